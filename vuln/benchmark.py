@@ -0,0 +1,780 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2013, Mario Vilas
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     * Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice,this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Benchmarks for the vulnerability tools.
+
+Everything runs on synthetic data generated locally, so no downloads are
+needed. Run without arguments to see the list of available benchmarks.
+"""
+
+import csv
+import gzip
+import json
+import os
+import random
+import resource
+import shutil
+import sys
+import tempfile
+
+from multiprocessing import Pool
+from time import time
+from xml.sax.saxutils import escape, quoteattr
+
+from cpe import CPEDB, parse_cpe, _parse_cpe
+from cve import CVEDB, _iter_cve_file, _iter_json_file
+from cvss import CVSS, CVSS3, numpy, score_vectors, score_vectors3
+
+
+#------------------------------------------------------------------------------
+# Synthetic data.
+
+NVD_HEADER = (
+    "<?xml version='1.0' encoding='UTF-8'?>\n"
+    '<nvd xmlns:scap-core="http://scap.nist.gov/schema/scap-core/0.1"'
+    ' xmlns:cvss="http://scap.nist.gov/schema/cvss-v2/0.2"'
+    ' xmlns:vuln="http://scap.nist.gov/schema/vulnerability/0.4"'
+    ' xmlns="http://scap.nist.gov/schema/feed/vulnerability/2.0"'
+    ' nvd_xml_version="2.0" pub_date="%04d-12-31T00:00:00.000-05:00">\n'
+)
+
+WORDS = (
+    "buffer overflow cross site scripting remote attackers execute arbitrary"
+    " code via crafted request allows denial of service sql injection in the"
+    " parameter vulnerability function memory corruption local users gain"
+    " privileges"
+).split()
+
+LEVELS = ("NONE", "PARTIAL", "COMPLETE")
+
+def write_nvd_feed(filename, year, count, seed = 0, first = 1, rejected = ()):
+    """
+    Write a synthetic NVD CVE feed in the legacy XML 2.0 format.
+
+    :param filename: Output filename.
+    :type filename: str
+
+    :param year: Year of the CVE names.
+    :type year: int
+
+    :param count: Number of CVE entries.
+    :type count: int
+
+    :param seed: Random seed, the same seed always generates the same feed.
+    :type seed: int
+
+    :param first: Number of the first CVE entry.
+    :type first: int
+
+    :param rejected: Numbers of the CVE entries to mark as rejected.
+    :type rejected: set(int)
+    """
+    rnd = random.Random(seed)
+    with open(filename, "w") as f:
+        w = f.write
+        w(NVD_HEADER % year)
+        for number in xrange(first, first + count):
+            name = "CVE-%04d-%04d" % (year, number)
+            w('  <entry id="%s">\n' % name)
+            w('    <vuln:vulnerable-software-list>\n')
+            for i in xrange(rnd.randint(1, 6)):
+                w('      <vuln:product>cpe:/a:vendor%d:product%d:%d.%d'
+                  '</vuln:product>\n' % (rnd.randint(1, 500),
+                    rnd.randint(1, 20), rnd.randint(0, 9), i))
+            w('    </vuln:vulnerable-software-list>\n')
+            w('    <vuln:cve-id>%s</vuln:cve-id>\n' % name)
+            w('    <vuln:published-datetime>%04d-01-01T00:00:00.000-05:00'
+              '</vuln:published-datetime>\n' % year)
+            w('    <vuln:last-modified-datetime>%04d-%02d-01T00:00:00.000-05:00'
+              '</vuln:last-modified-datetime>\n' % (year, rnd.randint(1, 12)))
+            w('    <vuln:cvss>\n')
+            w('      <cvss:base_metrics>\n')
+            w('        <cvss:score>%.1f</cvss:score>\n'
+              % (rnd.randint(0, 100) / 10.0))
+            w('        <cvss:access-vector>NETWORK</cvss:access-vector>\n')
+            w('        <cvss:access-complexity>MEDIUM</cvss:access-complexity>\n')
+            w('        <cvss:authentication>NONE</cvss:authentication>\n')
+            for impact in ("confidentiality", "integrity", "availability"):
+                w('        <cvss:%s-impact>%s</cvss:%s-impact>\n'
+                  % (impact, rnd.choice(LEVELS), impact))
+            w('        <cvss:source>http://nvd.nist.gov</cvss:source>\n')
+            w('      </cvss:base_metrics>\n')
+            w('    </vuln:cvss>\n')
+            w('    <vuln:cwe id="CWE-%d"/>\n' % rnd.randint(1, 800))
+            for i in xrange(rnd.randint(1, 5)):
+                url = "http://www.example.com/advisories/%d/%d" % (
+                    rnd.randint(1, 50000), i)
+                w('    <vuln:references xml:lang="en"'
+                  ' reference_type="UNKNOWN">\n')
+                w('      <vuln:source>MISC</vuln:source>\n')
+                w('      <vuln:reference href=%s xml:lang="en">%s'
+                  '</vuln:reference>\n' % (quoteattr(url), escape(url)))
+                w('    </vuln:references>\n')
+            if number in rejected:
+                summary = "** REJECT **  DO NOT USE THIS CANDIDATE NUMBER."
+            else:
+                summary = " ".join(rnd.choice(WORDS) for i in xrange(40))
+            w('    <vuln:summary>%s</vuln:summary>\n' % escape(summary))
+            w('  </entry>\n')
+        w('</nvd>\n')
+
+def write_nvd_json_feed(filename, year, count, seed = 0, first = 1,
+                        rejected = ()):
+    """
+    Write a synthetic gzipped NVD CVE feed in the JSON 1.1 format.
+    The entries are like the ones written by write_nvd_feed(), with CVSS v3
+    scores added, and a range of vulnerable versions for some products.
+
+    :param filename: Output filename.
+    :type filename: str
+
+    :param year: Year of the CVE names.
+    :type year: int
+
+    :param count: Number of CVE entries.
+    :type count: int
+
+    :param seed: Random seed, so the same data can be generated again.
+    :type seed: int
+
+    :param first: Number of the first CVE entry.
+    :type first: int
+
+    :param rejected: Numbers of the CVE entries to mark as rejected.
+    :type rejected: set(int)
+    """
+    rnd = random.Random(seed)
+    with gzip.open(filename, "wb") as f:
+        f.write('{"CVE_data_type": "CVE", "CVE_data_format": "MITRE",'
+                ' "CVE_data_version": "4.0", "CVE_data_numberOfCVEs": "%d",'
+                ' "CVE_data_timestamp": "%04d-12-31T00:00Z",'
+                ' "CVE_Items": [\n' % (count, year))
+        for number in xrange(first, first + count):
+            matches = []
+            for i in xrange(rnd.randint(1, 6)):
+                vendor  = rnd.randint(1, 500)
+                product = rnd.randint(1, 20)
+                match   = {"vulnerable": True}
+                if rnd.random() < 0.2:
+                    version = "*"
+                    match["versionEndExcluding"] = "%d.%d" % (
+                        rnd.randint(1, 9), rnd.randint(0, 20))
+                else:
+                    version = "%d.%d" % (rnd.randint(0, 9), i)
+                match["cpe23Uri"] = (
+                    "cpe:2.3:a:vendor%d:product%d:%s:*:*:*:*:*:*:*"
+                    % (vendor, product, version))
+                matches.append(match)
+            score = rnd.randint(0, 100) / 10.0
+            levels = [rnd.choice(LEVELS) for impact in xrange(3)]
+            cwe = "CWE-%d" % rnd.randint(1, 800)
+            references = [
+                {"url": "http://www.example.com/advisories/%d/%d" % (
+                    rnd.randint(1, 50000), i),
+                 "name": "MISC", "refsource": "MISC", "tags": []}
+                for i in xrange(rnd.randint(1, 5))
+            ]
+            if number in rejected:
+                summary = "** REJECT **  DO NOT USE THIS CANDIDATE NUMBER."
+            else:
+                summary = " ".join(rnd.choice(WORDS) for i in xrange(40))
+            item = {
+                "cve": {
+                    "data_type": "CVE",
+                    "data_format": "MITRE",
+                    "data_version": "4.0",
+                    "CVE_data_meta": {
+                        "ID": "CVE-%04d-%04d" % (year, number),
+                        "ASSIGNER": "cve@mitre.org",
+                    },
+                    "problemtype": {"problemtype_data": [
+                        {"description": [{"lang": "en", "value": cwe}]},
+                    ]},
+                    "references": {"reference_data": references},
+                    "description": {"description_data": [
+                        {"lang": "en", "value": summary},
+                    ]},
+                },
+                "configurations": {
+                    "CVE_data_version": "4.0",
+                    "nodes": [{"operator": "OR", "children": [],
+                               "cpe_match": matches}],
+                },
+                "impact": {
+                    "baseMetricV3": {
+                        "cvssV3": {
+                            "version": "3.1",
+                            "vectorString": "CVSS:3.1/AV:N/AC:L/PR:N/UI:N"
+                                            "/S:U/C:H/I:H/A:H",
+                            "baseScore": score,
+                            "baseSeverity": "HIGH" if score >= 7 else "MEDIUM",
+                        },
+                    },
+                    "baseMetricV2": {
+                        "cvssV2": {
+                            "version": "2.0",
+                            "accessVector": "NETWORK",
+                            "accessComplexity": "MEDIUM",
+                            "authentication": "NONE",
+                            "confidentialityImpact": levels[0],
+                            "integrityImpact": levels[1],
+                            "availabilityImpact": levels[2],
+                            "baseScore": score,
+                        },
+                    },
+                },
+                "publishedDate": "%04d-01-01T05:00Z" % year,
+                "lastModifiedDate": "%04d-%02d-01T05:00Z" % (
+                    year, rnd.randint(1, 12)),
+            }
+            if number != first:
+                f.write(",\n")
+            f.write(json.dumps(item))
+        f.write("\n]}\n")
+
+def write_vendor_statements(filename, cvenames):
+    """
+    Write a synthetic NVD vendor statements XML file.
+
+    :param filename: Output filename.
+    :type filename: str
+
+    :param cvenames: CVE names to write statements for.
+    :type cvenames: list(str)
+    """
+    with open(filename, "w") as f:
+        f.write("<?xml version='1.0' encoding='UTF-8'?>\n<statements>\n")
+        for cvename in cvenames:
+            f.write('  <statement cvename="%s" contributor="John Doe"'
+                    ' organization="Example Inc.">Fixed in the latest'
+                    ' version.</statement>\n' % cvename)
+        f.write("</statements>\n")
+
+CPE_HEADER = (
+    "<?xml version='1.0' encoding='UTF-8'?>\n"
+    '<cpe-list xmlns="http://cpe.mitre.org/dictionary/2.0"'
+    ' xmlns:cpe-23="http://scap.nist.gov/schema/cpe-extension/2.3">\n'
+    '  <generator>\n'
+    '    <product_name>National Vulnerability Database (NVD)</product_name>\n'
+    '    <schema_version>2.3</schema_version>\n'
+    '  </generator>\n'
+)
+
+def write_cpe_dictionary(filename, count, seed = 0):
+    """
+    Write a synthetic official CPE dictionary XML file.
+
+    :param filename: Output filename.
+    :type filename: str
+
+    :param count: Number of CPE items.
+    :type count: int
+
+    :param seed: Random seed. Different seeds give different titles and
+        deprecation flags for the same CPE names.
+    :type seed: int
+    """
+    rnd = random.Random(seed)
+    vendors = ["vendor%d" % i for i in xrange(max(1, count // 200))]
+    with open(filename, "w") as f:
+        f.write(CPE_HEADER)
+        for i in xrange(count):
+            part    = "aoh"[i % 3]
+            vendor  = vendors[i % len(vendors)]
+            product = "product%d" % (i // 40)
+            version = "%d.%d.%d" % (i % 7, i % 11, i % 13)
+            update  = ("", "sp1", "beta")[i % 3]
+            name22  = "cpe:/%s:%s:%s:%s" % (part, vendor, product, version)
+            if update:
+                name22 += ":" + update
+            name23  = "cpe:2.3:%s:%s:%s:%s:%s:*:*:*:*:*:*" % (
+                part, vendor, product, version, update or "*")
+            title   = " ".join(rnd.choice(WORDS) for _ in xrange(4))
+            deprecated = ' deprecated="true"' if rnd.random() < 0.05 else ""
+            f.write('  <cpe-item name=%s%s>\n' % (quoteattr(name22),
+                                                   deprecated))
+            f.write('    <title xml:lang="en-US">%s %s</title>\n'
+                    % (escape(title), version))
+            if i % 10 == 0:
+                f.write('    <title xml:lang="ja-JP">%s</title>\n'
+                        % escape(title))
+            f.write('    <cpe-23:cpe23-item name=%s/>\n' % quoteattr(name23))
+            f.write('  </cpe-item>\n')
+        f.write("</cpe-list>\n")
+
+def write_iana_registry(filename, tables, seed = 0):
+    """
+    Write a synthetic IANA port numbers registry CSV file, with the ports
+    and services of the given tables in random order.
+
+    :param filename: Output filename.
+    :type filename: str
+
+    :param tables: Map of table names, as in iana.TABLES, to dictionaries.
+        Only the TCP and UDP tables are used.
+    :type tables: dict(str -> dict)
+
+    :param seed: Random seed.
+    :type seed: int
+
+    :returns: Number of rows.
+    :rtype: int
+    """
+    rnd = random.Random(seed)
+    rows = []
+    for proto in ("tcp", "udp"):
+        port_to_services = tables[proto + "_port_to_services"]
+        service_to_ports = tables[proto + "_service_to_ports"]
+        for service, ports in service_to_ports.iteritems():
+            for port in ports:
+                if service in port_to_services.get(port, ()):
+                    notes = ""
+                else:
+                    notes = "This entry is an alias to another service"
+                description = " ".join(rnd.choice(WORDS) for _ in xrange(6))
+                rows.append([service, str(port), proto, description,
+                             "John Doe", "John Doe", "2013-01-01", "", "",
+                             "", "", notes])
+    rnd.shuffle(rows)
+    with open(filename, "wb") as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            "Service Name", "Port Number", "Transport Protocol",
+            "Description", "Assignee", "Contact", "Registration Date",
+            "Modification Date", "Reference", "Service Code",
+            "Known Unauthorized Uses", "Assignment Notes",
+        ])
+        writer.writerows(rows)
+    return len(rows)
+
+
+#------------------------------------------------------------------------------
+# Helpers.
+
+class Workspace(object):
+    "Temporary working directory, deleted on exit."
+
+    def __enter__(self):
+        self.old_cwd = os.getcwd()
+        self.path = tempfile.mkdtemp(prefix = "vuln-bench-")
+        os.chdir(self.path)
+        return self
+
+    def __exit__(self, etype, value, tb):
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.path, ignore_errors = True)
+
+def report(label, count, elapsed, unit = "entries"):
+    print "%-40s %10d %s in %8.3f s  (%10.1f %s/s)" % (
+        label, count, unit, elapsed, count / elapsed, unit)
+
+def peak_rss():
+    "Peak resident set size of this process, in Kb (Linux) or bytes (OSX)."
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def run_in_child(fn, *args):
+    "Run a function in a new process, so peak_rss() only accounts for it."
+    pool = Pool(1)
+    try:
+        return pool.apply(fn, args)
+    finally:
+        pool.close()
+        pool.join()
+
+
+#------------------------------------------------------------------------------
+# Benchmarks.
+
+def bench_cve_load(years = 4, per_year = 10000):
+    "Full CVE database load from synthetic XML feeds."
+    feeds = tuple("nvdcve-2.0-%d.xml" % (2002 + i) for i in xrange(years))
+    class BenchCVEDB(CVEDB):
+        DEBUG = False
+        CVE_XML_FILES = feeds
+    def write_feeds(seed):
+        for i, xml_file in enumerate(feeds):
+            write_nvd_feed(xml_file, 2002 + i, per_year, seed = seed + i)
+        write_vendor_statements(BenchCVEDB.VENDOR_XML_FILE,
+                                ["CVE-2002-%04d" % i for i in xrange(1, 100)])
+    with Workspace():
+        write_feeds(0)
+        t = time()
+        db = BenchCVEDB("bench.db")
+        report("CVE database load", years * per_year, time() - t)
+        write_feeds(years)
+        t = time()
+        db.update(incremental = False)
+        report("CVE database reload", years * per_year, time() - t)
+        db.close()
+
+def bench_cpe_load(count = 100000):
+    "Full CPE dictionary load from a synthetic XML file."
+    class BenchCPEDB(CPEDB):
+        DEBUG = False
+    def write_dictionary(seed):
+        write_cpe_dictionary(BenchCPEDB.CPE_XML_FILE, count, seed = seed)
+
+        # Make sure the file looks newer than the last one loaded.
+        mtime = time() + seed
+        os.utime(BenchCPEDB.CPE_XML_FILE, (mtime, mtime))
+    with Workspace():
+        write_dictionary(0)
+        t = time()
+        db = BenchCPEDB("bench.db")
+        report("CPE dictionary load", count, time() - t)
+        write_dictionary(1)
+        t = time()
+        db.update()
+        report("CPE dictionary reload", count, time() - t)
+        db.close()
+
+def bench_cpe_search(count = 100000, queries = 200):
+    "CPE dictionary searches, for each access path and as substrings."
+    class BenchCPEDB(CPEDB):
+        DEBUG = False
+    rnd = random.Random(0)
+    searches = [
+        ("exact",  lambda i: {"vendor": "vendor%d" % rnd.randrange(500)}),
+        ("prefix", lambda i: {"product": "product%d*" % rnd.randrange(2500)}),
+        ("words",  lambda i: {"title": " ".join(rnd.sample(WORDS, 2))}),
+        ("text",   lambda i: {"text": "vendor%d %s" % (rnd.randrange(500),
+                                                      rnd.choice(WORDS))}),
+    ]
+    with Workspace():
+        write_cpe_dictionary(BenchCPEDB.CPE_XML_FILE, count)
+        db = BenchCPEDB("bench.db")
+        for label, make_query in searches:
+            params = [make_query(i) for i in xrange(queries)]
+            for mode in ("auto", "substring"):
+                if label == "text" and mode == "substring":
+                    continue
+                t = time()
+                for kwargs in params:
+                    db.search(mode = mode, **kwargs)
+                report("CPE search (%s, %s)" % (label, mode),
+                       queries, time() - t, "queries")
+        db.close()
+
+def bench_cpe_resolve(count = 100000, queries = 5000):
+    "CPE name resolution with wildcards, in SQL and with the trie."
+    class BenchCPEDB(CPEDB):
+        DEBUG = False
+    rnd = random.Random(0)
+    cpes = []
+    for _ in xrange(queries):
+        i = rnd.randrange(count)
+        vendor  = "vendor%d" % (i % max(1, count // 200))
+        product = "product%d" % (i // 40)
+        version = rnd.choice(("*", "%d.%d.%d" % (i % 7, i % 11, i % 13),
+                              "%d.*" % (i % 7)))
+        cpes.append("cpe:2.3:%s:%s:%s:%s:*:*:*:*:*:*:*" % (
+            "aoh"[i % 3], vendor, product, version))
+    with Workspace():
+        write_cpe_dictionary(BenchCPEDB.CPE_XML_FILE, count)
+        BenchCPEDB("bench.db").close()
+        with BenchCPEDB("bench.db") as db:
+            t = time()
+            sql_results = db.resolve_many(cpes)
+            report("CPE resolve (SQL)", queries, time() - t, "queries")
+        with BenchCPEDB("bench.db", use_trie = True) as db:
+            t = time()
+            db.get_trie()
+            report("CPE trie build", count, time() - t)
+            t = time()
+            trie_results = db.resolve_many(cpes)
+            report("CPE resolve (trie)", queries, time() - t, "queries")
+        assert sql_results == trie_results
+
+def bench_cpe_titles(count = 100000, names = 20000):
+    "CPE title lookups one by one and in batch, and dictionary export."
+    class BenchCPEDB(CPEDB):
+        DEBUG = False
+    with Workspace():
+        write_cpe_dictionary(BenchCPEDB.CPE_XML_FILE, count)
+        with BenchCPEDB("bench.db") as db:
+            wanted = random.Random(0).sample(db.search(part = "a"), names)
+            t = time()
+            for name in wanted:
+                db.get_title(name)
+            report("CPE titles (one by one)", names, time() - t, "names")
+            t = time()
+            db.get_titles(wanted)
+            report("CPE titles (batch)", names, time() - t, "names")
+            for format in CPEDB.EXPORT_FORMATS:
+                t = time()
+                db.export("export." + format, format)
+                report("CPE export (%s)" % format, count, time() - t, "names")
+
+def bench_cpe_parse(count = 200000, inventory = 2000, queries = 200000):
+    "CPE name parsing, as in dictionary loads and in queries."
+    rnd = random.Random(0)
+    names23 = []
+    names22 = []
+    for i in xrange(count):
+        values = ("aoh"[i % 3], "vendor%d" % (i % 500), "product%d" % (i // 40),
+                  "%d.%d.%d" % (i % 7, i % 11, i % 13))
+        names23.append("cpe:2.3:%s:%s:%s:%s:*:*:*:*:*:*:*" % values)
+        names22.append("cpe:/%s:%s:%s:%s" % values)
+    t = time()
+    for name in names23:
+        _parse_cpe(name)
+    report("CPE 2.3 parse (dictionary load)", count, time() - t, "names")
+    t = time()
+    for name in names22:
+        _parse_cpe(name)
+    report("CPE 2.2 parse (dictionary load)", count, time() - t, "names")
+    known = rnd.sample(names23, inventory // 2) + \
+            rnd.sample(names22, inventory // 2)
+    names = [rnd.choice(known) for _ in xrange(queries)]
+    t = time()
+    for name in names:
+        parse_cpe(name)
+    report("CPE parse (queries, cached)", queries, time() - t, "names")
+
+def random_cvss_vectors(count, distinct, seed = 0):
+    "Random CVSS v2 base vectors, with repetitions as in real data."
+    rnd = random.Random(seed)
+    choices = [
+        (metric, sorted(getattr(CVSS, metric + "_SCORE")))
+        for metric in CVSS.METRICS[:6]
+    ]
+    unique = [
+        "/".join("%s:%s" % (metric, rnd.choice(names))
+                 for metric, names in choices)
+        for _ in xrange(distinct)
+    ]
+    return [rnd.choice(unique) for _ in xrange(count)]
+
+def bench_cvss_batch(count = 200000, distinct = 2000, sample = 20000):
+    "CVSS v2 scoring one vector at a time and in batch."
+    vectors = random_cvss_vectors(count, distinct)
+    environment = "CDP:L/TD:H/CR:H/IR:M/AR:L"
+    t = time()
+    for vector in vectors[:sample]:
+        CVSS(vector + "/" + environment).environmental_score
+    report("CVSS scoring (CVSS class)", sample, time() - t, "vectors")
+    t = time()
+    for vector in vectors[:sample]:
+        str(CVSS(vector + "/" + environment))
+    report("CVSS objects (construct and print)", sample, time() - t,
+           "vectors")
+    cvss_list = [CVSS(vector + "/" + environment)
+                 for vector in vectors[:sample]]
+    for label, use_tables in (("formulas", False), ("tables", True)):
+        t = time()
+        for cvss in cvss_list:
+            cvss.USE_TABLES = use_tables
+            cvss.environmental_score
+            cvss.level
+        report("CVSS scores and levels (%s)" % label, sample, time() - t,
+               "vectors")
+    modes = [("python", False)]
+    if numpy is not None:
+        modes.append(("numpy", True))
+    for label, use_numpy in modes:
+        t = time()
+        score_vectors(vectors, environment, use_numpy = use_numpy)
+        report("CVSS scoring (batch, %s)" % label, count, time() - t,
+               "vectors")
+
+def random_cvss3_vectors(count, distinct, seed = 0):
+    "Random CVSS v3 base vectors, with repetitions as in real data."
+    rnd = random.Random(seed)
+    choices = [
+        (metric, CVSS3.VALUES[metric]) for metric in CVSS3.METRICS[:8]
+    ]
+    unique = [
+        "CVSS:%s/" % rnd.choice(("3.0", "3.1")) +
+        "/".join("%s:%s" % (metric, rnd.choice(names))
+                 for metric, names in choices)
+        for _ in xrange(distinct)
+    ]
+    return [rnd.choice(unique) for _ in xrange(count)]
+
+def bench_cvss3_batch(count = 1000000, distinct = 5000, sample = 20000):
+    "CVSS v3 scoring one vector at a time and in batch."
+    vectors = random_cvss3_vectors(count, distinct)
+    environment = "E:F/RL:O/RC:C/CR:H/IR:M/AR:L/MAV:L"
+    t = time()
+    for vector in vectors[:sample]:
+        CVSS3(vector + "/" + environment).environmental_score
+    report("CVSS v3 scoring (CVSS3 class)", sample, time() - t, "vectors")
+    modes = [("python", False)]
+    if numpy is not None:
+        modes.append(("numpy", True))
+    for label, use_numpy in modes:
+        t = time()
+        score_vectors3(vectors, environment, use_numpy = use_numpy)
+        report("CVSS v3 scoring (batch, %s)" % label, count, time() - t,
+               "vectors")
+
+def import_iana():
+    rss = peak_rss()
+    t = time()
+    import iana
+    iana.tcp_port_to_services.get(80)
+    return time() - t, rss, peak_rss()
+
+def bench_iana_lookup():
+    "IANA registry import time, peak memory, lookups and updates."
+    elapsed, rss_before, rss_after = run_in_child(import_iana)
+    print "%-40s %10.3f s" % ("IANA import and first lookup", elapsed)
+    print "%-40s %10d Kb before, %d Kb after" % (
+        "  peak RSS", rss_before, rss_after)
+    import iana
+    t = time()
+    for port in xrange(65536):
+        iana.tcp_port_to_services.get(port)
+    report("IANA port lookups", 65536, time() - t, "ports")
+    services = list(iana.tcp_service_to_ports)
+    t = time()
+    for service in services:
+        iana.tcp_service_to_ports.get(service)
+    report("IANA service lookups", len(services), time() - t, "services")
+    registry = iana.IANARegistry("tcp")
+    registry.lookup_ports([80])
+    ports = range(65536)
+    modes = [("python", False)]
+    if numpy is not None:
+        modes.append(("numpy", True))
+    for label, use_numpy in modes:
+        t = time()
+        registry.lookup_ports(ports, use_numpy = use_numpy)
+        report("IANA bulk port lookup (%s)" % label, 65536, time() - t,
+               "ports")
+    t = time()
+    for low in xrange(0, 65536, 1000):
+        registry.get_port_range(low, low + 999)
+    report("IANA port range queries", 66, time() - t, "queries")
+    prefixes = sorted(set(service[:3] for service in services))
+    t = time()
+    for prefix in prefixes:
+        registry.search_prefix(prefix)
+    report("IANA service prefix searches", len(prefixes), time() - t,
+           "queries")
+    words = services[::100]
+    t = time()
+    for word in words:
+        registry.search_fuzzy(word[:-1])
+    report("IANA service fuzzy searches", len(words), time() - t, "queries")
+    tables = {}
+    for table in iana.TABLES:
+        tables[table] = dict(getattr(iana, table))
+    with Workspace():
+        rows = write_iana_registry(iana.IANA_FILE, tables)
+        t = time()
+        iana.update(iana.IANA_FILE, "iana.dat")
+        report("IANA update (new data file)", rows, time() - t, "rows")
+        t = time()
+        iana.update(iana.IANA_FILE, "iana.dat")
+        report("IANA update (no changes)", rows, time() - t, "rows")
+    t = time()
+    for _ in xrange(100000):
+        iana.reload_data()
+    report("IANA data file reload checks", 100000, time() - t, "checks")
+
+def parse_cve_feed(xml_file):
+    rss = peak_rss()
+    t = time()
+    count = 0
+    for _ in _iter_cve_file(xml_file):
+        count += 1
+    return count, time() - t, rss, peak_rss()
+
+def bench_cve_parse(sizes = (10000, 40000)):
+    "Streaming CVE XML feed parser speed and peak memory."
+    with Workspace():
+        for size in sizes:
+            xml_file = "nvdcve-2.0-%d.xml" % size
+            write_nvd_feed(xml_file, 2002, size)
+            count, elapsed, rss_before, rss_after = \
+                run_in_child(parse_cve_feed, xml_file)
+            report("CVE feed parse (%d entries)" % size, count, elapsed)
+            print "%-40s %10d Kb before, %d Kb after" % (
+                "  peak RSS", rss_before, rss_after)
+
+def parse_cve_json_feed(json_file):
+    t = time()
+    count = 0
+    for _ in _iter_json_file(json_file):
+        count += 1
+    return count, time() - t
+
+def bench_cve_json(years = 4, per_year = 10000):
+    "CVE database load from JSON feeds, compared to the XML feeds."
+    xml_files  = tuple("nvdcve-2.0-%d.xml" % (2002 + i) for i in xrange(years))
+    json_files = tuple("nvdcve-1.1-%d.json.gz" % (2002 + i)
+                       for i in xrange(years))
+    class BenchCVEDB(CVEDB):
+        DEBUG = False
+        CVE_XML_FILES = xml_files
+    with Workspace():
+        for i in xrange(years):
+            write_nvd_feed(xml_files[i], 2002 + i, per_year, seed = i)
+            write_nvd_json_feed(json_files[i], 2002 + i, per_year, seed = i)
+        write_vendor_statements(BenchCVEDB.VENDOR_XML_FILE, [])
+        count, elapsed = run_in_child(parse_cve_json_feed, json_files[0])
+        report("CVE JSON feed parse", count, elapsed)
+        count, elapsed, _, _ = run_in_child(parse_cve_feed, xml_files[0])
+        report("CVE XML feed parse", count, elapsed)
+        t = time()
+        db = BenchCVEDB("bench-json.db", json_files = json_files)
+        report("CVE database load from JSON", years * per_year, time() - t)
+        db.close()
+        t = time()
+        db = BenchCVEDB("bench-xml.db")
+        report("CVE database load from XML", years * per_year, time() - t)
+        db.close()
+
+BENCHMARKS = [
+    ("cve_load",  bench_cve_load),
+    ("cpe_load",  bench_cpe_load),
+    ("cpe_search", bench_cpe_search),
+    ("cpe_resolve", bench_cpe_resolve),
+    ("cpe_parse", bench_cpe_parse),
+    ("cpe_titles", bench_cpe_titles),
+    ("cve_parse", bench_cve_parse),
+    ("cve_json",  bench_cve_json),
+    ("cvss_batch", bench_cvss_batch),
+    ("cvss3_batch", bench_cvss3_batch),
+    ("iana_lookup", bench_iana_lookup),
+]
+
+if __name__ == "__main__":
+    names = sys.argv[1:]
+    if not names:
+        print "Usage: %s <benchmark...> | all" % os.path.basename(sys.argv[0])
+        print
+        for name, fn in BENCHMARKS:
+            print "  %-16s %s" % (name, fn.__doc__)
+    for name, fn in BENCHMARKS:
+        if name in names or "all" in names:
+            fn()
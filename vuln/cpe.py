@@ -27,9 +27,12 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import csv
+import json
 import re
 import sqlite3
 
+from collections import namedtuple
 from datetime import date
 from os import unlink
 from os.path import exists, getmtime
@@ -55,55 +58,462 @@ def get_cpe_version(cpe):
     else:
         raise ValueError("Not a valid CPE name: %s" % cpe)
 
+# Parsed CPE name. The values use the CPE 2.3 formatted string conventions:
+# "*" is ANY, "-" is NA, and special characters are quoted with a backslash.
+CPE = namedtuple("CPE", (
+    "part", "vendor", "product", "version", "update", "edition",
+    "language", "sw_edition", "target_sw", "target_hw", "other"
+))
+
+_cpe22_plain = re.compile(r"cpe:/[A-Za-z0-9._\-:~]*\Z").match
+_cpe22_special = re.compile(r"%([0-9a-fA-F]{2})|([^A-Za-z0-9._\-])")
+def _cpe22_unquote_char(match):
+    code, c = match.groups()
+    if code is None:
+        return "\\" + c
+    code = code.lower()
+    if code == "01":
+        return "?"
+    if code == "02":
+        return "*"
+    c = chr(int(code, 16))
+    if c.isalnum() or c in "._-":
+        return c
+    return "\\" + c
+
 def cpe22_unquote(s):
-    if not s:
+    """
+    Decode a CPE 2.2 component into the CPE 2.3 formatted string syntax.
+
+    Percent encoded characters are decoded, and like any other special
+    characters they're quoted with a backslash. The %01 and %02 codes are
+    the '?' and '*' wildcards.
+    """
+    if not s or s == "-":
         return s
-    r = []
-    i = -1
-    while i < len(s) - 1:
-        i += 1
-        c = s[i]
-        if c == "\\":
-            r.append("\\\\")
-            continue
-        if c != "%":
-            r.append(c)
-            continue
-        h = s[ i + 1 : i + 2 ]
-        if len(h) > 0 and h[0] == "%":
-            r.append(c)
-            i += 1
-            continue
-        if len(h) != 2 or \
-           h[0] not in "0123456789abcdefABCDEF" or \
-           h[1] not in "0123456789abcdefABCDEF":
-            r.append(c)
-            continue
-        r.append("\\")
-        r.append( chr( int(h, 16) ) )
-    return "".join(r)
+    r = _cpe22_special.sub(_cpe22_unquote_char, s)
+    if r == "-":
+        return "\\-"
+    return r
+
+_cpe22_escaped = re.compile(r"\\(.)|([*?])|([^A-Za-z0-9._\-])", re.DOTALL)
+def _cpe22_quote_char(match):
+    quoted, wildcard, c = match.groups()
+    if wildcard:
+        return "%02" if wildcard == "*" else "%01"
+    if quoted is not None:
+        c = quoted
+    if c.isalnum():
+        return c
+    if isinstance(c, unicode):
+        c = c.encode("utf-8")
+    return "".join("%%%02x" % ord(x) for x in c)
+
+def cpe22_quote(s):
+    """
+    Encode a component in the CPE 2.3 formatted string syntax for a CPE 2.2
+    name. This is the opposite of cpe22_unquote().
+    """
+    if s == "*":
+        return ""
+    if s == "-":
+        return s
+    return _cpe22_escaped.sub(_cpe22_quote_char, s)
+
+_cpe23_name = re.compile(
+    r"cpe:2\.3:" + ":".join([r"([^:\\]*(?:\\.[^:\\]*)*)"] * 11) + r"\Z",
+    re.DOTALL)
+_wfn_attr = re.compile(
+    r'\s*(\w+)\s*=\s*(?:(ANY|NA)|"([^"\\]*(?:\\.[^"\\]*)*)")\s*(,|\Z)',
+    re.DOTALL)
+_wfn_unquote = re.compile(r"\\([._\-])")
+
+def _parse_cpe22(cpe):
+    values = cpe[5:].split(":")
+    if len(values) > 7:
+        raise ValueError("Not a valid CPE 2.2 name: %s" % cpe)
+    values.extend([""] * (7 - len(values)))
+
+    # Unpack the extended attributes from the edition, if present.
+    packed = values[5].split("~")
+    if len(packed) == 6 and not packed[0]:
+        values = values[:5] + packed[1:2] + values[6:7] + packed[2:]
+    else:
+        values.extend([""] * 4)
+
+    # Most names have nothing to decode.
+    if _cpe22_plain(cpe):
+        return tuple.__new__(CPE, [x or "*" for x in values])
+    return tuple.__new__(CPE, [cpe22_unquote(x) or "*" for x in values])
+
+def _parse_wfn(wfn):
+    if not wfn.startswith("wfn:[") or not wfn.endswith("]"):
+        raise ValueError("Not a valid CPE WFN: %s" % wfn)
+    body = wfn[5:-1]
+    values = dict.fromkeys(CPE._fields, "*")
+    pos = 0
+    while pos < len(body):
+        match = _wfn_attr.match(body, pos)
+        if not match or match.group(1) not in values:
+            raise ValueError("Not a valid CPE WFN: %s" % wfn)
+        name, logical, value, _ = match.groups()
+        if logical:
+            value = "*" if logical == "ANY" else "-"
+        else:
+            value = _wfn_unquote.sub(r"\1", value)
+            if value == "-":
+                value = "\\-"
+        values[name] = value
+        pos = match.end()
+    return CPE(**values)
+
+def _parse_cpe(cpe):
+    "Parse a CPE name. Like parse_cpe(), but without the cache."
+    if not isinstance(cpe, basestring):
+        get_cpe_version(cpe)
+    if cpe.startswith("cpe:2.3:"):
+        match = _cpe23_name.match(cpe)
+        if match is None:
+            raise ValueError("Not a valid CPE 2.3 name: %s" % cpe)
+        return tuple.__new__(CPE, match.groups())
+    if cpe.startswith("cpe:/"):
+        return _parse_cpe22(cpe)
+    if cpe.startswith("wfn:"):
+        return _parse_wfn(cpe)
+    get_cpe_version(cpe)
+    raise ValueError("Not a valid CPE 2.2 or 2.3 name: %s" % cpe)
 
-_cpe23_split = re.compile(r"(?<!\\)\:")
+# Maximum number of parsed CPE names to keep in the cache.
+# The cache is emptied when full, which is fast and good enough for queries.
+PARSE_CACHE_SIZE = 65536
+
+_parse_cache = {}
 def parse_cpe(cpe):
-    ver = get_cpe_version(cpe)
-    if ver == "2.2":
-        parsed = [cpe22_unquote(x.strip()) for x in cpe[5:].split(":")]
-        if len(parsed) < 11:
-            parsed.extend( "*" * (11 - len(parsed)) )
-    elif ver == "2.3":
-        parsed = [x.strip() for x in _cpe23_split.split(cpe[8:])]
-        if len(parsed) != 11:
-            raise ValueError("Not a valid CPE 2.3 name: %s" % cpe)
-    else:
-        raise ValueError("Not a valid CPE 2.2 or 2.3 name: %s" % cpe)
+    """
+    Parse a CPE 2.2 or 2.3 name, or a CPE 2.3 well formed name (WFN).
+
+    Results are cached, so parsing the same names again is cheap.
+
+    :param cpe: CPE name.
+    :type cpe: str | unicode
+
+    :returns: Parsed CPE name.
+    :rtype: CPE
+
+    :raises ValueError: Not a valid CPE name.
+    """
+    try:
+        return _parse_cache[cpe]
+    except (KeyError, TypeError):
+        pass
+    parsed = _parse_cpe(cpe)
+    if len(_parse_cache) >= PARSE_CACHE_SIZE:
+        _parse_cache.clear()
+    _parse_cache[cpe] = parsed
     return parsed
 
 def unparse_cpe23(parsed):
-    return "cpe:2.3:" + ":".join(x.replace(":", r"\:") for x in parsed)
+    "Make a CPE 2.3 formatted string from a parsed CPE name."
+    return "cpe:2.3:" + ":".join(parsed)
+
+def unparse_cpe22(parsed):
+    "Make a CPE 2.2 name from a parsed CPE name."
+    values = [cpe22_quote(x) for x in parsed[:7]]
+
+    # Pack the extended attributes into the edition if needed.
+    if any(x != "*" for x in parsed[7:]):
+        values[5] = "~" + "~".join(
+            cpe22_quote(x) for x in (parsed[5],) + tuple(parsed[7:]))
+
+    while values and not values[-1]:
+        values.pop()
+    return "cpe:/" + ":".join(values)
+
+_wfn_quote = re.compile(r"\\.|([^\w*?])", re.DOTALL)
+def _wfn_quote_char(match):
+    c = match.group(1)
+    if c is None:
+        return match.group(0)
+    return "\\" + c
+
+def unparse_wfn(parsed):
+    "Make a CPE 2.3 well formed name (WFN) from a parsed CPE name."
+    attrs = []
+    for name, value in zip(CPE._fields, parsed):
+        if value == "*":
+            continue
+        if value == "-":
+            attrs.append("%s=NA" % name)
+        else:
+            attrs.append('%s="%s"' % (name, _wfn_quote.sub(_wfn_quote_char,
+                                                           value)))
+    return "wfn:[%s]" % ",".join(attrs)
 
 def cpe22to23(cpe):
     return unparse_cpe23( parse_cpe(cpe) )
 
+def cpe23to22(cpe):
+    return unparse_cpe22( parse_cpe(cpe) )
+
+_fts_token = re.compile(r"[^\W_]+", re.UNICODE)
+def _fts_query(words, column, module):
+    """
+    Build a full text search query that matches all the given words,
+    optionally restricted to a single column. Words ending with an asterisk
+    are treated as prefixes.
+
+    Only the alphanumeric tokens in the words are used, unquoted, since
+    FTS4 doesn't support column filters on quoted phrases. The tokenizers
+    split on everything else anyway.
+    """
+    terms = []
+    for word in words:
+        tokens = _fts_token.findall(word.lower())
+        if tokens and word.endswith("*"):
+            tokens[-1] += "*"
+        terms.extend(tokens)
+    if column:
+        terms = ["%s:%s" % (column, term) for term in terms]
+    return " ".join(terms)
+
+def _like_escape(s):
+    "Escape a string for use in a LIKE pattern with ESCAPE '\\'."
+    return s.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+_cpe_wildcards = re.compile(r"(\\.?|[*?])")
+def _search_path(value):
+    """
+    Choose how to look up a CPE component value with wildcards.
+
+    CPE 2.3 wildcards are the asterisk for any number of characters and the
+    question mark for a single character, unless escaped with a backslash.
+
+    :returns: "exact" and the value if it has no wildcards, "prefix" and
+        the prefix if it only has a trailing asterisk, or "like" and a LIKE
+        pattern for anything else.
+    :rtype: tuple(str, str)
+    """
+    tokens = _cpe_wildcards.split(value)
+    wildcards = [i for i in xrange(1, len(tokens), 2) if tokens[i] in "*?"]
+    if not wildcards:
+        return "exact", value
+    if wildcards == [len(tokens) - 2] and \
+            tokens[-2] == "*" and not tokens[-1]:
+        return "prefix", value[:-1]
+    pattern = []
+    for i, token in enumerate(tokens):
+        if i in wildcards:
+            pattern.append("%" if token == "*" else "_")
+        else:
+            pattern.append(_like_escape(token))
+    return "like", "".join(pattern)
+
+def _prefix_range(prefix):
+    """
+    Get the bounds of the strings that begin with the given prefix, so it
+    can be looked up as a range in an index. The upper bound is excluded.
+    """
+    if isinstance(prefix, str):
+        prefix = prefix.decode("utf-8")
+    return prefix, prefix[:-1] + unichr(ord(prefix[-1]) + 1)
+
+
+_cpe_unescape = re.compile(r"\\([^*?\\])")
+def _cpe_key(value):
+    """
+    Normalize a CPE component value for comparisons.
+
+    CPE components are case insensitive, and most escaped characters are
+    the same as the unescaped ones, but escaped wildcards and backslashes
+    are not. ANY ('*', or empty in CPE 2.2) and NA ('-') are kept as is.
+    """
+    if not value:
+        return "*"
+    if value == "*" or value == "-":
+        return value
+    if "\\" not in value:
+        return value.lower()
+    key = _cpe_unescape.sub(r"\1", value).lower()
+    if key == "-":
+        return "\\-"
+    return key
+
+def _cpe_matcher(value):
+    """
+    Compile a CPE component value from a query.
+
+    :returns: The key to look for (see _cpe_key), and a compiled regular
+        expression if the value has wildcards other than a single '*'.
+        The key is "*" for ANY and None for wildcard patterns.
+    :rtype: tuple(str, re.RegexObject)
+    """
+    key = _cpe_key(value)
+    if key == "*" or key == "-" or ("*" not in key and "?" not in key):
+        return key, None
+    tokens = _cpe_wildcards.split(value)
+    if not any(tokens[i] in "*?" for i in xrange(1, len(tokens), 2)):
+        return key, None
+    pattern = []
+    for i, token in enumerate(tokens):
+        if i % 2 == 0:
+            pattern.append(re.escape(token.lower()))
+        elif token == "*":
+            pattern.append(".*")
+        elif token == "?":
+            pattern.append(".")
+        else:
+            pattern.append(re.escape(_cpe_key(token)))
+    return None, re.compile("".join(pattern) + "$", re.DOTALL)
+
+def _cpe_match_key(matcher, key):
+    "Test a normalized dictionary value against a compiled query value."
+    wanted, regexp = matcher
+    if wanted == "*":
+        return True
+    if regexp is None:
+        return key == wanted
+    return key != "*" and key != "-" and regexp.match(key) is not None
+
+
+class CPETrie(object):
+    """
+    In-memory index of CPE names for fast wildcard resolution.
+
+    The names are kept in a trie over the part, vendor, product and version
+    components, so a query only visits the branches its values can match.
+    The remaining components are ANY for nearly all names, so they're kept
+    in a list at the leaves instead of more levels of the trie.
+
+    Queries follow the CPE 2.3 name matching rules: ANY matches everything,
+    NA only matches NA, '*' and '?' are wildcards anywhere in a value
+    unless escaped, and comparisons are case insensitive. A query value
+    other than ANY never matches ANY in the dictionary.
+    """
+
+    # Number of components in the trie levels.
+    DEPTH = 4
+
+    def __init__(self, names = ()):
+        """
+        :param names: CPE 2.3 names, CPE 2.2 names and deprecation flags.
+        :type names: iterable(tuple(str, str, bool))
+        """
+        self.__root  = {}
+        self.__keys  = {}
+        self.__count = 0
+        for name23, name22, deprecated in names:
+            self.add(name23, name22, deprecated)
+
+    def __len__(self):
+        return self.__count
+
+    def add(self, name23, name22 = None, deprecated = False):
+        """
+        Add a CPE name to the index.
+
+        :param name23: CPE 2.3 name.
+        :type name23: str | unicode
+
+        :param name22: CPE 2.2 name, if known.
+        :type name22: str | unicode
+
+        :param deprecated: True if the name is deprecated.
+        :type deprecated: bool
+        """
+        keys = self.__keys
+        path = tuple(
+            keys.setdefault(key, key)
+            for key in (_cpe_key(x) for x in _parse_cpe(name23))
+        )
+        node = self.__root
+        for key in path[:self.DEPTH - 1]:
+            node = node.setdefault(key, {})
+        node.setdefault(path[self.DEPTH - 1], []).append(
+            (path[self.DEPTH:], name23, name22, bool(deprecated)))
+        self.__count += 1
+
+    def resolve(self, cpe, include_deprecated = True):
+        """
+        Resolve the given CPE with wildcards.
+
+        :param CPE: CPE name.
+        :type CPE: str | unicode
+
+        :param include_deprecated: True to include deprecated names in the
+            results, False otherwise.
+        :type include_deprecated: bool
+
+        :returns: Set of matching CPE names, in the same CPE version as
+            the query.
+        :rtype: set(str|unicode)
+        """
+        ver = get_cpe_version(cpe)
+        matchers = [_cpe_matcher(x) for x in parse_cpe(cpe)]
+        if all(wanted == "*" for wanted, _ in matchers):
+            return set([cpe])
+
+        # Walk down the trie levels.
+        nodes = [self.__root]
+        for matcher in matchers[:self.DEPTH]:
+            wanted, regexp = matcher
+            if wanted == "*":
+                nodes = [child for node in nodes for child in node.itervalues()]
+            elif regexp is None:
+                nodes = [node[wanted] for node in nodes if wanted in node]
+            else:
+                nodes = [
+                    child
+                    for node in nodes
+                    for key, child in node.iteritems()
+                    if _cpe_match_key(matcher, key)
+                ]
+            if not nodes:
+                return set()
+
+        # Check the remaining components on the leaves.
+        tail = [
+            (i, matcher)
+            for i, matcher in enumerate(matchers[self.DEPTH:])
+            if matcher[0] != "*"
+        ]
+        result = set()
+        for leaf in nodes:
+            for rest, name23, name22, deprecated in leaf:
+                if deprecated and not include_deprecated:
+                    continue
+                for i, matcher in tail:
+                    if not _cpe_match_key(matcher, rest[i]):
+                        break
+                else:
+                    if ver == "2.2":
+                        result.add(name22)
+                    else:
+                        result.add(name23)
+        return result
+
+    def resolve_many(self, cpes, include_deprecated = True):
+        """
+        Resolve many CPE names with wildcards at once.
+
+        :param cpes: CPE names.
+        :type cpes: iterable(str|unicode)
+
+        :param include_deprecated: True to include deprecated names in the
+            results, False otherwise.
+        :type include_deprecated: bool
+
+        :returns: Map of each given CPE name to its set of matching names.
+        :rtype: dict(str|unicode -> set(str|unicode))
+        """
+        return {
+            cpe: self.resolve(cpe, include_deprecated)
+            for cpe in set(cpes)
+        }
+
+
+# Number of CPE items in each batch of inserts while loading the dictionary.
+BATCH_SIZE = 5000
+
 
 def transactional(fn):
     def wrapper(self, *args, **kwargs):
@@ -126,6 +536,65 @@ class CPEDB(object):
     CPE_XML_FILE = "official-cpe-dictionary_v2.3.xml"
     CPE_URL_BASE = "http://static.nvd.nist.gov/feeds/xml/cpe/dictionary/"
 
+    # PRAGMAs used while updating the database. They trade durability for
+    # speed, which is fine since the database can always be rebuilt.
+    BULK_PRAGMAS = (
+        ("synchronous",  "OFF"),
+        ("cache_size",   -65536),   # 64 Mb
+        ("temp_store",   "MEMORY"),
+    )
+
+    # CPE table creation statement. The table name is a parameter, so the
+    # bulk loader can build a new table next to the old one.
+    CPE_TABLE = \
+    """
+    CREATE TABLE IF NOT EXISTS `%s` (
+        `rowid` INTEGER PRIMARY KEY,
+        `name23` TEXT NOT NULL UNIQUE,
+        `name22` TEXT NOT NULL,
+        `title` TEXT,
+        `deprecated` INTEGER(1),
+        `part` TEXT NOT NULL DEFAULT '*',
+        `vendor` TEXT NOT NULL DEFAULT '*',
+        `product` TEXT NOT NULL DEFAULT '*',
+        `version` TEXT NOT NULL DEFAULT '*',
+        `update` TEXT NOT NULL DEFAULT '*',
+        `edition` TEXT NOT NULL DEFAULT '*',
+        `language` TEXT NOT NULL DEFAULT '*',
+        `sw_edition` TEXT NOT NULL DEFAULT '*',
+        `target_sw` TEXT NOT NULL DEFAULT '*',
+        `target_hw` TEXT NOT NULL DEFAULT '*',
+        `other` TEXT NOT NULL DEFAULT '*'
+    );
+    """
+
+    # Column types of the CPE table in older databases. They had numeric
+    # affinity, so names like "1.0" were stored as numbers.
+    OLD_CPE_TYPE = "`version` STRING"
+
+    # Version of the data in the CPE table, kept in the user_version PRAGMA.
+    # Databases with older data are reloaded by update().
+    #  1: CPE components are stored normalized (see _cpe_key), so they're
+    #     compared the same way as in CPETrie.
+    DATA_VERSION = 1
+
+    # Indexes on the CPE table. The bulk loader builds them at the end.
+    CPE_INDEXES = (
+        "CREATE INDEX IF NOT EXISTS `cpe_name22` ON `cpe`(`name22`);",
+        "CREATE INDEX IF NOT EXISTS `cpe_title` ON `cpe`(`title`);",
+        "CREATE INDEX IF NOT EXISTS `cpe_part` ON `cpe`(`part`);",
+        "CREATE INDEX IF NOT EXISTS `cpe_vendor` ON `cpe`(`vendor`);",
+        "CREATE INDEX IF NOT EXISTS `cpe_product` ON `cpe`(`product`);",
+        "CREATE INDEX IF NOT EXISTS `cpe_version` ON `cpe`(`version`);",
+        "CREATE INDEX IF NOT EXISTS `cpe_update` ON `cpe`(`update`);",
+        "CREATE INDEX IF NOT EXISTS `cpe_edition` ON `cpe`(`edition`);",
+        "CREATE INDEX IF NOT EXISTS `cpe_language` ON `cpe`(`language`);",
+        "CREATE INDEX IF NOT EXISTS `cpe_sw_edition` ON `cpe`(`sw_edition`);",
+        "CREATE INDEX IF NOT EXISTS `cpe_target_sw` ON `cpe`(`target_sw`);",
+        "CREATE INDEX IF NOT EXISTS `cpe_target_hw` ON `cpe`(`target_hw`);",
+        "CREATE INDEX IF NOT EXISTS `cpe_other` ON `cpe`(`other`);",
+    )
+
     SCHEMA = \
     """
     PRAGMA foreign_keys = ON;
@@ -144,42 +613,53 @@ class CPEDB(object):
     ---------
     -- CPE --
     ---------
+    """ + (CPE_TABLE % "cpe") + "\n".join(CPE_INDEXES)
 
-    CREATE TABLE IF NOT EXISTS `cpe` (
-        `rowid` INTEGER PRIMARY KEY,
-        `name23` STRING NOT NULL UNIQUE,
-        `name22` STRING NOT NULL,
-        `title` STRING,
-        `deprecated` INTEGER(1),
-        `part` STRING NOT NULL DEFAULT '*',
-        `vendor` STRING NOT NULL DEFAULT '*',
-        `product` STRING NOT NULL DEFAULT '*',
-        `version` STRING NOT NULL DEFAULT '*',
-        `update` STRING NOT NULL DEFAULT '*',
-        `edition` STRING NOT NULL DEFAULT '*',
-        `language` STRING NOT NULL DEFAULT '*',
-        `sw_edition` STRING NOT NULL DEFAULT '*',
-        `target_sw` STRING NOT NULL DEFAULT '*',
-        `target_hw` STRING NOT NULL DEFAULT '*',
-        `other` STRING NOT NULL DEFAULT '*'
-    );
-    CREATE INDEX IF NOT EXISTS `cpe_name22` ON `cpe`(`name22`);
-    CREATE INDEX IF NOT EXISTS `cpe_title` ON `cpe`(`title`);
-    CREATE INDEX IF NOT EXISTS `cpe_part` ON `cpe`(`part`);
-    CREATE INDEX IF NOT EXISTS `cpe_vendor` ON `cpe`(`vendor`);
-    CREATE INDEX IF NOT EXISTS `cpe_product` ON `cpe`(`product`);
-    CREATE INDEX IF NOT EXISTS `cpe_version` ON `cpe`(`version`);
-    CREATE INDEX IF NOT EXISTS `cpe_update` ON `cpe`(`update`);
-    CREATE INDEX IF NOT EXISTS `cpe_edition` ON `cpe`(`edition`);
-    CREATE INDEX IF NOT EXISTS `cpe_language` ON `cpe`(`language`);
-    CREATE INDEX IF NOT EXISTS `cpe_sw_edition` ON `cpe`(`sw_edition`);
-    CREATE INDEX IF NOT EXISTS `cpe_target_sw` ON `cpe`(`target_sw`);
-    CREATE INDEX IF NOT EXISTS `cpe_target_hw` ON `cpe`(`target_hw`);
-    CREATE INDEX IF NOT EXISTS `cpe_other` ON `cpe`(`other`);
+    # Full text search index creation statement.
+    # The index is rebuilt by update() along with the CPE table.
+    FTS_SCHEMA = \
+    """
+    CREATE VIRTUAL TABLE `cpe_fts` USING %s(`title`, `components`);
     """
 
+    # Statement to populate the full text search index from the CPE table.
+    FTS_POPULATE = (
+        "INSERT INTO `cpe_fts` (`rowid`, `title`, `components`)"
+        " SELECT `rowid`, `title`,"
+        "        `vendor` || ' ' || `product` || ' ' || `version` || ' ' ||"
+        "        `update` || ' ' || `edition` || ' ' || `language` || ' ' ||"
+        "        `sw_edition` || ' ' || `target_sw` || ' ' ||"
+        "        `target_hw` || ' ' || `other`"
+        "   FROM `cpe`;"
+    )
+
+    # Full text search engines to try, from best to worst.
+    FTS_MODULES = ("fts5", "fts4")
+
+    # Fields that can be searched for, in the order they're queried.
+    SEARCH_FIELDS = (
+        "text", "title",
+        "part", "vendor", "product", "version", "update", "edition",
+        "language", "sw_edition", "target_sw", "target_hw", "other"
+    )
+
+    # Search modes.
+    SEARCH_MODES = ("auto", "exact", "prefix", "substring")
+
+    # Export formats, and columns in the exported data.
+    EXPORT_FORMATS = ("csv", "jsonl")
+    EXPORT_COLUMNS = ("name23", "name22", "title", "deprecated")
+
+    def __init__(self, db_file = None, use_trie = False):
+        """
+        :param db_file: Database filename.
+        :type db_file: str
 
-    def __init__(self, db_file = None):
+        :param use_trie: True to resolve CPE names with an in-memory index
+            (see CPETrie), False to query the database each time. The index
+            is faster for many queries but takes time and memory to build.
+        :type use_trie: bool
+        """
 
         # If no filename is given, use the default.
         if not db_file:
@@ -191,6 +671,13 @@ class CPEDB(object):
         # The busy flag prevents reentrance.
         self.__busy = False
 
+        # Full text search engine, if any. Found when creating the schema.
+        self.__fts = None
+
+        # In-memory index for resolving CPE names, built when first needed.
+        self.__use_trie = use_trie
+        self.__trie     = None
+
         # Determine if the database existed.
         is_new = not exists(db_file)
 
@@ -250,6 +737,50 @@ class CPEDB(object):
     def __create_schema(self):
         self.__cursor.executescript(self.SCHEMA)
 
+        # Older databases have to be reloaded to fix the column types or
+        # the data. Forget when the dictionary was loaded so update() does
+        # it again.
+        self.__cursor.execute("PRAGMA user_version;")
+        data_version = self.__cursor.fetchone()[0]
+        self.__cursor.execute(
+            "SELECT `sql` FROM `sqlite_master`"
+            " WHERE `type` = 'table' AND `name` = 'cpe' LIMIT 1;"
+        )
+        if self.OLD_CPE_TYPE in self.__cursor.fetchone()[0] or \
+                data_version < self.DATA_VERSION:
+            self.__cursor.execute(
+                "DELETE FROM `files` WHERE `filename` = ?;",
+                (self.CPE_XML_FILE,)
+            )
+
+        # Create the full text search index if missing, using the best
+        # engine available. Older SQLite versions may not have any.
+        if not self.__get_fts():
+            for module in self.FTS_MODULES:
+                try:
+                    self.__cursor.execute(self.FTS_SCHEMA % module)
+                except sqlite3.OperationalError:
+                    continue
+                self.__cursor.execute(self.FTS_POPULATE)
+                self.__fts = module
+                break
+
+    # Returns the full text search engine used by the database, if any.
+    # This method assumes it's being called from within an open transaction.
+    def __get_fts(self):
+        if not self.__fts:
+            self.__cursor.execute(
+                "SELECT `sql` FROM `sqlite_master`"
+                " WHERE `type` = 'table' AND `name` = 'cpe_fts' LIMIT 1;"
+            )
+            row = self.__cursor.fetchone()
+            if row:
+                for module in self.FTS_MODULES:
+                    if ("USING %s(" % module) in row[0]:
+                        self.__fts = module
+                        break
+        return self.__fts
+
     # If the XML file is missing, broken or older, download it.
     # This method assumes it's being called from within an open transaction.
     def __download(self, base_url, xml_file):
@@ -333,14 +864,41 @@ class CPEDB(object):
             return xml_parser
 
 
-    @transactional
     def update(self):
         """
         Update the database.
 
         This automatically downloads up-to-date XML files from NIST when needed
         and recreates the database from them.
+
+        The dictionary is bulk loaded into a new table without indexes, the
+        indexes are built once at the end, and the new table replaces the old
+        one within the same transaction.
         """
+        with self.__lock:
+
+            # With the default isolation level, the Python sqlite3 module
+            # commits before each CREATE, DROP or ALTER statement, and the
+            # old table would be dropped before the new one is complete.
+            # So we handle the transaction ourselves while updating.
+            isolation_level = self.__db.isolation_level
+            self.__db.isolation_level = None
+            try:
+
+                # Tune the database for bulk loading while we update it.
+                # This can't be done from within a transaction.
+                old_pragmas = self.__set_pragmas(self.BULK_PRAGMAS)
+                try:
+                    self.__update()
+                finally:
+                    self.__set_pragmas(old_pragmas)
+
+            finally:
+                self.__db.isolation_level = isolation_level
+
+    @transactional
+    def __update(self):
+        self.__cursor.execute("BEGIN;")
 
         # Download and open the XML file.
         xml_file   = self.CPE_XML_FILE
@@ -351,24 +909,38 @@ class CPEDB(object):
             if self.DEBUG:
                 print "Loading file: %s" % xml_file
 
+            # Create a new table with no indexes to load the data into.
+            self.__cursor.execute("DROP TABLE IF EXISTS `cpe_new`;")
+            self.__cursor.execute(self.CPE_TABLE % "cpe_new")
+            insert = (
+                "INSERT OR REPLACE INTO `cpe_new` VALUES "
+                "(NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);"
+            )
+
             # Parse the XML file and store the data into the database.
+            # Each parsed item is freed right away to save memory.
             prefix20 = "{http://cpe.mitre.org/dictionary/2.0}"
             prefix23 = "{http://scap.nist.gov/schema/cpe-extension/2.3}"
             prefixns = "{http://www.w3.org/XML/1998/namespace}"
             context  = iter(xml_parser)
             _, root  = context.next()
             main_tag = prefix20 + "cpe-item"
+            tag23    = prefix23 + "cpe23-item"
+            tag_title = prefix20 + "title"
+            tag_lang = prefixns + "lang"
+            batch    = []
             for event, item in context:
                 if event != "end" or item.tag != main_tag:
                     continue
                 name22 = item.attrib["name"]
-                name23 = item.find(".//%scpe23-item" % prefix23).attrib["name"]
+                name23 = item.find(tag23).attrib["name"]
                 deprecated = int(
                             item.attrib.get("deprecated", "false") == "true")
                 titles = {
-                    t.attrib[prefixns + "lang"]: t.text
-                    for t in item.iter(prefix20 + "title")
+                    t.attrib[tag_lang]: t.text
+                    for t in item.iterfind(tag_title)
                 }
+                root.clear()
                 try:
                     title = titles["en-US"]
                 except KeyError:
@@ -380,18 +952,51 @@ class CPEDB(object):
                     if not found:
                         title = titles[sorted(titles.keys())[0]]
                 params = (name23, name22, title, deprecated)
-                params = params + tuple( parse_cpe(name23) )
-                self.__cursor.execute(
-                    "INSERT OR REPLACE INTO `cpe` VALUES "
-                    "(NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);",
-                    params
-                )
+                params = params + tuple(
+                    _cpe_key(x) for x in _parse_cpe(name23))
+                batch.append(params)
+                if len(batch) >= BATCH_SIZE:
+                    self.__cursor.executemany(insert, batch)
+                    del batch[:]
+            self.__cursor.executemany(insert, batch)
+
+            # Replace the old table with the new one, and build the indexes.
+            self.__cursor.execute("DROP TABLE `cpe`;")
+            self.__cursor.execute("ALTER TABLE `cpe_new` RENAME TO `cpe`;")
+            for statement in self.CPE_INDEXES:
+                self.__cursor.execute(statement)
+
+            # Rebuild the full text search index.
+            if self.__get_fts():
+                self.__cursor.execute("DELETE FROM `cpe_fts`;")
+                self.__cursor.execute(self.FTS_POPULATE)
+
+            # Gather statistics so the query planner picks the best index.
+            self.__cursor.execute("ANALYZE `cpe`;")
+
+            # Remember the components are stored normalized now.
+            self.__cursor.execute(
+                "PRAGMA user_version = %d;" % self.DATA_VERSION)
+
+            # The in-memory index is out of date now.
+            self.__trie = None
 
             # Delete the XML file.
             unlink(xml_file)
             if self.DEBUG:
                 print "Deleted file: %s" % xml_file
 
+    # Set the given PRAGMAs and return their old values.
+    # Some PRAGMAs can't be changed inside a transaction, so this is done
+    # outside of them.
+    def __set_pragmas(self, pragmas):
+        old_pragmas = []
+        for name, value in pragmas:
+            old_value = self.__db.execute("PRAGMA %s;" % name).fetchone()[0]
+            old_pragmas.append((name, old_value))
+            self.__db.execute("PRAGMA %s = %s;" % (name, value))
+        return old_pragmas
+
 
     @transactional
     def resolve(self, cpe, include_deprecated = True):
@@ -408,29 +1013,89 @@ class CPEDB(object):
         :returns: Set of matching CPE names.
         :rtype: set(str|unicode)
         """
+        if self.__use_trie:
+            return self.__get_trie().resolve(cpe, include_deprecated)
+        return self.__resolve(cpe, include_deprecated)
+
+    @transactional
+    def resolve_many(self, cpes, include_deprecated = True):
+        """
+        Resolve many CPE names with wildcards at once.
+
+        :param cpes: CPE names.
+        :type cpes: iterable(str|unicode)
+
+        :param include_deprecated: True to include deprecated names in the
+            results, False otherwise.
+        :type include_deprecated: bool
+
+        :returns: Map of each given CPE name to its set of matching names.
+        :rtype: dict(str|unicode -> set(str|unicode))
+        """
+        if self.__use_trie:
+            return self.__get_trie().resolve_many(cpes, include_deprecated)
+        return {
+            cpe: self.__resolve(cpe, include_deprecated)
+            for cpe in set(cpes)
+        }
+
+    @transactional
+    def get_trie(self):
+        """
+        Get the in-memory index of the CPE dictionary, building it if needed.
+        A new index is built after each update.
+
+        :returns: In-memory index.
+        :rtype: CPETrie
+        """
+        return self.__get_trie()
+
+    # This method assumes it's being called from within an open transaction.
+    def __get_trie(self):
+        if self.__trie is None:
+            self.__cursor.execute(
+                "SELECT `name23`, `name22`, `deprecated` FROM `cpe`;")
+            self.__trie = CPETrie(self.__cursor)
+        return self.__trie
+
+    # This method assumes it's being called from within an open transaction.
+    def __resolve(self, cpe, include_deprecated):
 
         ver = get_cpe_version(cpe).replace(".", "")
         parsed = parse_cpe(cpe)
 
-        params = [x for x in parsed if x and x != "*"]
-        if not params:
-            return set([cpe])
-        params.insert(0, cpe)
-
         columns = [
-            "part", "vendor", "product", "version", "update", "edition"
+            "part", "vendor", "product", "version", "update", "edition",
             "language", "sw_edition", "target_sw", "target_hw", "other"
         ]
 
+        # Look up each component with wildcards in the best possible way.
+        # The components are stored normalized, as in CPETrie.
+        conditions = []
+        params = [cpe]
+        for column, value in zip(columns, parsed):
+            if not value or value == "*":
+                continue
+            path, value = _search_path(_cpe_key(value))
+            if path == "exact":
+                conditions.append("`%s` = ?" % column)
+                params.append(value)
+            elif path == "prefix":
+                conditions.append("`%s` >= ? AND `%s` < ?" % (column, column))
+                params.extend(_prefix_range(value))
+            else:
+                conditions.append(
+                    "`%s` LIKE ? ESCAPE '\\' AND `%s` NOT IN ('*', '-')"
+                    % (column, column))
+                params.append(value)
+        if not conditions:
+            return set([cpe])
+
         query = "SELECT `name%s` FROM `cpe` WHERE " % ver
         if not include_deprecated:
             query += "`deprecated` = 0 AND "
         query += "(`name%s` = ?" % ver
-        query += " OR (%s)" % " AND ".join(
-            "`%s` = ?" % columns[i]
-            for i in xrange(len(columns))
-            if parsed[i] and parsed[i] != "*"
-        )
+        query += " OR (%s)" % " AND ".join(conditions)
         query += ");"
 
         self.__cursor.execute(query, params)
@@ -455,13 +1120,150 @@ class CPEDB(object):
             raise KeyError("CPE name not found: %s" % cpe)
         return row[0]
 
+    @transactional
+    def get_titles(self, names):
+        """
+        Get the user-friendly titles of many CPE names at once.
+
+        :param names: CPE names.
+        :type names: iterable(str|unicode)
+
+        :returns: Map of CPE names to their titles.
+            Names not found in the dictionary are left out.
+        :rtype: dict(str|unicode -> str|unicode)
+        """
+        names = set(names)
+        for name in names:
+            get_cpe_version(name)
+        self.__cursor.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS `cpe_names_wanted` ("
+            "    `name` TEXT NOT NULL"
+            ");"
+        )
+        self.__cursor.execute("DELETE FROM `temp`.`cpe_names_wanted`;")
+        self.__cursor.executemany(
+            "INSERT INTO `temp`.`cpe_names_wanted` VALUES (?);",
+            ((name,) for name in names)
+        )
+        self.__cursor.execute(
+            "SELECT `cpe_names_wanted`.`name`, `cpe`.`title`"
+            "  FROM `temp`.`cpe_names_wanted`"
+            "  JOIN `cpe` ON `cpe`.`name23` = `cpe_names_wanted`.`name`"
+            " UNION ALL "
+            "SELECT `cpe_names_wanted`.`name`, `cpe`.`title`"
+            "  FROM `temp`.`cpe_names_wanted`"
+            "  JOIN `cpe` ON `cpe`.`name22` = `cpe_names_wanted`.`name`;"
+        )
+        titles = dict(self.__cursor.fetchall())
+        self.__cursor.execute("DELETE FROM `temp`.`cpe_names_wanted`;")
+        return titles
+
+    @transactional
+    def export(self, output, format = "csv", include_deprecated = True):
+        """
+        Export the whole CPE dictionary, one name at a time, so it never
+        has to be held in memory.
+
+        Both formats have the EXPORT_COLUMNS fields. CSV has a header row
+        and is encoded in UTF-8. JSON lines has a JSON object per line.
+
+        :param output: Output filename or file object.
+        :type output: str | file
+
+        :param format: Output format, one of EXPORT_FORMATS.
+        :type format: str
+
+        :param include_deprecated: True to include deprecated names,
+            False otherwise.
+        :type include_deprecated: bool
+
+        :returns: Number of exported names.
+        :rtype: int
+
+        :raises ValueError: Unknown export format.
+        """
+        if format not in self.EXPORT_FORMATS:
+            raise ValueError("Unknown export format: %r" % (format,))
+        if isinstance(output, basestring):
+            with open(output, "wb") as fd:
+                return self.__export(fd, format, include_deprecated)
+        return self.__export(output, format, include_deprecated)
+
+    # This method assumes it's being called from within an open transaction.
+    def __export(self, fd, format, include_deprecated):
+        query = "SELECT %s FROM `cpe`" % ", ".join(
+            "`%s`" % column for column in self.EXPORT_COLUMNS)
+        if not include_deprecated:
+            query += " WHERE `deprecated` = 0"
+        self.__cursor.execute(query + " ORDER BY `rowid`;")
+        count = 0
+        if format == "csv":
+            writer = csv.writer(fd)
+            writer.writerow(self.EXPORT_COLUMNS)
+            for row in self.__cursor:
+                writer.writerow([
+                    x.encode("utf-8") if isinstance(x, unicode) else x
+                    for x in row
+                ])
+                count += 1
+        else:
+
+            # Formatting the objects by hand is much faster than json.dumps().
+            encode = json.JSONEncoder().encode
+            for name23, name22, title, deprecated in self.__cursor:
+                fd.write(
+                    '{"name23": %s, "name22": %s, "title": %s,'
+                    ' "deprecated": %s}\n' % (
+                        encode(name23), encode(name22), encode(title),
+                        "true" if deprecated else "false"
+                    )
+                )
+                count += 1
+        return count
+
 
     @transactional
-    def search(self, **kwargs):
+    def search(self, mode = "auto", with_titles = False, **kwargs):
         """
         Search the CPE database for the requested fields.
         The value '*' is assumed for missing fields.
 
+        Each field is looked up in a different way depending on the mode:
+
+         - "auto": words in the title are looked up in the full text search
+           index. CPE components are looked up in their indexes, either as
+           exact values or as prefixes if they end with an asterisk. Any
+           other wildcards ('*' and '?') are matched as in CPE 2.3, but
+           that requires a table scan when there are no other fields.
+
+         - "exact": all fields must match exactly.
+
+         - "prefix": all fields must begin with the given values.
+
+         - "substring": all fields must contain the given values. This
+           always requires a table scan.
+
+        The "text" keyword always uses the full text search index, in all
+        modes. CPE components are case insensitive in all modes, and
+        escaped characters match the unescaped ones except for wildcards
+        and backslashes. Titles are case sensitive, except in the full
+        text search.
+
+        .. note: If SQLite has no full text search support, words are
+            looked for as substrings of the title (and of the CPE name, for
+            the "text" keyword). This is much slower.
+
+        :param mode: Search mode, one of SEARCH_MODES.
+        :type mode: str
+
+        :param with_titles: True to return the titles too, False to return
+            only the names.
+        :type with_titles: bool
+
+        :keyword text: Words to look for in the title or any CPE component.
+            Words ending with an asterisk are treated as prefixes.
+        :type text: str | unicode
+
         :keyword title: User-friendly product name.
         :type title: str | unicode
 
@@ -510,31 +1312,163 @@ class CPEDB(object):
             does not logically fit in any other attribute value.
         :type other: str | unicode
 
-        :returns: Set of matching CPE names.
-        :rtype: set(str|unicode)
+        :returns: Set of matching CPE names, or a map of matching CPE names
+            to their titles if with_titles is True.
+        :rtype: set(str|unicode) | dict(str|unicode -> str|unicode)
+
+        :raises ValueError: Unknown search mode.
         """
-        columns = [
-            "title",
-            "part", "vendor", "product", "version", "update", "edition",
-            "language", "sw_edition", "target_sw", "target_hw", "other"
-        ]
-        if set(kwargs).difference(columns):
+        if mode not in self.SEARCH_MODES:
+            raise ValueError("Unknown search mode: %r" % (mode,))
+        unknown = set(kwargs).difference(self.SEARCH_FIELDS)
+        if unknown:
             raise TypeError("Unknown keyword arguments: %s"
-                    % ", " % sorted(set(kwargs).difference(columns)) )
-        query = "SELECT `name23` FROM `cpe` WHERE "
-        query += " AND ".join(
-            "`%s` LIKE ?" % field
-            for field in columns
-            if field in kwargs and kwargs[field] != "*"
-        )
-        params = [
-            "%%%s%%" % kwargs[field].replace("%", "%%")
-            for field in columns
-            if field in kwargs and kwargs[field] != "*"
-        ]
-        self.__cursor.execute(query, params)
+                    % ", ".join(sorted(unknown)) )
+
+        # Build the conditions for each field.
+        conditions = []
+        params = []
+        for field in self.SEARCH_FIELDS:
+            value = kwargs.get(field, "*")
+            if not value or value == "*":
+                continue
+
+            # Words go to the full text search index.
+            if field == "text" or (field == "title" and mode == "auto"):
+                self.__search_words(field, value, conditions, params)
+                continue
+
+            # CPE components are case insensitive, and stored normalized.
+            if field != "title":
+                value = _cpe_key(value)
+
+            # Choose the access path.
+            path = mode
+            if mode == "auto":
+                path, value = _search_path(value)
+            if path == "exact":
+                conditions.append("`%s` = ?" % field)
+                params.append(value)
+            elif path == "prefix":
+                conditions.append("`%s` >= ? AND `%s` < ?" % (field, field))
+                params.extend(_prefix_range(value))
+            elif path == "like":
+                conditions.append(
+                    "`%s` LIKE ? ESCAPE '\\' AND `%s` NOT IN ('*', '-')"
+                    % (field, field))
+                params.append(value)
+            else:
+                conditions.append("`%s` LIKE ? ESCAPE '\\'" % field)
+                params.append("%%%s%%" % _like_escape(value))
+
+        # Run the query.
+        if with_titles:
+            query = "SELECT `name23`, `title` FROM `cpe`"
+        else:
+            query = "SELECT `name23` FROM `cpe`"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        self.__cursor.execute(query + ";", params)
+        if with_titles:
+            return dict(self.__cursor.fetchall())
         return set(row[0] for row in self.__cursor.fetchall())
 
+    # Add the conditions to look for words in the title (field "title") or
+    # anywhere (field "text"). Uses the full text search index if possible.
+    # This method assumes it's being called from within an open transaction.
+    def __search_words(self, field, value, conditions, params):
+        words = value.split()
+        if self.__get_fts():
+            column = "title" if field == "title" else None
+            query = _fts_query(words, column, self.__fts)
+            if query:
+                conditions.append(
+                    "`rowid` IN (SELECT `rowid` FROM `cpe_fts`"
+                    " WHERE `cpe_fts` MATCH ?)")
+                params.append(query)
+            return
+        for word in words:
+            word = "%%%s%%" % _like_escape(word.rstrip("*"))
+            if field == "title":
+                conditions.append("`title` LIKE ? ESCAPE '\\'")
+                params.append(word)
+            else:
+                conditions.append("(`title` LIKE ? ESCAPE '\\'"
+                                  " OR `name23` LIKE ? ESCAPE '\\')")
+                params.extend((word, word))
+
+
+
+def test():
+    import shutil
+    import tempfile
+    from os.path import join
+
+    # Dictionary with mixed case and escaped names, and ANY and NA values.
+    names = [
+        "cpe:2.3:a:Acme:Widget:1.0:*:*:*:*:*:*:*",
+        "cpe:2.3:a:acme:widget:2.0:*:*:*:*:*:*:*",
+        "cpe:2.3:a:acme:gadget\\+\\+:2.0:*:*:*:*:*:*:*",
+        "cpe:2.3:a:ACME:star\\*name:1.0:*:*:*:*:*:*:*",
+        "cpe:2.3:a:other:Widget:-:*:*:*:*:*:*:*",
+        "cpe:2.3:o:acme:os:*:*:*:*:*:*:*:*",
+    ]
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        class TestCPEDB(CPEDB):
+            DEBUG = False
+            CPE_XML_FILE = join(tmp_dir, "official-cpe-dictionary_v2.3.xml")
+        with open(TestCPEDB.CPE_XML_FILE, "w") as fd:
+            fd.write(
+                '<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<cpe-list xmlns="http://cpe.mitre.org/dictionary/2.0"'
+                ' xmlns:cpe-23='
+                '"http://scap.nist.gov/schema/cpe-extension/2.3">\n')
+            for name23 in names:
+                fd.write(
+                    '<cpe-item name="%s"><title xml:lang="en-US">%s</title>'
+                    '<cpe-23:cpe23-item name="%s"/></cpe-item>\n'
+                    % (cpe23to22(name23), name23, name23))
+            fd.write('</cpe-list>\n')
+        with TestCPEDB(join(tmp_dir, "test.db")) as db:
+
+            # The components are case insensitive in all search modes.
+            acme = set(names[:4])
+            for mode in ("auto", "exact", "prefix", "substring"):
+                found = db.search(mode = mode, part = "a", vendor = "ACME")
+                assert found == acme, (mode, found)
+            assert db.search(vendor = "Ac*") == acme | set(names[5:])
+            assert db.search(product = "Widget", version = "1.0") == \
+                set(names[:1])
+            assert db.search(product = "star\\*name") == set(names[3:4])
+            assert db.search(product = "star\\**") == set(names[3:4])
+
+            # SQL and the trie resolve names the same way.
+            queries = {
+                "cpe:2.3:a:acme:*:*:*:*:*:*:*:*:*": acme,
+                "cpe:2.3:a:ACME:WIDGET:*:*:*:*:*:*:*:*": set(names[:2]),
+                "cpe:2.3:a:*:widget:-:*:*:*:*:*:*:*": set(names[4:5]),
+                "cpe:2.3:a:*:widget:?.0:*:*:*:*:*:*:*": set(names[:2]),
+                "cpe:2.3:a:acme:gadget\\+\\+:*:*:*:*:*:*:*:*":
+                    set(names[2:3]),
+                "cpe:2.3:a:acme:gadget\\+*:*:*:*:*:*:*:*:*": set(names[2:3]),
+                "cpe:2.3:a:acme:star\\*name:*:*:*:*:*:*:*:*":
+                    set(names[3:4]),
+                "cpe:2.3:a:acme:star*:*:*:*:*:*:*:*:*": set(names[3:4]),
+                "cpe:2.3:a:acme:star\\*:*:*:*:*:*:*:*:*": set(),
+                "cpe:2.3:o:acme:os:?:*:*:*:*:*:*:*": set(),
+                "cpe:/a:acme:gadget%2b%2b": set([cpe23to22(names[2])]),
+                "cpe:/a:Acme:Widget:1.0": set([cpe23to22(names[0])]),
+            }
+            trie = db.get_trie()
+            for query, expected in sorted(queries.iteritems()):
+                found = db.resolve(query)
+                assert found == expected, (query, found)
+                found = trie.resolve(query)
+                assert found == expected, (query, found)
+            assert db.resolve_many(queries) == trie.resolve_many(queries)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors = True)
 
 if __name__ == "__main__":
     import sys
@@ -558,6 +1492,8 @@ if __name__ == "__main__":
         if not is_new:
             db.update()
             pass
-        for cpe in db.search(title=title, version=version, part="o", target_hw=target_hw):
+        titles = db.search(title=title, version=version, part="o",
+                           target_hw=target_hw, with_titles=True)
+        for cpe, title in sorted(titles.iteritems()):
             ##print cpe
-            print db.get_title(cpe)
+            print title
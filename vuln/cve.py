@@ -28,23 +28,46 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import gzip
+import json
+import marshal
 import re
 import sqlite3
-
-from datetime import date
-from os import unlink
-from os.path import exists, getmtime
+import struct
+import sys
+
+from array import array
+from collections import defaultdict, namedtuple
+from datetime import date, datetime, timedelta
+from functools import partial
+from multiprocessing import Pool
+from mmap import mmap, ACCESS_READ
+from multiprocessing.pool import ThreadPool
+from os import fdopen, unlink
+from os.path import basename, exists, getmtime
 from shutil import copyfileobj
-from time import gmtime, asctime
-from threading import RLock
+from tempfile import mkstemp
+from time import gmtime, asctime, time
+from threading import Lock, RLock, local
 from urllib import quote, unquote
 from urllib2 import urlopen, Request, HTTPError
+from weakref import ref
+
+from cpe import parse_cpe
+from fileutil import replace_file
+from snapshot import open_snapshot, write_manifest
 
 try:
     from xml.etree import cElementTree as etree
 except ImportError:
     from xml.etree import ElementTree as etree
 
+# NumPy is optional, it's only used to load the columnar exports.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 def transactional(fn):
     def wrapper(self, *args, **kwargs):
@@ -52,16 +75,958 @@ def transactional(fn):
     return wrapper
 
 
+def _sql_statements(script):
+    """
+    Split an SQL script into statements, to run them one by one within a
+    transaction. Cursor.executescript() would commit the transaction first
+    and run each statement on its own.
+    """
+    statement = ""
+    for line in script.splitlines(True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            yield statement.strip()
+            statement = ""
+
+
+# XML namespaces used by the NVD CVE feeds.
+NS_VULN = "{http://scap.nist.gov/schema/vulnerability/0.4}"
+NS_CVSS = "{http://scap.nist.gov/schema/cvss-v2/0.2}"
+NS_FEED = "{http://scap.nist.gov/schema/feed/vulnerability/2.0}"
+
+# Number of CVE entries in each batch handed over to the database writer.
+BATCH_SIZE = 1000
+
+# Number of bytes fed to the XML and JSON parsers at a time.
+CHUNK_SIZE = 65536
+
+# Start of the array of entries in the NVD JSON feeds.
+# It's called "CVE_Items" in the 1.1 feeds and "vulnerabilities" in 2.0.
+_json_items_start = re.compile(r'"(?:CVE_Items|vulnerabilities)"\s*:\s*\[')
+
+# Strings and brackets in JSON data, to find where an entry ends.
+# The closing quote is missing when a string is cut short.
+_json_brackets = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*(")?|[\[\]{}]')
+
+# Magic string of the columnar export files.
+COLUMNS_MAGIC = "CVECOLS1"
+
+# Columns of the columnar export files, and their array typecodes.
+# The string columns are stored as codes, -1 meaning a missing value.
+# Missing CVSS scores are stored as NaN.
+COLUMNS = (
+    ("year",                   "h"),
+    ("number",                 "i"),
+    ("cvss_score",             "d"),
+    ("cvss_access_vector",     "b"),
+    ("cvss_access_complexity", "b"),
+    ("cvss_authentication",    "b"),
+    ("cvss_integrity_impact",  "b"),
+    ("cwe",                    "h"),
+)
+
+
+class _Connection(object):
+    """
+    Holds the database connection of a thread.
+
+    Only the thread's local storage references it, so it goes away when the
+    thread dies, and the connection is closed then.
+    """
+
+    __slots__ = ("db", "__weakref__")
+
+    def __init__(self, db):
+        self.db = db
+
+
+def _close_connection(connections, lock, holder_ref):
+    """
+    Close the connection of a dead thread.
+
+    :param connections: Open connections, keyed by weak references to
+        their holders.
+    :type connections: dict(weakref, sqlite3.Connection)
+
+    :param lock: Lock that protects the connections.
+    :type lock: RLock
+
+    :param holder_ref: Weak reference to the holder that went away.
+    :type holder_ref: weakref
+    """
+    with lock:
+        db = connections.pop(holder_ref, None)
+    if db is not None:
+        db.close()
+
+
+class _IdMap(dict):
+    """
+    Maps the unique keys of a table to their rowids.
+
+    Used by the bulk loader to resolve rowids without querying the database,
+    and to allocate the rowids of new rows before inserting them.
+    """
+
+    def __init__(self, rows):
+        super(_IdMap, self).__init__(rows)
+        self.next_id = max(self.itervalues()) + 1 if self else 1
+
+    def allocate(self, key):
+        rowid = self.next_id
+        self.next_id += 1
+        self[key] = rowid
+        return rowid
+
+
+# Cache statistics returned by CVEDB.cache_info().
+CacheInfo = namedtuple("CacheInfo",
+                       ("hits", "misses", "maxsize", "currsize", "generation"))
+
+
+class _LRUCache(object):
+    """
+    Bounded cache that discards the least recently used items first.
+
+    Invalidating the cache bumps its generation number. Items read from the
+    database before that are ignored when put in the cache, so a reader that
+    raced with an update can't bring stale data back into it.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize    = maxsize
+        self.generation = 0
+        self.hits       = 0
+        self.misses     = 0
+        self.__lock     = Lock()
+        self.__reset()
+
+    # The items are kept in a circular doubly linked list, from the least
+    # to the most recently used. Each link is [prev, next, key, value].
+    def __reset(self):
+        root = []
+        root[:] = [root, root, None, None]
+        self.__root = root
+        self.__map  = {}
+
+    def get(self, key):
+        with self.__lock:
+            link = self.__map.get(key)
+            if link is None:
+                self.misses += 1
+                return None
+            link_prev, link_next = link[0], link[1]
+            link_prev[1] = link_next
+            link_next[0] = link_prev
+            root = self.__root
+            last = root[0]
+            last[1] = root[0] = link
+            link[0] = last
+            link[1] = root
+            self.hits += 1
+            return link[3]
+
+    def put(self, key, value, generation):
+        with self.__lock:
+            if generation != self.generation or self.maxsize <= 0 or \
+                    key in self.__map:
+                return
+            root = self.__root
+            if len(self.__map) >= self.maxsize:
+                oldest = root[1]
+                root[1] = oldest[1]
+                oldest[1][0] = root
+                del self.__map[oldest[2]]
+            last = root[0]
+            link = [last, root, key, value]
+            last[1] = root[0] = self.__map[key] = link
+
+    def invalidate(self):
+        with self.__lock:
+            self.generation += 1
+            self.__reset()
+
+    def info(self):
+        with self.__lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize,
+                             len(self.__map), self.generation)
+
+
+def _parse_cve_name(cvename):
+    """
+    Parse a CVE name.
+
+    :param cvename: CVE name.
+    :type: cvename: str
+
+    :returns: Year and number.
+    :rtype: tuple(int, int)
+    """
+    if not isinstance(cvename, basestring):
+        raise TypeError("Expected string, got %r instead" % type(cvename))
+    if not cvename.startswith("CVE-"):
+        raise ValueError("Invalid CVE name: %s" % cvename)
+    if len(cvename) not in (13, 14):
+        raise ValueError("Invalid CVE name: %s" % cvename)
+    return int(cvename[4:8]), int(cvename[9:])
+
+
+def _to_str(x):
+    "Convert unicode strings from the database to UTF-8 when possible."
+    if isinstance(x, unicode):
+        try:
+            x = x.encode("UTF-8")
+        except Exception:
+            pass
+    return x
+
+
+def _fts_phrase(word, module):
+    """
+    Quote a word for use in a full text search query.
+    A trailing asterisk means a prefix search, the syntax for it depends on
+    the full text search engine.
+    """
+    prefix = word.endswith("*")
+    word = word.rstrip("*").replace('"', '""')
+    if not prefix:
+        return '"%s"' % word
+    if module == "fts5":
+        return '"%s"*' % word
+    return '"%s*"' % word
+
+
+def _fts4_rank(matchinfo):
+    """
+    Ranking function for FTS4, which has no built-in one.
+
+    Adds up, for each phrase and column, the ratio of hits in this row to
+    the hits in all rows. Expects the output of matchinfo(..., 'pcx').
+    """
+    info    = array("I", str(matchinfo))
+    phrases = info[0]
+    columns = info[1]
+    score   = 0.0
+    for i in xrange(phrases * columns):
+        hits_this_row = info[2 + i * 3]
+        hits_all_rows = info[3 + i * 3]
+        if hits_this_row:
+            score += float(hits_this_row) / hits_all_rows
+    return score
+
+
+def _utc_timestamp(timestamp):
+    """
+    Convert an NVD timestamp like "2013-06-01T12:30:00.000-04:00" to UTC,
+    so timestamps with different offsets can be compared as strings.
+
+    :param timestamp: NVD timestamp.
+    :type timestamp: str
+
+    :returns: UTC timestamp, like "2013-06-01T16:30:00.000Z".
+    :rtype: str
+    """
+    when = datetime(
+        int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+        int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]))
+    if timestamp[19:20] == ".":
+        millis = timestamp[20:23]
+    else:
+        millis = "000"
+    offset = timestamp[-6:]
+    if offset[0] in "+-" and offset[3] == ":":
+        delta = timedelta(hours = int(offset[1:3]), minutes = int(offset[4:6]))
+        if offset[0] == "+":
+            when -= delta
+        else:
+            when += delta
+    return "%s.%sZ" % (when.strftime("%Y-%m-%dT%H:%M:%S"), millis)
+
+
+# Tokens of a version string, and the ones that mark pre-releases.
+_version_tokens = re.compile(r"[0-9]+|[a-z]+")
+_PRERELEASE_TAGS = frozenset(("dev", "pre", "preview", "alpha", "beta", "rc"))
+
+def _version_key(version):
+    """
+    Sort key for version strings.
+
+    Numbers are compared as numbers, so "1.10" comes after "1.9", and
+    trailing zeros are ignored, so "1.0" and "1.0.0" are the same version.
+    Pre-release tags come before the release and any other letters after
+    it, so "1.0rc1" < "1.0" < "1.0a".
+
+    :param version: Version string.
+    :type version: str
+
+    :returns: Sort key.
+    :rtype: tuple
+    """
+    key   = []
+    zeros = 0
+    for token in _version_tokens.findall(version.lower()):
+        if token.isdigit():
+            number = int(token)
+            if not number:
+                zeros += 1
+                continue
+            key.extend([(2, 0)] * zeros)
+            key.append((2, number))
+        elif token in _PRERELEASE_TAGS:
+            key.append((0, token))
+        else:
+            key.append((3, token))
+        zeros = 0
+    key.append((1,))
+    return tuple(key)
+
+
+def _version_in_range(key, bounds):
+    """
+    Tell if a version is within a range of versions.
+
+    :param key: Version key, as returned by _version_key().
+    :type key: tuple
+
+    :param bounds: Version keys of the start including, start excluding,
+        end including and end excluding bounds. Missing bounds are None.
+    :type bounds: tuple(tuple | None)
+
+    :rtype: bool
+    """
+    start_including, start_excluding, end_including, end_excluding = bounds
+    return (
+        (start_including is None or key >= start_including) and
+        (start_excluding is None or key >  start_excluding) and
+        (end_including   is None or key <= end_including)   and
+        (end_excluding   is None or key <  end_excluding)
+    )
+
+
+def _cpe_parts(cpe):
+    """
+    Parse a CPE name into the components stored in the cve_cpe_parts table.
+    Components are lowercased, and empty components become "*" since both
+    mean any value.
+
+    :param cpe: CPE name, in 2.2 or 2.3 format.
+    :type cpe: str
+
+    :returns: Part, vendor, product, version, update, edition, language,
+        sw_edition, target_sw, target_hw and other.
+    :rtype: tuple(str)
+
+    :raises ValueError: The CPE name is invalid.
+    """
+    return tuple(x.lower() or "*" for x in parse_cpe(cpe))
+
+
+def _cpe_parts_rows(cpes):
+    """
+    Rows of the cve_cpe_parts table for the given (rowid, CPE name) pairs.
+    Invalid CPE names are skipped, since they can't be matched anyway.
+    """
+    for cpe_id, cpe in cpes:
+        try:
+            yield (cpe_id,) + _cpe_parts(cpe)
+        except ValueError:
+            pass
+
+
+def _parse_cve_file(xml_file, watermark = None):
+    """
+    Parse a CVE XML feed file into a spool file of batches of rows.
+    See _spool_entries() for details.
+
+    :param xml_file: XML feed filename.
+    :type xml_file: str
+
+    :param watermark: Optional UTC timestamp. Entries last modified at or
+        before this time are skipped, since they were already loaded.
+    :type watermark: str
+
+    :returns: Spool filename, and the new watermark.
+    :rtype: tuple(str, str)
+    """
+    return _spool_entries(_iter_cve_file(xml_file), watermark)
+
+
+def _parse_json_file(json_file, watermark = None):
+    """
+    Parse an NVD JSON feed file into a spool file of batches of rows.
+    See _spool_entries() for details.
+
+    :param json_file: JSON feed filename, optionally gzipped.
+    :type json_file: str
+
+    :param watermark: Optional UTC timestamp. Entries last modified at or
+        before this time are skipped, since they were already loaded.
+    :type watermark: str
+
+    :returns: Spool filename, and the new watermark.
+    :rtype: tuple(str, str)
+    """
+    return _spool_entries(_iter_json_file(json_file), watermark)
+
+
+def _spool_entries(entries, watermark = None):
+    """
+    Write the rows of the entries of a feed into a spool file, in batches.
+
+    This runs in the parser processes, so it must never touch the database.
+    Each row is a tuple with the following fields: year, number, cvss_score,
+    cvss_access_vector, cvss_access_complexity, cvss_authentication,
+    cvss_integrity_impact, cwe, summary, products, references, cvss3_score,
+    cvss3_vector, cvss3_severity, ranges. The ranges are tuples with a CPE
+    name and the start including, start excluding, end including and end
+    excluding versions; they're None if the feed doesn't have them.
+
+    The batches are written to a spool file as they are parsed rather than
+    kept in memory, so memory usage doesn't grow with the size of the feed.
+    Use _read_batches() to read them back.
+
+    :param entries: Last modified UTC timestamp and row of each entry.
+    :type entries: iter(tuple(str, tuple))
+
+    :param watermark: Optional UTC timestamp. Entries last modified at or
+        before this time are skipped, since they were already loaded.
+    :type watermark: str
+
+    :returns: Spool filename, and the new watermark.
+    :rtype: tuple(str, str)
+    """
+    fd, spool_file = mkstemp(prefix = "cve-", suffix = ".rows")
+    new_watermark  = watermark
+    batch          = []
+    try:
+        with fdopen(fd, "wb") as fd:
+            for modified, row in entries:
+                if modified:
+                    if watermark and modified <= watermark:
+                        continue
+                    if not new_watermark or modified > new_watermark:
+                        new_watermark = modified
+                batch.append(row)
+                if len(batch) >= BATCH_SIZE:
+                    marshal.dump(batch, fd)
+                    batch = []
+            if batch:
+                marshal.dump(batch, fd)
+    except:
+        unlink(spool_file)
+        raise
+    return spool_file, new_watermark
+
+
+def _read_batches(spool_file):
+    """
+    Read back the batches of rows written by _parse_cve_file().
+
+    :param spool_file: Spool filename.
+    :type spool_file: str
+
+    :returns: Generator of batches of rows.
+    :rtype: iter(list(tuple))
+    """
+    with open(spool_file, "rb") as fd:
+        while True:
+            try:
+                batch = marshal.load(fd)
+            except EOFError:
+                break
+            yield batch
+
+
+def _iter_cve_file(xml_file):
+    """
+    Parse a CVE XML feed file as a stream, one chunk at a time.
+
+    :param xml_file: XML feed filename.
+    :type xml_file: str
+
+    :returns: Generator of the last modified UTC timestamp and the row of
+        each entry. See _spool_entries() for the fields of the rows.
+    :rtype: iter(tuple(str, tuple))
+    """
+    target = _CVEFeedParser()
+    parser = etree.XMLParser(target = target)
+    rows   = target.rows
+    with open(xml_file, "rb") as fd:
+        while True:
+            data = fd.read(CHUNK_SIZE)
+            if not data:
+                break
+            parser.feed(data)
+            if rows:
+                for item in rows:
+                    yield item
+                del rows[:]
+    parser.close()
+    for item in rows:
+        yield item
+
+
+class _CVEFeedParser(object):
+    """
+    Parser target for the CVE XML feeds.
+
+    No element tree is built at all. The XML parser calls the start(),
+    data() and end() methods for each tag, which dispatch on the tag name to
+    fill in the fields of the current entry. At the end of each entry a flat
+    row is appended to the rows list, along with its last modified timestamp.
+    """
+
+    # Tags whose text we want, mapped to the field they go into.
+    TEXT_TAGS = {
+        NS_VULN + "product":                "products",
+        NS_VULN + "last-modified-datetime": "modified",
+        NS_CVSS + "score":                  "cvss_score",
+        NS_CVSS + "access-vector":          "cvss_access_vector",
+        NS_CVSS + "access-complexity":      "cvss_access_complexity",
+        NS_CVSS + "authentication":         "cvss_authentication",
+        NS_CVSS + "integrity-impact":       "cvss_integrity_impact",
+        NS_VULN + "summary":                "summary",
+    }
+
+    TAG_ENTRY     = NS_FEED + "entry"
+    TAG_CWE       = NS_VULN + "cwe"
+    TAG_REFERENCE = NS_VULN + "reference"
+
+    def __init__(self):
+        self.rows   = []
+        self.fields = None
+        self.text   = None
+
+    def start(self, tag, attrib):
+        if tag in self.TEXT_TAGS:
+            self.text = []
+        elif tag == self.TAG_REFERENCE:
+            self.fields["references"].append(attrib["href"])
+        elif tag == self.TAG_CWE:
+            self.fields.setdefault("cwe", attrib["id"])
+        elif tag == self.TAG_ENTRY:
+            self.fields = {
+                "id":         attrib["id"],
+                "products":   [],
+                "references": [],
+            }
+
+    def data(self, data):
+        if self.text is not None:
+            self.text.append(data)
+
+    def end(self, tag):
+        field = self.TEXT_TAGS.get(tag)
+        if field is not None:
+            text = "".join(self.text) or None
+            self.text = None
+            if field == "products":
+                self.fields["products"].append(text)
+            else:
+                self.fields.setdefault(field, text)
+        elif tag == self.TAG_ENTRY:
+            fields = self.fields
+            self.fields = None
+            year, number = _parse_cve_name(fields["id"])
+            cvss_score = fields.get("cvss_score")
+            if cvss_score is not None:
+                cvss_score = float(cvss_score)
+            modified = fields.get("modified")
+            if modified:
+                modified = _utc_timestamp(modified)
+            self.rows.append((modified, (
+                year, number, cvss_score,
+                fields.get("cvss_access_vector"),
+                fields.get("cvss_access_complexity"),
+                fields.get("cvss_authentication"),
+                fields.get("cvss_integrity_impact"),
+                fields.get("cwe"),
+                fields.get("summary"),
+                tuple(fields["products"]),
+                tuple(fields["references"]),
+                None, None, None, None,
+            )))
+
+    def close(self):
+        pass
+
+
+def _iter_json_file(json_file):
+    """
+    Parse an NVD JSON feed file as a stream, one entry at a time.
+    Gzipped files are decompressed on the fly.
+
+    The json module can't parse a file incrementally, so this looks for the
+    start of the array of entries and then decodes each entry on its own
+    from a buffer, reading more data when an entry is incomplete.
+
+    :param json_file: JSON feed filename. Gzipped if it ends with ".gz".
+    :type json_file: str
+
+    :returns: Generator of the last modified UTC timestamp and the row of
+        each entry. See _spool_entries() for the fields of the rows.
+    :rtype: iter(tuple(str, tuple))
+
+    :raises ValueError: The file is truncated, not valid JSON, or has no
+        array of entries.
+    """
+    if json_file.endswith(".gz"):
+        fd = gzip.open(json_file, "rb")
+    else:
+        fd = open(json_file, "rb")
+    with fd:
+        decoder = json.JSONDecoder()
+        buf     = ""
+
+        # Find the start of the array of entries.
+        while True:
+            match = _json_items_start.search(buf)
+            if match is not None:
+                pos = match.end()
+                break
+            data = fd.read(CHUNK_SIZE)
+            if not data:
+                raise ValueError("No CVE entries found in: %s" % json_file)
+            buf += data
+
+        while True:
+
+            # Skip the separators, and stop at the end of the array.
+            while True:
+                while pos < len(buf) and buf[pos] in " \t\r\n,":
+                    pos += 1
+                if pos < len(buf):
+                    break
+                data = fd.read(CHUNK_SIZE)
+                if not data:
+                    raise ValueError("Truncated JSON feed: %s" % json_file)
+                buf = data
+                pos = 0
+            if buf[pos] == "]":
+                return
+
+            # Decode the next entry, reading more data until it's complete.
+            # Malformed entries are reported right away.
+            while True:
+                try:
+                    item, pos = decoder.raw_decode(buf, pos)
+                    break
+                except ValueError:
+                    if not _json_cut_short(buf, pos):
+                        raise
+                    data = fd.read(CHUNK_SIZE)
+                    if not data:
+                        raise
+                    buf = buf[pos:] + data
+                    pos = 0
+            yield _json_cve_row(item)
+
+
+def _json_cut_short(buf, pos):
+    """
+    Tell if the JSON entry at the given position is cut short by the end of
+    the data, so it may be completed by reading more data, rather than being
+    malformed.
+
+    :param buf: Data that was being decoded.
+    :type buf: str
+
+    :param pos: Position of the entry in the data.
+    :type pos: int
+
+    :returns: True if the entry doesn't end within the data.
+    :rtype: bool
+    """
+    depth = 0
+    for match in _json_brackets.finditer(buf, pos):
+        token = match.group()
+        if token[0] == '"':
+            if match.group(1) is None:
+                return True
+        elif token in "[{":
+            depth += 1
+        else:
+            depth -= 1
+            if depth <= 0:
+                return False
+    return True
+
+
+def _json_cve_row(item):
+    """
+    Convert an entry of an NVD JSON feed into a row, like the XML parser.
+    Both the 1.1 feed format and the 2.0 API format are supported.
+
+    :param item: Decoded JSON entry.
+    :type item: dict
+
+    :returns: Last modified UTC timestamp, and the row.
+        See _spool_entries() for the fields of the rows.
+    :rtype: tuple(str, tuple)
+    """
+    cve = item["cve"]
+
+    # JSON 1.1 feed format.
+    if "CVE_data_meta" in cve:
+        cvename    = cve["CVE_data_meta"]["ID"]
+        modified   = item.get("lastModifiedDate")
+        summary    = _json_english(
+            cve.get("description", {}).get("description_data", ()))
+        cwes       = [
+            description["value"]
+            for problem in cve.get("problemtype", {})
+                              .get("problemtype_data", ())
+            for description in problem.get("description", ())
+        ]
+        references = [
+            reference["url"]
+            for reference in cve.get("references", {})
+                                .get("reference_data", ())
+        ]
+        nodes      = item.get("configurations", {}).get("nodes", ())
+        impact     = item.get("impact", {})
+        cvss2      = impact.get("baseMetricV2", {}).get("cvssV2")
+        cvss3      = impact.get("baseMetricV3", {}).get("cvssV3")
+        rejected   = False
+
+    # JSON 2.0 format, as returned by the NVD API.
+    else:
+        cvename    = cve["id"]
+        modified   = cve.get("lastModified")
+        summary    = _json_english(cve.get("descriptions", ()))
+        cwes       = [
+            description["value"]
+            for weakness in _json_primary_first(cve.get("weaknesses", ()))
+            for description in weakness.get("description", ())
+        ]
+        references = [
+            reference["url"]
+            for reference in cve.get("references", ())
+        ]
+        nodes      = [
+            node
+            for configuration in cve.get("configurations", ())
+            for node in configuration.get("nodes", ())
+        ]
+        metrics    = cve.get("metrics", {})
+        cvss2      = _json_cvss_data(metrics.get("cvssMetricV2"))
+        cvss3      = _json_cvss_data(metrics.get("cvssMetricV31") or
+                                     metrics.get("cvssMetricV30"))
+        rejected   = cve.get("vulnStatus") == "Rejected"
+
+    # The database loader recognizes rejected entries by their summary,
+    # like in the legacy feeds, so the JSON 2.0 status is turned into that.
+    if rejected and not (summary or "").startswith("** REJECT **"):
+        summary = "** REJECT ** " + (summary or "")
+
+    # Collect the vulnerable products, and the version ranges if any.
+    products = []
+    ranges   = []
+    for match in _json_cpe_matches(nodes):
+        cpe = match.get("cpe23Uri") or match.get("criteria")
+        if not cpe:
+            continue
+        if cpe not in products:
+            products.append(cpe)
+        bounds = (
+            match.get("versionStartIncluding"),
+            match.get("versionStartExcluding"),
+            match.get("versionEndIncluding"),
+            match.get("versionEndExcluding"),
+        )
+        if bounds != (None, None, None, None):
+            ranges.append((cpe,) + bounds)
+
+    if modified:
+        modified = _json_timestamp(modified)
+    year, number = _parse_cve_name(cvename)
+    if cvss2 is None:
+        cvss2 = {}
+    if cvss3 is None:
+        cvss3 = {}
+    return modified, (
+        year, number,
+        cvss2.get("baseScore"),
+        cvss2.get("accessVector"),
+        cvss2.get("accessComplexity"),
+        cvss2.get("authentication"),
+        cvss2.get("integrityImpact"),
+        cwes[0] if cwes else None,
+        summary,
+        tuple(products),
+        tuple(references),
+        cvss3.get("baseScore"),
+        cvss3.get("vectorString"),
+        cvss3.get("baseSeverity"),
+        tuple(ranges),
+    )
+
+
+def _json_english(descriptions):
+    "Get the English text from a list of JSON descriptions, if any."
+    for description in descriptions:
+        if description.get("lang") == "en":
+            return description.get("value")
+
+
+def _json_primary_first(items):
+    "Sort the JSON metrics or weaknesses so the NVD's own come first."
+    return sorted(items, key = lambda item: item.get("type") != "Primary")
+
+
+def _json_cvss_data(metrics):
+    "Get the CVSS data of the preferred JSON 2.0 metric, if any."
+    if metrics:
+        return _json_primary_first(metrics)[0].get("cvssData")
+
+
+def _json_cpe_matches(nodes):
+    """
+    Get the vulnerable CPE matches from the configuration nodes of an entry
+    of an NVD JSON feed. The nodes are nested in the 1.1 feeds.
+    """
+    queue = list(nodes)
+    for node in queue:
+        queue.extend(node.get("children", ()))
+        for match in node.get("cpe_match", node.get("cpeMatch", ())):
+            if match.get("vulnerable", True):
+                yield match
+
+
+# Timestamps in the NVD JSON feeds, with or without seconds and fractions.
+_json_timestamp_re = re.compile(
+    r"(\d{4}-\d\d-\d\dT\d\d:\d\d)(?::(\d\d)(?:\.(\d{1,3}))?)?")
+
+def _json_timestamp(timestamp):
+    """
+    Convert an NVD JSON timestamp, like "2019-01-01T05:29Z" in the 1.1 feeds
+    or "2023-11-07T03:40:29.867" in 2.0, to the format returned by
+    _utc_timestamp(). The JSON timestamps are always in UTC.
+
+    :param timestamp: NVD JSON timestamp.
+    :type timestamp: str
+
+    :returns: UTC timestamp, like "2019-01-01T05:29:00.000Z".
+    :rtype: str
+    """
+    match = _json_timestamp_re.match(timestamp)
+    if match is None:
+        raise ValueError("Invalid timestamp: %s" % timestamp)
+    minutes, seconds, millis = match.groups()
+    return "%s:%s.%sZ" % (
+        minutes, seconds or "00", (millis or "").ljust(3, "0"))
+
+
+class CVESummary(namedtuple("CVESummary",
+                            ("year", "number", "cvss_score", "cwe"))):
+    """
+    Lightweight summary of an entry in the CVE database, for bulk listings.
+    """
+
+    __slots__ = ()
+
+    @property
+    def name(self):
+        return "CVE-%04d-%04d" % (self.year, self.number)
+
+
+class CVSSStats(namedtuple("CVSSStats",
+        ("count", "minimum", "maximum", "mean", "histogram"))):
+    """
+    Statistics of the CVSS base scores of a group of CVEs.
+
+    The histogram has the number of scores in each of the ranges [0, 1),
+    [1, 2) and so on until [9, 10].
+    """
+
+    __slots__ = ()
+
+
+def load_columns(filename, use_numpy = None):
+    """
+    Load a columnar export of the CVE database, as written by
+    CVEDB.export_columns().
+
+    With NumPy the file is memory mapped and the columns are NumPy arrays
+    backed by it, so loading is almost instant no matter the file size.
+    Otherwise the columns are read into array.array objects.
+
+    :param filename: Columnar export filename.
+    :type filename: str
+
+    :param use_numpy: True to use NumPy, False to use the array module,
+        None to use NumPy only if it's installed.
+    :type use_numpy: bool | None
+
+    :returns: Columns indexed by name, and the labels of the string columns
+        indexed by name. The string columns have the index of each label.
+    :rtype: tuple(dict(str -> array), dict(str -> list(str)))
+
+    :raises ValueError: The file is not a columnar export.
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and numpy is None:
+        raise ImportError("NumPy is not installed")
+    with open(filename, "rb") as fd:
+        if fd.read(len(COLUMNS_MAGIC)) != COLUMNS_MAGIC:
+            raise ValueError("Not a columnar export file: %s" % filename)
+        size,  = struct.unpack("<I", fd.read(4))
+        header = json.loads(fd.read(size))
+        rows   = header["rows"]
+        labels = {
+            str(name): [_to_str(x) for x in values]
+            for name, values in header["labels"].iteritems()
+        }
+        columns = {}
+        if use_numpy:
+            if rows:
+                data = mmap(fd.fileno(), 0, access = ACCESS_READ)
+            for name, typecode, offset in header["columns"]:
+                dtype = numpy.dtype(typecode).newbyteorder("<")
+                if rows:
+                    columns[str(name)] = numpy.frombuffer(
+                        data, dtype, rows, offset)
+                else:
+                    columns[str(name)] = numpy.zeros(0, dtype)
+        else:
+            for name, typecode, offset in header["columns"]:
+                column = array(str(typecode))
+                fd.seek(offset)
+                column.fromstring(fd.read(rows * column.itemsize))
+                if sys.byteorder != "little":
+                    column.byteswap()
+                columns[str(name)] = column
+    return columns, labels
+
+
 class CVE(object):
     """
     Represents an entry in the CVE database.
+
+    The products, references and vendor statements can be loaded lazily:
+    if they're not given, the loader is called the first time any of them
+    is accessed, and must return a tuple with the three of them.
     """
 
+    __slots__ = (
+        "__year", "__number", "__cvss_score", "__cvss_access_vector",
+        "__cvss_access_complexity", "__cvss_authentication",
+        "__cvss_integrity_impact", "__cwe", "__summary", "__products",
+        "__references", "__vendor_statements", "__loader",
+        "__cvss3_score", "__cvss3_vector", "__cvss3_severity",
+    )
+
     def __init__(self,
                  year, number, cvss_score, cvss_access_vector,
                  cvss_access_complexity, cvss_authentication,
-                 cvss_integrity_impact, cwe, summary, products,
-                 references, vendor_statements):
+                 cvss_integrity_impact, cwe, summary, products = None,
+                 references = None, vendor_statements = None,
+                 loader = None, cvss3_score = None, cvss3_vector = None,
+                 cvss3_severity = None):
+        if loader is None and (products is None or references is None or
+                               vendor_statements is None):
+            raise TypeError("Missing loader for the child collections")
         self.__year                   = year
         self.__number                 = number
         self.__cvss_score             = cvss_score
@@ -74,6 +1039,39 @@ class CVE(object):
         self.__products               = products
         self.__references             = references
         self.__vendor_statements      = vendor_statements
+        self.__loader                 = loader
+        self.__cvss3_score            = cvss3_score
+        self.__cvss3_vector           = cvss3_vector
+        self.__cvss3_severity         = cvss3_severity
+
+    def __load(self):
+        (self.__products,
+         self.__references,
+         self.__vendor_statements) = self.__loader()
+        self.__loader = None
+
+    # Pickle the children too, but not the loader, since it's bound to the
+    # database it came from.
+    def __getstate__(self):
+        if self.__loader is not None:
+            self.__load()
+        return (
+            self.__year, self.__number, self.__cvss_score,
+            self.__cvss_access_vector, self.__cvss_access_complexity,
+            self.__cvss_authentication, self.__cvss_integrity_impact,
+            self.__cwe, self.__summary, self.__products, self.__references,
+            self.__vendor_statements, self.__cvss3_score,
+            self.__cvss3_vector, self.__cvss3_severity,
+        )
+
+    def __setstate__(self, state):
+        (self.__year, self.__number, self.__cvss_score,
+         self.__cvss_access_vector, self.__cvss_access_complexity,
+         self.__cvss_authentication, self.__cvss_integrity_impact,
+         self.__cwe, self.__summary, self.__products, self.__references,
+         self.__vendor_statements, self.__cvss3_score,
+         self.__cvss3_vector, self.__cvss3_severity) = state
+        self.__loader = None
 
     @property
     def name(self):
@@ -107,6 +1105,18 @@ class CVE(object):
     def cvss_integrity_impact(self):
         return self.__cvss_integrity_impact
 
+    @property
+    def cvss3_score(self):
+        return self.__cvss3_score
+
+    @property
+    def cvss3_vector(self):
+        return self.__cvss3_vector
+
+    @property
+    def cvss3_severity(self):
+        return self.__cvss3_severity
+
     @property
     def cwe(self):
         return self.__cwe
@@ -117,14 +1127,20 @@ class CVE(object):
 
     @property
     def products(self):
+        if self.__loader is not None:
+            self.__load()
         return self.__products
 
     @property
     def references(self):
+        if self.__loader is not None:
+            self.__load()
         return self.__references
 
     @property
     def vendor_statements(self):
+        if self.__loader is not None:
+            self.__load()
         return self.__vendor_statements
 
     def __str__(self):
@@ -147,6 +1163,12 @@ class CVE(object):
         if self.cvss_integrity_impact:
             r.append("CVSS Integrity Impact:")
             r.append("  %s" % self.cvss_integrity_impact)
+        if self.cvss3_score:
+            r.append("CVSS v3 Base Score:")
+            r.append("  %s (%s)" % (self.cvss3_score, self.cvss3_severity))
+        if self.cvss3_vector:
+            r.append("CVSS v3 Vector:")
+            r.append("  %s" % self.cvss3_vector)
         if self.cwe:
             r.append("CWE ID:")
             r.append("  %s" % self.cwe)
@@ -201,12 +1223,17 @@ class CVEDB(object):
     """
     CVE database.
 
-    Generated from the XML files mantained by NIST:
-    https://nvd.nist.gov/download.cfm#CVE_FEED
+    Generated from the feeds mantained by NIST, either the JSON 1.1/2.0
+    feeds with update_from_json(), or the legacy XML feeds with update():
+    https://nvd.nist.gov/vuln/data-feeds
+
+    The same object can be shared by many threads. Each thread reads through
+    its own connection to the database, and keeps working while another
+    thread is running an update.
     """
 
-    # XXX TODO no longer working, need to switch to JSON feed
-    # https://gist.github.com/christiangalsterer/5f55389b9c50c74c31b9
+    # NIST no longer publishes the XML feeds, so update() needs a mirror
+    # of them in CVE_URL_BASE. Use update_from_json() for current data.
 
     # Set to False to suppress prints
     DEBUG = True
@@ -215,19 +1242,44 @@ class CVEDB(object):
     DEFAULT_DB_FILE = "nvdcve-2.0.db"
 
     # CVE data URL base and XML files. Order is important!
+    # The delta files only have the most recent changes, and they're the
+    # only ones loaded by incremental updates.
     CVE_URL_BASE = "http://static.nvd.nist.gov/feeds/xml/cve/"
-    CVE_XML_FILES = [
+    DELTA_XML_FILES = (
+        "nvdcve-2.0-modified.xml",
+        "nvdcve-2.0-recent.xml",
+    )
+    CVE_XML_FILES = tuple(
         "nvdcve-2.0-%s.xml" % year
         for year in xrange(2002, date.today().year + 1)
-    ]
-    CVE_XML_FILES.append("nvdcve-2.0-modified.xml")
-    CVE_XML_FILES.append("nvdcve-2.0-recent.xml")
-    CVE_XML_FILES = tuple(CVE_XML_FILES)
+    ) + DELTA_XML_FILES
+
+    # Maximum age in days of the last update for incremental updates to
+    # work. NIST keeps the changes of the last eight days in the delta files.
+    INCREMENTAL_MAX_AGE = 7
 
     # Vendor statements URL base and XML file.
     VENDOR_URL_BASE = "https://nvd.nist.gov/download/"
     VENDOR_XML_FILE = "vendorstatements.xml"
 
+    # Number of concurrent downloads while updating the database.
+    DOWNLOAD_THREADS = 4
+
+    # Number of XML parser processes. Use None for one per CPU.
+    PARSER_PROCESSES = None
+
+    # PRAGMAs used while updating the database. They trade durability for
+    # speed, which is fine since the database can always be rebuilt.
+    # The journal mode can't be changed here, since other threads may be
+    # reading from the database at the same time.
+    BULK_PRAGMAS = (
+        ("synchronous",  "OFF"),
+        ("cache_size",   -65536),   # 64 Mb
+    )
+
+    # Seconds to wait for a lock on the database before giving up.
+    TIMEOUT = 60
+
     # Database schema creation script.
     SCHEMA = \
     """
@@ -238,10 +1290,20 @@ class CVEDB(object):
     -- File timestamps --
     ---------------------
 
+    -- The last load time is when the file was last loaded, or found not
+    -- modified since then. Incremental updates depend on it.
     CREATE TABLE IF NOT EXISTS `files` (
         `filename` STRING NOT NULL UNIQUE ON CONFLICT REPLACE,
         `last_modified` INTEGER NOT NULL,
-        `last_modified_string` STRING NOT NULL
+        `last_modified_string` STRING NOT NULL,
+        `last_loaded` INTEGER
+    );
+
+    -- Last modified time in UTC of the newest entry loaded from each file.
+    -- Incremental updates skip the entries older than this.
+    CREATE TABLE IF NOT EXISTS `watermarks` (
+        `filename` STRING NOT NULL UNIQUE ON CONFLICT REPLACE,
+        `last_modified` STRING NOT NULL
     );
 
     ---------
@@ -252,13 +1314,16 @@ class CVEDB(object):
         `rowid` INTEGER PRIMARY KEY,
         `year` INTEGER NOT NULL,
         `number` INTEGER NOT NULL,
-        `cvss_score` STRING,
+        `cvss_score` REAL,
         `cvss_access_vector` STRING,
         `cvss_access_complexity` STRING,
         `cvss_authentication` STRING,
         `cvss_integrity_impact` STRING,
         `cwe` STRING,
         `summary` STRING,
+        `cvss3_score` REAL,
+        `cvss3_vector` STRING,
+        `cvss3_severity` STRING,
         UNIQUE (`year`, `number`)
     );
     CREATE INDEX IF NOT EXISTS `cve_year` ON `cve`(`year`);
@@ -277,6 +1342,43 @@ class CVEDB(object):
         FOREIGN KEY(`id_cpe`) REFERENCES `cve_cpe_names`(`rowid`) ON DELETE CASCADE,
         UNIQUE (`id_cve`, `id_cpe`) ON CONFLICT IGNORE
     );
+    CREATE INDEX IF NOT EXISTS `cve_cpe_id_cpe` ON `cve_cpe`(`id_cpe`);
+
+    -- Components of the CPE names, to match them against installed products.
+    -- The columns are TEXT rather than STRING so versions like "1.10" aren't
+    -- converted to numbers.
+    CREATE TABLE IF NOT EXISTS `cve_cpe_parts` (
+        `id_cpe` INTEGER PRIMARY KEY,
+        `part` TEXT NOT NULL,
+        `vendor` TEXT NOT NULL,
+        `product` TEXT NOT NULL,
+        `version` TEXT NOT NULL,
+        `update` TEXT NOT NULL,
+        `edition` TEXT NOT NULL,
+        `language` TEXT NOT NULL,
+        `sw_edition` TEXT NOT NULL,
+        `target_sw` TEXT NOT NULL,
+        `target_hw` TEXT NOT NULL,
+        `other` TEXT NOT NULL,
+        FOREIGN KEY(`id_cpe`) REFERENCES `cve_cpe_names`(`rowid`) ON DELETE CASCADE
+    );
+    CREATE INDEX IF NOT EXISTS `cve_cpe_parts_product`
+        ON `cve_cpe_parts`(`vendor`, `product`);
+
+    -- Ranges of vulnerable versions of a product, when the feeds have them.
+    -- A CVE may list more than one range for the same CPE name.
+    CREATE TABLE IF NOT EXISTS `cve_cpe_ranges` (
+        `id_cve` INTEGER NOT NULL,
+        `id_cpe` INTEGER NOT NULL,
+        `version_start_including` TEXT,
+        `version_start_excluding` TEXT,
+        `version_end_including` TEXT,
+        `version_end_excluding` TEXT,
+        FOREIGN KEY(`id_cve`) REFERENCES `cve`(`rowid`) ON DELETE CASCADE,
+        FOREIGN KEY(`id_cpe`) REFERENCES `cve_cpe_names`(`rowid`) ON DELETE CASCADE
+    );
+    CREATE INDEX IF NOT EXISTS `cve_cpe_ranges_cve_cpe`
+        ON `cve_cpe_ranges`(`id_cve`, `id_cpe`);
 
     CREATE TABLE IF NOT EXISTS `cve_ref_urls` (
         `rowid` INTEGER PRIMARY KEY,
@@ -301,41 +1403,212 @@ class CVEDB(object):
     );
     """
 
+    # Columns added to the cve table after the first release of the schema.
+    # Older databases are migrated by adding them at the end of the table.
+    CVE_NEW_COLUMNS = (
+        ("cvss3_score",    "REAL"),
+        ("cvss3_vector",   "STRING"),
+        ("cvss3_severity", "STRING"),
+    )
+    FILES_NEW_COLUMNS = (
+        ("last_loaded",    "INTEGER"),
+    )
+
+    # Columns of the cve table, in the order expected by the CVE class.
+    CVE_COLUMNS = (
+        "year", "number", "cvss_score", "cvss_access_vector",
+        "cvss_access_complexity", "cvss_authentication",
+        "cvss_integrity_impact", "cwe", "summary",
+        "cvss3_score", "cvss3_vector", "cvss3_severity",
+    )
+
+    # Full text search index creation script.
+    # The index is kept in sync with the other tables by the triggers.
+    FTS_SCHEMA = \
+    """
+    CREATE VIRTUAL TABLE `cve_fts` USING %s(`summary`, `statements`);
+
+    CREATE TRIGGER `cve_fts_insert` AFTER INSERT ON `cve`
+    BEGIN
+        INSERT INTO `cve_fts` (`rowid`, `summary`, `statements`)
+            VALUES (NEW.`rowid`, NEW.`summary`, '');
+    END;
+
+    CREATE TRIGGER `cve_fts_update` AFTER UPDATE OF `summary` ON `cve`
+    WHEN NEW.`summary` IS NOT OLD.`summary`
+    BEGIN
+        UPDATE `cve_fts` SET `summary` = NEW.`summary`
+            WHERE `rowid` = NEW.`rowid`;
+    END;
+
+    CREATE TRIGGER `cve_fts_delete` AFTER DELETE ON `cve`
+    BEGIN
+        DELETE FROM `cve_fts` WHERE `rowid` = OLD.`rowid`;
+    END;
+
+    CREATE TRIGGER `cve_fts_statements_insert`
+    AFTER INSERT ON `cve_vendor_statements`
+    BEGIN
+        UPDATE `cve_fts` SET `statements` = (
+            SELECT group_concat(`statement`, ' ')
+              FROM `cve_vendor_statements`
+             WHERE `id_cve` = NEW.`id_cve`
+        ) WHERE `rowid` = NEW.`id_cve`;
+    END;
+
+    CREATE TRIGGER `cve_fts_statements_delete`
+    AFTER DELETE ON `cve_vendor_statements`
+    BEGIN
+        UPDATE `cve_fts` SET `statements` = (
+            SELECT group_concat(`statement`, ' ')
+              FROM `cve_vendor_statements`
+             WHERE `id_cve` = OLD.`id_cve`
+        ) WHERE `rowid` = OLD.`id_cve`;
+    END;
+
+    INSERT INTO `cve_fts` (`rowid`, `summary`, `statements`)
+        SELECT `rowid`, `summary`, (
+            SELECT group_concat(`statement`, ' ')
+              FROM `cve_vendor_statements`
+             WHERE `id_cve` = `cve`.`rowid`
+        ) FROM `cve`;
+    """
+
+    # Full text search engines to try, from best to worst.
+    FTS_MODULES = ("fts5", "fts4")
 
-    def __init__(self, db_file = None):
+
+    def __init__(self, db_file = None, cache_size = 0, json_files = None,
+                 snapshot = False):
+        """
+        :param db_file: Database filename. Use None for the default.
+        :type db_file: str
+
+        :param cache_size: Maximum number of CVE objects and query results
+            to keep cached in memory. Use 0 to disable the cache.
+        :type cache_size: int
+
+        :param json_files: Local NVD JSON feed files to populate a new
+            database from, instead of downloading the XML feeds.
+            See update_from_json().
+        :type json_files: list(str)
+
+        :param snapshot: True to open a read-only snapshot made with
+            export_snapshot(). Snapshots are opened as immutable and memory
+            mapped, so opening them is instant, but they can't be updated.
+        :type snapshot: bool
+        """
 
         # If no filename is given, use the default.
         if not db_file:
             db_file = self.DEFAULT_DB_FILE
+        self.__db_file  = db_file
+        self.__snapshot = snapshot
+
+        # Cache of CVE objects and query results.
+        # It's invalidated every time the database is updated.
+        self.__cache = _LRUCache(cache_size)
 
-        # Create the lock to make this class thread safe.
-        self.__lock = RLock()
+        # Each thread gets its own connection to the database, so readers
+        # don't block each other. The connections are kept here so close()
+        # can close them all, and each one is closed when its thread dies.
+        self.__local       = local()
+        self.__lock        = RLock()
+        self.__connections = {}
 
-        # The busy flag prevents reentrance.
-        self.__busy = False
+        # Updates are serialized with their own lock, so threads can keep
+        # opening connections and reading while an update runs.
+        self.__update_lock = Lock()
+
+        # Rowids cached in memory by the bulk loader during updates.
+        self.__id_maps = None
+
+        # Full text search engine, detected on first use.
+        self.__fts = None
+
+        # Snapshots are used as they are. Open it right away anyway, so a
+        # missing or broken snapshot is reported here.
+        if snapshot:
+            try:
+                self.__db
+            except:
+                self.close()
+                raise
+            return
 
         # Determine if the database existed.
         is_new = not exists(db_file)
 
         # Open the database file.
-        self.__db = sqlite3.connect(db_file)
+        # Switch to WAL journaling, so readers can work while we update.
+        self.__db.execute("PRAGMA journal_mode = WAL;")
 
         # Populate the database on the first run.
+        # Otherwise bring the schema up to date with this version.
         # On error delete the database and raise an exception.
         try:
-            if is_new:
+            if is_new and json_files is not None:
+                self.update_from_json(json_files)
+            elif is_new:
                 self.update()
+            else:
+                self.__create_schema()
         except:
             self.close()
             raise
 
-    def close(self):
+    # Connection to the database for the current thread.
+    # The connection is created the first time each thread uses it.
+    @property
+    def __db(self):
         try:
-            self.__db.close()
-        finally:
-            self.__db     = None
-            self.__cursor = None
-            self.__lock   = None
+            return self.__local.connection.db
+        except AttributeError:
+            pass
+        if self.__lock is None:
+            raise RuntimeError("The database is closed")
+        if self.__snapshot:
+            db = open_snapshot(self.__db_file)
+        else:
+            db = sqlite3.connect(
+                self.__db_file,
+                timeout = self.TIMEOUT,
+                isolation_level = None,     # we handle transactions ourselves
+                check_same_thread = False,  # so close() can close it
+            )
+        try:
+            if not self.__snapshot:
+                db.execute("PRAGMA foreign_keys = ON;")
+                db.execute("PRAGMA synchronous = NORMAL;")
+            db.create_function("cve_fts4_rank", 1, _fts4_rank)
+        except:
+            db.close()
+            raise
+        # Close the connection when the thread dies and its holder goes away.
+        holder = _Connection(db)
+        with self.__lock:
+            holder_ref = ref(holder, partial(
+                _close_connection, self.__connections, self.__lock))
+            self.__connections[holder_ref] = db
+        self.__local.connection = holder
+        return db
+
+    # Cursor of the current thread's open transaction.
+    @property
+    def __cursor(self):
+        return self.__local.cursor
+
+    def close(self):
+        lock = self.__lock
+        if lock is None:
+            return
+        with lock:
+            connections = self.__connections.values()
+            self.__connections.clear()
+            self.__local = local()
+            self.__lock  = None
+        for db in connections:
+            db.close()
 
     def __enter__(self):
         return self
@@ -346,227 +1619,609 @@ class CVEDB(object):
         except Exception:
             pass
 
+    # Each transaction sees a consistent snapshot of the database, even if
+    # another thread commits an update while the transaction is running.
     def _transaction(self, fn, args, kwargs):
-        with self.__lock:
-            if self.__busy:
-                raise RuntimeError("The database is busy")
+        if getattr(self.__local, "busy", False):
+            raise RuntimeError("The database is busy")
+        db = self.__db
+        try:
+            self.__local.busy   = True
+            self.__local.cursor = db.cursor()
+            self.__local.cursor.execute("BEGIN;")
             try:
-                self.__busy   = True
-                self.__cursor = self.__db.cursor()
-                try:
-                    retval = fn(self, *args, **kwargs)
-                    self.__db.commit()
-                    return retval
-                except:
-                    self.__db.rollback()
-                    raise
-            finally:
-                self.__cursor = None
-                self.__busy   = False
+                retval = fn(self, *args, **kwargs)
+                db.commit()
+                return retval
+            except:
+                db.rollback()
+                raise
+        finally:
+            self.__local.cursor = None
+            self.__local.busy   = False
 
 
-    def update(self):
+    def update(self, incremental = None):
         """
         Update the database.
 
         This automatically downloads up-to-date XML files from NIST when needed
-        and recreates the database from them.
+        and recreates the database from them. NIST has retired the XML feeds,
+        so this requires a mirror of them in CVE_URL_BASE; otherwise use
+        update_from_json() with the JSON feeds.
+
+        The update is pipelined: the feeds are downloaded concurrently, each
+        one is parsed in a separate process as soon as it arrives, and the
+        parsed rows are written to the database from this thread only.
+
+        Incremental updates only load the delta files, and only the entries
+        that changed since the last time each file was loaded. This requires
+        all the other files to have been loaded before, and the last update
+        to be no older than INCREMENTAL_MAX_AGE days.
+
+        :param incremental: True for an incremental update, False for a full
+            update, or None to do an incremental update only when possible.
+        :type incremental: bool | None
         """
 
+        # Only one thread at a time can update the database.
+        # Other threads can keep reading from it in the meantime.
+        # Even if the update fails some changes may have been committed,
+        # so the cache is always invalidated.
+        if self.__snapshot:
+            raise RuntimeError("Snapshots can't be updated")
+        with self.__update_lock:
+            try:
+                self.__update(incremental)
+            finally:
+                self.__cache.invalidate()
+
+    def __update(self, incremental):
+
         # Create the database schema.
         self.__create_schema()
 
-        # Load the CVE data for each year from 2002 until today.
-        # The order of this list is important! At the end of it
-        # are the files with the most recent updates.
-        for xml_file in self.CVE_XML_FILES:
-            self.__load_cve_file(xml_file)
+        # Get the timestamps of the files we have already loaded,
+        # and the newest entry we loaded from each one of them.
+        file_times = self.__get_file_times()
+        watermarks = self.__get_watermarks()
+
+        # Decide which files to load.
+        if incremental is None:
+            incremental = self.__can_update_incrementally(file_times)
+        if incremental:
+            xml_files = [
+                xml_file
+                for xml_file in self.CVE_XML_FILES
+                if xml_file in self.DELTA_XML_FILES
+            ]
+        else:
+            xml_files  = self.CVE_XML_FILES
+            watermarks = {}
+        if self.DEBUG:
+            print "Update mode: %s" % ("incremental" if incremental else "full")
 
-        # Load the vendor statements.
-        self.__load_vendor_statements()
+        # Tune the database for bulk loading while we update it.
+        old_pragmas = self.__set_pragmas(self.BULK_PRAGMAS)
+        try:
+            self.__load_feeds(xml_files, file_times, watermarks)
+        finally:
+            self.__id_maps = None
+            self.__set_pragmas(old_pragmas)
 
-    @transactional
-    def __create_schema(self):
-        self.__cursor.executescript(self.SCHEMA)
+    def update_from_json(self, json_files, incremental = True):
+        """
+        Update the database from local NVD JSON feed files, in either the
+        1.1 feed format or the 2.0 API format. The files may be gzipped.
+        Nothing is downloaded, and the files are not deleted afterwards.
 
-    @transactional
-    def __load_cve_file(self, xml_file):
+        The files are parsed in separate processes as a stream, and loaded
+        in the given order, so the files with the most recent changes
+        should go last. Files that haven't been modified since they were
+        last loaded are skipped.
 
-        # Download and open the XML file.
-        xml_parser = self.__download(self.CVE_URL_BASE, xml_file)
+        JSON feeds have the CVSS v3 scores and the ranges of vulnerable
+        versions used by match(), which the XML feeds don't have.
 
-        # Do we need to load new data?
-        if xml_parser:
-            if self.DEBUG:
-                print "Loading file: %s" % xml_file
-
-            # Parse the XML file and store the data into the database.
-            context  = iter(xml_parser)
-            _, root  = context.next()
-            for event, item in context:
-                if event == "end" and item.tag.endswith("}entry"):
-                    self.__load_cve_entry(item)
-                    root.clear()
-
-            # Delete the XML file.
-            unlink(xml_file)
-            if self.DEBUG:
-                print "Deleted file: %s" % xml_file
+        :param json_files: JSON feed filenames.
+        :type json_files: list(str)
 
-    # This method assumes it's being called from within an open transaction.
-    def __load_cve_entry(self, item):
-        ns_v = "{http://scap.nist.gov/schema/vulnerability/0.4}"
-        ns_c = "{http://scap.nist.gov/schema/cvss-v2/0.2}"
-        ns_s = "{http://scap.nist.gov/schema/feed/vulnerability/2.0}"
-        cvename = item.attrib["id"]
-        assert cvename.startswith("CVE-"), cvename
-        assert len(cvename) in (13, 14), cvename
-        year = int(cvename[4:8])
-        number = int(cvename[9:])
-        has_cwe = item.find(".//%scwe" % ns_v)
-        if has_cwe is not None:
-            cwe = has_cwe.attrib["id"]
+        :param incremental: True to only load the entries that changed since
+            the last time each file was loaded, False to load them all.
+        :type incremental: bool
+        """
+        if self.__snapshot:
+            raise RuntimeError("Snapshots can't be updated")
+        with self.__update_lock:
+            try:
+                self.__update_from_json(json_files, incremental)
+            finally:
+                self.__cache.invalidate()
+
+    def __update_from_json(self, json_files, incremental):
+        self.__create_schema()
+        file_times = self.__get_file_times()
+        if incremental:
+            watermarks = self.__get_watermarks()
         else:
-            cwe = None
-        soft = item.find(".//%svulnerable-software-list" % ns_v)
-        if soft is not None:
-            products = [
-                child.text
-                for child in soft.iter("%sproduct" % ns_v)
+            watermarks = {}
+        old_pragmas = self.__set_pragmas(self.BULK_PRAGMAS)
+        try:
+            self.__load_json_feeds(json_files, file_times, watermarks)
+        finally:
+            self.__id_maps = None
+            self.__set_pragmas(old_pragmas)
+
+    def __load_json_feeds(self, json_files, file_times, watermarks):
+
+        # Queue the files for parsing, skipping the ones not modified since
+        # they were last loaded. The files are tracked by name only, so the
+        # same feeds can be loaded from different directories.
+        parsers = Pool(self.PARSER_PROCESSES)
+        try:
+            pending = []
+            for json_file in json_files:
+                filename = basename(json_file)
+                last_modified = int(getmtime(json_file))
+                if file_times.get(filename, (None, None))[0] == last_modified:
+                    if self.DEBUG:
+                        print "Already loaded file: %s" % json_file
+                    continue
+                new_times = (last_modified, asctime(gmtime(last_modified)))
+                pending.append((filename, new_times, parsers.apply_async(
+                    _parse_json_file, (json_file, watermarks.get(filename))
+                )))
+
+            # Write the parsed data into the database, in order.
+            for filename, new_times, parsing in pending:
+                spool_file, watermark = parsing.get()
+                try:
+                    self.__load_cve_file(
+                        filename, new_times,
+                        _read_batches(spool_file), watermark)
+                finally:
+                    unlink(spool_file)
+
+            # Wait for the workers to finish.
+            parsers.close()
+
+        # On error kill all the workers.
+        except:
+            parsers.terminate()
+            raise
+
+        finally:
+            parsers.join()
+
+    def export_snapshot(self, snapshot_file, compress = None):
+        """
+        Export a read-only snapshot of the database, to build it once and
+        distribute it to many hosts. Open it with snapshot = True.
+
+        The snapshot is a compacted copy of the database, with the full text
+        search index optimized and the query planner statistics gathered.
+        A manifest in JSON with its size, SHA-256 hash, number of CVEs and
+        watermarks is written next to it, with the ".manifest" extension.
+        See the snapshot module to verify, decompress and make binary deltas
+        of snapshots.
+
+        :param snapshot_file: Snapshot filename. It's replaced atomically.
+        :type snapshot_file: str
+
+        :param compress: Also write a compressed copy of the snapshot, in
+            one of the formats in snapshot.COMPRESSORS ("gzip" or "bz2").
+        :type compress: str | None
+
+        :returns: Manifest.
+        :rtype: dict
+        """
+        tmp_file = snapshot_file + ".tmp"
+        if exists(tmp_file):
+            unlink(tmp_file)
+        try:
+
+            # Copy the database, compacted, as of the last commit.
+            # This can't be done from within a transaction.
+            self.__db.execute("VACUUM INTO ?;", (tmp_file,))
+
+            # Tune the copy for reading only, and compact it again.
+            db = sqlite3.connect(tmp_file, isolation_level = None)
+            try:
+                db.execute("PRAGMA journal_mode = DELETE;")
+                if db.execute(
+                    "SELECT 1 FROM `sqlite_master`"
+                    " WHERE `type` = 'table' AND `name` = 'cve_fts';"
+                ).fetchone():
+                    db.execute(
+                        "INSERT INTO `cve_fts` (`cve_fts`) VALUES ('optimize');")
+                db.execute("ANALYZE;")
+                db.execute("VACUUM;")
+                count = db.execute("SELECT COUNT(*) FROM `cve`;").fetchone()[0]
+                watermarks = dict(db.execute(
+                    "SELECT `filename`, `last_modified` FROM `watermarks`;"))
+            finally:
+                db.close()
+            replace_file(tmp_file, snapshot_file)
+        except:
+            if exists(tmp_file):
+                unlink(tmp_file)
+            raise
+
+        return write_manifest(
+            snapshot_file, compress,
+            created    = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            cves       = count,
+            watermarks = watermarks,
+        )
+
+    # Incremental updates are possible if all the files were loaded before,
+    # and the delta files were loaded recently enough.
+    def __can_update_incrementally(self, file_times):
+        max_age = self.INCREMENTAL_MAX_AGE * 24 * 60 * 60
+        for xml_file in self.CVE_XML_FILES:
+            if xml_file not in file_times:
+                return False
+            if xml_file in self.DELTA_XML_FILES:
+                last_modified, _, last_loaded = file_times[xml_file]
+                if time() - (last_loaded or last_modified) > max_age:
+                    return False
+        return True
+
+    def __load_feeds(self, xml_files, file_times, watermarks):
+
+        # Start the downloader threads and the parser processes.
+        downloaders = ThreadPool(self.DOWNLOAD_THREADS)
+        parsers     = Pool(self.PARSER_PROCESSES)
+        try:
+
+            # Queue the downloads for the CVE data for each year from 2002
+            # until today. Each file is handed over to the parsers as soon
+            # as its download is complete.
+            pending = [
+                (xml_file, downloaders.apply_async(
+                    self.__fetch_and_parse,
+                    (parsers, xml_file,
+                     file_times.get(xml_file, (None, None, None)),
+                     watermarks.get(xml_file))
+                ))
+                for xml_file in xml_files
             ]
-        else:
-            products = []
-        cvss = item.find(".//%sbase_metrics" % ns_c)
-        if cvss is not None:
-            cvss_score = item.find(".//%sscore" % ns_c).text
-            cvss_access_vector = item.find(".//%saccess-vector" % ns_c).text
-            cvss_access_complexity = item.find(".//%saccess-complexity" % ns_c).text
-            cvss_authentication = item.find(".//%sauthentication" % ns_c).text
-            cvss_integrity_impact = item.find(".//%sintegrity-impact" % ns_c).text
-        else:
-            cvss_score             = None
-            cvss_access_vector     = None
-            cvss_access_complexity = None
-            cvss_authentication    = None
-            cvss_integrity_impact  = None
-        references = []
-        for refs in item.iter("%sreferences" % ns_v):
-            references.extend(
-                child.attrib["href"]
-                for child in refs.iter("%sreference" % ns_v)
+
+            # Queue the download for the vendor statements too.
+            vendor_file = self.VENDOR_XML_FILE
+            vendor_download = downloaders.apply_async(
+                self.__fetch,
+                (self.VENDOR_URL_BASE, vendor_file,
+                 file_times.get(vendor_file, (None, None, None)))
             )
-        has_summary = item.find(".//%ssummary" % ns_v)
-        if has_summary is not None:
-            summary = has_summary.text
-        else:
-            summary = None
+
+            # Write the parsed CVE data into the database.
+            # The order of this list is important! At the end of it
+            # are the files with the most recent updates.
+            for xml_file, download in pending:
+                job = download.get()
+                if job:
+                    new_times, parsing = job
+                    spool_file, watermark = parsing.get()
+                    try:
+                        self.__load_cve_file(
+                            xml_file, new_times,
+                            _read_batches(spool_file), watermark)
+                    finally:
+                        unlink(spool_file)
+
+                    # Delete the XML file.
+                    unlink(xml_file)
+                    if self.DEBUG:
+                        print "Deleted file: %s" % xml_file
+
+                # The file wasn't modified, so we're up to date with it.
+                else:
+                    self.__set_file_loaded(xml_file)
+
+            # Load the vendor statements.
+            new_times = vendor_download.get()
+            if new_times:
+                self.__load_vendor_statements(vendor_file, new_times)
+            else:
+                self.__set_file_loaded(vendor_file)
+
+            # Wait for the workers to finish.
+            downloaders.close()
+            parsers.close()
+
+        # On error kill all the workers.
+        except:
+            downloaders.terminate()
+            parsers.terminate()
+            raise
+
+        finally:
+            downloaders.join()
+            parsers.join()
+
+    # Set the given PRAGMAs on this thread's connection and return their old
+    # values. Some PRAGMAs can't be changed inside a transaction, so this is
+    # done outside of them.
+    def __set_pragmas(self, pragmas):
+        old_pragmas = []
+        for name, value in pragmas:
+            old_value = self.__db.execute("PRAGMA %s;" % name).fetchone()[0]
+            old_pragmas.append((name, old_value))
+            self.__db.execute("PRAGMA %s = %s;" % (name, value))
+        return old_pragmas
+
+    @transactional
+    def __create_schema(self):
+        for statement in _sql_statements(self.SCHEMA):
+            self.__cursor.execute(statement)
+
+        # Add the columns missing in databases created by older versions.
+        for table, new_columns in (("cve",   self.CVE_NEW_COLUMNS),
+                                   ("files", self.FILES_NEW_COLUMNS)):
+            self.__cursor.execute("PRAGMA table_info(`%s`);" % table)
+            columns = set(row[1] for row in self.__cursor.fetchall())
+            for name, decltype in new_columns:
+                if name not in columns:
+                    self.__cursor.execute(
+                        "ALTER TABLE `%s` ADD COLUMN `%s` %s;"
+                        % (table, name, decltype))
+
+        # Parse the CPE names loaded by older versions of this module.
         self.__cursor.execute(
-            "SELECT `rowid` FROM `cve`"
-            " WHERE `year` = ? AND `number` = ? LIMIT 1;",
-            (year, number)
+            "SELECT `rowid`, `cpe_name` FROM `cve_cpe_names`"
+            " WHERE `rowid` NOT IN (SELECT `id_cpe` FROM `cve_cpe_parts`);"
         )
-        has_cve_id = self.__cursor.fetchone()
-        if has_cve_id:
-            cve_id = has_cve_id[0]
-            if summary is not None and \
-               summary.startswith("** REJECT **"):
-                if self.DEBUG:
-                    print "Deleting %s..." % cvename
-                self.__cursor.execute(
-                    "DELETE FROM `cve` WHERE `rowid` = ?;",
-                    (cve_id,)
-                )
-                return
-            ##if self.DEBUG:
-            ##    print "Updating %s..." % cvename
-            self.__cursor.execute(
-                "UPDATE `cve` SET"
-                " `cvss_score` = ?,"
-                " `cvss_access_vector` = ?,"
-                " `cvss_access_complexity` = ?,"
-                " `cvss_authentication` = ?,"
-                " `cvss_integrity_impact` = ?,"
-                " `cwe` = ?,"
-                " `summary` = ?"
-                " WHERE `rowid` = ?;",
-                (cvss_score, cvss_access_vector,
-                 cvss_access_complexity, cvss_authentication,
-                 cvss_integrity_impact, cwe, summary, cve_id)
-            )
-        else:
-            if summary is not None and \
-               summary.startswith("** REJECT **"):
-                return
-            ##if self.DEBUG:
-            ##    print "Adding %s..." % cvename
-            self.__cursor.execute(
-                "INSERT INTO `cve` VALUES (NULL, "
-                "?, ?, ?, ?, ?, ?, ?, ?, ?);",
-                (year, number, cvss_score, cvss_access_vector,
-                 cvss_access_complexity, cvss_authentication,
-                 cvss_integrity_impact, cwe, summary)
-            )
-            cve_id = self.__cursor.lastrowid
-        for ref in references:
+        self.__cursor.executemany(
+            "INSERT INTO `cve_cpe_parts`"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);",
+            _cpe_parts_rows(self.__cursor.fetchall())
+        )
+
+        # Create the full text search index if missing, using the best
+        # engine available. Older SQLite versions may not have any.
+        # The index, its triggers and the existing CVEs are all added
+        # within this transaction, so it's never left half populated.
+        if not self.__get_fts():
+            for module in self.FTS_MODULES:
+                statements = list(_sql_statements(self.FTS_SCHEMA % module))
+                try:
+                    self.__cursor.execute(statements[0])
+                except sqlite3.OperationalError:
+                    continue
+                for statement in statements[1:]:
+                    self.__cursor.execute(statement)
+                self.__fts = module
+                break
+
+    # Returns the full text search engine used by the database, if any.
+    # This method assumes it's being called from within an open transaction.
+    def __get_fts(self):
+        if not self.__fts:
             self.__cursor.execute(
-                "SELECT `rowid` FROM `cve_ref_urls`"
-                " WHERE `url` = ? LIMIT 1;",
-                (ref,)
+                "SELECT `sql` FROM `sqlite_master`"
+                " WHERE `type` = 'table' AND `name` = 'cve_fts' LIMIT 1;"
             )
-            has_ref_id = self.__cursor.fetchone()
-            if has_ref_id:
-                ref_id = has_ref_id[0]
-            else:
-                self.__cursor.execute(
-                    "INSERT INTO `cve_ref_urls` VALUES (NULL, ?);",
-                    (ref,)
-                )
-                ref_id = self.__cursor.lastrowid
+            row = self.__cursor.fetchone()
+            if row:
+                for module in self.FTS_MODULES:
+                    if ("USING %s(" % module) in row[0]:
+                        self.__fts = module
+                        break
+        return self.__fts
+
+    @transactional
+    def __get_file_times(self):
+        self.__cursor.execute(
+            "SELECT `filename`, `last_modified`, `last_modified_string`,"
+            "       `last_loaded`"
+            " FROM `files`;"
+        )
+        return {
+            row[0]: (row[1], row[2], row[3])
+            for row in self.__cursor.fetchall()
+        }
+
+    # Remember when a file was last loaded, or found up to date.
+    # This method assumes it's being called from within an open transaction.
+    def __set_file_times(self, filename, new_times):
+        self.__cursor.execute(
+            "INSERT INTO `files` (`filename`, `last_modified`,"
+            "                     `last_modified_string`, `last_loaded`)"
+            " VALUES (?, ?, ?, ?);",
+            (filename, new_times[0], new_times[1], int(time()))
+        )
+
+    @transactional
+    def __set_file_loaded(self, filename):
+        self.__cursor.execute(
+            "UPDATE `files` SET `last_loaded` = ? WHERE `filename` = ?;",
+            (int(time()), filename)
+        )
+
+    @transactional
+    def __get_watermarks(self):
+        self.__cursor.execute(
+            "SELECT `filename`, `last_modified` FROM `watermarks`;")
+        return dict(self.__cursor.fetchall())
+
+    # This method assumes it's being called from within an open transaction.
+    def __get_id_maps(self):
+        if self.__id_maps is None:
+            self.__cursor.execute("SELECT `year`, `number`, `rowid` FROM `cve`;")
+            cve_ids = _IdMap(
+                ((row[0], row[1]), row[2]) for row in self.__cursor.fetchall())
+            self.__cursor.execute("SELECT `url`, `rowid` FROM `cve_ref_urls`;")
+            ref_ids = _IdMap(self.__cursor.fetchall())
             self.__cursor.execute(
-                "INSERT INTO `cve_references` VALUES (?, ?);",
-                (cve_id, ref_id)
-            )
-        for cpe in products:
+                "SELECT `cpe_name`, `rowid` FROM `cve_cpe_names`;")
+            cpe_ids = _IdMap(self.__cursor.fetchall())
+            self.__id_maps = (cve_ids, ref_ids, cpe_ids)
+        return self.__id_maps
+
+    # This method runs in the downloader threads.
+    def __fetch_and_parse(self, parsers, xml_file, file_time, watermark):
+        new_times = self.__fetch(self.CVE_URL_BASE, xml_file, file_time)
+        if new_times:
+            return new_times, parsers.apply_async(
+                _parse_cve_file, (xml_file, watermark))
+
+    @transactional
+    def __load_cve_file(self, xml_file, new_times, batches, watermark):
+        if self.DEBUG:
+            print "Loading file: %s" % xml_file
+
+        # Store the parsed data into the database.
+        # If anything goes wrong the transaction is rolled back, so the
+        # rowids cached in memory have to be discarded as well.
+        try:
+            for batch in batches:
+                self.__load_cve_batch(batch)
+        except:
+            self.__id_maps = None
+            raise
+
+        # Remember when the file was last modified and loaded,
+        # and the newest entry we have loaded from it.
+        self.__set_file_times(xml_file, new_times)
+        if watermark:
             self.__cursor.execute(
-                "SELECT `rowid` FROM `cve_cpe_names`"
-                " WHERE `cpe_name` = ? LIMIT 1;",
-                (cpe,)
+                "INSERT INTO `watermarks` VALUES (?, ?);",
+                (xml_file, watermark)
             )
-            has_cpe_id = self.__cursor.fetchone()
-            if has_cpe_id:
-                cpe_id = has_cpe_id[0]
+
+    # This method assumes it's being called from within an open transaction.
+    def __load_cve_batch(self, batch):
+        cve_ids, ref_ids, cpe_ids = self.__get_id_maps()
+        new_cves     = []
+        changed_cves = []
+        new_refs     = []
+        new_cpes     = []
+        cve_refs     = []
+        cve_cpes     = []
+        old_ranges   = []
+        cve_ranges   = []
+        for row in batch:
+            key     = row[:2]
+            summary = row[8]
+            cve_id  = cve_ids.get(key)
+            if summary is not None and summary.startswith("** REJECT **"):
+                if cve_id is not None:
+                    if self.DEBUG:
+                        print "Deleting CVE-%04d-%04d..." % key
+                    self.__flush_cve_batch(new_cves, changed_cves,
+                                           new_refs, new_cpes,
+                                           cve_refs, cve_cpes,
+                                           old_ranges, cve_ranges)
+                    self.__cursor.execute(
+                        "DELETE FROM `cve` WHERE `rowid` = ?;",
+                        (cve_id,)
+                    )
+                    del cve_ids[key]
+                continue
+            if cve_id is None:
+                cve_id = cve_ids.allocate(key)
+                new_cves.append((cve_id,) + row[:9] + row[11:14])
             else:
-                self.__cursor.execute(
-                    "INSERT INTO `cve_cpe_names` VALUES (NULL, ?);",
-                    (cpe,)
-                )
-                cpe_id = self.__cursor.lastrowid
-            self.__cursor.execute(
-                "INSERT INTO `cve_cpe` VALUES (?, ?);",
-                (cve_id, cpe_id)
-            )
+                changed_cves.append(row[2:9] + row[11:14] + (cve_id,))
+                if row[14] is not None:
+                    old_ranges.append((cve_id,))
+            for ref in row[10]:
+                ref_id = ref_ids.get(ref)
+                if ref_id is None:
+                    ref_id = ref_ids.allocate(ref)
+                    new_refs.append((ref_id, ref))
+                cve_refs.append((cve_id, ref_id))
+            for cpe in row[9]:
+                cpe_id = cpe_ids.get(cpe)
+                if cpe_id is None:
+                    cpe_id = cpe_ids.allocate(cpe)
+                    new_cpes.append((cpe_id, cpe))
+                cve_cpes.append((cve_id, cpe_id))
+            for cpe_range in row[14] or ():
+                cpe_id = cpe_ids.get(cpe_range[0])
+                if cpe_id is not None:
+                    cve_ranges.append((cve_id, cpe_id) + cpe_range[1:])
+        self.__flush_cve_batch(new_cves, changed_cves,
+                               new_refs, new_cpes,
+                               cve_refs, cve_cpes,
+                               old_ranges, cve_ranges)
+
+    # Write the rows accumulated by __load_cve_batch and empty the lists.
+    # This method assumes it's being called from within an open transaction.
+    def __flush_cve_batch(self, new_cves, changed_cves,
+                          new_refs, new_cpes, cve_refs, cve_cpes,
+                          old_ranges, cve_ranges):
+        self.__cursor.executemany(
+            "INSERT INTO `cve` (`rowid`, %s) VALUES (?%s);" % (
+                ", ".join("`%s`" % name for name in self.CVE_COLUMNS),
+                ", ?" * len(self.CVE_COLUMNS)),
+            new_cves
+        )
+        self.__cursor.executemany(
+            "UPDATE `cve` SET"
+            " `cvss_score` = ?,"
+            " `cvss_access_vector` = ?,"
+            " `cvss_access_complexity` = ?,"
+            " `cvss_authentication` = ?,"
+            " `cvss_integrity_impact` = ?,"
+            " `cwe` = ?,"
+            " `summary` = ?,"
+            " `cvss3_score` = ?,"
+            " `cvss3_vector` = ?,"
+            " `cvss3_severity` = ?"
+            " WHERE `rowid` = ?;",
+            changed_cves
+        )
+        self.__cursor.executemany(
+            "INSERT INTO `cve_ref_urls` VALUES (?, ?);",
+            new_refs
+        )
+        self.__cursor.executemany(
+            "INSERT INTO `cve_cpe_names` VALUES (?, ?);",
+            new_cpes
+        )
+        self.__cursor.executemany(
+            "INSERT INTO `cve_cpe_parts`"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);",
+            _cpe_parts_rows(new_cpes)
+        )
+        self.__cursor.executemany(
+            "INSERT OR IGNORE INTO `cve_references` VALUES (?, ?);",
+            cve_refs
+        )
+        self.__cursor.executemany(
+            "INSERT OR IGNORE INTO `cve_cpe` VALUES (?, ?);",
+            cve_cpes
+        )
+        self.__cursor.executemany(
+            "DELETE FROM `cve_cpe_ranges` WHERE `id_cve` = ?;",
+            old_ranges
+        )
+        self.__cursor.executemany(
+            "INSERT INTO `cve_cpe_ranges` VALUES (?, ?, ?, ?, ?, ?);",
+            cve_ranges
+        )
+        for rows in (new_cves, changed_cves, new_refs, new_cpes,
+                     cve_refs, cve_cpes, old_ranges, cve_ranges):
+            del rows[:]
 
     @transactional
-    def __load_vendor_statements(self):
+    def __load_vendor_statements(self, xml_file, new_times):
+        if self.DEBUG:
+            print "Loading file: %s" % xml_file
 
-        # Download and parse the vendor statements XML file.
-        xml_file   = self.VENDOR_XML_FILE
-        xml_parser = self.__download(self.VENDOR_URL_BASE, xml_file,
-                                     big_file = False)
+        # Parse the XML file and store the data into the database.
+        for item in etree.parse(xml_file).iter("statement"):
+            self.__load_vendor_statement_entry(item)
 
-        # Do we need to load new data?
-        if xml_parser:
-            if self.DEBUG:
-                print "Loading file: %s" % xml_file
+        # Remember when the file was last modified and loaded.
+        self.__set_file_times(xml_file, new_times)
 
-            # Parse the XML file and store the data into the database.
-            for item in xml_parser.iter("statement"):
-                self.__load_vendor_statement_entry(item)
-
-            # Delete the XML file.
-            unlink(xml_file)
-            if self.DEBUG:
-                print "Deleted file: %s" % xml_file
+        # Delete the XML file.
+        unlink(xml_file)
+        if self.DEBUG:
+            print "Deleted file: %s" % xml_file
 
     # This method assumes it's being called from within an open transaction.
     def __load_vendor_statement_entry(self, item):
@@ -594,52 +2249,34 @@ class CVEDB(object):
             )
 
     # If the XML file is missing, broken or older, download it.
-    # This method assumes it's being called from within an open transaction.
-    def __download(self, base_url, xml_file, big_file = True):
+    # Returns the new last modified time and string if there is new data to
+    # load, or None if the database is already up-to-date.
+    # This method runs in the downloader threads, so it must never touch the
+    # database. The caller must record the new time once the file is loaded.
+    def __fetch(self, base_url, xml_file, file_time):
 
         # HTTP request to make.
         req = Request(base_url + xml_file)
 
         # Get the last modified time from the database if available.
-        self.__cursor.execute(
-            "SELECT `last_modified`, `last_modified_string` FROM `files`"
-            " WHERE `filename` = ? LIMIT 1;",
-            (xml_file,)
-        )
-        row = self.__cursor.fetchone()
-        if row:
-            db_time, db_time_str = row
-        else:
-            db_time = None
-            db_time_str = None
+        db_time, db_time_str = file_time[:2]
 
         # Also try looking for the file locally.
         # If found but can't be read, delete it.
         if exists(xml_file):
             try:
-                if big_file:
-                    xml_parser = etree.iterparse(
-                        xml_file, events=("start", "end"))
-                else:
-                    xml_parser = etree.parse(xml_file)
                 local_time = getmtime(xml_file)
             except Exception:
-                xml_parser = None
                 local_time = None
                 unlink(xml_file)
         else:
-            xml_parser = None
             local_time = None
 
         # Use the local file if newer or not yet loaded in the database.
         if local_time and (not db_time or local_time > db_time):
             if self.DEBUG:
                 print "Found local file: %s" % xml_file
-            self.__cursor.execute(
-                "INSERT INTO `files` VALUES (?, ?, ?);",
-                (xml_file, local_time, asctime(gmtime(local_time)))
-            )
-            return xml_parser
+            return local_time, asctime(gmtime(local_time))
 
         # Otherwise, download the file if newer or not yet loaded.
         if db_time_str:
@@ -663,25 +2300,23 @@ class CVEDB(object):
             except:
                 unlink(xml_file)
                 raise
-            xml_parser = None # free memory before using more
-            if big_file:
-                xml_parser = etree.iterparse(
-                    xml_file, events=("start", "end"))
-            else:
-                xml_parser = etree.parse(xml_file)
-            if not db_time:
-                db_time = getmtime(xml_file)
+            db_time = getmtime(xml_file)
             if not db_time_str:
                 db_time_str = asctime(gmtime(db_time))
-            self.__cursor.execute(
-                "INSERT INTO `files` VALUES (?, ?, ?);",
-                (xml_file, db_time, db_time_str)
-            )
 
-            # Return the open XML file.
-            return xml_parser
+            # Return the new last modified time.
+            return db_time, db_time_str
+
+    def cache_info(self):
+        """
+        Get statistics on the cache of CVE objects and query results.
+
+        :returns: Cache hits, misses, maximum size, current size and
+            generation, which is incremented on every update.
+        :rtype: CacheInfo
+        """
+        return self.__cache.info()
 
-    @transactional
     def get(self, cvename):
         """
         Get info on a CVE by name.
@@ -692,68 +2327,237 @@ class CVEDB(object):
         :returns: CVE information.
         :rtype: CVE
         """
-        if not isinstance(cvename, basestring):
-            raise TypeError("Expected string, got %r instead" % type(cvename))
-        if not cvename.startswith("CVE-"):
-            raise ValueError("Invalid CVE name: %s" % cvename)
-        if len(cvename) not in (13, 14):
-            raise ValueError("Invalid CVE name: %s" % cvename)
-        year   = int(cvename[4:8])
-        number = int(cvename[9:])
+        cache = self.__cache
+        cve = cache.get(cvename)
+        if cve is None:
+            generation = cache.generation
+            cve = self.__get(cvename)
+            cache.put(cvename, cve, generation)
+        return cve
+
+    @transactional
+    def __get(self, cvename):
+        year, number = _parse_cve_name(cvename)
+        found = self.__fetch_cves(
+            "`year` = ? AND `number` = ?", (year, number))
+        if not found:
+            raise KeyError("CVE name not found: %s" % cvename)
+        return found[0]
+
+    def get_many(self, cvenames):
+        """
+        Get info on many CVEs by name.
+
+        This is much faster than calling get() for each name, since all the
+        CVEs are fetched together in just a few queries.
+
+        :param cvenames: CVE names.
+        :type: cvenames: list(str)
+
+        :returns: CVE information, in the same order as the names.
+        :rtype: list(CVE)
+        """
+        cache   = self.__cache
+        found   = {}
+        missing = []
+        for cvename in cvenames:
+            cve = cache.get(cvename)
+            if cve is None:
+                missing.append(cvename)
+            else:
+                found[cvename] = cve
+        if missing:
+            generation = cache.generation
+            for cvename, cve in zip(missing, self.__get_many(missing)):
+                found[cvename] = cve
+                cache.put(cvename, cve, generation)
+        return [found[cvename] for cvename in cvenames]
+
+    @transactional
+    def __get_many(self, cvenames):
+        keys = [_parse_cve_name(cvename) for cvename in cvenames]
+        if not keys:
+            return []
         self.__cursor.execute(
-            "SELECT * FROM `cve` WHERE `year` = ? AND `number` = ? LIMIT 1;",
-            (year, number)
+            "CREATE TEMP TABLE IF NOT EXISTS `cve_wanted` ("
+            "    `year` INTEGER NOT NULL,"
+            "    `number` INTEGER NOT NULL"
+            ");"
         )
-        row = self.__cursor.fetchone()
-        if not row:
-            raise KeyError("CVE name not found: %s" % cvename)
-        rowid = row[0]
-        properties = []
-        for x in row[1:]:
-            if isinstance(x, unicode):
-                try:
-                    x = x.encode("UTF-8")
-                except Exception:
-                    pass
-            properties.append(x)
+        self.__cursor.execute("DELETE FROM `temp`.`cve_wanted`;")
+        self.__cursor.executemany(
+            "INSERT INTO `temp`.`cve_wanted` VALUES (?, ?);", keys)
+        found = {
+            (cve.year, cve.number): cve
+            for cve in self.__fetch_cves(
+                "`rowid` IN ("
+                "    SELECT `cve`.`rowid`"
+                "      FROM `cve`, `temp`.`cve_wanted`"
+                "     WHERE `cve`.`year` = `cve_wanted`.`year`"
+                "       AND `cve`.`number` = `cve_wanted`.`number`"
+                ")", ())
+        }
+        self.__cursor.execute("DELETE FROM `temp`.`cve_wanted`;")
+        try:
+            return [found[key] for key in keys]
+        except KeyError, e:
+            raise KeyError("CVE name not found: CVE-%04d-%04d" % e.args[0])
+
+    @transactional
+    def get_by_year(self, year):
+        """
+        Get info on all CVEs for a given year.
+
+        :param year: Year to query.
+        :type: year: int
+
+        :returns: CVE information.
+        :rtype: list(CVE)
+        """
+        return self.__fetch_cves("`year` = ?", (year,))
+
+    @transactional
+    def get_by_cwe(self, cwe):
+        """
+        Get info on all CVEs for a given CWE ID.
+
+        :param cwe: CWE ID.
+        :type: cwe: str
+
+        :returns: CVE information.
+        :rtype: list(CVE)
+        """
+        return self.__fetch_cves("`cwe` = ?", (cwe,))
+
+    @transactional
+    def get_by_cpe(self, cpe):
+        """
+        Get info on all CVEs for a given CPE name.
+
+        :param cpe: CPE name.
+        :type: cpe: str
+
+        :returns: CVE information.
+        :rtype: list(CVE)
+        """
+        return self.__fetch_cves(
+            "`rowid` IN ("
+            "    SELECT `cve_cpe`.`id_cve`"
+            "      FROM `cve_cpe`, `cve_cpe_names`"
+            "     WHERE `cve_cpe_names`.`cpe_name` = ?"
+            "       AND `cve_cpe`.`id_cpe` = `cve_cpe_names`.`rowid`"
+            ")", (cpe,))
+
+    # Fetch all the CVEs matching the given SQL condition on the cve table.
+    # Each child table is fetched with a single query for all the CVEs.
+    # The CVEs are returned complete, so they're still usable once the
+    # database is closed. Bulk listings should use summaries() instead.
+    # This method assumes it's being called from within an open transaction.
+    def __fetch_cves(self, condition, params):
         self.__cursor.execute(
-            "SELECT `cve_cpe_names`.`cpe_name`"
+            "SELECT `rowid`, %s FROM `cve` WHERE %s;" % (
+                ", ".join("`%s`" % name for name in self.CVE_COLUMNS),
+                condition),
+            params)
+        rows = self.__cursor.fetchall()
+        if not rows:
+            return []
+        products, references, vendor_statements = \
+            self.__fetch_children(
+                "IN (SELECT `rowid` FROM `cve` WHERE %s)" % condition, params)
+        return [
+            CVE(
+                *[_to_str(x) for x in row[1:10]],
+                         products = tuple(products[row[0]]),
+                       references = tuple(references[row[0]]),
+                vendor_statements = tuple(vendor_statements[row[0]]),
+                      cvss3_score = row[10],
+                     cvss3_vector = _to_str(row[11]),
+                   cvss3_severity = _to_str(row[12])
+            )
+            for row in rows
+        ]
+
+    # Fetch the products, references and vendor statements of the CVEs
+    # whose rowids match the given SQL condition, grouped by rowid.
+    # This method assumes it's being called from within an open transaction.
+    def __fetch_children(self, condition, params):
+        products          = defaultdict(list)
+        references        = defaultdict(list)
+        vendor_statements = defaultdict(list)
+        self.__cursor.execute(
+            "SELECT `cve_cpe`.`id_cve`, `cve_cpe_names`.`cpe_name`"
             "  FROM `cve_cpe_names`, `cve_cpe`"
-            " WHERE `cve_cpe`.`id_cve` = ?"
-            "   AND `cve_cpe`.`id_cpe` = `cve_cpe_names`.`rowid`;",
-            (rowid,)
+            " WHERE `cve_cpe`.`id_cve` %s"
+            "   AND `cve_cpe`.`id_cpe` = `cve_cpe_names`.`rowid`;" % condition,
+            params
         )
-        products = tuple(str(row[0]) for row in self.__cursor.fetchall())
+        for id_cve, cpe_name in self.__cursor:
+            products[id_cve].append(str(cpe_name))
         self.__cursor.execute(
-            "SELECT `cve_ref_urls`.`url`"
+            "SELECT `cve_references`.`id_cve`, `cve_ref_urls`.`url`"
             "  FROM `cve_ref_urls`, `cve_references`"
-            " WHERE `cve_references`.`id_cve` = ?"
-            "   AND `cve_references`.`id_ref` = `cve_ref_urls`.`rowid`;",
-            (rowid,)
+            " WHERE `cve_references`.`id_cve` %s"
+            "   AND `cve_references`.`id_ref` = `cve_ref_urls`.`rowid`;"
+            % condition,
+            params
         )
-        references = tuple(str(row[0]) for row in self.__cursor.fetchall())
+        for id_cve, url in self.__cursor:
+            references[id_cve].append(str(url))
         self.__cursor.execute(
-            "SELECT * FROM `cve_vendor_statements` WHERE `id_cve` = ?;",
-            (rowid,)
-        )
-        tmp = []
-        for row in self.__cursor.fetchall():
-            tmp2 = []
-            for x in row[1:]:
-                if isinstance(x, unicode):
-                    try:
-                        x = x.encode("UTF-8")
-                    except Exception:
-                        pass
-                tmp2.append(x)
-            tmp.append(tuple(tmp2))
-        vendor_statements = tuple(tmp)
-        return CVE(
-                         *properties,
-                     products = products,
-                   references = references,
-            vendor_statements = vendor_statements
+            "SELECT * FROM `cve_vendor_statements` WHERE `id_cve` %s;"
+            % condition,
+            params
         )
+        for row in self.__cursor:
+            vendor_statements[row[0]].append(
+                tuple(_to_str(x) for x in row[1:]))
+        return products, references, vendor_statements
+
+    @transactional
+    def summaries(self, year = None, cwe = None, cpe = None):
+        """
+        Get a lightweight summary of the CVEs matching all the given filters,
+        or of all the CVEs if no filters are given. This is much cheaper than
+        getting the full CVE objects for bulk listings.
+
+        :param year: Optional year to filter by.
+        :type: year: int
+
+        :param cwe: Optional CWE ID to filter by.
+        :type: cwe: str
+
+        :param cpe: Optional CPE name to filter by.
+        :type: cpe: str
+
+        :returns: CVE summaries.
+        :rtype: list(CVESummary)
+        """
+        conditions = []
+        params     = []
+        if year is not None:
+            conditions.append("`year` = ?")
+            params.append(year)
+        if cwe is not None:
+            conditions.append("`cwe` = ?")
+            params.append(cwe)
+        if cpe is not None:
+            conditions.append(
+                "`rowid` IN ("
+                "    SELECT `cve_cpe`.`id_cve`"
+                "      FROM `cve_cpe`, `cve_cpe_names`"
+                "     WHERE `cve_cpe_names`.`cpe_name` = ?"
+                "       AND `cve_cpe`.`id_cpe` = `cve_cpe_names`.`rowid`"
+                ")")
+            params.append(cpe)
+        query = "SELECT `year`, `number`, `cvss_score`, `cwe` FROM `cve`"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        self.__cursor.execute(query + ";", params)
+        return [
+            CVESummary(row[0], row[1], row[2], _to_str(row[3]))
+            for row in self.__cursor.fetchall()
+        ]
 
     @transactional
     def by_year(self, year):
@@ -796,6 +2600,186 @@ class CVEDB(object):
         ]
 
     @transactional
+    def by_cvss_range(self, low = None, high = None):
+        """
+        Get all CVE names whose CVSS base score is within the given range.
+
+        :param low: Lowest CVSS base score, or None for no lower bound.
+        :type low: float
+
+        :param high: Highest CVSS base score, or None for no upper bound.
+        :type high: float
+
+        :returns: CVE names, sorted by CVSS base score.
+        :rtype: list(str)
+        """
+        conditions = ["`cvss_score` IS NOT NULL"]
+        params     = []
+        if low is not None:
+            conditions.append("`cvss_score` >= ?")
+            params.append(low)
+        if high is not None:
+            conditions.append("`cvss_score` <= ?")
+            params.append(high)
+        self.__cursor.execute(
+            "SELECT `year`, `number` FROM `cve` WHERE %s"
+            " ORDER BY `cvss_score`;" % " AND ".join(conditions),
+            params
+        )
+        return [
+            "CVE-%04d-%04d" % (row[0], row[1])
+            for row in self.__cursor.fetchall()
+        ]
+
+    @transactional
+    def cvss_stats(self, group_by = "year"):
+        """
+        Get statistics of the CVSS base scores, grouped by year, CWE ID or
+        vendor. The statistics are calculated by the database, so this is
+        much faster than going through all the CVE objects.
+
+        CVEs without a CVSS base score are ignored. CVEs affecting products
+        of more than one vendor are counted once for each vendor.
+
+        :param group_by: One of "year", "cwe" or "vendor".
+        :type group_by: str
+
+        :returns: Statistics for each group.
+        :rtype: dict(int | str -> CVSSStats)
+
+        :raises ValueError: Unknown grouping.
+        """
+        if group_by == "year":
+            source = (
+                "SELECT `year` AS `grp`, `cvss_score` AS `score` FROM `cve`"
+            )
+        elif group_by == "cwe":
+            source = (
+                "SELECT `cwe` AS `grp`, `cvss_score` AS `score` FROM `cve`"
+            )
+        elif group_by == "vendor":
+            source = (
+                "SELECT DISTINCT `cve_cpe_parts`.`vendor` AS `grp`,"
+                "       `cve`.`rowid`, `cve`.`cvss_score` AS `score`"
+                "  FROM `cve`, `cve_cpe`, `cve_cpe_parts`"
+                " WHERE `cve_cpe`.`id_cve` = `cve`.`rowid`"
+                "   AND `cve_cpe_parts`.`id_cpe` = `cve_cpe`.`id_cpe`"
+            )
+        else:
+            raise ValueError("Unknown grouping: %r" % (group_by,))
+        self.__cursor.execute(
+            "SELECT `grp`, MIN(CAST(`score` AS INTEGER), 9), COUNT(*),"
+            "       MIN(`score`), MAX(`score`), SUM(`score`)"
+            "  FROM (%s)"
+            " WHERE `score` IS NOT NULL"
+            " GROUP BY 1, 2;" % source
+        )
+        groups = {}
+        for group, bucket, count, minimum, maximum, total in self.__cursor:
+            group   = _to_str(group)
+            minimum = float(minimum)
+            maximum = float(maximum)
+            stats   = groups.get(group)
+            if stats is None:
+                stats = groups[group] = [0, minimum, maximum, 0.0, [0] * 10]
+            stats[0] += count
+            stats[1] = min(stats[1], minimum)
+            stats[2] = max(stats[2], maximum)
+            stats[3] += total
+            stats[4][bucket] = count
+        return {
+            group: CVSSStats(count, minimum, maximum, total / count,
+                             tuple(histogram))
+            for group, (count, minimum, maximum, total, histogram)
+            in groups.iteritems()
+        }
+
+    @transactional
+    def export_columns(self, filename):
+        """
+        Export the CVE table to a columnar file, for analytics and reporting.
+        It can be loaded very quickly with load_columns(), as NumPy arrays
+        or array.array objects.
+
+        The file has the magic string, the length of the header as a 32 bit
+        integer, the header in JSON, and then the columns one after another.
+        Each column is a little endian array aligned to 8 bytes, and its
+        typecode and offset are in the header. The rows are sorted by CVE
+        name. See COLUMNS for the list of columns.
+
+        :param filename: Output filename. It's replaced atomically.
+        :type filename: str
+
+        :returns: Number of rows exported.
+        :rtype: int
+        """
+
+        # Fetch the CVE table, encoding the strings as they come.
+        names   = [name for name, _ in COLUMNS]
+        columns = [array(typecode) for _, typecode in COLUMNS]
+        codes   = [None, None, None, {}, {}, {}, {}, {}]
+        nan     = float("nan")
+        self.__cursor.execute(
+            "SELECT %s FROM `cve` ORDER BY `year`, `number`;"
+            % ", ".join("`%s`" % name for name in names)
+        )
+        for row in self.__cursor:
+            for value, column, values in zip(row, columns, codes):
+                if values is not None:
+                    if value is None:
+                        value = -1
+                    else:
+                        value = values.setdefault(value, len(values))
+                elif value is None:
+                    value = nan
+                column.append(value)
+        rows = len(columns[0])
+
+        # Build the header. Every column starts at a multiple of 8 bytes.
+        header  = {
+            "rows":    rows,
+            "columns": [],
+            "labels":  {},
+        }
+        offsets = []
+        size    = 0
+        for name, column, values in zip(names, columns, codes):
+            header["columns"].append([name, column.typecode, size])
+            offsets.append(size)
+            size += (column.itemsize * rows + 7) & ~7
+            if values is not None:
+                labels = [None] * len(values)
+                for value, code in values.iteritems():
+                    labels[code] = value
+                header["labels"][name] = labels
+
+        # The offsets depend on the size of the header, which in turn
+        # depends on the offsets, so repeat until they don't change.
+        start = 0
+        while True:
+            for column, offset in zip(header["columns"], offsets):
+                column[2] = start + offset
+            data = json.dumps(header)
+            needed = (len(COLUMNS_MAGIC) + 4 + len(data) + 7) & ~7
+            if needed <= start:
+                break
+            start = needed
+        data += " " * (start - len(COLUMNS_MAGIC) - 4 - len(data))
+
+        # Write the file, replacing the old one only when it's complete.
+        tmp_file = filename + ".tmp"
+        with open(tmp_file, "wb") as fd:
+            fd.write(COLUMNS_MAGIC)
+            fd.write(struct.pack("<I", len(data)))
+            fd.write(data)
+            for column in columns:
+                if sys.byteorder != "little":
+                    column.byteswap()
+                column.tofile(fd)
+                fd.write("\0" * (-(column.itemsize * rows) & 7))
+        replace_file(tmp_file, filename)
+        return rows
+
     def by_cwe(self, cwe):
         """
         Get all CVE names for a given CWE ID.
@@ -806,6 +2790,10 @@ class CVEDB(object):
         :returns: CVE names.
         :rtype: list(str)
         """
+        return self.__cached_query("by_cwe", self.__by_cwe, cwe)
+
+    @transactional
+    def __by_cwe(self, cwe):
         self.__cursor.execute(
             "SELECT `year`, `number` FROM `cve` WHERE `cwe` = ?;",
             (cwe,)
@@ -815,7 +2803,6 @@ class CVEDB(object):
             for row in self.__cursor.fetchall()
         ]
 
-    @transactional
     def by_cpe(self, cpe):
         """
         Get all CVE names for a given CPE name.
@@ -826,6 +2813,10 @@ class CVEDB(object):
         :returns: CVE names.
         :rtype: list(str)
         """
+        return self.__cached_query("by_cpe", self.__by_cpe, cpe)
+
+    @transactional
+    def __by_cpe(self, cpe):
         self.__cursor.execute(
             "SELECT `cve`.`year`, `cve`.`number`"
             "  FROM `cve`, `cve_cpe`, `cve_cpe_names`"
@@ -839,6 +2830,149 @@ class CVEDB(object):
             for row in self.__cursor.fetchall()
         ]
 
+    # Run a query that returns a list of CVE names, caching the results.
+    # The results are cached as tuples, so callers can't modify them.
+    def __cached_query(self, name, query, param):
+        cache = self.__cache
+        key = (name, param)
+        names = cache.get(key)
+        if names is None:
+            generation = cache.generation
+            names = tuple(query(param))
+            cache.put(key, names, generation)
+        return list(names)
+
+    @transactional
+    def match(self, cpes):
+        """
+        Find the CVEs affecting the given installed products.
+
+        All the products are matched together in a single query, so it's
+        much faster to match a whole inventory at once than one product at
+        a time. The installed products must have a vendor and a product;
+        any other missing component, or "*", matches any value.
+
+        When a CVE has ranges of vulnerable versions, the installed version
+        is compared against them. Otherwise it's compared against the
+        version in the CPE name of the CVE. An installed version of "-"
+        (not applicable) only matches CPE names of the CVEs with a version
+        of "-" or "*", and never falls within a range.
+
+        :param cpes: CPE names of the installed products, in 2.2 or 2.3
+            format.
+        :type cpes: list(str)
+
+        :returns: CVE names affecting each product, indexed by CPE name.
+        :rtype: dict(str -> set(str))
+
+        :raises ValueError: A CPE name is invalid or has no vendor or product.
+        """
+
+        # Parse the installed products. Duplicates are only matched once.
+        installed = {}
+        for cpe in cpes:
+            if cpe not in installed:
+                parts = _cpe_parts(cpe)
+                if parts[1] == "*" or parts[2] == "*":
+                    raise ValueError(
+                        "CPE name has no vendor or product: %s" % cpe)
+                installed[cpe] = parts
+        matches = {cpe: set() for cpe in installed}
+        if not installed:
+            return matches
+
+        # Get the CPE names of the CVEs for the same vendors and products,
+        # along with the vulnerable version ranges.
+        self.__cursor.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS `cpe_wanted` ("
+            "    `vendor` TEXT NOT NULL,"
+            "    `product` TEXT NOT NULL"
+            ");"
+        )
+        self.__cursor.execute("DELETE FROM `temp`.`cpe_wanted`;")
+        self.__cursor.executemany(
+            "INSERT INTO `temp`.`cpe_wanted` VALUES (?, ?);",
+            set(parts[1:3] for parts in installed.itervalues())
+        )
+        self.__cursor.execute(
+            "SELECT `cve_cpe_parts`.*, `cve`.`year`, `cve`.`number`,"
+            "       `cve_cpe_ranges`.`version_start_including`,"
+            "       `cve_cpe_ranges`.`version_start_excluding`,"
+            "       `cve_cpe_ranges`.`version_end_including`,"
+            "       `cve_cpe_ranges`.`version_end_excluding`"
+            "  FROM `temp`.`cpe_wanted`"
+            "  JOIN `cve_cpe_parts`"
+            "    ON `cve_cpe_parts`.`vendor` = `cpe_wanted`.`vendor`"
+            "   AND `cve_cpe_parts`.`product` = `cpe_wanted`.`product`"
+            "  JOIN `cve_cpe` ON `cve_cpe`.`id_cpe` = `cve_cpe_parts`.`id_cpe`"
+            "  JOIN `cve` ON `cve`.`rowid` = `cve_cpe`.`id_cve`"
+            "  LEFT JOIN `cve_cpe_ranges`"
+            "    ON `cve_cpe_ranges`.`id_cve` = `cve_cpe`.`id_cve`"
+            "   AND `cve_cpe_ranges`.`id_cpe` = `cve_cpe`.`id_cpe`;"
+        )
+
+        # Group the CVEs by CPE name, and the CPE names by vendor and
+        # product, so each installed product is compared only once against
+        # each CPE name. Version strings are parsed only once too.
+        version_keys = {}
+        def version_key(version):
+            key = version_keys.get(version)
+            if key is None:
+                key = version_keys[version] = _version_key(version)
+            return key
+        cpe_parts = defaultdict(dict)
+        cpe_cves  = defaultdict(list)
+        for row in self.__cursor.fetchall():
+            id_cpe  = row[0]
+            parts   = row[1:12]
+            cvename = "CVE-%04d-%04d" % (row[12], row[13])
+            if row[14:18] == (None, None, None, None):
+                bounds = None
+            else:
+                bounds = tuple(
+                    version_key(bound) if bound is not None else None
+                    for bound in row[14:18]
+                )
+            cpe_parts[parts[1:3]][id_cpe] = parts
+            cpe_cves[id_cpe].append((cvename, bounds))
+        self.__cursor.execute("DELETE FROM `temp`.`cpe_wanted`;")
+
+        # Match each installed product against the CPE names.
+        for cpe, parts in installed.iteritems():
+            version     = parts[3]
+            any_version = version == "*"
+            no_version  = version == "-"
+            if any_version or no_version:
+                key = None
+            else:
+                key = version_key(version)
+            found = matches[cpe]
+            for id_cpe, other in cpe_parts[parts[1:3]].iteritems():
+
+                # Compare all the components but the version.
+                if any(
+                    parts[i] != other[i] and "*" not in (parts[i], other[i])
+                    for i in (0, 4, 5, 6, 7, 8, 9, 10)
+                ):
+                    continue
+
+                # Compare the version.
+                if no_version:
+                    if other[3] not in ("*", "-"):
+                        continue
+                elif not any_version and other[3] != "*":
+                    if other[3] == "-" or key != version_key(other[3]):
+                        continue
+
+                # Compare against the version ranges, if any.
+                # Without a version there's nothing to compare.
+                for cvename, bounds in cpe_cves[id_cpe]:
+                    if bounds is None or any_version or (
+                            not no_version and _version_in_range(key, bounds)):
+                        found.add(cvename)
+
+        return matches
+
     @transactional
     def by_ref(self, url):
         """
@@ -866,9 +3000,12 @@ class CVEDB(object):
     @transactional
     def search(self, words):
         """
-        Get all CVE names that have all the given words in their summary.
+        Get all CVE names that have all the given words in their summary
+        or vendor statements. Words ending with an asterisk are treated as
+        prefixes. Results are sorted by relevance.
 
-        .. note: This query may be slow, depending on your search terms.
+        .. note: If SQLite has no full text search support, this falls back
+            to a much slower substring search over the summaries only.
 
         :param words: Words to look for.
         :type: words: list(str)
@@ -880,6 +3017,9 @@ class CVEDB(object):
             return []
         if isinstance(words, basestring):
             words = [words]
+        if self.__get_fts():
+            query = " ".join(_fts_phrase(word, self.__fts) for word in words)
+            return [name for name, _ in self.__fulltext(query, None, False)]
         query = "SELECT `year`, `number` FROM `cve` WHERE "
         query += " AND ".join(["`summary` LIKE ?"] * len(words))
         query += ";"
@@ -890,6 +3030,192 @@ class CVEDB(object):
             for row in self.__cursor.fetchall()
         ]
 
+    @transactional
+    def fulltext(self, query, limit = None, snippets = True):
+        """
+        Full text search on the CVE summaries and vendor statements.
+
+        The query uses the SQLite full text search syntax, so it supports
+        phrases ("buffer overflow"), prefixes (overfl*) and boolean operators
+        (overflow OR underflow).
+
+        :param query: Full text search query.
+        :type: query: str
+
+        :param limit: Maximum number of results. Use None for no limit.
+        :type: limit: int
+
+        :param snippets: True to return a snippet of the matching text with
+            each result, False to return None instead.
+        :type: snippets: bool
+
+        :returns: CVE names and snippets, most relevant first.
+        :rtype: list(tuple(str, str))
+
+        :raises RuntimeError: Full text search is not supported.
+        """
+        if not self.__get_fts():
+            raise RuntimeError("Full text search is not supported")
+        return self.__fulltext(query, limit, snippets)
+
+    # This method assumes it's being called from within an open transaction.
+    def __fulltext(self, query, limit, snippets):
+        if self.__fts == "fts5":
+            snippet = "snippet(`cve_fts`, -1, '[', ']', '...', 16)"
+            order   = "`cve_fts`.`rank`"
+        else:
+            snippet = "snippet(`cve_fts`, '[', ']', '...', -1, 16)"
+            order   = "cve_fts4_rank(matchinfo(`cve_fts`, 'pcx')) DESC"
+        if not snippets:
+            snippet = "NULL"
+        sql = (
+            "SELECT `cve`.`year`, `cve`.`number`, %s"
+            "  FROM `cve_fts`, `cve`"
+            " WHERE `cve_fts` MATCH ?"
+            "   AND `cve`.`rowid` = `cve_fts`.`rowid`"
+            " ORDER BY %s"
+        ) % (snippet, order)
+        params = [query]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        self.__cursor.execute(sql + ";", params)
+        return [
+            ("CVE-%04d-%04d" % (row[0], row[1]), row[2])
+            for row in self.__cursor.fetchall()
+        ]
+
+
+def test():
+    import gzip
+    import shutil
+    import tempfile
+    from os.path import join
+    from snapshot import apply_delta, hash_file, make_delta
+
+    # Version ordering: numbers as numbers, trailing zeros ignored,
+    # pre-releases before the release and other letters after it.
+    assert _version_key("1.9") < _version_key("1.10")
+    assert _version_key("1.0") == _version_key("1.0.0")
+    assert _version_key("1.0rc1") < _version_key("1.0") < _version_key("1.0a")
+    assert _version_key("2.0alpha") < _version_key("2.0beta2") < \
+        _version_key("2.0")
+
+    # Synthetic JSON 1.1 feeds, with version ranges and NA and ANY versions.
+    def entry(cvename, summary, matches):
+        return {
+            "cve": {
+                "CVE_data_meta": {"ID": cvename},
+                "description": {"description_data": [
+                    {"lang": "en", "value": summary},
+                ]},
+                "references": {"reference_data": [
+                    {"url": "http://example.com/" + cvename},
+                ]},
+            },
+            "configurations": {"nodes": [{"cpe_match": matches}]},
+            "lastModifiedDate": "2020-01-01T00:00Z",
+        }
+    def cpe_match(product, version, **bounds):
+        match = {
+            "vulnerable": True,
+            "cpe23Uri": "cpe:2.3:a:acme:%s:%s:*:*:*:*:*:*:*"
+                        % (product, version),
+        }
+        match.update(bounds)
+        return match
+    entries = [
+        entry("CVE-2020-0001", "Buffer overflow in the widget parser",
+              [cpe_match("widget", "*", versionStartIncluding = "1.0",
+                         versionEndExcluding = "2.0")]),
+        entry("CVE-2020-0002", "Heap overflow in the widget renderer",
+              [cpe_match("widget", "*", versionStartExcluding = "2.0",
+                         versionEndIncluding = "3.0")]),
+        entry("CVE-2020-0003", "Cross site scripting in the widget",
+              [cpe_match("widget", "-")]),
+        entry("CVE-2020-0004", "Denial of service in the widget",
+              [cpe_match("widget", "1.5")]),
+        entry("CVE-2020-0005", "Information leak in the gadget",
+              [cpe_match("gadget", "*")]),
+    ]
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        def write_feed(filename, entries):
+            filename = join(tmp_dir, filename)
+            with gzip.open(filename, "wb") as fd:
+                json.dump({"CVE_Items": entries}, fd)
+            return filename
+        class TestCVEDB(CVEDB):
+            DEBUG = False
+        db_file = join(tmp_dir, "test.db")
+        with TestCVEDB(db_file,
+                       json_files = [write_feed("a.json.gz", entries)]) as db:
+
+            # Version ranges, pre-releases, and NA and ANY versions.
+            expected = {
+                "1.0rc1":   set(),
+                "1.0":      set(["CVE-2020-0001"]),
+                "1.5":      set(["CVE-2020-0001", "CVE-2020-0004"]),
+                "1.10":     set(["CVE-2020-0001"]),
+                "2.0beta":  set(["CVE-2020-0001"]),
+                "2.0":      set(),
+                "2.0.1":    set(["CVE-2020-0002"]),
+                "3.0rc1":   set(["CVE-2020-0002"]),
+                "3.0.0":    set(["CVE-2020-0002"]),
+                "3.0.1":    set(),
+                "-":        set(["CVE-2020-0003"]),
+                "*":        set(["CVE-2020-0001", "CVE-2020-0002",
+                                 "CVE-2020-0003", "CVE-2020-0004"]),
+            }
+            cpes = {
+                "cpe:2.3:a:acme:widget:%s:*:*:*:*:*:*:*" % version: cves
+                for version, cves in expected.iteritems()
+            }
+            cpes["cpe:/a:acme:gadget:-"] = set(["CVE-2020-0005"])
+            cpes["cpe:/a:ACME:Gadget:1.0"] = set(["CVE-2020-0005"])
+            found = db.match(cpes)
+            for cpe in sorted(cpes):
+                assert found[cpe] == cpes[cpe], (cpe, found[cpe])
+
+            # Bulk lookups keep the order of the names, and the objects
+            # are complete even after the database is closed.
+            names = ["CVE-2020-0005", "CVE-2020-0001", "CVE-2020-0005"]
+            many = db.get_many(names)
+            assert [cve.name for cve in many] == names
+            try:
+                db.get_many(["CVE-2020-0001", "CVE-2020-0009"])
+                assert False
+            except KeyError:
+                pass
+
+            # Full text search, or its fallback.
+            assert set(db.search(["overflow"])) == \
+                set(["CVE-2020-0001", "CVE-2020-0002"])
+            assert db.search(["buffer", "overflow"]) == ["CVE-2020-0001"]
+            assert db.search(["nonexistent"]) == []
+
+            # Snapshots and binary deltas between them.
+            old_snapshot = join(tmp_dir, "old.db")
+            new_snapshot = join(tmp_dir, "new.db")
+            rebuilt      = join(tmp_dir, "rebuilt.db")
+            db.export_snapshot(old_snapshot)
+            entries.append(
+                entry("CVE-2020-0006", "Use after free in the gadget",
+                      [cpe_match("gadget", "2.0")]))
+            db.update_from_json([write_feed("b.json.gz", entries[-1:])])
+            db.export_snapshot(new_snapshot)
+        assert many[1].products == (
+            "cpe:2.3:a:acme:widget:*:*:*:*:*:*:*:*",)
+        assert many[1].references == ("http://example.com/CVE-2020-0001",)
+        delta_file = join(tmp_dir, "new.delta")
+        assert make_delta(old_snapshot, new_snapshot, delta_file) is not None
+        apply_delta(old_snapshot, delta_file, rebuilt)
+        assert hash_file(rebuilt) == hash_file(new_snapshot)
+        with TestCVEDB(rebuilt, snapshot = True) as db:
+            cve = db.get("CVE-2020-0006")
+        assert cve.products == ("cpe:2.3:a:acme:gadget:2.0:*:*:*:*:*:*:*",)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors = True)
 
 if __name__ == "__main__":
     import sys
@@ -923,10 +3249,10 @@ if __name__ == "__main__":
                     words = [x for x in words if x]
                     cve_list.extend(db.search(words))
         sep = ""
-        for cvename in cve_list:
+        for cve in db.get_many(cve_list):
             print
             if sep:
                 print sep
                 print
             sep = "----"
-            print db.get(cvename)
+            print cve
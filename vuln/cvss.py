@@ -28,7 +28,104 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-__all__ = ["CVSS_Base", "CVSS"]
+__all__ = [
+    "CVSS_Base", "CVSS",
+    "CVSSScores", "parse_vectors", "score_codes", "score_vectors",
+    "score_tables",
+    "CVSS3", "score_vectors3",
+]
+
+from array import array
+from collections import namedtuple
+from itertools import product
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#------------------------------------------------------------------------------
+# Formulas. The order of the operations matters, it must be the same
+# everywhere to get the same floating point results.
+
+def _base_formulas(AV, AC, Au, C, I, A):
+    "Exploitability, impact, impact factor and base score."
+    exploitability = 20.0 * AV * AC * Au
+    impact = 10.41 * (1.0-(1.0-C) * (1.0-I) * (1.0-A))
+    f_impact = 0.0 if impact == 0.0 else 1.176
+    base_score = "%.1f" % (
+        f_impact * ((0.6 * impact) + (0.4 * exploitability) - 1.5)
+    )
+    return exploitability, impact, f_impact, base_score
+
+def _temporal_formula(base_score, E, RL, RC):
+    "Temporal score, from a base score or an adjusted base score."
+    return "%.1f" % (float(base_score) * E * RL * RC)
+
+def _adjusted_formulas(exploitability, f_impact, C, I, A, CR, IR, AR):
+    "Adjusted impact and adjusted base score."
+    adjusted_impact = min(10, 10.41 * (
+        1 - (1-C*CR) * (1-I*IR) * (1-A*AR)
+    ))
+    adjusted_base_score = "%.1f" % (
+        f_impact * (
+            (0.6 * adjusted_impact) +
+            (0.4 * exploitability) -
+            1.5
+        )
+    )
+    return adjusted_impact, adjusted_base_score
+
+def _environmental_formula(adjusted_temporal_score, CDP, TD):
+    "Environmental score, from the adjusted temporal score."
+    adjusted_temporal = float(adjusted_temporal_score)
+    return "%.1f" % (
+        (adjusted_temporal + (10 - adjusted_temporal) * CDP) * TD
+    )
+
+def _level(score):
+    "Severity level of a score."
+    # https://www.pcisecuritystandards.org/pdfs/asv_program_guide_v1.0.pdf
+    score = float(score)
+    if score == 0.0:
+        return "INFORMATIONAL"
+    if score == 10.0:
+        return "CRITICAL"
+    if score < 4.0:
+        return "LOW"
+    if score < 7.0:
+        return "MEDIUM"
+    return "HIGH"
+
+# Maximum number of split vectors to keep in the cache.
+# The cache is emptied when full, which is fast and good enough.
+VECTOR_CACHE_SIZE = 4096
+
+_vector_cache = {}
+def _split_vector(vector):
+    """
+    Split a CVSS vector into metric names and values, without validating
+    them. Results are cached, since the same vectors come up over and over.
+    """
+    try:
+        return _vector_cache[vector]
+    except (KeyError, TypeError):
+        pass
+    pairs = []
+    for metric_and_value in vector.split("/"):
+        metric_and_value = metric_and_value.strip()
+        if not metric_and_value:
+            continue
+        metric, value = metric_and_value.split(":", 1)
+        pairs.append((metric.strip(), value.strip()))
+    pairs = tuple(pairs)
+    if len(_vector_cache) >= VECTOR_CACHE_SIZE:
+        _vector_cache.clear()
+    _vector_cache[vector] = pairs
+    return pairs
+
+#------------------------------------------------------------------------------
+# Calculators.
 
 def _p(metric):
     def _g(self):
@@ -44,16 +141,61 @@ class cvss_metaclass(type):
         for _m in cls.METRICS:
             setattr(cls, _m, _p(_m))
 
+class cvss2_metaclass(cvss_metaclass):
+
+    def __init__(cls, name, bases, namespace):
+        super(cvss2_metaclass, cls).__init__(name, bases, namespace)
+
+        # The metrics are stored as integer codes, the indexes of their
+        # numeric values sorted. Both the value names and the numeric
+        # values map to the codes.
+        cls._INDEXES = {metric: i for i, metric in enumerate(cls.METRICS)}
+        values = []
+        codes = []
+        names = []
+        for metric in cls.METRICS:
+            scores = getattr(cls, metric + "_SCORE")
+            metric_values = tuple(sorted(set(scores.itervalues())))
+            metric_codes = {
+                score: code for code, score in enumerate(metric_values)
+            }
+            metric_names = [None] * len(metric_values)
+
+            # Names with the same numeric value (like E:H and E:ND) get the
+            # same code. The vectors use the first one in dictionary order.
+            for value_name, score in scores.iteritems():
+                code = metric_codes[score]
+                if metric_names[code] is None:
+                    metric_names[code] = "%s:%s" % (metric, value_name)
+            for value_name, score in scores.iteritems():
+                metric_codes[value_name] = metric_codes[score]
+
+            values.append(metric_values)
+            codes.append(metric_codes)
+            names.append(tuple(metric_names))
+        cls._VALUES = tuple(values)
+        cls._CODES = tuple(codes)
+        cls._NAMES = tuple(names)
+
+        # Caches of parsed vectors and vector strings.
+        cls._parsed = {}
+        cls._vectors = {}
+
+        cls._DEFAULT_CODES = tuple(
+            code for _, code in cls._parse(cls.DEFAULT_VECTOR))
+
 class CVSS_Base(object):
     "Base CVSS Calculator."
 
-    __metaclass__ = cvss_metaclass
+    __metaclass__ = cvss2_metaclass
 
     METRICS = (
         "AV", "AC", "Au",
         "C", "I", "A",
     )
 
+    DEFAULT_VECTOR = "AV:N/AC:L/Au:N/C:N/I:N/A:N"
+
     ADJACENT_NETWORK = "A"
     COMPLETE = "C"
     HIGH = "H"
@@ -92,102 +234,138 @@ class CVSS_Base(object):
     I_SCORE = C_SCORE
     A_SCORE = C_SCORE
 
+    # True to look up the scores in the precomputed tables (see
+    # score_tables()), False to calculate them with the formulas.
+    USE_TABLES = True
+
     def get_metric(self, metric):
-        return getattr(self, "_CVSS_Base__" + metric)
+        try:
+            index = self._INDEXES[metric]
+        except KeyError:
+            raise AttributeError("Invalid metric: %r" % (metric,))
+        return self._VALUES[index][self.__codes[index]]
+
+    def get_codes(self):
+        """
+        Get the integer codes of the metrics, as in METRIC_VALUES.
+
+        :rtype: tuple(int)
+        """
+        return self.__codes
 
     def set_metric(self, metric, value):
         try:
-            scores = getattr(self, metric + "_SCORE")
-        except AttributeError:
+            index = self._INDEXES[metric]
+        except KeyError:
             raise ValueError("Invalid metric: %r" % (metric,))
         try:
-            score = scores[value]
+            code = self._CODES[index][value]
         except KeyError:
-            if value in scores.values():
-                score = value
-            else:
-                raise ValueError("Invalid %s value: %r" % (metric, value))
-        setattr(self, "_CVSS_Base__" + metric, score)
+            raise ValueError("Invalid %s value: %r" % (metric, value))
+        codes = list(self.__codes)
+        codes[index] = code
+        self.__codes = tuple(codes)
 
-    @property
-    def vector(self):
-        vector = []
-        for metric in self.METRICS:
-            value = self.get_metric(metric)
-            scores = getattr(self, metric + "_SCORE")
-            found = False
-            for name, candidate in scores.iteritems():
-                if value == candidate:
-                    vector.append("%s:%s" % (metric, name))
-                    found = True
-                    break
-            assert found, "Internal error while calculating CVSS base vector"
-        return "/".join(vector)
+    @classmethod
+    def _parse(cls, vector):
+        """
+        Parse a CVSS vector into metric indexes and codes.
+        Results are cached.
 
-    @vector.setter
-    def vector(self, vector):
+        :rtype: tuple(tuple(int, int))
+        """
         try:
-            old_vector = self.vector
-        except Exception:
-            old_vector = None
+            return cls._parsed[vector]
+        except (KeyError, TypeError):
+            pass
         try:
-            for metric_and_value in vector.split("/"):
-                metric_and_value = metric_and_value.strip()
-                if not metric_and_value:
-                    continue
-                metric, value = metric_and_value.split(":", 1)
-                self.set_metric(metric.strip(), value.strip())
-            self.vector # sanity check
+            changes = tuple(
+                (cls._INDEXES[metric], cls._CODES[cls._INDEXES[metric]][value])
+                for metric, value in _split_vector(vector)
+            )
         except Exception:
-            if old_vector is not None:
-                self.vector = old_vector
             raise ValueError("Invalid CVSS base vector: %r" % (vector,))
+        if len(cls._parsed) >= VECTOR_CACHE_SIZE:
+            cls._parsed.clear()
+        cls._parsed[vector] = changes
+        return changes
+
+    @classmethod
+    def _format(cls, codes):
+        """
+        Format the CVSS vector for some metric codes, the first ones in
+        METRICS. The vector strings are cached and interned.
+
+        :rtype: str
+        """
+        try:
+            return cls._vectors[codes]
+        except KeyError:
+            pass
+        vector = intern("/".join(
+            names[code] for names, code in zip(cls._NAMES, codes)
+        ))
+        if len(cls._vectors) >= VECTOR_CACHE_SIZE:
+            cls._vectors.clear()
+        cls._vectors[codes] = vector
+        return vector
+
+    @property
+    def vector(self):
+        return self._format(self.__codes)
+
+    @vector.setter
+    def vector(self, vector):
+        changes = self._parse(vector)
+        codes = list(self.__codes)
+        for index, code in changes:
+            codes[index] = code
+        self.__codes = tuple(codes)
 
     base_vector = vector
 
+    def _base_scores(self):
+        if self.USE_TABLES:
+            return score_tables().base[self.get_codes()[:6]]
+        return _base_formulas(
+            self.AV, self.AC, self.Au, self.C, self.I, self.A)
+
     @property
     def base_exploitability(self):
-        return 20.0 * self.AV * self.AC * self.Au
+        return self._base_scores()[0]
 
     @property
     def impact(self):
-        return 10.41 * (1.0-(1.0-self.C) * (1.0-self.I) * (1.0-self.A))
+        return self._base_scores()[1]
 
     @property
     def f_impact(self):
-        return 0.0 if self.impact == 0.0 else 1.176
+        return self._base_scores()[2]
 
     @property
     def base_score(self):
-        return "%.1f" % (
-            self.f_impact * (
-                (0.6 * self.impact) + (0.4 * self.base_exploitability) - 1.5
-            )
-        )
+        return self._base_scores()[3]
 
     score = base_score
 
     @property
     def level(self):
-        # https://www.pcisecuritystandards.org/pdfs/asv_program_guide_v1.0.pdf
-        score = float(self.score)
-        if score == 0.0:
-            return "INFORMATIONAL"
-        if score == 10.0:
-            return "CRITICAL"
-        if score < 4.0:
-            return "LOW"
-        if score < 7.0:
-            return "MEDIUM"
-        return "HIGH"
+        return self._get_level(self.score)
+
+    def _get_level(self, score):
+        if self.USE_TABLES:
+            return score_tables().levels[score]
+        return _level(score)
 
     def __init__(self, vector = None):
-        self.vector = "AV:N/AC:L/Au:N/C:N/I:N/A:N"
+        self.__codes = self._DEFAULT_CODES
         if vector:
             self.vector = vector
 
     def __str__(self):
-        return "%s: %s [%s]" % (self.score, self.level.title(), self.vector)
+        score = self.score
+        return "%s: %s [%s]" % (
+            score, self._get_level(score).title(), self.vector)
 
     def __repr__(self):
         return "<%s score=%s vector=%s>" % \
@@ -208,6 +386,9 @@ class CVSS(CVSS_Base):
         "CDP", "TD", "CR", "IR", "AR",
     )
 
+    DEFAULT_VECTOR = CVSS_Base.DEFAULT_VECTOR + \
+        "/E:ND/RL:ND/RC:ND/CDP:ND/TD:ND/CR:ND/IR:ND/AR:ND"
+
     HIGH = CVSS_Base.HIGH
     LOW = CVSS_Base.LOW
     MEDIUM = CVSS_Base.MEDIUM
@@ -276,52 +457,48 @@ class CVSS(CVSS_Base):
     IR_SCORE = CR_SCORE
     AR_SCORE = CR_SCORE
 
-    def __init__(self, vector = None):
-        new_metrics = self.METRICS[len(CVSS_Base.METRICS):]
-        for metric in new_metrics:
-            self.set_metric(metric, self.NOT_DEFINED)
-        super(CVSS, self).__init__(vector)
+    def _temporal_score(self, base_score):
+        if self.USE_TABLES:
+            return score_tables().temporal[
+                (base_score,) + self.get_codes()[6:9]]
+        return _temporal_formula(base_score, self.E, self.RL, self.RC)
+
+    def _adjusted_scores(self):
+        if self.USE_TABLES:
+            codes = self.get_codes()
+            return score_tables().adjusted[codes[:6] + codes[11:14]]
+        return _adjusted_formulas(
+            self.base_exploitability, self.f_impact, self.C, self.I, self.A,
+            self.CR, self.IR, self.AR)
 
     @property
     def temporal_score(self):
-        return "%.1f" % (
-            float(self.base_score) * self.E * self.RL * self.RC
-        )
+        return self._temporal_score(self.base_score)
 
     @property
     def adjusted_impact(self):
-        return min(10, 10.41 * (
-            1 - (1-self.C*self.CR) * (1-self.I*self.IR) * (1-self.A*self.AR)
-        ))
+        return self._adjusted_scores()[0]
 
     @property
     def adjusted_base_score(self):
-        return "%.1f" % (
-            self.f_impact * (
-                (0.6 * self.adjusted_impact) +
-                (0.4 * self.base_exploitability) -
-                1.5
-            )
-        )
+        return self._adjusted_scores()[1]
 
     @property
     def adjusted_temporal_score(self):
-        return "%.1f" % (
-            float(self.adjusted_base_score) * self.E * self.RL * self.RC
-        )
+        return self._temporal_score(self.adjusted_base_score)
 
     @property
     def environmental_score(self):
-        adjusted_temporal = float(self.adjusted_temporal_score)
-        return "%.1f" % (
-            (adjusted_temporal + (10 - adjusted_temporal) * self.CDP) * self.TD
-        )
+        if self.USE_TABLES:
+            return _score_strings(self.get_codes(), score_tables())[2]
+        return _environmental_formula(
+            self.adjusted_temporal_score, self.CDP, self.TD)
 
     score = environmental_score
 
     @property
     def base_vector(self):
-        return "/".join(self.vector.split("/")[:6])
+        return self._format(self.get_codes()[:6])
 
 CVSS.exploitability = CVSS.E
 CVSS.remediation_level = CVSS.RL
@@ -332,6 +509,879 @@ CVSS.confidentiality_requirements = CVSS.CR
 CVSS.integrity_requirements = CVSS.IR
 CVSS.availability_requirements = CVSS.AR
 
+#------------------------------------------------------------------------------
+# Batch scoring.
+
+# Scores of many CVSS vectors: base, temporal and environmental.
+CVSSScores = namedtuple("CVSSScores", ("base", "temporal", "environmental"))
+
+# Distinct numeric values of each metric, the integer codes index them.
+# Value names with the same score (like E:H and E:ND) get the same code.
+# These are the tables built by the metaclass of the calculators.
+METRIC_VALUES = dict(zip(CVSS.METRICS, CVSS._VALUES))
+
+# Integer code of each value name, for each metric.
+METRIC_CODES = {
+    metric: {
+        name: code
+        for name, code in codes.iteritems()
+        if isinstance(name, basestring)
+    }
+    for metric, codes in zip(CVSS.METRICS, CVSS._CODES)
+}
+
+# Default codes for the metrics missing in a vector, as in CVSS().
+DEFAULT_CODES = CVSS._DEFAULT_CODES
+
+def _unique_codes(vectors, environment, parse = CVSS._parse,
+                  defaults = DEFAULT_CODES):
+    """
+    Parse CVSS vectors, each distinct one only once.
+    The parser must return the field indexes and codes of a vector, like
+    CVSS._parse() does.
+
+    :returns: Code tuples of the distinct vectors, and for each vector the
+        index of its code tuple.
+    :rtype: tuple(list(tuple(int)), array)
+    """
+    overrides = ()
+    if environment:
+        overrides = parse(environment)
+    rows = []
+    index = {}
+    inverse = array("i")
+    for vector in vectors:
+        try:
+            inverse.append(index[vector])
+        except KeyError:
+            codes = list(defaults)
+            for i, code in parse(vector):
+                codes[i] = code
+            for i, code in overrides:
+                codes[i] = code
+            index[vector] = len(rows)
+            inverse.append(len(rows))
+            rows.append(tuple(codes))
+    return rows, inverse
+
+# Lookup tables with every possible score. See score_tables().
+ScoreTables = namedtuple("ScoreTables", (
+    "base", "adjusted", "temporal", "environmental", "levels"
+))
+
+_score_tables = None
+def score_tables():
+    """
+    Get the lookup tables with every possible CVSS v2 score, which are
+    built the first time they're needed.
+
+    There are only 729 combinations of the base metrics, and the other
+    scores depend on a rounded score and a few more metrics, so the tables
+    are small. They're indexed by the integer codes of the metrics (see
+    METRIC_VALUES), with the rounded scores as strings where needed:
+
+     - base: codes of AV, AC, Au, C, I, A. Returns the exploitability,
+       impact, impact factor and base score.
+     - adjusted: codes of AV, AC, Au, C, I, A, CR, IR, AR. Returns the
+       adjusted impact and adjusted base score.
+     - temporal: base score or adjusted base score, codes of E, RL, RC.
+       Returns the temporal score or adjusted temporal score.
+     - environmental: adjusted temporal score, codes of CDP, TD. Returns
+       the environmental score.
+     - levels: score. Returns the severity level.
+
+    :rtype: ScoreTables
+    """
+    global _score_tables
+    if _score_tables is None:
+        values = [METRIC_VALUES[metric] for metric in CVSS.METRICS]
+        codes = [xrange(len(x)) for x in values]
+
+        # Base and adjusted scores, for every combination of the metrics.
+        base = {}
+        adjusted = {}
+        for key in product(*codes[:6]):
+            AV, AC, Au, C, I, A = [values[i][x] for i, x in enumerate(key)]
+            scores = _base_formulas(AV, AC, Au, C, I, A)
+            base[key] = scores
+            for extra in product(*codes[11:14]):
+                CR, IR, AR = [values[11 + i][x] for i, x in enumerate(extra)]
+                adjusted[key + extra] = _adjusted_formulas(
+                    scores[0], scores[2], C, I, A, CR, IR, AR)
+
+        # Temporal scores, for every base and adjusted base score.
+        scores = set(x[3] for x in base.itervalues())
+        scores.update(x[1] for x in adjusted.itervalues())
+        temporal = {}
+        for score in scores:
+            for key in product(*codes[6:9]):
+                E, RL, RC = [values[6 + i][x] for i, x in enumerate(key)]
+                temporal[(score,) + key] = _temporal_formula(score, E, RL, RC)
+
+        # Environmental scores, for every adjusted temporal score.
+        environmental = {}
+        for score in set(temporal.itervalues()):
+            for key in product(*codes[9:11]):
+                CDP, TD = [values[9 + i][x] for i, x in enumerate(key)]
+                environmental[(score,) + key] = \
+                    _environmental_formula(score, CDP, TD)
+
+        # Severity levels, for every score.
+        scores.update(temporal.itervalues())
+        scores.update(environmental.itervalues())
+        levels = {score: _level(score) for score in scores}
+
+        _score_tables = ScoreTables(
+            base, adjusted, temporal, environmental, levels)
+    return _score_tables
+
+def _check_numpy(use_numpy):
+    if use_numpy is None:
+        return numpy is not None
+    if use_numpy and numpy is None:
+        raise ImportError("NumPy is not installed")
+    return use_numpy
+
+def parse_vectors(vectors, environment = None, use_numpy = None):
+    """
+    Parse many CVSS vectors into integer codes.
+
+    The code of each metric is the index of its numeric value in
+    METRIC_VALUES. Missing metrics get the same defaults as in CVSS().
+
+    :param vectors: CVSS vectors.
+    :type vectors: iterable(str)
+
+    :param environment: Optional CVSS vector with metrics that override
+        the ones in every vector, for example the environmental metrics.
+    :type environment: str | None
+
+    :param use_numpy: True to use NumPy, False to use the array module,
+        None to use NumPy only if it's installed.
+    :type use_numpy: bool | None
+
+    :returns: Array of codes for each metric, indexed by metric name.
+    :rtype: dict(str -> array)
+
+    :raises ValueError: Invalid CVSS vector.
+    """
+    use_numpy = _check_numpy(use_numpy)
+    rows, inverse = _unique_codes(vectors, environment)
+    if use_numpy:
+        table = numpy.array(rows, numpy.int8).reshape(-1, len(CVSS.METRICS))
+        table = table[numpy.frombuffer(inverse, numpy.intc)]
+        return {
+            metric: numpy.ascontiguousarray(table[:, i])
+            for i, metric in enumerate(CVSS.METRICS)
+        }
+    return {
+        metric: array("b", (rows[j][i] for j in inverse))
+        for i, metric in enumerate(CVSS.METRICS)
+    }
+
+def _round_numpy(scores):
+    """
+    Round scores to one decimal exactly like "%.1f" does, which is what
+    the CVSS class does. Only the distinct values are formatted.
+    """
+    values, inverse = numpy.unique(scores, return_inverse = True)
+    rounded = numpy.array([float("%.1f" % x) for x in values], numpy.float64)
+    return rounded[inverse]
+
+def _score_numpy(codes):
+    AV, AC, Au, C, I, A, E, RL, RC, CDP, TD, CR, IR, AR = [
+        numpy.array(METRIC_VALUES[metric], numpy.float64)[codes[metric]]
+        for metric in CVSS.METRICS
+    ]
+
+    # Base score.
+    exploitability = 20.0 * AV * AC * Au
+    impact = 10.41 * (1.0-(1.0-C) * (1.0-I) * (1.0-A))
+    f_impact = numpy.where(impact == 0.0, 0.0, 1.176)
+    base = _round_numpy(
+        f_impact * ((0.6 * impact) + (0.4 * exploitability) - 1.5))
+
+    # Temporal score.
+    temporal = _round_numpy(base * E * RL * RC)
+
+    # Environmental score.
+    adjusted_impact = numpy.minimum(10, 10.41 * (
+        1 - (1-C*CR) * (1-I*IR) * (1-A*AR)
+    ))
+    adjusted_base = _round_numpy(
+        f_impact * (
+            (0.6 * adjusted_impact) + (0.4 * exploitability) - 1.5
+        )
+    )
+    adjusted_temporal = _round_numpy(adjusted_base * E * RL * RC)
+    environmental = _round_numpy(
+        (adjusted_temporal + (10 - adjusted_temporal) * CDP) * TD)
+
+    return CVSSScores(base, temporal, environmental)
+
+# Maximum number of scored code tuples to keep in the cache.
+SCORE_CACHE_SIZE = 65536
+
+_score_cache = {}
+def _score_strings(row, tables):
+    """
+    Scores of a single vector as strings, from the codes of its metrics.
+    Results are cached.
+    """
+    try:
+        return _score_cache[row]
+    except KeyError:
+        pass
+    base = tables.base[row[:6]][3]
+    temporal = tables.temporal[(base,) + row[6:9]]
+    adjusted_base = tables.adjusted[row[:6] + row[11:14]][1]
+    adjusted_temporal = tables.temporal[(adjusted_base,) + row[6:9]]
+    environmental = tables.environmental[(adjusted_temporal,) + row[9:11]]
+    scores = (base, temporal, environmental)
+    if len(_score_cache) >= SCORE_CACHE_SIZE:
+        _score_cache.clear()
+    _score_cache[row] = scores
+    return scores
+
+def _score_row(row, tables):
+    "Scores of a single vector, from the codes of its metrics."
+    return tuple(float(x) for x in _score_strings(row, tables))
+
+def _score_python(codes):
+    columns = [codes[metric] for metric in CVSS.METRICS]
+    count = len(columns[0])
+    tables = score_tables()
+    base = array("d")
+    temporal = array("d")
+    environmental = array("d")
+    cache = {}
+    for j in xrange(count):
+        row = tuple(column[j] for column in columns)
+        try:
+            scores = cache[row]
+        except KeyError:
+            scores = _score_row(row, tables)
+            cache[row] = scores
+        base.append(scores[0])
+        temporal.append(scores[1])
+        environmental.append(scores[2])
+    return CVSSScores(base, temporal, environmental)
+
+def score_codes(codes, use_numpy = None):
+    """
+    Calculate the scores of many CVSS vectors parsed with parse_vectors().
+
+    The results are the same as the CVSS class gives, as numbers.
+
+    :param codes: Array of codes for each metric, indexed by metric name.
+    :type codes: dict(str -> array)
+
+    :param use_numpy: True to use NumPy, False to use the array module,
+        None to use NumPy only if it's installed.
+    :type use_numpy: bool | None
+
+    :returns: Arrays of base, temporal and environmental scores.
+    :rtype: CVSSScores
+    """
+    if _check_numpy(use_numpy):
+        return _score_numpy({
+            metric: numpy.asarray(codes[metric], numpy.intp)
+            for metric in CVSS.METRICS
+        })
+    return _score_python(codes)
+
+def score_vectors(vectors, environment = None, use_numpy = None):
+    """
+    Calculate the scores of many CVSS vectors.
+
+    The results are the same as the CVSS class gives, as numbers. Each
+    distinct vector is only parsed and scored once.
+
+    :param vectors: CVSS vectors.
+    :type vectors: iterable(str)
+
+    :param environment: Optional CVSS vector with metrics that override
+        the ones in every vector, for example the environmental metrics.
+    :type environment: str | None
+
+    :param use_numpy: True to use NumPy, False to use the array module,
+        None to use NumPy only if it's installed.
+    :type use_numpy: bool | None
+
+    :returns: Arrays of base, temporal and environmental scores.
+    :rtype: CVSSScores
+
+    :raises ValueError: Invalid CVSS vector.
+    """
+    use_numpy = _check_numpy(use_numpy)
+    rows, inverse = _unique_codes(vectors, environment)
+    codes = {
+        metric: array("b", (row[i] for row in rows))
+        for i, metric in enumerate(CVSS.METRICS)
+    }
+    scores = score_codes(codes, use_numpy)
+    if use_numpy:
+        inverse = numpy.frombuffer(inverse, numpy.intc)
+        return CVSSScores(*[column[inverse] for column in scores])
+    return CVSSScores(*[
+        array("d", map(column.__getitem__, inverse)) for column in scores
+    ])
+
+#------------------------------------------------------------------------------
+# CVSS v3.
+
+# Versions of CVSS v3 supported, the integer codes index them.
+CVSS3_VERSIONS = ("3.0", "3.1")
+
+def _roundup(value):
+    """
+    Round up to one decimal, as defined in CVSS v3.1. It's used for v3.0
+    too: v3.0 defines it as a plain ceiling, which only differs because of
+    floating point errors (10 * 0.92 == 9.200000000000001 rounds up to 9.3).
+    """
+    int_input = int(round(value * 100000))
+    if int_input % 10000 == 0:
+        return int_input / 100000.0
+    return (int_input // 10000 + 1) / 10.0
+
+def _level3(score):
+    "Severity level of a CVSS v3 score."
+    score = float(score)
+    if score == 0.0:
+        return "NONE"
+    if score < 4.0:
+        return "LOW"
+    if score < 7.0:
+        return "MEDIUM"
+    if score < 9.0:
+        return "HIGH"
+    return "CRITICAL"
+
+class CVSS3(object):
+    """
+    CVSS v3.0 and v3.1 Calculator.
+
+    The vectors may begin with the version ("CVSS:3.1/..."), if they don't
+    the version doesn't change (v3.1 by default). Unlike in the CVSS v2
+    classes the metrics are the value names, not the numeric values,
+    since the weight of some of them depends on the scope.
+    """
+
+    __metaclass__ = cvss_metaclass
+
+    METRICS = (
+        "AV", "AC", "PR", "UI", "S",
+        "C", "I", "A",
+        "E", "RL", "RC",
+        "CR", "IR", "AR",
+        "MAV", "MAC", "MPR", "MUI", "MS",
+        "MC", "MI", "MA",
+    )
+
+    ADJACENT_NETWORK = "A"
+    CHANGED = "C"
+    CONFIRMED = "C"
+    FUNCTIONAL = "F"
+    HIGH = "H"
+    LOCAL = "L"
+    LOW = "L"
+    MEDIUM = "M"
+    NETWORK = "N"
+    NONE = "N"
+    NOT_DEFINED = "X"
+    OFFICIAL_FIX = "O"
+    PHYSICAL = "P"
+    PROOF_OF_CONCEPT = "P"
+    REASONABLE = "R"
+    REQUIRED = "R"
+    TEMPORARY_FIX = "T"
+    UNAVAILABLE = "U"
+    UNCHANGED = "U"
+    UNKNOWN = "U"
+    UNPROVEN = "U"
+    WORKAROUND = "W"
+
+    AV_SCORE = {
+        NETWORK: 0.85,
+        ADJACENT_NETWORK: 0.62,
+        LOCAL: 0.55,
+        PHYSICAL: 0.2,
+    }
+
+    AC_SCORE = {
+        LOW: 0.77,
+        HIGH: 0.44,
+    }
+
+    PR_SCORE = {
+        NONE: 0.85,
+        LOW: 0.62,
+        HIGH: 0.27,
+    }
+
+    # Privileges Required weighs more when the scope changes.
+    PR_CHANGED_SCORE = {
+        NONE: 0.85,
+        LOW: 0.68,
+        HIGH: 0.5,
+    }
+
+    UI_SCORE = {
+        NONE: 0.85,
+        REQUIRED: 0.62,
+    }
+
+    C_SCORE = {
+        HIGH: 0.56,
+        LOW: 0.22,
+        NONE: 0.0,
+    }
+    I_SCORE = C_SCORE
+    A_SCORE = C_SCORE
+
+    E_SCORE = {
+        NOT_DEFINED: 1.0,
+        HIGH: 1.0,
+        FUNCTIONAL: 0.97,
+        PROOF_OF_CONCEPT: 0.94,
+        UNPROVEN: 0.91,
+    }
+
+    RL_SCORE = {
+        NOT_DEFINED: 1.0,
+        UNAVAILABLE: 1.0,
+        WORKAROUND: 0.97,
+        TEMPORARY_FIX: 0.96,
+        OFFICIAL_FIX: 0.95,
+    }
+
+    RC_SCORE = {
+        NOT_DEFINED: 1.0,
+        CONFIRMED: 1.0,
+        REASONABLE: 0.96,
+        UNKNOWN: 0.92,
+    }
+
+    CR_SCORE = {
+        NOT_DEFINED: 1.0,
+        HIGH: 1.5,
+        MEDIUM: 1.0,
+        LOW: 0.5,
+    }
+    IR_SCORE = CR_SCORE
+    AR_SCORE = CR_SCORE
+
+    # Value names of each metric, in the order of their integer codes.
+    # The modified base metrics use the code 0 for "not defined", and the
+    # codes of the base metric plus one for the rest.
+    VALUES = {
+        "AV": (NETWORK, ADJACENT_NETWORK, LOCAL, PHYSICAL),
+        "AC": (LOW, HIGH),
+        "PR": (NONE, LOW, HIGH),
+        "UI": (NONE, REQUIRED),
+        "S":  (UNCHANGED, CHANGED),
+        "C":  (HIGH, LOW, NONE),
+        "I":  (HIGH, LOW, NONE),
+        "A":  (HIGH, LOW, NONE),
+        "E":  (NOT_DEFINED, HIGH, FUNCTIONAL, PROOF_OF_CONCEPT, UNPROVEN),
+        "RL": (NOT_DEFINED, UNAVAILABLE, WORKAROUND, TEMPORARY_FIX,
+               OFFICIAL_FIX),
+        "RC": (NOT_DEFINED, CONFIRMED, REASONABLE, UNKNOWN),
+        "CR": (NOT_DEFINED, HIGH, MEDIUM, LOW),
+        "IR": (NOT_DEFINED, HIGH, MEDIUM, LOW),
+        "AR": (NOT_DEFINED, HIGH, MEDIUM, LOW),
+    }
+    for _m in METRICS[:8]:
+        VALUES["M" + _m] = (NOT_DEFINED,) + VALUES[_m]
+    del _m
+
+    def __init__(self, vector = None):
+        self.__version = len(CVSS3_VERSIONS) - 1
+        self.__codes = [0] * len(self.METRICS)
+        self.vector = "AV:N/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:N"
+        if vector:
+            self.vector = vector
+
+    @property
+    def version(self):
+        return CVSS3_VERSIONS[self.__version]
+
+    @version.setter
+    def version(self, version):
+        try:
+            self.__version = CVSS3_VERSIONS.index(version)
+        except ValueError:
+            raise ValueError("Invalid CVSS version: %r" % (version,))
+
+    def get_metric(self, metric):
+        return self.VALUES[metric][self.__codes[self.METRICS.index(metric)]]
+
+    def set_metric(self, metric, value):
+        try:
+            index = self.METRICS.index(metric)
+        except ValueError:
+            raise ValueError("Invalid metric: %r" % (metric,))
+        try:
+            self.__codes[index] = self.VALUES[metric].index(value)
+        except ValueError:
+            raise ValueError("Invalid %s value: %r" % (metric, value))
+
+    def get_codes(self):
+        """
+        Get the integer codes of the version and the metrics, as in
+        CVSS3_FIELDS.
+
+        :rtype: tuple(int)
+        """
+        return (self.__version,) + tuple(self.__codes)
+
+    @property
+    def vector(self):
+        vector = ["CVSS:" + self.version]
+        for i, metric in enumerate(self.METRICS):
+            code = self.__codes[i]
+            if i < 8 or code != 0:
+                vector.append("%s:%s" % (metric, self.VALUES[metric][code]))
+        return "/".join(vector)
+
+    @vector.setter
+    def vector(self, vector):
+        old_version = self.__version
+        old_codes = list(self.__codes)
+        try:
+            for metric, value in _split_vector(vector):
+                if metric == "CVSS":
+                    self.version = value
+                else:
+                    self.set_metric(metric, value)
+        except Exception:
+            self.__version = old_version
+            self.__codes = old_codes
+            raise ValueError("Invalid CVSS v3 vector: %r" % (vector,))
+
+    @property
+    def base_vector(self):
+        return "/".join(self.vector.split("/")[:9])
+
+    def _scores(self):
+        return _cvss3_scores(self.get_codes())
+
+    @property
+    def impact(self):
+        return self._scores()[0]
+
+    @property
+    def base_exploitability(self):
+        return self._scores()[1]
+
+    @property
+    def base_score(self):
+        return self._scores()[2]
+
+    @property
+    def temporal_score(self):
+        return self._scores()[3]
+
+    @property
+    def modified_impact(self):
+        return self._scores()[4]
+
+    @property
+    def modified_exploitability(self):
+        return self._scores()[5]
+
+    @property
+    def environmental_score(self):
+        return self._scores()[6]
+
+    score = environmental_score
+
+    @property
+    def level(self):
+        return _level3(self.score)
+
+    def __str__(self):
+        return "%s: %s [%s]" % (self.score, self.level.title(), self.vector)
+
+    def __repr__(self):
+        return "<%s score=%s vector=%s>" % \
+               (self.__class__.__name__, self.score, self.vector)
+
+CVSS3.attack_vector = CVSS3.AV
+CVSS3.attack_complexity = CVSS3.AC
+CVSS3.privileges_required = CVSS3.PR
+CVSS3.user_interaction = CVSS3.UI
+CVSS3.scope = CVSS3.S
+CVSS3.confidentiality = CVSS3.C
+CVSS3.integrity = CVSS3.I
+CVSS3.availability = CVSS3.A
+CVSS3.exploit_code_maturity = CVSS3.E
+CVSS3.remediation_level = CVSS3.RL
+CVSS3.report_confidence = CVSS3.RC
+CVSS3.confidentiality_requirement = CVSS3.CR
+CVSS3.integrity_requirement = CVSS3.IR
+CVSS3.availability_requirement = CVSS3.AR
+
+# Fields of the CVSS v3 code tuples: the version and the metrics.
+CVSS3_FIELDS = ("CVSS",) + CVSS3.METRICS
+
+# Integer code of each value name, for each field.
+CVSS3_CODES = {
+    metric: {name: code for code, name in enumerate(names)}
+    for metric, names in CVSS3.VALUES.iteritems()
+}
+CVSS3_CODES["CVSS"] = {
+    version: code for code, version in enumerate(CVSS3_VERSIONS)
+}
+
+# Default codes for the fields missing in a vector, as in CVSS3().
+CVSS3_DEFAULTS = CVSS3().get_codes()
+
+def _parse_vector3(vector):
+    """
+    Parse a CVSS v3 vector into field indexes and codes, as in CVSS3_FIELDS,
+    with the same rules as the CVSS3.vector setter.
+    """
+    try:
+        return tuple(
+            (CVSS3_FIELDS.index(metric), CVSS3_CODES[metric][value])
+            for metric, value in _split_vector(vector)
+        )
+    except Exception:
+        raise ValueError("Invalid CVSS v3 vector: %r" % (vector,))
+
+# Numeric values of each metric, indexed by code. The modified base metrics
+# are resolved to base metric codes before looking them up.
+CVSS3_WEIGHTS = {
+    metric: tuple(
+        getattr(CVSS3, metric + "_SCORE")[name]
+        for name in CVSS3.VALUES[metric]
+    )
+    for metric in CVSS3.METRICS
+    if hasattr(CVSS3, metric + "_SCORE")
+}
+CVSS3_WEIGHTS["PR_CHANGED"] = tuple(
+    CVSS3.PR_CHANGED_SCORE[name] for name in CVSS3.VALUES["PR"]
+)
+
+# Maximum number of scored code tuples to keep in the cache.
+CVSS3_CACHE_SIZE = 65536
+
+_cvss3_cache = {}
+def _cvss3_scores(row):
+    """
+    Scores of a single CVSS v3 vector, from the codes of its fields.
+    Results are cached.
+
+    :returns: Impact, exploitability, base score, temporal score, modified
+        impact, modified exploitability, environmental score. The scores
+        are strings with one decimal, as in the CVSS v2 classes.
+    :rtype: tuple
+    """
+    try:
+        return _cvss3_cache[row]
+    except KeyError:
+        pass
+    (version, AV, AC, PR, UI, S, C, I, A, E, RL, RC, CR, IR, AR,
+     MAV, MAC, MPR, MUI, MS, MC, MI, MA) = row
+    w = CVSS3_WEIGHTS
+
+    # The modified base metrics default to the base metrics.
+    MAV = AV if MAV == 0 else MAV - 1
+    MAC = AC if MAC == 0 else MAC - 1
+    MPR = PR if MPR == 0 else MPR - 1
+    MUI = UI if MUI == 0 else MUI - 1
+    MS  = S  if MS  == 0 else MS  - 1
+    MC  = C  if MC  == 0 else MC  - 1
+    MI  = I  if MI  == 0 else MI  - 1
+    MA  = A  if MA  == 0 else MA  - 1
+    E  = w["E"][E]
+    RL = w["RL"][RL]
+    RC = w["RC"][RC]
+
+    # Base score.
+    changed = S == 1
+    C, I, A = w["C"][C], w["I"][I], w["A"][A]
+    iss = 1 - ((1 - C) * (1 - I) * (1 - A))
+    if changed:
+        impact = 7.52 * (iss - 0.029) - 3.25 * (iss - 0.02) ** 15
+    else:
+        impact = 6.42 * iss
+    exploitability = 8.22 * w["AV"][AV] * w["AC"][AC] * \
+        w["PR_CHANGED" if changed else "PR"][PR] * w["UI"][UI]
+    if impact <= 0:
+        base = 0.0
+    elif changed:
+        base = _roundup(min(1.08 * (impact + exploitability), 10))
+    else:
+        base = _roundup(min(impact + exploitability, 10))
+
+    # Temporal score.
+    temporal = _roundup(base * E * RL * RC)
+
+    # Environmental score.
+    changed = MS == 1
+    MC, MI, MA = w["C"][MC], w["I"][MI], w["A"][MA]
+    miss = min(1 - (
+        (1 - w["CR"][CR] * MC) * (1 - w["IR"][IR] * MI) * (1 - w["AR"][AR] * MA)
+    ), 0.915)
+    if not changed:
+        modified_impact = 6.42 * miss
+    elif version == 0:
+        modified_impact = 7.52 * (miss - 0.029) - 3.25 * (miss - 0.02) ** 15
+    else:
+        modified_impact = 7.52 * (miss - 0.029) - \
+            3.25 * (miss * 0.9731 - 0.02) ** 13
+    modified_exploitability = 8.22 * w["AV"][MAV] * w["AC"][MAC] * \
+        w["PR_CHANGED" if changed else "PR"][MPR] * w["UI"][MUI]
+    if modified_impact <= 0:
+        environmental = 0.0
+    elif changed:
+        environmental = _roundup(_roundup(min(
+            1.08 * (modified_impact + modified_exploitability), 10
+        )) * E * RL * RC)
+    else:
+        environmental = _roundup(_roundup(min(
+            modified_impact + modified_exploitability, 10
+        )) * E * RL * RC)
+
+    scores = (
+        impact, exploitability, "%.1f" % base, "%.1f" % temporal,
+        modified_impact, modified_exploitability, "%.1f" % environmental,
+    )
+    if len(_cvss3_cache) >= CVSS3_CACHE_SIZE:
+        _cvss3_cache.clear()
+    _cvss3_cache[row] = scores
+    return scores
+
+def _roundup_numpy(values):
+    """
+    Round up scores exactly like _roundup() does.
+    Only the distinct values are rounded.
+    """
+    unique, inverse = numpy.unique(values, return_inverse = True)
+    rounded = numpy.array([_roundup(x) for x in unique], numpy.float64)
+    return rounded[inverse]
+
+def _score3_numpy(rows):
+    table = numpy.array(rows, numpy.intp).reshape(-1, len(CVSS3_FIELDS))
+    columns = dict(zip(CVSS3_FIELDS, table.T))
+    version = columns["CVSS"]
+
+    def weight(metric, codes):
+        return numpy.array(CVSS3_WEIGHTS[metric], numpy.float64)[codes]
+
+    def modified(metric):
+        codes = columns["M" + metric]
+        return numpy.where(codes == 0, columns[metric], codes - 1)
+
+    def exploitability(AV, AC, PR, UI, changed):
+        PR = numpy.where(
+            changed, weight("PR_CHANGED", PR), weight("PR", PR))
+        return 8.22 * weight("AV", AV) * weight("AC", AC) * PR * \
+            weight("UI", UI)
+
+    E  = weight("E", columns["E"])
+    RL = weight("RL", columns["RL"])
+    RC = weight("RC", columns["RC"])
+
+    # Base score.
+    changed = columns["S"] == 1
+    C = weight("C", columns["C"])
+    I = weight("I", columns["I"])
+    A = weight("A", columns["A"])
+    iss = 1 - ((1 - C) * (1 - I) * (1 - A))
+    impact = numpy.where(
+        changed,
+        7.52 * (iss - 0.029) - 3.25 * (iss - 0.02) ** 15,
+        6.42 * iss,
+    )
+    base_exploitability = exploitability(
+        columns["AV"], columns["AC"], columns["PR"], columns["UI"], changed)
+    base = numpy.where(
+        impact <= 0,
+        0.0,
+        _roundup_numpy(numpy.where(
+            changed,
+            numpy.minimum(1.08 * (impact + base_exploitability), 10),
+            numpy.minimum(impact + base_exploitability, 10),
+        )),
+    )
+
+    # Temporal score.
+    temporal = _roundup_numpy(base * E * RL * RC)
+
+    # Environmental score.
+    changed = modified("S") == 1
+    MC = weight("C", modified("C"))
+    MI = weight("I", modified("I"))
+    MA = weight("A", modified("A"))
+    miss = numpy.minimum(1 - (
+        (1 - weight("CR", columns["CR"]) * MC) *
+        (1 - weight("IR", columns["IR"]) * MI) *
+        (1 - weight("AR", columns["AR"]) * MA)
+    ), 0.915)
+    modified_impact = numpy.where(
+        changed,
+        numpy.where(
+            version == 0,
+            7.52 * (miss - 0.029) - 3.25 * (miss - 0.02) ** 15,
+            7.52 * (miss - 0.029) - 3.25 * (miss * 0.9731 - 0.02) ** 13,
+        ),
+        6.42 * miss,
+    )
+    modified_exploitability = exploitability(
+        modified("AV"), modified("AC"), modified("PR"), modified("UI"),
+        changed)
+    environmental = numpy.where(
+        modified_impact <= 0,
+        0.0,
+        _roundup_numpy(_roundup_numpy(numpy.where(
+            changed,
+            numpy.minimum(
+                1.08 * (modified_impact + modified_exploitability), 10),
+            numpy.minimum(modified_impact + modified_exploitability, 10),
+        )) * E * RL * RC),
+    )
+
+    return CVSSScores(base, temporal, environmental)
+
+def score_vectors3(vectors, environment = None, use_numpy = None):
+    """
+    Calculate the scores of many CVSS v3 vectors.
+
+    The results are the same as the CVSS3 class gives, as numbers. Each
+    distinct vector is only parsed and scored once.
+
+    :param vectors: CVSS v3 vectors.
+    :type vectors: iterable(str)
+
+    :param environment: Optional CVSS v3 vector with metrics that override
+        the ones in every vector, for example the environmental metrics.
+    :type environment: str | None
+
+    :param use_numpy: True to use NumPy, False to use the array module,
+        None to use NumPy only if it's installed.
+    :type use_numpy: bool | None
+
+    :returns: Arrays of base, temporal and environmental scores.
+    :rtype: CVSSScores
+
+    :raises ValueError: Invalid CVSS vector.
+    """
+    use_numpy = _check_numpy(use_numpy)
+    rows, inverse = _unique_codes(
+        vectors, environment, _parse_vector3, CVSS3_DEFAULTS)
+    if use_numpy:
+        scores = _score3_numpy(rows)
+        inverse = numpy.frombuffer(inverse, numpy.intc)
+        return CVSSScores(*[column[inverse] for column in scores])
+    scores = [_cvss3_scores(row) for row in rows]
+    return CVSSScores(*[
+        array("d", map([float(x[j]) for x in scores].__getitem__, inverse))
+        for j in (2, 3, 6)
+    ])
+
 def test():
 
     # Unit test based on Wikipedia examples.
@@ -367,17 +1417,99 @@ def test():
     assert cvss.environmental_score == "7.8", cvss.environmental_score
     assert ("%.1f" % cvss.adjusted_impact) == "8.0", cvss.adjusted_impact
     assert cvss.score == "7.8", cvss.score
+    assert cvss.level == "HIGH", cvss.level
+
+    # The precomputed tables must give the same results as the formulas.
+    for vector in (
+        "AV:N/AC:L/Au:N/C:P/I:P/A:C/E:POC/RL:TF/RC:UC/CDP:MH/TD:H/CR:H/IR:H/AR:L",
+        "AV:L/AC:H/Au:M/C:N/I:N/A:N/E:U/RL:OF/RC:UR/CDP:L/TD:L/CR:L/IR:L/AR:L",
+    ):
+        cvss = CVSS(vector)
+        with_tables = [getattr(cvss, name) for name in (
+            "base_exploitability", "impact", "f_impact", "base_score",
+            "temporal_score", "adjusted_impact", "adjusted_base_score",
+            "adjusted_temporal_score", "environmental_score", "level")]
+        cvss.USE_TABLES = False
+        with_formulas = [getattr(cvss, name) for name in (
+            "base_exploitability", "impact", "f_impact", "base_score",
+            "temporal_score", "adjusted_impact", "adjusted_base_score",
+            "adjusted_temporal_score", "environmental_score", "level")]
+        assert with_tables == with_formulas, (with_tables, with_formulas)
+
+    # The batch scoring must give the same results.
+    vectors = [
+        "AV:N/AC:L/Au:N/C:P/I:P/A:C",
+        "AV:N/AC:L/Au:N/C:P/I:P/A:C/E:POC/RL:U/RC:UC",
+        "C:P/I:P/A:C/E:POC/RL:OF/RC:C",
+        "AV:N/AC:L/Au:N/C:P/I:P/A:C/E:POC/RL:TF/RC:UC/CDP:MH/TD:H/CR:H/IR:H/AR:L",
+        "AV:L/AC:H/Au:M/C:N/I:N/A:N",
+    ]
+    expected = [CVSS(vector) for vector in vectors]
+    for use_numpy in ((False, True) if numpy is not None else (False,)):
+        scores = score_vectors(vectors, use_numpy = use_numpy)
+        for i, cvss in enumerate(expected):
+            assert scores.base[i] == float(cvss.base_score), scores.base[i]
+            assert scores.temporal[i] == float(cvss.temporal_score), \
+                scores.temporal[i]
+            assert scores.environmental[i] == \
+                float(cvss.environmental_score), scores.environmental[i]
+
+    # CVSS v3, examples from the NVD and the specification.
+    for vector, base_score in (
+        ("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H", "9.8"),
+        ("CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H", "10.0"),
+        ("CVSS:3.1/AV:N/AC:L/PR:N/UI:R/S:C/C:L/I:L/A:N", "6.1"),
+        ("CVSS:3.1/AV:L/AC:L/PR:L/UI:N/S:U/C:H/I:H/A:H", "7.8"),
+        ("CVSS:3.1/AV:N/AC:H/PR:N/UI:N/S:U/C:H/I:N/A:N", "5.9"),
+        ("CVSS:3.1/AV:N/AC:L/PR:L/UI:N/S:C/C:L/I:L/A:N", "6.4"),
+        ("CVSS:3.0/AV:N/AC:L/PR:H/UI:N/S:U/C:H/I:H/A:H", "7.2"),
+        ("CVSS:3.0/AV:P/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:N", "0.0"),
+    ):
+        cvss = CVSS3(vector)
+        assert cvss.base_score == base_score, (vector, cvss.base_score)
+        assert cvss.score == base_score, (vector, cvss.score)
+        assert cvss.vector == vector, cvss.vector
+    cvss = CVSS3("AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H/E:P/RL:O/RC:C")
+    assert cvss.version == "3.1", cvss.version
+    assert cvss.temporal_score == "8.8", cvss.temporal_score
+    assert cvss.level == "HIGH", cvss.level
+    cvss.vector = "CR:H/IR:H/AR:H/MS:C"
+    assert cvss.environmental_score == "9.0", cvss.environmental_score
+    assert cvss.base_vector == \
+        "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H", cvss.base_vector
+    try:
+        cvss.vector = "CVSS:3.1/AV:X"
+        assert False
+    except ValueError:
+        pass
+    assert cvss.environmental_score == "9.0", cvss.environmental_score
+    vectors = [
+        "CVSS:3.1/AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H/E:P/RL:O/RC:C",
+        "CVSS:3.0/AV:N/AC:L/PR:L/UI:N/S:C/C:L/I:L/A:N/MS:U/MPR:H",
+        "CVSS:3.1/AV:A/AC:H/PR:H/UI:R/S:C/C:H/I:L/A:N/CR:L/MAV:N",
+        "CVSS:3.0/AV:P/AC:L/PR:N/UI:N/S:U/C:N/I:N/A:N",
+    ]
+    expected = [CVSS3(vector) for vector in vectors]
+    for use_numpy in ((False, True) if numpy is not None else (False,)):
+        scores = score_vectors3(vectors, use_numpy = use_numpy)
+        for i, cvss in enumerate(expected):
+            assert scores.base[i] == float(cvss.base_score), scores.base[i]
+            assert scores.temporal[i] == float(cvss.temporal_score), \
+                scores.temporal[i]
+            assert scores.environmental[i] == \
+                float(cvss.environmental_score), scores.environmental[i]
 
 if __name__ == "__main__":
     import sys
     argv = sys.argv[1:]
     if argv:
         for vector in argv:
+            if vector.startswith("CVSS:3"):
+                print(CVSS3(vector))
+                continue
             try:
                 print(CVSS_Base(vector))
             except ValueError:
                 print(CVSS(vector))
     else:
         test()
-
-# TODO add support for v3
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2013, Mario Vilas
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     * Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice,this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+File helpers shared by the other modules.
+"""
+
+import sys
+
+from os import rename
+
+
+# Flags of MoveFileEx() to replace files on Windows.
+_MOVEFILE_REPLACE_EXISTING = 0x1
+_MOVEFILE_WRITE_THROUGH    = 0x8
+
+
+def replace_file(src, dst):
+    """
+    Rename a file, replacing the destination if it exists.
+
+    On POSIX systems this is atomic, and processes that have the old file
+    open keep reading it. On Windows os.rename() can't replace files, so
+    MoveFileEx() is used instead, and it fails if any process has the old
+    file open or memory mapped.
+
+    :param src: Filename to rename.
+    :type src: str
+
+    :param dst: New filename.
+    :type dst: str
+
+    :raises OSError: The file couldn't be renamed.
+    """
+    if sys.platform != "win32":
+        rename(src, dst)
+        return
+    import ctypes
+    if isinstance(src, str):
+        src = src.decode(sys.getfilesystemencoding())
+    if isinstance(dst, str):
+        dst = dst.decode(sys.getfilesystemencoding())
+    if not ctypes.windll.kernel32.MoveFileExW(
+            src, dst, _MOVEFILE_REPLACE_EXISTING | _MOVEFILE_WRITE_THROUGH):
+        raise ctypes.WinError()
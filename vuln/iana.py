@@ -1,11 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-###############################################################################
-##                       AUTOMATICALLY GENERATED FILE                        ##
-##                                DO NOT EDIT                                ##
-###############################################################################
-
 # Copyright (c) 2014, Mario Vilas
 # All rights reserved.
 #
@@ -33,177 +28,872 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+"""
+IANA port numbers and service names.
+
+The registry is kept in a compact binary data file next to this module,
+which is memory mapped the first time it's queried. Besides the
+dictionary-like tables, IANARegistry has bulk port lookups, port ranges
+and service searches.
+
+Run this module, or call update(), to update the data file from the IANA
+website. The new file has the next version number and replaces the old
+one atomically, and running processes notice it and reopen it within
+RELOAD_INTERVAL seconds, or right away with reload_data().
+
+The data file begins with a magic string and a JSON header, followed by
+the sections the header points to: a table of service names (sorted,
+with an array of offsets to them) and, for each table in TABLES, a sorted
+array of keys (port numbers or service name indexes), an array of offsets
+into the values, and the values (service name indexes or port numbers).
+"""
+
 __all__ = [
     "port_to_services",     "service_to_ports",
     "tcp_port_to_services", "tcp_service_to_ports",
     "udp_port_to_services", "udp_service_to_ports",
+    "IANARegistry", "update", "reload_data",
 ]
 
-### DO NOT EDIT THIS LINE ###
-LAST_MODIFIED = 'Tue, 31 Dec 2013 20:00:27 GMT'
-port_to_services = {8192: ['spytechphone'], 1: ['tcpmux'], 2: ['compressnet'], 3: ['compressnet'], 32772: ['filenet-pa'], 5: ['rje'], 32774: ['filenet-re'], 7: ['echo'], 8200: ['trivnet1'], 9: ['discard'], 11: ['systat'], 8204: ['lm-perfworks'], 13: ['daytime'], 8206: ['lm-dta'], 8207: ['lm-sserver'], 8208: ['lm-webwatcher'], 17: ['qotd'], 18: ['msp'], 19: ['chargen'], 20: ['ftp-data'], 21: ['ftp'], 22: ['ssh'], 23: ['telnet'], 25: ['smtp'], 27: ['nsw-fe'], 29: ['msg-icp'], 31: ['msg-auth'], 33: ['dsp'], 17755: ['zigbee-ip'], 37: ['time'], 38: ['rap'], 39: ['rlp'], 41: ['graphics'], 42: ['name', 'nameserver'], 43: ['nicname'], 44: ['mpm-flags'], 45: ['mpm'], 46: ['mpm-snd'], 47: ['ni-ftp'], 48: ['auditd'], 49: ['tacacs'], 50: ['re-mail-ck'], 8243: ['synapse-nhttps'], 52: ['xns-time'], 53: ['domain'], 54: ['xns-ch'], 55: ['isi-gl'], 56: ['xns-auth'], 58: ['xns-mail'], 61: ['ni-mail'], 62: ['acas'], 63: ['whoispp'], 64: ['covia'], 65: ['tacacs-ds'], 66: ['sql-net'], 67: ['bootps'], 68: ['bootpc'], 69: ['tftp'], 70: ['gopher'], 71: ['netrjs-1'], 72: ['netrjs-2'], 73: ['netrjs-3'], 74: ['netrjs-4'], 76: ['deos'], 78: ['vettcp'], 79: ['finger'], 80: ['http'], 82: ['xfer'], 83: ['mit-ml-dev'], 84: ['ctf'], 85: ['mit-ml-dev'], 86: ['mfcobol'], 88: ['kerberos'], 89: ['su-mit-tg'], 90: ['dnsix'], 91: ['mit-dov'], 92: ['npp'], 93: ['dcp'], 94: ['objcall'], 95: ['supdup'], 96: ['dixie'], 97: ['swift-rvf'], 98: ['tacnews'], 99: ['metagram'], 8292: ['blp3'], 101: ['hostname'], 102: ['iso-tsap'], 103: ['gppitnp'], 104: ['acr-nema'], 105: ['csnet-ns', 'cso'], 106: ['3com-tsmux'], 107: ['rtelnet'], 108: ['snagas'], 109: ['pop2'], 110: ['pop3'], 111: ['sunrpc'], 112: ['mcidas'], 113: ['auth'], 115: ['sftp'], 116: ['ansanotify'], 117: ['uucp-path'], 118: ['sqlserv'], 119: ['nntp'], 120: ['cfdptkt'], 121: ['erpc'], 122: ['smakynet'], 123: ['ntp'], 124: ['ansatrader'], 125: ['locus-map'], 126: ['nxedit'], 127: ['locus-con'], 128: ['gss-xlicen'], 129: ['pwdgen'], 130: ['cisco-fna'], 131: ['cisco-tna'], 132: ['cisco-sys'], 133: ['statsrv'], 134: ['ingres-net'], 135: ['epmap'], 136: ['profile'], 137: ['netbios-ns'], 138: ['netbios-dgm'], 139: ['netbios-ssn'], 140: ['emfis-data'], 141: ['emfis-cntl'], 142: ['bl-idm'], 143: ['imap'], 144: ['uma'], 145: ['uaac'], 146: ['iso-tp0'], 147: ['iso-ip'], 148: ['jargon'], 149: ['aed-512'], 150: ['sql-net'], 151: ['hems'], 152: ['bftp'], 153: ['sgmp'], 154: ['netsc-prod'], 155: ['netsc-dev'], 156: ['sqlsrv'], 157: ['knet-cmp'], 158: ['pcmail-srv'], 159: ['nss-routing'], 160: ['sgmp-traps'], 161: ['snmp'], 162: ['snmptrap'], 163: ['cmip-man'], 164: ['cmip-agent'], 165: ['xns-courier'], 166: ['s-net'], 167: ['namp'], 168: ['rsvd'], 169: ['send'], 170: ['print-srv'], 171: ['multiplex'], 172: ['cl-1'], 173: ['xyplex-mux'], 174: ['mailq'], 175: ['vmnet'], 176: ['genrad-mux'], 177: ['xdmcp'], 178: ['nextstep'], 179: ['bgp'], 180: ['ris'], 181: ['unify'], 182: ['audit'], 183: ['ocbinder'], 184: ['ocserver'], 185: ['remote-kis'], 186: ['kis'], 187: ['aci'], 188: ['mumps'], 189: ['qft'], 190: ['gacp'], 191: ['prospero'], 192: ['osu-nms'], 193: ['srmp'], 194: ['irc'], 195: ['dn6-nlm-aud'], 196: ['dn6-smm-red'], 197: ['dls'], 198: ['dls-mon'], 199: ['smux'], 200: ['src'], 201: ['at-rtmp'], 202: ['at-nbp'], 203: ['at-3'], 204: ['at-echo'], 205: ['at-5'], 206: ['at-zis'], 207: ['at-7'], 208: ['at-8'], 209: ['qmtp'], 210: ['z39-50'], 211: ['914c-g'], 212: ['anet'], 213: ['ipx'], 214: ['vmpwscs'], 215: ['softpc'], 216: ['cailic'], 217: ['dbase'], 218: ['mpp'], 219: ['uarps'], 220: ['imap3'], 221: ['fln-spx'], 222: ['rsh-spx'], 223: ['cdc'], 224: ['masqdialer'], 8417: ['espeech-rtp'], 9595: ['pds'], 34378: ['p-net-local'], 8230: ['rexecj'], 27345: ['imagepump'], 9596: ['mercury-disc'], 9597: ['pd-admin'], 242: ['direct'], 243: ['sur-meas'], 244: ['inbusiness'], 245: ['link'], 246: ['dsp3270'], 247: ['subntbcst-tftp'], 248: ['bhfhs'], 8442: ['cybro-a-bus'], 8443: ['pcsync-https'], 8444: ['pcsync-http'], 256: ['rap'], 257: ['set'], 8450: ['npmp'], 259: ['esro-gen'], 260: ['openport'], 261: ['nsiiops'], 262: ['arcisdms'], 263: ['hdap'], 264: ['bgmp'], 265: ['x-bone-ctl'], 266: ['sst'], 267: ['td-service'], 268: ['td-replica'], 269: ['manet'], 10102: ['ezproxy-2'], 280: ['http-mgmt'], 281: ['personal-link'], 282: ['cableport-ax'], 283: ['rescap'], 284: ['corerjd'], 286: ['fxp'], 287: ['k-block'], 10103: ['ezrelay'], 308: ['novastorbakcup'], 309: ['entrusttime'], 310: ['bhmds'], 311: ['asip-webadmin'], 312: ['vslmp'], 313: ['magenta-logic'], 314: ['opalis-robot'], 315: ['dpsi'], 316: ['decauth'], 317: ['zannet'], 318: ['pkix-timestamp'], 319: ['ptp-event'], 320: ['ptp-general'], 321: ['pip'], 322: ['rtsps'], 12013: ['vipera-ssl'], 9612: ['streamcomm-ds'], 333: ['texar'], 10104: ['swdtp'], 8766: ['amcs'], 12345: ['italk'], 344: ['pdap'], 345: ['pawserv'], 346: ['zserv'], 347: ['fatserv'], 348: ['csi-sgwp'], 349: ['mftp'], 350: ['matip-type-a'], 351: ['bhoetty', 'matip-type-b'], 352: ['bhoedap4', 'dtag-ste-sb'], 353: ['ndsauth'], 354: ['bh611'], 355: ['datex-asn'], 356: ['cloanto-net-1'], 357: ['bhevent'], 358: ['shrinkwrap'], 359: ['nsrmp'], 360: ['scoi2odialog'], 361: ['semantix'], 362: ['srssend'], 363: ['rsvp-tunnel'], 364: ['aurora-cmgr'], 365: ['dtk'], 366: ['odmr'], 367: ['mortgageware'], 368: ['qbikgdp'], 369: ['rpc2portmap'], 370: ['codaauth2'], 371: ['clearcase'], 372: ['ulistproc'], 373: ['legent-1'], 374: ['legent-2'], 375: ['hassle'], 376: ['nip'], 377: ['tnetos'], 378: ['dsetos'], 379: ['is99c'], 380: ['is99s'], 381: ['hp-collector'], 382: ['hp-managed-node'], 383: ['hp-alarm-mgr'], 384: ['arns'], 385: ['ibm-app'], 386: ['asa'], 387: ['aurp'], 388: ['unidata-ldm'], 389: ['ldap'], 390: ['uis'], 391: ['synotics-relay'], 392: ['synotics-broker'], 393: ['meta5'], 394: ['embl-ndt'], 395: ['netcp'], 396: ['netware-ip'], 397: ['mptn'], 398: ['kryptolan'], 399: ['iso-tsap-c2'], 400: ['osb-sd'], 401: ['ups'], 402: ['genie'], 403: ['decap'], 404: ['nced'], 405: ['ncld'], 406: ['imsp'], 407: ['timbuktu'], 408: ['prm-sm'], 409: ['prm-nm'], 410: ['decladebug'], 411: ['rmt'], 412: ['synoptics-trap'], 413: ['smsp'], 414: ['infoseek'], 415: ['bnet'], 416: ['silverplatter'], 417: ['onmux'], 418: ['hyper-g'], 419: ['ariel1'], 420: ['smpte'], 421: ['ariel2'], 422: ['ariel3'], 423: ['opc-job-start'], 424: ['opc-job-track'], 425: ['icad-el'], 426: ['smartsdp'], 427: ['svrloc'], 428: ['ocs-cmu'], 429: ['ocs-amu'], 430: ['utmpsd'], 431: ['utmpcd'], 432: ['iasd'], 433: ['nnsp'], 434: ['mobileip-agent'], 435: ['mobilip-mn'], 436: ['dna-cml'], 437: ['comscm'], 438: ['dsfgw'], 439: ['dasp'], 440: ['sgcp'], 441: ['decvms-sysmgt'], 442: ['cvc-hostd'], 443: ['https'], 444: ['snpp'], 445: ['microsoft-ds'], 446: ['ddm-rdb'], 447: ['ddm-dfm'], 448: ['ddm-ssl'], 449: ['as-servermap'], 450: ['tserver'], 451: ['sfs-smp-net'], 452: ['sfs-config'], 453: ['creativeserver'], 454: ['contentserver'], 455: ['creativepartnr'], 457: ['scohelp'], 458: ['appleqtc'], 459: ['ampr-rcmd'], 460: ['skronk'], 461: ['datasurfsrv'], 462: ['datasurfsrvsec'], 463: ['alpes'], 464: ['kpasswd'], 11000: ['irisa'], 466: ['digital-vrc'], 467: ['mylex-mapd'], 468: ['photuris'], 469: ['rcp'], 470: ['scx-proxy'], 471: ['mondex'], 472: ['ljk-login'], 473: ['hybrid-pop'], 475: ['tcpnethaspsrv'], 476: ['tn-tl-fd1'], 477: ['ss7ns'], 478: ['spsc'], 479: ['iafserver'], 480: ['iafdbase'], 481: ['ph'], 482: ['bgs-nsi'], 483: ['ulpnet'], 484: ['integra-sme'], 485: ['powerburst'], 486: ['avian'], 487: ['saft'], 488: ['gss-http'], 489: ['nest-protocol'], 490: ['micom-pfs'], 491: ['go-login'], 492: ['ticf-1'], 493: ['ticf-2'], 494: ['pov-ray'], 495: ['intecourier'], 496: ['pim-rp-disc'], 497: ['retrospect'], 498: ['siam'], 499: ['iso-ill'], 500: ['isakmp'], 501: ['stmf'], 502: ['asa-appl-proto'], 503: ['intrinsa'], 504: ['citadel'], 505: ['mailbox-lm'], 506: ['ohimsrv'], 507: ['crs'], 508: ['xvttp'], 509: ['snare'], 510: ['fcp'], 511: ['passgo'], 11201: ['smsqp'], 515: ['printer'], 516: ['videotex'], 517: ['talk'], 518: ['ntalk'], 519: ['utime'], 521: ['ripng'], 522: ['ulp'], 523: ['ibm-db2'], 524: ['ncp'], 525: ['timed'], 526: ['tempo'], 527: ['stx'], 528: ['custix'], 529: ['irc-serv'], 530: ['courier'], 531: ['conference'], 532: ['netnews'], 533: ['netwall'], 534: ['windream'], 535: ['iiop'], 536: ['opalis-rdv'], 537: ['nmsp'], 538: ['gdomap'], 539: ['apertus-ldp'], 540: ['uucp'], 541: ['uucp-rlogin'], 542: ['commerce'], 543: ['klogin'], 544: ['kshell'], 545: ['appleqtcsrvr'], 546: ['dhcpv6-client'], 547: ['dhcpv6-server'], 548: ['afpovertcp'], 549: ['idfp'], 550: ['new-rwho'], 551: ['cybercash'], 552: ['devshr-nts'], 553: ['pirp'], 554: ['rtsp'], 555: ['dsf'], 556: ['remotefs'], 557: ['openvms-sysipc'], 558: ['sdnskmp'], 559: ['teedtap'], 560: ['rmonitor'], 561: ['monitor'], 562: ['chshell'], 563: ['nntps'], 564: ['9pfs'], 565: ['whoami'], 566: ['streettalk'], 567: ['banyan-rpc'], 568: ['ms-shuttle'], 569: ['ms-rome'], 570: ['meter'], 571: ['meter'], 572: ['sonar'], 573: ['banyan-vip'], 574: ['ftp-agent'], 575: ['vemmi'], 576: ['ipcd'], 577: ['vnas'], 578: ['ipdd'], 579: ['decbsrv'], 580: ['sntp-heartbeat'], 581: ['bdp'], 582: ['scc-security'], 583: ['philips-vc'], 584: ['keyserver'], 586: ['password-chg'], 587: ['submission'], 588: ['cal'], 589: ['eyelink'], 590: ['tns-cml'], 591: ['http-alt'], 592: ['eudora-set'], 593: ['http-rpc-epmap'], 594: ['tpip'], 595: ['cab-protocol'], 596: ['smsd'], 597: ['ptcnameservice'], 598: ['sco-websrvrmg3'], 599: ['acp'], 600: ['ipcserver'], 601: ['syslog-conn'], 602: ['xmlrpc-beep'], 603: ['idxp'], 604: ['tunnel'], 605: ['soap-beep'], 606: ['urm'], 607: ['nqs'], 608: ['sift-uft'], 609: ['npmp-trap'], 610: ['npmp-local'], 611: ['npmp-gui'], 612: ['hmmp-ind'], 613: ['hmmp-op'], 614: ['sshell'], 615: ['sco-inetmgr'], 616: ['sco-sysmgr'], 617: ['sco-dtmgr'], 618: ['dei-icda'], 619: ['compaq-evm'], 620: ['sco-websrvrmgr'], 621: ['escp-ip'], 622: ['collaborator'], 17007: ['isode-dua'], 624: ['cryptoadmin'], 625: ['dec-dlm'], 626: ['asia'], 627: ['passgo-tivoli'], 628: ['qmqp'], 629: ['3com-amp3'], 630: ['rda'], 631: ['ipp'], 632: ['bmpp'], 633: ['servstat'], 634: ['ginad'], 635: ['rlzdbase'], 636: ['ldaps'], 637: ['lanserver'], 638: ['mcns-sec'], 639: ['msdp'], 640: ['entrust-sps'], 641: ['repcmd'], 642: ['esro-emsdp'], 643: ['sanity'], 644: ['dwr'], 645: ['pssc'], 646: ['ldp'], 647: ['dhcp-failover'], 648: ['rrp'], 649: ['cadview-3d'], 650: ['obex'], 651: ['ieee-mms'], 652: ['hello-port'], 653: ['repscmd'], 654: ['aodv'], 655: ['tinc'], 656: ['spmp'], 657: ['rmc'], 658: ['tenfold'], 9667: ['xmms2'], 660: ['mac-srvr-admin'], 661: ['hap'], 662: ['pftp'], 663: ['purenoise'], 665: ['sun-dr'], 666: ['doom', 'mdqs'], 667: ['disclose'], 668: ['mecomm'], 669: ['meregister'], 670: ['vacdsm-sws'], 671: ['vacdsm-app'], 672: ['vpps-qua'], 673: ['cimplex'], 674: ['acap'], 675: ['dctp'], 676: ['vpps-via'], 677: ['vpp'], 678: ['ggf-ncp'], 679: ['mrm'], 680: ['entrust-aaas'], 681: ['entrust-aams'], 682: ['xfr'], 683: ['corba-iiop'], 684: ['corba-iiop-ssl'], 685: ['mdc-portmapper'], 686: ['hcp-wismar'], 687: ['asipregistry'], 688: ['realm-rusd'], 689: ['nmap'], 690: ['vatp'], 691: ['msexch-routing'], 692: ['hyperwave-isp'], 693: ['connendp'], 694: ['ha-cluster'], 695: ['ieee-mms-ssl'], 696: ['rushd'], 697: ['uuidgen'], 698: ['olsr'], 699: ['accessnetwork'], 700: ['epp'], 701: ['lmp'], 702: ['iris-beep'], 704: ['elcsd'], 705: ['agentx'], 706: ['silc'], 707: ['borland-dsj'], 8900: ['jmb-cds1'], 709: ['entrust-kmsh'], 710: ['entrust-ash'], 711: ['cisco-tdp'], 712: ['tbrpf'], 713: ['iris-xpc'], 714: ['iris-xpcs'], 715: ['iris-lwz'], 18881: ['infotos'], 8910: ['manyone-http'], 8911: ['manyone-xml'], 8912: ['wcbackup'], 8913: ['dragonfly'], 11208: ['wifree'], 12007: ['accuracer'], 10117: ['iqrm'], 729: ['netviewdm1'], 730: ['netviewdm2'], 731: ['netviewdm3'], 21847: ['netspeak-cs'], 741: ['netgw'], 742: ['netrcs'], 744: ['flexlm'], 747: ['fujitsu-dev'], 748: ['ris-cm'], 749: ['kerberos-adm'], 12300: ['linogridengine'], 751: ['pump'], 752: ['qrh'], 753: ['rrh'], 754: ['tell'], 758: ['nlogin'], 759: ['con'], 760: ['ns'], 761: ['rxe'], 762: ['quotad'], 763: ['cycleserv'], 764: ['omserv'], 765: ['webster'], 767: ['phonebook'], 21848: ['netspeak-acd'], 769: ['vid'], 770: ['cadlock'], 771: ['rtip'], 772: ['cycleserv2'], 8321: ['tnp'], 776: ['wpages'], 777: ['multiling-http'], 41795: ['crestron-ctp'], 780: ['wpgs'], 8989: ['sunwebadmins'], 8990: ['http-wmap'], 8991: ['https-wmap'], 800: ['mdbs-daemon'], 801: ['device'], 9951: ['apc-9951'], 8999: ['bctp'], 9000: ['cslistener'], 9001: ['etlservicemgr'], 810: ['fcp-udp'], 27442: ['jesmsjc'], 11211: ['memcache'], 9009: ['pichat'], 26487: ['exoconfig'], 9694: ['client-wakeup'], 9695: ['ccnx'], 828: ['itm-mcell-s'], 829: ['pkix-3-ca-ra'], 830: ['netconf-ssh'], 831: ['netconf-beep'], 832: ['netconfsoaphttp'], 833: ['netconfsoapbeep'], 9026: ['swa-4'], 17219: ['chipper'], 17221: ['avdecc'], 847: ['dhcp-failover2'], 848: ['gdoi'], 17234: ['integrius-stp'], 17235: ['ssh-mgmt'], 9700: ['board-roar'], 860: ['iscsi'], 861: ['owamp-control'], 862: ['twamp-control'], 9952: ['apc-9952'], 873: ['rsync'], 26489: ['exonet'], 886: ['iclcnet-locate'], 887: ['iclcnet-svinfo'], 888: ['accessbuilder'], 9084: ['aurora'], 9085: ['ibm-rsyscon'], 9086: ['net2display'], 9087: ['classic'], 9088: ['sqlexec'], 9089: ['sqlexec-ssl'], 9090: ['websm'], 9091: ['xmltec-xmlmail'], 900: ['omginitialrefs'], 901: ['smpnameres'], 902: ['ideafarm-door'], 903: ['ideafarm-panic'], 21849: ['netspeak-cps'], 41111: ['fs-qos'], 9100: ['hp-pdl-datastr', 'pdl-datastream'], 9101: ['bacula-dir'], 910: ['kink'], 911: ['xact-backup'], 912: ['apex-mesh'], 913: ['apex-edge'], 19398: ['mtrgtrans'], 9119: ['mxit'], 22000: ['snapenetio'], 9131: ['dddp'], 22003: ['optohost003'], 8351: ['server-find'], 9990: ['osm-appsrvr'], 9160: ['apani1'], 9161: ['apani2'], 9162: ['apani3'], 9163: ['apani4'], 9164: ['apani5'], 989: ['ftps-data'], 990: ['ftps'], 991: ['nas'], 992: ['telnets'], 993: ['imaps'], 995: ['pop3s'], 996: ['vsinet'], 997: ['maitrd'], 999: ['puprouter'], 1000: ['cadlock2'], 13820: ['dsmcc-passthru'], 10128: ['bmc-perf-sd'], 9200: ['wap-wsp'], 9201: ['wap-wsp-wtp'], 1010: ['surf'], 9203: ['wap-wsp-wtp-s'], 9204: ['wap-vcard'], 9205: ['wap-vcal'], 9206: ['wap-vcard-s'], 9207: ['wap-vcal-s'], 9208: ['rjcdb-vcards'], 9209: ['almobile-system'], 9210: ['oma-mlp'], 9211: ['oma-mlp-s'], 9212: ['serverviewdbms'], 1021: ['exp1'], 1022: ['exp2'], 9215: ['insis'], 9216: ['acme'], 1025: ['blackjack'], 1026: ['cap'], 1029: ['solid-mux'], 9222: ['teamcoherence'], 1033: ['netinfo-local'], 1034: ['activesync'], 1035: ['mxxrlogin'], 1036: ['nsstp'], 1037: ['ams'], 1038: ['mtqp'], 1039: ['sbl'], 1040: ['netarx'], 1041: ['danf-ak2'], 1042: ['afrog'], 1043: ['boinc-client'], 1044: ['dcutility'], 1045: ['fpitp'], 1046: ['wfremotertm'], 1047: ['neod1'], 1048: ['neod2'], 1049: ['td-postman'], 1050: ['cma'], 1051: ['optima-vnet'], 1052: ['ddt'], 1053: ['remote-as'], 1054: ['brvread'], 1055: ['ansyslmd'], 1056: ['vfo'], 1057: ['startron'], 1058: ['nim'], 1059: ['nimreg'], 1060: ['polestar'], 1061: ['kiosk'], 1062: ['veracity'], 1063: ['kyoceranetdev'], 1064: ['jstel'], 1065: ['syscomlan'], 1066: ['fpo-fns'], 1067: ['instl-boots'], 1068: ['instl-bootc'], 1069: ['cognex-insight'], 1070: ['gmrupdateserv'], 1071: ['bsquare-voip'], 1072: ['cardax'], 1073: ['bridgecontrol'], 1074: ['warmspotmgmt'], 1075: ['rdrmshc'], 1076: ['dab-sti-c'], 1077: ['imgames'], 1078: ['avocent-proxy'], 1079: ['asprovatalk'], 1080: ['socks'], 1081: ['pvuniwien'], 1082: ['amt-esd-prot'], 1083: ['ansoft-lm-1'], 1084: ['ansoft-lm-2'], 1085: ['webobjects'], 1086: ['cplscrambler-lg'], 1087: ['cplscrambler-in'], 1088: ['cplscrambler-al'], 1089: ['ff-annunc'], 1090: ['ff-fms'], 1091: ['ff-sm'], 1092: ['obrpd'], 1093: ['proofd'], 1094: ['rootd'], 1095: ['nicelink'], 1096: ['cnrprotocol'], 1097: ['sunclustermgr'], 1098: ['rmiactivation'], 1099: ['rmiregistry'], 1100: ['mctp'], 1101: ['pt2-discover'], 1102: ['adobeserver-1'], 1103: ['adobeserver-2'], 1104: ['xrl'], 1105: ['ftranhc'], 1106: ['isoipsigport-1'], 1107: ['isoipsigport-2'], 1108: ['ratio-adp'], 42510: ['caerpc'], 1111: ['lmsocialserver'], 1112: ['icp'], 1113: ['ltp-deepspace'], 1114: ['mini-sql'], 1115: ['ardus-trns'], 1116: ['ardus-cntl'], 1117: ['ardus-mtrns'], 1118: ['sacred'], 1119: ['bnetgame'], 1120: ['bnetfile'], 1121: ['rmpp'], 1122: ['availant-mgr'], 1123: ['murray'], 1124: ['hpvmmcontrol'], 1125: ['hpvmmagent'], 1126: ['hpvmmdata'], 1127: ['kwdb-commn'], 1128: ['saphostctrl'], 1129: ['saphostctrls'], 1130: ['casp'], 1131: ['caspssl'], 1132: ['kvm-via-ip'], 1133: ['dfn'], 1134: ['aplx'], 1135: ['omnivision'], 1136: ['hhb-gateway'], 1137: ['trim'], 1138: ['encrypted-admin'], 1139: ['evm'], 1140: ['autonoc'], 1141: ['mxomss'], 1142: ['edtools'], 1143: ['imyx'], 1144: ['fuscript'], 1145: ['x9-icue'], 1146: ['audit-transfer'], 1147: ['capioverlan'], 1148: ['elfiq-repl'], 1149: ['bvtsonar'], 1150: ['blaze'], 1151: ['unizensus'], 1152: ['winpoplanmess'], 1153: ['c1222-acse'], 1154: ['resacommunity'], 1155: ['nfa'], 1156: ['iascontrol-oms'], 1157: ['iascontrol'], 1158: ['dbcontrol-oms'], 1159: ['oracle-oms'], 1160: ['olsv'], 1161: ['health-polling'], 1162: ['health-trap'], 1163: ['sddp'], 1164: ['qsm-proxy'], 1165: ['qsm-gui'], 1166: ['qsm-remote'], 1167: ['cisco-ipsla'], 1168: ['vchat'], 1169: ['tripwire'], 1170: ['atc-lm'], 1171: ['atc-appserver'], 1172: ['dnap'], 1173: ['d-cinema-rrp'], 1174: ['fnet-remote-ui'], 1175: ['dossier'], 1176: ['indigo-server'], 1177: ['dkmessenger'], 1178: ['sgi-storman'], 1179: ['b2n'], 1180: ['mc-client'], 1181: ['3comnetman'], 9374: ['fjdmimgr'], 1183: ['llsurfup-http'], 1184: ['llsurfup-https'], 1185: ['catchpole'], 1186: ['mysql-cluster'], 1187: ['alias'], 1188: ['hp-webadmin'], 1189: ['unet'], 1190: ['commlinx-avl'], 1191: ['gpfs'], 1192: ['caids-sensor'], 1193: ['fiveacross'], 1194: ['openvpn'], 1195: ['rsf-1'], 1196: ['netmagic'], 1197: ['carrius-rshell'], 1198: ['cajo-discovery'], 1199: ['dmidi'], 1200: ['scol'], 1201: ['nucleus-sand'], 1202: ['caiccipc'], 1203: ['ssslic-mgr'], 1204: ['ssslog-mgr'], 1205: ['accord-mgc'], 1206: ['anthony-data'], 1207: ['metasage'], 1208: ['seagull-ais'], 1209: ['ipcd3'], 1210: ['eoss'], 1211: ['groove-dpp'], 1212: ['lupa'], 1213: ['mpc-lifenet'], 1214: ['kazaa'], 1215: ['scanstat-1'], 1216: ['etebac5'], 1217: ['hpss-ndapi'], 1218: ['aeroflight-ads'], 1219: ['aeroflight-ret'], 1220: ['qt-serveradmin'], 1221: ['sweetware-apps'], 1222: ['nerv'], 1223: ['tgp'], 1224: ['vpnz'], 1225: ['slinkysearch'], 1226: ['stgxfws'], 1227: ['dns2go'], 1228: ['florence'], 1229: ['zented'], 1230: ['periscope'], 1231: ['menandmice-lpm'], 1232: ['first-defense'], 1233: ['univ-appserver'], 1234: ['search-agent'], 1235: ['mosaicsyssvc1'], 1236: ['bvcontrol'], 1237: ['tsdos390'], 1238: ['hacl-qs'], 1239: ['nmsd'], 1240: ['instantia'], 1241: ['nessus'], 1242: ['nmasoverip'], 1243: ['serialgateway'], 1244: ['isbconference1'], 1245: ['isbconference2'], 1246: ['payrouter'], 1247: ['visionpyramid'], 1248: ['hermes'], 1249: ['mesavistaco'], 1250: ['swldy-sias'], 1251: ['servergraph'], 1252: ['bspne-pcc'], 1253: ['q55-pcc'], 1254: ['de-noc'], 1255: ['de-cache-query'], 1256: ['de-server'], 1257: ['shockwave2'], 1258: ['opennl'], 1259: ['opennl-voice'], 1260: ['ibm-ssd'], 1261: ['mpshrsv'], 1262: ['qnts-orb'], 1263: ['dka'], 1264: ['prat'], 1265: ['dssiapi'], 1266: ['dellpwrappks'], 1267: ['epc'], 1268: ['propel-msgsys'], 1269: ['watilapp'], 1270: ['opsmgr'], 1271: ['excw'], 1272: ['cspmlockmgr'], 1273: ['emc-gateway'], 1274: ['t1distproc'], 1275: ['ivcollector'], 1276: ['ivmanager'], 1277: ['miva-mqs'], 1278: ['dellwebadmin-1'], 1279: ['dellwebadmin-2'], 1280: ['pictrography'], 1281: ['healthd'], 1282: ['emperion'], 1283: ['productinfo'], 1284: ['iee-qfx'], 1285: ['neoiface'], 1286: ['netuitive'], 1287: ['routematch'], 1288: ['navbuddy'], 1289: ['jwalkserver'], 1290: ['winjaserver'], 1291: ['seagulllms'], 1292: ['dsdn'], 1293: ['pkt-krb-ipsec'], 1294: ['cmmdriver'], 1295: ['ehtp'], 1296: ['dproxy'], 1297: ['sdproxy'], 1298: ['lpcp'], 1299: ['hp-sci'], 1300: ['h323hostcallsc'], 1301: ['ci3-software-1'], 1302: ['ci3-software-2'], 1303: ['sftsrv'], 1304: ['boomerang'], 1305: ['pe-mike'], 1306: ['re-conn-proto'], 1307: ['pacmand'], 1308: ['odsi'], 1309: ['jtag-server'], 1310: ['husky'], 1311: ['rxmon'], 1312: ['sti-envision'], 1313: ['bmc-patroldb'], 1314: ['pdps'], 1315: ['els'], 1316: ['exbit-escp'], 1317: ['vrts-ipcserver'], 1318: ['krb5gatekeeper'], 1319: ['amx-icsp'], 1320: ['amx-axbnet'], 1321: ['pip'], 1322: ['novation'], 1323: ['brcd'], 1324: ['delta-mcp'], 1325: ['dx-instrument'], 1326: ['wimsic'], 1327: ['ultrex'], 1328: ['ewall'], 1329: ['netdb-export'], 1330: ['streetperfect'], 1331: ['intersan'], 1332: ['pcia-rxp-b'], 1333: ['passwrd-policy'], 1334: ['writesrv'], 1335: ['digital-notary'], 1336: ['ischat'], 1337: ['menandmice-dns'], 1338: ['wmc-log-svc'], 1339: ['kjtsiteserver'], 1340: ['naap'], 1341: ['qubes'], 1342: ['esbroker'], 1343: ['re101'], 1344: ['icap'], 1345: ['vpjp'], 1346: ['alta-ana-lm'], 1347: ['bbn-mmc'], 1348: ['bbn-mmx'], 1349: ['sbook'], 1350: ['editbench'], 1351: ['equationbuilder'], 1352: ['lotusnote'], 1353: ['relief'], 1354: ['xsip-network'], 1355: ['intuitive-edge'], 1356: ['cuillamartin'], 1357: ['pegboard'], 1358: ['connlcli'], 1359: ['ftsrv'], 1360: ['mimer'], 1361: ['linx'], 1362: ['timeflies'], 1363: ['ndm-requester'], 1364: ['ndm-server'], 1365: ['adapt-sna'], 1366: ['netware-csp'], 1367: ['dcs'], 1368: ['screencast'], 1369: ['gv-us'], 1370: ['us-gv'], 1371: ['fc-cli'], 1372: ['fc-ser'], 1373: ['chromagrafx'], 1374: ['molly'], 1375: ['bytex'], 1376: ['ibm-pps'], 1377: ['cichlid'], 1378: ['elan'], 1379: ['dbreporter'], 1380: ['telesis-licman'], 1381: ['apple-licman'], 1382: ['udt-os'], 1383: ['gwha'], 1384: ['os-licman'], 1385: ['atex-elmd'], 1386: ['checksum'], 1387: ['cadsi-lm'], 1388: ['objective-dbc'], 1389: ['iclpv-dm'], 1390: ['iclpv-sc'], 1391: ['iclpv-sas'], 1392: ['iclpv-pm'], 1393: ['iclpv-nls'], 1394: ['iclpv-nlc'], 1395: ['iclpv-wsm'], 1396: ['dvl-activemail'], 1397: ['audio-activmail'], 1398: ['video-activmail'], 1399: ['cadkey-licman'], 1400: ['cadkey-tablet'], 1401: ['goldleaf-licman'], 1402: ['prm-sm-np'], 1403: ['prm-nm-np'], 1404: ['igi-lm'], 1405: ['ibm-res'], 1406: ['netlabs-lm'], 1407: ['dbsa-lm'], 1408: ['sophia-lm'], 1409: ['here-lm'], 1410: ['hiq'], 1411: ['af'], 1412: ['innosys'], 1413: ['innosys-acl'], 1414: ['ibm-mqseries'], 1415: ['dbstar'], 1416: ['novell-lu6-2'], 1417: ['timbuktu-srv1'], 1418: ['timbuktu-srv2'], 1419: ['timbuktu-srv3'], 1420: ['timbuktu-srv4'], 1421: ['gandalf-lm'], 1422: ['autodesk-lm'], 1423: ['essbase'], 1424: ['hybrid'], 1425: ['zion-lm'], 1426: ['sais'], 1427: ['mloadd'], 1428: ['informatik-lm'], 1429: ['nms'], 1430: ['tpdu'], 1431: ['rgtp'], 1432: ['blueberry-lm'], 1433: ['ms-sql-s'], 1434: ['ms-sql-m'], 1435: ['ibm-cics'], 1436: ['saism'], 1437: ['tabula'], 1438: ['eicon-server'], 1439: ['eicon-x25'], 1440: ['eicon-slp'], 1441: ['cadis-1'], 1442: ['cadis-2'], 1443: ['ies-lm'], 1444: ['marcam-lm'], 1445: ['proxima-lm'], 1446: ['ora-lm'], 1447: ['apri-lm'], 1448: ['oc-lm'], 1449: ['peport'], 1450: ['dwf'], 1451: ['infoman'], 1452: ['gtegsc-lm'], 1453: ['genie-lm'], 1454: ['interhdl-elmd'], 1455: ['esl-lm'], 1456: ['dca'], 1457: ['valisys-lm'], 1458: ['nrcabq-lm'], 1459: ['proshare1'], 1460: ['proshare2'], 1461: ['ibm-wrless-lan'], 1462: ['world-lm'], 1463: ['nucleus'], 1464: ['msl-lmd'], 1465: ['pipes'], 1466: ['oceansoft-lm'], 1467: ['csdmbase'], 1468: ['csdm'], 1469: ['aal-lm'], 1470: ['uaiact'], 1471: ['csdmbase'], 1472: ['csdm'], 1473: ['openmath'], 1474: ['telefinder'], 1475: ['taligent-lm'], 1476: ['clvm-cfg'], 1477: ['ms-sna-server'], 1478: ['ms-sna-base'], 1479: ['dberegister'], 1480: ['pacerforum'], 1481: ['airs'], 1482: ['miteksys-lm'], 1483: ['afs'], 1484: ['confluent'], 1485: ['lansource'], 1486: ['nms-topo-serv'], 1487: ['localinfosrvr'], 1488: ['docstor'], 1489: ['dmdocbroker'], 1490: ['insitu-conf'], 1492: ['stone-design-1'], 1493: ['netmap-lm'], 1494: ['ica'], 1495: ['cvc'], 1496: ['liberty-lm'], 1497: ['rfx-lm'], 1498: ['sybase-sqlany'], 1499: ['fhc'], 1500: ['vlsi-lm'], 1501: ['saiscm'], 1502: ['shivadiscovery'], 1503: ['imtc-mcs'], 1504: ['evb-elm'], 1505: ['funkproxy'], 1506: ['utcd'], 1507: ['symplex'], 1508: ['diagmond'], 1509: ['robcad-lm'], 1510: ['mvx-lm'], 1511: ['3l-l1'], 1512: ['wins'], 1513: ['fujitsu-dtc'], 1514: ['fujitsu-dtcns'], 1515: ['ifor-protocol'], 1516: ['vpad'], 1517: ['vpac'], 1518: ['vpvd'], 1519: ['vpvc'], 1520: ['atm-zip-office'], 1521: ['ncube-lm'], 1522: ['ricardo-lm'], 1523: ['cichild-lm'], 1524: ['ingreslock'], 1525: ['orasrv', 'prospero-np'], 1526: ['pdap-np'], 1527: ['tlisrv'], 1529: ['coauthor'], 1530: ['rap-service'], 1531: ['rap-listen'], 1532: ['miroconnect'], 1533: ['virtual-places'], 1534: ['micromuse-lm'], 1535: ['ampr-info'], 1536: ['ampr-inter'], 1537: ['sdsc-lm'], 1538: ['3ds-lm'], 1539: ['intellistor-lm'], 1540: ['rds'], 1541: ['rds2'], 1542: ['gridgen-elmd'], 1543: ['simba-cs'], 1544: ['aspeclmd'], 1545: ['vistium-share'], 1546: ['abbaccuray'], 1547: ['laplink'], 1548: ['axon-lm'], 42509: ['candrp'], 1550: ['3m-image-lm'], 1551: ['hecmtl-db'], 1552: ['pciarray'], 1553: ['sna-cs'], 1554: ['caci-lm'], 1555: ['livelan'], 1556: ['veritas-pbx'], 1557: ['arbortext-lm'], 1558: ['xingmpeg'], 1559: ['web2host'], 1560: ['asci-val'], 1561: ['facilityview'], 1562: ['pconnectmgr'], 1563: ['cadabra-lm'], 1564: ['pay-per-view'], 1565: ['winddlb'], 1566: ['corelvideo'], 1567: ['jlicelmd'], 1568: ['tsspmap'], 1569: ['ets'], 1570: ['orbixd'], 1571: ['rdb-dbs-disp'], 1572: ['chip-lm'], 1573: ['itscomm-ns'], 1574: ['mvel-lm'], 1575: ['oraclenames'], 1576: ['moldflow-lm'], 1577: ['hypercube-lm'], 1578: ['jacobus-lm'], 1579: ['ioc-sea-lm'], 1581: ['mil-2045-47001'], 1582: ['msims'], 1583: ['simbaexpress'], 1584: ['tn-tl-fd2'], 1585: ['intv'], 1586: ['ibm-abtact'], 1587: ['pra-elmd'], 1588: ['triquest-lm'], 1589: ['vqp'], 1590: ['gemini-lm'], 1591: ['ncpm-pm'], 1592: ['commonspace'], 1593: ['mainsoft-lm'], 1594: ['sixtrak'], 1595: ['radio'], 1597: ['orbplus-iiop'], 1598: ['picknfs'], 1599: ['simbaservices'], 1600: ['issd'], 1601: ['aas'], 1602: ['inspect'], 1603: ['picodbc'], 1604: ['icabrowser'], 1605: ['slp'], 1606: ['slm-api'], 1607: ['stt'], 1608: ['smart-lm'], 1609: ['isysg-lm'], 1610: ['taurus-wh'], 1611: ['ill'], 1612: ['netbill-trans'], 1613: ['netbill-keyrep'], 1614: ['netbill-cred'], 1615: ['netbill-auth'], 1616: ['netbill-prod'], 1617: ['nimrod-agent'], 1618: ['skytelnet'], 1619: ['xs-openstorage'], 1620: ['faxportwinport'], 1621: ['softdataphone'], 1622: ['ontime'], 1623: ['jaleosnd'], 1624: ['udp-sr-port'], 1625: ['svs-omagent'], 1626: ['shockwave'], 1627: ['t128-gateway'], 1628: ['lontalk-norm'], 1629: ['lontalk-urgnt'], 1630: ['oraclenet8cman'], 1631: ['visitview'], 1632: ['pammratc'], 1633: ['pammrpc'], 1634: ['loaprobe'], 1635: ['edb-server1'], 1636: ['isdc'], 1637: ['islc'], 1638: ['ismc'], 1639: ['cert-initiator'], 1640: ['cert-responder'], 1641: ['invision'], 1642: ['isis-am'], 1643: ['isis-ambc'], 1644: ['saiseh'], 1645: ['sightline'], 1646: ['sa-msg-port'], 1647: ['rsap'], 1648: ['concurrent-lm'], 1649: ['kermit'], 1650: ['nkd'], 1651: ['shiva-confsrvr'], 1652: ['xnmp'], 1653: ['alphatech-lm'], 1654: ['stargatealerts'], 1655: ['dec-mbadmin'], 1656: ['dec-mbadmin-h'], 1657: ['fujitsu-mmpdc'], 1658: ['sixnetudr'], 1659: ['sg-lm'], 1660: ['skip-mc-gikreq'], 1661: ['netview-aix-1'], 1662: ['netview-aix-2'], 1663: ['netview-aix-3'], 1664: ['netview-aix-4'], 1665: ['netview-aix-5'], 1666: ['netview-aix-6'], 1667: ['netview-aix-7'], 1668: ['netview-aix-8'], 1669: ['netview-aix-9'], 1670: ['netview-aix-10'], 1671: ['netview-aix-11'], 1672: ['netview-aix-12'], 1673: ['proshare-mc-1'], 1674: ['proshare-mc-2'], 1675: ['pdp'], 1677: ['groupwise'], 1678: ['prolink'], 1679: ['darcorp-lm'], 1680: ['microcom-sbp'], 1681: ['sd-elmd'], 1682: ['lanyon-lantern'], 1683: ['ncpm-hip'], 1684: ['snaresecure'], 1685: ['n2nremote'], 1686: ['cvmon'], 1687: ['nsjtp-ctrl'], 1688: ['nsjtp-data'], 1689: ['firefox'], 1690: ['ng-umds'], 1691: ['empire-empuma'], 1692: ['sstsys-lm'], 1693: ['rrirtr'], 1694: ['rrimwm'], 1695: ['rrilwm'], 1696: ['rrifmm'], 1697: ['rrisat'], 1698: ['rsvp-encap-1'], 1699: ['rsvp-encap-2'], 1700: ['mps-raft'], 1701: ['l2f', 'l2tp'], 1702: ['deskshare'], 1703: ['hb-engine'], 1704: ['bcs-broker'], 1705: ['slingshot'], 1706: ['jetform'], 1707: ['vdmplay'], 1708: ['gat-lmd'], 1709: ['centra'], 1710: ['impera'], 1711: ['pptconference'], 1712: ['registrar'], 1713: ['conferencetalk'], 1714: ['sesi-lm'], 1715: ['houdini-lm'], 1716: ['xmsg'], 1717: ['fj-hdnet'], 1718: ['h323gatedisc'], 1719: ['h323gatestat'], 1720: ['h323hostcall'], 1721: ['caicci'], 1722: ['hks-lm'], 1723: ['pptp'], 1724: ['csbphonemaster'], 1725: ['iden-ralp'], 1726: ['iberiagames'], 1727: ['winddx'], 1728: ['telindus'], 1729: ['citynl'], 1730: ['roketz'], 1731: ['msiccp'], 1732: ['proxim'], 1733: ['siipat'], 1734: ['cambertx-lm'], 1735: ['privatechat'], 1736: ['street-stream'], 1737: ['ultimad'], 1738: ['gamegen1'], 1739: ['webaccess'], 1740: ['encore'], 1741: ['cisco-net-mgmt'], 1742: ['3com-nsd'], 1743: ['cinegrfx-lm'], 1744: ['ncpm-ft'], 1745: ['remote-winsock'], 1746: ['ftrapid-1'], 1747: ['ftrapid-2'], 1748: ['oracle-em1'], 1749: ['aspen-services'], 1750: ['sslp'], 1751: ['swiftnet'], 1752: ['lofr-lm'], 1754: ['oracle-em2'], 1755: ['ms-streaming'], 1756: ['capfast-lmd'], 1757: ['cnhrp'], 1758: ['tftp-mcast'], 1759: ['spss-lm'], 1760: ['www-ldap-gw'], 1761: ['cft-0'], 1762: ['cft-1'], 1763: ['cft-2'], 1764: ['cft-3'], 1765: ['cft-4'], 1766: ['cft-5'], 1767: ['cft-6'], 1768: ['cft-7'], 1769: ['bmc-net-adm'], 1770: ['bmc-net-svc'], 1771: ['vaultbase'], 1772: ['essweb-gw'], 1773: ['kmscontrol'], 1774: ['global-dtserv'], 1776: ['femis'], 1777: ['powerguardian'], 1778: ['prodigy-intrnet'], 1779: ['pharmasoft'], 1780: ['dpkeyserv'], 1781: ['answersoft-lm'], 1782: ['hp-hcip'], 1784: ['finle-lm'], 1785: ['windlm'], 1786: ['funk-logger'], 1787: ['funk-license'], 1788: ['psmond'], 1789: ['hello'], 1790: ['nmsp'], 1791: ['ea1'], 1792: ['ibm-dt-2'], 1793: ['rsc-robot'], 1794: ['cera-bcm'], 1795: ['dpi-proxy'], 1796: ['vocaltec-admin'], 1797: ['uma'], 1798: ['etp'], 1799: ['netrisk'], 1800: ['ansys-lm'], 1801: ['msmq'], 1802: ['concomp1'], 1803: ['hp-hcip-gwy'], 1804: ['enl'], 1805: ['enl-name'], 1806: ['musiconline'], 1807: ['fhsp'], 1808: ['oracle-vp2'], 1809: ['oracle-vp1'], 1810: ['jerand-lm'], 1811: ['scientia-sdb'], 1812: ['radius'], 1813: ['radius-acct'], 1814: ['tdp-suite'], 1815: ['mmpft'], 1816: ['harp'], 1817: ['rkb-oscs'], 1818: ['etftp'], 1819: ['plato-lm'], 1820: ['mcagent'], 1821: ['donnyworld'], 1822: ['es-elmd'], 1823: ['unisys-lm'], 1824: ['metrics-pas'], 1825: ['direcpc-video'], 1826: ['ardt'], 1827: ['asi'], 1828: ['itm-mcell-u'], 1829: ['optika-emedia'], 1830: ['net8-cman'], 1831: ['myrtle'], 1832: ['tht-treasure'], 1833: ['udpradio'], 1834: ['ardusuni'], 1835: ['ardusmul'], 1836: ['ste-smsc'], 1837: ['csoft1'], 1838: ['talnet'], 1839: ['netopia-vo1'], 1840: ['netopia-vo2'], 1841: ['netopia-vo3'], 1842: ['netopia-vo4'], 1843: ['netopia-vo5'], 1844: ['direcpc-dll'], 1845: ['altalink'], 1846: ['tunstall-pnc'], 1847: ['slp-notify'], 1848: ['fjdocdist'], 1849: ['alpha-sms'], 1850: ['gsi'], 1851: ['ctcd'], 1852: ['virtual-time'], 1853: ['vids-avtp'], 1854: ['buddy-draw'], 1855: ['fiorano-rtrsvc'], 1856: ['fiorano-msgsvc'], 1857: ['datacaptor'], 1858: ['privateark'], 1859: ['gammafetchsvr'], 1860: ['sunscalar-svc'], 1861: ['lecroy-vicp'], 1862: ['mysql-cm-agent'], 1863: ['msnp'], 1864: ['paradym-31port'], 1865: ['entp'], 1866: ['swrmi'], 1867: ['udrive'], 1868: ['viziblebrowser'], 1869: ['transact'], 1870: ['sunscalar-dns'], 1871: ['canocentral0'], 1872: ['canocentral1'], 1873: ['fjmpjps'], 1874: ['fjswapsnp'], 1875: ['westell-stats'], 1876: ['ewcappsrv'], 1877: ['hp-webqosdb'], 1878: ['drmsmc'], 1879: ['nettgain-nms'], 1880: ['vsat-control'], 1881: ['ibm-mqseries2'], 1882: ['ecsqdmn'], 1883: ['ibm-mqisdp'], 1884: ['idmaps'], 1885: ['vrtstrapserver'], 1886: ['leoip'], 1887: ['filex-lport'], 1888: ['ncconfig'], 1889: ['unify-adapter'], 1890: ['wilkenlistener'], 1891: ['childkey-notif'], 1892: ['childkey-ctrl'], 1893: ['elad'], 1894: ['o2server-port'], 1896: ['b-novative-ls'], 1897: ['metaagent'], 1898: ['cymtec-port'], 1899: ['mc2studios'], 1900: ['ssdp'], 1901: ['fjicl-tep-a'], 1902: ['fjicl-tep-b'], 1903: ['linkname'], 1904: ['fjicl-tep-c'], 1905: ['sugp'], 1906: ['tpmd'], 1907: ['intrastar'], 1908: ['dawn'], 1909: ['global-wlink'], 1910: ['ultrabac'], 1911: ['mtp'], 1912: ['rhp-iibp'], 1913: ['armadp'], 1914: ['elm-momentum'], 1915: ['facelink'], 1916: ['persona'], 1917: ['noagent'], 1918: ['can-nds'], 1919: ['can-dch'], 1920: ['can-ferret'], 1921: ['noadmin'], 1922: ['tapestry'], 1923: ['spice'], 1924: ['xiip'], 1925: ['discovery-port'], 1926: ['egs'], 1927: ['videte-cipc'], 1928: ['emsd-port'], 1929: ['bandwiz-system'], 1930: ['driveappserver'], 1931: ['amdsched'], 1932: ['ctt-broker'], 1933: ['xmapi'], 1934: ['xaapi'], 1935: ['macromedia-fcs'], 1936: ['jetcmeserver'], 1937: ['jwserver'], 1938: ['jwclient'], 1939: ['jvserver'], 1940: ['jvclient'], 1941: ['dic-aida'], 1942: ['res'], 1943: ['beeyond-media'], 1944: ['close-combat'], 1945: ['dialogic-elmd'], 1946: ['tekpls'], 1947: ['sentinelsrm'], 1948: ['eye2eye'], 1949: ['ismaeasdaqlive'], 1950: ['ismaeasdaqtest'], 1951: ['bcs-lmserver'], 1952: ['mpnjsc'], 1953: ['rapidbase'], 1954: ['abr-api'], 1955: ['abr-secure'], 1956: ['vrtl-vmf-ds'], 1957: ['unix-status'], 1958: ['dxadmind'], 1959: ['simp-all'], 1960: ['nasmanager'], 1961: ['bts-appserver'], 1962: ['biap-mp'], 1963: ['webmachine'], 1964: ['solid-e-engine'], 1965: ['tivoli-npm'], 1966: ['slush'], 1967: ['sns-quote'], 1968: ['lipsinc'], 1969: ['lipsinc1'], 1970: ['netop-rc'], 1971: ['netop-school'], 1972: ['intersys-cache'], 1973: ['dlsrap'], 1974: ['drp'], 1975: ['tcoflashagent'], 1976: ['tcoregagent'], 1977: ['tcoaddressbook'], 1978: ['unisql'], 1979: ['unisql-java'], 1980: ['pearldoc-xact'], 1981: ['p2pq'], 1982: ['estamp'], 1983: ['lhtp'], 1984: ['bb'], 1985: ['hsrp'], 1986: ['licensedaemon'], 1987: ['tr-rsrb-p1'], 1988: ['tr-rsrb-p2'], 1989: ['mshnet', 'tr-rsrb-p3'], 1990: ['stun-p1'], 1991: ['stun-p2'], 1992: ['ipsendmsg', 'stun-p3'], 1993: ['snmp-tcp-port'], 1994: ['stun-port'], 1995: ['perf-port'], 1996: ['tr-rsrb-port'], 1997: ['gdp-port'], 1998: ['x25-svc-port'], 1999: ['tcp-id-port'], 2000: ['cisco-sccp'], 2002: ['globe'], 2003: ['brutus'], 10200: ['trisoap'], 2016: ['bootserver'], 10160: ['qb-db-server'], 2020: ['xinupageserver'], 32801: ['mlsn'], 2023: ['xinuexpansion3'], 2024: ['xinuexpansion4'], 2026: ['scrabble'], 2027: ['shadowserver'], 2028: ['submitserver'], 2029: ['hsrpv6'], 2030: ['device2'], 2031: ['mobrien-chat'], 2032: ['blackboard'], 2033: ['glogger'], 2034: ['scoremgr'], 2035: ['imsldoc'], 2036: ['e-dpnet'], 2037: ['applus'], 2038: ['objectmanager'], 2039: ['prizma'], 2040: ['lam'], 2041: ['interbase'], 2042: ['isis'], 2043: ['isis-bcast'], 2044: ['rimsl'], 2045: ['cdfunc'], 2046: ['sdfunc'], 2047: ['dls'], 2048: ['dls-monitor'], 2049: ['nfs', 'shilp'], 2050: ['av-emb-config'], 2051: ['epnsdp'], 2052: ['clearvisn'], 2053: ['lot105-ds-upd'], 2054: ['weblogin'], 2055: ['iop'], 2056: ['omnisky'], 2057: ['rich-cp'], 2058: ['newwavesearch'], 2059: ['bmc-messaging'], 2060: ['teleniumdaemon'], 2061: ['netmount'], 2062: ['icg-swp'], 2063: ['icg-bridge'], 2064: ['icg-iprelay'], 2065: ['dlsrpn'], 2066: ['aura'], 2067: ['dlswpn'], 2068: ['avauthsrvprtcl'], 2069: ['event-port'], 2070: ['ah-esp-encap'], 2071: ['acp-port'], 2072: ['msync'], 2073: ['gxs-data-port'], 2074: ['vrtl-vmf-sa'], 2075: ['newlixengine'], 2076: ['newlixconfig'], 2077: ['tsrmagt'], 2078: ['tpcsrvr'], 2079: ['idware-router'], 2080: ['autodesk-nlm'], 2081: ['kme-trap-port'], 2082: ['infowave'], 2083: ['radsec'], 2084: ['sunclustergeo'], 2085: ['ada-cip'], 2086: ['gnunet'], 2087: ['eli'], 2088: ['ip-blf'], 2089: ['sep'], 2090: ['lrp'], 2091: ['prp'], 2092: ['descent3'], 2093: ['nbx-cc'], 2094: ['nbx-au'], 2095: ['nbx-ser'], 2096: ['nbx-dir'], 2097: ['jetformpreview'], 2098: ['dialog-port'], 2099: ['h2250-annex-g'], 2100: ['amiganetfs'], 2101: ['rtcm-sc104'], 2102: ['zephyr-srv'], 2103: ['zephyr-clt'], 2104: ['zephyr-hm'], 2105: ['minipay'], 2106: ['mzap'], 2107: ['bintec-admin'], 2108: ['comcam'], 2109: ['ergolight'], 2110: ['umsp'], 2111: ['dsatp'], 2112: ['idonix-metanet'], 2113: ['hsl-storm'], 2114: ['newheights'], 2115: ['kdm'], 2116: ['ccowcmr'], 2117: ['mentaclient'], 2118: ['mentaserver'], 2119: ['gsigatekeeper'], 2120: ['qencp'], 2121: ['scientia-ssdb'], 2122: ['caupc-remote'], 2123: ['gtp-control'], 2124: ['elatelink'], 2125: ['lockstep'], 2126: ['pktcable-cops'], 2127: ['index-pc-wb'], 2128: ['net-steward'], 2129: ['cs-live'], 2130: ['xds'], 2131: ['avantageb2b'], 2132: ['solera-epmap'], 2133: ['zymed-zpp'], 2134: ['avenue'], 2135: ['gris'], 2136: ['appworxsrv'], 2137: ['connect'], 2138: ['unbind-cluster'], 2139: ['ias-auth'], 2140: ['ias-reg'], 2141: ['ias-admind'], 2142: ['tdmoip'], 2143: ['lv-jc'], 2144: ['lv-ffx'], 2145: ['lv-pici'], 2146: ['lv-not'], 2147: ['lv-auth'], 2148: ['veritas-ucl'], 2149: ['acptsys'], 2150: ['dynamic3d'], 2151: ['docent'], 2152: ['gtp-user'], 2153: ['ctlptc'], 2154: ['stdptc'], 2155: ['brdptc'], 2156: ['trp'], 2157: ['xnds'], 2158: ['touchnetplus'], 2159: ['gdbremote'], 2160: ['apc-2160'], 2161: ['apc-2161'], 2162: ['navisphere'], 2163: ['navisphere-sec'], 2164: ['ddns-v3'], 2165: ['x-bone-api'], 2166: ['iwserver'], 2167: ['raw-serial'], 2168: ['easy-soft-mux'], 2169: ['brain'], 2170: ['eyetv'], 2171: ['msfw-storage'], 2172: ['msfw-s-storage'], 2173: ['msfw-replica'], 2174: ['msfw-array'], 2175: ['airsync'], 2176: ['rapi'], 2177: ['qwave'], 2178: ['bitspeer'], 2179: ['vmrdp'], 2180: ['mc-gt-srv'], 2181: ['eforward'], 2182: ['cgn-stat'], 2183: ['cgn-config'], 2184: ['nvd'], 2185: ['onbase-dds'], 2186: ['gtaua'], 2190: ['tivoconnect'], 2191: ['tvbus'], 2192: ['asdis'], 2193: ['drwcs'], 26260: ['ezproxy'], 34963: ['profinet-rtm'], 34964: ['profinet-cm'], 2197: ['mnp-exchange'], 2198: ['onehome-remote'], 2199: ['onehome-help'], 2200: ['ici'], 2201: ['ats'], 2202: ['imtc-map'], 2203: ['b2-runtime'], 2204: ['b2-license'], 2205: ['jps'], 2206: ['hpocbus'], 2207: ['hpssd'], 2208: ['hpiod'], 2209: ['rimf-ps'], 2210: ['noaaport'], 2211: ['emwin'], 2212: ['leecoposserver'], 2213: ['kali'], 2214: ['rpi'], 2215: ['ipcore'], 2216: ['vtu-comms'], 2217: ['gotodevice'], 2218: ['bounzza'], 2219: ['netiq-ncap'], 2220: ['netiq'], 2221: ['rockwell-csp1'], 2222: ['ethernet-ip-1'], 2223: ['rockwell-csp2'], 2224: ['efi-mg'], 2226: ['di-drm'], 2227: ['di-msg'], 2228: ['ehome-ms'], 2229: ['datalens'], 2230: ['queueadm'], 2231: ['wimaxasncp'], 2232: ['ivs-video'], 2233: ['infocrypt'], 2234: ['directplay'], 2235: ['sercomm-wlink'], 2236: ['nani'], 2237: ['optech-port1-lm'], 2238: ['aviva-sna'], 2239: ['imagequery'], 2240: ['recipe'], 2241: ['ivsd'], 2242: ['foliocorp'], 2243: ['magicom'], 2244: ['nmsserver'], 2245: ['hao'], 2246: ['pc-mta-addrmap'], 2247: ['antidotemgrsvr'], 2248: ['ums'], 2249: ['rfmp'], 2250: ['remote-collab'], 2251: ['dif-port'], 2252: ['njenet-ssl'], 2253: ['dtv-chan-req'], 2254: ['seispoc'], 2255: ['vrtp'], 2256: ['pcc-mfp'], 2257: ['simple-tx-rx'], 2258: ['rcts'], 2260: ['apc-2260'], 2261: ['comotionmaster'], 2262: ['comotionback'], 2263: ['ecwcfg'], 2264: ['apx500api-1'], 2265: ['apx500api-2'], 2266: ['mfserver'], 2267: ['ontobroker'], 2268: ['amt'], 2269: ['mikey'], 2270: ['starschool'], 2271: ['mmcals'], 2272: ['mmcal'], 2273: ['mysql-im'], 2274: ['pcttunnell'], 2275: ['ibridge-data'], 2276: ['ibridge-mgmt'], 2277: ['bluectrlproxy'], 2278: ['s3db'], 2279: ['xmquery'], 2280: ['lnvpoller'], 2281: ['lnvconsole'], 2282: ['lnvalarm'], 2283: ['lnvstatus'], 2284: ['lnvmaps'], 2285: ['lnvmailmon'], 2286: ['nas-metering'], 2287: ['dna'], 2288: ['netml'], 2289: ['dict-lookup'], 2290: ['sonus-logging'], 2291: ['eapsp'], 2292: ['mib-streaming'], 2293: ['npdbgmngr'], 2294: ['konshus-lm'], 2295: ['advant-lm'], 2296: ['theta-lm'], 2297: ['d2k-datamover1'], 2298: ['d2k-datamover2'], 2299: ['pc-telecommute'], 2300: ['cvmmon'], 2301: ['cpq-wbem'], 2302: ['binderysupport'], 2303: ['proxy-gateway'], 2304: ['attachmate-uts'], 2305: ['mt-scaleserver'], 2306: ['tappi-boxnet'], 2307: ['pehelp'], 2308: ['sdhelp'], 2309: ['sdserver'], 2310: ['sdclient'], 2311: ['messageservice'], 2312: ['wanscaler'], 2313: ['iapp'], 2314: ['cr-websystems'], 2315: ['precise-sft'], 2316: ['sent-lm'], 2317: ['attachmate-g32'], 2318: ['cadencecontrol'], 2319: ['infolibria'], 2320: ['siebel-ns'], 2321: ['rdlap'], 2322: ['ofsd'], 2323: ['3d-nfsd'], 2324: ['cosmocall'], 2325: ['ansysli'], 2326: ['idcp'], 2327: ['xingcsm'], 2328: ['netrix-sftm'], 2329: ['nvd'], 2330: ['tscchat'], 2331: ['agentview'], 2332: ['rcc-host'], 2333: ['snapp'], 2334: ['ace-client'], 2335: ['ace-proxy'], 2336: ['appleugcontrol'], 2337: ['ideesrv'], 2338: ['norton-lambert'], 2339: ['3com-webview'], 2340: ['wrs-registry'], 2341: ['xiostatus'], 2342: ['manage-exec'], 2343: ['nati-logos'], 2344: ['fcmsys'], 2345: ['dbm'], 2346: ['redstorm-join'], 2347: ['redstorm-find'], 2348: ['redstorm-info'], 2349: ['redstorm-diag'], 2350: ['psbserver'], 2351: ['psrserver'], 2352: ['pslserver'], 2353: ['pspserver'], 2354: ['psprserver'], 2355: ['psdbserver'], 2356: ['gxtelmd'], 2357: ['unihub-server'], 2358: ['futrix'], 2359: ['flukeserver'], 2360: ['nexstorindltd'], 2361: ['tl1'], 2362: ['digiman'], 2363: ['mediacntrlnfsd'], 2364: ['oi-2000'], 2365: ['dbref'], 2366: ['qip-login'], 2367: ['service-ctrl'], 2368: ['opentable'], 8199: ['vvr-data'], 2370: ['l3-hbmon'], 2371: ['worldwire'], 2372: ['lanmessenger'], 9953: ['acis'], 11319: ['imip'], 2381: ['compaq-https'], 2382: ['ms-olap3'], 2383: ['ms-olap4'], 2385: ['sd-data'], 2386: ['virtualtape'], 2387: ['vsamredirector'], 2388: ['mynahautostart'], 2389: ['ovsessionmgr'], 2390: ['rsmtp'], 2391: ['3com-net-mgmt'], 2392: ['tacticalauth'], 2393: ['ms-olap1'], 2394: ['ms-olap2'], 2395: ['lan900-remote'], 2396: ['wusage'], 2397: ['ncl'], 2398: ['orbiter'], 2399: ['fmpro-fdal'], 2400: ['opequus-server'], 2401: ['cvspserver'], 2402: ['taskmaster2000'], 2403: ['taskmaster2000'], 2404: ['iec-104'], 2405: ['trc-netpoll'], 2406: ['jediserver'], 2407: ['orion'], 2409: ['sns-protocol'], 2410: ['vrts-registry'], 2411: ['netwave-ap-mgmt'], 2412: ['cdn'], 2413: ['orion-rmi-reg'], 2414: ['beeyond'], 2415: ['codima-rtp'], 2416: ['rmtserver'], 2417: ['composit-server'], 2418: ['cas'], 2419: ['attachmate-s2s'], 2420: ['dslremote-mgmt'], 2421: ['g-talk'], 2422: ['crmsbits'], 2423: ['rnrp'], 2424: ['kofax-svr'], 2425: ['fjitsuappmgr'], 9628: ['odbcpathway'], 2427: ['mgcp-gateway'], 2428: ['ott'], 2429: ['ft-role'], 2430: ['venus'], 2431: ['venus-se'], 2432: ['codasrv'], 2433: ['codasrv-se'], 2434: ['pxc-epmap'], 2435: ['optilogic'], 2436: ['topx'], 2437: ['unicontrol'], 2438: ['msp'], 2439: ['sybasedbsynch'], 2440: ['spearway'], 2441: ['pvsw-inet'], 2442: ['netangel'], 2443: ['powerclientcsf'], 2444: ['btpp2sectrans'], 2445: ['dtn1'], 2446: ['bues-service'], 2447: ['ovwdb'], 2448: ['hpppssvr'], 2449: ['ratl'], 2450: ['netadmin'], 2451: ['netchat'], 2452: ['snifferclient'], 2453: ['madge-ltd'], 2454: ['indx-dds'], 2455: ['wago-io-system'], 2456: ['altav-remmgt'], 2457: ['rapido-ip'], 2458: ['griffin'], 2459: ['community'], 2460: ['ms-theater'], 2461: ['qadmifoper'], 2462: ['qadmifevent'], 2463: ['lsi-raid-mgmt'], 2464: ['direcpc-si'], 2465: ['lbm'], 2466: ['lbf'], 2467: ['high-criteria'], 2468: ['qip-msgd'], 2469: ['mti-tcs-comm'], 2470: ['taskman-port'], 2471: ['seaodbc'], 2472: ['c3'], 2473: ['aker-cdp'], 2474: ['vitalanalysis'], 2475: ['ace-server'], 2476: ['ace-svr-prop'], 2477: ['ssm-cvs'], 2478: ['ssm-cssps'], 2479: ['ssm-els'], 2480: ['powerexchange'], 2481: ['giop'], 2482: ['giop-ssl'], 2483: ['ttc'], 2484: ['ttc-ssl'], 2485: ['netobjects1'], 2486: ['netobjects2'], 2487: ['pns'], 2488: ['moy-corp'], 2489: ['tsilb'], 2490: ['qip-qdhcp'], 2491: ['conclave-cpp'], 2492: ['groove'], 2493: ['talarian-mqs'], 2494: ['bmc-ar'], 2495: ['fast-rem-serv'], 2496: ['dirgis'], 2497: ['quaddb'], 2498: ['odn-castraq'], 2499: ['unicontrol'], 2500: ['rtsserv'], 2501: ['rtsclient'], 2502: ['kentrox-prot'], 2503: ['nms-dpnss'], 2504: ['wlbs'], 2505: ['ppcontrol'], 2506: ['jbroker'], 2507: ['spock'], 2508: ['jdatastore'], 2509: ['fjmpss'], 2510: ['fjappmgrbulk'], 2511: ['metastorm'], 2512: ['citrixima'], 2513: ['citrixadmin'], 2514: ['facsys-ntp'], 2515: ['facsys-router'], 2516: ['maincontrol'], 2517: ['call-sig-trans'], 2518: ['willy'], 2519: ['globmsgsvc'], 2520: ['pvsw'], 2521: ['adaptecmgr'], 2522: ['windb'], 2523: ['qke-llc-v3'], 2524: ['optiwave-lm'], 2525: ['ms-v-worlds'], 2526: ['ema-sent-lm'], 2527: ['iqserver'], 2528: ['ncr-ccl'], 2529: ['utsftp'], 2530: ['vrcommerce'], 2531: ['ito-e-gui'], 2532: ['ovtopmd'], 2533: ['snifferserver'], 2534: ['combox-web-acc'], 2535: ['madcap'], 2536: ['btpp2audctr1'], 2537: ['upgrade'], 2538: ['vnwk-prapi'], 2539: ['vsiadmin'], 2540: ['lonworks'], 2541: ['lonworks2'], 2542: ['udrawgraph'], 2543: ['reftek'], 2544: ['novell-zen'], 2545: ['sis-emt'], 2546: ['vytalvaultbrtp'], 2547: ['vytalvaultvsmp'], 2548: ['vytalvaultpipe'], 2549: ['ipass'], 2550: ['ads'], 2551: ['isg-uda-server'], 2552: ['call-logging'], 2553: ['efidiningport'], 2554: ['vcnet-link-v10'], 2555: ['compaq-wcp'], 2556: ['nicetec-nmsvc'], 2557: ['nicetec-mgmt'], 2558: ['pclemultimedia'], 2559: ['lstp'], 2560: ['labrat'], 2561: ['mosaixcc'], 2562: ['delibo'], 2563: ['cti-redwood'], 2564: ['hp-3000-telnet'], 2565: ['coord-svr'], 2566: ['pcs-pcw'], 2567: ['clp'], 2568: ['spamtrap'], 2569: ['sonuscallsig'], 2570: ['hs-port'], 2571: ['cecsvc'], 2572: ['ibp'], 2573: ['trustestablish'], 2574: ['blockade-bpsp'], 2575: ['hl7'], 2576: ['tclprodebugger'], 2577: ['scipticslsrvr'], 2578: ['rvs-isdn-dcp'], 2579: ['mpfoncl'], 2580: ['tributary'], 2581: ['argis-te'], 2582: ['argis-ds'], 2583: ['mon'], 2584: ['cyaserv'], 2585: ['netx-server'], 2586: ['netx-agent'], 2587: ['masc'], 2588: ['privilege'], 2589: ['quartus-tcl'], 2590: ['idotdist'], 2591: ['maytagshuffle'], 2592: ['netrek'], 2593: ['mns-mail'], 2594: ['dts'], 2595: ['worldfusion1'], 2596: ['worldfusion2'], 2597: ['homesteadglory'], 2598: ['citriximaclient'], 2599: ['snapd'], 2600: ['hpstgmgr'], 2601: ['discp-client'], 2602: ['discp-server'], 2603: ['servicemeter'], 2604: ['nsc-ccs'], 2605: ['nsc-posa'], 2606: ['netmon'], 2607: ['connection'], 2608: ['wag-service'], 2609: ['system-monitor'], 2610: ['versa-tek'], 2611: ['lionhead'], 2612: ['qpasa-agent'], 2613: ['smntubootstrap'], 2614: ['neveroffline'], 2615: ['firepower'], 2616: ['appswitch-emp'], 2617: ['cmadmin'], 2618: ['priority-e-com'], 2619: ['bruce'], 2620: ['lpsrecommender'], 2621: ['miles-apart'], 2622: ['metricadbc'], 2623: ['lmdp'], 2624: ['aria'], 2625: ['blwnkl-port'], 2626: ['gbjd816'], 2627: ['moshebeeri'], 2628: ['dict'], 2629: ['sitaraserver'], 2630: ['sitaramgmt'], 2631: ['sitaradir'], 2632: ['irdg-post'], 2633: ['interintelli'], 2634: ['pk-electronics'], 2635: ['backburner'], 2636: ['solve'], 2637: ['imdocsvc'], 2638: ['sybaseanywhere'], 2639: ['aminet'], 2640: ['sai-sentlm'], 2641: ['hdl-srv'], 2642: ['tragic'], 2643: ['gte-samp'], 2644: ['travsoft-ipx-t'], 2645: ['novell-ipx-cmd'], 2646: ['and-lm'], 2647: ['syncserver'], 2648: ['upsnotifyprot'], 2649: ['vpsipport'], 2650: ['eristwoguns'], 2651: ['ebinsite'], 2652: ['interpathpanel'], 2653: ['sonus'], 2654: ['corel-vncadmin'], 2655: ['unglue'], 2656: ['kana'], 2657: ['sns-dispatcher'], 2658: ['sns-admin'], 2659: ['sns-query'], 2660: ['gcmonitor'], 2661: ['olhost'], 2662: ['bintec-capi'], 2663: ['bintec-tapi'], 2664: ['patrol-mq-gm'], 2665: ['patrol-mq-nm'], 2666: ['extensis'], 2667: ['alarm-clock-s'], 2668: ['alarm-clock-c'], 2669: ['toad'], 2670: ['tve-announce'], 2671: ['newlixreg'], 2672: ['nhserver'], 2673: ['firstcall42'], 2674: ['ewnn'], 2675: ['ttc-etap'], 2676: ['simslink'], 2677: ['gadgetgate1way'], 2678: ['gadgetgate2way'], 2679: ['syncserverssl'], 2680: ['pxc-sapxom'], 2681: ['mpnjsomb'], 2683: ['ncdloadbalance'], 2684: ['mpnjsosv'], 2685: ['mpnjsocl'], 2686: ['mpnjsomg'], 2687: ['pq-lic-mgmt'], 2688: ['md-cg-http'], 2689: ['fastlynx'], 2690: ['hp-nnm-data'], 2691: ['itinternet'], 2692: ['admins-lms'], 2694: ['pwrsevent'], 2695: ['vspread'], 2696: ['unifyadmin'], 2697: ['oce-snmp-trap'], 2698: ['mck-ivpip'], 2699: ['csoft-plusclnt'], 2700: ['tqdata'], 2701: ['sms-rcinfo'], 2702: ['sms-xfer'], 2703: ['sms-chat'], 2704: ['sms-remctrl'], 2705: ['sds-admin'], 2706: ['ncdmirroring'], 2707: ['emcsymapiport'], 2708: ['banyan-net'], 2709: ['supermon'], 2710: ['sso-service'], 2711: ['sso-control'], 2712: ['aocp'], 2713: ['raventbs'], 2714: ['raventdm'], 2715: ['hpstgmgr2'], 2716: ['inova-ip-disco'], 2717: ['pn-requester'], 2718: ['pn-requester2'], 2719: ['scan-change'], 2720: ['wkars'], 2721: ['smart-diagnose'], 2722: ['proactivesrvr'], 2723: ['watchdog-nt'], 2724: ['qotps'], 2725: ['msolap-ptp2'], 2726: ['tams'], 2727: ['mgcp-callagent'], 2728: ['sqdr'], 2729: ['tcim-control'], 2730: ['nec-raidplus'], 2731: ['fyre-messanger'], 2732: ['g5m'], 2733: ['signet-ctf'], 2734: ['ccs-software'], 2735: ['netiq-mc'], 2736: ['radwiz-nms-srv'], 2737: ['srp-feedback'], 2738: ['ndl-tcp-ois-gw'], 2739: ['tn-timing'], 2740: ['alarm'], 2741: ['tsb'], 2742: ['tsb2'], 2743: ['murx'], 2744: ['honyaku'], 2745: ['urbisnet'], 2746: ['cpudpencap'], 2747: ['fjippol-swrly'], 2748: ['fjippol-polsvr'], 2749: ['fjippol-cnsl'], 2750: ['fjippol-port1'], 2751: ['fjippol-port2'], 2752: ['rsisysaccess'], 2753: ['de-spot'], 2754: ['apollo-cc'], 2755: ['expresspay'], 2756: ['simplement-tie'], 2757: ['cnrp'], 2758: ['apollo-status'], 2759: ['apollo-gms'], 2760: ['sabams'], 2761: ['dicom-iscl'], 2762: ['dicom-tls'], 2763: ['desktop-dna'], 2764: ['data-insurance'], 2765: ['qip-audup'], 2766: ['compaq-scp'], 2767: ['uadtc'], 2768: ['uacs'], 2769: ['exce'], 2770: ['veronica'], 2771: ['vergencecm'], 2772: ['auris'], 2773: ['rbakcup1'], 2774: ['rbakcup2'], 2775: ['smpp'], 2776: ['ridgeway1'], 2777: ['ridgeway2'], 2778: ['gwen-sonya'], 2779: ['lbc-sync'], 2780: ['lbc-control'], 2781: ['whosells'], 2782: ['everydayrc'], 2783: ['aises'], 2784: ['www-dev'], 2785: ['aic-np'], 2786: ['aic-oncrpc'], 2787: ['piccolo'], 2788: ['fryeserv'], 2789: ['media-agent'], 2790: ['plgproxy'], 2791: ['mtport-regist'], 2792: ['f5-globalsite'], 2793: ['initlsmsad'], 2795: ['livestats'], 2796: ['ac-tech'], 2797: ['esp-encap'], 2798: ['tmesis-upshot'], 2799: ['icon-discover'], 2800: ['acc-raid'], 2801: ['igcp'], 2803: ['btprjctrl'], 2804: ['dvr-esm'], 2805: ['wta-wsp-s'], 2806: ['cspuni'], 2807: ['cspmulti'], 2808: ['j-lan-p'], 2809: ['corbaloc'], 2810: ['netsteward'], 2811: ['gsiftp'], 2812: ['atmtcp'], 2813: ['llm-pass'], 2814: ['llm-csv'], 2815: ['lbc-measure'], 2816: ['lbc-watchdog'], 2817: ['nmsigport'], 2818: ['rmlnk'], 2819: ['fc-faultnotify'], 2820: ['univision'], 2821: ['vrts-at-port'], 2822: ['ka0wuc'], 2823: ['cqg-netlan'], 2824: ['cqg-netlan-1'], 2826: ['slc-systemlog'], 2827: ['slc-ctrlrloops'], 2828: ['itm-lm'], 2829: ['silkp1'], 2830: ['silkp2'], 2831: ['silkp3'], 2832: ['silkp4'], 2833: ['glishd'], 2834: ['evtp'], 2835: ['evtp-data'], 2836: ['catalyst'], 2837: ['repliweb'], 2838: ['starbot'], 2839: ['nmsigport'], 2840: ['l3-exprt'], 2841: ['l3-ranger'], 2842: ['l3-hawk'], 2843: ['pdnet'], 2844: ['bpcp-poll'], 2845: ['bpcp-trap'], 2846: ['aimpp-hello'], 2847: ['aimpp-port-req'], 2848: ['amt-blc-port'], 2849: ['fxp'], 2850: ['metaconsole'], 2851: ['webemshttp'], 2852: ['bears-01'], 2853: ['ispipes'], 2854: ['infomover'], 2855: ['msrp'], 2856: ['cesdinv'], 2857: ['simctlp'], 2858: ['ecnp'], 2859: ['activememory'], 2860: ['dialpad-voice1'], 2861: ['dialpad-voice2'], 2862: ['ttg-protocol'], 2863: ['sonardata'], 2864: ['astromed-main'], 2865: ['pit-vpn'], 2866: ['iwlistener'], 2867: ['esps-portal'], 2868: ['npep-messaging'], 2869: ['icslap'], 2870: ['daishi'], 2871: ['msi-selectplay'], 2872: ['radix'], 2874: ['dxmessagebase1'], 2875: ['dxmessagebase2'], 2876: ['sps-tunnel'], 2877: ['bluelance'], 2878: ['aap'], 2879: ['ucentric-ds'], 2880: ['synapse'], 2881: ['ndsp'], 2882: ['ndtp'], 2883: ['ndnp'], 2884: ['flashmsg'], 2885: ['topflow'], 2886: ['responselogic'], 2887: ['aironetddp'], 2888: ['spcsdlobby'], 2889: ['rsom'], 2890: ['cspclmulti'], 2891: ['cinegrfx-elmd'], 2892: ['snifferdata'], 2893: ['vseconnector'], 2894: ['abacus-remote'], 2895: ['natuslink'], 2896: ['ecovisiong6-1'], 2897: ['citrix-rtmp'], 2898: ['appliance-cfg'], 2899: ['powergemplus'], 2900: ['quicksuite'], 2901: ['allstorcns'], 2902: ['netaspi'], 2903: ['suitcase'], 2904: ['m2ua'], 2906: ['caller9'], 2907: ['webmethods-b2b'], 2908: ['mao'], 2909: ['funk-dialout'], 2910: ['tdaccess'], 2911: ['blockade'], 2912: ['epicon'], 2913: ['boosterware'], 2914: ['gamelobby'], 2915: ['tksocket'], 2916: ['elvin-server'], 2917: ['elvin-client'], 2918: ['kastenchasepad'], 2919: ['roboer'], 2920: ['roboeda'], 2921: ['cesdcdman'], 2922: ['cesdcdtrn'], 2923: ['wta-wsp-wtp-s'], 2924: ['precise-vip'], 2926: ['mobile-file-dl'], 2927: ['unimobilectrl'], 2928: ['redstone-cpss'], 2929: ['amx-webadmin'], 2930: ['amx-weblinx'], 2931: ['circle-x'], 2932: ['incp'], 2933: ['4-tieropmgw'], 2934: ['4-tieropmcli'], 2935: ['qtp'], 2936: ['otpatch'], 2937: ['pnaconsult-lm'], 2938: ['sm-pas-1'], 2939: ['sm-pas-2'], 2940: ['sm-pas-3'], 2941: ['sm-pas-4'], 2942: ['sm-pas-5'], 2943: ['ttnrepository'], 2944: ['megaco-h248'], 2945: ['h248-binary'], 2946: ['fjsvmpor'], 2947: ['gpsd'], 2948: ['wap-push'], 2949: ['wap-pushsecure'], 2950: ['esip'], 2951: ['ottp'], 2952: ['mpfwsas'], 2953: ['ovalarmsrv'], 2954: ['ovalarmsrv-cmd'], 2955: ['csnotify'], 2956: ['ovrimosdbman'], 2957: ['jmact5'], 2958: ['jmact6'], 2959: ['rmopagt'], 2960: ['dfoxserver'], 2961: ['boldsoft-lm'], 2962: ['iph-policy-cli'], 2963: ['iph-policy-adm'], 2964: ['bullant-srap'], 2965: ['bullant-rap'], 2966: ['idp-infotrieve'], 2967: ['ssc-agent'], 2968: ['enpp'], 2969: ['essp'], 2970: ['index-net'], 2971: ['netclip'], 2972: ['pmsm-webrctl'], 2973: ['svnetworks'], 2974: ['signal'], 2975: ['fjmpcm'], 2976: ['cns-srv-port'], 2977: ['ttc-etap-ns'], 2978: ['ttc-etap-ds'], 2979: ['h263-video'], 2980: ['wimd'], 2981: ['mylxamport'], 2982: ['iwb-whiteboard'], 2983: ['netplan'], 2984: ['hpidsadmin'], 2985: ['hpidsagent'], 2986: ['stonefalls'], 2987: ['identify'], 2988: ['hippad'], 2989: ['zarkov'], 2990: ['boscap'], 2991: ['wkstn-mon'], 2992: ['avenyo'], 2993: ['veritas-vis1'], 2994: ['veritas-vis2'], 2995: ['idrs'], 2996: ['vsixml'], 2997: ['rebol'], 2998: ['realsecure'], 2999: ['remoteware-un'], 3000: ['hbci', 'remoteware-cl'], 3002: ['exlm-agent', 'remoteware-srv'], 3003: ['cgms'], 3004: ['csoftragent'], 3005: ['geniuslm'], 3006: ['ii-admin'], 3007: ['lotusmtap'], 3008: ['midnight-tech'], 3009: ['pxc-ntfy'], 3011: ['trusted-web'], 3012: ['twsdss'], 3013: ['gilatskysurfer'], 3014: ['broker-service'], 3015: ['nati-dstp'], 3016: ['notify-srvr'], 3017: ['event-listener'], 3018: ['srvc-registry'], 3019: ['resource-mgr'], 3020: ['cifs'], 3021: ['agriserver'], 3022: ['csregagent'], 3023: ['magicnotes'], 3024: ['nds-sso'], 3025: ['arepa-raft'], 3026: ['agri-gateway'], 3027: ['liebdevmgmt-c'], 3028: ['liebdevmgmt-dm'], 3029: ['liebdevmgmt-a'], 3030: ['arepa-cas'], 3031: ['eppc'], 3032: ['redwood-chat'], 3033: ['pdb'], 3034: ['osmosis-aeea'], 3035: ['fjsv-gssagt'], 3036: ['hagel-dump'], 3037: ['hp-san-mgmt'], 3038: ['santak-ups'], 3039: ['cogitate'], 3040: ['tomato-springs'], 3041: ['di-traceware'], 3042: ['journee'], 3043: ['brp'], 3044: ['epp'], 3045: ['responsenet'], 3046: ['di-ase'], 3047: ['hlserver'], 3048: ['pctrader'], 3049: ['nsws'], 3050: ['gds-db'], 3051: ['galaxy-server'], 3052: ['apc-3052'], 3053: ['dsom-server'], 3054: ['amt-cnf-prot'], 3055: ['policyserver'], 3056: ['cdl-server'], 3057: ['goahead-fldup'], 3058: ['videobeans'], 3059: ['qsoft'], 3060: ['interserver'], 3061: ['cautcpd'], 3062: ['ncacn-ip-tcp'], 3063: ['ncadg-ip-udp'], 3064: ['rprt'], 3065: ['slinterbase'], 3066: ['netattachsdmp'], 3067: ['fjhpjp'], 3068: ['ls3bcast'], 3069: ['ls3'], 3070: ['mgxswitch'], 3071: ['csd-mgmt-port'], 3072: ['csd-monitor'], 3073: ['vcrp'], 3074: ['xbox'], 3075: ['orbix-locator'], 3076: ['orbix-config'], 3077: ['orbix-loc-ssl'], 3078: ['orbix-cfg-ssl'], 3079: ['lv-frontpanel'], 3080: ['stm-pproc'], 3081: ['tl1-lv'], 3082: ['tl1-raw'], 3083: ['tl1-telnet'], 3084: ['itm-mccs'], 3085: ['pcihreq'], 3086: ['jdl-dbkitchen'], 3087: ['asoki-sma'], 3088: ['xdtp'], 3089: ['ptk-alink'], 3090: ['stss'], 3091: ['1ci-smcs'], 3093: ['rapidmq-center'], 3094: ['rapidmq-reg'], 3095: ['panasas'], 3096: ['ndl-aps'], 16900: ['newbay-snc-mc'], 3098: ['umm-port'], 3099: ['chmd'], 3100: ['opcon-xps'], 3101: ['hp-pxpib'], 3102: ['slslavemon'], 3103: ['autocuesmi'], 26262: ['k3software-svr'], 3105: ['cardbox'], 3106: ['cardbox-http'], 3107: ['business'], 3108: ['geolocate'], 3109: ['personnel'], 3110: ['sim-control'], 3111: ['wsynch'], 3112: ['ksysguard'], 3113: ['cs-auth-svr'], 3114: ['ccmad'], 3115: ['mctet-master'], 3116: ['mctet-gateway'], 3117: ['mctet-jserv'], 3118: ['pkagent'], 3119: ['d2000kernel'], 3120: ['d2000webserver'], 33656: ['snip-slave'], 3122: ['vtr-emulator'], 3123: ['edix'], 3124: ['beacon-port'], 3125: ['a13-an'], 24680: ['tcc-http'], 3127: ['ctx-bridge'], 3128: ['ndl-aas'], 3129: ['netport-id'], 3130: ['icpv2'], 3131: ['netbookmark'], 3132: ['ms-rule-engine'], 3133: ['prism-deploy'], 3134: ['ecp'], 3135: ['peerbook-port'], 3136: ['grubd'], 3137: ['rtnt-1'], 3138: ['rtnt-2'], 3139: ['incognitorv'], 3140: ['ariliamulti'], 3141: ['vmodem'], 3142: ['rdc-wh-eos'], 3143: ['seaview'], 3144: ['tarantella'], 3145: ['csi-lfap'], 3146: ['bears-02'], 3147: ['rfio'], 3148: ['nm-game-admin'], 3149: ['nm-game-server'], 3150: ['nm-asses-admin'], 3151: ['nm-assessor'], 3152: ['feitianrockey'], 3153: ['s8-client-port'], 3154: ['ccmrmi'], 3155: ['jpegmpeg'], 3156: ['indura'], 3157: ['e3consultants'], 3158: ['stvp'], 3159: ['navegaweb-port'], 3160: ['tip-app-server'], 3161: ['doc1lm'], 3162: ['sflm'], 3163: ['res-sap'], 3164: ['imprs'], 3165: ['newgenpay'], 3166: ['sossecollector'], 3167: ['nowcontact'], 3168: ['poweronnud'], 3169: ['serverview-as'], 3170: ['serverview-asn'], 3171: ['serverview-gf'], 3172: ['serverview-rm'], 3173: ['serverview-icc'], 3174: ['armi-server'], 3175: ['t1-e1-over-ip'], 3176: ['ars-master'], 3177: ['phonex-port'], 3178: ['radclientport'], 3179: ['h2gf-w-2m'], 3180: ['mc-brk-srv'], 3181: ['bmcpatrolagent'], 3182: ['bmcpatrolrnvu'], 3183: ['cops-tls'], 3184: ['apogeex-port'], 3185: ['smpppd'], 3186: ['iiw-port'], 3187: ['odi-port'], 3188: ['brcm-comm-port'], 3189: ['pcle-infex'], 3190: ['csvr-proxy'], 3191: ['csvr-sslproxy'], 3192: ['firemonrcc'], 3193: ['spandataport'], 3194: ['magbind'], 3195: ['ncu-1'], 3196: ['ncu-2'], 3197: ['embrace-dp-s'], 3198: ['embrace-dp-c'], 3199: ['dmod-workspace'], 3200: ['tick-port'], 3201: ['cpq-tasksmart'], 3202: ['intraintra'], 3203: ['netwatcher-mon'], 3204: ['netwatcher-db'], 3205: ['isns'], 3206: ['ironmail'], 3207: ['vx-auth-port'], 3208: ['pfu-prcallback'], 3209: ['netwkpathengine'], 3210: ['flamenco-proxy'], 3211: ['avsecuremgmt'], 3212: ['surveyinst'], 3213: ['neon24x7'], 3214: ['jmq-daemon-1'], 3215: ['jmq-daemon-2'], 3216: ['ferrari-foam'], 3217: ['unite'], 3218: ['smartpackets'], 3219: ['wms-messenger'], 3220: ['xnm-ssl'], 3221: ['xnm-clear-text'], 3222: ['glbp'], 3223: ['digivote'], 3224: ['aes-discovery'], 3225: ['fcip-port'], 3226: ['isi-irp'], 3227: ['dwnmshttp'], 3228: ['dwmsgserver'], 3229: ['global-cd-port'], 3230: ['sftdst-port'], 3231: ['vidigo'], 3232: ['mdtp'], 3233: ['whisker'], 3234: ['alchemy'], 3235: ['mdap-port'], 3236: ['apparenet-ts'], 3237: ['apparenet-tps'], 3238: ['apparenet-as'], 3239: ['apparenet-ui'], 3240: ['triomotion'], 3241: ['sysorb'], 3242: ['sdp-id-port'], 3243: ['timelot'], 3244: ['onesaf'], 3245: ['vieo-fe'], 3246: ['dvt-system'], 3247: ['dvt-data'], 3248: ['procos-lm'], 3249: ['ssp'], 3250: ['hicp'], 3251: ['sysscanner'], 3252: ['dhe'], 3253: ['pda-data'], 3254: ['pda-sys'], 3255: ['semaphore'], 3256: ['cpqrpm-agent'], 3257: ['cpqrpm-server'], 3258: ['ivecon-port'], 3259: ['epncdp2'], 3260: ['iscsi-target'], 3261: ['winshadow'], 3262: ['necp'], 3263: ['ecolor-imager'], 3264: ['ccmail'], 3265: ['altav-tunnel'], 3266: ['ns-cfg-server'], 3267: ['ibm-dial-out'], 3268: ['msft-gc'], 3269: ['msft-gc-ssl'], 3270: ['verismart'], 3271: ['csoft-prev'], 3272: ['user-manager'], 3273: ['sxmp'], 3274: ['ordinox-server'], 3275: ['samd'], 3276: ['maxim-asics'], 3277: ['awg-proxy'], 3278: ['lkcmserver'], 3279: ['admind'], 3280: ['vs-server'], 3281: ['sysopt'], 3282: ['datusorb'], 3283: ['apple remote desktop (net assistant)'], 3284: ['4talk'], 3285: ['plato'], 3286: ['e-net'], 3287: ['directvdata'], 3288: ['cops'], 3289: ['enpc'], 3290: ['caps-lm'], 3291: ['sah-lm'], 3292: ['cart-o-rama'], 3293: ['fg-fps'], 3294: ['fg-gip'], 3295: ['dyniplookup'], 3296: ['rib-slm'], 3297: ['cytel-lm'], 3298: ['deskview'], 3299: ['pdrncs'], 3302: ['mcs-fastmail'], 3303: ['opsession-clnt'], 3304: ['opsession-srvr'], 3305: ['odette-ftp'], 3306: ['mysql'], 3307: ['opsession-prxy'], 3308: ['tns-server'], 3309: ['tns-adv'], 3310: ['dyna-access'], 3311: ['mcns-tel-ret'], 3312: ['appman-server'], 3313: ['uorb'], 3314: ['uohost'], 3315: ['cdid'], 3316: ['aicc-cmi'], 3317: ['vsaiport'], 3318: ['ssrip'], 3319: ['sdt-lmd'], 3320: ['officelink2000'], 3321: ['vnsstr'], 8294: ['blp4'], 3326: ['sftu'], 3327: ['bbars'], 3328: ['egptlm'], 3329: ['hp-device-disc'], 3330: ['mcs-calypsoicf'], 3331: ['mcs-messaging'], 3332: ['mcs-mailsvr'], 3333: ['dec-notes'], 3334: ['directv-web'], 3335: ['directv-soft'], 3336: ['directv-tick'], 3337: ['directv-catlg'], 3338: ['anet-b'], 3339: ['anet-l'], 3340: ['anet-m'], 3341: ['anet-h'], 3342: ['webtie'], 3343: ['ms-cluster-net'], 3344: ['bnt-manager'], 3345: ['influence'], 3346: ['trnsprntproxy'], 3347: ['phoenix-rpc'], 3348: ['pangolin-laser'], 3349: ['chevinservices'], 3350: ['findviatv'], 3351: ['btrieve'], 3352: ['ssql'], 3353: ['fatpipe'], 3354: ['suitjd'], 3355: ['ordinox-dbase'], 3356: ['upnotifyps'], 3357: ['adtech-test'], 3358: ['mpsysrmsvr'], 3359: ['wg-netforce'], 3360: ['kv-server'], 3361: ['kv-agent'], 3362: ['dj-ilm'], 3363: ['nati-vi-server'], 3364: ['creativeserver'], 3365: ['contentserver'], 3366: ['creativepartnr'], 3372: ['tip2'], 3373: ['lavenir-lm'], 3374: ['cluster-disc'], 3375: ['vsnm-agent'], 3376: ['cdbroker'], 3377: ['cogsys-lm'], 3378: ['wsicopy'], 3379: ['socorfs'], 3380: ['sns-channels'], 3381: ['geneous'], 3382: ['fujitsu-neat'], 3383: ['esp-lm'], 3384: ['hp-clic'], 3385: ['qnxnetman'], 3387: ['backroomnet'], 3388: ['cbserver'], 3389: ['ms-wbt-server'], 3390: ['dsc'], 3391: ['savant'], 3392: ['efi-lm'], 3393: ['d2k-tapestry1'], 3394: ['d2k-tapestry2'], 3395: ['dyna-lm'], 3396: ['printer-agent'], 3397: ['cloanto-lm'], 3398: ['mercantile'], 3399: ['csms'], 3400: ['csms2'], 3401: ['filecast'], 3402: ['fxaengine-net'], 3405: ['nokia-ann-ch1'], 3406: ['nokia-ann-ch2'], 3407: ['ldap-admin'], 3408: ['besapi'], 3409: ['networklens'], 3410: ['networklenss'], 3411: ['biolink-auth'], 3412: ['xmlblaster'], 3413: ['svnet'], 3414: ['wip-port'], 3415: ['bcinameservice'], 3416: ['commandport'], 3417: ['csvr'], 3418: ['rnmap'], 3419: ['softaudit'], 3420: ['ifcp-port'], 3421: ['bmap'], 3422: ['rusb-sys-port'], 3423: ['xtrm'], 3424: ['xtrms'], 3425: ['agps-port'], 3426: ['arkivio'], 3427: ['websphere-snmp'], 3428: ['twcss'], 3429: ['gcsp'], 3430: ['ssdispatch'], 3431: ['ndl-als'], 3432: ['osdcp'], 3433: ['opnet-smp'], 3434: ['opencm'], 3435: ['pacom'], 3436: ['gc-config'], 3437: ['autocueds'], 3438: ['spiral-admin'], 3439: ['hri-port'], 3440: ['ans-console'], 3441: ['connect-client'], 3442: ['connect-server'], 3443: ['ov-nnm-websrv'], 3444: ['denali-server'], 3445: ['monp'], 3446: ['3comfaxrpc'], 3447: ['directnet'], 3448: ['dnc-port'], 3449: ['hotu-chat'], 3450: ['castorproxy'], 3451: ['asam'], 3452: ['sabp-signal'], 3453: ['pscupd'], 3454: ['mira'], 3455: ['prsvp'], 3456: ['vat'], 3457: ['vat-control'], 3458: ['d3winosfi'], 3459: ['integral'], 3460: ['edm-manager'], 3461: ['edm-stager'], 3462: ['edm-std-notify'], 3463: ['edm-adm-notify'], 3464: ['edm-mgr-sync'], 3465: ['edm-mgr-cntrl'], 3466: ['workflow'], 3467: ['rcst'], 3468: ['ttcmremotectrl'], 3469: ['pluribus'], 3470: ['jt400'], 3471: ['jt400-ssl'], 3472: ['jaugsremotec-1'], 3473: ['jaugsremotec-2'], 3474: ['ttntspauto'], 3475: ['genisar-port'], 3476: ['nppmp'], 3477: ['ecomm'], 3478: ['stun', 'stun-behavior', 'turn'], 3479: ['twrpc'], 3480: ['plethora'], 3481: ['cleanerliverc'], 3482: ['vulture'], 3483: ['slim-devices'], 3484: ['gbs-stp'], 3485: ['celatalk'], 3486: ['ifsf-hb-port'], 3488: ['fs-rh-srv'], 3489: ['dtp-dia'], 3490: ['colubris'], 3491: ['swr-port'], 3492: ['tvdumtray-port'], 3493: ['nut'], 3494: ['ibm3494'], 3495: ['seclayer-tcp'], 3496: ['seclayer-tls'], 3497: ['ipether232port'], 3498: ['dashpas-port'], 3499: ['sccip-media'], 3500: ['rtmp-port'], 3501: ['isoft-p2p'], 3502: ['avinstalldisc'], 3503: ['lsp-ping'], 3504: ['ironstorm'], 3505: ['ccmcomm'], 3506: ['apc-3506'], 3507: ['nesh-broker'], 3508: ['interactionweb'], 3509: ['vt-ssl'], 3510: ['xss-port'], 3511: ['webmail-2'], 3512: ['aztec'], 3513: ['arcpd'], 3514: ['must-p2p'], 3515: ['must-backplane'], 3516: ['smartcard-port'], 3517: ['802-11-iapp'], 3518: ['artifact-msg'], 9025: ['swa-3'], 3520: ['galileolog'], 3521: ['mc3ss'], 3522: ['nssocketport'], 3523: ['odeumservlink'], 3524: ['ecmport'], 3525: ['eisport'], 3526: ['starquiz-port'], 3527: ['beserver-msg-q'], 3528: ['jboss-iiop'], 3529: ['jboss-iiop-ssl'], 3530: ['gf'], 3531: ['joltid'], 3532: ['raven-rmp'], 3533: ['raven-rdp'], 3534: ['urld-port'], 3535: ['ms-la'], 3536: ['snac'], 3537: ['ni-visa-remote'], 3538: ['ibm-diradm'], 3539: ['ibm-diradm-ssl'], 3540: ['pnrp-port'], 3541: ['voispeed-port'], 3542: ['hacl-monitor'], 3543: ['qftest-lookup'], 3544: ['teredo'], 3545: ['camac'], 3547: ['symantec-sim'], 3548: ['interworld'], 3549: ['tellumat-nms'], 3550: ['ssmpp'], 3551: ['apcupsd'], 3552: ['taserver'], 3553: ['rbr-discovery'], 3554: ['questnotify'], 3555: ['razor'], 3556: ['sky-transport'], 3557: ['personalos-001'], 3558: ['mcp-port'], 3559: ['cctv-port'], 3560: ['iniserve-port'], 3561: ['bmc-onekey'], 3562: ['sdbproxy'], 3563: ['watcomdebug'], 3564: ['esimport'], 8786: ['msgclnt'], 3567: ['enc-eps'], 3568: ['enc-tunnel-sec'], 3569: ['mbg-ctrl'], 3570: ['mccwebsvr-port'], 3571: ['megardsvr-port'], 3572: ['megaregsvrport'], 3573: ['tag-ups-1'], 3575: ['ccm-port'], 3576: ['cmc-port'], 3577: ['config-port'], 3578: ['data-port'], 3579: ['ttat3lb'], 3580: ['nati-svrloc'], 3581: ['kfxaclicensing'], 3582: ['press'], 3583: ['canex-watch'], 3584: ['u-dbap'], 3585: ['emprise-lls'], 3586: ['emprise-lsc'], 3587: ['p2pgroup'], 3588: ['sentinel'], 3589: ['isomair'], 3590: ['wv-csp-sms'], 3591: ['gtrack-server'], 3592: ['gtrack-ne'], 3593: ['bpmd'], 3594: ['mediaspace'], 3595: ['shareapp'], 3596: ['iw-mmogame'], 3597: ['a14'], 3598: ['a15'], 3599: ['quasar-server'], 3600: ['trap-daemon'], 3601: ['visinet-gui'], 3602: ['infiniswitchcl'], 3603: ['int-rcv-cntrl'], 3604: ['bmc-jmx-port'], 3605: ['comcam-io'], 3606: ['splitlock'], 3607: ['precise-i3'], 3608: ['trendchip-dcp'], 3609: ['cpdi-pidas-cm'], 3610: ['echonet'], 3611: ['six-degrees'], 3612: ['hp-dataprotect'], 3613: ['alaris-disc'], 3614: ['sigma-port'], 3615: ['start-network'], 3616: ['cd3o-protocol'], 3617: ['sharp-server'], 3618: ['aairnet-1'], 3619: ['aairnet-2'], 3620: ['ep-pcp'], 3621: ['ep-nsp'], 3622: ['ff-lr-port'], 3623: ['haipe-discover'], 3624: ['dist-upgrade'], 3625: ['volley'], 3626: ['bvcdaemon-port'], 3627: ['jamserverport'], 3628: ['ept-machine'], 3629: ['escvpnet'], 3630: ['cs-remote-db'], 3631: ['cs-services'], 3632: ['distcc'], 3633: ['wacp'], 3634: ['hlibmgr'], 3635: ['sdo'], 3636: ['servistaitsm'], 3637: ['scservp'], 3638: ['ehp-backup'], 3639: ['xap-ha'], 3640: ['netplay-port1'], 3641: ['netplay-port2'], 3642: ['juxml-port'], 3643: ['audiojuggler'], 3644: ['ssowatch'], 3645: ['cyc'], 3646: ['xss-srv-port'], 3647: ['splitlock-gw'], 3648: ['fjcp'], 3649: ['nmmp'], 3650: ['prismiq-plugin'], 3651: ['xrpc-registry'], 3652: ['vxcrnbuport'], 3653: ['tsp'], 3654: ['vaprtm'], 3655: ['abatemgr'], 3656: ['abatjss'], 3657: ['immedianet-bcn'], 3658: ['ps-ams'], 3659: ['apple-sasl'], 3660: ['can-nds-ssl'], 3661: ['can-ferret-ssl'], 3662: ['pserver'], 3663: ['dtp'], 3664: ['ups-engine'], 3665: ['ent-engine'], 3666: ['eserver-pap'], 3667: ['infoexch'], 3668: ['dell-rm-port'], 3669: ['casanswmgmt'], 3670: ['smile'], 3671: ['efcp'], 3672: ['lispworks-orb'], 3673: ['mediavault-gui'], 3674: ['wininstall-ipc'], 3675: ['calltrax'], 3676: ['va-pacbase'], 3677: ['roverlog'], 3678: ['ipr-dglt'], 3679: ['escale (newton dock)'], 3680: ['npds-tracker'], 3681: ['bts-x73'], 3682: ['cas-mapi'], 3683: ['bmc-ea'], 3684: ['faxstfx-port'], 3685: ['dsx-agent'], 3686: ['tnmpv2'], 3687: ['simple-push'], 3688: ['simple-push-s'], 3689: ['daap'], 3690: ['svn'], 3691: ['magaya-network'], 3692: ['intelsync'], 3695: ['bmc-data-coll'], 3696: ['telnetcpcd'], 3697: ['nw-license'], 3698: ['sagectlpanel'], 3699: ['kpn-icw'], 3700: ['lrs-paging'], 3701: ['netcelera'], 3702: ['ws-discovery'], 3703: ['adobeserver-3'], 3704: ['adobeserver-4'], 3705: ['adobeserver-5'], 3706: ['rt-event'], 3707: ['rt-event-s'], 3708: ['sun-as-iiops'], 3709: ['ca-idms'], 3710: ['portgate-auth'], 3711: ['edb-server2'], 3712: ['sentinel-ent'], 3713: ['tftps'], 3714: ['delos-dms'], 3715: ['anoto-rendezv'], 3716: ['wv-csp-sms-cir'], 3717: ['wv-csp-udp-cir'], 3718: ['opus-services'], 3719: ['itelserverport'], 3720: ['ufastro-instr'], 3721: ['xsync'], 3722: ['xserveraid'], 3723: ['sychrond'], 3724: ['blizwow'], 3725: ['na-er-tip'], 3726: ['array-manager'], 3727: ['e-mdu'], 3728: ['e-woa'], 3729: ['fksp-audit'], 3730: ['client-ctrl'], 3731: ['smap'], 3732: ['m-wnn'], 3733: ['multip-msg'], 3734: ['synel-data'], 3735: ['pwdis'], 3736: ['rs-rmi'], 3738: ['versatalk'], 3739: ['launchbird-lm'], 3740: ['heartbeat'], 3741: ['wysdma'], 3742: ['cst-port'], 3743: ['ipcs-command'], 3744: ['sasg'], 3745: ['gw-call-port'], 3746: ['linktest'], 3747: ['linktest-s'], 3748: ['webdata'], 3749: ['cimtrak'], 3750: ['cbos-ip-port'], 3751: ['gprs-cube'], 3752: ['vipremoteagent'], 3753: ['nattyserver'], 3754: ['timestenbroker'], 3755: ['sas-remote-hlp'], 3756: ['canon-capt'], 3757: ['grf-port'], 3758: ['apw-registry'], 3759: ['exapt-lmgr'], 3760: ['adtempusclient'], 3761: ['gsakmp'], 3762: ['gbs-smp'], 3763: ['xo-wave'], 3764: ['mni-prot-rout'], 3765: ['rtraceroute'], 3767: ['listmgr-port'], 3768: ['rblcheckd'], 3769: ['haipe-otnk'], 3770: ['cindycollab'], 3771: ['paging-port'], 3772: ['ctp'], 3773: ['ctdhercules'], 3774: ['zicom'], 3775: ['ispmmgr'], 3776: ['dvcprov-port'], 3777: ['jibe-eb'], 3778: ['c-h-it-port'], 3779: ['cognima'], 3780: ['nnp'], 3781: ['abcvoice-port'], 3782: ['iso-tp0s'], 3783: ['bim-pem'], 3784: ['bfd-control'], 3785: ['bfd-echo'], 3786: ['upstriggervsw'], 3787: ['fintrx'], 3788: ['isrp-port'], 3789: ['remotedeploy'], 3790: ['quickbooksrds'], 3791: ['tvnetworkvideo'], 3792: ['sitewatch'], 3793: ['dcsoftware'], 3794: ['jaus'], 3795: ['myblast'], 3796: ['spw-dialer'], 3797: ['idps'], 3798: ['minilock'], 3799: ['radius-dynauth'], 3800: ['pwgpsi'], 3801: ['ibm-mgr'], 3802: ['vhd'], 3803: ['soniqsync'], 3804: ['iqnet-port'], 3805: ['tcpdataserver'], 3806: ['wsmlb'], 3807: ['spugna'], 3808: ['sun-as-iiops-ca'], 3809: ['apocd'], 3810: ['wlanauth'], 3811: ['amp'], 3812: ['neto-wol-server'], 3813: ['rap-ip'], 3814: ['neto-dcs'], 3815: ['lansurveyorxml'], 3816: ['sunlps-http'], 3817: ['tapeware'], 3818: ['crinis-hb'], 3819: ['epl-slp'], 3820: ['scp'], 3821: ['pmcp'], 3822: ['acp-discovery'], 3823: ['acp-conduit'], 3824: ['acp-policy'], 3825: ['ffserver'], 3826: ['warmux'], 3827: ['netmpi'], 3828: ['neteh'], 3829: ['neteh-ext'], 3830: ['cernsysmgmtagt'], 3831: ['dvapps'], 3832: ['xxnetserver'], 3833: ['aipn-auth'], 3834: ['spectardata'], 3835: ['spectardb'], 3836: ['markem-dcp'], 3837: ['mkm-discovery'], 3838: ['sos'], 3839: ['amx-rms'], 3840: ['flirtmitmir'], 3841: ['zfirm-shiprush3'], 3842: ['nhci'], 3843: ['quest-agent'], 3844: ['rnm'], 3845: ['v-one-spp'], 3846: ['an-pcp'], 3847: ['msfw-control'], 3848: ['item'], 3849: ['spw-dnspreload'], 3850: ['qtms-bootstrap'], 3851: ['spectraport'], 3852: ['sse-app-config'], 3853: ['sscan'], 3854: ['stryker-com'], 3855: ['opentrac'], 3856: ['informer'], 3857: ['trap-port'], 3858: ['trap-port-mom'], 3859: ['nav-port'], 3860: ['sasp'], 3861: ['winshadow-hd'], 3862: ['giga-pocket'], 3865: ['xpl'], 3866: ['dzdaemon'], 3867: ['dzoglserver'], 3869: ['ovsam-mgmt'], 3870: ['ovsam-d-agent'], 3871: ['avocent-adsap'], 3872: ['oem-agent'], 3873: ['fagordnc'], 3874: ['sixxsconfig'], 3875: ['pnbscada'], 3876: ['dl-agent'], 3877: ['xmpcr-interface'], 3878: ['fotogcad'], 3879: ['appss-lm'], 3880: ['igrs'], 3881: ['idac'], 3882: ['msdts1'], 3883: ['vrpn'], 3884: ['softrack-meter'], 3885: ['topflow-ssl'], 3886: ['nei-management'], 3887: ['ciphire-data'], 3888: ['ciphire-serv'], 3889: ['dandv-tester'], 3890: ['ndsconnect'], 3891: ['rtc-pm-port'], 3892: ['pcc-image-port'], 3893: ['cgi-starapi'], 3894: ['syam-agent'], 3895: ['syam-smc'], 3896: ['sdo-tls'], 3897: ['sdo-ssh'], 3898: ['senip'], 3899: ['itv-control'], 3900: ['udt-os'], 3901: ['nimsh'], 3902: ['nimaux'], 3903: ['charsetmgr'], 3904: ['omnilink-port'], 3905: ['mupdate'], 3906: ['topovista-data'], 3907: ['imoguia-port'], 3908: ['hppronetman'], 3909: ['surfcontrolcpa'], 3910: ['prnrequest'], 3911: ['prnstatus'], 3912: ['gbmt-stars'], 3913: ['listcrt-port'], 3914: ['listcrt-port-2'], 3915: ['agcat'], 3916: ['wysdmc'], 3917: ['aftmux'], 3918: ['pktcablemmcops'], 3919: ['hyperip'], 3920: ['exasoftport1'], 3921: ['herodotus-net'], 3922: ['sor-update'], 3923: ['symb-sb-port'], 3924: ['mpl-gprs-port'], 3925: ['zmp'], 3926: ['winport'], 3927: ['natdataservice'], 3928: ['netboot-pxe'], 3929: ['smauth-port'], 3930: ['syam-webserver'], 3931: ['msr-plugin-port'], 3932: ['dyn-site'], 3933: ['plbserve-port'], 3934: ['sunfm-port'], 3935: ['sdp-portmapper'], 3936: ['mailprox'], 3937: ['dvbservdsc'], 3938: ['dbcontrol-agent'], 3939: ['aamp'], 3940: ['xecp-node'], 3941: ['homeportal-web'], 3942: ['srdp'], 3943: ['tig'], 3944: ['sops'], 3945: ['emcads'], 3946: ['backupedge'], 3947: ['ccp'], 3948: ['apdap'], 3949: ['drip'], 3950: ['namemunge'], 3951: ['pwgippfax'], 3952: ['i3-sessionmgr'], 3953: ['xmlink-connect'], 3954: ['adrep'], 3955: ['p2pcommunity'], 3956: ['gvcp'], 3957: ['mqe-broker'], 3958: ['mqe-agent'], 3959: ['treehopper'], 3960: ['bess'], 3961: ['proaxess'], 3962: ['sbi-agent'], 3963: ['thrp'], 3964: ['sasggprs'], 3965: ['ati-ip-to-ncpe'], 3966: ['bflckmgr'], 3967: ['ppsms'], 3968: ['ianywhere-dbns'], 3969: ['landmarks'], 3970: ['lanrevagent'], 3971: ['lanrevserver'], 3972: ['iconp'], 3973: ['progistics'], 3974: ['citysearch'], 3975: ['airshot'], 3976: ['opswagent'], 3977: ['opswmanager'], 3978: ['secure-cfg-svr'], 3979: ['smwan'], 3980: ['acms'], 3981: ['starfish'], 3982: ['eis'], 3983: ['eisp'], 3984: ['mapper-nodemgr'], 3985: ['mapper-mapethd'], 3986: ['mapper-ws-ethd'], 3987: ['centerline'], 3988: ['dcs-config'], 3989: ['bv-queryengine'], 3990: ['bv-is'], 3991: ['bv-smcsrv'], 3992: ['bv-ds'], 3993: ['bv-agent'], 3995: ['iss-mgmt-ssl'], 3996: ['abcsoftware'], 3997: ['agentsease-db'], 3998: ['dnx'], 3999: ['nvcnet'], 4000: ['terabase'], 4001: ['newoak'], 4002: ['pxc-spvr-ft'], 4003: ['pxc-splr-ft'], 4004: ['pxc-roid'], 4005: ['pxc-pin'], 4006: ['pxc-spvr'], 4007: ['pxc-splr'], 4008: ['netcheque'], 4009: ['chimera-hwm'], 4010: ['samsung-unidex'], 4011: ['altserviceboot'], 4012: ['pda-gate'], 4013: ['acl-manager'], 4014: ['taiclock'], 4015: ['talarian-mcast1'], 4016: ['talarian-mcast2'], 4017: ['talarian-mcast3'], 4018: ['talarian-mcast4'], 4019: ['talarian-mcast5'], 4020: ['trap'], 4021: ['nexus-portal'], 4022: ['dnox'], 4023: ['esnm-zoning'], 4024: ['tnp1-port'], 4025: ['partimage'], 4026: ['as-debug'], 4027: ['bxp'], 4028: ['dtserver-port'], 4029: ['ip-qsig'], 4030: ['jdmn-port'], 4031: ['suucp'], 4032: ['vrts-auth-port'], 4033: ['sanavigator'], 4034: ['ubxd'], 4035: ['wap-push-http'], 4036: ['wap-push-https'], 4037: ['ravehd'], 4038: ['fazzt-ptp'], 4039: ['fazzt-admin'], 4040: ['yo-main'], 4041: ['houston'], 4042: ['ldxp'], 4043: ['nirp'], 4044: ['ltp'], 4045: ['npp'], 4046: ['acp-proto'], 4047: ['ctp-state'], 4049: ['wafs'], 4050: ['cisco-wafs'], 4051: ['cppdp'], 4052: ['interact'], 4053: ['ccu-comm-1'], 4054: ['ccu-comm-2'], 4055: ['ccu-comm-3'], 4056: ['lms'], 4057: ['wfm'], 4058: ['kingfisher'], 4059: ['dlms-cosem'], 4060: ['dsmeter-iatc'], 4061: ['ice-location'], 4062: ['ice-slocation'], 4063: ['ice-router'], 4064: ['ice-srouter'], 4065: ['avanti-cdp'], 4066: ['pmas'], 4067: ['idp'], 4068: ['ipfltbcst'], 4069: ['minger'], 4070: ['tripe'], 4071: ['aibkup'], 4072: ['zieto-sock'], 4073: ['irapp'], 4074: ['cequint-cityid'], 4075: ['perimlan'], 4076: ['seraph'], 4079: ['santools'], 4080: ['lorica-in'], 4081: ['lorica-in-sec'], 4082: ['lorica-out'], 4083: ['lorica-out-sec'], 8873: ['dxspider'], 4089: ['opencore'], 4090: ['omasgport'], 4091: ['ewinstaller'], 4092: ['ewdgs'], 4093: ['pvxpluscs'], 4094: ['sysrqd'], 4095: ['xtgui'], 4096: ['bre'], 4097: ['patrolview'], 4098: ['drmsfsd'], 4099: ['dpcp'], 4100: ['igo-incognito'], 4101: ['brlp-0'], 4102: ['brlp-1'], 4103: ['brlp-2'], 4104: ['brlp-3'], 4105: ['shofar'], 4106: ['synchronite'], 4107: ['j-ac'], 4108: ['accel'], 4109: ['izm'], 4110: ['g2tag'], 4111: ['xgrid'], 4112: ['apple-vpns-rp'], 4113: ['aipn-reg'], 4114: ['jomamqmonitor'], 4115: ['cds'], 4116: ['smartcard-tls'], 4117: ['hillrserv'], 4118: ['netscript'], 4119: ['assuria-slm'], 4121: ['e-builder'], 4122: ['fprams'], 4123: ['z-wave'], 4124: ['tigv2'], 4125: ['opsview-envoy'], 4126: ['ddrepl'], 4127: ['unikeypro'], 4128: ['nufw'], 4129: ['nuauth'], 4130: ['fronet'], 4131: ['stars'], 4132: ['nuts-dem'], 4133: ['nuts-bootp'], 4134: ['nifty-hmi'], 4135: ['cl-db-attach'], 4136: ['cl-db-request'], 4137: ['cl-db-remote'], 4138: ['nettest'], 4139: ['thrtx'], 4140: ['cedros-fds'], 4141: ['oirtgsvc'], 4142: ['oidocsvc'], 4143: ['oidsr'], 4145: ['vvr-control'], 4146: ['tgcconnect'], 4147: ['vrxpservman'], 4148: ['hhb-handheld'], 4149: ['agslb'], 4150: ['poweralert-nsa'], 4151: ['menandmice-noh'], 4152: ['idig-mux'], 4153: ['mbl-battd'], 4154: ['atlinks'], 4155: ['bzr'], 4156: ['stat-results'], 4157: ['stat-scanner'], 4158: ['stat-cc'], 4159: ['nss'], 4160: ['jini-discovery'], 4161: ['omscontact'], 4162: ['omstopology'], 4163: ['silverpeakpeer'], 4164: ['silverpeakcomm'], 4165: ['altcp'], 4166: ['joost'], 4167: ['ddgn'], 4168: ['pslicser'], 10252: ['apollo-relay'], 4172: ['pcoip'], 13819: ['dsmcc-session'], 4177: ['wello'], 4178: ['storman'], 4179: ['maxumsp'], 4180: ['httpx'], 4181: ['macbak'], 4182: ['pcptcpservice'], 4183: ['gmmp'], 4184: ['universe-suite'], 4185: ['wcpp'], 4188: ['vatata'], 4199: ['eims-admin'], 11321: ['arena-server'], 10260: ['axis-wimp-port'], 16995: ['amt-redir-tls'], 8899: ['ospf-lite'], 8901: ['jmb-cds2'], 10000: ['ndmp'], 18463: ['ac-cluster'], 20670: ['track'], 4300: ['corelccam'], 4301: ['d-data'], 4302: ['d-data-control'], 4303: ['srcp'], 4304: ['owserver'], 4305: ['batman'], 4306: ['pinghgl'], 4307: ['visicron-vs'], 4308: ['compx-lockview'], 4309: ['dserver'], 4310: ['mirrtex'], 28240: ['siemensgsm'], 8800: ['sunwebadmin'], 4320: ['fdt-rcatp'], 4321: ['rwhois'], 4322: ['trim-event'], 4323: ['trim-ice'], 4324: ['balour'], 4325: ['geognosisman'], 4326: ['geognosis'], 4327: ['jaxer-web'], 4328: ['jaxer-manager'], 15740: ['ptp'], 4340: ['gaia'], 4341: ['lisp-data'], 4343: ['unicall'], 4344: ['vinainstall'], 4345: ['m4-network-as'], 4346: ['elanlm'], 4347: ['lansurveyor'], 4348: ['itose'], 4349: ['fsportmap'], 4350: ['net-device'], 4351: ['plcy-net-svcs'], 4352: ['pjlink'], 4353: ['f5-iquery'], 4354: ['qsnet-trans'], 4355: ['qsnet-workst'], 4356: ['qsnet-assist'], 4357: ['qsnet-cond'], 4358: ['qsnet-nucl'], 4359: ['omabcastltkm'], 16994: ['amt-redir-tcp'], 4368: ['wxbrief'], 4369: ['epmd'], 4370: ['elpro-tunnel'], 4372: ['l2c-data'], 4373: ['remctl'], 4375: ['tolteces'], 4376: ['bip'], 4377: ['cp-spxsvr'], 4378: ['cp-spxdpy'], 4379: ['ctdb'], 9966: ['odnsp'], 4389: ['xandros-cms'], 4390: ['wiegand'], 8320: ['tnp-discover'], 4395: ['omnivisionesx'], 4400: ['ds-srv'], 4401: ['ds-srvr'], 4402: ['ds-clnt'], 4403: ['ds-user'], 4404: ['ds-admin'], 4405: ['ds-mail'], 4406: ['ds-slp'], 4425: ['netrockey6'], 4426: ['beacon-port-2'], 4430: ['rsqlserver'], 4432: ['l-acoustics'], 24676: ['canditv'], 4442: ['saris'], 4443: ['pharos'], 4444: ['krb524', 'nv-video'], 4445: ['upnotifyp'], 4446: ['n1-fwp'], 4447: ['n1-rmgmt'], 4448: ['asc-slmd'], 4449: ['privatewire'], 4450: ['camp'], 4451: ['ctisystemmsg'], 4452: ['ctiprogramload'], 4453: ['nssalertmgr'], 4454: ['nssagentmgr'], 4455: ['prchat-user'], 4456: ['prchat-server'], 4457: ['prregister'], 4458: ['mcp'], 10107: ['bctp-server'], 4484: ['hpssmgmt'], 4486: ['icms'], 4488: ['awacs-ice'], 45966: ['ssr-servermgr'], 4500: ['ipsec-nat-t'], 25003: ['icl-twobase4'], 16950: ['sgcip'], 4535: ['ehs'], 4536: ['ehs-ssl'], 4537: ['wssauthsvc'], 4538: ['swx-gate'], 8880: ['cddbp-alt'], 4545: ['worldscores'], 4546: ['sf-lm'], 4547: ['lanner-lm'], 4548: ['synchromesh'], 4549: ['aegate'], 4550: ['gds-adppiw-db'], 4551: ['ieee-mih'], 4552: ['menandmice-mon'], 4554: ['msfrs'], 4555: ['rsip'], 28200: ['voxelstorm'], 4559: ['hylafax'], 12753: ['tsaf'], 14414: ['ca-web-update'], 4566: ['kwtc'], 4567: ['tram'], 4568: ['bmc-reporting'], 4569: ['iax'], 8954: ['cumulus-admin'], 18634: ['rds-ib'], 4591: ['l3t-at-an'], 4593: ['ipt-anri-anri'], 4594: ['ias-session'], 4595: ['ias-paging'], 4596: ['ias-neighbor'], 4597: ['a21-an-1xbs'], 4598: ['a16-an-an'], 4599: ['a17-an-an'], 4600: ['piranha1'], 4601: ['piranha2'], 20999: ['athand-mmp'], 21000: ['irtrans'], 8610: ['canon-mfnp'], 8883: ['secure-mqtt'], 16992: ['amt-soap-http'], 33434: ['traceroute'], 8611: ['canon-bjnp1'], 4658: ['playsta2-app'], 4659: ['playsta2-lob'], 4660: ['smaclmgr'], 4661: ['kar2ouche'], 4662: ['oms'], 4663: ['noteit'], 4664: ['ems'], 4665: ['contclientms'], 4666: ['eportcomm'], 4667: ['mmacomm'], 4668: ['mmaeds'], 4669: ['eportcommdata'], 4670: ['light'], 4671: ['acter'], 4672: ['rfa'], 4673: ['cxws'], 4674: ['appiq-mgmt'], 4675: ['dhct-status'], 4676: ['dhct-alerts'], 4677: ['bcs'], 4678: ['traversal'], 4679: ['mgesupervision'], 4680: ['mgemanagement'], 4681: ['parliant'], 4682: ['finisar'], 4683: ['spike'], 4684: ['rfid-rp1'], 4685: ['autopac'], 4686: ['msp-os'], 4687: ['nst'], 4688: ['mobile-p2p'], 4689: ['altovacentral'], 4690: ['prelude'], 4691: ['mtn'], 4692: ['conspiracy'], 33123: ['aurora-balaena'], 4700: ['netxms-agent'], 4701: ['netxms-mgmt'], 4702: ['netxms-sync'], 37475: ['neckar'], 8613: ['canon-bjnp3'], 45678: ['eba'], 26000: ['quake'], 4725: ['truckstar'], 4728: ['capmux'], 4730: ['gearman'], 4737: ['ipdr-sp'], 4738: ['solera-lpn'], 4739: ['ipfix'], 4740: ['ipfixs'], 4741: ['lumimgrd'], 4743: ['openhpid'], 4744: ['ifsp'], 4745: ['fmp'], 19999: ['dnp-sec'], 4749: ['profilemac'], 4750: ['ssad'], 4751: ['spocp'], 4752: ['snap'], 13821: ['dsmcc-download'], 24006: ['med-net-svc'], 4784: ['bfd-multi-ctl'], 11720: ['h323callsigalt'], 4800: ['iims'], 4801: ['iwec'], 4802: ['ilss'], 11723: ['emc-xsw-dcache'], 17185: ['soundsvirtual'], 4827: ['htcp'], 4837: ['varadero-0'], 4838: ['varadero-1'], 4839: ['varadero-2'], 4841: ['quosa'], 4842: ['gw-asv'], 4843: ['opcua-tls'], 4844: ['gw-log'], 4845: ['wcr-remlib'], 4846: ['contamac-icm'], 4847: ['wfc'], 4848: ['appserv-http'], 4849: ['appserv-https'], 4850: ['sun-as-nodeagt'], 4851: ['derby-repli'], 13929: ['dta-systems'], 9002: ['dynamid'], 45825: ['qdb2service'], 4867: ['unify-debug'], 4868: ['phrelay'], 4869: ['phrelaydbg'], 4870: ['cc-tracking'], 4871: ['wired'], 32896: ['idmgratm'], 4876: ['tritium-can'], 4877: ['lmcs'], 4884: ['hivestor'], 4885: ['abbs'], 37654: ['unisys-eportal'], 4894: ['lyskom'], 4899: ['radmin-port'], 4900: ['hfcs'], 20000: ['dnp'], 4914: ['bones'], 10110: ['nmea-0183'], 9950: ['apc-9950'], 25004: ['icl-twobase5'], 4940: ['eq-office-4940'], 4941: ['eq-office-4941'], 4942: ['eq-office-4942'], 15363: ['3link'], 10115: ['netiq-endpt'], 4949: ['munin'], 4950: ['sybasesrvmon'], 4951: ['pwgwims'], 4952: ['sagxtsds'], 41794: ['crestron-cip'], 13160: ['i-zipqd'], 4969: ['ccss-qmm'], 4970: ['ccss-qsm'], 11751: ['intrepid-ssl'], 34962: ['profinet-rt'], 9021: ['panagolin-ident'], 12168: ['cawas'], 9022: ['paragent'], 4986: ['mrip'], 4987: ['smar-se-port1'], 4988: ['smar-se-port2'], 4989: ['parallel'], 4990: ['busycal'], 4991: ['vrt'], 9024: ['swa-2'], 8472: ['otv'], 4999: ['hfcs-manager'], 5000: ['commplex-main'], 5001: ['commplex-link'], 5002: ['rfe'], 5003: ['fmpro-internal'], 5004: ['avt-profile-1'], 5005: ['avt-profile-2'], 5006: ['wsm-server'], 5007: ['wsm-server-ssl'], 5008: ['synapsis-edge'], 5009: ['winfs'], 5010: ['telelpathstart'], 5011: ['telelpathattack'], 5012: ['nsp'], 5013: ['fmpro-v6'], 9987: ['dsm-scm-target'], 5020: ['zenginkyo-1'], 5021: ['zenginkyo-2'], 5022: ['mice'], 5023: ['htuilsrv'], 5024: ['scpi-telnet'], 5025: ['scpi-raw'], 5026: ['strexec-d'], 5027: ['strexec-s'], 5029: ['infobright'], 5030: ['surfpass'], 13223: ['powwow-client'], 13224: ['powwow-server'], 5042: ['asnaacceler8db'], 5043: ['swxadmin'], 5044: ['lxi-evntsvc'], 5049: ['ivocalize'], 5050: ['mmcc'], 5051: ['ita-agent'], 5052: ['ita-manager'], 5055: ['unot'], 5056: ['intecom-ps1'], 5057: ['intecom-ps2'], 35004: ['rt-classmanager'], 5059: ['sds'], 5060: ['sip'], 5061: ['sip-tls'], 5062: ['na-localise'], 5064: ['ca-1'], 5065: ['ca-2'], 5066: ['stanag-5066'], 5067: ['authentx'], 5069: ['i-net-2000-npr'], 5070: ['vtsas'], 5071: ['powerschool'], 5072: ['ayiya'], 5073: ['tag-pm'], 5074: ['alesquery'], 32249: ['t1distproc60'], 5080: ['onscreen'], 5081: ['sdl-ets'], 5082: ['qcp'], 5083: ['qfp'], 5084: ['llrp'], 5085: ['encrypted-llrp'], 5093: ['sentinel-lm'], 5094: ['hart-ip'], 5099: ['sentlm-srv2srv'], 5100: ['socalia'], 5102: ['oms-nonsecure'], 9888: ['cyborg-systems'], 5111: ['taep-as-svc'], 5112: ['pm-cmdsvr'], 5120: ['barracuda-bbs'], 5133: ['nbt-pc'], 8763: ['mc-appserver'], 9991: ['osm-oev'], 5137: ['ctsd'], 5145: ['rmonitor-secure'], 11600: ['tempest-port'], 5150: ['atmp'], 5151: ['esri-sde'], 5152: ['sde-discovery'], 5154: ['bzflag'], 5155: ['asctrl-agent'], 5165: ['ife-icorp'], 5166: ['winpcs'], 5167: ['scte104'], 5168: ['scte30'], 21554: ['dfserver'], 44553: ['rbr-debug'], 43188: ['reachout'], 9909: ['domaintime'], 19540: ['sxuptp'], 24677: ['flashfiler'], 5190: ['aol'], 5191: ['aol-1'], 5192: ['aol-2'], 5193: ['aol-3'], 9993: ['palace-2'], 5200: ['targus-getdata'], 5201: ['targus-getdata1'], 5202: ['targus-getdata2'], 5203: ['targus-getdata3'], 21590: ['vofr-gateway'], 35001: ['rt-viewer'], 19541: ['jcp'], 11001: ['metasys'], 5223: ['hpvirtgrp'], 5224: ['hpvirtctrl'], 5225: ['hp-server'], 5226: ['hp-status'], 5227: ['perfd'], 5234: ['eenet'], 5235: ['galaxy-network'], 5236: ['padl2sim'], 5237: ['mnet-discovery'], 10009: ['swdtp-sv'], 5248: ['caacws'], 5249: ['caaclang2'], 5250: ['soagateway'], 5251: ['caevms'], 5252: ['movaz-ssc'], 9995: ['palace-4'], 5264: ['3com-njack-1'], 5265: ['3com-njack-2'], 27999: ['tw-auth-key'], 5270: ['cartographerxmp'], 5272: ['pk'], 9450: ['sntlkeyssrvr'], 5282: ['transmit-port'], 8764: ['openqueue'], 9996: ['palace-5'], 43189: ['ndm-agent-port'], 28000: ['nxlmd'], 5298: ['presence'], 5299: ['nlg-data'], 5300: ['hacl-hb'], 5301: ['hacl-gs'], 5302: ['hacl-cfg'], 5303: ['hacl-probe'], 5304: ['hacl-local'], 5305: ['hacl-test'], 5306: ['sun-mc-grp'], 5307: ['sco-aip'], 5308: ['cfengine'], 5309: ['jprinter'], 5310: ['outlaws'], 5312: ['permabit-cs'], 5313: ['rrdp'], 5314: ['opalis-rbt-ipc'], 5315: ['hacl-poll'], 9997: ['palace-6'], 20001: ['microsan'], 20002: ['commtact-http'], 9080: ['glrpc'], 20003: ['commtact-https'], 18181: ['opsec-cvp'], 32769: ['filenet-rpc'], 5343: ['kfserver'], 5344: ['xkotodrcp'], 25001: ['icl-twobase2'], 9998: ['distinct32'], 5349: ['stun-behaviors', 'stuns', 'turns'], 39681: ['turbonote-1'], 5352: ['dns-llq'], 5353: ['mdns'], 5354: ['mdnsresponder'], 5355: ['llmnr'], 5356: ['ms-smlbiz'], 5357: ['wsdapi'], 5358: ['wsdapi-s'], 5359: ['ms-alerter'], 5360: ['ms-sideshow'], 5361: ['ms-s-sideshow'], 5362: ['serverwsd2'], 5363: ['net-projection'], 25002: ['icl-twobase3'], 9999: ['distinct'], 9092: ['xmlipcregsvc'], 18183: ['opsec-sam'], 25005: ['icl-twobase6'], 5397: ['stresstester'], 5398: ['elektron-admin'], 5399: ['securitychase'], 5400: ['excerpt'], 5401: ['excerpts'], 5402: ['mftp'], 5403: ['hpoms-ci-lstn'], 5404: ['hpoms-dps-lstn'], 5405: ['netsupport'], 5406: ['systemics-sox'], 5407: ['foresyte-clear'], 5408: ['foresyte-sec'], 5409: ['salient-dtasrv'], 5410: ['salient-usrmgr'], 5411: ['actnet'], 5412: ['continuus'], 5413: ['wwiotalk'], 5414: ['statusd'], 5415: ['ns-server'], 5416: ['sns-gateway'], 5417: ['sns-agent'], 5418: ['mcntp'], 5419: ['dj-ice'], 5420: ['cylink-c'], 5421: ['netsupport2'], 5422: ['salient-mux'], 5423: ['virtualuser'], 5424: ['beyond-remote'], 5425: ['br-channel'], 5426: ['devbasic'], 5427: ['sco-peer-tta'], 5428: ['telaconsole'], 5429: ['base'], 5430: ['radec-corp'], 5431: ['park-agent'], 5432: ['postgresql'], 5433: ['pyrrho'], 5434: ['sgi-arrayd'], 5435: ['sceanics'], 10001: ['scp-config'], 5443: ['spss'], 43190: ['ip-provision'], 18185: ['opsec-omi'], 5453: ['surebox'], 5454: ['apc-5454'], 5455: ['apc-5455'], 5456: ['apc-5456'], 5461: ['silkmeter'], 5462: ['ttl-publisher'], 5463: ['ttlpriceproxy'], 5464: ['quailnet'], 5465: ['netops-broker'], 10002: ['documentum'], 9103: ['bacula-sd'], 9104: ['peerwire'], 10100: ['itap-ddtp'], 9105: ['xadmin'], 18186: ['ohsc'], 9911: ['sype-transport'], 8787: ['msgsrvr'], 25006: ['icl-twobase7'], 10003: ['documentum-s'], 13822: ['dsmcc-ccp'], 11367: ['atm-uhas'], 5500: ['fcp-addr-srvr1'], 5501: ['fcp-addr-srvr2'], 5502: ['fcp-srvr-inst1'], 5503: ['fcp-srvr-inst2'], 5504: ['fcp-cics-gw1'], 5505: ['checkoutdb'], 5506: ['amc'], 8567: ['enc-tunnel'], 18187: ['opsec-ela'], 20034: ['nburn-id'], 25007: ['icl-twobase8'], 13720: ['bprd'], 13721: ['bpdbm'], 13722: ['bpjava-msvc'], 13724: ['vnetd'], 5553: ['sgi-eventmond'], 5554: ['sgi-esphttp'], 5555: ['personal-agent'], 5556: ['freeciv'], 5567: ['enc-eps-mc-sec'], 5568: ['sdt'], 13216: ['bcslogc'], 5573: ['sdmmp'], 13217: ['rs-pias'], 5580: ['tmosms0'], 5581: ['tmosms1'], 5582: ['fac-restore'], 5583: ['tmo-icon-sync'], 5584: ['bis-web'], 5585: ['bis-sync'], 10116: ['netiq-voipa'], 20046: ['tmophl7mts'], 13782: ['bpcd'], 13783: ['vopied'], 13785: ['nbdb'], 13786: ['nomdb'], 5597: ['ininmessaging'], 5598: ['mctfeed'], 5599: ['esinstall'], 5600: ['esmmanager'], 5601: ['esmagent'], 5602: ['a1-msc'], 5603: ['a1-bs'], 5604: ['a3-sdunode'], 5605: ['a4-sdunode'], 20049: ['nfsrdma'], 10007: ['mvs-capacity'], 22001: ['optocontrol'], 22002: ['optohost002'], 11371: ['hkp'], 22004: ['optohost004'], 22005: ['optohost004'], 13818: ['dsmcc-config'], 5627: ['ninaf'], 5628: ['htrust'], 5629: ['symantec-sfdb'], 5630: ['precise-comm'], 5631: ['pcanywheredata'], 5632: ['pcanywherestat'], 5633: ['beorl'], 5634: ['xprtld'], 10008: ['octopus'], 20005: ['openwebnet'], 19283: ['keysrvr'], 22305: ['cis'], 5671: ['amqps'], 5672: ['amqp'], 5673: ['jms'], 5674: ['hyperscsi-port'], 5675: ['v5ua'], 5676: ['raadmin'], 5677: ['questdb2-lnchr'], 5678: ['rrac'], 5679: ['dccm'], 5680: ['auriga-router'], 5681: ['ncxcp'], 30260: ['kingdomsonline'], 5688: ['ggz'], 5689: ['qmvideo'], 13894: ['ucontrol'], 5713: ['proshareaudio'], 5714: ['prosharevideo'], 5715: ['prosharedata'], 5716: ['prosharerequest'], 5717: ['prosharenotify'], 5718: ['dpm'], 5719: ['dpm-agent'], 5720: ['ms-licensing'], 5721: ['dtpt'], 5722: ['msdfsr'], 5723: ['omhs'], 5724: ['omsdk'], 5729: ['openmail'], 5730: ['unieng'], 8276: ['pando-sec'], 5741: ['ida-discover1'], 5742: ['ida-discover2'], 5743: ['watchdoc-pod'], 5744: ['watchdoc'], 5745: ['fcopy-server'], 5746: ['fcopys-server'], 5747: ['tunatic'], 5748: ['tunalyzer'], 5750: ['rscd'], 8300: ['tmi'], 5755: ['openmailg'], 5757: ['x500ms'], 5766: ['openmailns'], 5767: ['s-openmail'], 5768: ['openmailpxy'], 5769: ['spramsca'], 5770: ['spramsd'], 5771: ['netagent'], 5777: ['dali-port'], 19539: ['fxuptp'], 5781: ['3par-evts'], 5782: ['3par-mgmt'], 5783: ['3par-mgmt-ssl'], 5785: ['3par-rcopy'], 8376: ['cruise-enum'], 5793: ['xtreamx'], 14000: ['scotty-ft'], 14001: ['sua'], 5813: ['icmpd'], 5814: ['spt-automation'], 8377: ['cruise-swroute'], 14033: ['sage-best-com1'], 14034: ['sage-best-com2'], 8378: ['cruise-config'], 11106: ['sgi-lk'], 5859: ['wherehoo'], 5863: ['ppsuitemsg'], 8379: ['cruise-diags'], 22273: ['wnn6'], 10540: ['mos-lower'], 5900: ['rfb'], 10541: ['mos-upper'], 9900: ['iua'], 8380: ['cruise-update'], 10542: ['mos-aux'], 5910: ['cm'], 5911: ['cpdlc'], 5912: ['fis'], 5913: ['ads-c'], 10543: ['mos-soap'], 10544: ['mos-soap-opt'], 32773: ['filenet-cm'], 24678: ['proactivate'], 14141: ['vcs-app'], 14142: ['icpp'], 14145: ['gcm-app'], 14149: ['vrts-tdd'], 22343: ['cis-secure'], 14154: ['vad'], 5963: ['indy'], 22350: ['codemeter'], 5968: ['mppolicy-v5'], 5969: ['mppolicy-mgr'], 8201: ['trivnet2'], 36865: ['kastenxpipe'], 22763: ['talikaserver'], 5984: ['couchdb'], 5985: ['wsman'], 5986: ['wsmans'], 5987: ['wbem-rmi'], 5988: ['wbem-http'], 5989: ['wbem-https'], 5990: ['wbem-exp-https'], 5991: ['nuxsl'], 5992: ['consul-insight'], 9191: ['sun-as-jpda'], 8383: ['m2mservices'], 5999: ['cvsup'], 9747: ['l5nas-parchan'], 11111: ['vce'], 17756: ['zigbee-ips'], 32770: ['filenet-nch'], 11112: ['dicom'], 17754: ['zep'], 46999: ['mediabox'], 47000: ['mbus'], 16991: ['intel-rci-mp'], 26208: ['wnn6-ds'], 14250: ['cps'], 9202: ['wap-wsp-s'], 6064: ['ndl-ahp-svc'], 6065: ['winpharaoh'], 6066: ['ewctsp'], 6069: ['trip'], 6070: ['messageasap'], 6071: ['ssdtp'], 6072: ['diagnose-proc'], 6073: ['directplay8'], 6074: ['max'], 6085: ['konspire2b'], 6086: ['pdtp'], 6087: ['ldss'], 9750: ['board-voip'], 6100: ['synchronet-db'], 6101: ['synchronet-rtc'], 6102: ['synchronet-upd'], 6103: ['rets'], 6104: ['dbdb'], 6105: ['primaserver'], 6106: ['mpsserver'], 6107: ['etc-control'], 6108: ['sercomm-scadmin'], 6109: ['globecast-id'], 6110: ['softcm'], 6111: ['spc'], 6112: ['dtspcd'], 18769: ['ique'], 6122: ['bex-webadmin'], 6123: ['backup-express'], 6124: ['pnbs'], 9213: ['serverstart'], 6133: ['nbt-wol'], 6140: ['pulsonixnls'], 6141: ['meta-corp'], 6142: ['aspentec-lm'], 6143: ['watershed-lm'], 6144: ['statsci1-lm'], 6145: ['statsci2-lm'], 6146: ['lonewolf-lm'], 6147: ['montage-lm'], 6148: ['ricardo-lm'], 6149: ['tal-pod'], 9217: ['fsc-port'], 6161: ['patrol-ism'], 6162: ['patrol-coll'], 6163: ['pscribe'], 9668: ['tec5-sdctp'], 9753: ['rasadv'], 8770: ['dpap'], 6200: ['lm-x'], 20048: ['mountd'], 6222: ['radmind'], 33331: ['diamondport'], 10101: ['ezmeeting-2'], 32775: ['filenet-pch'], 16993: ['amt-soap-https'], 12006: ['dbisamserver2'], 6251: ['tl1-raw-ssl'], 6252: ['tl1-ssh'], 6253: ['crip'], 11967: ['sysinfo-sp'], 6268: ['grid'], 6269: ['grid-alt'], 10114: ['netiq-qcheck'], 6300: ['bmc-grx'], 6301: ['bmc-ctd-ldap'], 19191: ['opsec-uaa'], 6306: ['ufmp'], 20167: ['tolfab'], 6316: ['abb-escp'], 6320: ['repsvc'], 6321: ['emp-server1'], 6322: ['emp-server2'], 8280: ['synapse-nhttp'], 6343: ['sflow'], 6346: ['gnutella-svc'], 6347: ['gnutella-rtr'], 6350: ['adap'], 6355: ['pmcs'], 6360: ['metaedit-mu'], 6370: ['metaedit-se'], 25009: ['icl-twobase10'], 9214: ['ipdcesgbs'], 9255: ['mon'], 34249: ['turbonote-2'], 6382: ['metatude-mds'], 32776: ['filenet-peior'], 8473: ['vp2p'], 6389: ['clariion-evr01'], 6390: ['metaedit-ws'], 9898: ['monkeycom'], 22800: ['aws-brf'], 6417: ['faxcomservice'], 19410: ['hp-sco'], 6420: ['nim-vdrshell'], 6421: ['nim-wan'], 30999: ['ovobs'], 26261: ['ezmeeting'], 6443: ['sun-sr-https'], 6444: ['sge-qmaster'], 6445: ['sge-execd'], 6446: ['mysql-proxy'], 9762: ['tungsten-http'], 6455: ['skip-cert-recv'], 6456: ['skip-cert-send'], 9629: ['uniport'], 18184: ['opsec-lea'], 12000: ['entextxid'], 6471: ['lvision-lm'], 12002: ['entexthigh'], 6480: ['sun-sr-http'], 6481: ['servicetags'], 6482: ['ldoms-mgmt'], 6483: ['sunvts-rmi'], 6484: ['sun-sr-jms'], 6485: ['sun-sr-iiop'], 6486: ['sun-sr-iiops'], 6487: ['sun-sr-iiop-aut'], 6488: ['sun-sr-jmx'], 6489: ['sun-sr-admin'], 12005: ['dbisamserver1'], 6500: ['boks'], 6501: ['boks-servc'], 6502: ['boks-servm'], 6503: ['boks-clntd'], 6505: ['badm-priv'], 6506: ['badm-pub'], 6507: ['bdir-priv'], 6508: ['bdir-pub'], 6509: ['mgcs-mfp-port'], 6510: ['mcer-port'], 12008: ['accuracer-dbms'], 6514: ['syslog-tls'], 6515: ['elipse-rec'], 9278: ['pegasus'], 8554: ['rtsp-alt'], 9279: ['pegasus-ctl'], 20202: ['ipdtp-port'], 9280: ['pgps'], 32777: ['filenet-obrok'], 9281: ['swtp-port1'], 12012: ['vipera'], 8401: ['sabarsd'], 9282: ['swtp-port2'], 6543: ['lds-distrib'], 6544: ['lds-dump'], 6547: ['apc-6547'], 6548: ['apc-6548'], 6549: ['apc-6549'], 6550: ['fg-sysupdate'], 6551: ['sum'], 9284: ['visd'], 6558: ['xdsxdm'], 9285: ['n2h2server'], 6566: ['sane-port'], 22951: ['brf-gw'], 8402: ['abarsd'], 19411: ['hp-sca'], 9287: ['cumulus'], 26133: ['scscp'], 6579: ['affiliate'], 6580: ['parsec-master'], 6581: ['parsec-peer'], 6582: ['parsec-game'], 6583: ['joajewelsuite'], 47557: ['dbbrowse'], 8403: ['admind'], 9292: ['armtechdaemon'], 8500: ['fmtp'], 9293: ['storview'], 9294: ['armcenterhttp'], 23000: ['inovaport1'], 23001: ['inovaport2'], 23002: ['inovaport3'], 6619: ['odette-ftps'], 6620: ['kftp-data'], 6621: ['kftp'], 6622: ['mcftp'], 6623: ['ktelnet'], 6626: ['wago-service'], 6627: ['nexgen'], 6628: ['afesc-mc'], 8555: ['d-fence'], 20222: ['ipulse-ics'], 9300: ['vrace'], 6653: ['openflow'], 24321: ['ild'], 47624: ['directplaysrvr'], 6670: ['vocaltec-gold'], 6671: ['p4p-portal'], 6672: ['vision-server'], 6673: ['vision-elmd'], 6679: ['osaut'], 6689: ['tsa'], 24922: ['find'], 43441: ['ciscocsdb'], 6701: ['kti-icad-srvr'], 6702: ['e-design-net'], 6703: ['e-design-web'], 32768: ['filenet-tms'], 6714: ['ibprotocol'], 6715: ['fibotrader-com'], 19412: ['hp-sessmon'], 44322: ['pmcdproxy'], 9592: ['ldgateway'], 14936: ['hde-lcesrvr-1'], 14937: ['hde-lcesrvr-2'], 19194: ['ua-secureagent'], 9318: ['secure-ts'], 19315: ['keyshadow'], 44818: ['ethernet-ip-2'], 6767: ['bmc-perf-agent'], 6768: ['bmc-perf-mgrd'], 6769: ['adi-gxp-srvprt'], 6770: ['plysrv-http'], 6771: ['plysrv-https'], 9321: ['guibase'], 9992: ['palace-1'], 6785: ['dgpf-exchg'], 6786: ['smc-jmx'], 6787: ['smc-admin'], 6788: ['smc-http'], 6789: ['smc-https'], 6790: ['hnmp'], 6791: ['hnm'], 6801: ['acnet'], 15000: ['hydap'], 42508: ['candp'], 6831: ['ambit-lm'], 18888: ['apc-necmp'], 31416: ['xqosd'], 6841: ['netmo-default'], 6842: ['netmo-http'], 47806: ['ap'], 47808: ['bacnet'], 6850: ['iccrushmore'], 11165: ['suncacao-websvc'], 31457: ['tetrinet'], 9283: ['callwaveiam'], 9593: ['cba8'], 9102: ['bacula-fd'], 6888: ['muse'], 8686: ['sun-as-jmxrmi'], 9343: ['mpidcmgr'], 10050: ['zabbix-agent'], 9889: ['gt-proxy'], 9344: ['mphlpdmc'], 12321: ['warehouse-sss'], 9346: ['ctechlicensing'], 12004: ['entextlow'], 6935: ['ethoscan'], 6936: ['xsmsvc'], 10051: ['zabbix-trapper'], 27782: ['ars-vista'], 6946: ['bioserver'], 23003: ['inovaport4'], 23333: ['elxmgmt'], 6951: ['otlp'], 23004: ['inovaport5'], 23005: ['inovaport6'], 6961: ['jmact3'], 6962: ['jmevt2'], 6963: ['swismgr1'], 6964: ['swismgr2'], 6965: ['swistrap'], 6966: ['swispol'], 6969: ['acmsoda'], 8416: ['espeech'], 6997: ['mobilitysrv'], 6998: ['iatp-highpri'], 6999: ['iatp-normalpri'], 7000: ['afs3-fileserver'], 7001: ['afs3-callback'], 7002: ['afs3-prserver'], 7003: ['afs3-vlserver'], 7004: ['afs3-kaserver'], 7005: ['afs3-volser'], 7006: ['afs3-errors'], 7007: ['afs3-bos'], 7008: ['afs3-update'], 7009: ['afs3-rmtsys'], 7010: ['ups-onlinet'], 7011: ['talon-disc'], 7012: ['talon-engine'], 7013: ['microtalon-dis'], 7014: ['microtalon-com'], 7015: ['talon-webserver'], 23400: ['novar-dbase'], 23401: ['novar-alarm'], 23402: ['novar-global'], 7020: ['dpserve'], 7021: ['dpserveadmin'], 7022: ['ctdp'], 7023: ['ct2nmcs'], 7024: ['vmsvc'], 7025: ['vmsvc-2'], 7030: ['op-probe'], 11320: ['imip-channels'], 9594: ['msgsys'], 8612: ['canon-bjnp2'], 48001: ['nimspooler'], 48002: ['nimhub'], 48003: ['nimgtw'], 31620: ['lm-mon'], 24386: ['intel-rci'], 20014: ['opendeploy'], 10113: ['netiq-endpoint'], 12322: ['warehouse'], 7070: ['arcp'], 7071: ['iwg1'], 7080: ['empowerid'], 7099: ['lazy-ptop'], 7100: ['font-service'], 7101: ['elcn'], 12109: ['rets-ssl'], 7121: ['virprot-lm'], 7128: ['scenidm'], 7129: ['scenccs'], 18241: ['checkpoint-rtm'], 21846: ['netspeak-is'], 15345: ['xpilot'], 18182: ['opsec-ufp'], 7161: ['cabsm-comm'], 7162: ['caistoragemgr'], 7163: ['cacsambroker'], 7164: ['fsr'], 7165: ['doc-server'], 7166: ['aruba-server'], 48128: ['isnetserv'], 7169: ['ccag-pib'], 7170: ['nsrp'], 7171: ['drm-production'], 7174: ['clutild'], 31765: ['gamesmith-port'], 12121: ['nupaper-ss'], 7200: ['fodms'], 7201: ['dlip'], 9396: ['fjinvmgr'], 7227: ['ramp'], 9397: ['mpidcagt'], 40000: ['safetynetp'], 8793: ['acd-pm'], 8600: ['asterix'], 9400: ['sec-t4net-srv'], 9401: ['sec-t4net-clt'], 9402: ['sec-pc2fax-srv'], 7262: ['cnap'], 25000: ['icl-twobase1'], 7272: ['watchme-7272'], 7273: ['oma-rlp'], 7274: ['oma-rlp-s'], 7275: ['oma-ulp'], 7276: ['oma-ilp'], 7277: ['oma-ilp-s'], 7278: ['oma-dcdocbs'], 7279: ['ctxlic'], 7280: ['itactionserver1'], 7281: ['itactionserver2'], 34980: ['ethercat'], 18635: ['rds-ip'], 25793: ['vocaltec-hos'], 9295: ['armcenterhttps'], 8804: ['truecm'], 9020: ['tambora'], 8614: ['canon-bjnp4'], 48129: ['blp5'], 9418: ['git'], 15555: ['cisco-snat'], 7365: ['lcm-server'], 10288: ['blocks'], 31948: ['iceedcp-tx'], 31949: ['iceedcp-rx'], 7391: ['mindfilesys'], 7392: ['mrssrendezvous'], 7393: ['nfoldman'], 7394: ['fse'], 7395: ['winqedit'], 7397: ['hexarc'], 7400: ['rtps-discovery'], 7401: ['rtps-dd-ut'], 7402: ['rtps-dd-mt'], 44321: ['pmcd'], 7410: ['ionixnetmon'], 7411: ['daqstream'], 7421: ['mtportmon'], 7426: ['pmdmgr'], 7427: ['oveadmgr'], 7428: ['ovladmgr'], 7429: ['opi-sock'], 7430: ['xmpv7'], 7431: ['pmd'], 7437: ['faximum'], 7443: ['oracleas-https'], 10800: ['gap'], 32034: ['iracinghelper'], 15660: ['bex-xr'], 10990: ['rmiaux'], 7473: ['rise'], 40842: ['csccredir'], 10805: ['lpdg'], 7491: ['telops-lmd'], 12172: ['hivep'], 7500: ['silhouette'], 7501: ['ovbus'], 11161: ['suncacao-snmp'], 19000: ['igrid'], 9443: ['tungsten-https'], 7510: ['ovhpas'], 7511: ['pafec-lm'], 9444: ['wso2esb-console'], 24465: ['tonidods'], 11162: ['suncacao-jmxmp'], 8765: ['ultraseek-http'], 8733: ['ibus'], 7542: ['saratoga'], 7543: ['atul'], 7544: ['nta-ds'], 7545: ['nta-us'], 7546: ['cfs'], 7547: ['cwmp'], 7548: ['tidp'], 7549: ['nls-tl'], 7560: ['sncp'], 22347: ['wibukey'], 11163: ['suncacao-rmi'], 7566: ['vsi-omega'], 7570: ['aries-kfinder'], 29167: ['otmp'], 7588: ['sun-lm'], 9800: ['davsrc'], 11164: ['suncacao-csa'], 48556: ['com-bardac-dw'], 24000: ['med-ltp'], 24001: ['med-fsp-rx'], 24002: ['med-fsp-tx'], 24003: ['med-supp'], 24004: ['med-ovw'], 24005: ['med-ci'], 9801: ['sstp-2'], 7624: ['indi'], 7627: ['soap-http'], 7628: ['zen-pawn'], 7629: ['xdas'], 7633: ['pmdfmgt'], 9598: ['vscp'], 9618: ['condor'], 7648: ['cuseeme'], 9802: ['davsrcs'], 48619: ['iqobject'], 8474: ['noteshare'], 9380: ['boxp'], 7674: ['imqtunnels'], 7675: ['imqtunnel'], 7676: ['imqbrokerd'], 7677: ['sun-user-https'], 7680: ['pando-pub'], 7689: ['collaber'], 18000: ['biimenu'], 34379: ['p-net-remote'], 7697: ['klio'], 7707: ['sync-em7'], 7708: ['scinet'], 12003: ['entextmed'], 7720: ['medimageportal'], 7724: ['nsdeepfreezectl'], 7725: ['nitrogen'], 7726: ['freezexservice'], 7727: ['trident-data'], 7734: ['smip'], 7738: ['aiagent'], 7741: ['scriptview'], 7743: ['sstp-1'], 7744: ['raqmon-pdu'], 7747: ['prgp'], 16310: ['pduncs'], 18262: ['gv-pf'], 7777: ['cbt'], 7778: ['interwise'], 7779: ['vstat'], 7781: ['accu-lmgr'], 9599: ['robix'], 7786: ['minivend'], 7787: ['popup-reminders'], 7789: ['office-tools'], 7794: ['q3ade'], 7797: ['pnet-conn'], 7798: ['pnet-enc'], 7799: ['altbsdp'], 7800: ['asr'], 7801: ['ssp-client'], 10080: ['amanda'], 7810: ['rbt-wanopt'], 27504: ['kopek-httphead'], 10860: ['helix'], 9994: ['palace-3'], 9535: ['mngsuite'], 11876: ['xoraya'], 16384: ['connected'], 10081: ['famdc'], 7845: ['apc-7845'], 7846: ['apc-7846'], 9500: ['ismserver'], 24242: ['filesphere'], 32771: ['filenet-rmi'], 24249: ['vista-4gl'], 9023: ['swa-1'], 7880: ['pss'], 7887: ['ubroker'], 7900: ['mevent'], 7901: ['tnos-sp'], 7902: ['tnos-dp'], 7903: ['tnos-dps'], 48000: ['nimcontroller'], 32483: ['apm-link'], 7913: ['qo-secure'], 21800: ['tvpm'], 25008: ['icl-twobase9'], 8301: ['amberon'], 7932: ['t2-drm'], 7933: ['t2-brm'], 10880: ['bveapi'], 9600: ['micromuse-ncpw'], 25900: ['tasp-net'], 9875: ['sapv1'], 25901: ['niobserver'], 32635: ['sec-ntb-clnt'], 25902: ['nilinkanalyst'], 25903: ['niprobe'], 7967: ['supercell'], 16161: ['sun-sea-port'], 8400: ['cvd'], 30001: ['pago-services1'], 7979: ['micromuse-ncps'], 7980: ['quest-vista'], 30002: ['pago-services2'], 30003: ['amicon-fpsu-ra'], 7999: ['irdmi2'], 8000: ['irdmi'], 8001: ['vcom-tunnel'], 8002: ['teradataordbms'], 8003: ['mcreport'], 8005: ['mxi'], 8008: ['http-alt'], 36001: ['allpeers'], 8019: ['qbdb'], 8020: ['intu-ec-svcdisc'], 8021: ['intu-ec-client'], 8022: ['oa-system'], 38201: ['galaxy7-data'], 8025: ['ca-audit-da'], 8026: ['ca-audit-ds'], 38202: ['fairview'], 8032: ['pro-ed'], 8033: ['mindprint'], 8034: ['vantronix-mgmt'], 38203: ['agpolicy'], 8040: ['ampify'], 8052: ['senomix01'], 8053: ['senomix02'], 8054: ['senomix03'], 8055: ['senomix04'], 8056: ['senomix05'], 8057: ['senomix06'], 8058: ['senomix07'], 8059: ['senomix08'], 32636: ['dmexpress'], 20480: ['emwavemsg'], 9536: ['laes-bf'], 17729: ['ea'], 40841: ['cscp'], 8074: ['gadugadu'], 40843: ['csccfirewall'], 26263: ['k3software-cli'], 8080: ['http-alt'], 8081: ['sunproxyadmin'], 8082: ['us-cli'], 8083: ['us-srv'], 8086: ['d-s-n'], 8087: ['simplifymedia'], 8088: ['radan-http'], 8194: ['blp1'], 8097: ['sac'], 8100: ['xprint-server'], 8115: ['mtl8000-matrix'], 8116: ['cp-cluster'], 16309: ['etb4j'], 8118: ['privoxy'], 16311: ['pdefmns'], 8121: ['apollo-data'], 8122: ['apollo-admin'], 8128: ['paycash-online'], 8129: ['paycash-wbp'], 8130: ['indigo-vrmi'], 8131: ['indigo-vbcp'], 8132: ['dbabble'], 8148: ['isdd'], 8205: ['lm-instmgr'], 12001: ['entextnetwk'], 8160: ['patrol'], 8161: ['patrol-snmp'], 8195: ['blp2'], 16360: ['netserialext1'], 16361: ['netserialext2'], 24554: ['binkp'], 16367: ['netserialext3'], 16368: ['netserialext4'], 9555: ['trispen-sra'], 45054: ['invision-ag'], 8182: ['vmware-fdm'], 8184: ['itach'], 32767: ['filenet-powsrm'], 21845: ['webphone']}
-service_to_ports = {'system-monitor': [2609], 'metricadbc': [2622], 'zannet': [317], 'netwkpathengine': [3209], 'appserv-https': [4849], 'lumimgrd': [4741], 'pgps': [9280], 'dynamid': [9002], 'h323callsigalt': [11720], 'accessnetwork': [699], 'idcp': [2326], 'ubroker': [7887], 'mysql-cm-agent': [1862], 'magaya-network': [3691], 'sync-em7': [7707], 'netboot-pxe': [3928], 'xact-backup': [911], 'rtps-discovery': [7400], 'metaagent': [1897], 'vista-4gl': [24249], 'icg-swp': [2062], 'bmc-reporting': [4568], 'nsjtp-ctrl': [1687], 'a21-an-1xbs': [4597], 'nss-routing': [159], 'lipsinc': [1968], 'pharmasoft': [1779], 'afs3-update': [7008], 'digital-notary': [1335], 'sonardata': [2863], 'radan-http': [8088], 'atm-uhas': [11367], 'proshare2': [1460], 'traceroute': [33434], 'medimageportal': [7720], 'cardbox': [3105], 'fsportmap': [4349], 'imqtunnel': [7675], 'citrixima': [2512], 'apocd': [3809], 'pjlink': [4352], 'guibase': [9321], 'prm-nm-np': [1403], 'navegaweb-port': [3159], 'aurora': [9084], 'rise': [7473], 'mtqp': [1038], 'banyan-rpc': [567], 'tvbus': [2191], 'ct2nmcs': [7023], 'iee-qfx': [1284], 'iceedcp-rx': [31949], 'stun-behaviors': [5349], 'ifsf-hb-port': [3486], 'seraph': [4076], 'saris': [4442], 'redstorm-diag': [2349], 'panasas': [3095], 'qadmifevent': [2462], 'ontime': [1622], 'lispworks-orb': [3672], 'synchronet-db': [6100], 'wfm': [4057], 'anthony-data': [1206], 'ipdtp-port': [20202], 'cma': [1050], 'p2pgroup': [3587], 'wrs-registry': [2340], 'kingfisher': [4058], 'phonebook': [767], 'metrics-pas': [1824], 'webtie': [3342], 'dif-port': [2251], 'cvspserver': [2401], 'venus': [2430], 'alaris-disc': [3613], 'stuns': [5349], 'picknfs': [1598], 'oms-nonsecure': [5102], 'checkoutdb': [5505], 'piranha2': [4601], 'piranha1': [4600], 'nest-protocol': [489], 'genrad-mux': [176], 'ttcmremotectrl': [3468], 'mcftp': [6622], 'direct': [242], 'wimd': [2980], 'docent': [2151], 'entp': [1865], 'bues-service': [2446], 'nmsp': [537, 1790], 'tip-app-server': [3160], 'nm-game-server': [3149], 'vmware-fdm': [8182], 'topflow-ssl': [3885], 'soniqsync': [3803], 'd2000webserver': [3120], 'sbl': [1039], 'nmasoverip': [1242], 'jboss-iiop-ssl': [3529], 'gridgen-elmd': [1542], 'kwtc': [4566], 'lofr-lm': [1752], 'starbot': [2838], 'contclientms': [4665], 'pciarray': [1552], 'asia': [626], 'scp': [3820], 'hl7': [2575], 'sysorb': [3241], 'esp-encap': [2797], 'pxc-roid': [4004], 'opsmgr': [1270], 'brcm-comm-port': [3188], 'x500ms': [5757], 'ptp': [15740], 'mlsn': [32801], 'pangolin-laser': [3348], 'networklenss': [3410], 'swdtp': [10104], 'vacdsm-app': [671], 'moldflow-lm': [1576], 'acp-proto': [4046], 'ibm-res': [1405], 'armtechdaemon': [9292], 'artifact-msg': [3518], 'pmsm-webrctl': [2972], 'mobile-file-dl': [2926], 'omstopology': [4162], 'gpsd': [2947], 'iwserver': [2166], 'palace-6': [9997], 'sasp': [3860], 'hart-ip': [5094], 'netscript': [4118], 'pim-rp-disc': [496], 'ismaeasdaqtest': [1950], 'palace-4': [9995], 'dpm-agent': [5719], 'directnet': [3447], 'int-rcv-cntrl': [3603], 'ibm3494': [3494], 'afs3-bos': [7007], 'drp': [1974], 'smtp': [25], 'palace-2': [9993], 'ariel1': [419], 'ariel3': [422], 'ariel2': [421], 'rcst': [3467], 'samd': [3275], 'vx-auth-port': [3207], 'idps': [3797], 'tip2': [3372], 'wap-wsp-s': [9202], 'fujitsu-neat': [3382], 'wsicopy': [3378], 'cctv-port': [3559], 'nssocketport': [3522], 'csoft1': [1837], 'osu-nms': [192], 'aes-discovery': [3224], 'tungsten-https': [9443], 'di-msg': [2227], 'swa-3': [9025], 'brp': [3043], 'altserviceboot': [4011], 'cruise-config': [8378], 'fast-rem-serv': [2495], 'qsnet-assist': [4356], 'mps-raft': [1700], 'bre': [4096], 'darcorp-lm': [1679], 'rmiregistry': [1099], 'netconf-ssh': [830], 'minivend': [7786], 'mapper-mapethd': [3985], 'esimport': [3564], 'dna': [2287], 'sceanics': [5435], 'pacmand': [1307], 'norton-lambert': [2338], 'event-listener': [3017], 'bv-ds': [3992], 'livelan': [1555], 'syncserver': [2647], 'cc-tracking': [4870], 'm-wnn': [3732], 'dnp': [20000], 'ezmeeting-2': [10101], 'msp-os': [4686], 'servergraph': [1251], 'netop-school': [1971], 'ironstorm': [3504], 'dnx': [3998], 'nessus': [1241], 'ds-srvr': [4401], 'excw': [1271], 'nkd': [1650], 'vpp': [677], 'netmo-http': [6842], 'jms': [5673], 'netview-aix-3': [1663], 'ncxcp': [5681], 'netview-aix-5': [1665], 'netview-aix-4': [1664], 'muse': [6888], 'netview-aix-6': [1666], 'dpcp': [4099], 'caspssl': [1131], 'exce': [2769], 'sstp-2': [9801], 'netgw': [741], 'ciphire-serv': [3888], 'nav-port': [3859], 'osaut': [6679], 'ssh': [22], 'moshebeeri': [2627], 'filenet-powsrm': [32767], 'sso-service': [2710], 'mtl8000-matrix': [8115], 'novation': [1322], 'radwiz-nms-srv': [2736], 'lisp-data': [4341], 'softrack-meter': [3884], 'xaapi': [1934], 'roketz': [1730], 'slm-api': [1606], 'messageservice': [2311], 'sep': [2089], 'here-lm': [1409], 'nowcontact': [3167], 'servicemeter': [2603], 'hotu-chat': [3449], 'wap-push-https': [4036], 'veritas-vis2': [2994], 'castorproxy': [3450], 'opsec-cvp': [18181], 'wfc': [4847], 'netspeak-cps': [21849], 'senip': [3898], 'radius': [1812], 'nesh-broker': [3507], 'vpps-qua': [672], 'ka0wuc': [2822], 'kpasswd': [464], 'smwan': [3979], 'compaq-wcp': [2555], 'gbmt-stars': [3912], 'high-criteria': [2467], 't1-e1-over-ip': [3175], 'orion': [2407], 'mcns-tel-ret': [3311], 'flashfiler': [24677], 'close-combat': [1944], 'sasggprs': [3964], 'solera-lpn': [4738], 'avdecc': [17221], 'svnetworks': [2973], 'health-polling': [1161], 'opswmanager': [3977], 'xyplex-mux': [173], 'tag-pm': [5073], 'subntbcst-tftp': [247], 'quest-agent': [3843], 'hp-collector': [381], 'xtrm': [3423], 'vslmp': [312], 'ufmp': [6306], 'netclip': [2971], 'rsom': [2889], 'enl': [1804], 'netx-agent': [2586], 'xvttp': [508], 'productinfo': [1283], 'msiccp': [1731], '3com-tsmux': [106], 'ctechlicensing': [9346], 'liebdevmgmt-dm': [3028], 'skip-cert-send': [6456], 'sunproxyadmin': [8081], 'hacl-poll': [5315], 'ctlptc': [2153], 'cadlock2': [1000], 'sitaradir': [2631], 'winqedit': [7395], 'arcp': [7070], 'ovwdb': [2447], 'hp-clic': [3384], 'at-5': [205], 'visitview': [1631], 'at-7': [207], 'scientia-ssdb': [2121], 'tserver': [450], 'at-3': [203], 'sdclient': [2310], 'parsec-peer': [6581], 'dta-systems': [13929], 'msfrs': [4554], 'psdbserver': [2355], 'dj-ilm': [3362], 'parallel': [4989], 'teredo': [3544], 'vfo': [1056], 'net8-cman': [1830], 'dicom-iscl': [2761], 'cisco-tdp': [711], 'smakynet': [122], 'mc-appserver': [8763], 'wins': [1512], 'idig-mux': [4152], 'entextlow': [12004], 'oma-dcdocbs': [7278], 'cfdptkt': [120], 'ardus-cntl': [1116], 'senomix03': [8054], 'ezproxy': [26260], 'vision-elmd': [6673], 'uaac': [145], 'srp-feedback': [2737], 'senomix04': [8055], 'vmpwscs': [214], 'iso-tp0s': [3782], 'simslink': [2676], 'wssauthsvc': [4537], 'cs-auth-svr': [3113], 'sitaramgmt': [2630], 'sightline': [1645], 'aol-1': [5191], 'ionixnetmon': [7410], 'mpp': [218], 'streetperfect': [1330], 'homeportal-web': [3941], 'cdfunc': [2045], 'emsd-port': [1928], 'entrust-sps': [640], 'murray': [1123], 'tcoaddressbook': [1977], 'zep': [17754], 'suncacao-snmp': [11161], 'winddlb': [1565], 'eisp': [3983], 'ssdtp': [6071], 'ufastro-instr': [3720], 'fis': [5912], 'tacacs-ds': [65], 'suncacao-websvc': [11165], 'accuracer-dbms': [12008], 'dec_dlm': [625], 'concurrent-lm': [1648], 'celatalk': [3485], 'linogridengine': [12300], 'simple-push-s': [3688], 'konshus-lm': [2294], 'nicetec-mgmt': [2557], 'scohelp': [457], 'intel-rci': [24386], 'oidsr': [4143], 'qubes': [1341], 'caacws': [5248], 'etlservicemgr': [9001], 'cnhrp': [1757], 'clp': [2567], 'oa-system': [8022], 'sonus-logging': [2290], 'silc': [706], 'mos-lower': [10540], 'blizwow': [3724], 'csi-lfap': [3145], 'vsat-control': [1880], 'dpkeyserv': [1780], 'intraintra': [3202], 'rebol': [2997], 'nupaper-ss': [12121], 'nasmanager': [1960], 'mpfoncl': [2579], 'ctdhercules': [3773], 'intecom-ps2': [5057], 'lorica-in': [4080], 'repscmd': [653], 'intecom-ps1': [5056], 'codasrv-se': [2433], 'saft': [487], 'contentserver': [454, 3365], 'netiq-endpoint': [10113], 'smartsdp': [426], 'vcom-tunnel': [8001], 'comcam-io': [3605], 'proofd': [1093], 'webmethods-b2b': [2907], 'g2tag': [4110], 'acme': [9216], 'z39.50': [210], 'nbt-wol': [6133], 'grubd': [3136], 'mountd': [20048], 'acms': [3980], 'liebdevmgmt_c': [3027], 'metagram': [99], 'mpnjsc': [1952], 'affiliate': [6579], 'spcsdlobby': [2888], 'ltp': [4044], 'plysrv-https': [6771], 'svrloc': [427], 'cabsm-comm': [7161], 'cns-srv-port': [2976], 'livestats': [2795], 'snaresecure': [1684], 'streamcomm-ds': [9612], 'ars-vista': [27782], 'serverview-icc': [3173], 'maincontrol': [2516], '3link': [15363], 'tnp': [8321], 'iph-policy-adm': [2963], 'street-stream': [1736], 'fc-ser': [1372], 'ubxd': [4034], 'desktop-dna': [2763], 'servicetags': [6481], 'dawn': [1908], 'dynamic3d': [2150], 'pwgwims': [4951], 'omabcastltkm': [4359], 'commplex-main': [5000], 'prnstatus': [3911], 'msl_lmd': [1464], 'sunwebadmins': [8989], 'bfd-control': [3784], 'ms-olap2': [2394], 'ice-slocation': [4062], 'dsp': [33], 'drm-production': [7171], 'tal-pod': [6149], 'rtc-pm-port': [3891], 'netwatcher-db': [3204], 'unimobilectrl': [2927], 'amt-soap-http': [16992], 'aegate': [4549], 'dsf': [555], 'aker-cdp': [2473], 'odsi': [1308], 'omasgport': [4090], 'lontalk-norm': [1628], 'dsc': [3390], 'multiling-http': [777], 'rnmap': [3418], 'storman': [4178], 'otpatch': [2936], 'fjsv-gssagt': [3035], 'webemshttp': [2851], 'utcd': [1506], 'xtrms': [3424], 'mgesupervision': [4679], 'gpfs': [1191], '3par-mgmt': [5782], 'mecomm': [668], 'trident-data': [7727], 'skytelnet': [1618], 'cgi-starapi': [3893], 'ismc': [1638], 'hyperwave-isp': [692], 'resource_mgr': [3019], 'nmsserver': [2244], 'jerand-lm': [1810], 'tenfold': [658], 'propel-msgsys': [1268], 'cyborg-systems': [9888], 'dict-lookup': [2289], 'cxws': [4673], 'entrust-aams': [681], 'odette-ftps': [6619], 'nburn_id': [20034], 'syncserverssl': [2679], 'eoss': [1210], 'responsenet': [3045], 'banyan-vip': [573], 'micom-pfs': [490], 'tgcconnect': [4146], 'obex': [650], 'ats': [2201], 'ovsam-d-agent': [3870], 'iclpv-wsm': [1395], 'isis-am': [1642], 'simple-push': [3687], 'remotedeploy': [3789], 'wkstn-mon': [2991], 'isg-uda-server': [2551], 'cesdcdman': [2921], 'iclpv-pm': [1392], 'mvel-lm': [1574], 'vqp': [1589], 'authentx': [5067], 'ischat': [1336], 'tag-ups-1': [3573], 'hp-managed-node': [382], 'ardusuni': [1834], 'infobright': [5029], 'ticf-2': [493], 'skip-mc-gikreq': [1660], 'unify-debug': [4867], 'taurus-wh': [1610], 'teradataordbms': [8002], 'facsys-ntp': [2514], 'surfpass': [5030], 'ds-srv': [4400], 'asci-val': [1560], 'ccm-port': [3575], 'swldy-sias': [1250], 'edtools': [1142], 'cl-db-request': [4136], 'exp1': [1021], 'madge-ltd': [2453], 'allstorcns': [2901], 'airs': [1481], 'jmq-daemon-2': [3215], 'npmp-local': [610], 'jmq-daemon-1': [3214], 'ibm-rsyscon': [9085], 'fatpipe': [3353], 'pmas': [4066], 'ianywhere-dbns': [3968], 'paycash-online': [8128], 'va-pacbase': [3676], 'precise-i3': [3607], 'iqserver': [2527], 'tsdos390': [1237], 'rusb-sys-port': [3422], 'triquest-lm': [1588], 'sns-admin': [2658], 'osm-oev': [9991], 'redstorm_find': [2347], 'cisco-fna': [130], 'ksysguard': [3112], 'galileolog': [3520], 'mpnjsomg': [2686], 'spytechphone': [8192], 'csoft-prev': [3271], 'embl-ndt': [394], 'infomover': [2854], 'digital-vrc': [466], 'http-alt': [591, 8008, 8080], 'direcpc-si': [2464], 'lbm': [2465], 'cosmocall': [2324], 'aztec': [3512], 'answersoft-lm': [1781], 'philips-vc': [583], 'nburn-id': [20034], 'lv-jc': [2143], 'pnet-conn': [7797], 'mpsysrmsvr': [3358], 'circle-x': [2931], 'sms-remctrl': [2704], 'dls-monitor': [2048], 'afs3-prserver': [7002], '914c-g': [211], 'p-net-remote': [34379], 'gdomap': [538], 'nas-metering': [2286], 'ipfltbcst': [4068], 'dnap': [1172], 'mppolicy-mgr': [5969], 'vrxpservman': [4147], 'mxit': [9119], 'hlserver': [3047], 'everydayrc': [2782], 'liebdevmgmt_a': [3029], 'cardbox-http': [3106], 'cl-1': [172], 'netangel': [2442], 'rap': [38, 256], 'lbf': [2466], 'dxmessagebase1': [2874], 'dxmessagebase2': [2875], 'nimhub': [48002], 'ft-role': [2429], 'dvl-activemail': [1396], 'proactivate': [24678], 'ratl': [2449], 'dbref': [2365], 'rtps-dd-mt': [7402], 'passgo-tivoli': [627], 'entrusttime': [309], 'panagolin-ident': [9021], 'wta-wsp-s': [2805], 'netplay-port1': [3640], 'xmlrpc-beep': [602], 'meta5': [393], 'monkeycom': [9898], 'metaedit-se': [6370], 'rrirtr': [1693], 'beacon-port': [3124], 'bmc-jmx-port': [3604], 'nani': [2236], 'bpcp-poll': [2844], 'idware-router': [2079], 'solera-epmap': [2132], 'hppronetman': [3908], 'dpserveadmin': [7021], 'opsession-prxy': [3307], 'bruce': [2619], 'pcanywheredata': [5631], 'tig': [3943], 'pcs-pcw': [2566], 'iccrushmore': [6850], 'gtp-control': [2123], 'ideafarm-panic': [903], 'wello': [4177], 'odeumservlink': [3523], 'cap': [1026], 'pcttunnell': [2274], 'sms-chat': [2703], 'csms': [3399], 'dtv-chan-req': [2253], 'swtp-port1': [9281], 'swtp-port2': [9282], 'hdl-srv': [2641], 'alarm': [2740], 'camp': [4450], 'ssmpp': [3550], 'na-localise': [5062], 'is99c': [379], 'aruba-server': [7166], 'v5ua': [5675], 'mfserver': [2266], 'btpp2audctr1': [2536], 'bmc-messaging': [2059], 'ddm-rdb': [446], 'dj-ice': [5419], 'sgcp': [440], 'ndmp': [10000], 'sun-as-jmxrmi': [8686], 'radix': [2872], 'igrs': [3880], 'fjdocdist': [1848], 'rbr-discovery': [3553], 'kwdb-commn': [1127], 'innosys': [1412], 'ftps': [990], 'zenginkyo-1': [5020], 'radio': [1595], 'cartographerxmp': [5270], 'hillrserv': [4117], 'informatik-lm': [1428], 'emc-gateway': [1273], 'megardsvr-port': [3571], 'sd-data': [2385], 'emwin': [2211], 'systat': [11], 'intrepid-ssl': [11751], 'nsws': [3049], 'ftp-agent': [574], 'ravehd': [4037], 'ofsd': [2322], 'giop-ssl': [2482], 'bmcpatrolrnvu': [3182], 'call-sig-trans': [2517], 'tcpmux': [1], 'kali': [2213], 'smc-http': [6788], 'navisphere': [2162], 'pnet-enc': [7798], 'board-roar': [9700], 'edm-mgr-cntrl': [3465], 'mpidcagt': [9397], '3ds-lm': [1538], 'minipay': [2105], 'cs-remote-db': [3630], 'exasoftport1': [3920], 'eserver-pap': [3666], 'magicom': [2243], 'pop3': [110], 'crestron-cip': [41794], 'wta-wsp-wtp-s': [2923], 'abb-escp': [6316], 'ent-engine': [3665], 'oirtgsvc': [4141], 'filenet-pch': [32775], 'snifferserver': [2533], 'comcam': [2108], 'lv-auth': [2147], 'lanserver': [637], 'argis-te': [2581], 'cgms': [3003], 'wag-service': [2608], 'hmmp-op': [613], 'ndl-aas': [3128], 'asipregistry': [687], 'pegasus-ctl': [9279], 'bcs-lmserver': [1951], 'msfw-storage': [2171], 'ems': [4664], 'backup-express': [6123], 'mimer': [1360], 'namp': [167], 'sds-admin': [2705], 'scc-security': [582], 'npmp': [8450], 'xnds': [2157], 'ci3-software-2': [1302], 'uohost': [3314], 'mcreport': [8003], 'ci3-software-1': [1301], 'mobilip-mn': [435], 'ispmmgr': [3775], 'ipcs-command': [3743], 'krb524': [4444], 'tcp-id-port': [1999], 'nut': [3493], 'boks-clntd': [6503], 'ccag-pib': [7169], 'mysql-im': [2273], 'ltp-deepspace': [1113], 'digivote': [3223], 'avinstalldisc': [3502], 'telelpathstart': [5010], 'smpte': [420], 'fsc-port': [9217], 'bess': [3960], 'cruise-update': [8380], 'qtp': [2935], 'globmsgsvc': [2519], 'cpdi-pidas-cm': [3609], 'smpp': [2775], 'cpq-wbem': [2301], 'remoteware-srv': [3002], 'hpssmgmt': [4484], 'nxlmd': [28000], 'insitu-conf': [1490], 'ds-mail': [4405], 'neckar': [37475], 'oma-mlp-s': [9211], 'pra-elmd': [1587], 'cruise-diags': [8379], 'shilp': [2049], 'sais': [1426], 'finger': [79], 'lanrevserver': [3971], 'atul': [7543], 'irc': [194], 'dctp': [675], 'spandataport': [3193], 'appleqtcsrvr': [545], 'virtualuser': [5423], 'caupc-remote': [2122], 'sftp': [115], 'kme-trap-port': [2081], 'blwnkl-port': [2625], 'lupa': [1212], 'altcp': [4165], 'incognitorv': [3139], 'oms': [4662], 'odnsp': [9966], 'talon-engine': [7012], 'windb': [2522], 'cambertx-lm': [1734], 'pkix-timestamp': [318], 'smsp': [413], 'ice-location': [4061], 'ibm-diradm': [3538], 'pdap-np': [1526], 'esri_sde': [5151], 'ms-sna-base': [1478], 'ild': [24321], 'timeflies': [1362], 'esp-lm': [3383], 'synapse-nhttp': [8280], 'ill': [1611], 'boinc-client': [1043], 'vsiadmin': [2539], 'robcad-lm': [1509], 'iris-lwz': [715], 'tvnetworkvideo': [3791], 'encore': [1740], 'pkagent': [3118], 'zephyr-hm': [2104], 'commtact-http': [20002], 'nameserver': [42], 'mcer-port': [6510], 'wusage': [2396], 'con': [759], 'sunfm-port': [3934], 'esip': [2950], 'saism': [1436], 'cops-tls': [3183], 'ipulse-ics': [20222], 'nqs': [607], 'b2-license': [2204], 'skip-cert-recv': [6455], 'silkmeter': [5461], 'gopher': [70], 'rapidmq-reg': [3094], 'sun-sr-iiop': [6485], 'pyrrho': [5433], 'mmaeds': [4668], 'dtag-ste-sb': [352], 'opsec-sam': [18183], 'pxc-pin': [4005], 'gw-log': [4844], 'ipdd': [578], 'bv-smcsrv': [3991], 'magbind': [3194], 'conference': [531], 'mbg-ctrl': [3569], 'wysdma': [3741], 'timelot': [3243], 'afpovertcp': [548], 'ncacn-ip-tcp': [3062], 'dicom': [11112], 'sybase-sqlany': [1498], 'profilemac': [4749], 'hyperscsi-port': [5674], 'sugp': [1905], 'ptp-general': [320], 'sac': [8097], 'ov-nnm-websrv': [3443], 'tinc': [655], 'udrive': [1867], 'odette-ftp': [3305], 'acp-policy': [3824], 'ads-c': [5913], 'esinstall': [5599], 'sm-pas-1': [2938], 'sm-pas-2': [2939], 'sm-pas-3': [2940], 'pq-lic-mgmt': [2687], 'inova-ip-disco': [2716], 'retrospect': [497], 'pcc-mfp': [2256], 'fcopy-server': [5745], 'dsmeter_iatc': [4060], 'mac-srvr-admin': [660], 'pe-mike': [1305], 'vinainstall': [4344], 'exbit-escp': [1316], 'newheights': [2114], 'micromuse-ncpw': [9600], 'srmp': [193], 'rmiactivation': [1098], 'isi-irp': [3226], 'ioc-sea-lm': [1579], 'stdptc': [2154], 'sun-sr-https': [6443], 'ccss-qsm': [4970], 'tdaccess': [2910], 'aftmux': [3917], 'mcp': [4458], 'rimsl': [2044], 'commerce': [542], 'imqtunnels': [7674], 'gwen-sonya': [2778], 'ita-manager': [5052], 'wap-vcard': [9204], 'drmsmc': [1878], 'esps-portal': [2867], 'slp': [1605], 'ovbus': [7501], 'fjippol-cnsl': [2749], 'commonspace': [1592], 'hfcs-manager': [4999], 'bis-sync': [5585], 'rrifmm': [1696], 'mediavault-gui': [3673], 'lv-pici': [2145], 'palace-5': [9996], 'd-fence': [8555], 'ivsd': [2241], 'flukeserver': [2359], 'palace-1': [9992], 'prp': [2091], 'scotty-ft': [14000], 'nomdb': [13786], 'sdo-tls': [3896], 'unot': [5055], 'mpnjsosv': [2684], 'ampify': [8040], 'goldleaf-licman': [1401], 'ca-idms': [3709], 'oveadmgr': [7427], 'radmin-port': [4899], 'pk-electronics': [2634], 'noteit': [4663], 'xmlblaster': [3412], 'videte-cipc': [1927], 'qtms-bootstrap': [3850], 'microcom-sbp': [1680], 'ndl-ahp-svc': [6064], 'ssm-cvs': [2477], 'mirrtex': [4310], 'ctisystemmsg': [4451], 'mdap-port': [3235], 'ias-admind': [2141], 'lv-not': [2146], 'rnm': [3844], 'l3-ranger': [2841], 'privatewire': [4449], 'aol-2': [5192], 'aol-3': [5193], 'dhe': [3252], 'couchdb': [5984], 'ccnx': [9695], 'meregister': [669], 'routematch': [1287], 'swismgr1': [6963], 'swismgr2': [6964], 'compaq-https': [2381], 'gcmonitor': [2660], 'ibm-mqisdp': [1883], 'enc-tunnel': [8567], 'netsupport2': [5421], 'scanstat-1': [1215], 'bvtsonar': [1149], 'perfd': [5227], 'wap-push-http': [4035], 'obrpd': [1092], 'ncu-1': [3195], 'kis': [186], 'kvm-via-ip': [1132], 'cpudpencap': [2746], 'winpoplanmess': [1152], 'tunatic': [5747], 'vlsi-lm': [1500], 'msp': [18, 2438], 'ivs-video': [2232], 'wsynch': [3111], 'mpc-lifenet': [1213], 'itelserverport': [3719], 'opsec-ela': [18187], 'nip': [376], 'telops-lmd': [7491], 'cslistener': [9000], 'rap-listen': [1531], 'shiva-confsrvr': [1651], 'goahead-fldup': [3057], 'tcpdataserver': [3805], 'combox-web-acc': [2534], 'xtgui': [4095], 'lnvstatus': [2283], 'drip': [3949], 'epp': [700, 3044], 'dna-cml': [436], 'cluster-disc': [3374], 'sa-msg-port': [1646], 'ds-admin': [4404], 'winpharaoh': [6065], 'ms-s-sideshow': [5361], 'zymed-zpp': [2133], 'ice-router': [4063], 'epc': [1267], 'oracle-vp2': [1808], 'mt-scaleserver': [2305], 'slim-devices': [3483], 'shockwave2': [1257], 'sigma-port': [3614], 'unidata-ldm': [388], 'video-activmail': [1398], 'ewall': [1328], 'vipera': [12012], 'talon-disc': [7011], 'datusorb': [3282], 'thrp': [3963], 'cvc-hostd': [442], 'smap': [3731], 'identify': [2987], 'amt-redir-tls': [16995], 'necp': [3262], 'cognex-insight': [1069], 'cpq-tasksmart': [3201], 'bullant-rap': [2965], 'eli': [2087], 'keyserver': [584], 'hao': [2245], 't2-drm': [7932], 'stx': [527], 'opencm': [3434], 'synchronet-upd': [6102], 'charsetmgr': [3903], 'prosharevideo': [5714], '3com-njack-2': [5265], 'wago-service': [6626], 'powerexchange': [2480], 'alchemy': [3234], 'lipsinc1': [1969], 'novell-lu6-2': [1416], 'patrol-mq-nm': [2665], 'hap': [661], 'els': [1315], 'whoispp': [63], 'proshare-mc-1': [1673], 'xingcsm': [2327], 'ipt-anri-anri': [4593], 'wbem-exp-https': [5990], 'pwgippfax': [3951], 'ncr-ccl': [2528], 'vulture': [3482], 'nettest': [4138], 'fcp-cics-gw1': [5504], 'radius-acct': [1813], 'oc-lm': [1448], 'supercell': [7967], 'llm-csv': [2814], 'wap-wsp-wtp-s': [9203], 'wysdmc': [3916], 'fc-faultnotify': [2819], 'hfcs': [4900], 'sxmp': [3273], 'cs-services': [3631], 'meta-corp': [6141], 'submission': [587], 'verismart': [3270], 'de-cache-query': [1255], 'iclpv-nlc': [1394], 'truecm': [8804], 'moy-corp': [2488], 'irapp': [4073], 'bmc_ctd_ldap': [6301], 'isomair': [3589], 'bmc-ctd-ldap': [6301], 'genisar-port': [3475], 'autodesk-nlm': [2080], 'rtsclient': [2501], 'iclpv-nls': [1393], 'apc-2160': [2160], 'apc-2161': [2161], 'xmms2': [9667], 'snagas': [108], 'rrac': [5678], 'hpidsadmin': [2984], 'bmc-net-svc': [1770], 'vatp': [690], 'iso-tsap-c2': [399], 'tksocket': [2915], 'ulpnet': [483], 'excerpt': [5400], 'exonet': [26489], 'bdir_pub': [6508], 'bcslogc': [13216], 'cft-4': [1765], 'acas': [62], 'acap': [674], 'tolteces': [4375], 'mctfeed': [5598], 'directv-soft': [3335], 'nvcnet': [3999], 'eicon-slp': [1440], 'cvmmon': [2300], 'apani5': [9164], 'apani4': [9163], 'apani3': [9162], 'apani2': [9161], 'apani1': [9160], 'webaccess': [1739], 'sdmmp': [5573], 'ica': [1494], 'hpvirtgrp': [5223], 'vtu-comms': [2216], 'daytime': [13], 'lnvmailmon': [2285], 'rmonitor-secure': [5145], 'statusd': [5414], 'netwall': [533], 'uma': [144, 1797], 'maitrd': [997], 'glrpc': [9080], 'icp': [1112], 'synotics-relay': [391], 'menandmice_noh': [4151], 'enc-eps-mc-sec': [5567], 'commplex-link': [5001], 'vpsipport': [2649], 'comotionmaster': [2261], 'cp-cluster': [8116], 'biimenu': [18000], 'entextmed': [12003], 'pmcp': [3821], 'confluent': [1484], 'netinfo-local': [1033], 'kfserver': [5343], 'myblast': [3795], 'ansys-lm': [1800], 'redstorm-join': [2346], 'sps-tunnel': [2876], 'ibridge-data': [2275], 'vs-server': [3280], 'sabarsd': [8401], 'oraclenames': [1575], 'pmcd': [44321], 'nicelink': [1095], 'videotex': [516], 'nls-tl': [7549], 'sqdr': [2728], 'postgresql': [5432], 'ipsendmsg': [1992], 'beserver-msg-q': [3527], 'pxc-ntfy': [3009], 'entextxid': [12000], 'ndm-server': [1364], 'vrts-at-port': [2821], 'lnvalarm': [2282], 'distinct': [9999], 'sec-ntb-clnt': [32635], 'rtraceroute': [3765], 'ups-onlinet': [7010], 'bdir-pub': [6508], 'h248-binary': [2945], 'bmc-net-adm': [1769], 'beeyond-media': [1943], 'prosharedata': [5715], 'octopus': [10008], 'lmcs': [4877], 'cimplex': [673], 'presence': [5298], 'ambit-lm': [6831], 'dfserver': [21554], 'soap-beep': [605], 'www': [80], 'ppsms': [3967], 'snmptrap': [162], 'sos': [3838], 'ncdloadbalance': [2683], 'cdl-server': [3056], 'interworld': [3548], 'eye2eye': [1948], 'rkb-oscs': [1817], 'ff-annunc': [1089], 'camac': [3545], 'git': [9418], 'sns-dispatcher': [2657], 'mos-soap-opt': [10544], 'infocrypt': [2233], 'unbind-cluster': [2138], 'picodbc': [1603], 'td-service': [267], 'stat-results': [4156], 'device2': [2030], 'brlp-1': [4102], 'brlp-0': [4101], 'brlp-3': [4104], 'brlp-2': [4103], 'imip': [11319], 'nta-us': [7545], 'ncconfig': [1888], 'tams': [2726], 'fc-cli': [1371], 'six-degrees': [3611], 'gat-lmd': [1708], 'jamserverport': [3627], 'sychrond': [3723], 'bluectrlproxy': [2277], 'hp-server': [5225], 'nati-logos': [2343], 'h2250-annex-g': [2099], 'apc-7846': [7846], 'batman': [4305], 'apc-7845': [7845], 'rtnt-1': [3137], 'rtnt-2': [3138], 'imtc-map': [2202], 'autonoc': [1140], 'idonix-metanet': [2112], 'qwave': [2177], 'sentlm-srv2srv': [5099], 'catalyst': [2836], 'ohimsrv': [506], 'icms': [4486], 'mptn': [397], 'imprs': [3164], 'gnunet': [2086], 'atex-elmd': [1385], 'dsmeter-iatc': [4060], 'smpnameres': [901], 'eppc': [3031], 'webphone': [21845], 'isis': [2042], 'pdl-datastream': [9100], 'sysopt': [3281], 'cumulus-admin': [8954], 'directv-catlg': [3337], 'jt400-ssl': [3471], 'mtrgtrans': [19398], 'armcenterhttps': [9295], 'klogin': [543], 'lm-dta': [8206], 'anet': [212], 'telnets': [992], 'boomerang': [1304], 'whisker': [3233], 'flashmsg': [2884], 'oracle-vp1': [1809], 'n1-fwp': [4446], 'trim': [1137], 'dali-port': [5777], 'mailq': [174], 'neto-wol-server': [3812], 'netconfsoaphttp': [832], 'dei-icda': [618], 'classic': [9087], 'oracleas-https': [7443], 'xiip': [1924], 'cbos-ip-port': [3750], 'med-fsp-tx': [24002], 'amx-icsp': [1319], 'binderysupport': [2302], 'imoguia-port': [3907], 'redstorm-info': [2348], 'https-wmap': [8991], 'esro-emsdp': [642], 'idxp': [603], 'nds_sso': [3024], 'cert-responder': [1640], 'tlisrv': [1527], 'nnp': [3780], 'vpac': [1517], 'entrust-kmsh': [709], 'vpad': [1516], 'itm-mccs': [3084], 'edm-std-notify': [3462], 'e-design-net': [6702], 'and-lm': [2646], 'search-agent': [1234], 'msolap-ptp2': [2725], 'apple-licman': [1381], 'netview-aix-1': [1661], 'wv-csp-udp-cir': [3717], 'nbx-dir': [2096], 'radmind': [6222], 'rmpp': [1121], 'warehouse': [12322], 'blp4': [8294], 'blp5': [48129], 'blp2': [8195], 'blp3': [8292], 'opus-services': [3718], 'blp1': [8194], 'a15': [3598], 'a14': [3597], 'omserv': [764], 'netview-aix-2': [1662], 'scan-change': [2719], 'sec-pc2fax-srv': [9402], 'imqbrokerd': [7676], 'privilege': [2588], 'wrs_registry': [2340], 'hhb-handheld': [4148], 'sco-websrvrmg3': [598], 'ici': [2200], 'abarsd': [8402], 'opc-job-start': [423], 'ibm-mqseries': [1414], 'hpvmmcontrol': [1124], 'agslb': [4149], 'netview-aix-7': [1667], 'nm-assessor': [3151], 'flirtmitmir': [3840], 'netware-csp': [1366], 'jaleosnd': [1623], 'brf-gw': [22951], 'mpnjsocl': [2685], 'fcp-udp': [810], 'sunscalar-svc': [1860], 'gsiftp': [2811], 'dhcp-failover': [647], 'mctet-master': [3115], 'fazzt-ptp': [4038], 'drwcs': [2193], 'fse': [7394], 'scipticslsrvr': [2577], 'sftdst-port': [3230], 'veritas_pbx': [1556], 'codemeter': [22350], 'amx-axbnet': [1320], 'cajo-discovery': [1198], 'fnet-remote-ui': [1174], 'jbroker': [2506], 'vnsstr': [3321], 'sysscanner': [3251], 'bmc_patroldb': [1313], 'oma-mlp': [9210], 'ecnp': [2858], 'msft-gc-ssl': [3269], 'ep-pcp': [3620], 'mns-mail': [2593], 'dsdn': [1292], 'rjcdb-vcards': [9208], 'can-ferret': [1920], 'vmodem': [3141], 'eristwoguns': [2650], 'cadabra-lm': [1563], 'sagxtsds': [4952], 'sdsc-lm': [1537], 'solve': [2636], 'ansatrader': [124], 'tscchat': [2330], 'fjicl-tep-a': [1901], 'fjicl-tep-b': [1902], 'fjicl-tep-c': [1904], 'boldsoft-lm': [2961], 'wsmlb': [3806], 'ssslic-mgr': [1203], 'qip-msgd': [2468], 'ace-proxy': [2335], 'faxportwinport': [1620], 'tasp-net': [25900], 'f5-globalsite': [2792], 'barracuda-bbs': [5120], 'awg-proxy': [3277], 'serverview-as': [3169], 'ultraseek-http': [8765], 'datasurfsrv': [461], 'sah-lm': [3291], 'proxim': [1732], 'micromuse-lm': [1534], 'utmpcd': [431], 'nuxsl': [5991], 'contamac-icm': [4846], 'stun-port': [1994], 'med-supp': [24003], 'ias-auth': [2139], 'n1-rmgmt': [4447], 'compressnet': [2, 3], 'inbusiness': [244], 'uniport': [9629], 'imaps': [993], 'mosaicsyssvc1': [1235], 'ibm-abtact': [1586], 'dragonfly': [8913], 'csd-monitor': [3072], 'argis-ds': [2582], 'winjaserver': [1290], 'hydap': [15000], 'santools': [4079], 'surfcontrolcpa': [3909], 'printer-agent': [3396], 'ipcore': [2215], 'mindfilesys': [7391], 'msgclnt': [8786], 'sonus': [2653], 'watilapp': [1269], 'www-http': [80], 'microtalon-dis': [7013], 'ibprotocol': [6714], 'quartus-tcl': [2589], 'softaudit': [3419], 'datalens': [2229], 'qnxnetman': [3385], 'e-net': [3286], 'start-network': [3615], 'hpss-ndapi': [1217], 'phrelaydbg': [4869], 'idp-infotrieve': [2966], 'ljk-login': [472], 'bhfhs': [248], 'oraclenet8cman': [1630], 'siebel-ns': [2320], 'novell-lu6.2': [1416], 'item': [3848], 'giga-pocket': [3862], 'atex_elmd': [1385], 'mqe-broker': [3957], 'pc-mta-addrmap': [2246], 'imap3': [220], 'adtempusclient': [3760], 'fiorano-rtrsvc': [1855], 'natdataservice': [3927], 'qsnet-cond': [4357], 'prizma': [2039], 'altbsdp': [7799], 'xdtp': [3088], 'corel-vncadmin': [2654], 'corba-iiop-ssl': [684], 'spt-automation': [5814], 'funk-license': [1787], 'opalis-robot': [314], 'crinis-hb': [3818], 'njenet-ssl': [2252], 'apogeex-port': [3184], 'oidocsvc': [4142], 'edm-adm-notify': [3463], 'mdbs-daemon': [800], 'nsw-fe': [27], 'alarm-clock-c': [2668], 'ace-client': [2334], 'ethernet-ip-1': [2222], 'rmlnk': [2818], 'irdg-post': [2632], 'fsr': [7164], 'filenet-re': [32774], 'swistrap': [6965], 'niprobe': [25903], 'questdb2-lnchr': [5677], 'ideafarm-door': [902], 'checkpoint-rtm': [18241], 'interpathpanel': [2652], 'prsvp': [3455], 'cindycollab': [3770], 'htrust': [5628], 'redstone-cpss': [2928], 'ipcserver': [600], 'interactionweb': [3508], 'xrpc-registry': [3651], 'nmsigport': [2817, 2839], 'abacus-remote': [2894], 'health-trap': [1162], 'mondex': [471], 'fujitsu-dev': [747], 'geniuslm': [3005], 'vmnet': [175], 'itactionserver2': [7281], 'itactionserver1': [7280], 'pmcs': [6355], 'nmea-0183': [10110], 'integrius-stp': [17234], 'univision': [2820], 'pdtp': [6086], 'orbixd': [1570], 'netrcs': [742], 'sxuptp': [19540], 'escvpnet': [3629], 'upgrade': [2537], 'tetrinet': [31457], '3comfaxrpc': [3446], 'ttc-etap': [2675], '4talk': [3284], 'stmf': [501], 'sco-dtmgr': [617], 'ipr-dglt': [3678], 'dialpad-voice2': [2861], 'elanlm': [4346], 'dialpad-voice1': [2860], 'cmip-man': [163], 'aurora-balaena': [33123], 'haipe-otnk': [3769], 'ida-discover2': [5742], 'apx500api-2': [2265], 'checksum': [1386], 'apx500api-1': [2264], 'pptconference': [1711], 'ieee-mih': [4551], 'contamac_icm': [4846], 'ias-neighbor': [4596], 'proxy-gateway': [2303], 'cisco-snat': [15555], 'healthd': [1281], 'nucleus-sand': [1201], 'stanag-5066': [5066], 'mccwebsvr-port': [3570], 'h323hostcallsc': [1300], 'transact': [1869], 'rtmp-port': [3500], 'signet-ctf': [2733], 'mshnet': [1989], 'tl1-raw-ssl': [6251], 'eudora-set': [592], 'newlixreg': [2671], 'tmesis-upshot': [2798], 'sntp-heartbeat': [580], 'menandmice-lpm': [1231], 'mos-aux': [10542], 'hs-port': [2570], 'athand-mmp': [20999], 'carrius-rshell': [1197], 'upnotifyps': [3356], 'telelpathattack': [5011], 'zephyr-srv': [2102], 'cailic': [216], 'ipx': [213], 'writesrv': [1334], 'cinegrfx-lm': [1743], 'herodotus-net': [3921], 'purenoise': [663], 'ibridge-mgmt': [2276], 'htcp': [4827], 'siipat': [1733], 'sns-agent': [5417], 'qotps': [2724], 'simple-tx-rx': [2257], 'topflow': [2885], 'talarian-mcast4': [4018], 'csregagent': [3022], 'scientia-sdb': [1811], 'edm-stager': [3461], 'xgrid': [4111], 'icad-el': [425], 'pfu-prcallback': [3208], 'd2000kernel': [3119], 'canon-bjnp3': [8613], 'dsmcc-session': [13819], 'canon-bjnp1': [8611], 'canon-capt': [3756], 'httpx': [4180], 'ssr-servermgr': [45966], 'canon-bjnp4': [8614], 'opsec-ufp': [18182], 'ansyslmd': [1055], 'dvcprov-port': [3776], 'ice-srouter': [4064], 'afs3-errors': [7006], 'parliant': [4681], 'icg-iprelay': [2064], 'pconnectmgr': [1562], 'qft': [189], 'mobile-p2p': [4688], 'ssowatch': [3644], 'cacsambroker': [7163], 'powwow-server': [13224], 'bacula-dir': [9101], 'intecourier': [495], 'iso-ill': [499], 'movaz-ssc': [5252], 'ardus-mtrns': [1117], 'trnsprntproxy': [3346], 'opi-sock': [7429], 'wlbs': [2504], 'rbakcup2': [2774], 'nexstorindltd': [2360], 'ms-sideshow': [5360], 'cpqrpm-server': [3257], 'd2k-tapestry2': [3394], 'mcp-port': [3558], 'ticf-1': [492], 'tappi-boxnet': [2306], 'cnap': [7262], 'fodms': [7200], 'bintec-admin': [2107], 'med-ltp': [24000], 'fs-qos': [41111], 'igrid': [19000], 'sdo-ssh': [3897], 'niobserver': [25901], 'hks-lm': [1722], 'trustestablish': [2573], 'arena-server': [11321], 'ibp': [2572], 'vp2p': [8473], 'sky-transport': [3556], 'indigo-server': [1176], 'afs3-kaserver': [7004], 'brcd': [1323], 'sybaseanywhere': [2638], 'ddm-ssl': [448], 'fiorano-msgsvc': [1856], 'tmo-icon-sync': [5583], 'ncube-lm': [1521], 'sixtrak': [1594], 'neteh': [3828], 'corbaloc': [2809], 'tr-rsrb-p1': [1987], 'jmb-cds1': [8900], 'jmb-cds2': [8901], 'tr-rsrb-p2': [1988], 'send': [169], 'pcsync-http': [8444], 'nssagentmgr': [4454], 'spc': [6111], 'spss-lm': [1759], 'saratoga': [7542], 'srvc-registry': [3018], 'slc-ctrlrloops': [2827], 'rib-slm': [3296], 'faxstfx-port': [3684], 'saiseh': [1644], 'sunclustergeo': [2084], 'icon-discover': [2799], 'ampr-rcmd': [459], 'pd-admin': [9597], 'mmcc': [5050], 'hcp-wismar': [686], 'nmsd': [1239], 'cycleserv': [763], 'tapestry': [1922], 'nuts-bootp': [4133], 'direcpc-video': [1825], 'ms-theater': [2460], 'laes-bf': [9536], 'sd-elmd': [1681], 'snapp': [2333], 'ssslog-mgr': [1204], 'csdmbase': [1467, 1471], 'emprise-lsc': [3586], 'connlcli': [1358], 'lpcp': [1298], 'slush': [1966], 'aol': [5190], 'wsdapi-s': [5358], 'seagulllms': [1291], 'sun-sr-iiops': [6486], 'omnivision': [1135], 'ms-wbt-server': [3389], 'data-port': [3578], 'repliweb': [2837], 'd-data-control': [4302], 'pslicser': [4168], 'cert-initiator': [1639], 'rapidmq-center': [3093], 'sflm': [3162], 'xserveraid': [3722], 'aairnet-2': [3619], 'ls3bcast': [3068], 'mao': [2908], 'aairnet-1': [3618], 'rtip': [771], 'avocent-adsap': [3871], 'integra-sme': [484], 'mediabox': [46999], 'netserialext3': [16367], 'kryptolan': [398], 'netserialext1': [16360], 'ariliamulti': [3140], 'vnwk-prapi': [2538], 'matip-type-a': [350], 'xds': [2130], 'matip-type-b': [351], 'talarian-mcast3': [4017], 'b-novative-ls': [1896], 'dell-rm-port': [3668], 'lavenir-lm': [3373], 'med-net-svc': [24006], 'altav-tunnel': [3265], 're101': [1343], 'gvcp': [3956], 'tftps': [3713], 'smsd': [596], 'glogger': [2033], 'brain': [2169], 'jaxer-manager': [4328], 'seagull-ais': [1208], 'qmqp': [628], 'devshr-nts': [552], 'rbt-wanopt': [7810], 'sybasedbsynch': [2439], 'gtaua': [2186], 'appleqtc': [458], 'mtportmon': [7421], 'cas-mapi': [3682], 'ulp': [522], 'monitor': [561], 'openhpid': [4743], 'intu-ec-svcdisc': [8020], 'pn-requester2': [2718], 'hp-sci': [1299], 'novell-ipx-cmd': [2645], 'phonex-port': [3177], 'shofar': [4105], 'policyserver': [3055], 'nbx-ser': [2095], 'armadp': [1913], 'virtual-time': [1852], 'pduncs': [16310], 'ndl-als': [3431], 'dmdocbroker': [1489], 'iims': [4800], 'whois++': [63], 'listmgr-port': [3767], 'wbem-http': [5988], 'rsisysaccess': [2752], 'sent-lm': [2316], 'reachout': [43188], 'xxnetserver': [3832], 'integral': [3459], 'cddbp-alt': [8880], 'mloadd': [1427], 'adapt-sna': [1365], 'rtsp-alt': [8554], 'xmltec-xmlmail': [9091], 'binkp': [24554], 'isbconference2': [1245], 'ls3': [3069], 'veritas-pbx': [1556], 'isbconference1': [1244], 'global-wlink': [1909], 'btrieve': [3351], 'jvclient': [1940], 'isoipsigport-2': [1107], 'dcsoftware': [3793], 'netiq-qcheck': [10114], 'name': [42], 'netrockey6': [4425], 'ovsessionmgr': [2389], 'redstorm_info': [2348], 'optech-port1-lm': [2237], 'tl1': [2361], 'idig_mux': [4152], 'rsvp-tunnel': [363], 'intv': [1585], 'vpnz': [1224], 'smartcard-port': [3516], 'pm-cmdsvr': [5112], 'ucentric-ds': [2879], 'afs3-vlserver': [7003], 'shiva_confsrvr': [1651], 'fujitsu-dtcns': [1514], 'compaq-evm': [619], 'afesc-mc': [6628], 'domain': [53], 'ncpm-pm': [1591], 'wnn6-ds': [26208], 'adrep': [3954], 'nim': [1058], 'lam': [2040], 'ii-admin': [3006], 'vcrp': [3073], 'crestron-ctp': [41795], 'ea': [17729], 'encrypted-admin': [1138], 'kana': [2656], 'ultrex': [1327], 'igcp': [2801], 'cisco-tna': [131], 'pt2-discover': [1101], 'iasd': [432], 'at-8': [208], 'direcpc-dll': [1844], 'myrtle': [1831], 'atlinks': [4154], 'optiwave-lm': [2524], 't1distproc60': [32249], 'fiveacross': [1193], 'nss': [4159], 'bbn-mmx': [1348], 'mesavistaco': [1249], 'isis-bcast': [2043], 'tw-auth-key': [27999], 'icpv2': [3130], 'pscupd': [3453], 'zion-lm': [1425], 'pulsonixnls': [6140], 'smar-se-port2': [4988], 'smar-se-port1': [4987], 'centerline': [3987], 'msfw-replica': [2173], 'fagordnc': [3873], 'bbn-mmc': [1347], 'pcc-image-port': [3892], 'mercantile': [3398], 'aipn-auth': [3833], 'd3winosfi': [3458], 'lmp': [701], 'xnmp': [1652], 'nattyserver': [3753], 'lms': [4056], 'payrouter': [1246], 'netlabs-lm': [1406], 'mc-brk-srv': [3180], 'nexgen': [6627], 'icabrowser': [1604], '3com-net-mgmt': [2391], 'nrcabq-lm': [1458], 'magicnotes': [3023], 'iatp-normalpri': [6999], 'sdproxy': [1297], 'rlp': [39], 'n2nremote': [1685], 'nufw': [4128], 'wacp': [3633], 'cab-protocol': [595], 'covia': [64], 'liberty-lm': [1496], 'sitaraserver': [2629], 'attachmate-s2s': [2419], 'agriserver': [3021], 'turn': [3478], 'netiq': [2220], 'h323hostcall': [1720], 'dhcp-failover2': [847], 'apex-edge': [913], 'stun-p3': [1992], 'mmpft': [1815], 'chip-lm': [1572], 'busycal': [4990], 'us-cli': [8082], 'config-port': [3577], 'aimpp-hello': [2846], 'parsec-game': [6582], 'netspeak-is': [21846], 'reftek': [2543], 'cnrprotocol': [1096], 'imyx': [1143], 'sso-control': [2711], 'wilkenlistener': [1890], 'ewinstaller': [4091], 'hb-engine': [1703], 'opsession-clnt': [3303], 'wimsic': [1326], 'gotodevice': [2217], 'proshareaudio': [5713], 'crip': [6253], 'rmopagt': [2959], 'eba': [45678], 'dsfgw': [438], 'scoi2odialog': [360], 'ibm-mqseries2': [1881], 'stargatealerts': [1654], 'hpoms-dps-lstn': [5404], 'hecmtl-db': [1551], 'fujitsu-dtc': [1513], 'msfw-s-storage': [2172], 'upnotifyp': [4445], 'ctx-bridge': [3127], 'fmp': [4745], 'instl-bootc': [1068], 'pda-gate': [4012], 'su-mit-tg': [89], 'caps-lm': [3290], 'apparenet-tps': [3237], 'lanyon-lantern': [1682], 'iax': [4569], 'bfd-echo': [3785], 'kftp': [6621], 'pslserver': [2352], 'hippad': [2988], 'donnyworld': [1821], 'instl-boots': [1067], 'office-tools': [7789], 'aminet': [2639], 'tvpm': [21800], 'courier': [530], 'dns2go': [1227], 'pns': [2487], 'bhoedap4': [352], 'permabit-cs': [5312], 'visicron-vs': [4307], 'auditd': [48], 'cleanerliverc': [3481], 'cops': [3288], 'dvt-system': [3246], 'netrisk': [1799], 'bmc-ar': [2494], 'mti-tcs-comm': [2469], 'conferencetalk': [1713], 'gamesmith-port': [31765], 'clvm-cfg': [1476], 'hacl-local': [5304], 'statsci1-lm': [6144], 'lan900_remote': [2395], '3com-njack-1': [5264], 'ovalarmsrv-cmd': [2954], 'sqlexec': [9088], 'nec-raidplus': [2730], 'edm-manager': [3460], 'musiconline': [1806], 'mysql': [3306], 'rsc-robot': [1793], 'ocserver': [184], 'is99s': [380], 'savant': [3391], 'jwserver': [1937], 'egs': [1926], 'lvision-lm': [6471], 'xiostatus': [2341], 'aamp': [3939], 'vocaltec-admin': [1796], 'juxml-port': [3642], 'hp-webqosdb': [1877], 'omscontact': [4161], 'spugna': [3807], 'stun-behavior': [3478], 'g-talk': [2421], 'dccm': [5679], 'sm-pas-5': [2942], 'atm-zip-office': [1520], 'dasp': [439], 'pktcable-cops': [2126], 'piccolo': [2787], 'cloanto-net-1': [356], 'adi-gxp-srvprt': [6769], 'sunwebadmin': [8800], 'netbill-keyrep': [1613], 'cwmp': [7547], 'erpc': [121], 'conspiracy': [4692], 'icslap': [2869], 'dbsa-lm': [1407], 'accu-lmgr': [7781], 'konspire2b': [6085], 'must-backplane': [3515], 'profinet-rt': [34962], 'netiq-ncap': [2219], 'prospero': [191], 'ewdgs': [4092], 'phoenix-rpc': [3347], 'klio': [7697], 'slp-notify': [1847], 'canex-watch': [3583], 'msexch-routing': [691], 'hybrid-pop': [473], 'alias': [1187], 'ftrapid-2': [1747], 'xoraya': [11876], 'ftrapid-1': [1746], 'playsta2-lob': [4659], 'wap-wsp': [9200], 'dellwebadmin-2': [1279], 'dellwebadmin-1': [1278], 'siemensgsm': [28240], 'evtp': [2834], 'appworxsrv': [2136], 'http-wmap': [8990], 'icmpd': [5813], 'toad': [2669], 'acp-conduit': [3823], 'fcp': [510], 'cnrp': [2757], 'printer': [515], 'cifs': [3020], 'spiral-admin': [3438], 'track': [20670], 'rdrmshc': [1075], 'dtserver-port': [4028], 'cisco-sccp': [2000], 'ctsd': [5137], 'gtrack-server': [3591], 'synotics-broker': [392], 'e-woa': [3728], 'ife-icorp': [5165], 'mxomss': [1141], 'opc-job-track': [424], 'opswagent': [3976], 'dhct-alerts': [4676], 'snip-slave': [33656], 'pnaconsult-lm': [2937], 'brutus': [2003], 'ricardo-lm': [1522, 6148], 'cesdinv': [2856], 'kopek-httphead': [27504], 'mylex-mapd': [467], 'seispoc': [2254], 'xingmpeg': [1558], 'synchromesh': [4548], 'ss7ns': [477], 'afs3-callback': [7001], 'j-ac': [4107], 'mrm': [679], 'simplifymedia': [8087], 'netconfsoapbeep': [833], 'avt-profile-1': [5004], 'link': [245], 'avt-profile-2': [5005], 'sixxsconfig': [3874], 'mdnsresponder': [5354], 'funk-dialout': [2909], 'wsm-server': [5006], 'asip-webadmin': [311], 'ddrepl': [4126], 'pwdgen': [129], 'recipe': [2240], 'buddy-draw': [1854], 'noaaport': [2210], 'nimsh': [3901], 'netport-id': [3129], 'elan': [1378], 'twcss': [3428], 'jlicelmd': [1567], 'ncadg-ip-udp': [3063], 'elad': [1893], 'dslremote-mgmt': [2420], 'excerpts': [5401], 'vsixml': [2996], 'wms-messenger': [3219], 'amt-esd-prot': [1082], 'legent-2': [374], 'embrace-dp-c': [3198], 'sdo': [3635], 'etebac5': [1216], 'cisco-ipsla': [1167], 'powerclientcsf': [2443], 'tcpnethaspsrv': [475], 'opcon-xps': [3100], 'amx-weblinx': [2930], 'pvuniwien': [1081], 'rlzdbase': [635], 'embrace-dp-s': [3197], 'mercury-disc': [9596], 'dict': [2628], 'helix': [10860], 'ntalk': [518], 'rbakcup1': [2773], 'ehp-backup': [3638], 'filenet-nch': [32770], 'quaddb': [2497], 'ifcp-port': [3420], 'vrts-registry': [2410], 'ique': [18769], 'sst': [266], 'tr-rsrb-port': [1996], 'backburner': [2635], 'peport': [1449], 'pscribe': [6163], 'cuseeme': [7648], 'fairview': [38202], 'ripng': [521], 'pago-services2': [30002], 'prosharerequest': [5716], 'chromagrafx': [1373], 'sim-control': [3110], 'pxc-epmap': [2434], 'unify-adapter': [1889], 'msnp': [1863], 'metastorm': [2511], 'admind': [3279, 8403], 'ni-mail': [61], 'oi-2000': [2364], 'echonet': [3610], 'badm_pub': [6506], 'noteshare': [8474], 'vistium-share': [1545], 'prm-nm': [409], 'aicc-cmi': [3316], 'bl-idm': [142], 'sonar': [572], 'ua-secureagent': [19194], 'amanda': [10080], 'h323gatestat': [1719], 'canditv': [24676], 'natuslink': [2895], 'distinct32': [9998], 'bdir-priv': [6507], 'ms-streaming': [1755], 'vsi-omega': [7566], 'netadmin': [2450], 'menandmice-noh': [4151], 'amt-soap-https': [16993], 'mc-gt-srv': [2180], 'ldss': [6087], 'ardusmul': [1835], 'di-ase': [3046], 'profinet-rtm': [34963], 'montage-lm': [6147], 'enc-tunnel-sec': [3568], 'kermit': [1649], 'wcbackup': [8912], 'silhouette': [7500], 'orbix-loc-ssl': [3077], 'opentable': [2368], 'ovhpas': [7510], 'rprt': [3064], 'cybro-a-bus': [8442], 'bhmds': [310], 'loaprobe': [1634], 'symplex': [1507], 'zabbix-agent': [10050], 'vytalvaultvsmp': [2547], 'isode-dua': [17007], 'netmap-lm': [1493], 'altav-remmgt': [2456], 'pump': [751], 'nimgtw': [48003], 'consul-insight': [5992], 'hsrpv6': [2029], 'mtn': [4691], 'sdhelp': [2308], 'versatalk': [3738], 'nntp': [119], 'vsamredirector': [2387], 'netview-aix-8': [1668], 'netconf-beep': [831], 'openmailg': [5755], 'connendp': [693], 'fintrx': [3787], 'dmexpress': [32636], 'syslog-tls': [6514], 'msgsys': [9594], 'sun-sea-port': [16161], 'slingshot': [1705], 'roboeda': [2920], 'dyna-access': [3310], 'invision': [1641], 'locus-map': [125], 'diamondport': [33331], 'scoremgr': [2034], 'uacs': [2768], 'pcsync-https': [8443], 'nfoldman': [7393], 'ssdispatch': [3430], 'dbcontrol_agent': [3938], 'suucp': [4031], 'sflow': [6343], 'clutild': [7174], 'fg-sysupdate': [6550], 'rmtserver': [2416], 'windlm': [1785], 'decbsrv': [579], 'talikaserver': [22763], 'madcap': [2535], 'brdptc': [2155], 'hello-port': [652], 'imip-channels': [11320], 'rs-pias': [13217], 'aura': [2066], 'monp': [3445], 'dka': [1263], 'qpasa-agent': [2612], 'vrcommerce': [2530], 'hylafax': [4559], 'scpi-raw': [5025], 'irdmi2': [7999], 'sns-gateway': [5416], 'splitlock-gw': [3647], 'netxms-sync': [4702], 'bpcd': [13782], 'qmvideo': [5689], 'mobilitysrv': [6997], 'dandv-tester': [3889], 'raven-rmp': [3532], 'nimspooler': [48001], 'teedtap': [559], 'miteksys-lm': [1482], 'sysrqd': [4094], 'sns-protocol': [2409], 'btprjctrl': [2803], 'netrix-sftm': [2328], 'aic-np': [2785], 'upsnotifyprot': [2648], 'sentinel': [3588], 'ardus-trns': [1115], 'telesis-licman': [1380], 'd-s-n': [8086], 'sge_execd': [6445], 'ovrimosdbman': [2956], 'sdl-ets': [5081], 'xnm-clear-text': [3221], 'bpcp-trap': [2845], 'raven-rdp': [3533], 'netbookmark': [3131], 'bbars': [3327], 'ssm-cssps': [2478], 'bsquare-voip': [1071], 'qip-login': [2366], 'aodv': [654], 'vseconnector': [2893], 'corerjd': [284], 'unisys-lm': [1823], 'mni-prot-rout': [3764], 'www-ldap-gw': [1760], 'omsdk': [5724], 'informer': [3856], 'pluribus': [3469], 'ms-alerter': [5359], 'whosells': [2781], 'avian': [486], 'mcs-calypsoicf': [3330], 'fmpro-internal': [5003], 'bpjava-msvc': [13722], 'sshell': [614], 'megaco-h248': [2944], 'rvs-isdn-dcp': [2578], 'airsync': [2175], 'stun-p1': [1990], 'statsci2-lm': [6145], 'lanmessenger': [2372], 'iapp': [2313], 'ibus': [8733], '9pfs': [564], 'gnutella-rtr': [6347], 'lot105-ds-upd': [2053], 'aurp': [387], 'iwb-whiteboard': [2982], 'vat-control': [3457], 'ndsp': [2881], 'eis': [3982], 'printer_agent': [3396], 'iceedcp_tx': [31948], 'grf-port': [3757], 'impera': [1710], 'kazaa': [1214], 'netplan': [2983], 'zserv': [346], 'bpmd': [3593], 'pvxpluscs': [4093], 'shockwave': [1626], 'nextstep': [178], 'interserver': [3060], 'casp': [1130], 'z39-50': [210], 'psmond': [1788], 'kentrox-prot': [2502], 'u-dbap': [3584], 'profinet-cm': [34964], 'tram': [4567], 'mctet-gateway': [3116], 'elvin-client': [2917], 'wpages': [776], 'grid-alt': [6269], 'ramp': [7227], 'targus-getdata3': [5203], 'xinuexpansion3': [2023], 'xss-port': [3510], 'h263-video': [2979], 'rbr-debug': [44553], 'smc-https': [6789], 'commandport': [3416], 'dzoglserver': [3867], 'lv-ffx': [2144], 'xdas': [7629], 'macbak': [4181], 'csccfirewall': [40843], 'intersys-cache': [1972], 'tpmd': [1906], 'nbt-pc': [5133], 'sbook': [1349], 'dialogic-elmd': [1945], 'ottp': [2951], 'iscsi': [860], 'hostname': [101], 'asprovatalk': [1079], 'epmd': [4369], 'pptp': [1723], 'bex-xr': [15660], 'nm-asses-admin': [3150], 'interbase': [2041], 'cis-secure': [22343], 'sfs-config': [452], 'nsjtp-data': [1688], 'trivnet1': [8200], 'trivnet2': [8201], 'islc': [1637], 'metaedit-mu': [6360], 'rfio': [3147], 'smpppd': [3185], 'persona': [1916], 'casanswmgmt': [3669], 'targus-getdata1': [5201], 'cppdp': [4051], 'cplscrambler-in': [1087], 'v-one-spp': [3845], 'sgmp-traps': [160], 'nicetec-nmsvc': [2556], 'sco-peer-tta': [5427], 'wired': [4871], 'appswitch-emp': [2616], 'tunalyzer': [5748], 'nds-sso': [3024], 'jcp': [19541], 'wcr-remlib': [4845], 'boks_servc': [6501], 'vmrdp': [2179], 'resacommunity': [1154], 'bluelance': [2877], 'shadowserver': [2027], 'locus-con': [127], 'ca-audit-da': [8025], 'intel-rci-mp': [16991], 'bcinameservice': [3415], 'ctdp': [7022], 'lm-perfworks': [8204], 'pwrsevent': [2694], 'ovtopmd': [2532], 'chargen': [19], 'pftp': [662], 'ca-audit-ds': [8026], 'hivestor': [4884], 'genie': [402], 'nced': [404], 'kastenxpipe': [36865], 'estamp': [1982], 'm4-network-as': [4345], 'ctdb': [4379], 'ias-paging': [4595], 'ff-fms': [1090], 'worldscores': [4545], 'wap-wsp-wtp': [9201], 'virtual-places': [1533], 'asdis': [2192], 'ssp-client': [7801], 'mxi': [8005], 'dbcontrol-oms': [1158], 'caids-sensor': [1192], 'jaus': [3794], 'net-projection': [5363], 'ace-svr-prop': [2476], 'hp-nnm-data': [2690], 'entexthigh': [12002], 'nw-license': [3697], 'm2ua': [2904], 'rt-event': [3706], 'qsm-remote': [1166], 'firstcall42': [2673], 'tcoregagent': [1976], 'sgi-storman': [1178], 'snmp': [161], 'llsurfup-http': [1183], 'kti-icad-srvr': [6701], 'filenet-peior': [32776], 'netsc-dev': [155], 'netsteward': [2810], 'lds-dump': [6544], 'cadview-3d': [649], 'lsi-raid-mgmt': [2463], 'cogitate': [3039], 'sco-sysmgr': [616], 'csd-mgmt-port': [3071], 'pawserv': [345], 'intelsync': [3692], 'gris': [2135], 'pcmail-srv': [158], 'sis-emt': [2545], 'netspeak-acd': [21848], 'editbench': [1350], 'veritas-ucl': [2148], 'enl-name': [1805], 'amc': [5506], 'kar2ouche': [4661], 'oma-ulp': [7275], 'gilatskysurfer': [3013], 'proactivesrvr': [2722], 'aises': [2783], 'grid': [6268], 'mon': [2583, 9255], 'dbase': [217], 'scpi-telnet': [5024], 'itv-control': [3899], 'amp': [3811], 'ams': [1037], 'varadero-2': [4839], 'audiojuggler': [3643], 'amt': [2268], 'lecroy-vicp': [1861], 'qsnet-trans': [4354], 'n2h2server': [9285], 'netopia-vo1': [1839], 'broker-service': [3014], 'assuria-slm': [4119], 'samsung-unidex': [4010], 'psrserver': [2351], 'varadero-0': [4837], 'vitalanalysis': [2474], 'ocs-amu': [429], 'print-srv': [170], 'mftp': [349, 5402], 'manage-exec': [2342], 'padl2sim': [5236], 'touchnetplus': [2158], 'zephyr-clt': [2103], 'rescap': [283], 'slinterbase': [3065], 'ocs_amu': [429], 'msdfsr': [5722], 'radclientport': [3178], 'dberegister': [1479], 'dbisamserver2': [12006], 'mrip': [4986], 'elcsd': [704], 'dbisamserver1': [12005], 'scriptview': [7741], 'veracity': [1062], 'lm-sserver': [8207], 'mbl-battd': [4153], 'rrdp': [5313], 'msft-gc': [3268], 'glbp': [3222], 'acmsoda': [6969], 'qbdb': [8019], 'licensedaemon': [1986], 'mcs-fastmail': [3302], 'ocs-cmu': [428], 'trispen-sra': [9555], 'ms-cluster-net': [3343], 'fcopys-server': [5746], 'facilityview': [1561], 'rets-ssl': [12109], 'owamp-control': [861], 'remote-collab': [2250], 'perf-port': [1995], 'watchdog-nt': [2723], 'bctp-server': [10107], 'olsr': [698], 'sbi-agent': [3962], 'lnvconsole': [2281], 'gearman': [4730], 'iniserve-port': [3560], 'lonworks2': [2541], 'worldwire': [2371], 'ep-nsp': [3621], 'udt-os': [1382, 3900], 'cognima': [3779], 'wv-csp-sms': [3590], 'neod2': [1048], 'dproxy': [1296], 'mnet-discovery': [5237], 'lanner-lm': [4547], 'ddm-dfm': [447], 'cba8': [9593], 'storview': [9293], 'proshare-mc-2': [1674], 'childkey-notif': [1891], 'watchme-7272': [7272], 'noagent': [1917], 'awacs-ice': [4488], 'nms': [1429], 'business': [3107], 'hacl-probe': [5303], 'pxc-splr-ft': [4003], 'tnmpv2': [3686], 'inspect': [1602], 'wap-pushsecure': [2949], 'plcy-net-svcs': [4351], 'uarps': [219], 'soagateway': [5250], 'minger': [4069], 'l3-exprt': [2840], 'hpiod': [2208], 'sunclustermgr': [1097], 'skronk': [460], 'ms-la': [3535], 'asam': [3451], 'journee': [3042], 'oracle-em1': [1748], 'dls-mon': [198], 'oracle-em2': [1754], 'src': [200], 'ws-discovery': [3702], 'mos-soap': [10543], 'sur-meas': [243], 'vipremoteagent': [3752], 'gc-config': [3436], 'aci': [187], 'beacon-port-2': [4426], 'jstel': [1064], 'bacnet': [47808], 'acp': [599], 'ethernet/ip-1': [2222], 'net-steward': [2128], 'nsiiops': [261], 'ethernet/ip-2': [44818], 'besapi': [3408], 'avantageb2b': [2131], 'tributary': [2580], 'jediserver': [2406], 'nettgain-nms': [1879], 'clariion-evr01': [6389], 'abatjss': [3656], 'netopia-vo3': [1841], 'iso-tp0': [146], 'cvc_hostd': [442], 'netopia-vo4': [1842], 'nicname': [43], 'qrh': [752], 'tht-treasure': [1832], 'igo-incognito': [4100], 'pay-per-view': [1564], 'whoami': [565], 'netobjects2': [2486], '3com-webview': [2339], 'linx': [1361], 'netobjects1': [2485], 'ms-shuttle': [568], 'avanti-cdp': [4065], 'gbjd816': [2626], 'csvr-proxy': [3190], 'noadmin': [1921], 'rmt': [411], 'rockwell-csp2': [2223], 'outlaws': [5310], 'otmp': [29167], 'ehs': [4535], 'rsip': [4555], 'ezproxy-2': [10102], 'inovaport5': [23004], 'sercomm-wlink': [2235], 'iph-policy-cli': [2962], 'font-service': [7100], 'bprd': [13720], 'surveyinst': [3212], 'sun-as-iiops': [3708], 'ldgateway': [9592], 'ovladmgr': [7428], 'stars': [4131], 'vrtp': [2255], 'patrol-snmp': [8161], 'personal-agent': [5555], 'adaptecmgr': [2521], 'ptp-event': [319], 'ewcappsrv': [1876], 'fs-rh-srv': [3488], 'cadkey-licman': [1399], 'umsp': [2110], 'applus': [2037], 'sse-app-config': [3852], 'otlp': [6951], 'geognosisman': [4325], 'semaphore': [3255], 'lkcmserver': [3278], 'hsrp': [1985], 'plato-lm': [1819], 'spramsd': [5770], 'ibm-pps': [1376], 'rje': [5], 'filenet-obrok': [32777], 'sai-sentlm': [2640], 'filenet-cm': [32773], 'foresyte-sec': [5408], 'quotad': [762], 'e-mdu': [3727], 'ccmcomm': [3505], 'vcs-app': [14141], 'utsftp': [2529], 'patrol-coll': [6162], 'mos-upper': [10541], 'tripe': [4070], 'amcs': [8766], 'radec-corp': [5430], 'prregister': [4457], 'ttnrepository': [2943], 'remctl': [4373], 'alesquery': [5074], 'suitcase': [2903], 'iceedcp_rx': [31949], 'ssrip': [3318], 'symantec-sfdb': [5629], 'prchat-server': [4456], 'bnt-manager': [3344], 'razor': [3555], 'af': [1411], 'aurora-cmgr': [364], 'ibm-dial-out': [3267], 'websm': [9090], 'distcc': [3632], 'nerv': [1222], 'ap': [47806], 'thrtx': [4139], 'cbt': [7777], 'ms-olap1': [2393], 'md-cg-http': [2688], 'ms-olap3': [2382], 'ideesrv': [2337], 'ms-olap4': [2383], 'snifferdata': [2892], 'apparenet-as': [3238], 'trim-event': [4322], 'spice': [1923], 'rtsps': [322], 'ms-rule-engine': [3132], 'appliance-cfg': [2898], 'compx-lockview': [4308], 'adobeserver-3': [3703], 'cernsysmgmtagt': [3830], 'adobeserver-1': [1102], 'hybrid': [1424], 'csoftragent': [3004], 'adobeserver-4': [3704], 'adobeserver-5': [3705], 'fcp-srvr-inst2': [5503], 'stun-p2': [1991], 'pehelp': [2307], 'fcp-srvr-inst1': [5502], 'keyshadow': [19315], 'fotogcad': [3878], 'sitewatch': [3792], 'starquiz-port': [3526], 'mbus': [47000], 'willy': [2518], 'ctcd': [1851], 'questnotify': [3554], 'eicon-x25': [1439], 'vt-ssl': [3509], 'corelvideo': [1566], 'iris-beep': [702], 'aimpp-port-req': [2847], 'timbuktu-srv4': [1420], 'hp-pxpib': [3101], 'nm-game-admin': [3148], 'suitjd': [3354], 'travsoft-ipx-t': [2644], 'time': [37], 'netware-ip': [396], 'rds2': [1541], 'ndsconnect': [3890], 'sonuscallsig': [2569], 'accessbuilder': [888], 'lbc-sync': [2779], 'nucleus': [1463], 'snifferclient': [2452], 'onmux': [417], 'orbplus-iiop': [1597], 'bues_service': [2446], 'cedros_fds': [4140], 'dn6-smm-red': [196], 'max': [6074], 'zented': [1229], 'masc': [2587], 'adap': [6350], 'stresstester': [5397], 'arkivio': [3426], 'hdap': [263], 'rxe': [761], 'hacl-cfg': [5302], 'dsmcc-passthru': [13820], 'yo-main': [4040], 'intrastar': [1907], 'hacl-qs': [1238], 'davsrc': [9800], 'odi-port': [3187], 'rrimwm': [1694], 'hpssd': [2207], 'atc-lm': [1170], 'husky': [1310], 'ssdp': [1900], 'cps': [14250], 'documentum-s': [10003], 'kyoceranetdev': [1063], 'atc-appserver': [1171], 'freeciv': [5556], 'de-noc': [1254], 'newlixengine': [2075], 'fatserv': [347], 'amberon': [8301], 'proshare1': [1459], 'graphics': [41], 'iascontrol': [1157], 'tnp-discover': [8320], 'd-cinema-rrp': [1173], 'qsm-gui': [1165], 'dsmcc-ccp': [13822], 'nsc-posa': [2605], 'apdap': [3948], 'smauth-port': [3929], 'pit-vpn': [2865], 'esro-gen': [259], 'qsnet-workst': [4355], 'masqdialer': [224], 'iden-ralp': [1725], 'griffin': [2458], 'iconp': [3972], 'filex-lport': [1887], 'pdnet': [2843], 'jacobus-lm': [1578], 'discard': [9], 'infiniswitchcl': [3602], 'omhs': [5723], 'itscomm-ns': [1573], 'iberiagames': [1726], 'jpegmpeg': [3155], 'fjappmgrbulk': [2510], 'smile': [3670], 'openmath': [1473], 'nbx-au': [2094], '1ci-smcs': [3091], 'joost': [4166], 'stat-scanner': [4157], 'iua': [9900], 'mpm': [45], 'sntlkeyssrvr': [9450], 'tns-adv': [3309], 'icap': [1344], 'nppmp': [3476], 'blockade': [2911], 'senomix02': [8053], 'nlogin': [758], 'seclayer-tcp': [3495], 'senomix05': [8056], 'l5nas-parchan': [9747], 'senomix07': [8058], 'senomix08': [8059], 'hems': [151], 'microsoft-ds': [445], 'boosterware': [2913], 'worldfusion1': [2595], 'worldfusion2': [2596], 'utime': [519], 'synapsis-edge': [5008], 'mainsoft-lm': [1593], 'rds-ip': [18635], 'xo-wave': [3763], 'dbreporter': [1379], 'rmc': [657], 'hbci': [3000], 'warmspotmgmt': [1074], 'bnetfile': [1120], 'egptlm': [3328], 'openqueue': [8764], 'privateark': [1858], 'rgtp': [1431], 'mentaserver': [2118], 'gadugadu': [8074], 'x-bone-ctl': [265], 'tnetos': [377], 'delibo': [2562], 'prodigy-intrnet': [1778], 'essbase': [1423], 'markem-dcp': [3836], 'gss-xlicen': [128], 'hicp': [3250], 'vpjp': [1345], 'rtelnet': [107], 'mgemanagement': [4680], 'dmod-workspace': [3199], 'bvcdaemon-port': [3626], 'xns-mail': [58], 'devbasic': [5426], 're-conn-proto': [1306], 'netview-aix-9': [1669], 'dtpt': [5721], 'lonworks': [2540], 'elcn': [7101], 'strexec-d': [5026], 'spw-dialer': [3796], '3l-l1': [1511], 'filesphere': [24242], 'citrix-rtmp': [2897], 'pnrp-port': [3540], 'sua': [14001], 'iqobject': [48619], 'doc1lm': [3161], 'sum': [6551], 'silkp3': [2831], 'iw-mmogame': [3596], 'sns-query': [2659], 'npdbgmngr': [2293], 'nbdb': [13785], 'mcidas': [112], 'lcm-server': [7365], 'ntp': [123], 'first-defense': [1232], 'dvt-data': [3247], 'intu-ec-client': [8021], 'proaxess': [3961], 'spectardb': [3835], 'arbortext-lm': [1557], 'pra_elmd': [1587], 'tempo': [526], 'danf-ak2': [1041], 'xbox': [3074], 'data-insurance': [2764], 'ggz': [5688], 'acp-discovery': [3822], 'b2n': [1179], 'teamcoherence': [9222], 'ctp-state': [4047], 'itm-mcell-s': [828], 'ecwcfg': [2263], 'multiplex': [171], 'bis-web': [5584], 'vrtstrapserver': [1885], 'tacnews': [98], 'opsec-lea': [18184], 'sanavigator': [4033], 'netviewdm3': [731], 'hp-hcip-gwy': [1803], 'fprams': [4122], 'udp-sr-port': [1624], 'cd3o-protocol': [3616], 'terabase': [4000], 'micromuse-ncps': [7979], 'l-acoustics': [4432], 'citynl': [1729], 'abatemgr': [3655], 'appman-server': [3312], 'mctet-jserv': [3117], 'utmpsd': [430], 'emp-server1': [6321], 'galaxy-server': [3051], 'cmmdriver': [1294], 'emp-server2': [6322], 'chipper': [17219], 'tn-timing': [2739], 'sun-lm': [7588], 'itm-mcell-u': [1828], 'irc-serv': [529], 'ni-visa-remote': [3537], 'x-bone-api': [2165], 'isrp-port': [3788], 'hp-hcip': [1782], 'objectmanager': [2038], 'plgproxy': [2790], 'chshell': [562], 'nfsrdma': [20049], 'c1222-acse': [1153], 'arepa-raft': [3025], 'e-dpnet': [2036], 'miroconnect': [1532], 'intrinsa': [503], 'ias-reg': [2140], 'a4-sdunode': [5605], 'netrjs-1': [71], 'sg-lm': [1659], 'florence': [1228], 'ivcollector': [1275], 'driveappserver': [1930], 'qcp': [5082], 'sage-best-com2': [14034], 'sage-best-com1': [14033], 'directplaysrvr': [47624], 'hermes': [1248], 'ac-tech': [2796], 'synchronet-rtc': [6101], 'softpc': [215], 'elxmgmt': [23333], 'denali-server': [3444], 'pcle-infex': [3189], 'audit': [182], 'optocontrol': [22001], 'dsmcc-download': [13821], 'amx-rms': [3839], 'boks_clntd': [6503], 'infowave': [2082], 'gdbremote': [2159], 'lm-x': [6200], 'ipsec-nat-t': [4500], 'tl1-raw': [3082], 'infoseek': [414], 'filenet-tms': [32768], 'zmp': [3925], 'netaspi': [2902], 'mira': [3454], 'parsec-master': [6580], 'ttg-protocol': [2862], 'tdp-suite': [1814], 'sge-execd': [6445], 'amqps': [5671], 'notify_srvr': [3016], 'patrolview': [4097], 'doom': [666], 'remote-kis': [185], 'deskshare': [1702], 'qmtp': [209], 'mgxswitch': [3070], 'tapeware': [3817], 'dmidi': [1199], 'sdt-lmd': [3319], 'acr-nema': [104], 'fibotrader-com': [6715], 'ldxp': [4042], 'sun-sr-admin': [6489], 'caistoragemgr': [7162], 'mcagent': [1820], 'ridgeway2': [2777], 'dpserve': [7020], 'tpip': [594], 'docstor': [1488], 'scx-proxy': [470], 'cpqrpm-agent': [3256], 'escp-ip': [621], 'alarm-clock-s': [2667], 'gsigatekeeper': [2119], 'kjtsiteserver': [1339], 'scol': [1200], 'xrl': [1104], 'ip-provision': [43190], 'iracinghelper': [32034], 'calltrax': [3675], 'prolink': [1678], 'pwgpsi': [3800], 'stvp': [3158], 'ibm-mgr': [3801], 'sercomm-scadmin': [6108], 'secure-cfg-svr': [3978], 'user-manager': [3272], 'isysg-lm': [1609], 'xprtld': [5634], 'precise-vip': [2924], 'aed-512': [149], 'cso': [105], 'https': [443], 'lhtp': [1983], 'pkix-3-ca-ra': [829], 'anoto-rendezv': [3715], 'taserver': [3552], 'neteh-ext': [3829], 'secure-ts': [9318], 'starschool': [2270], 'ddns-v3': [2164], 'pdps': [1314], 'dab-sti-c': [1076], 'sacred': [1118], 'taskman-port': [2470], 'onehome-help': [2199], 'cfengine': [5308], 'mdbs_daemon': [800], 'xdmcp': [177], 'gv-us': [1369], 'seaodbc': [2471], 'sm-pas-4': [2941], 'netchat': [2451], 'geognosis': [4326], 'vdmplay': [1707], 'remoteware-un': [2999], 'sor-update': [3922], 'iascontrol-oms': [1156], 'ati-ip-to-ncpe': [3965], 'netcheque': [4008], 'net2display': [9086], 'ssh-mgmt': [17235], 'invision-ag': [45054], 'personalos-001': [3557], 'filenet-rmi': [32771], 'netxms-mgmt': [4701], 'esnm-zoning': [4023], 'rt-viewer': [35001], 'vvr-data': [8199], 'agentview': [2331], 'traversal': [4678], 'xsync': [3721], 'hpstgmgr2': [2715], 'tsaf': [12753], 'lrp': [2090], 'bftp': [152], 'rushd': [696], 'ridgeway1': [2776], 'cadlock': [770], 'ininmessaging': [5597], 'patrol-mq-gm': [2664], 'jibe-eb': [3777], 'eyelink': [589], 'ardt': [1826], 'ds-slp': [4406], 'zenginkyo-2': [5021], 'l3-hbmon': [2370], 'mqe-agent': [3958], 'legent-1': [373], 'mc2studios': [1899], 'firemonrcc': [3192], 'maytagshuffle': [2591], 'gsakmp': [3761], 'supermon': [2709], 'rootd': [1094], 'pnbscada': [3875], 'nati-vi-server': [3363], 'ffserver': [3825], 'santak-ups': [3038], 'dbbrowse': [47557], 'npep-messaging': [2868], 'creativepartnr': [455, 3366], 'silverpeakcomm': [4164], 'isns': [3205], 'fryeserv': [2788], 'cp-spxsvr': [4377], 'avenue': [2134], 'mapper-ws-ethd': [3986], 'taligent-lm': [1475], 'pictrography': [1280], 'sgi-esphttp': [5554], 'prat': [1264], 'trisoap': [10200], 'etb4j': [16309], 'vofr-gateway': [21590], 'agentsease-db': [3997], 'dialog-port': [2098], 'ultrabac': [1910], 'apollo-status': [2758], 'hp-san-mgmt': [3037], 'iceedcp-tx': [31948], 'lsp-ping': [3503], 'decvms-sysmgt': [441], 'ccowcmr': [2116], 'vision_server': [6672], 'aic-oncrpc': [2786], 'kshell': [544], 'vxcrnbuport': [3652], 'ms-licensing': [5720], 'itap-ddtp': [10100], 'cisco-net-mgmt': [1741], 'msg-auth': [31], 'mcns-sec': [638], 'dvr-esm': [2804], 'med-fsp-rx': [24001], 'ismserver': [9500], 'officelink2000': [3320], 'xs-openstorage': [1619], 'asa-appl-proto': [502], 'ordinox-dbase': [3355], 'bounzza': [2218], 'dlip': [7201], 'pegasus': [9278], 'hsl-storm': [2113], 'csoft-plusclnt': [2699], 'vaprtm': [3654], 'iclcnet-locate': [886], 'sun-as-nodeagt': [4850], 'e-builder': [4121], 'icpp': [14142], 'suncacao-jmxmp': [11162], 'sql-net': [66, 150], 'discp-server': [2602], 'sybasesrvmon': [4950], 'esmagent': [5601], 'antidotemgrsvr': [2247], 'saiscm': [1501], 'screencast': [1368], 'vcnet-link-v10': [2554], 'prism-deploy': [3133], 'axon-lm': [1548], 'ca-web-update': [14414], 'mdqs': [666], 'csbphonemaster': [1724], 'indura': [3156], 'di-traceware': [3041], 'navisphere-sec': [2163], 'l3-hawk': [2842], 'cruise-enum': [8376], 'neoiface': [1285], 'bfd-multi-ctl': [4784], 'rockwell-csp1': [2221], 'sops': [3944], 'beyond-remote': [5424], 'liebdevmgmt-c': [3027], 'sysinfo-sp': [11967], 'abr-api': [1954], 'gw-call-port': [3745], 'nms-topo-serv': [1486], 'eportcomm': [4666], 'netmagic': [1196], 'badm-pub': [6506], 'connect': [2137], 'wap-vcal': [9205], 'fjdmimgr': [9374], 'quickbooksrds': [3790], 'mit-ml-dev': [83, 85], 'onehome-remote': [2198], 'harp': [1816], 'fjinvmgr': [9396], 'ftp': [21], 'codima-rtp': [2415], 'pxc-spvr-ft': [4002], 'espeech': [8416], 'ezmeeting': [26261], 'must-p2p': [3514], 'simba-cs': [1543], 'izm': [4109], 'coauthor': [1529], 'jdl-dbkitchen': [3086], 'csnotify': [2955], 'acd-pm': [8793], 'ndm-agent-port': [43189], 'lansurveyorxml': [3815], 'apw-registry': [3758], 'hpidsagent': [2985], 'op-probe': [7030], 'hacl-hb': [5300], 'talarian-mcast1': [4015], 'talarian-mcast2': [4016], 'gdp-port': [1997], 'custix': [528], 'asr': [7800], 'med-ovw': [24004], 'hyperip': [3919], 'advant-lm': [2295], 'sco-websrvrmgr': [620], 'vocaltec-gold': [6670], 'memcache': [11211], 'spmp': [656], 'atmp': [5150], 'netnews': [532], 'swift-rvf': [97], 'canocentral0': [1871], 'canocentral1': [1872], 'asa': [386], 'base': [5429], 'fac-restore': [5582], 'us-srv': [8083], 'acptsys': [2149], 'alphatech-lm': [1653], 'asi': [1827], 'fjswapsnp': [1874], 'bitspeer': [2178], 'csccredir': [40842], 'pda-sys': [3254], 'kfxaclicensing': [3581], 'tsb2': [2742], 'kftp-data': [6620], 'synapse-nhttps': [8243], 'nxedit': [126], 'ca-2': [5065], 'ca-1': [5064], 'activememory': [2859], 'fhc': [1499], 'taep-as-svc': [5111], 'salient-usrmgr': [5410], 'tnp1-port': [4024], 'lxi-evntsvc': [5044], 'exp2': [1022], 'epnsdp': [2051], 'heartbeat': [3740], 'pnbs': [6124], 'nmmp': [3649], 'aiagent': [7738], 'boks_servm': [6502], 'netop-rc': [1970], 'sstp-1': [7743], 'dcutility': [1044], 'playsta2-app': [4658], 'ptcnameservice': [597], 'sentinel-lm': [5093], 'unihub-server': [2357], 'lan900-remote': [2395], 'sunscalar-dns': [1870], 'warmux': [3826], 'icl-twobase9': [25008], 'liebdevmgmt-a': [3029], 'csdm': [1468, 1472], 'bh611': [354], 'virtualtape': [2386], 'hacl-monitor': [3542], 'osdcp': [3432], 'cp-spxdpy': [4378], 'spearway': [2440], 'pmcdproxy': [44322], 'honyaku': [2744], 'ezrelay': [10103], 'cloanto-lm': [3397], 'topovista-data': [3906], 'serverview-rm': [3172], 'spocp': [4751], 'interact': [4052], 'rrh': [753], 'sift-uft': [608], 'openmail': [5729], 'uaiact': [1470], 'ibm-ssd': [1260], 'derby-repli': [4851], 'dfn': [1133], 'tn-tl-fd2': [1584], 'tn-tl-fd1': [476], 'ttat3lb': [3579], 'weblogin': [2054], 'caevms': [5251], 'dddp': [9131], 'dvapps': [3831], 'fxuptp': [19539], 'wfremotertm': [1046], 'supdup': [95], 'imsldoc': [2035], 'icl-twobase6': [25005], 'catchpole': [1185], 'rfid-rp1': [4684], 'cisco-sys': [132], 'tempest-port': [11600], 'syslog-conn': [601], 'miles-apart': [2621], 'wiegand': [4390], 'hp-sca': [19411], 'ncl': [2397], 'salient-mux': [5422], 'candrp': [42509], 'decladebug': [410], 'agpolicy': [38203], 'gtrack-ne': [3592], 'hp-sco': [19410], 'csvr': [3417], 'tcc-http': [24680], 'dtk': [365], 'pmd': [7431], 'tellumat-nms': [3549], 'tnos-sp': [7901], 'dossier': [1175], 'chmd': [3099], 'kink': [910], 'ordinox-server': [3274], 'stt': [1607], 'ace-server': [2475], 'ff-lr-port': [3622], 'aap': [2878], 'aas': [1601], 'videobeans': [3058], 'bcs-broker': [1704], 'diagmond': [1508], 'equationbuilder': [1351], 'cymtec-port': [1898], 'lorica-out-sec': [4083], 'hp-alarm-mgr': [383], 'netiq-endpt': [10115], 'wafs': [4049], 'sge_qmaster': [6444], 'spw-dnspreload': [3849], 'telnetcpcd': [3696], 'ccp': [3947], 'ms-sna-server': [1477], 'emwavemsg': [20480], 'dserver': [4309], 'vpps-via': [676], 'hacl-test': [5305], 'k3software-cli': [26263], 'lm-webwatcher': [8208], 'intuitive-edge': [1355], 'slinkysearch': [1225], 'winfs': [5009], 'jdatastore': [2508], 'vpvd': [1518], 'j-lan-p': [2808], 'webdata': [3748], 'immedianet-bcn': [3657], 'trip': [6069], 'optilogic': [2435], 'netmo-default': [6841], 'tigv2': [4124], 'hlibmgr': [3634], 'ethernet-ip-2': [44818], 'rtcm-sc104': [2101], 'ncp': [524], 'cinegrfx-elmd': [2891], 'ipp': [631], 'menandmice-dns': [1337], 'olhost': [2661], 'accuracer': [12007], 'upstriggervsw': [3786], 'osmosis-aeea': [3034], 'relief': [1353], 'essp': [2969], 'wv-csp-sms-cir': [3716], 'xmpcr-interface': [3877], 'freezexservice': [7726], 'cableport-ax': [282], 'blackboard': [2032], 'qsm-proxy': [1164], 'dbdb': [6104], 'ipfix': [4739], 'nati-svrloc': [3580], 'timbuktu-srv1': [1417], 'tpdu': [1430], 'edm-mgr-sync': [3464], 'opnet-smp': [3433], 'gppitnp': [103], 'rfx-lm': [1497], 'tftp-mcast': [1758], 'ccu-comm-1': [4053], 'ccu-comm-3': [4055], 'ecmport': [3524], 'privatechat': [1735], 'swxadmin': [5043], 'pmdmgr': [7426], 'tambora': [9020], 'citriximaclient': [2598], 'surf': [1010], 'bzr': [4155], 'cspuni': [2806], 'ac-cluster': [18463], 'nitrogen': [7725], 'amicon-fpsu-ra': [30003], 'tdmoip': [2142], 'netops-broker': [5465], 'lonewolf-lm': [6146], 'optohost004': [22004, 22005], 'iso-tsap': [102], 'fg-fps': [3293], 'sas-remote-hlp': [3755], 'itach': [8184], 'smc-admin': [6787], 'axis-wimp-port': [10260], 'sf-lm': [4546], 'pipes': [1465], 'opennl-voice': [1259], 'jtag-server': [1309], 'fxaengine-net': [3402], 'iafdbase': [480], 'p2pcommunity': [3955], 'cdc': [223], 'array-manager': [3726], 'cdn': [2412], 'mpm-flags': [44], 'unieng': [5730], 'xns-courier': [165], 'beeyond': [2414], 'safetynetp': [40000], 'fuscript': [1144], 'cds': [4115], 'mpnjsomb': [2681], '802-11-iapp': [3517], 'qip-audup': [2765], 'find': [24922], 'fpitp': [1045], 'rs-rmi': [3736], 'rmonitor': [560], 'nhci': [3842], 'iclcnet-svinfo': [887], 'cr-websystems': [2314], 'netrek': [2592], 'gtegsc-lm': [1452], 'condor': [9618], 'talarian-mcast5': [4019], 'tr-rsrb-p3': [1989], 'vsnm-agent': [3375], 'opsec-omi': [18185], 'nilinkanalyst': [25902], 'mxxrlogin': [1035], 'minilock': [3798], 'pafec-lm': [7511], 'pxc-spvr': [4006], 'imtc-mcs': [1503], 'gbs-stp': [3484], 'bdp': [581], 'hiq': [1410], 'eapsp': [2291], 'kastenchasepad': [2918], 'deskview': [3298], 'houdini-lm': [1715], 'bmc-ea': [3683], 'afs3-fileserver': [7000], 'rsmtp': [2390], 'mapper-ws_ethd': [3986], 'gds_db': [3050], 'fjippol-port1': [2750], 'pserver': [3662], 'fjippol-port2': [2751], 'crs': [507], 'media-agent': [2789], 'bytex': [1375], 'asctrl-agent': [5155], 'cqg-netlan-1': [2824], 'sde-discovery': [5152], 'eyetv': [2170], 'rfb': [5900], 'portgate-auth': [3710], 'apcupsd': [3551], 'swa-4': [9026], 'mysql-proxy': [6446], 'netbios-ns': [137], 'continuus': [5412], 'www-dev': [2784], 'lnvmaps': [2284], 'mgcp-callagent': [2727], 'hp-webadmin': [1188], 'remoteware-cl': [3000], 'set': [257], 'galaxy7-data': [38201], 'backroomnet': [3387], 'lansurveyor': [4347], 'creativeserver': [453, 3364], 'ccmad': [3114], 'res-sap': [3163], 'gtp-user': [2152], 'spramsca': [5769], 'http-mgmt': [280], 'scte104': [5167], 'paradym-31port': [1864], 'xmsg': [1716], 'spock': [2507], 'sype-transport': [9911], 'proxima-lm': [1445], 'dwmsgserver': [3228], 'sun-dr': [665], 'bmc-perf-agent': [6767], 'dbabble': [8132], 'oce-snmp-trap': [2697], 'imsp': [406], 'netspeak-cs': [21847], 'sabp-signal': [3452], 'serverview-asn': [3170], 'eenet': [5234], 'ups': [401], 'csvr-sslproxy': [3191], 'cmc-port': [3576], 'novar-alarm': [23401], 'password-chg': [586], 'rsvp-encap-1': [1698], 'rsvp-encap-2': [1699], 'ris-cm': [748], 'remotefs': [556], 'nimreg': [1059], 'netmap_lm': [1493], 't128-gateway': [1627], 'apm-link': [32483], 'ipdr-sp': [4737], 'vrpn': [3883], 'urld-port': [3534], 'global-cd-port': [3229], 'ncpm-ft': [1744], 'bctp': [8999], 'objective-dbc': [1388], 'talon-webserver': [7015], 'initlsmsad': [2793], 'hpvmmagent': [1125], 'marcam-lm': [1444], 'escale (newton dock)': [3679], 'wip-port': [3414], 'dts': [2594], 'symantec-sim': [3547], 'vytalvaultpipe': [2548], 'rblcheckd': [3768], 'caerpc': [42510], 'ampr-inter': [1536], 'prelude': [4690], 'nirp': [4043], 'rsvd': [168], 'rtsserv': [2500], 'dtp': [3663], 'pdefmns': [16311], 'ppsuitemsg': [5863], 'cspmlockmgr': [1272], 'responselogic': [2886], 'dwnmshttp': [3227], 'actnet': [5411], 'pds': [9595], 'gbs-smp': [3762], 'pdp': [1675], 'watershed-lm': [6143], 'connection': [2607], 'badm-priv': [6505], 'softdataphone': [1621], 'nexus-portal': [4021], 'ms-rome': [569], 'pdb': [3033], 'esri-sde': [5151], 'pspserver': [2353], 'tgp': [1223], 'rsap': [1647], 'enc-eps': [3567], 'unisys-eportal': [37654], 'ferrari-foam': [3216], 'jwclient': [1938], 'adtech-test': [3357], 'community': [2459], 'pda-data': [3253], 'mphlpdmc': [9344], 'murx': [2743], 'pmdfmgt': [7633], 'ethoscan': [6935], 'joajewelsuite': [6583], 'ccs-software': [2734], 'hpppssvr': [2448], 'pammrpc': [1633], 'acter': [4671], 'irtrans': [21000], 'agentx': [705], 'arcpd': [3513], 'serverstart': [9213], 'apc-necmp': [18888], 'microtalon-com': [7014], 'hpoms-ci-lstn': [5403], 'semantix': [361], 'bnetgame': [1119], 'ms-sql-s': [1433], 'laplink': [1547], 'strexec-s': [5027], 'mikey': [2269], 'wsman': [5985], 'feitianrockey': [3152], 'twamp-control': [862], 'ms-sql-m': [1434], 'orbiter': [2398], 'dfoxserver': [2960], 'pk': [5272], 'ph': [481], 'isi-gl': [55], 'dxadmind': [1958], 'pammratc': [1632], 'kmscontrol': [1773], 'onbase-dds': [2185], 'websphere-snmp': [3427], 'sdnskmp': [558], 'rcts': [2258], 'tl1-ssh': [6252], 'osm-appsrvr': [9990], 'kerberos': [88], '3m-image-lm': [1550], 'wmc-log-svc': [1338], 'nhserver': [2672], 'dvbservdsc': [3937], 'lm-mon': [31620], 'syam-smc': [3895], 'partimage': [4025], 'ida-discover1': [5741], 'jini-discovery': [4160], 'sun-sr-jms': [6484], 'imap': [143], 'dtp-dia': [3489], 'netmon': [2606], 'isoft-p2p': [3501], 'blockade-bpsp': [2574], 'rds': [1540], 'dhcpv6-server': [547], 'can-ferret-ssl': [3661], 'sixnetudr': [1658], 'robix': [9599], 'ept-machine': [3628], 'ipass': [2549], 'amx-webadmin': [2929], 'xadmin': [9105], 'gxs-data-port': [2073], 'p-net-local': [34378], 'sec-t4net-clt': [9401], 'zieto-sock': [4072], 'rexecj': [8230], 'easy-soft-mux': [2168], 'socorfs': [3379], 'wininstall-ipc': [3674], 'clearcase': [371], 'xkotodrcp': [5344], 'bflckmgr': [3966], 'eportcommdata': [4669], 'kofax-svr': [2424], 'epncdp2': [3259], 'dsm-scm-target': [9987], 'serverview-gf': [3171], 'tripwire': [1169], 'xfr': [682], 'quosa': [4841], 'mtport-regist': [2791], 'arepa-cas': [3030], 'versa-tek': [2610], 'ris': [180], 'sapv1': [9875], 'jwalkserver': [1289], 'cichild-lm': [1523], 'neon24x7': [3213], 'sun-as-iiops-ca': [3808], 'socalia': [5100], 'abbaccuray': [1546], 'secure-mqtt': [8883], 'jps': [2205], 'neveroffline': [2614], 'h323gatedisc': [1718], 'td-replica': [268], 'optika-emedia': [1829], 'arcisdms': [262], 'openvms-sysipc': [557], 'visionpyramid': [1247], 'ecsqdmn': [1882], 'scp-config': [10001], 'gacp': [190], 'bim-pem': [3783], 'onscreen': [5080], 'facsys-router': [2515], 'cumulus': [9287], 'galaxy-network': [5235], 'efi-mg': [2224], 'italk': [12345], 'xdsxdm': [6558], 'mmcals': [2271], 'ptk-alink': [3089], 'zen-pawn': [7628], 'vnetd': [13724], 'bgs-nsi': [482], 'cadkey-tablet': [1400], 'snapenetio': [22000], 'cesdcdtrn': [2922], 'dyna-lm': [3395], 'lbc-watchdog': [2816], 'infoman': [1451], 'qadmifoper': [2461], 'espeech-rtp': [8417], 'foliocorp': [2242], 'haipe-discover': [3623], 'mynahautostart': [2388], 'alpha-sms': [1849], 'clearvisn': [2052], 'stonefalls': [2986], 'quasar-server': [3599], 'ansanotify': [116], 'webobjects': [1085], 'uadtc': [2767], 'ncr_ccl': [2528], 'eisport': [3525], 'iwec': [4801], 'pssc': [645], 'vpvc': [1519], 'bspne-pcc': [1252], 'xmlipcregsvc': [9092], 'netplay-port2': [3641], 'exapt-lmgr': [3759], 'bioserver': [6946], 'cybercash': [551], 'mpshrsv': [1261], 'pxc-sapxom': [2680], 'homesteadglory': [2597], 'gsi': [1850], 'nuts-dem': [4132], 'remote-as': [1053], 'ciscocsdb': [43441], 'slc-systemlog': [2826], 'xecp-node': [3940], 'srssend': [362], 'netmount': [2061], 'alta-ana-lm': [1346], 'turbonote-2': [34249], 'mevent': [7900], 'aries-kfinder': [7570], 'smart-lm': [1608], 'redstorm_join': [2346], 'fln-spx': [221], 'varadero-1': [4838], 'ldp': [646], 'lbc-measure': [2815], 'cisco-wafs': [4050], 'wap-push': [2948], 'bridgecontrol': [1073], 'ewnn': [2674], 'gds-adppiw-db': [4550], 'blueberry-lm': [1432], 'snare': [509], 'cdbroker': [3376], 'alpes': [463], 'netcelera': [3701], 'bacula-sd': [9103], 'optima-vnet': [1051], 'kerberos-adm': [749], 'lmdp': [2623], 'emfis-data': [140], 'msims': [1582], 'plysrv-http': [6770], 'iss-mgmt-ssl': [3995], 'quailnet': [5464], 'nmap': [689], 'cawas': [12168], 'watcomdebug': [3563], 'ibm-cics': [1435], 'opequus-server': [2400], 'snap': [4752], 'csms2': [3400], 'tell': [754], 'roboer': [2919], 'acnet': [6801], 'bvcontrol': [1236], 'amiganetfs': [2100], 'soundsvirtual': [17185], 'tmophl7mts': [20046], 'omginitialrefs': [900], 'unisql': [1978], 'radsec': [2083], 'mtp': [1911], 'pxc-splr': [4007], 'wsdapi': [5357], 'qsoft': [3059], 'ftp-data': [20], 'tsa': [6689], 'blackjack': [1025], 'scservp': [3637], 'udpradio': [1833], 'sdserver': [2309], 'swx-gate': [4538], 'bip': [4376], 'iso-ip': [147], 'newwavesearch': [2058], 'scte30': [5168], 'commtact-https': [20003], 'documentum': [10002], 'sharp-server': [3617], 'dpi-proxy': [1795], 'afs3-volser': [7005], 'keysrvr': [19283], 'signal': [2974], 'airshot': [3975], 'npmp-gui': [611], 'infolibria': [2319], 'childkey-ctrl': [1892], 'privoxy': [8118], 'index-pc-wb': [2127], 'poweralert-nsa': [4150], 'sccip-media': [3499], 'at-zis': [206], 'esmmanager': [5600], 'smux': [199], 'listcrt-port': [3913], 'mctp': [1100], 'tclprodebugger': [2576], 'oma-rlp': [7273], 'abcvoice-port': [3781], 'mngsuite': [9535], 'oceansoft-lm': [1466], 'ttc-etap-ds': [2978], 'prm-sm-np': [1402], 'ecomm': [3477], 'hpstgmgr': [2600], 'mib-streaming': [2292], 'vettcp': [78], 'hassle': [375], 'apc-6548': [6548], 'apc-6549': [6549], 'redstorm_diag': [2349], 'sun-as-jpda': [9191], 'apc-6547': [6547], 'ampr-info': [1535], 'b2-runtime': [2203], 'vacdsm-sws': [670], 'balour': [4324], 'mkm-discovery': [3837], 'lnvpoller': [2280], 'quest-vista': [7980], 'ssp': [3249], 'boks': [6500], 'mupdate': [3905], 'dzdaemon': [3866], 'directv-tick': [3336], 'efidiningport': [2553], 'futrix': [2358], 'hde-lcesrvr-2': [14937], 'hde-lcesrvr-1': [14936], 'metatude-mds': [6382], 'e-design-web': [6703], 'dsx-agent': [3685], 'palace-3': [9994], 'ftps-data': [989], 'pegboard': [1357], 'svnet': [3413], 'rfmp': [2249], 'ssql': [3352], 'bb': [1984], 'pctrader': [3048], 'westell-stats': [1875], 'cylink-c': [5420], 'mylxamport': [2981], 'mmcal': [2272], 'i-net-2000-npr': [5069], 'photuris': [468], 'bdir_priv': [6507], 'winpcs': [5166], 'serverviewdbms': [9212], 'perimlan': [4075], 'fjippol-swrly': [2747], 'irdmi': [8000], 'es-elmd': [1822], 'vtsas': [5070], 'gadgetgate2way': [2678], 'tqdata': [2700], 'solid-e-engine': [1964], 'dsom-server': [3053], 'corelccam': [4300], 'snac': [3536], 'rap-ip': [3813], 'wxbrief': [4368], 'vstat': [7779], 'idp': [4067], 'scenccs': [7129], 'bgp': [179], 'directv-web': [3334], 'appserv-http': [4848], 'ans-console': [3440], 'ng-umds': [1690], 'cadis-1': [1441], 'cadis-2': [1442], 'vnas': [577], 'hpvmmdata': [1126], 'primaserver': [6105], 'tunnel': [604], 'rdc-wh-eos': [3142], 'o2server-port': [1894], 'gmrupdateserv': [1070], 'sgi-eventmond': [5553], 'ecovisiong6-1': [2896], 'openmailpxy': [5768], 'empire-empuma': [1691], 'daishi': [2870], 'plethora': [3480], 'bv-agent': [3993], 'turbonote-1': [39681], 'iqrm': [10117], 'theta-lm': [2296], 'digiman': [2362], 'uorb': [3313], 'badm_priv': [6505], 'fazzt-admin': [4039], 'vergencecm': [2771], 'rsvp_tunnel': [363], 'nsp': [5012], 'netviewdm2': [730], 'miva-mqs': [1277], 'nst': [4687], 'prismiq-plugin': [3650], 'mdns': [5353], 'ccu-comm-2': [4054], 'net-device': [4350], 'epmap': [135], '3comnetman': [1181], 'ncpm-hip': [1683], 'beorl': [5633], 'gemini-lm': [1590], 'empowerid': [7080], 'biap-mp': [1962], 'smartpackets': [3218], 'dns-llq': [5352], 'startron': [1057], 'streettalk': [566], 'sec-t4net-srv': [9400], 'bmc-data-coll': [3695], 'netviewdm1': [729], 'ehome-ms': [2228], 'zabbix-trapper': [10051], 'sdt': [5568], 'audit-transfer': [1146], 'statsrv': [133], 'webmail-2': [3511], 'client-wakeup': [9694], 'edb-server1': [1635], 'edb-server2': [3711], 'capioverlan': [1147], 'groupwise': [1677], 'mpl-gprs-port': [3924], '3com-nsd': [1742], 'cspclmulti': [2890], 'aipn-reg': [4113], 'smart-diagnose': [2721], 'directplay8': [6073], 'macromedia-fcs': [1935], 'cycleserv2': [772], 'canon-bjnp2': [8612], 'imagepump': [27345], 'magenta-logic': [313], 'raventdm': [2714], 'dl-agent': [3876], 'auris': [2772], 'hpvirtctrl': [5224], 'ema-sent-lm': [2526], 'universe_suite': [4184], 'nuts_dem': [4132], 'munin': [4949], 'psprserver': [2354], 'davsrcs': [9802], 'icg-bridge': [2063], 'vsinet': [996], 'cis': [22305], 'tungsten-http': [9762], 'sna-cs': [1553], 'daqstream': [7411], 'iec-104': [2404], 'naap': [1340], 'groove': [2492], 'workflow': [3466], 'elektron-admin': [5398], 'pirp': [553], 'orbix-locator': [3075], 'simp-all': [1959], 'linktest-s': [3747], 'rimf-ps': [2209], 'cpdlc': [5911], 'filecast': [3401], 'datasurfsrvsec': [462], 'fj-hdnet': [1717], 'ivocalize': [5049], 'influence': [3345], 'cplscrambler-lg': [1086], 'elfiq-repl': [1148], 'trap-port-mom': [3858], 'opendeploy': [20014], 'ovsam-mgmt': [3869], 'objcall': [94], 'dlsrap': [1973], 'sunrpc': [111], 'k-block': [287], 'timestenbroker': [3754], 'simbaservices': [1599], 'senomix06': [8057], 'iclpv-sc': [1390], 'nta-ds': [7544], 'nim-vdrshell': [6420], 'fyre-messanger': [2731], 'amqp': [5672], 'qsnet-nucl': [4358], 'ndl-tcp-ois-gw': [2738], 'ff-sm': [1091], 'cecsvc': [2571], 'itm-lm': [2828], 'ttc-etap-ns': [2977], 'tnos-dp': [7902], 'enpp': [2968], 'ppcontrol': [2505], 'spectardata': [3834], 'nas': [991], 'passgo': [511], 'bmap': [3421], 'ingres-net': [134], 'optohost003': [22003], 'jt400': [3470], 'mc3ss': [3521], 'enpc': [3289], 'optohost002': [22002], 'ehs-ssl': [4536], 'ita-agent': [5051], 'olsv': [1160], 'tsrmagt': [2077], 'gf': [3530], 'm2mservices': [8383], 'mppolicy-v5': [5968], 'bullant-srap': [2964], 'kiosk': [1061], 'hivep': [12172], 'bzflag': [5154], 'rsync': [873], 'scinet': [7708], 'realsecure': [2998], 'genie-lm': [1453], 'snmp-tcp-port': [1993], 'vrts-tdd': [14149], 'mit-dov': [91], 'ehtp': [1295], 'diagnose-proc': [6072], 'index-net': [2970], 'wsmans': [5986], 'synchronite': [4106], 'svn': [3690], 'mapper-nodemgr': [3984], 'netml': [2288], 'emfis-cntl': [141], 'ontobroker': [2267], 'sftu': [3326], 'srcp': [4303], 'ggf-ncp': [678], 'timbuktu-srv2': [1418], 'timbuktu-srv3': [1419], 'ewctsp': [6066], 'ctxlic': [7279], 'roverlog': [3677], 'ste-smsc': [1836], 'hexarc': [7397], 'uis': [390], 'hello': [1789], 'gamelobby': [2914], 'apc-5456': [5456], 'apc-5455': [5455], 'apc-5454': [5454], 'simbaexpress': [1583], 'dlswpn': [2067], 'afs3-rmtsys': [7009], 'ipfixs': [4740], 'rcc-host': [2332], 'crmsbits': [2422], 'ndtp': [2882], 'bveapi': [10880], 'unet': [1189], 'newlixconfig': [2076], 'ilss': [4802], 'ddt': [1052], 'ethercat': [34980], 'peerbook-port': [3135], 'vantronix-mgmt': [8034], 'colubris': [3490], 'spectraport': [3851], 'afrog': [1042], 'aria': [2624], 'netrjs-3': [73], 'neod1': [1047], 'ibm-db2': [523], 'ospf-lite': [8899], 'isakmp': [500], 'x9-icue': [1145], 'xpilot': [15345], 'blaze': [1150], 'nimcontroller': [48000], 'lansource': [1485], 'directvdata': [3287], '4-tieropmgw': [2933], 'stone-design-1': [1492], 'pdap': [344], 'hacl-gs': [5301], 'netmpi': [3827], 'phrelay': [4868], 'igi-lm': [1404], 'veronica': [2770], 'l3t-at-an': [4591], 'epl-slp': [3819], 'mdtp': [3232], 'orion-rmi-reg': [2413], 'tmi': [8300], 'ifsp': [4744], 'nlg-data': [5299], 'watchdoc-pod': [5743], 'compaq-scp': [2766], 'cgn-config': [2183], 'vmsvc': [7024], 'evm': [1139], 'finisar': [4682], 'bxp': [4027], 'rrisat': [1697], 'popup-reminders': [7787], 'netcp': [395], 'opsession-srvr': [3304], 'netagent': [5771], 'cas': [2418], 'fpo-fns': [1066], 'can-nds': [1918], 'namemunge': [3950], 'broker_service': [3014], 'sunlps-http': [3816], 'p2pq': [1981], 'svs-omagent': [1625], 'trp': [2156], 'xandros-cms': [4389], 'stat-cc': [4158], 'efi-lm': [3392], 'fmpro-v6': [5013], 'itose': [4348], 'd2k-datamover1': [2297], 'icl-twobase8': [25007], 'd2k-datamover2': [2298], 'nsdeepfreezectl': [7724], 'l2f': [1701], 'icl-twobase2': [25001], 'icl-twobase3': [25002], 'icl-twobase1': [25000], 'acis': [9953], 'icl-twobase7': [25006], 'icl-twobase4': [25003], 'icl-twobase5': [25004], 'bears-02': [3146], 'netuitive': [1286], 'scrabble': [2026], 'bears-01': [2852], 'canon-mfnp': [8610], 'rdlap': [2321], 'ccss-qmm': [4969], 'cbserver': [3388], 'gprs-cube': [3751], 'xprint-server': [8100], 'cfs': [7546], 'rrp': [648], 'foresyte-clear': [5407], 'atmtcp': [2812], 'ctt-broker': [1932], 'cl-db-attach': [4135], 'unisql-java': [1979], 'jmact3': [6961], 'mnp-exchange': [2197], 'jmact5': [2957], 'pando-pub': [7680], 'g5m': [2732], 'hypercube-lm': [1577], 'ndsauth': [353], 'oma-rlp-s': [7274], 'agcat': [3915], 'caicci': [1721], 'owserver': [4304], 'vmsvc-2': [7025], 'systemics-sox': [5406], 'jaugsremotec-2': [3473], 'nsstp': [1036], 'sqlserv': [118], 'amt-blc-port': [2848], 'oem-agent': [3872], 'hkp': [11371], 'cal': [588], 'swiftnet': [1751], 'qb-db-server': [10160], 'bmcpatrolagent': [3181], 'powerburst': [485], 'fdt-rcatp': [4320], 'webster': [765], 'kv-server': [3360], 'dic-aida': [1941], 'psbserver': [2350], 'dyniplookup': [3295], 'jetform': [1706], 'gandalf-lm': [1421], 'wsm-server-ssl': [5007], 'jetformpreview': [2097], 'ctp': [3772], 'synapse': [2880], 'ds-user': [4403], 'metasage': [1207], 'udt_os': [1382, 3900], 'aspen-services': [1749], 'aeroflight-ads': [1218], 'stryker-com': [3854], 'ah-esp-encap': [2070], 'ibm-app': [385], 'syam-agent': [3894], 'ctf': [84], 'apex-mesh': [912], 'rda': [630], 'iclcnet_svinfo': [887], 'gv-pf': [18262], 'tomato-springs': [3040], 'openmailns': [5766], 'lockstep': [2125], 'wherehoo': [5859], 'dsp3270': [246], 'appleugcontrol': [2336], 'firefox': [1689], 'server-find': [8351], 'ip-qsig': [4029], 'can-dch': [1919], 'wap-vcal-s': [9207], 'pss': [7880], 'msgsrvr': [8787], 'unglue': [2655], 'iris-xpcs': [714], 'netx-server': [2585], 'fjmpcm': [2975], 'sds': [5059], 'delos-dms': [3714], 'jvserver': [1939], 'serialgateway': [1243], 'filenet-pa': [32772], 'mindprint': [8033], 'boxp': [9380], 'gmmp': [4183], 'ssc-agent': [2967], 'apollo-relay': [10252], 'us-gv': [1370], 'q55-pcc': [1253], 'corel_vncadmin': [2654], 'brvread': [1054], 'cyaserv': [2584], 'jaxer-web': [4327], 'qnts-orb': [1262], 'deos': [76], 'bintec-tapi': [2663], 'msr-plugin-port': [3931], 'wwiotalk': [5413], 'sti-envision': [1312], '3com-amp3': [629], 'trap-port': [3857], 'openport': [260], 'radius-dynauth': [3799], 'vytalvaultbrtp': [2546], 'pop3s': [995], 'syscomlan': [1065], 'ninaf': [5627], 'connect-client': [3441], 'winddx': [1727], 'dtspcd': [6112], 'mobileip-agent': [434], 'wg-netforce': [3359], 'dkmessenger': [1177], 'armcenterhttp': [9294], 'ldap': [389], '3par-rcopy': [5785], 'zigbee-ip': [17755], 'unicall': [4343], 'sql*net': [66], 'scenidm': [7128], 'sun-sr-iiop-aut': [6487], 'emprise-lls': [3585], 'progistics': [3973], 'jomamqmonitor': [4114], 'zfirm-shiprush3': [3841], 'ldap-admin': [3407], 'efcp': [3671], 'msync': [2072], 'smntubootstrap': [2613], 'ies-lm': [1443], 'novar-dbase': [23400], 'opsec-uaa': [19191], 'openwebnet': [20005], 'icl-twobase10': [25009], 'conclave-cpp': [2491], 'univ-appserver': [1233], 'ndm-requester': [1363], 'ohsc': [18186], 'ncdmirroring': [2706], 'iafserver': [479], 'rap-service': [1530], 'iiop': [535], 'llrp': [5084], 'apertus-ldp': [539], 'auriga-router': [5680], 'capfast-lmd': [1756], 'patrol': [8160], 'xnm-ssl': [3220], 'passwrd-policy': [1333], 'elvin_client': [2917], 'saphostctrls': [1129], 'lpdg': [10805], 'telefinder': [1474], 'ocbinder': [183], 'sqlsrv': [156], 'globecast-id': [6109], 'vchat': [1168], 'rapi': [2176], 'sms-rcinfo': [2701], 'winport': [3926], 'borland-dsj': [707], 'fronet': [4130], 'ddgn': [4167], 'bones': [4914], 'redwood-chat': [3032], 'agri-gateway': [3026], 'spss': [5443], 'interhdl_elmd': [1454], 'slslavemon': [3102], 'tritium-can': [4876], 'ds-clnt': [4402], 'encrypted-llrp': [5085], 'inovaport2': [23001], 'inovaport3': [23002], 'inovaport4': [23003], 'ars-master': [3176], 'inovaport6': [23005], 'tns-server': [3308], 'rtsp': [554], 'orbix-cfg-ssl': [3078], 'midnight-tech': [3008], 'x25-svc-port': [1998], 'sgi-arrayd': [5434], 'remote-winsock': [1745], 'raadmin': [5676], 'dwf': [1450], 'mumps': [188], 'snpp': [444], 'pro-ed': [8032], 'sossecollector': [3166], 'pclemultimedia': [2558], 'xns-auth': [56], 'apc-3506': [3506], 'afs': [1483], 'profile': [136], 'dwr': [644], 'tvdumtray-port': [3492], 'plato': [3285], 'blocks': [10288], 'idfp': [549], 'inovaport1': [23000], 'intersan': [1331], 'cogsys-lm': [3377], 'rt-event-s': [3707], 'cimtrak': [3749], 'gds-db': [3050], 'k3software-svr': [26262], 'sentinel-ent': [3712], 'allpeers': [36001], 'raqmon-pdu': [7744], 'sip': [5060], 'asnaacceler8db': [5042], 'anet-b': [3338], '914c/g': [211], 'anet-m': [3340], 'anet-l': [3339], 'msdp': [639], 'nati-dstp': [3015], 'oma-ilp-s': [7277], 'anet-h': [3341], 'issd': [1600], 'vsaiport': [3317], 'senomix01': [8052], 'msmq': [1801], 'pop2': [109], 'light': [4670], 'ibm-dt-2': [1792], 'dyn-site': [3932], 'rapido-ip': [2457], 'lm-instmgr': [8205], 'suncacao-csa': [11164], 'entrust-aaas': [680], 's-net': [166], 'xmlink-connect': [3953], 'bts-appserver': [1961], 'netdb-export': [1329], 'zigbee-ips': [17756], 'isis-ambc': [1643], 'hnmp': [6790], 'talnet': [1838], 'bootserver': [2016], 'extensis': [2666], 'houston': [4041], 'audio-activmail': [1397], 'aplx': [1134], 'ulistproc': [372], 'giop': [2481], 'cmadmin': [2617], 'hp-device-disc': [3329], 'visd': [9284], 'altovacentral': [4689], 'fcp-addr-srvr1': [5500], 'citrixadmin': [2513], 'meter': [570, 571], 'citysearch': [3974], 'lds-distrib': [6543], 'ns-cfg-server': [3266], 'netopia-vo2': [1840], 'quake': [26000], 'simplement-tie': [2756], 'netopia-vo5': [1843], 'stgxfws': [1226], 'mentaclient': [2117], 'syam-webserver': [3930], 'raw-serial': [2167], 'ovobs': [30999], 'prospero-np': [1525], 'pichat': [9009], 'os-licman': [1384], 'xfer': [82], 'geolocate': [3108], 'asc-slmd': [4448], 'msfw-control': [3847], 'acp-port': [2071], 'apple-sasl': [3659], 'discp-client': [2601], 'tsb': [2741], 'bex-webadmin': [6122], 'decap': [403], 'iiw-port': [3186], 'stss': [3090], 'suncacao-rmi': [11163], 'apri-lm': [1447], 'nntps': [563], 'ha-cluster': [694], 'openvpn': [1194], 'nokia-ann-ch1': [3405], 'sns-quote': [1967], 'udrawgraph': [2542], 'nokia-ann-ch2': [3406], 'iwg1': [7071], 'nim-wan': [6421], 'bmc-grx': [6300], 'bhoetty': [351], 'qencp': [2120], 'esl-lm': [1455], 'jboss-iiop': [3528], 'mediaspace': [3594], 'tivoli-npm': [1965], 'mysql-cluster': [1186], 'paragent': [9022], 'fmpro-fdal': [2399], 'sip-tls': [5061], 'bv-is': [3990], 'winshadow-hd': [3861], 'auth': [113], 'qip-qdhcp': [2490], 'cti-redwood': [2563], 'emc-xsw-dcache': [11723], 'dl_agent': [3876], 'q3ade': [7794], 'tcim-control': [2729], 'odbcpathway': [9628], 'ucontrol': [13894], 'msfw-array': [2174], 'bmc-perf-mgrd': [6768], 'netarx': [1040], 'tick-port': [3200], 'appiq-mgmt': [4674], 'commlinx-avl': [1190], 'edix': [3123], 'avsecuremgmt': [3211], 'nfa': [1155], 'sun-sr-jmx': [6488], 'warehouse-sss': [12321], 'faxcomservice': [6417], 'wcpp': [4185], 'apple-vpns-rp': [4112], 'apollo-data': [8121], 'bts-x73': [3681], 'nfs': [2049], 'trap': [4020], 'trendchip-dcp': [3608], 'mgcp-gateway': [2427], 'fastlynx': [2689], 'nv-video': [4444], 'caaclang2': [5249], 'spike': [4683], 'board-voip': [9750], 'sco-inetmgr': [615], 'swdtp-sv': [10009], 'ovalarmsrv': [2953], 'dixie': [96], 'dec-notes': [3333], 'patrol-ism': [6161], 'autopac': [4685], 'mediacntrlnfsd': [2363], 'globe': [2002], 'msl-lmd': [1464], 'http-rpc-epmap': [593], 'an-pcp': [3846], 'faximum': [7437], 'cichlid': [1377], 'sge-qmaster': [6444], 'datacaptor': [1857], 'joltid': [3531], 'lontalk-urgnt': [1629], 'firepower': [2615], 'opennl': [1258], 'cedros-fds': [4140], 'hmmp-ind': [612], 'ismaeasdaqlive': [1949], 'vieo-fe': [3245], 'mpm-snd': [46], 'msi-selectplay': [2871], 'taskmaster2000': [2402, 2403], 'swa-1': [9023], 's-openmail': [5767], 'tec5-sdctp': [9668], 'swr-port': [3491], 'sncp': [7560], 'openflow': [6653], 'mmacomm': [4667], 'wbem-https': [5989], 'ccmrmi': [3154], 'rfa': [4672], 'watchdoc': [5744], 'metaedit-ws': [6390], 'swa-2': [9024], 'wkars': [2720], 'iris-xpc': [713], 'bandwiz-system': [1929], 'entextnetwk': [12001], 'cautcpd': [3061], 'stun': [3478], 'ssad': [4750], 'drmsfsd': [4098], 'bmc-patroldb': [1313], 'disclose': [667], 'ssm-els': [2479], 's3db': [2278], 'fhsp': [1807], 'acl-manager': [4013], 'starfish': [3981], 'hagel-dump': [3036], 'ginad': [634], 'netwave-ap-mgmt': [2411], 'synel-data': [3734], 'insis': [9215], 'qo-secure': [7913], 'lotusnote': [1352], 'viziblebrowser': [1868], 'ecp': [3134], 'apollo-gms': [2759], 'callwaveiam': [9283], 'vipera-ssl': [12013], 'paging-port': [3771], 'rfe': [5002], 'cspmulti': [2807], 'vaultbase': [1771], 'aviva-sna': [2238], 'linktest': [3746], 'domaintime': [9909], 'a3-sdunode': [5604], 'jdmn-port': [4030], 'rds-ib': [18634], 'iclpv-dm': [1389], 'funkproxy': [1505], 'silverpeakpeer': [4163], 'uucp-rlogin': [541], 'jprinter': [5309], 'jesmsjc': [27442], 'fcmsys': [2344], 'h2gf-w-2m': [3179], 'registrar': [1712], 'queueadm': [2230], 'essweb-gw': [1772], 'timed': [525], 'pcoip': [4172], 'xqosd': [31416], 'client-ctrl': [3730], 'iclpv-sas': [1391], 'ayiya': [5072], 'smartcard-tls': [4116], 'llmnr': [5355], 'mc-client': [1180], 'cst-port': [3742], 'wago-io-system': [2455], 'admins-lms': [2692], 'elpro-tunnel': [4370], 'netiq-voipa': [10116], 'ocs_cmu': [428], 'echo': [7], 'cadsi-lm': [1387], 'llsurfup-https': [1184], 'pago-services1': [30001], 'localinfosrvr': [1487], 'aal-lm': [1469], 'z-wave': [4123], 'cytel-lm': [3297], 'sweetware-apps': [1221], 'ldaps': [636], 'precise-sft': [2315], 'tragic': [2642], 'shivadiscovery': [1502], 'almobile-system': [9209], 'ciphire-data': [3887], 'gcsp': [3429], 'ni-ftp': [47], 'orbix-config': [3076], 'hp-sessmon': [19412], 'pinghgl': [4306], 'npp': [92, 4045], 'world-lm': [1462], 'ansoft-lm-2': [1084], 'ansoft-lm-1': [1083], 'netview-aix-12': [1672], 'odmr': [366], 'dgpf-exchg': [6785], 'l2tp': [1701], 'pcihreq': [3085], 'siam': [498], 'dnsix': [90], 'synoptics-trap': [412], 'omnilink-port': [3904], 'de-spot': [2753], 'vid': [769], 'dsmcc-config': [13818], 'mdc-portmapper': [685], 'taiclock': [4014], 'navbuddy': [1288], 'sdp-id-port': [3242], 'caiccipc': [1202], 'fg-gip': [3294], 't2-brm': [7933], 'ibm_wrless_lan': [1461], 'cyc': [3645], 'oma-ilp': [7276], 'fjitsuappmgr': [2425], 'mvx-lm': [1510], 'qotd': [17], 'trusted-web': [3011], 'telindus': [1728], 'service-ctrl': [2367], 'intellistor-lm': [1539], 'ipether232port': [3497], 'cuillamartin': [1356], 'webmachine': [1963], 'labrat': [2560], 'tacacs': [49], 'prnrequest': [3910], 'a1-msc': [5602], 'attachmate-uts': [2304], 'nifty-hmi': [4134], 'mzap': [2106], 'a16-an-an': [4598], 'paycash-wbp': [8129], 'odn-castraq': [2498], 'xns-time': [52], 'de-server': [1256], 'symb-sb-port': [3923], 'instl_bootc': [1068], 'lpsrecommender': [2620], 'netserialext4': [16368], 'tidp': [7548], 'tekpls': [1946], 'bnet': [415], 'apple remote desktop (net assistant)': [3283], 'tarantella': [3144], 'hp-dataprotect': [3612], 'swispol': [6966], 'netserialext2': [16361], 'netbios-ssn': [139], 'instl_boots': [1067], 'idac': [3881], 'aeroflight-ret': [1219], 'aironetddp': [2887], 'zarkov': [2989], 'isnetserv': [48128], 'tns-cml': [590], 'powerschool': [5071], 'rhp-iibp': [1912], 'llm-pass': [2813], 'doc-server': [7165], 'ncu-2': [3196], 'lmsocialserver': [1111], 'altalink': [1845], 'glishd': [2833], 'ctiprogramload': [4452], 'gt-proxy': [9889], 'nsrmp': [359], 'connect-server': [3442], 'fxp': [286, 2849], 'sftsrv': [1303], 'ums': [2248], 'nsc-ccs': [2604], 'vtr-emulator': [3122], 'kv-agent': [3361], 'interintelli': [2633], 'caller9': [2906], 'peerwire': [9104], 'lionhead': [2611], 'a13-an': [3125], 'raventbs': [2713], 'cft-7': [1768], 'cft-6': [1767], 'cft-5': [1766], 'centra': [1709], 'cft-3': [1764], 'cft-2': [1763], 'cft-1': [1762], 'cft-0': [1761], 'cdid': [3315], 'sddp': [1163], '3par-mgmt-ssl': [5783], 'mcs-messaging': [3331], 'notify-srvr': [3016], 'pvsw-inet': [2441], 'connected': [16384], 'bmc-perf-sd': [10128], 'smc-jmx': [6786], 'device': [801], 'gnutella-svc': [6346], 'ttntspauto': [3474], 'urbisnet': [2745], 'orasrv': [1525], 'avenyo': [2992], 'imgames': [1077], 'codasrv': [2432], 'simctlp': [2857], 'vvr-control': [4145], 'nimaux': [3902], 'urm': [606], 'indy': [5963], 'bootps': [67], 'repsvc': [6320], 'sagectlpanel': [3698], 'gadgetgate1way': [2677], 'rasadv': [9753], 'windream': [534], 'etc-control': [6107], 'ratio-adp': [1108], 'procos-lm': [3248], 'wibukey': [22347], '3par-evts': [5781], 'lazy-ptop': [7099], 'indi': [7624], 'bootpc': [68], 'xtreamx': [5793], 'tbrpf': [712], 'sgcip': [16950], 'nuauth': [4129], 'dbm': [2345], 'eicon-server': [1438], 'fjippol-polsvr': [2748], 'dlms-cosem': [4059], 'novell-zen': [2544], 'xinuexpansion4': [2024], 'ipcd3': [1209], 'leoip': [1886], 'imagequery': [2239], 'c-h-it-port': [3778], 'rsf-1': [1195], 'vemmi': [575], 'bintec-capi': [2662], 'mice': [5022], 'salient-dtasrv': [5409], 'comscm': [437], 'elm-momentum': [1914], 'interwise': [7778], 'asterix': [8600], 'netxms-agent': [4700], 'rapidbase': [1953], 'ldoms-mgmt': [6482], 'esbroker': [1342], 'tpcsrvr': [2078], 'vspread': [2695], 'di-drm': [2226], 'd2k-tapestry1': [3393], 'wso2esb-console': [9444], 'cgn-stat': [2182], 'unifyadmin': [2696], 'bgmp': [264], 'cl-db-remote': [4137], 'exlm-agent': [3002], 'coord-svr': [2565], 'nssalertmgr': [4453], 'dsetos': [378], 'sophia-lm': [1408], 'mcs-mailsvr': [3332], 'stm-pproc': [3080], 'sscan': [3853], 'prgp': [7747], 'sesi-lm': [1714], 'accel': [4108], 'aibkup': [4071], 'iscsi-target': [3260], 'nuts_bootp': [4133], 'evtp-data': [2835], 'abbs': [4885], 'securitychase': [5399], 'twsdss': [3012], 'fcp-addr-srvr2': [5501], 'ada-cip': [2085], 'can-nds-ssl': [3660], 'vrace': [9300], 'caci-lm': [1554], 'bhevent': [357], 'rt-classmanager': [35004], 'as-servermap': [449], 'omnisky': [2056], 'dn6-nlm-aud': [195], 'cardax': [1072], 'precise-comm': [5630], 'pktcablemmcops': [3918], 'dpm': [5718], 'mpidcmgr': [9343], 'eforward': [2181], 'sms-xfer': [2702], 'xmquery': [2279], 'infotos': [18881], 'xss-srv-port': [3646], 'dnc-port': [3448], 'rscd': [5750], 'at-nbp': [202], 'idotdist': [2590], 'transmit-port': [5282], 'cvsup': [5999], 'truckstar': [4725], 'timbuktu': [407], 'comotionback': [2262], 'venus-se': [2431], 'manyone-xml': [8911], 'ttc': [2483], 'molly': [1374], 'backupedge': [3946], 'dpsi': [315], 'sanity': [643], 'wap-vcard-s': [9206], 'veritas-vis1': [2993], 'mpsserver': [6106], 'ingreslock': [1524], 'concomp1': [1802], 'voispeed-port': [3541], 'expresspay': [2755], 'ansysli': [2325], 'tve-announce': [2670], 'puprouter': [999], 'biolink-auth': [3411], 'pc-telecommute': [2299], 'leecoposserver': [2212], 'dls': [197, 2047], 'tabula': [1437], 'p4p-portal': [6671], 'treehopper': [3959], 'netiq-mc': [2735], 'ibm-diradm-ssl': [3539], 'ns-server': [5415], 'mvs-capacity': [10007], 'ora-lm': [1446], 'ieee-mms-ssl': [695], 'targus-getdata2': [5202], 'rich-cp': [2057], 'jmevt2': [6962], 'apollo-admin': [8122], 'event_listener': [3017], 'filenet-rpc': [32769], 'vrt': [4991], 'tnos-dps': [7903], 'ivecon-port': [3258], 'flamenco-proxy': [3210], 'fjmpjps': [1873], 'novar-global': [23402], 'messageasap': [6070], 'accord-mgc': [1205], 'ias-session': [4594], 'sqlexec-ssl': [9089], 'qbikgdp': [368], 'elvin_server': [2916], 'vhd': [3802], 'indigo-vrmi': [8130], 'wanscaler': [2312], 'visinet-gui': [3601], 'unizensus': [1151], 'ets': [1569], 'etp': [1798], 'mpfwsas': [2952], 'iwlistener': [2866], 'vision-server': [6672], 'avocent-proxy': [1078], 'nnsp': [433], 'dpap': [8770], 'qfp': [5083], 'elvin-server': [2916], 'dec-mbadmin-h': [1656], 'servstat': [633], 'aspeclmd': [1544], 'powerguardian': [1777], 'groove-dpp': [1211], 'dx-instrument': [1325], 'volley': [3625], 'tolfab': [20167], 'smaclmgr': [4660], 'dirgis': [2496], 'd-data': [4301], 'bacula-fd': [9102], 'sslp': [1750], 'lv-frontpanel': [3079], 'opencore': [4089], 'cm': [5910], 'vision_elmd': [6673], 'gw-asv': [4842], 'pcptcpservice': [4182], 'msg-icp': [29], 'autodesk-lm': [1422], 'npmp-trap': [609], 'event-port': [2069], 'saphostctrl': [1128], 'rmiaux': [10990], 'seclayer-tls': [3496], 'ttc-ssl': [2484], 'rpi': [2214], 'xmpv7': [7430], 'i-zipqd': [13160], 'aws-brf': [22800], 'gss-http': [488], 'capmux': [4728], 'boks-servc': [6501], 'tcoflashagent': [1975], 'rdb-dbs-disp': [1571], 'ktelnet': [6623], 'npds-tracker': [3680], 'gammafetchsvr': [1859], 'dhcpv6-client': [546], 'dtn1': [2445], 'rtps-dd-ut': [7401], 'boks-servm': [6502], 'ispipes': [2853], 'ttlpriceproxy': [5463], 'poweronnud': [3168], 'cscp': [40841], 'discovery-port': [1925], 'ebinsite': [2651], 'iop': [2055], 'abr-secure': [1955], 'entrust-ash': [710], 'cadencecontrol': [2318], 'seaview': [3143], 'gte-samp': [2643], 'intel_rci': [24386], 'plbserve-port': [3933], 'citadel': [504], 'ftsrv': [1359], 'silverplatter': [416], 'liebdevmgmt_dm': [3028], 'pcanywherestat': [5632], 'dist-upgrade': [3624], 'at-rtmp': [201], 'zicom': [3774], 'wimaxasncp': [2231], 'swrmi': [1866], 'sai_sentlm': [2640], 'park-agent': [5431], 'apc-3052': [3052], 'c3': [2472], 'mgcs-mfp-port': [6509], 'ott': [2428], 'descent3': [2092], 'epicon': [2912], 'spsc': [478], 'av-emb-config': [2050], 'aocp': [2712], 'mcntp': [5418], 'wnn6': [22273], 'spamtrap': [2568], 'tsilb': [2489], 'targus-getdata': [5200], 'texar': [333], 'vrts-auth-port': [4032], 'uucp-path': [117], 'rsqlserver': [4430], 'silkp1': [2829], '4-tieropmcli': [2934], 'f5-iquery': [4353], 'silkp2': [2830], 'sco-aip': [5307], 'silkp4': [2832], 'ndl-aps': [3096], 'apparenet-ui': [3239], 'cvd': [8400], 'dellpwrappks': [1266], 'com-bardac-dw': [48556], 'cvc': [1495], 'iqnet-port': [3804], 'flexlm': [744], 'elpro_tunnel': [4370], 'polestar': [1060], 'redstorm-find': [2347], 'banyan-net': [2708], 'as-debug': [4026], 'e3consultants': [3157], 'cruise-swroute': [8377], 'sstsys-lm': [1692], 'voxelstorm': [28200], 'xpl': [3865], 'sane-port': [6566], 'snapd': [2599], 'vidigo': [3231], 'turns': [5349], 'netwatcher-mon': [3203], 'htuilsrv': [5023], 'rmonitor_secure': [5145], 'powergemplus': [2899], 'trim-ice': [4323], 'cera-bcm': [1794], 'ife_icorp': [5165], 'incp': [2932], 'jargon': [148], 'call-logging': [2552], 'ncld': [405], 'corba-iiop': [683], 'landmarks': [3969], 'ito-e-gui': [2531], 'manet': [269], 'armi-server': [3174], 'ironmail': [3206], 'unikeypro': [4127], 'opentrac': [3855], 'netbios-dgm': [138], 'dsatp': [2111], 'unite': [3217], 'composit-server': [2417], 'mrssrendezvous': [7392], 'newbay-snc-mc': [16900], 'teleniumdaemon': [2060], 'iatp-highpri': [6998], 'fjcp': [3648], 'lorica-out': [4082], 'pacerforum': [1480], 'ivmanager': [1276], 'http': [80], 'pharos': [4443], 'hp-3000-telnet': [2564], 'scscp': [26133], 'winshadow': [3261], 'sabams': [2760], 'lbc-control': [2780], 'fmtp': [8500], 'astromed-main': [2864], 'sdfunc': [2046], 'uuidgen': [697], 'uucp': [540], 'hhb-gateway': [1136], 'mck-ivpip': [2698], 'eims-admin': [4199], 'pov-ray': [494], 'ndnp': [2883], 'daap': [3689], 'tftp': [69], 'rxmon': [1311], 'dbstar': [1415], 'microsan': [20001], 'boscap': [2990], 'tl1-lv': [3081], 'tmosms1': [5581], 'idmgratm': [32896], 'gcm-app': [14145], 'adobeserver-2': [1103], 'wpgs': [780], 'xap-ha': [3639], 'at-echo': [204], 'personnel': [3109], 'rnrp': [2423], 'talk': [517], 'mailbox-lm': [505], 'nsrp': [7170], 'priority-e-com': [2618], 'telnet': [23], 'directplay': [2234], 'wifree': [11208], 'opsview-envoy': [4125], 'universe-suite': [4184], 'mini-sql': [1114], 'bv-queryengine': [3989], 'na-er-tip': [3725], 'vocaltec-hos': [25793], 'documentum_s': [10003], 'twrpc': [3479], 'csnet-ns': [105], 'soap-http': [7627], 'bpdbm': [13721], 'megaregsvrport': [3572], 'attachmate-g32': [2317], 'femis': [1776], 'pvsw': [2520], 'elatelink': [2124], 'ads': [2550], 'menandmice-mon': [4552], 'prchat-user': [4455], 'lorica-in-sec': [4081], 'vids-avtp': [1853], 'unicontrol': [2437, 2499], 'gwha': [1383], 'nms-dpnss': [2503], 'cs-live': [2129], 'sns-channels': [3380], 'metaconsole': [2850], 'interhdl-elmd': [1454], 'new-rwho': [550], 'qt-serveradmin': [1220], 'linkname': [1903], 'dlsrpn': [2065], 'geneous': [3381], 'vatata': [4188], 'sun-mc-grp': [5306], 'msdts1': [3882], 'aspentec-lm': [6142], 'bmpp': [632], 'med-ci': [24005], 'ps-ams': [3658], 'telaconsole': [5428], 'isoipsigport-1': [1106], 'unify': [181], 'repcmd': [641], 'go-login': [491], 'nvd': [2184, 2329], 'pacom': [3435], 'mobrien-chat': [2031], 'press': [3582], 'indigo-vbcp': [8131], 'netbill-cred': [1614], 'rsh-spx': [222], 'sgi-lk': [11106], 'fujitsu-mmpdc': [1657], 'rwhois': [4321], 'launchbird-lm': [3739], 'ms-v-worlds': [2525], 'servistaitsm': [3636], 'unix-status': [1957], 'candp': [42508], 'tl1-telnet': [3083], 'gamegen1': [1738], 'availant-mgr': [1122], 'netsupport': [5405], 'periscope': [1230], 'global-dtserv': [1774], 'wlanauth': [3810], 'shrinkwrap': [358], 'ibm-wrless-lan': [1461], 'appss-lm': [3879], 'sfs-smp-net': [451], 'kdm': [2115], 'jmact6': [2958], 'netbill-auth': [1615], 'smsqp': [11201], 'lanrevagent': [3970], 'netbill-prod': [1616], 'apollo-cc': [2754], 'facelink': [1915], 'datex-asn': [355], 'trc-netpoll': [2405], 'decauth': [316], 'pn-requester': [2717], 'dnp-sec': [19999], 'ergolight': [2109], 'encrypted_admin': [1138], 'sun-user-https': [7677], 'imdocsvc': [2637], 'i3-sessionmgr': [3952], 'emcads': [3945], 'funk-logger': [1786], 'cart-o-rama': [3292], 'opalis-rdv': [536], 'nei-management': [3886], 'rrilwm': [1695], 'lrs-paging': [3700], 'netbill-trans': [1612], 'srdp': [3942], 'vrtl-vmf-sa': [2074], 'famdc': [10081], 'trap-daemon': [3600], 'novastorbakcup': [308], 'xns-ch': [54], 'qdb2service': [45825], 'quicksuite': [2900], 'ttl-publisher': [5462], 'sdbproxy': [3562], 'delta-mcp': [1324], 'rpc2portmap': [369], 'newgenpay': [3165], 'dashpas-port': [3498], 'qke-llc-v3': [2523], 'sun-sr-http': [6480], 'nimrod-agent': [1617], 'acc-raid': [2800], 'etftp': [1818], 'qftest-lookup': [3543], 'ipdcesgbs': [9214], 'tunstall-pnc': [1846], 'cplscrambler-al': [1088], 'softcm': [6110], 'dca': [1456], 'xinupageserver': [2020], 'netrjs-4': [74], 'elipse-rec': [6515], 'virprot-lm': [7121], 'hri-port': [3439], 'fcip-port': [3225], 'omnivisionesx': [4395], 'dcs': [1367], 'dcp': [93], 'innosys-acl': [1413], 'listcrt-port-2': [3914], 'tacticalauth': [2392], 'br-channel': [5425], 'apc-2260': [2260], 'dcs-config': [3988], 'agps-port': [3425], 'xsip-network': [1354], 'cvmon': [1686], 'maxim-asics': [3276], 'powwow-client': [13223], 'dec-dlm': [625], 'findviatv': [3350], 'exoconfig': [26487], 'kpn-icw': [3699], 'otv': [8472], 'tivoconnect': [2190], 'lstp': [2559], 'dicom-tls': [2762], 'idrs': [2995], 'pcia-rxp-b': [1332], 'topx': [2436], 's8-client-port': [3153], 'vrts-ipcserver': [1317], 'ifor-protocol': [1515], 'nbx-cc': [2093], 'prosharenotify': [5717], 'netrjs-2': [72], 'socks': [1080], 'asoki-sma': [3087], 'autocuesmi': [3103], 'amdsched': [1931], 'cl/1': [172], 'stm_pproc': [3080], 'ea1': [1791], 'mailprox': [3936], 're-mail-ck': [50], 'hp-pdl-datastr': [9100], 'abcsoftware': [3996], 'tsp': [3653], 'apparenet-ts': [3236], 'rets': [6103], 'hpocbus': [2206], 'networklens': [3409], 'ftranhc': [1105], 'smip': [7734], 'rcp': [469], 'ns': [760], 'vad': [14154], 'a1-bs': [5603], 'netview-aix-11': [1671], 'netview-aix-10': [1670], 'opalis-rbt-ipc': [5314], 'jetcmeserver': [1936], 'vrtl-vmf-ds': [1956], 'knet-cmp': [157], 'fksp-audit': [3729], 'prm-sm': [408], 'amt-redir-tcp': [16994], 'cryptoadmin': [624], 'shareapp': [3595], 'vat': [3456], 'tsspmap': [1568], '3d-nfsd': [2323], 'vopied': [13783], 'cequint-cityid': [4074], 'jaugsremotec-1': [3472], 'personal-link': [281], 'submitserver': [2028], 'chimera-hwm': [4009], 'codaauth2': [370], 'onesaf': [3244], 'mil-2045-47001': [1581], 'newoak': [4001], 'umm-port': [3098], 'dbcontrol-agent': [3938], 'fjsvmpor': [2946], 'collaborator': [622], 'maxumsp': [4179], 'ups-engine': [3664], 'dssiapi': [1265], 'emperion': [1282], 'netattachsdmp': [3066], 'gaia': [4340], 'dhct-status': [4675], 'idmaps': [1884], 'nms_topo_serv': [1486], 'arns': [384], 'eq-office-4942': [4942], 'eq-office-4941': [4941], 'eq-office-4940': [4940], 'kingdomsonline': [30260], 'itinternet': [2691], 'krb5gatekeeper': [1318], 'instantia': [1240], 'gxtelmd': [2356], 'srvc_registry': [3018], 'tonidods': [24465], 'sgmp': [153], 'valisys-lm': [1457], 'serverwsd2': [5362], 'sdp-portmapper': [3935], 'indx-dds': [2454], 'btpp2sectrans': [2444], 'fjmpss': [2509], 'wbem-rmi': [5987], 'infoexch': [3667], 'oracle-oms': [1159], 'opcua-tls': [4843], 'finle-lm': [1784], 'dxspider': [8873], 'ecolor-imager': [3263], 'hnm': [6791], 'solid-mux': [1029], 'irisa': [11000], 'triomotion': [3240], 'avauthsrvprtcl': [2068], 'autocueds': [3437], 'pdrncs': [3299], 'pearldoc-xact': [1980], 'isdc': [1636], 'isdd': [8148], 't1distproc': [1274], 'pip': [321, 1321], 'neto-dcs': [3814], 'ip-blf': [2088], 'multip-msg': [3733], 'surebox': [5453], 'sunvts-rmi': [6483], 'talarian-mqs': [2493], 'xmapi': [1933], 'realm-rusd': [688], 'osb-sd': [400], 'a17-an-an': [4599], 'lyskom': [4894], 'tmosms0': [5580], 'csi-sgwp': [348], 'ccmail': [3264], 'amt-cnf-prot': [3054], 'hyper-g': [418], 'apc-9952': [9952], 'cmip-agent': [164], 'apc-9950': [9950], 'apc-9951': [9951], 'splitlock': [3606], 'collaber': [7689], 'subntbcst_tftp': [247], 'fjhpjp': [3067], 'mortgageware': [367], 'ultimad': [1737], 'metasys': [11001], 'netsc-prod': [154], 'vscp': [9598], 'dnox': [4022], 'avanti_cdp': [4065], 'dec-mbadmin': [1655], 'pando-sec': [8276], 'xsmsvc': [6936], 'mfcobol': [86], 'web2host': [1559], 'activesync': [1034], 'ms-smlbiz': [5356], 'mosaixcc': [2561], 'sentinelsrm': [1947], 'cqg-netlan': [2823], 'lotusmtap': [3007], 'gap': [10800], 'ieee-mms': [651], 'vce': [11111], 'evb-elm': [1504], 'chevinservices': [3349], 'manyone-http': [8910], 'msrp': [2855], 'ipcd': [576], 'resource-mgr': [3019], 'emcsymapiport': [2707], 'bmc-onekey': [3561], 'pkt-krb-ipsec': [1293], 'sasg': [3744], 'l2c-data': [4372], 'res': [1942], 'pwdis': [3735], 'hp-status': [5226], 'td-postman': [1049], 'gdoi': [848], 'bcs': [4677]}
-tcp_port_to_services = {32768: ['filenet-tms'], 1: ['tcpmux'], 2: ['compressnet'], 3: ['compressnet'], 32772: ['filenet-pa'], 5: ['rje'], 32774: ['filenet-re'], 7: ['echo'], 32776: ['filenet-peior'], 9: ['discard'], 11: ['systat'], 13: ['daytime'], 17: ['qotd'], 18: ['msp'], 19: ['chargen'], 20: ['ftp-data'], 21: ['ftp'], 22: ['ssh'], 23: ['telnet'], 25: ['smtp'], 27: ['nsw-fe'], 29: ['msg-icp'], 31: ['msg-auth'], 33: ['dsp'], 37: ['time'], 38: ['rap'], 39: ['rlp'], 41: ['graphics'], 42: ['name', 'nameserver'], 43: ['nicname'], 44: ['mpm-flags'], 45: ['mpm'], 46: ['mpm-snd'], 47: ['ni-ftp'], 48: ['auditd'], 49: ['tacacs'], 50: ['re-mail-ck'], 52: ['xns-time'], 53: ['domain'], 54: ['xns-ch'], 55: ['isi-gl'], 56: ['xns-auth'], 58: ['xns-mail'], 61: ['ni-mail'], 62: ['acas'], 63: ['whoispp'], 64: ['covia'], 65: ['tacacs-ds'], 66: ['sql-net'], 67: ['bootps'], 68: ['bootpc'], 69: ['tftp'], 70: ['gopher'], 71: ['netrjs-1'], 72: ['netrjs-2'], 73: ['netrjs-3'], 74: ['netrjs-4'], 76: ['deos'], 78: ['vettcp'], 79: ['finger'], 80: ['http'], 82: ['xfer'], 83: ['mit-ml-dev'], 84: ['ctf'], 85: ['mit-ml-dev'], 86: ['mfcobol'], 88: ['kerberos'], 89: ['su-mit-tg'], 90: ['dnsix'], 91: ['mit-dov'], 92: ['npp'], 93: ['dcp'], 94: ['objcall'], 95: ['supdup'], 96: ['dixie'], 97: ['swift-rvf'], 98: ['tacnews'], 99: ['metagram'], 101: ['hostname'], 102: ['iso-tsap'], 103: ['gppitnp'], 104: ['acr-nema'], 105: ['csnet-ns', 'cso'], 106: ['3com-tsmux'], 107: ['rtelnet'], 108: ['snagas'], 109: ['pop2'], 110: ['pop3'], 111: ['sunrpc'], 112: ['mcidas'], 113: ['auth', 'ident'], 115: ['sftp'], 116: ['ansanotify'], 117: ['uucp-path'], 118: ['sqlserv'], 119: ['nntp'], 120: ['cfdptkt'], 121: ['erpc'], 122: ['smakynet'], 123: ['ntp'], 124: ['ansatrader'], 125: ['locus-map'], 126: ['nxedit'], 127: ['locus-con'], 128: ['gss-xlicen'], 129: ['pwdgen'], 130: ['cisco-fna'], 131: ['cisco-tna'], 132: ['cisco-sys'], 133: ['statsrv'], 134: ['ingres-net'], 135: ['epmap'], 136: ['profile'], 137: ['netbios-ns'], 138: ['netbios-dgm'], 139: ['netbios-ssn'], 140: ['emfis-data'], 141: ['emfis-cntl'], 142: ['bl-idm'], 143: ['imap'], 144: ['uma'], 145: ['uaac'], 146: ['iso-tp0'], 147: ['iso-ip'], 148: ['jargon'], 149: ['aed-512'], 150: ['sql-net'], 151: ['hems'], 152: ['bftp'], 153: ['sgmp'], 154: ['netsc-prod'], 155: ['netsc-dev'], 156: ['sqlsrv'], 157: ['knet-cmp'], 158: ['pcmail-srv'], 159: ['nss-routing'], 160: ['sgmp-traps'], 161: ['snmp'], 162: ['snmptrap'], 163: ['cmip-man'], 164: ['cmip-agent'], 165: ['xns-courier'], 166: ['s-net'], 167: ['namp'], 168: ['rsvd'], 169: ['send'], 170: ['print-srv'], 171: ['multiplex'], 172: ['cl-1'], 173: ['xyplex-mux'], 174: ['mailq'], 175: ['vmnet'], 176: ['genrad-mux'], 177: ['xdmcp'], 178: ['nextstep'], 179: ['bgp'], 180: ['ris'], 181: ['unify'], 182: ['audit'], 183: ['ocbinder'], 184: ['ocserver'], 185: ['remote-kis'], 186: ['kis'], 187: ['aci'], 188: ['mumps'], 189: ['qft'], 190: ['gacp'], 191: ['prospero'], 192: ['osu-nms'], 193: ['srmp'], 194: ['irc'], 195: ['dn6-nlm-aud'], 196: ['dn6-smm-red'], 197: ['dls'], 198: ['dls-mon'], 199: ['smux'], 200: ['src'], 201: ['at-rtmp'], 202: ['at-nbp'], 203: ['at-3'], 204: ['at-echo'], 205: ['at-5'], 206: ['at-zis'], 207: ['at-7'], 208: ['at-8'], 209: ['qmtp'], 210: ['z39-50'], 211: ['914c-g'], 212: ['anet'], 213: ['ipx'], 214: ['vmpwscs'], 215: ['softpc'], 216: ['cailic'], 217: ['dbase'], 218: ['mpp'], 219: ['uarps'], 220: ['imap3'], 221: ['fln-spx'], 222: ['rsh-spx'], 223: ['cdc'], 224: ['masqdialer'], 242: ['direct'], 243: ['sur-meas'], 244: ['inbusiness'], 245: ['link'], 246: ['dsp3270'], 247: ['subntbcst-tftp'], 248: ['bhfhs'], 256: ['rap'], 257: ['set'], 259: ['esro-gen'], 260: ['openport'], 261: ['nsiiops'], 262: ['arcisdms'], 263: ['hdap'], 264: ['bgmp'], 265: ['x-bone-ctl'], 266: ['sst'], 267: ['td-service'], 268: ['td-replica'], 269: ['manet'], 271: ['pt-tls'], 280: ['http-mgmt'], 281: ['personal-link'], 282: ['cableport-ax'], 283: ['rescap'], 284: ['corerjd'], 286: ['fxp'], 287: ['k-block'], 308: ['novastorbakcup'], 309: ['entrusttime'], 310: ['bhmds'], 311: ['asip-webadmin'], 312: ['vslmp'], 313: ['magenta-logic'], 314: ['opalis-robot'], 315: ['dpsi'], 316: ['decauth'], 317: ['zannet'], 318: ['pkix-timestamp'], 319: ['ptp-event'], 320: ['ptp-general'], 321: ['pip'], 322: ['rtsps'], 323: ['rpki-rtr'], 324: ['rpki-rtr-tls'], 333: ['texar'], 344: ['pdap'], 345: ['pawserv'], 346: ['zserv'], 347: ['fatserv'], 348: ['csi-sgwp'], 349: ['mftp'], 350: ['matip-type-a'], 351: ['bhoetty', 'matip-type-b'], 352: ['bhoedap4', 'dtag-ste-sb'], 353: ['ndsauth'], 354: ['bh611'], 355: ['datex-asn'], 356: ['cloanto-net-1'], 357: ['bhevent'], 358: ['shrinkwrap'], 359: ['nsrmp'], 360: ['scoi2odialog'], 361: ['semantix'], 362: ['srssend'], 363: ['rsvp-tunnel'], 364: ['aurora-cmgr'], 365: ['dtk'], 366: ['odmr'], 367: ['mortgageware'], 368: ['qbikgdp'], 369: ['rpc2portmap'], 370: ['codaauth2'], 371: ['clearcase'], 372: ['ulistproc'], 373: ['legent-1'], 374: ['legent-2'], 375: ['hassle'], 376: ['nip'], 377: ['tnetos'], 378: ['dsetos'], 379: ['is99c'], 380: ['is99s'], 381: ['hp-collector'], 382: ['hp-managed-node'], 383: ['hp-alarm-mgr'], 384: ['arns'], 385: ['ibm-app'], 386: ['asa'], 387: ['aurp'], 388: ['unidata-ldm'], 389: ['ldap'], 390: ['uis'], 391: ['synotics-relay'], 392: ['synotics-broker'], 393: ['meta5'], 394: ['embl-ndt'], 395: ['netcp'], 396: ['netware-ip'], 397: ['mptn'], 398: ['kryptolan'], 399: ['iso-tsap-c2'], 400: ['osb-sd'], 401: ['ups'], 402: ['genie'], 403: ['decap'], 404: ['nced'], 405: ['ncld'], 406: ['imsp'], 407: ['timbuktu'], 408: ['prm-sm'], 409: ['prm-nm'], 410: ['decladebug'], 411: ['rmt'], 412: ['synoptics-trap'], 413: ['smsp'], 414: ['infoseek'], 415: ['bnet'], 416: ['silverplatter'], 417: ['onmux'], 418: ['hyper-g'], 419: ['ariel1'], 420: ['smpte'], 421: ['ariel2'], 422: ['ariel3'], 423: ['opc-job-start'], 424: ['opc-job-track'], 425: ['icad-el'], 426: ['smartsdp'], 427: ['svrloc'], 428: ['ocs-cmu'], 429: ['ocs-amu'], 430: ['utmpsd'], 431: ['utmpcd'], 432: ['iasd'], 433: ['nnsp'], 434: ['mobileip-agent'], 435: ['mobilip-mn'], 436: ['dna-cml'], 437: ['comscm'], 438: ['dsfgw'], 439: ['dasp'], 440: ['sgcp'], 441: ['decvms-sysmgt'], 442: ['cvc-hostd'], 443: ['https'], 444: ['snpp'], 445: ['microsoft-ds'], 446: ['ddm-rdb'], 447: ['ddm-dfm'], 448: ['ddm-ssl'], 449: ['as-servermap'], 450: ['tserver'], 451: ['sfs-smp-net'], 452: ['sfs-config'], 453: ['creativeserver'], 454: ['contentserver'], 455: ['creativepartnr'], 456: ['macon-tcp'], 457: ['scohelp'], 458: ['appleqtc'], 459: ['ampr-rcmd'], 460: ['skronk'], 461: ['datasurfsrv'], 462: ['datasurfsrvsec'], 463: ['alpes'], 464: ['kpasswd'], 465: ['urd'], 466: ['digital-vrc'], 467: ['mylex-mapd'], 468: ['photuris'], 469: ['rcp'], 470: ['scx-proxy'], 471: ['mondex'], 472: ['ljk-login'], 473: ['hybrid-pop'], 474: ['tn-tl-w1'], 475: ['tcpnethaspsrv'], 476: ['tn-tl-fd1'], 477: ['ss7ns'], 478: ['spsc'], 479: ['iafserver'], 480: ['iafdbase'], 481: ['ph'], 482: ['bgs-nsi'], 483: ['ulpnet'], 484: ['integra-sme'], 485: ['powerburst'], 486: ['avian'], 487: ['saft'], 488: ['gss-http'], 489: ['nest-protocol'], 490: ['micom-pfs'], 491: ['go-login'], 492: ['ticf-1'], 493: ['ticf-2'], 494: ['pov-ray'], 495: ['intecourier'], 496: ['pim-rp-disc'], 497: ['retrospect'], 498: ['siam'], 499: ['iso-ill'], 500: ['isakmp'], 501: ['stmf'], 502: ['asa-appl-proto'], 503: ['intrinsa'], 504: ['citadel'], 505: ['mailbox-lm'], 506: ['ohimsrv'], 507: ['crs'], 508: ['xvttp'], 509: ['snare'], 510: ['fcp'], 511: ['passgo'], 512: ['exec'], 513: ['login'], 514: ['shell'], 515: ['printer'], 516: ['videotex'], 517: ['talk'], 518: ['ntalk'], 519: ['utime'], 520: ['efs'], 521: ['ripng'], 522: ['ulp'], 523: ['ibm-db2'], 524: ['ncp'], 525: ['timed'], 526: ['tempo'], 527: ['stx'], 528: ['custix'], 529: ['irc-serv'], 530: ['courier'], 531: ['conference'], 532: ['netnews'], 533: ['netwall'], 534: ['windream'], 535: ['iiop'], 536: ['opalis-rdv'], 537: ['nmsp'], 538: ['gdomap'], 539: ['apertus-ldp'], 540: ['uucp'], 541: ['uucp-rlogin'], 542: ['commerce'], 543: ['klogin'], 544: ['kshell'], 545: ['appleqtcsrvr'], 546: ['dhcpv6-client'], 547: ['dhcpv6-server'], 548: ['afpovertcp'], 549: ['idfp'], 550: ['new-rwho'], 551: ['cybercash'], 552: ['devshr-nts'], 553: ['pirp'], 554: ['rtsp'], 555: ['dsf'], 556: ['remotefs'], 557: ['openvms-sysipc'], 558: ['sdnskmp'], 559: ['teedtap'], 560: ['rmonitor'], 561: ['monitor'], 562: ['chshell'], 563: ['nntps'], 564: ['9pfs'], 565: ['whoami'], 566: ['streettalk'], 567: ['banyan-rpc'], 568: ['ms-shuttle'], 569: ['ms-rome'], 570: ['meter'], 571: ['meter'], 572: ['sonar'], 573: ['banyan-vip'], 574: ['ftp-agent'], 575: ['vemmi'], 576: ['ipcd'], 577: ['vnas'], 578: ['ipdd'], 579: ['decbsrv'], 580: ['sntp-heartbeat'], 581: ['bdp'], 582: ['scc-security'], 583: ['philips-vc'], 584: ['keyserver'], 586: ['password-chg'], 587: ['submission'], 588: ['cal'], 589: ['eyelink'], 590: ['tns-cml'], 591: ['http-alt'], 592: ['eudora-set'], 593: ['http-rpc-epmap'], 594: ['tpip'], 595: ['cab-protocol'], 596: ['smsd'], 597: ['ptcnameservice'], 598: ['sco-websrvrmg3'], 599: ['acp'], 600: ['ipcserver'], 601: ['syslog-conn'], 602: ['xmlrpc-beep'], 603: ['idxp'], 604: ['tunnel'], 605: ['soap-beep'], 606: ['urm'], 607: ['nqs'], 608: ['sift-uft'], 609: ['npmp-trap'], 610: ['npmp-local'], 611: ['npmp-gui'], 612: ['hmmp-ind'], 613: ['hmmp-op'], 614: ['sshell'], 615: ['sco-inetmgr'], 616: ['sco-sysmgr'], 617: ['sco-dtmgr'], 618: ['dei-icda'], 619: ['compaq-evm'], 620: ['sco-websrvrmgr'], 621: ['escp-ip'], 622: ['collaborator'], 623: ['oob-ws-http'], 624: ['cryptoadmin'], 625: ['dec-dlm'], 626: ['asia'], 627: ['passgo-tivoli'], 628: ['qmqp'], 629: ['3com-amp3'], 630: ['rda'], 631: ['ipp'], 632: ['bmpp'], 633: ['servstat'], 634: ['ginad'], 635: ['rlzdbase'], 636: ['ldaps'], 637: ['lanserver'], 638: ['mcns-sec'], 639: ['msdp'], 640: ['entrust-sps'], 641: ['repcmd'], 642: ['esro-emsdp'], 643: ['sanity'], 644: ['dwr'], 645: ['pssc'], 646: ['ldp'], 647: ['dhcp-failover'], 648: ['rrp'], 649: ['cadview-3d'], 650: ['obex'], 651: ['ieee-mms'], 652: ['hello-port'], 653: ['repscmd'], 654: ['aodv'], 655: ['tinc'], 656: ['spmp'], 657: ['rmc'], 658: ['tenfold'], 660: ['mac-srvr-admin'], 661: ['hap'], 662: ['pftp'], 663: ['purenoise'], 664: ['oob-ws-https'], 665: ['sun-dr'], 666: ['doom', 'mdqs'], 667: ['disclose'], 668: ['mecomm'], 669: ['meregister'], 670: ['vacdsm-sws'], 671: ['vacdsm-app'], 672: ['vpps-qua'], 673: ['cimplex'], 674: ['acap'], 675: ['dctp'], 676: ['vpps-via'], 677: ['vpp'], 678: ['ggf-ncp'], 679: ['mrm'], 680: ['entrust-aaas'], 681: ['entrust-aams'], 682: ['xfr'], 683: ['corba-iiop'], 684: ['corba-iiop-ssl'], 685: ['mdc-portmapper'], 686: ['hcp-wismar'], 687: ['asipregistry'], 688: ['realm-rusd'], 689: ['nmap'], 690: ['vatp'], 691: ['msexch-routing'], 692: ['hyperwave-isp'], 693: ['connendp'], 694: ['ha-cluster'], 695: ['ieee-mms-ssl'], 696: ['rushd'], 697: ['uuidgen'], 698: ['olsr'], 699: ['accessnetwork'], 700: ['epp'], 701: ['lmp'], 702: ['iris-beep'], 704: ['elcsd'], 705: ['agentx'], 706: ['silc'], 707: ['borland-dsj'], 709: ['entrust-kmsh'], 710: ['entrust-ash'], 711: ['cisco-tdp'], 712: ['tbrpf'], 713: ['iris-xpc'], 714: ['iris-xpcs'], 715: ['iris-lwz'], 729: ['netviewdm1'], 730: ['netviewdm2'], 731: ['netviewdm3'], 741: ['netgw'], 742: ['netrcs'], 744: ['flexlm'], 747: ['fujitsu-dev'], 748: ['ris-cm'], 749: ['kerberos-adm'], 750: ['rfile'], 751: ['pump'], 752: ['qrh'], 753: ['rrh'], 754: ['tell'], 758: ['nlogin'], 759: ['con'], 760: ['ns'], 761: ['rxe'], 762: ['quotad'], 763: ['cycleserv'], 764: ['omserv'], 765: ['webster'], 767: ['phonebook'], 769: ['vid'], 770: ['cadlock'], 771: ['rtip'], 772: ['cycleserv2'], 773: ['submit'], 774: ['rpasswd'], 775: ['entomb'], 776: ['wpages'], 777: ['multiling-http'], 780: ['wpgs'], 800: ['mdbs-daemon'], 801: ['device'], 810: ['fcp-udp'], 828: ['itm-mcell-s'], 829: ['pkix-3-ca-ra'], 830: ['netconf-ssh'], 831: ['netconf-beep'], 832: ['netconfsoaphttp'], 833: ['netconfsoapbeep'], 847: ['dhcp-failover2'], 848: ['gdoi'], 860: ['iscsi'], 861: ['owamp-control'], 862: ['twamp-control'], 873: ['rsync'], 886: ['iclcnet-locate'], 887: ['iclcnet-svinfo'], 888: ['accessbuilder', 'cddbp'], 900: ['omginitialrefs'], 901: ['smpnameres'], 902: ['ideafarm-door'], 903: ['ideafarm-panic'], 910: ['kink'], 911: ['xact-backup'], 912: ['apex-mesh'], 913: ['apex-edge'], 989: ['ftps-data'], 990: ['ftps'], 991: ['nas'], 992: ['telnets'], 993: ['imaps'], 995: ['pop3s'], 996: ['vsinet'], 997: ['maitrd'], 998: ['busboy'], 999: ['garcon', 'puprouter'], 1000: ['cadlock2'], 1010: ['surf'], 1021: ['exp1'], 1022: ['exp2'], 1025: ['blackjack'], 1026: ['cap'], 1029: ['solid-mux'], 1033: ['netinfo-local'], 1034: ['activesync'], 1035: ['mxxrlogin'], 1036: ['nsstp'], 1037: ['ams'], 1038: ['mtqp'], 1039: ['sbl'], 1040: ['netarx'], 1041: ['danf-ak2'], 1042: ['afrog'], 1043: ['boinc-client'], 1044: ['dcutility'], 1045: ['fpitp'], 1046: ['wfremotertm'], 1047: ['neod1'], 1048: ['neod2'], 1049: ['td-postman'], 1050: ['cma'], 1051: ['optima-vnet'], 1052: ['ddt'], 1053: ['remote-as'], 1054: ['brvread'], 1055: ['ansyslmd'], 1056: ['vfo'], 1057: ['startron'], 1058: ['nim'], 1059: ['nimreg'], 1060: ['polestar'], 1061: ['kiosk'], 1062: ['veracity'], 1063: ['kyoceranetdev'], 1064: ['jstel'], 1065: ['syscomlan'], 1066: ['fpo-fns'], 1067: ['instl-boots'], 1068: ['instl-bootc'], 1069: ['cognex-insight'], 1070: ['gmrupdateserv'], 1071: ['bsquare-voip'], 1072: ['cardax'], 1073: ['bridgecontrol'], 1074: ['warmspotmgmt'], 1075: ['rdrmshc'], 1076: ['dab-sti-c'], 1077: ['imgames'], 1078: ['avocent-proxy'], 1079: ['asprovatalk'], 1080: ['socks'], 1081: ['pvuniwien'], 1082: ['amt-esd-prot'], 1083: ['ansoft-lm-1'], 1084: ['ansoft-lm-2'], 1085: ['webobjects'], 1086: ['cplscrambler-lg'], 1087: ['cplscrambler-in'], 1088: ['cplscrambler-al'], 1089: ['ff-annunc'], 1090: ['ff-fms'], 1091: ['ff-sm'], 1092: ['obrpd'], 1093: ['proofd'], 1094: ['rootd'], 1095: ['nicelink'], 1096: ['cnrprotocol'], 1097: ['sunclustermgr'], 1098: ['rmiactivation'], 1099: ['rmiregistry'], 1100: ['mctp'], 1101: ['pt2-discover'], 1102: ['adobeserver-1'], 1103: ['adobeserver-2'], 1104: ['xrl'], 1105: ['ftranhc'], 1106: ['isoipsigport-1'], 1107: ['isoipsigport-2'], 1108: ['ratio-adp'], 1110: ['webadmstart'], 1111: ['lmsocialserver'], 1112: ['icp'], 1113: ['ltp-deepspace'], 1114: ['mini-sql'], 1115: ['ardus-trns'], 1116: ['ardus-cntl'], 1117: ['ardus-mtrns'], 1118: ['sacred'], 1119: ['bnetgame'], 1120: ['bnetfile'], 1121: ['rmpp'], 1122: ['availant-mgr'], 1123: ['murray'], 1124: ['hpvmmcontrol'], 1125: ['hpvmmagent'], 1126: ['hpvmmdata'], 1127: ['kwdb-commn'], 1128: ['saphostctrl'], 1129: ['saphostctrls'], 1130: ['casp'], 1131: ['caspssl'], 1132: ['kvm-via-ip'], 1133: ['dfn'], 1134: ['aplx'], 1135: ['omnivision'], 1136: ['hhb-gateway'], 1137: ['trim'], 1138: ['encrypted-admin'], 1139: ['evm'], 1140: ['autonoc'], 1141: ['mxomss'], 1142: ['edtools'], 1143: ['imyx'], 1144: ['fuscript'], 1145: ['x9-icue'], 1146: ['audit-transfer'], 1147: ['capioverlan'], 1148: ['elfiq-repl'], 1149: ['bvtsonar'], 1150: ['blaze'], 1151: ['unizensus'], 1152: ['winpoplanmess'], 1153: ['c1222-acse'], 1154: ['resacommunity'], 1155: ['nfa'], 1156: ['iascontrol-oms'], 1157: ['iascontrol'], 1158: ['dbcontrol-oms'], 1159: ['oracle-oms'], 1160: ['olsv'], 1161: ['health-polling'], 1162: ['health-trap'], 1163: ['sddp'], 1164: ['qsm-proxy'], 1165: ['qsm-gui'], 1166: ['qsm-remote'], 1167: ['cisco-ipsla'], 1168: ['vchat'], 1169: ['tripwire'], 1170: ['atc-lm'], 1171: ['atc-appserver'], 1172: ['dnap'], 1173: ['d-cinema-rrp'], 1174: ['fnet-remote-ui'], 1175: ['dossier'], 1176: ['indigo-server'], 1177: ['dkmessenger'], 1178: ['sgi-storman'], 1179: ['b2n'], 1180: ['mc-client'], 1181: ['3comnetman'], 1182: ['accelenet'], 1183: ['llsurfup-http'], 1184: ['llsurfup-https'], 1185: ['catchpole'], 1186: ['mysql-cluster'], 1187: ['alias'], 1188: ['hp-webadmin'], 1189: ['unet'], 1190: ['commlinx-avl'], 1191: ['gpfs'], 1192: ['caids-sensor'], 1193: ['fiveacross'], 1194: ['openvpn'], 1195: ['rsf-1'], 1196: ['netmagic'], 1197: ['carrius-rshell'], 1198: ['cajo-discovery'], 1199: ['dmidi'], 1200: ['scol'], 1201: ['nucleus-sand'], 1202: ['caiccipc'], 1203: ['ssslic-mgr'], 1204: ['ssslog-mgr'], 1205: ['accord-mgc'], 1206: ['anthony-data'], 1207: ['metasage'], 1208: ['seagull-ais'], 1209: ['ipcd3'], 1210: ['eoss'], 1211: ['groove-dpp'], 1212: ['lupa'], 1213: ['mpc-lifenet'], 1214: ['kazaa'], 1215: ['scanstat-1'], 1216: ['etebac5'], 1217: ['hpss-ndapi'], 1218: ['aeroflight-ads'], 1219: ['aeroflight-ret'], 1220: ['qt-serveradmin'], 1221: ['sweetware-apps'], 1222: ['nerv'], 1223: ['tgp'], 1224: ['vpnz'], 1225: ['slinkysearch'], 1226: ['stgxfws'], 1227: ['dns2go'], 1228: ['florence'], 1229: ['zented'], 1230: ['periscope'], 1231: ['menandmice-lpm'], 1232: ['first-defense'], 1233: ['univ-appserver'], 1234: ['search-agent'], 1235: ['mosaicsyssvc1'], 1236: ['bvcontrol'], 1237: ['tsdos390'], 1238: ['hacl-qs'], 1239: ['nmsd'], 1240: ['instantia'], 1241: ['nessus'], 1242: ['nmasoverip'], 1243: ['serialgateway'], 1244: ['isbconference1'], 1245: ['isbconference2'], 1246: ['payrouter'], 1247: ['visionpyramid'], 1248: ['hermes'], 1249: ['mesavistaco'], 1250: ['swldy-sias'], 1251: ['servergraph'], 1252: ['bspne-pcc'], 1253: ['q55-pcc'], 1254: ['de-noc'], 1255: ['de-cache-query'], 1256: ['de-server'], 1257: ['shockwave2'], 1258: ['opennl'], 1259: ['opennl-voice'], 1260: ['ibm-ssd'], 1261: ['mpshrsv'], 1262: ['qnts-orb'], 1263: ['dka'], 1264: ['prat'], 1265: ['dssiapi'], 1266: ['dellpwrappks'], 1267: ['epc'], 1268: ['propel-msgsys'], 1269: ['watilapp'], 1270: ['opsmgr'], 1271: ['excw'], 1272: ['cspmlockmgr'], 1273: ['emc-gateway'], 1274: ['t1distproc'], 1275: ['ivcollector'], 1276: ['ivmanager'], 1277: ['miva-mqs'], 1278: ['dellwebadmin-1'], 1279: ['dellwebadmin-2'], 1280: ['pictrography'], 1281: ['healthd'], 1282: ['emperion'], 1283: ['productinfo'], 1284: ['iee-qfx'], 1285: ['neoiface'], 1286: ['netuitive'], 1287: ['routematch'], 1288: ['navbuddy'], 1289: ['jwalkserver'], 1290: ['winjaserver'], 1291: ['seagulllms'], 1292: ['dsdn'], 1293: ['pkt-krb-ipsec'], 1294: ['cmmdriver'], 1295: ['ehtp'], 1296: ['dproxy'], 1297: ['sdproxy'], 1298: ['lpcp'], 1299: ['hp-sci'], 1300: ['h323hostcallsc'], 1301: ['ci3-software-1'], 1302: ['ci3-software-2'], 1303: ['sftsrv'], 1304: ['boomerang'], 1305: ['pe-mike'], 1306: ['re-conn-proto'], 1307: ['pacmand'], 1308: ['odsi'], 1309: ['jtag-server'], 1310: ['husky'], 1311: ['rxmon'], 1312: ['sti-envision'], 1313: ['bmc-patroldb'], 1314: ['pdps'], 1315: ['els'], 1316: ['exbit-escp'], 1317: ['vrts-ipcserver'], 1318: ['krb5gatekeeper'], 1319: ['amx-icsp'], 1320: ['amx-axbnet'], 1321: ['pip'], 1322: ['novation'], 1323: ['brcd'], 1324: ['delta-mcp'], 1325: ['dx-instrument'], 1326: ['wimsic'], 1327: ['ultrex'], 1328: ['ewall'], 1329: ['netdb-export'], 1330: ['streetperfect'], 1331: ['intersan'], 1332: ['pcia-rxp-b'], 1333: ['passwrd-policy'], 1334: ['writesrv'], 1335: ['digital-notary'], 1336: ['ischat'], 1337: ['menandmice-dns'], 1338: ['wmc-log-svc'], 1339: ['kjtsiteserver'], 1340: ['naap'], 1341: ['qubes'], 1342: ['esbroker'], 1343: ['re101'], 1344: ['icap'], 1345: ['vpjp'], 1346: ['alta-ana-lm'], 1347: ['bbn-mmc'], 1348: ['bbn-mmx'], 1349: ['sbook'], 1350: ['editbench'], 1351: ['equationbuilder'], 1352: ['lotusnote'], 1353: ['relief'], 1354: ['xsip-network'], 1355: ['intuitive-edge'], 1356: ['cuillamartin'], 1357: ['pegboard'], 1358: ['connlcli'], 1359: ['ftsrv'], 1360: ['mimer'], 1361: ['linx'], 1362: ['timeflies'], 1363: ['ndm-requester'], 1364: ['ndm-server'], 1365: ['adapt-sna'], 1366: ['netware-csp'], 1367: ['dcs'], 1368: ['screencast'], 1369: ['gv-us'], 1370: ['us-gv'], 1371: ['fc-cli'], 1372: ['fc-ser'], 1373: ['chromagrafx'], 1374: ['molly'], 1375: ['bytex'], 1376: ['ibm-pps'], 1377: ['cichlid'], 1378: ['elan'], 1379: ['dbreporter'], 1380: ['telesis-licman'], 1381: ['apple-licman'], 1382: ['udt-os'], 1383: ['gwha'], 1384: ['os-licman'], 1385: ['atex-elmd'], 1386: ['checksum'], 1387: ['cadsi-lm'], 1388: ['objective-dbc'], 1389: ['iclpv-dm'], 1390: ['iclpv-sc'], 1391: ['iclpv-sas'], 1392: ['iclpv-pm'], 1393: ['iclpv-nls'], 1394: ['iclpv-nlc'], 1395: ['iclpv-wsm'], 1396: ['dvl-activemail'], 1397: ['audio-activmail'], 1398: ['video-activmail'], 1399: ['cadkey-licman'], 1400: ['cadkey-tablet'], 1401: ['goldleaf-licman'], 1402: ['prm-sm-np'], 1403: ['prm-nm-np'], 1404: ['igi-lm'], 1405: ['ibm-res'], 1406: ['netlabs-lm'], 1407: ['dbsa-lm'], 1408: ['sophia-lm'], 1409: ['here-lm'], 1410: ['hiq'], 1411: ['af'], 1412: ['innosys'], 1413: ['innosys-acl'], 1414: ['ibm-mqseries'], 1415: ['dbstar'], 1416: ['novell-lu6-2'], 1417: ['timbuktu-srv1'], 1418: ['timbuktu-srv2'], 1419: ['timbuktu-srv3'], 1420: ['timbuktu-srv4'], 1421: ['gandalf-lm'], 1422: ['autodesk-lm'], 1423: ['essbase'], 1424: ['hybrid'], 1425: ['zion-lm'], 1426: ['sais'], 1427: ['mloadd'], 1428: ['informatik-lm'], 1429: ['nms'], 1430: ['tpdu'], 1431: ['rgtp'], 1432: ['blueberry-lm'], 1433: ['ms-sql-s'], 1434: ['ms-sql-m'], 1435: ['ibm-cics'], 1436: ['saism'], 1437: ['tabula'], 1438: ['eicon-server'], 1439: ['eicon-x25'], 1440: ['eicon-slp'], 1441: ['cadis-1'], 1442: ['cadis-2'], 1443: ['ies-lm'], 1444: ['marcam-lm'], 1445: ['proxima-lm'], 1446: ['ora-lm'], 1447: ['apri-lm'], 1448: ['oc-lm'], 1449: ['peport'], 1450: ['dwf'], 1451: ['infoman'], 1452: ['gtegsc-lm'], 1453: ['genie-lm'], 1454: ['interhdl-elmd'], 1455: ['esl-lm'], 1456: ['dca'], 1457: ['valisys-lm'], 1458: ['nrcabq-lm'], 1459: ['proshare1'], 1460: ['proshare2'], 1461: ['ibm-wrless-lan'], 1462: ['world-lm'], 1463: ['nucleus'], 1464: ['msl-lmd'], 1465: ['pipes'], 1466: ['oceansoft-lm'], 1467: ['csdmbase'], 1468: ['csdm'], 1469: ['aal-lm'], 1470: ['uaiact'], 1471: ['csdmbase'], 1472: ['csdm'], 1473: ['openmath'], 1474: ['telefinder'], 1475: ['taligent-lm'], 1476: ['clvm-cfg'], 1477: ['ms-sna-server'], 1478: ['ms-sna-base'], 1479: ['dberegister'], 1480: ['pacerforum'], 1481: ['airs'], 1482: ['miteksys-lm'], 1483: ['afs'], 1484: ['confluent'], 1485: ['lansource'], 1486: ['nms-topo-serv'], 1487: ['localinfosrvr'], 1488: ['docstor'], 1489: ['dmdocbroker'], 1490: ['insitu-conf'], 1492: ['stone-design-1'], 1493: ['netmap-lm'], 1494: ['ica'], 1495: ['cvc'], 1496: ['liberty-lm'], 1497: ['rfx-lm'], 1498: ['sybase-sqlany'], 1499: ['fhc'], 1500: ['vlsi-lm'], 1501: ['saiscm'], 1502: ['shivadiscovery'], 1503: ['imtc-mcs'], 1504: ['evb-elm'], 1505: ['funkproxy'], 1506: ['utcd'], 1507: ['symplex'], 1508: ['diagmond'], 1509: ['robcad-lm'], 1510: ['mvx-lm'], 1511: ['3l-l1'], 1512: ['wins'], 1513: ['fujitsu-dtc'], 1514: ['fujitsu-dtcns'], 1515: ['ifor-protocol'], 1516: ['vpad'], 1517: ['vpac'], 1518: ['vpvd'], 1519: ['vpvc'], 1520: ['atm-zip-office'], 1521: ['ncube-lm'], 1522: ['ricardo-lm'], 1523: ['cichild-lm'], 1524: ['ingreslock'], 1525: ['orasrv', 'prospero-np'], 1526: ['pdap-np'], 1527: ['tlisrv'], 1529: ['coauthor'], 1530: ['rap-service'], 1531: ['rap-listen'], 1532: ['miroconnect'], 1533: ['virtual-places'], 1534: ['micromuse-lm'], 1535: ['ampr-info'], 1536: ['ampr-inter'], 1537: ['sdsc-lm'], 1538: ['3ds-lm'], 1539: ['intellistor-lm'], 1540: ['rds'], 1541: ['rds2'], 1542: ['gridgen-elmd'], 1543: ['simba-cs'], 1544: ['aspeclmd'], 1545: ['vistium-share'], 1546: ['abbaccuray'], 1547: ['laplink'], 1548: ['axon-lm'], 1549: ['shivahose'], 1550: ['3m-image-lm'], 1551: ['hecmtl-db'], 1552: ['pciarray'], 1553: ['sna-cs'], 1554: ['caci-lm'], 1555: ['livelan'], 1556: ['veritas-pbx'], 1557: ['arbortext-lm'], 1558: ['xingmpeg'], 1559: ['web2host'], 1560: ['asci-val'], 1561: ['facilityview'], 1562: ['pconnectmgr'], 1563: ['cadabra-lm'], 1564: ['pay-per-view'], 1565: ['winddlb'], 1566: ['corelvideo'], 1567: ['jlicelmd'], 1568: ['tsspmap'], 1569: ['ets'], 1570: ['orbixd'], 1571: ['rdb-dbs-disp'], 1572: ['chip-lm'], 1573: ['itscomm-ns'], 1574: ['mvel-lm'], 1575: ['oraclenames'], 1576: ['moldflow-lm'], 1577: ['hypercube-lm'], 1578: ['jacobus-lm'], 1579: ['ioc-sea-lm'], 1580: ['tn-tl-r1'], 1581: ['mil-2045-47001'], 1582: ['msims'], 1583: ['simbaexpress'], 1584: ['tn-tl-fd2'], 1585: ['intv'], 1586: ['ibm-abtact'], 1587: ['pra-elmd'], 1588: ['triquest-lm'], 1589: ['vqp'], 1590: ['gemini-lm'], 1591: ['ncpm-pm'], 1592: ['commonspace'], 1593: ['mainsoft-lm'], 1594: ['sixtrak'], 1595: ['radio'], 1596: ['radio-sm'], 1597: ['orbplus-iiop'], 1598: ['picknfs'], 1599: ['simbaservices'], 1600: ['issd'], 1601: ['aas'], 1602: ['inspect'], 1603: ['picodbc'], 1604: ['icabrowser'], 1605: ['slp'], 1606: ['slm-api'], 1607: ['stt'], 1608: ['smart-lm'], 1609: ['isysg-lm'], 1610: ['taurus-wh'], 1611: ['ill'], 1612: ['netbill-trans'], 1613: ['netbill-keyrep'], 1614: ['netbill-cred'], 1615: ['netbill-auth'], 1616: ['netbill-prod'], 1617: ['nimrod-agent'], 1618: ['skytelnet'], 1619: ['xs-openstorage'], 1620: ['faxportwinport'], 1621: ['softdataphone'], 1622: ['ontime'], 1623: ['jaleosnd'], 1624: ['udp-sr-port'], 1625: ['svs-omagent'], 1626: ['shockwave'], 1627: ['t128-gateway'], 1628: ['lontalk-norm'], 1629: ['lontalk-urgnt'], 1630: ['oraclenet8cman'], 1631: ['visitview'], 1632: ['pammratc'], 1633: ['pammrpc'], 1634: ['loaprobe'], 1635: ['edb-server1'], 1636: ['isdc'], 1637: ['islc'], 1638: ['ismc'], 1639: ['cert-initiator'], 1640: ['cert-responder'], 1641: ['invision'], 1642: ['isis-am'], 1643: ['isis-ambc'], 1644: ['saiseh'], 1645: ['sightline'], 1646: ['sa-msg-port'], 1647: ['rsap'], 1648: ['concurrent-lm'], 1649: ['kermit'], 1650: ['nkd'], 1651: ['shiva-confsrvr'], 1652: ['xnmp'], 1653: ['alphatech-lm'], 1654: ['stargatealerts'], 1655: ['dec-mbadmin'], 1656: ['dec-mbadmin-h'], 1657: ['fujitsu-mmpdc'], 1658: ['sixnetudr'], 1659: ['sg-lm'], 1660: ['skip-mc-gikreq'], 1661: ['netview-aix-1'], 1662: ['netview-aix-2'], 1663: ['netview-aix-3'], 1664: ['netview-aix-4'], 1665: ['netview-aix-5'], 1666: ['netview-aix-6'], 1667: ['netview-aix-7'], 1668: ['netview-aix-8'], 1669: ['netview-aix-9'], 1670: ['netview-aix-10'], 1671: ['netview-aix-11'], 1672: ['netview-aix-12'], 1673: ['proshare-mc-1'], 1674: ['proshare-mc-2'], 1675: ['pdp'], 1676: ['netcomm1'], 1677: ['groupwise'], 1678: ['prolink'], 1679: ['darcorp-lm'], 1680: ['microcom-sbp'], 1681: ['sd-elmd'], 1682: ['lanyon-lantern'], 1683: ['ncpm-hip'], 1684: ['snaresecure'], 1685: ['n2nremote'], 1686: ['cvmon'], 1687: ['nsjtp-ctrl'], 1688: ['nsjtp-data'], 1689: ['firefox'], 1690: ['ng-umds'], 1691: ['empire-empuma'], 1692: ['sstsys-lm'], 1693: ['rrirtr'], 1694: ['rrimwm'], 1695: ['rrilwm'], 1696: ['rrifmm'], 1697: ['rrisat'], 1698: ['rsvp-encap-1'], 1699: ['rsvp-encap-2'], 1700: ['mps-raft'], 1701: ['l2f', 'l2tp'], 1702: ['deskshare'], 1703: ['hb-engine'], 1704: ['bcs-broker'], 1705: ['slingshot'], 1706: ['jetform'], 1707: ['vdmplay'], 1708: ['gat-lmd'], 1709: ['centra'], 1710: ['impera'], 1711: ['pptconference'], 1712: ['registrar'], 1713: ['conferencetalk'], 1714: ['sesi-lm'], 1715: ['houdini-lm'], 1716: ['xmsg'], 1717: ['fj-hdnet'], 1718: ['h323gatedisc'], 1719: ['h323gatestat'], 1720: ['h323hostcall'], 1721: ['caicci'], 1722: ['hks-lm'], 1723: ['pptp'], 1724: ['csbphonemaster'], 1725: ['iden-ralp'], 1726: ['iberiagames'], 1727: ['winddx'], 1728: ['telindus'], 1729: ['citynl'], 1730: ['roketz'], 1731: ['msiccp'], 1732: ['proxim'], 1733: ['siipat'], 1734: ['cambertx-lm'], 1735: ['privatechat'], 1736: ['street-stream'], 1737: ['ultimad'], 1738: ['gamegen1'], 1739: ['webaccess'], 1740: ['encore'], 1741: ['cisco-net-mgmt'], 1742: ['3com-nsd'], 1743: ['cinegrfx-lm'], 1744: ['ncpm-ft'], 1745: ['remote-winsock'], 1746: ['ftrapid-1'], 1747: ['ftrapid-2'], 1748: ['oracle-em1'], 1749: ['aspen-services'], 1750: ['sslp'], 1751: ['swiftnet'], 1752: ['lofr-lm'], 1753: ['predatar-comms'], 1754: ['oracle-em2'], 1755: ['ms-streaming'], 1756: ['capfast-lmd'], 1757: ['cnhrp'], 1758: ['tftp-mcast'], 1759: ['spss-lm'], 1760: ['www-ldap-gw'], 1761: ['cft-0'], 1762: ['cft-1'], 1763: ['cft-2'], 1764: ['cft-3'], 1765: ['cft-4'], 1766: ['cft-5'], 1767: ['cft-6'], 1768: ['cft-7'], 1769: ['bmc-net-adm'], 1770: ['bmc-net-svc'], 1771: ['vaultbase'], 1772: ['essweb-gw'], 1773: ['kmscontrol'], 1774: ['global-dtserv'], 1776: ['femis'], 1777: ['powerguardian'], 1778: ['prodigy-intrnet'], 1779: ['pharmasoft'], 1780: ['dpkeyserv'], 1781: ['answersoft-lm'], 1782: ['hp-hcip'], 1784: ['finle-lm'], 1785: ['windlm'], 1786: ['funk-logger'], 1787: ['funk-license'], 1788: ['psmond'], 1789: ['hello'], 1790: ['nmsp'], 1791: ['ea1'], 1792: ['ibm-dt-2'], 1793: ['rsc-robot'], 1794: ['cera-bcm'], 1795: ['dpi-proxy'], 1796: ['vocaltec-admin'], 1797: ['uma'], 1798: ['etp'], 1799: ['netrisk'], 1800: ['ansys-lm'], 1801: ['msmq'], 1802: ['concomp1'], 1803: ['hp-hcip-gwy'], 1804: ['enl'], 1805: ['enl-name'], 1806: ['musiconline'], 1807: ['fhsp'], 1808: ['oracle-vp2'], 1809: ['oracle-vp1'], 1810: ['jerand-lm'], 1811: ['scientia-sdb'], 1812: ['radius'], 1813: ['radius-acct'], 1814: ['tdp-suite'], 1815: ['mmpft'], 1816: ['harp'], 1817: ['rkb-oscs'], 1818: ['etftp'], 1819: ['plato-lm'], 1820: ['mcagent'], 1821: ['donnyworld'], 1822: ['es-elmd'], 1823: ['unisys-lm'], 1824: ['metrics-pas'], 1825: ['direcpc-video'], 1826: ['ardt'], 1827: ['asi'], 1828: ['itm-mcell-u'], 1829: ['optika-emedia'], 1830: ['net8-cman'], 1831: ['myrtle'], 1832: ['tht-treasure'], 1833: ['udpradio'], 1834: ['ardusuni'], 1835: ['ardusmul'], 1836: ['ste-smsc'], 1837: ['csoft1'], 1838: ['talnet'], 1839: ['netopia-vo1'], 1840: ['netopia-vo2'], 1841: ['netopia-vo3'], 1842: ['netopia-vo4'], 1843: ['netopia-vo5'], 1844: ['direcpc-dll'], 1845: ['altalink'], 1846: ['tunstall-pnc'], 1847: ['slp-notify'], 1848: ['fjdocdist'], 1849: ['alpha-sms'], 1850: ['gsi'], 1851: ['ctcd'], 1852: ['virtual-time'], 1853: ['vids-avtp'], 1854: ['buddy-draw'], 1855: ['fiorano-rtrsvc'], 1856: ['fiorano-msgsvc'], 1857: ['datacaptor'], 1858: ['privateark'], 1859: ['gammafetchsvr'], 1860: ['sunscalar-svc'], 1861: ['lecroy-vicp'], 1862: ['mysql-cm-agent'], 1863: ['msnp'], 1864: ['paradym-31port'], 1865: ['entp'], 1866: ['swrmi'], 1867: ['udrive'], 1868: ['viziblebrowser'], 1869: ['transact'], 1870: ['sunscalar-dns'], 1871: ['canocentral0'], 1872: ['canocentral1'], 1873: ['fjmpjps'], 1874: ['fjswapsnp'], 1875: ['westell-stats'], 1876: ['ewcappsrv'], 1877: ['hp-webqosdb'], 1878: ['drmsmc'], 1879: ['nettgain-nms'], 1880: ['vsat-control'], 1881: ['ibm-mqseries2'], 1882: ['ecsqdmn'], 1883: ['ibm-mqisdp'], 1884: ['idmaps'], 1885: ['vrtstrapserver'], 1886: ['leoip'], 1887: ['filex-lport'], 1888: ['ncconfig'], 1889: ['unify-adapter'], 1890: ['wilkenlistener'], 1891: ['childkey-notif'], 1892: ['childkey-ctrl'], 1893: ['elad'], 1894: ['o2server-port'], 1896: ['b-novative-ls'], 1897: ['metaagent'], 1898: ['cymtec-port'], 1899: ['mc2studios'], 1900: ['ssdp'], 1901: ['fjicl-tep-a'], 1902: ['fjicl-tep-b'], 1903: ['linkname'], 1904: ['fjicl-tep-c'], 1905: ['sugp'], 1906: ['tpmd'], 1907: ['intrastar'], 1908: ['dawn'], 1909: ['global-wlink'], 1910: ['ultrabac'], 1911: ['mtp'], 1912: ['rhp-iibp'], 1913: ['armadp'], 1914: ['elm-momentum'], 1915: ['facelink'], 1916: ['persona'], 1917: ['noagent'], 1918: ['can-nds'], 1919: ['can-dch'], 1920: ['can-ferret'], 1921: ['noadmin'], 1922: ['tapestry'], 1923: ['spice'], 1924: ['xiip'], 1925: ['discovery-port'], 1926: ['egs'], 1927: ['videte-cipc'], 1928: ['emsd-port'], 1929: ['bandwiz-system'], 1930: ['driveappserver'], 1931: ['amdsched'], 1932: ['ctt-broker'], 1933: ['xmapi'], 1934: ['xaapi'], 1935: ['macromedia-fcs'], 1936: ['jetcmeserver'], 1937: ['jwserver'], 1938: ['jwclient'], 1939: ['jvserver'], 1940: ['jvclient'], 1941: ['dic-aida'], 1942: ['res'], 1943: ['beeyond-media'], 1944: ['close-combat'], 1945: ['dialogic-elmd'], 1946: ['tekpls'], 1947: ['sentinelsrm'], 1948: ['eye2eye'], 1949: ['ismaeasdaqlive'], 1950: ['ismaeasdaqtest'], 1951: ['bcs-lmserver'], 1952: ['mpnjsc'], 1953: ['rapidbase'], 1954: ['abr-api'], 1955: ['abr-secure'], 1956: ['vrtl-vmf-ds'], 1957: ['unix-status'], 1958: ['dxadmind'], 1959: ['simp-all'], 1960: ['nasmanager'], 1961: ['bts-appserver'], 1962: ['biap-mp'], 1963: ['webmachine'], 1964: ['solid-e-engine'], 1965: ['tivoli-npm'], 1966: ['slush'], 1967: ['sns-quote'], 1968: ['lipsinc'], 1969: ['lipsinc1'], 1970: ['netop-rc'], 1971: ['netop-school'], 1972: ['intersys-cache'], 1973: ['dlsrap'], 1974: ['drp'], 1975: ['tcoflashagent'], 1976: ['tcoregagent'], 1977: ['tcoaddressbook'], 1978: ['unisql'], 1979: ['unisql-java'], 1980: ['pearldoc-xact'], 1981: ['p2pq'], 1982: ['estamp'], 1983: ['lhtp'], 1984: ['bb'], 1985: ['hsrp'], 1986: ['licensedaemon'], 1987: ['tr-rsrb-p1'], 1988: ['tr-rsrb-p2'], 1989: ['mshnet', 'tr-rsrb-p3'], 1990: ['stun-p1'], 1991: ['stun-p2'], 1992: ['ipsendmsg', 'stun-p3'], 1993: ['snmp-tcp-port'], 1994: ['stun-port'], 1995: ['perf-port'], 1996: ['tr-rsrb-port'], 1997: ['gdp-port'], 1998: ['x25-svc-port'], 1999: ['tcp-id-port'], 2000: ['cisco-sccp'], 2001: ['dc'], 2002: ['globe'], 2003: ['brutus'], 2004: ['mailbox'], 2005: ['berknet'], 2006: ['invokator'], 2007: ['dectalk'], 2008: ['conf'], 2009: ['news'], 2010: ['search'], 2011: ['raid-cc'], 2012: ['ttyinfo'], 2013: ['raid-am'], 2014: ['troff'], 2015: ['cypress'], 2016: ['bootserver'], 2017: ['cypress-stat'], 2018: ['terminaldb'], 2019: ['whosockami'], 2020: ['xinupageserver'], 2021: ['servexec'], 2022: ['down'], 2023: ['xinuexpansion3'], 2024: ['xinuexpansion4'], 2025: ['ellpack'], 2026: ['scrabble'], 2027: ['shadowserver'], 2028: ['submitserver'], 2029: ['hsrpv6'], 2030: ['device2'], 2031: ['mobrien-chat'], 2032: ['blackboard'], 2033: ['glogger'], 2034: ['scoremgr'], 2035: ['imsldoc'], 2036: ['e-dpnet'], 2037: ['applus'], 2038: ['objectmanager'], 2039: ['prizma'], 2040: ['lam'], 2041: ['interbase'], 2042: ['isis'], 2043: ['isis-bcast'], 2044: ['rimsl'], 2045: ['cdfunc'], 2046: ['sdfunc'], 2047: ['dls'], 2048: ['dls-monitor'], 2049: ['nfs', 'shilp'], 2050: ['av-emb-config'], 2051: ['epnsdp'], 2052: ['clearvisn'], 2053: ['lot105-ds-upd'], 2054: ['weblogin'], 2055: ['iop'], 2056: ['omnisky'], 2057: ['rich-cp'], 2058: ['newwavesearch'], 2059: ['bmc-messaging'], 2060: ['teleniumdaemon'], 2061: ['netmount'], 2062: ['icg-swp'], 2063: ['icg-bridge'], 2064: ['icg-iprelay'], 2065: ['dlsrpn'], 2066: ['aura'], 2067: ['dlswpn'], 2068: ['avauthsrvprtcl'], 2069: ['event-port'], 2070: ['ah-esp-encap'], 2071: ['acp-port'], 2072: ['msync'], 2073: ['gxs-data-port'], 2074: ['vrtl-vmf-sa'], 2075: ['newlixengine'], 2076: ['newlixconfig'], 2077: ['tsrmagt'], 2078: ['tpcsrvr'], 2079: ['idware-router'], 2080: ['autodesk-nlm'], 2081: ['kme-trap-port'], 2082: ['infowave'], 2083: ['radsec'], 2084: ['sunclustergeo'], 2085: ['ada-cip'], 2086: ['gnunet'], 2087: ['eli'], 2088: ['ip-blf'], 2089: ['sep'], 2090: ['lrp'], 2091: ['prp'], 2092: ['descent3'], 2093: ['nbx-cc'], 2094: ['nbx-au'], 2095: ['nbx-ser'], 2096: ['nbx-dir'], 2097: ['jetformpreview'], 2098: ['dialog-port'], 2099: ['h2250-annex-g'], 2100: ['amiganetfs'], 2101: ['rtcm-sc104'], 2102: ['zephyr-srv'], 2103: ['zephyr-clt'], 2104: ['zephyr-hm'], 2105: ['minipay'], 2106: ['mzap'], 2107: ['bintec-admin'], 2108: ['comcam'], 2109: ['ergolight'], 2110: ['umsp'], 2111: ['dsatp'], 2112: ['idonix-metanet'], 2113: ['hsl-storm'], 2114: ['newheights'], 2115: ['kdm'], 2116: ['ccowcmr'], 2117: ['mentaclient'], 2118: ['mentaserver'], 2119: ['gsigatekeeper'], 2120: ['qencp'], 2121: ['scientia-ssdb'], 2122: ['caupc-remote'], 2123: ['gtp-control'], 2124: ['elatelink'], 2125: ['lockstep'], 2126: ['pktcable-cops'], 2127: ['index-pc-wb'], 2128: ['net-steward'], 2129: ['cs-live'], 2130: ['xds'], 2131: ['avantageb2b'], 2132: ['solera-epmap'], 2133: ['zymed-zpp'], 2134: ['avenue'], 2135: ['gris'], 2136: ['appworxsrv'], 2137: ['connect'], 2138: ['unbind-cluster'], 2139: ['ias-auth'], 2140: ['ias-reg'], 2141: ['ias-admind'], 2142: ['tdmoip'], 2143: ['lv-jc'], 2144: ['lv-ffx'], 2145: ['lv-pici'], 2146: ['lv-not'], 2147: ['lv-auth'], 2148: ['veritas-ucl'], 2149: ['acptsys'], 2150: ['dynamic3d'], 2151: ['docent'], 2152: ['gtp-user'], 2153: ['ctlptc'], 2154: ['stdptc'], 2155: ['brdptc'], 2156: ['trp'], 2157: ['xnds'], 2158: ['touchnetplus'], 2159: ['gdbremote'], 2160: ['apc-2160'], 2161: ['apc-2161'], 2162: ['navisphere'], 2163: ['navisphere-sec'], 2164: ['ddns-v3'], 2165: ['x-bone-api'], 2166: ['iwserver'], 2167: ['raw-serial'], 2168: ['easy-soft-mux'], 2169: ['brain'], 2170: ['eyetv'], 2171: ['msfw-storage'], 2172: ['msfw-s-storage'], 2173: ['msfw-replica'], 2174: ['msfw-array'], 2175: ['airsync'], 2176: ['rapi'], 2177: ['qwave'], 2178: ['bitspeer'], 2179: ['vmrdp'], 2180: ['mc-gt-srv'], 2181: ['eforward'], 2182: ['cgn-stat'], 2183: ['cgn-config'], 2184: ['nvd'], 2185: ['onbase-dds'], 2186: ['gtaua'], 2187: ['ssmc'], 2188: ['radware-rpm'], 2189: ['radware-rpm-s'], 2190: ['tivoconnect'], 2191: ['tvbus'], 2192: ['asdis'], 2193: ['drwcs'], 34962: ['profinet-rt'], 34963: ['profinet-rtm'], 34964: ['profinet-cm'], 2197: ['mnp-exchange'], 2198: ['onehome-remote'], 2199: ['onehome-help'], 2200: ['ici'], 2201: ['ats'], 2202: ['imtc-map'], 2203: ['b2-runtime'], 2204: ['b2-license'], 2205: ['jps'], 2206: ['hpocbus'], 2207: ['hpssd'], 2208: ['hpiod'], 2209: ['rimf-ps'], 2210: ['noaaport'], 2211: ['emwin'], 2212: ['leecoposserver'], 2213: ['kali'], 2214: ['rpi'], 2215: ['ipcore'], 2216: ['vtu-comms'], 2217: ['gotodevice'], 2218: ['bounzza'], 2219: ['netiq-ncap'], 2220: ['netiq'], 2221: ['rockwell-csp1'], 2222: ['ethernet-ip-1'], 2223: ['rockwell-csp2'], 2224: ['efi-mg'], 2225: ['rcip-itu'], 2226: ['di-drm'], 2227: ['di-msg'], 2228: ['ehome-ms'], 2229: ['datalens'], 2230: ['queueadm'], 2231: ['wimaxasncp'], 2232: ['ivs-video'], 2233: ['infocrypt'], 2234: ['directplay'], 2235: ['sercomm-wlink'], 2236: ['nani'], 2237: ['optech-port1-lm'], 2238: ['aviva-sna'], 2239: ['imagequery'], 2240: ['recipe'], 2241: ['ivsd'], 2242: ['foliocorp'], 2243: ['magicom'], 2244: ['nmsserver'], 2245: ['hao'], 2246: ['pc-mta-addrmap'], 2247: ['antidotemgrsvr'], 2248: ['ums'], 2249: ['rfmp'], 2250: ['remote-collab'], 2251: ['dif-port'], 2252: ['njenet-ssl'], 2253: ['dtv-chan-req'], 2254: ['seispoc'], 2255: ['vrtp'], 2256: ['pcc-mfp'], 2257: ['simple-tx-rx'], 2258: ['rcts'], 2260: ['apc-2260'], 2261: ['comotionmaster'], 2262: ['comotionback'], 2263: ['ecwcfg'], 2264: ['apx500api-1'], 2265: ['apx500api-2'], 2266: ['mfserver'], 2267: ['ontobroker'], 2268: ['amt'], 2269: ['mikey'], 2270: ['starschool'], 2271: ['mmcals'], 2272: ['mmcal'], 2273: ['mysql-im'], 2274: ['pcttunnell'], 2275: ['ibridge-data'], 2276: ['ibridge-mgmt'], 2277: ['bluectrlproxy'], 2278: ['s3db'], 2279: ['xmquery'], 2280: ['lnvpoller'], 2281: ['lnvconsole'], 2282: ['lnvalarm'], 2283: ['lnvstatus'], 2284: ['lnvmaps'], 2285: ['lnvmailmon'], 2286: ['nas-metering'], 2287: ['dna'], 2288: ['netml'], 2289: ['dict-lookup'], 2290: ['sonus-logging'], 2291: ['eapsp'], 2292: ['mib-streaming'], 2293: ['npdbgmngr'], 2294: ['konshus-lm'], 2295: ['advant-lm'], 2296: ['theta-lm'], 2297: ['d2k-datamover1'], 2298: ['d2k-datamover2'], 2299: ['pc-telecommute'], 2300: ['cvmmon'], 2301: ['cpq-wbem'], 2302: ['binderysupport'], 2303: ['proxy-gateway'], 2304: ['attachmate-uts'], 2305: ['mt-scaleserver'], 2306: ['tappi-boxnet'], 2307: ['pehelp'], 2308: ['sdhelp'], 2309: ['sdserver'], 2310: ['sdclient'], 2311: ['messageservice'], 2312: ['wanscaler'], 2313: ['iapp'], 2314: ['cr-websystems'], 2315: ['precise-sft'], 2316: ['sent-lm'], 2317: ['attachmate-g32'], 2318: ['cadencecontrol'], 2319: ['infolibria'], 2320: ['siebel-ns'], 2321: ['rdlap'], 2322: ['ofsd'], 2323: ['3d-nfsd'], 2324: ['cosmocall'], 2325: ['ansysli'], 2326: ['idcp'], 2327: ['xingcsm'], 2328: ['netrix-sftm'], 2329: ['nvd'], 2330: ['tscchat'], 2331: ['agentview'], 2332: ['rcc-host'], 2333: ['snapp'], 2334: ['ace-client'], 2335: ['ace-proxy'], 2336: ['appleugcontrol'], 2337: ['ideesrv'], 2338: ['norton-lambert'], 2339: ['3com-webview'], 2340: ['wrs-registry'], 2341: ['xiostatus'], 2342: ['manage-exec'], 2343: ['nati-logos'], 2344: ['fcmsys'], 2345: ['dbm'], 2346: ['redstorm-join'], 2347: ['redstorm-find'], 2348: ['redstorm-info'], 2349: ['redstorm-diag'], 2350: ['psbserver'], 2351: ['psrserver'], 2352: ['pslserver'], 2353: ['pspserver'], 2354: ['psprserver'], 2355: ['psdbserver'], 2356: ['gxtelmd'], 2357: ['unihub-server'], 2358: ['futrix'], 2359: ['flukeserver'], 2360: ['nexstorindltd'], 2361: ['tl1'], 2362: ['digiman'], 2363: ['mediacntrlnfsd'], 2364: ['oi-2000'], 2365: ['dbref'], 2366: ['qip-login'], 2367: ['service-ctrl'], 2368: ['opentable'], 2370: ['l3-hbmon'], 2371: ['worldwire'], 2372: ['lanmessenger'], 2373: ['remographlm'], 2374: ['hydra'], 2381: ['compaq-https'], 2382: ['ms-olap3'], 2383: ['ms-olap4'], 2384: ['sd-request'], 2385: ['sd-data'], 2386: ['virtualtape'], 2387: ['vsamredirector'], 2388: ['mynahautostart'], 2389: ['ovsessionmgr'], 2390: ['rsmtp'], 2391: ['3com-net-mgmt'], 2392: ['tacticalauth'], 2393: ['ms-olap1'], 2394: ['ms-olap2'], 2395: ['lan900-remote'], 2396: ['wusage'], 2397: ['ncl'], 2398: ['orbiter'], 2399: ['fmpro-fdal'], 2400: ['opequus-server'], 2401: ['cvspserver'], 2402: ['taskmaster2000'], 2403: ['taskmaster2000'], 2404: ['iec-104'], 2405: ['trc-netpoll'], 2406: ['jediserver'], 2407: ['orion'], 2408: ['railgun-webaccl'], 2409: ['sns-protocol'], 2410: ['vrts-registry'], 2411: ['netwave-ap-mgmt'], 2412: ['cdn'], 2413: ['orion-rmi-reg'], 2414: ['beeyond'], 2415: ['codima-rtp'], 2416: ['rmtserver'], 2417: ['composit-server'], 2418: ['cas'], 2419: ['attachmate-s2s'], 2420: ['dslremote-mgmt'], 2421: ['g-talk'], 2422: ['crmsbits'], 2423: ['rnrp'], 2424: ['kofax-svr'], 2425: ['fjitsuappmgr'], 2427: ['mgcp-gateway'], 2428: ['ott'], 2429: ['ft-role'], 2430: ['venus'], 2431: ['venus-se'], 2432: ['codasrv'], 2433: ['codasrv-se'], 2434: ['pxc-epmap'], 2435: ['optilogic'], 2436: ['topx'], 2437: ['unicontrol'], 2438: ['msp'], 2439: ['sybasedbsynch'], 2440: ['spearway'], 2441: ['pvsw-inet'], 2442: ['netangel'], 2443: ['powerclientcsf'], 2444: ['btpp2sectrans'], 2445: ['dtn1'], 2446: ['bues-service'], 2447: ['ovwdb'], 2448: ['hpppssvr'], 2449: ['ratl'], 2450: ['netadmin'], 2451: ['netchat'], 2452: ['snifferclient'], 2453: ['madge-ltd'], 2454: ['indx-dds'], 2455: ['wago-io-system'], 2456: ['altav-remmgt'], 2457: ['rapido-ip'], 2458: ['griffin'], 2459: ['community'], 2460: ['ms-theater'], 2461: ['qadmifoper'], 2462: ['qadmifevent'], 2463: ['lsi-raid-mgmt'], 2464: ['direcpc-si'], 2465: ['lbm'], 2466: ['lbf'], 2467: ['high-criteria'], 2468: ['qip-msgd'], 2469: ['mti-tcs-comm'], 2470: ['taskman-port'], 2471: ['seaodbc'], 2472: ['c3'], 2473: ['aker-cdp'], 2474: ['vitalanalysis'], 2475: ['ace-server'], 2476: ['ace-svr-prop'], 2477: ['ssm-cvs'], 2478: ['ssm-cssps'], 2479: ['ssm-els'], 2480: ['powerexchange'], 2481: ['giop'], 2482: ['giop-ssl'], 2483: ['ttc'], 2484: ['ttc-ssl'], 2485: ['netobjects1'], 2486: ['netobjects2'], 2487: ['pns'], 2488: ['moy-corp'], 2489: ['tsilb'], 2490: ['qip-qdhcp'], 2491: ['conclave-cpp'], 2492: ['groove'], 2493: ['talarian-mqs'], 2494: ['bmc-ar'], 2495: ['fast-rem-serv'], 2496: ['dirgis'], 2497: ['quaddb'], 2498: ['odn-castraq'], 2499: ['unicontrol'], 2500: ['rtsserv'], 2501: ['rtsclient'], 2502: ['kentrox-prot'], 2503: ['nms-dpnss'], 2504: ['wlbs'], 2505: ['ppcontrol'], 2506: ['jbroker'], 2507: ['spock'], 2508: ['jdatastore'], 2509: ['fjmpss'], 2510: ['fjappmgrbulk'], 2511: ['metastorm'], 2512: ['citrixima'], 2513: ['citrixadmin'], 2514: ['facsys-ntp'], 2515: ['facsys-router'], 2516: ['maincontrol'], 2517: ['call-sig-trans'], 2518: ['willy'], 2519: ['globmsgsvc'], 2520: ['pvsw'], 2521: ['adaptecmgr'], 2522: ['windb'], 2523: ['qke-llc-v3'], 2524: ['optiwave-lm'], 2525: ['ms-v-worlds'], 2526: ['ema-sent-lm'], 2527: ['iqserver'], 2528: ['ncr-ccl'], 2529: ['utsftp'], 2530: ['vrcommerce'], 2531: ['ito-e-gui'], 2532: ['ovtopmd'], 2533: ['snifferserver'], 2534: ['combox-web-acc'], 2535: ['madcap'], 2536: ['btpp2audctr1'], 2537: ['upgrade'], 2538: ['vnwk-prapi'], 2539: ['vsiadmin'], 2540: ['lonworks'], 2541: ['lonworks2'], 2542: ['udrawgraph'], 2543: ['reftek'], 2544: ['novell-zen'], 2545: ['sis-emt'], 2546: ['vytalvaultbrtp'], 2547: ['vytalvaultvsmp'], 2548: ['vytalvaultpipe'], 2549: ['ipass'], 2550: ['ads'], 2551: ['isg-uda-server'], 2552: ['call-logging'], 2553: ['efidiningport'], 2554: ['vcnet-link-v10'], 2555: ['compaq-wcp'], 2556: ['nicetec-nmsvc'], 2557: ['nicetec-mgmt'], 2558: ['pclemultimedia'], 2559: ['lstp'], 2560: ['labrat'], 2561: ['mosaixcc'], 2562: ['delibo'], 2563: ['cti-redwood'], 2564: ['hp-3000-telnet'], 2565: ['coord-svr'], 2566: ['pcs-pcw'], 2567: ['clp'], 2568: ['spamtrap'], 2569: ['sonuscallsig'], 2570: ['hs-port'], 2571: ['cecsvc'], 2572: ['ibp'], 2573: ['trustestablish'], 2574: ['blockade-bpsp'], 2575: ['hl7'], 2576: ['tclprodebugger'], 2577: ['scipticslsrvr'], 2578: ['rvs-isdn-dcp'], 2579: ['mpfoncl'], 2580: ['tributary'], 2581: ['argis-te'], 2582: ['argis-ds'], 2583: ['mon'], 2584: ['cyaserv'], 2585: ['netx-server'], 2586: ['netx-agent'], 2587: ['masc'], 2588: ['privilege'], 2589: ['quartus-tcl'], 2590: ['idotdist'], 2591: ['maytagshuffle'], 2592: ['netrek'], 2593: ['mns-mail'], 2594: ['dts'], 2595: ['worldfusion1'], 2596: ['worldfusion2'], 2597: ['homesteadglory'], 2598: ['citriximaclient'], 2599: ['snapd'], 2600: ['hpstgmgr'], 2601: ['discp-client'], 2602: ['discp-server'], 2603: ['servicemeter'], 2604: ['nsc-ccs'], 2605: ['nsc-posa'], 2606: ['netmon'], 2607: ['connection'], 2608: ['wag-service'], 2609: ['system-monitor'], 2610: ['versa-tek'], 2611: ['lionhead'], 2612: ['qpasa-agent'], 2613: ['smntubootstrap'], 2614: ['neveroffline'], 2615: ['firepower'], 2616: ['appswitch-emp'], 2617: ['cmadmin'], 2618: ['priority-e-com'], 2619: ['bruce'], 2620: ['lpsrecommender'], 2621: ['miles-apart'], 2622: ['metricadbc'], 2623: ['lmdp'], 2624: ['aria'], 2625: ['blwnkl-port'], 2626: ['gbjd816'], 2627: ['moshebeeri'], 2628: ['dict'], 2629: ['sitaraserver'], 2630: ['sitaramgmt'], 2631: ['sitaradir'], 2632: ['irdg-post'], 2633: ['interintelli'], 2634: ['pk-electronics'], 2635: ['backburner'], 2636: ['solve'], 2637: ['imdocsvc'], 2638: ['sybaseanywhere'], 2639: ['aminet'], 2640: ['sai-sentlm'], 2641: ['hdl-srv'], 2642: ['tragic'], 2643: ['gte-samp'], 2644: ['travsoft-ipx-t'], 2645: ['novell-ipx-cmd'], 2646: ['and-lm'], 2647: ['syncserver'], 2648: ['upsnotifyprot'], 2649: ['vpsipport'], 2650: ['eristwoguns'], 2651: ['ebinsite'], 2652: ['interpathpanel'], 2653: ['sonus'], 2654: ['corel-vncadmin'], 2655: ['unglue'], 2656: ['kana'], 2657: ['sns-dispatcher'], 2658: ['sns-admin'], 2659: ['sns-query'], 2660: ['gcmonitor'], 2661: ['olhost'], 2662: ['bintec-capi'], 2663: ['bintec-tapi'], 2664: ['patrol-mq-gm'], 2665: ['patrol-mq-nm'], 2666: ['extensis'], 2667: ['alarm-clock-s'], 2668: ['alarm-clock-c'], 2669: ['toad'], 2670: ['tve-announce'], 2671: ['newlixreg'], 2672: ['nhserver'], 2673: ['firstcall42'], 2674: ['ewnn'], 2675: ['ttc-etap'], 2676: ['simslink'], 2677: ['gadgetgate1way'], 2678: ['gadgetgate2way'], 2679: ['syncserverssl'], 2680: ['pxc-sapxom'], 2681: ['mpnjsomb'], 2683: ['ncdloadbalance'], 2684: ['mpnjsosv'], 2685: ['mpnjsocl'], 2686: ['mpnjsomg'], 2687: ['pq-lic-mgmt'], 2688: ['md-cg-http'], 2689: ['fastlynx'], 2690: ['hp-nnm-data'], 2691: ['itinternet'], 2692: ['admins-lms'], 2694: ['pwrsevent'], 2695: ['vspread'], 2696: ['unifyadmin'], 2697: ['oce-snmp-trap'], 2698: ['mck-ivpip'], 2699: ['csoft-plusclnt'], 2700: ['tqdata'], 2701: ['sms-rcinfo'], 2702: ['sms-xfer'], 2703: ['sms-chat'], 2704: ['sms-remctrl'], 2705: ['sds-admin'], 2706: ['ncdmirroring'], 2707: ['emcsymapiport'], 2708: ['banyan-net'], 2709: ['supermon'], 2710: ['sso-service'], 2711: ['sso-control'], 2712: ['aocp'], 2713: ['raventbs'], 2714: ['raventdm'], 2715: ['hpstgmgr2'], 2716: ['inova-ip-disco'], 2717: ['pn-requester'], 2718: ['pn-requester2'], 2719: ['scan-change'], 2720: ['wkars'], 2721: ['smart-diagnose'], 2722: ['proactivesrvr'], 2723: ['watchdog-nt'], 2724: ['qotps'], 2725: ['msolap-ptp2'], 2726: ['tams'], 2727: ['mgcp-callagent'], 2728: ['sqdr'], 2729: ['tcim-control'], 2730: ['nec-raidplus'], 2731: ['fyre-messanger'], 2732: ['g5m'], 2733: ['signet-ctf'], 2734: ['ccs-software'], 2735: ['netiq-mc'], 2736: ['radwiz-nms-srv'], 2737: ['srp-feedback'], 2738: ['ndl-tcp-ois-gw'], 2739: ['tn-timing'], 2740: ['alarm'], 2741: ['tsb'], 2742: ['tsb2'], 2743: ['murx'], 2744: ['honyaku'], 2745: ['urbisnet'], 2746: ['cpudpencap'], 2747: ['fjippol-swrly'], 2748: ['fjippol-polsvr'], 2749: ['fjippol-cnsl'], 2750: ['fjippol-port1'], 2751: ['fjippol-port2'], 2752: ['rsisysaccess'], 2753: ['de-spot'], 2754: ['apollo-cc'], 2755: ['expresspay'], 2756: ['simplement-tie'], 2757: ['cnrp'], 2758: ['apollo-status'], 2759: ['apollo-gms'], 2760: ['sabams'], 2761: ['dicom-iscl'], 2762: ['dicom-tls'], 2763: ['desktop-dna'], 2764: ['data-insurance'], 2765: ['qip-audup'], 2766: ['compaq-scp'], 2767: ['uadtc'], 2768: ['uacs'], 2769: ['exce'], 2770: ['veronica'], 2771: ['vergencecm'], 2772: ['auris'], 2773: ['rbakcup1'], 2774: ['rbakcup2'], 2775: ['smpp'], 2776: ['ridgeway1'], 2777: ['ridgeway2'], 2778: ['gwen-sonya'], 2779: ['lbc-sync'], 2780: ['lbc-control'], 2781: ['whosells'], 2782: ['everydayrc'], 2783: ['aises'], 2784: ['www-dev'], 2785: ['aic-np'], 2786: ['aic-oncrpc'], 2787: ['piccolo'], 2788: ['fryeserv'], 2789: ['media-agent'], 2790: ['plgproxy'], 2791: ['mtport-regist'], 2792: ['f5-globalsite'], 2793: ['initlsmsad'], 2795: ['livestats'], 2796: ['ac-tech'], 2797: ['esp-encap'], 2798: ['tmesis-upshot'], 2799: ['icon-discover'], 2800: ['acc-raid'], 2801: ['igcp'], 2802: ['veritas-tcp1'], 2803: ['btprjctrl'], 2804: ['dvr-esm'], 2805: ['wta-wsp-s'], 2806: ['cspuni'], 2807: ['cspmulti'], 2808: ['j-lan-p'], 2809: ['corbaloc'], 2810: ['netsteward'], 2811: ['gsiftp'], 2812: ['atmtcp'], 2813: ['llm-pass'], 2814: ['llm-csv'], 2815: ['lbc-measure'], 2816: ['lbc-watchdog'], 2817: ['nmsigport'], 2818: ['rmlnk'], 2819: ['fc-faultnotify'], 2820: ['univision'], 2821: ['vrts-at-port'], 2822: ['ka0wuc'], 2823: ['cqg-netlan'], 2824: ['cqg-netlan-1'], 2826: ['slc-systemlog'], 2827: ['slc-ctrlrloops'], 2828: ['itm-lm'], 2829: ['silkp1'], 2830: ['silkp2'], 2831: ['silkp3'], 2832: ['silkp4'], 2833: ['glishd'], 2834: ['evtp'], 2835: ['evtp-data'], 2836: ['catalyst'], 2837: ['repliweb'], 2838: ['starbot'], 2839: ['nmsigport'], 2840: ['l3-exprt'], 2841: ['l3-ranger'], 2842: ['l3-hawk'], 2843: ['pdnet'], 2844: ['bpcp-poll'], 2845: ['bpcp-trap'], 2846: ['aimpp-hello'], 2847: ['aimpp-port-req'], 2848: ['amt-blc-port'], 2849: ['fxp'], 2850: ['metaconsole'], 2851: ['webemshttp'], 2852: ['bears-01'], 2853: ['ispipes'], 2854: ['infomover'], 2855: ['msrp'], 2856: ['cesdinv'], 2857: ['simctlp'], 2858: ['ecnp'], 2859: ['activememory'], 2860: ['dialpad-voice1'], 2861: ['dialpad-voice2'], 2862: ['ttg-protocol'], 2863: ['sonardata'], 2864: ['astromed-main'], 2865: ['pit-vpn'], 2866: ['iwlistener'], 2867: ['esps-portal'], 2868: ['npep-messaging'], 2869: ['icslap'], 2870: ['daishi'], 2871: ['msi-selectplay'], 2872: ['radix'], 2874: ['dxmessagebase1'], 2875: ['dxmessagebase2'], 2876: ['sps-tunnel'], 2877: ['bluelance'], 2878: ['aap'], 2879: ['ucentric-ds'], 2880: ['synapse'], 2881: ['ndsp'], 2882: ['ndtp'], 2883: ['ndnp'], 2884: ['flashmsg'], 2885: ['topflow'], 2886: ['responselogic'], 2887: ['aironetddp'], 2888: ['spcsdlobby'], 2889: ['rsom'], 2890: ['cspclmulti'], 2891: ['cinegrfx-elmd'], 2892: ['snifferdata'], 2893: ['vseconnector'], 2894: ['abacus-remote'], 2895: ['natuslink'], 2896: ['ecovisiong6-1'], 2897: ['citrix-rtmp'], 2898: ['appliance-cfg'], 2899: ['powergemplus'], 2900: ['quicksuite'], 2901: ['allstorcns'], 2902: ['netaspi'], 2903: ['suitcase'], 2904: ['m2ua'], 2905: ['m3ua'], 2906: ['caller9'], 2907: ['webmethods-b2b'], 2908: ['mao'], 2909: ['funk-dialout'], 2910: ['tdaccess'], 2911: ['blockade'], 2912: ['epicon'], 2913: ['boosterware'], 2914: ['gamelobby'], 2915: ['tksocket'], 2916: ['elvin-server'], 2917: ['elvin-client'], 2918: ['kastenchasepad'], 2919: ['roboer'], 2920: ['roboeda'], 2921: ['cesdcdman'], 2922: ['cesdcdtrn'], 2923: ['wta-wsp-wtp-s'], 2924: ['precise-vip'], 2926: ['mobile-file-dl'], 2927: ['unimobilectrl'], 2928: ['redstone-cpss'], 2929: ['amx-webadmin'], 2930: ['amx-weblinx'], 2931: ['circle-x'], 2932: ['incp'], 2933: ['4-tieropmgw'], 2934: ['4-tieropmcli'], 2935: ['qtp'], 2936: ['otpatch'], 2937: ['pnaconsult-lm'], 2938: ['sm-pas-1'], 2939: ['sm-pas-2'], 2940: ['sm-pas-3'], 2941: ['sm-pas-4'], 2942: ['sm-pas-5'], 2943: ['ttnrepository'], 2944: ['megaco-h248'], 2945: ['h248-binary'], 2946: ['fjsvmpor'], 2947: ['gpsd'], 2948: ['wap-push'], 2949: ['wap-pushsecure'], 2950: ['esip'], 2951: ['ottp'], 2952: ['mpfwsas'], 2953: ['ovalarmsrv'], 2954: ['ovalarmsrv-cmd'], 2955: ['csnotify'], 2956: ['ovrimosdbman'], 2957: ['jmact5'], 2958: ['jmact6'], 2959: ['rmopagt'], 2960: ['dfoxserver'], 2961: ['boldsoft-lm'], 2962: ['iph-policy-cli'], 2963: ['iph-policy-adm'], 2964: ['bullant-srap'], 2965: ['bullant-rap'], 2966: ['idp-infotrieve'], 2967: ['ssc-agent'], 2968: ['enpp'], 2969: ['essp'], 2970: ['index-net'], 2971: ['netclip'], 2972: ['pmsm-webrctl'], 2973: ['svnetworks'], 2974: ['signal'], 2975: ['fjmpcm'], 2976: ['cns-srv-port'], 2977: ['ttc-etap-ns'], 2978: ['ttc-etap-ds'], 2979: ['h263-video'], 2980: ['wimd'], 2981: ['mylxamport'], 2982: ['iwb-whiteboard'], 2983: ['netplan'], 2984: ['hpidsadmin'], 2985: ['hpidsagent'], 2986: ['stonefalls'], 2987: ['identify'], 2988: ['hippad'], 2989: ['zarkov'], 2990: ['boscap'], 2991: ['wkstn-mon'], 2992: ['avenyo'], 2993: ['veritas-vis1'], 2994: ['veritas-vis2'], 2995: ['idrs'], 2996: ['vsixml'], 2997: ['rebol'], 2998: ['realsecure'], 2999: ['remoteware-un'], 3000: ['hbci', 'remoteware-cl'], 3001: ['origo-native'], 3002: ['exlm-agent', 'remoteware-srv'], 3003: ['cgms'], 3004: ['csoftragent'], 3005: ['geniuslm'], 3006: ['ii-admin'], 3007: ['lotusmtap'], 3008: ['midnight-tech'], 3009: ['pxc-ntfy'], 3010: ['gw'], 3011: ['trusted-web'], 3012: ['twsdss'], 3013: ['gilatskysurfer'], 3014: ['broker-service'], 3015: ['nati-dstp'], 3016: ['notify-srvr'], 3017: ['event-listener'], 3018: ['srvc-registry'], 3019: ['resource-mgr'], 3020: ['cifs'], 3021: ['agriserver'], 3022: ['csregagent'], 3023: ['magicnotes'], 3024: ['nds-sso'], 3025: ['arepa-raft'], 3026: ['agri-gateway'], 3027: ['liebdevmgmt-c'], 3028: ['liebdevmgmt-dm'], 3029: ['liebdevmgmt-a'], 3030: ['arepa-cas'], 3031: ['eppc'], 3032: ['redwood-chat'], 3033: ['pdb'], 3034: ['osmosis-aeea'], 3035: ['fjsv-gssagt'], 3036: ['hagel-dump'], 3037: ['hp-san-mgmt'], 3038: ['santak-ups'], 3039: ['cogitate'], 3040: ['tomato-springs'], 3041: ['di-traceware'], 3042: ['journee'], 3043: ['brp'], 3044: ['epp'], 3045: ['responsenet'], 3046: ['di-ase'], 3047: ['hlserver'], 3048: ['pctrader'], 3049: ['nsws'], 3050: ['gds-db'], 3051: ['galaxy-server'], 3052: ['apc-3052'], 3053: ['dsom-server'], 3054: ['amt-cnf-prot'], 3055: ['policyserver'], 3056: ['cdl-server'], 3057: ['goahead-fldup'], 3058: ['videobeans'], 3059: ['qsoft'], 3060: ['interserver'], 3061: ['cautcpd'], 3062: ['ncacn-ip-tcp'], 3063: ['ncadg-ip-udp'], 3064: ['rprt'], 3065: ['slinterbase'], 3066: ['netattachsdmp'], 3067: ['fjhpjp'], 3068: ['ls3bcast'], 3069: ['ls3'], 3070: ['mgxswitch'], 3071: ['csd-mgmt-port'], 3072: ['csd-monitor'], 3073: ['vcrp'], 3074: ['xbox'], 3075: ['orbix-locator'], 3076: ['orbix-config'], 3077: ['orbix-loc-ssl'], 3078: ['orbix-cfg-ssl'], 3079: ['lv-frontpanel'], 3080: ['stm-pproc'], 3081: ['tl1-lv'], 3082: ['tl1-raw'], 3083: ['tl1-telnet'], 3084: ['itm-mccs'], 3085: ['pcihreq'], 3086: ['jdl-dbkitchen'], 3087: ['asoki-sma'], 3088: ['xdtp'], 3089: ['ptk-alink'], 3090: ['stss'], 3091: ['1ci-smcs'], 3093: ['rapidmq-center'], 3094: ['rapidmq-reg'], 3095: ['panasas'], 3096: ['ndl-aps'], 3098: ['umm-port'], 3099: ['chmd'], 3100: ['opcon-xps'], 3101: ['hp-pxpib'], 3102: ['slslavemon'], 3103: ['autocuesmi'], 3104: ['autocuelog'], 3105: ['cardbox'], 3106: ['cardbox-http'], 3107: ['business'], 3108: ['geolocate'], 3109: ['personnel'], 3110: ['sim-control'], 3111: ['wsynch'], 3112: ['ksysguard'], 3113: ['cs-auth-svr'], 3114: ['ccmad'], 3115: ['mctet-master'], 3116: ['mctet-gateway'], 3117: ['mctet-jserv'], 3118: ['pkagent'], 3119: ['d2000kernel'], 3120: ['d2000webserver'], 3121: ['pcmk-remote'], 3122: ['vtr-emulator'], 3123: ['edix'], 3124: ['beacon-port'], 3125: ['a13-an'], 3127: ['ctx-bridge'], 3128: ['ndl-aas'], 3129: ['netport-id'], 3130: ['icpv2'], 3131: ['netbookmark'], 3132: ['ms-rule-engine'], 3133: ['prism-deploy'], 3134: ['ecp'], 3135: ['peerbook-port'], 3136: ['grubd'], 3137: ['rtnt-1'], 3138: ['rtnt-2'], 3139: ['incognitorv'], 3140: ['ariliamulti'], 3141: ['vmodem'], 3142: ['rdc-wh-eos'], 3143: ['seaview'], 3144: ['tarantella'], 3145: ['csi-lfap'], 3146: ['bears-02'], 3147: ['rfio'], 3148: ['nm-game-admin'], 3149: ['nm-game-server'], 3150: ['nm-asses-admin'], 3151: ['nm-assessor'], 3152: ['feitianrockey'], 3153: ['s8-client-port'], 3154: ['ccmrmi'], 3155: ['jpegmpeg'], 3156: ['indura'], 3157: ['e3consultants'], 3158: ['stvp'], 3159: ['navegaweb-port'], 3160: ['tip-app-server'], 3161: ['doc1lm'], 3162: ['sflm'], 3163: ['res-sap'], 3164: ['imprs'], 3165: ['newgenpay'], 3166: ['sossecollector'], 3167: ['nowcontact'], 3168: ['poweronnud'], 3169: ['serverview-as'], 3170: ['serverview-asn'], 3171: ['serverview-gf'], 3172: ['serverview-rm'], 3173: ['serverview-icc'], 3174: ['armi-server'], 3175: ['t1-e1-over-ip'], 3176: ['ars-master'], 3177: ['phonex-port'], 3178: ['radclientport'], 3179: ['h2gf-w-2m'], 3180: ['mc-brk-srv'], 3181: ['bmcpatrolagent'], 3182: ['bmcpatrolrnvu'], 3183: ['cops-tls'], 3184: ['apogeex-port'], 3185: ['smpppd'], 3186: ['iiw-port'], 3187: ['odi-port'], 3188: ['brcm-comm-port'], 3189: ['pcle-infex'], 3190: ['csvr-proxy'], 3191: ['csvr-sslproxy'], 3192: ['firemonrcc'], 3193: ['spandataport'], 3194: ['magbind'], 3195: ['ncu-1'], 3196: ['ncu-2'], 3197: ['embrace-dp-s'], 3198: ['embrace-dp-c'], 3199: ['dmod-workspace'], 3200: ['tick-port'], 3201: ['cpq-tasksmart'], 3202: ['intraintra'], 3203: ['netwatcher-mon'], 3204: ['netwatcher-db'], 3205: ['isns'], 3206: ['ironmail'], 3207: ['vx-auth-port'], 3208: ['pfu-prcallback'], 3209: ['netwkpathengine'], 3210: ['flamenco-proxy'], 3211: ['avsecuremgmt'], 3212: ['surveyinst'], 3213: ['neon24x7'], 3214: ['jmq-daemon-1'], 3215: ['jmq-daemon-2'], 3216: ['ferrari-foam'], 3217: ['unite'], 3218: ['smartpackets'], 3219: ['wms-messenger'], 3220: ['xnm-ssl'], 3221: ['xnm-clear-text'], 3222: ['glbp'], 3223: ['digivote'], 3224: ['aes-discovery'], 3225: ['fcip-port'], 3226: ['isi-irp'], 3227: ['dwnmshttp'], 3228: ['dwmsgserver'], 3229: ['global-cd-port'], 3230: ['sftdst-port'], 3231: ['vidigo'], 3232: ['mdtp'], 3233: ['whisker'], 3234: ['alchemy'], 3235: ['mdap-port'], 3236: ['apparenet-ts'], 3237: ['apparenet-tps'], 3238: ['apparenet-as'], 3239: ['apparenet-ui'], 3240: ['triomotion'], 3241: ['sysorb'], 3242: ['sdp-id-port'], 3243: ['timelot'], 3244: ['onesaf'], 3245: ['vieo-fe'], 3246: ['dvt-system'], 3247: ['dvt-data'], 3248: ['procos-lm'], 3249: ['ssp'], 3250: ['hicp'], 3251: ['sysscanner'], 3252: ['dhe'], 3253: ['pda-data'], 3254: ['pda-sys'], 3255: ['semaphore'], 3256: ['cpqrpm-agent'], 3257: ['cpqrpm-server'], 3258: ['ivecon-port'], 3259: ['epncdp2'], 3260: ['iscsi-target'], 3261: ['winshadow'], 3262: ['necp'], 3263: ['ecolor-imager'], 3264: ['ccmail'], 3265: ['altav-tunnel'], 3266: ['ns-cfg-server'], 3267: ['ibm-dial-out'], 3268: ['msft-gc'], 3269: ['msft-gc-ssl'], 3270: ['verismart'], 3271: ['csoft-prev'], 3272: ['user-manager'], 3273: ['sxmp'], 3274: ['ordinox-server'], 3275: ['samd'], 3276: ['maxim-asics'], 3277: ['awg-proxy'], 3278: ['lkcmserver'], 3279: ['admind'], 3280: ['vs-server'], 3281: ['sysopt'], 3282: ['datusorb'], 3283: ['apple remote desktop (net assistant)'], 3284: ['4talk'], 3285: ['plato'], 3286: ['e-net'], 3287: ['directvdata'], 3288: ['cops'], 3289: ['enpc'], 3290: ['caps-lm'], 3291: ['sah-lm'], 3292: ['cart-o-rama'], 3293: ['fg-fps'], 3294: ['fg-gip'], 3295: ['dyniplookup'], 3296: ['rib-slm'], 3297: ['cytel-lm'], 3298: ['deskview'], 3299: ['pdrncs'], 3302: ['mcs-fastmail'], 3303: ['opsession-clnt'], 3304: ['opsession-srvr'], 3305: ['odette-ftp'], 3306: ['mysql'], 3307: ['opsession-prxy'], 3308: ['tns-server'], 3309: ['tns-adv'], 3310: ['dyna-access'], 3311: ['mcns-tel-ret'], 3312: ['appman-server'], 3313: ['uorb'], 3314: ['uohost'], 3315: ['cdid'], 3316: ['aicc-cmi'], 3317: ['vsaiport'], 3318: ['ssrip'], 3319: ['sdt-lmd'], 3320: ['officelink2000'], 3321: ['vnsstr'], 3326: ['sftu'], 3327: ['bbars'], 3328: ['egptlm'], 3329: ['hp-device-disc'], 3330: ['mcs-calypsoicf'], 3331: ['mcs-messaging'], 3332: ['mcs-mailsvr'], 3333: ['dec-notes'], 3334: ['directv-web'], 3335: ['directv-soft'], 3336: ['directv-tick'], 3337: ['directv-catlg'], 3338: ['anet-b'], 3339: ['anet-l'], 3340: ['anet-m'], 3341: ['anet-h'], 3342: ['webtie'], 3343: ['ms-cluster-net'], 3344: ['bnt-manager'], 3345: ['influence'], 3346: ['trnsprntproxy'], 3347: ['phoenix-rpc'], 3348: ['pangolin-laser'], 3349: ['chevinservices'], 3350: ['findviatv'], 3351: ['btrieve'], 3352: ['ssql'], 3353: ['fatpipe'], 3354: ['suitjd'], 3355: ['ordinox-dbase'], 3356: ['upnotifyps'], 3357: ['adtech-test'], 3358: ['mpsysrmsvr'], 3359: ['wg-netforce'], 3360: ['kv-server'], 3361: ['kv-agent'], 3362: ['dj-ilm'], 3363: ['nati-vi-server'], 3364: ['creativeserver'], 3365: ['contentserver'], 3366: ['creativepartnr'], 3372: ['tip2'], 3373: ['lavenir-lm'], 3374: ['cluster-disc'], 3375: ['vsnm-agent'], 3376: ['cdbroker'], 3377: ['cogsys-lm'], 3378: ['wsicopy'], 3379: ['socorfs'], 3380: ['sns-channels'], 3381: ['geneous'], 3382: ['fujitsu-neat'], 3383: ['esp-lm'], 3384: ['hp-clic'], 3385: ['qnxnetman'], 3386: ['gprs-data'], 3387: ['backroomnet'], 3388: ['cbserver'], 3389: ['ms-wbt-server'], 3390: ['dsc'], 3391: ['savant'], 3392: ['efi-lm'], 3393: ['d2k-tapestry1'], 3394: ['d2k-tapestry2'], 3395: ['dyna-lm'], 3396: ['printer-agent'], 3397: ['cloanto-lm'], 3398: ['mercantile'], 3399: ['csms'], 3400: ['csms2'], 3401: ['filecast'], 3402: ['fxaengine-net'], 3405: ['nokia-ann-ch1'], 3406: ['nokia-ann-ch2'], 3407: ['ldap-admin'], 3408: ['besapi'], 3409: ['networklens'], 3410: ['networklenss'], 3411: ['biolink-auth'], 3412: ['xmlblaster'], 3413: ['svnet'], 3414: ['wip-port'], 3415: ['bcinameservice'], 3416: ['commandport'], 3417: ['csvr'], 3418: ['rnmap'], 3419: ['softaudit'], 3420: ['ifcp-port'], 3421: ['bmap'], 3422: ['rusb-sys-port'], 3423: ['xtrm'], 3424: ['xtrms'], 3425: ['agps-port'], 3426: ['arkivio'], 3427: ['websphere-snmp'], 3428: ['twcss'], 3429: ['gcsp'], 3430: ['ssdispatch'], 3431: ['ndl-als'], 3432: ['osdcp'], 3433: ['opnet-smp'], 3434: ['opencm'], 3435: ['pacom'], 3436: ['gc-config'], 3437: ['autocueds'], 3438: ['spiral-admin'], 3439: ['hri-port'], 3440: ['ans-console'], 3441: ['connect-client'], 3442: ['connect-server'], 3443: ['ov-nnm-websrv'], 3444: ['denali-server'], 3445: ['monp'], 3446: ['3comfaxrpc'], 3447: ['directnet'], 3448: ['dnc-port'], 3449: ['hotu-chat'], 3450: ['castorproxy'], 3451: ['asam'], 3452: ['sabp-signal'], 3453: ['pscupd'], 3454: ['mira'], 3455: ['prsvp'], 3456: ['vat'], 3457: ['vat-control'], 3458: ['d3winosfi'], 3459: ['integral'], 3460: ['edm-manager'], 3461: ['edm-stager'], 3462: ['edm-std-notify'], 3463: ['edm-adm-notify'], 3464: ['edm-mgr-sync'], 3465: ['edm-mgr-cntrl'], 3466: ['workflow'], 3467: ['rcst'], 3468: ['ttcmremotectrl'], 3469: ['pluribus'], 3470: ['jt400'], 3471: ['jt400-ssl'], 3472: ['jaugsremotec-1'], 3473: ['jaugsremotec-2'], 3474: ['ttntspauto'], 3475: ['genisar-port'], 3476: ['nppmp'], 3477: ['ecomm'], 3478: ['stun', 'stun-behavior', 'turn'], 3479: ['twrpc'], 3480: ['plethora'], 3481: ['cleanerliverc'], 3482: ['vulture'], 3483: ['slim-devices'], 3484: ['gbs-stp'], 3485: ['celatalk'], 3486: ['ifsf-hb-port'], 3487: ['ltctcp'], 3488: ['fs-rh-srv'], 3489: ['dtp-dia'], 3490: ['colubris'], 3491: ['swr-port'], 3492: ['tvdumtray-port'], 3493: ['nut'], 3494: ['ibm3494'], 3495: ['seclayer-tcp'], 3496: ['seclayer-tls'], 3497: ['ipether232port'], 3498: ['dashpas-port'], 3499: ['sccip-media'], 3500: ['rtmp-port'], 3501: ['isoft-p2p'], 3502: ['avinstalldisc'], 3503: ['lsp-ping'], 3504: ['ironstorm'], 3505: ['ccmcomm'], 3506: ['apc-3506'], 3507: ['nesh-broker'], 3508: ['interactionweb'], 3509: ['vt-ssl'], 3510: ['xss-port'], 3511: ['webmail-2'], 3512: ['aztec'], 3513: ['arcpd'], 3514: ['must-p2p'], 3515: ['must-backplane'], 3516: ['smartcard-port'], 3517: ['802-11-iapp'], 3518: ['artifact-msg'], 3519: ['nvmsgd'], 3520: ['galileolog'], 3521: ['mc3ss'], 3522: ['nssocketport'], 3523: ['odeumservlink'], 3524: ['ecmport'], 3525: ['eisport'], 3526: ['starquiz-port'], 3527: ['beserver-msg-q'], 3528: ['jboss-iiop'], 3529: ['jboss-iiop-ssl'], 3530: ['gf'], 3531: ['joltid'], 3532: ['raven-rmp'], 3533: ['raven-rdp'], 3534: ['urld-port'], 3535: ['ms-la'], 3536: ['snac'], 3537: ['ni-visa-remote'], 3538: ['ibm-diradm'], 3539: ['ibm-diradm-ssl'], 3540: ['pnrp-port'], 3541: ['voispeed-port'], 3542: ['hacl-monitor'], 3543: ['qftest-lookup'], 3544: ['teredo'], 3545: ['camac'], 3547: ['symantec-sim'], 3548: ['interworld'], 3549: ['tellumat-nms'], 3550: ['ssmpp'], 3551: ['apcupsd'], 3552: ['taserver'], 3553: ['rbr-discovery'], 3554: ['questnotify'], 3555: ['razor'], 3556: ['sky-transport'], 3557: ['personalos-001'], 3558: ['mcp-port'], 3559: ['cctv-port'], 3560: ['iniserve-port'], 3561: ['bmc-onekey'], 3562: ['sdbproxy'], 3563: ['watcomdebug'], 3564: ['esimport'], 3565: ['m2pa'], 3566: ['quest-data-hub'], 3567: ['enc-eps'], 3568: ['enc-tunnel-sec'], 3569: ['mbg-ctrl'], 3570: ['mccwebsvr-port'], 3571: ['megardsvr-port'], 3572: ['megaregsvrport'], 3573: ['tag-ups-1'], 3574: ['dmaf-server'], 3575: ['ccm-port'], 3576: ['cmc-port'], 3577: ['config-port'], 3578: ['data-port'], 3579: ['ttat3lb'], 3580: ['nati-svrloc'], 3581: ['kfxaclicensing'], 3582: ['press'], 3583: ['canex-watch'], 3584: ['u-dbap'], 3585: ['emprise-lls'], 3586: ['emprise-lsc'], 3587: ['p2pgroup'], 3588: ['sentinel'], 3589: ['isomair'], 3590: ['wv-csp-sms'], 3591: ['gtrack-server'], 3592: ['gtrack-ne'], 3593: ['bpmd'], 3594: ['mediaspace'], 3595: ['shareapp'], 3596: ['iw-mmogame'], 3597: ['a14'], 3598: ['a15'], 3599: ['quasar-server'], 3600: ['trap-daemon'], 3601: ['visinet-gui'], 3602: ['infiniswitchcl'], 3603: ['int-rcv-cntrl'], 3604: ['bmc-jmx-port'], 3605: ['comcam-io'], 3606: ['splitlock'], 3607: ['precise-i3'], 3608: ['trendchip-dcp'], 3609: ['cpdi-pidas-cm'], 3610: ['echonet'], 3611: ['six-degrees'], 3612: ['hp-dataprotect'], 3613: ['alaris-disc'], 3614: ['sigma-port'], 3615: ['start-network'], 3616: ['cd3o-protocol'], 3617: ['sharp-server'], 3618: ['aairnet-1'], 3619: ['aairnet-2'], 3620: ['ep-pcp'], 3621: ['ep-nsp'], 3622: ['ff-lr-port'], 3623: ['haipe-discover'], 3624: ['dist-upgrade'], 3625: ['volley'], 3626: ['bvcdaemon-port'], 3627: ['jamserverport'], 3628: ['ept-machine'], 3629: ['escvpnet'], 3630: ['cs-remote-db'], 3631: ['cs-services'], 3632: ['distcc'], 3633: ['wacp'], 3634: ['hlibmgr'], 3635: ['sdo'], 3636: ['servistaitsm'], 3637: ['scservp'], 3638: ['ehp-backup'], 3639: ['xap-ha'], 3640: ['netplay-port1'], 3641: ['netplay-port2'], 3642: ['juxml-port'], 3643: ['audiojuggler'], 3644: ['ssowatch'], 3645: ['cyc'], 3646: ['xss-srv-port'], 3647: ['splitlock-gw'], 3648: ['fjcp'], 3649: ['nmmp'], 3650: ['prismiq-plugin'], 3651: ['xrpc-registry'], 3652: ['vxcrnbuport'], 3653: ['tsp'], 3654: ['vaprtm'], 3655: ['abatemgr'], 3656: ['abatjss'], 3657: ['immedianet-bcn'], 3658: ['ps-ams'], 3659: ['apple-sasl'], 3660: ['can-nds-ssl'], 3661: ['can-ferret-ssl'], 3662: ['pserver'], 3663: ['dtp'], 3664: ['ups-engine'], 3665: ['ent-engine'], 3666: ['eserver-pap'], 3667: ['infoexch'], 3668: ['dell-rm-port'], 3669: ['casanswmgmt'], 3670: ['smile'], 3671: ['efcp'], 3672: ['lispworks-orb'], 3673: ['mediavault-gui'], 3674: ['wininstall-ipc'], 3675: ['calltrax'], 3676: ['va-pacbase'], 3677: ['roverlog'], 3678: ['ipr-dglt'], 3679: ['escale (newton dock)'], 3680: ['npds-tracker'], 3681: ['bts-x73'], 3682: ['cas-mapi'], 3683: ['bmc-ea'], 3684: ['faxstfx-port'], 3685: ['dsx-agent'], 3686: ['tnmpv2'], 3687: ['simple-push'], 3688: ['simple-push-s'], 3689: ['daap'], 3690: ['svn'], 3691: ['magaya-network'], 3692: ['intelsync'], 3695: ['bmc-data-coll'], 3696: ['telnetcpcd'], 3697: ['nw-license'], 3698: ['sagectlpanel'], 3699: ['kpn-icw'], 3700: ['lrs-paging'], 3701: ['netcelera'], 3702: ['ws-discovery'], 3703: ['adobeserver-3'], 3704: ['adobeserver-4'], 3705: ['adobeserver-5'], 3706: ['rt-event'], 3707: ['rt-event-s'], 3708: ['sun-as-iiops'], 3709: ['ca-idms'], 3710: ['portgate-auth'], 3711: ['edb-server2'], 3712: ['sentinel-ent'], 3713: ['tftps'], 3714: ['delos-dms'], 3715: ['anoto-rendezv'], 3716: ['wv-csp-sms-cir'], 3717: ['wv-csp-udp-cir'], 3718: ['opus-services'], 3719: ['itelserverport'], 3720: ['ufastro-instr'], 3721: ['xsync'], 3722: ['xserveraid'], 3723: ['sychrond'], 3724: ['blizwow'], 3725: ['na-er-tip'], 3726: ['array-manager'], 3727: ['e-mdu'], 3728: ['e-woa'], 3729: ['fksp-audit'], 3730: ['client-ctrl'], 3731: ['smap'], 3732: ['m-wnn'], 3733: ['multip-msg'], 3734: ['synel-data'], 3735: ['pwdis'], 3736: ['rs-rmi'], 3737: ['xpanel'], 3738: ['versatalk'], 3739: ['launchbird-lm'], 3740: ['heartbeat'], 3741: ['wysdma'], 3742: ['cst-port'], 3743: ['ipcs-command'], 3744: ['sasg'], 3745: ['gw-call-port'], 3746: ['linktest'], 3747: ['linktest-s'], 3748: ['webdata'], 3749: ['cimtrak'], 3750: ['cbos-ip-port'], 3751: ['gprs-cube'], 3752: ['vipremoteagent'], 3753: ['nattyserver'], 3754: ['timestenbroker'], 3755: ['sas-remote-hlp'], 3756: ['canon-capt'], 3757: ['grf-port'], 3758: ['apw-registry'], 3759: ['exapt-lmgr'], 3760: ['adtempusclient'], 3761: ['gsakmp'], 3762: ['gbs-smp'], 3763: ['xo-wave'], 3764: ['mni-prot-rout'], 3765: ['rtraceroute'], 3767: ['listmgr-port'], 3768: ['rblcheckd'], 3769: ['haipe-otnk'], 3770: ['cindycollab'], 3771: ['paging-port'], 3772: ['ctp'], 3773: ['ctdhercules'], 3774: ['zicom'], 3775: ['ispmmgr'], 3776: ['dvcprov-port'], 3777: ['jibe-eb'], 3778: ['c-h-it-port'], 3779: ['cognima'], 3780: ['nnp'], 3781: ['abcvoice-port'], 3782: ['iso-tp0s'], 3783: ['bim-pem'], 3784: ['bfd-control'], 3785: ['bfd-echo'], 3786: ['upstriggervsw'], 3787: ['fintrx'], 3788: ['isrp-port'], 3789: ['remotedeploy'], 3790: ['quickbooksrds'], 3791: ['tvnetworkvideo'], 3792: ['sitewatch'], 3793: ['dcsoftware'], 3794: ['jaus'], 3795: ['myblast'], 3796: ['spw-dialer'], 3797: ['idps'], 3798: ['minilock'], 3799: ['radius-dynauth'], 3800: ['pwgpsi'], 3801: ['ibm-mgr'], 3802: ['vhd'], 3803: ['soniqsync'], 3804: ['iqnet-port'], 3805: ['tcpdataserver'], 3806: ['wsmlb'], 3807: ['spugna'], 3808: ['sun-as-iiops-ca'], 3809: ['apocd'], 3810: ['wlanauth'], 3811: ['amp'], 3812: ['neto-wol-server'], 3813: ['rap-ip'], 3814: ['neto-dcs'], 3815: ['lansurveyorxml'], 3816: ['sunlps-http'], 3817: ['tapeware'], 3818: ['crinis-hb'], 3819: ['epl-slp'], 3820: ['scp'], 3821: ['pmcp'], 3822: ['acp-discovery'], 3823: ['acp-conduit'], 3824: ['acp-policy'], 3825: ['ffserver'], 3826: ['warmux'], 3827: ['netmpi'], 3828: ['neteh'], 3829: ['neteh-ext'], 3830: ['cernsysmgmtagt'], 3831: ['dvapps'], 3832: ['xxnetserver'], 3833: ['aipn-auth'], 3834: ['spectardata'], 3835: ['spectardb'], 3836: ['markem-dcp'], 3837: ['mkm-discovery'], 3838: ['sos'], 3839: ['amx-rms'], 3840: ['flirtmitmir'], 3841: ['zfirm-shiprush3'], 3842: ['nhci'], 3843: ['quest-agent'], 3844: ['rnm'], 3845: ['v-one-spp'], 3846: ['an-pcp'], 3847: ['msfw-control'], 3848: ['item'], 3849: ['spw-dnspreload'], 3850: ['qtms-bootstrap'], 3851: ['spectraport'], 3852: ['sse-app-config'], 3853: ['sscan'], 3854: ['stryker-com'], 3855: ['opentrac'], 3856: ['informer'], 3857: ['trap-port'], 3858: ['trap-port-mom'], 3859: ['nav-port'], 3860: ['sasp'], 3861: ['winshadow-hd'], 3862: ['giga-pocket'], 3863: ['asap-tcp'], 3864: ['asap-tcp-tls'], 3865: ['xpl'], 3866: ['dzdaemon'], 3867: ['dzoglserver'], 3868: ['diameter'], 3869: ['ovsam-mgmt'], 3870: ['ovsam-d-agent'], 3871: ['avocent-adsap'], 3872: ['oem-agent'], 3873: ['fagordnc'], 3874: ['sixxsconfig'], 3875: ['pnbscada'], 3876: ['dl-agent'], 3877: ['xmpcr-interface'], 3878: ['fotogcad'], 3879: ['appss-lm'], 3880: ['igrs'], 3881: ['idac'], 3882: ['msdts1'], 3883: ['vrpn'], 3884: ['softrack-meter'], 3885: ['topflow-ssl'], 3886: ['nei-management'], 3887: ['ciphire-data'], 3888: ['ciphire-serv'], 3889: ['dandv-tester'], 3890: ['ndsconnect'], 3891: ['rtc-pm-port'], 3892: ['pcc-image-port'], 3893: ['cgi-starapi'], 3894: ['syam-agent'], 3895: ['syam-smc'], 3896: ['sdo-tls'], 3897: ['sdo-ssh'], 3898: ['senip'], 3899: ['itv-control'], 3900: ['udt-os'], 3901: ['nimsh'], 3902: ['nimaux'], 3903: ['charsetmgr'], 3904: ['omnilink-port'], 3905: ['mupdate'], 3906: ['topovista-data'], 3907: ['imoguia-port'], 3908: ['hppronetman'], 3909: ['surfcontrolcpa'], 3910: ['prnrequest'], 3911: ['prnstatus'], 3912: ['gbmt-stars'], 3913: ['listcrt-port'], 3914: ['listcrt-port-2'], 3915: ['agcat'], 3916: ['wysdmc'], 3917: ['aftmux'], 3918: ['pktcablemmcops'], 3919: ['hyperip'], 3920: ['exasoftport1'], 3921: ['herodotus-net'], 3922: ['sor-update'], 3923: ['symb-sb-port'], 3924: ['mpl-gprs-port'], 3925: ['zmp'], 3926: ['winport'], 3927: ['natdataservice'], 3928: ['netboot-pxe'], 3929: ['smauth-port'], 3930: ['syam-webserver'], 3931: ['msr-plugin-port'], 3932: ['dyn-site'], 3933: ['plbserve-port'], 3934: ['sunfm-port'], 3935: ['sdp-portmapper'], 3936: ['mailprox'], 3937: ['dvbservdsc'], 3938: ['dbcontrol-agent'], 3939: ['aamp'], 3940: ['xecp-node'], 3941: ['homeportal-web'], 3942: ['srdp'], 3943: ['tig'], 3944: ['sops'], 3945: ['emcads'], 3946: ['backupedge'], 3947: ['ccp'], 3948: ['apdap'], 3949: ['drip'], 3950: ['namemunge'], 3951: ['pwgippfax'], 3952: ['i3-sessionmgr'], 3953: ['xmlink-connect'], 3954: ['adrep'], 3955: ['p2pcommunity'], 3956: ['gvcp'], 3957: ['mqe-broker'], 3958: ['mqe-agent'], 3959: ['treehopper'], 3960: ['bess'], 3961: ['proaxess'], 3962: ['sbi-agent'], 3963: ['thrp'], 3964: ['sasggprs'], 3965: ['ati-ip-to-ncpe'], 3966: ['bflckmgr'], 3967: ['ppsms'], 3968: ['ianywhere-dbns'], 3969: ['landmarks'], 3970: ['lanrevagent'], 3971: ['lanrevserver'], 3972: ['iconp'], 3973: ['progistics'], 3974: ['citysearch'], 3975: ['airshot'], 3976: ['opswagent'], 3977: ['opswmanager'], 3978: ['secure-cfg-svr'], 3979: ['smwan'], 3980: ['acms'], 3981: ['starfish'], 3982: ['eis'], 3983: ['eisp'], 3984: ['mapper-nodemgr'], 3985: ['mapper-mapethd'], 3986: ['mapper-ws-ethd'], 3987: ['centerline'], 3988: ['dcs-config'], 3989: ['bv-queryengine'], 3990: ['bv-is'], 3991: ['bv-smcsrv'], 3992: ['bv-ds'], 3993: ['bv-agent'], 3995: ['iss-mgmt-ssl'], 3996: ['abcsoftware'], 3997: ['agentsease-db'], 3998: ['dnx'], 3999: ['nvcnet'], 4000: ['terabase'], 4001: ['newoak'], 4002: ['pxc-spvr-ft'], 4003: ['pxc-splr-ft'], 4004: ['pxc-roid'], 4005: ['pxc-pin'], 4006: ['pxc-spvr'], 4007: ['pxc-splr'], 4008: ['netcheque'], 4009: ['chimera-hwm'], 4010: ['samsung-unidex'], 4011: ['altserviceboot'], 4012: ['pda-gate'], 4013: ['acl-manager'], 4014: ['taiclock'], 4015: ['talarian-mcast1'], 4016: ['talarian-mcast2'], 4017: ['talarian-mcast3'], 4018: ['talarian-mcast4'], 4019: ['talarian-mcast5'], 4020: ['trap'], 4021: ['nexus-portal'], 4022: ['dnox'], 4023: ['esnm-zoning'], 4024: ['tnp1-port'], 4025: ['partimage'], 4026: ['as-debug'], 4027: ['bxp'], 4028: ['dtserver-port'], 4029: ['ip-qsig'], 4030: ['jdmn-port'], 4031: ['suucp'], 4032: ['vrts-auth-port'], 4033: ['sanavigator'], 4034: ['ubxd'], 4035: ['wap-push-http'], 4036: ['wap-push-https'], 4037: ['ravehd'], 4038: ['fazzt-ptp'], 4039: ['fazzt-admin'], 4040: ['yo-main'], 4041: ['houston'], 4042: ['ldxp'], 4043: ['nirp'], 4044: ['ltp'], 4045: ['npp'], 4046: ['acp-proto'], 4047: ['ctp-state'], 4049: ['wafs'], 4050: ['cisco-wafs'], 4051: ['cppdp'], 4052: ['interact'], 4053: ['ccu-comm-1'], 4054: ['ccu-comm-2'], 4055: ['ccu-comm-3'], 4056: ['lms'], 4057: ['wfm'], 4058: ['kingfisher'], 4059: ['dlms-cosem'], 4060: ['dsmeter-iatc'], 4061: ['ice-location'], 4062: ['ice-slocation'], 4063: ['ice-router'], 4064: ['ice-srouter'], 4065: ['avanti-cdp'], 4066: ['pmas'], 4067: ['idp'], 4068: ['ipfltbcst'], 4069: ['minger'], 4070: ['tripe'], 4071: ['aibkup'], 4072: ['zieto-sock'], 4073: ['irapp'], 4074: ['cequint-cityid'], 4075: ['perimlan'], 4076: ['seraph'], 4078: ['cssp'], 4079: ['santools'], 4080: ['lorica-in'], 4081: ['lorica-in-sec'], 4082: ['lorica-out'], 4083: ['lorica-out-sec'], 4085: ['ezmessagesrv'], 4087: ['applusservice'], 4088: ['npsp'], 4089: ['opencore'], 4090: ['omasgport'], 4091: ['ewinstaller'], 4092: ['ewdgs'], 4093: ['pvxpluscs'], 4094: ['sysrqd'], 4095: ['xtgui'], 4096: ['bre'], 4097: ['patrolview'], 4098: ['drmsfsd'], 4099: ['dpcp'], 4100: ['igo-incognito'], 4101: ['brlp-0'], 4102: ['brlp-1'], 4103: ['brlp-2'], 4104: ['brlp-3'], 4105: ['shofar'], 4106: ['synchronite'], 4107: ['j-ac'], 4108: ['accel'], 4109: ['izm'], 4110: ['g2tag'], 4111: ['xgrid'], 4112: ['apple-vpns-rp'], 4113: ['aipn-reg'], 4114: ['jomamqmonitor'], 4115: ['cds'], 4116: ['smartcard-tls'], 4117: ['hillrserv'], 4118: ['netscript'], 4119: ['assuria-slm'], 4121: ['e-builder'], 4122: ['fprams'], 4123: ['z-wave'], 4124: ['tigv2'], 4125: ['opsview-envoy'], 4126: ['ddrepl'], 4127: ['unikeypro'], 4128: ['nufw'], 4129: ['nuauth'], 4130: ['fronet'], 4131: ['stars'], 4132: ['nuts-dem'], 4133: ['nuts-bootp'], 4134: ['nifty-hmi'], 4135: ['cl-db-attach'], 4136: ['cl-db-request'], 4137: ['cl-db-remote'], 4138: ['nettest'], 4139: ['thrtx'], 4140: ['cedros-fds'], 4141: ['oirtgsvc'], 4142: ['oidocsvc'], 4143: ['oidsr'], 4145: ['vvr-control'], 4146: ['tgcconnect'], 4147: ['vrxpservman'], 4148: ['hhb-handheld'], 4149: ['agslb'], 4150: ['poweralert-nsa'], 4151: ['menandmice-noh'], 4152: ['idig-mux'], 4153: ['mbl-battd'], 4154: ['atlinks'], 4155: ['bzr'], 4156: ['stat-results'], 4157: ['stat-scanner'], 4158: ['stat-cc'], 4159: ['nss'], 4160: ['jini-discovery'], 4161: ['omscontact'], 4162: ['omstopology'], 4163: ['silverpeakpeer'], 4164: ['silverpeakcomm'], 4165: ['altcp'], 4166: ['joost'], 4167: ['ddgn'], 4168: ['pslicser'], 4169: ['iadt'], 4170: ['d-cinema-csp'], 4171: ['ml-svnet'], 4172: ['pcoip'], 4174: ['smcluster'], 4175: ['bccp'], 4176: ['tl-ipcproxy'], 4177: ['wello'], 4178: ['storman'], 4179: ['maxumsp'], 4180: ['httpx'], 4181: ['macbak'], 4182: ['pcptcpservice'], 4183: ['gmmp'], 4184: ['universe-suite'], 4185: ['wcpp'], 4186: ['boxbackupstore'], 4187: ['csc-proxy'], 4188: ['vatata'], 4189: ['pcep'], 4190: ['sieve'], 4192: ['azeti'], 4193: ['pvxplusio'], 4199: ['eims-admin'], 4300: ['corelccam'], 4301: ['d-data'], 4302: ['d-data-control'], 4303: ['srcp'], 4304: ['owserver'], 4305: ['batman'], 4306: ['pinghgl'], 4307: ['visicron-vs'], 4308: ['compx-lockview'], 4309: ['dserver'], 4310: ['mirrtex'], 4311: ['p6ssmc'], 4312: ['pscl-mgt'], 4313: ['perrla'], 4314: ['choiceview-agt'], 4316: ['choiceview-clt'], 4320: ['fdt-rcatp'], 4321: ['rwhois'], 4322: ['trim-event'], 4323: ['trim-ice'], 4324: ['balour'], 4325: ['geognosisman'], 4326: ['geognosis'], 4327: ['jaxer-web'], 4328: ['jaxer-manager'], 4329: ['publiqare-sync'], 4330: ['dey-sapi'], 4340: ['gaia'], 4341: ['lisp-data'], 4342: ['lisp-cons'], 4343: ['unicall'], 4344: ['vinainstall'], 4345: ['m4-network-as'], 4346: ['elanlm'], 4347: ['lansurveyor'], 4348: ['itose'], 4349: ['fsportmap'], 4350: ['net-device'], 4351: ['plcy-net-svcs'], 4352: ['pjlink'], 4353: ['f5-iquery'], 4354: ['qsnet-trans'], 4355: ['qsnet-workst'], 4356: ['qsnet-assist'], 4357: ['qsnet-cond'], 4358: ['qsnet-nucl'], 4359: ['omabcastltkm'], 4360: ['matrix-vnet'], 4368: ['wxbrief'], 4369: ['epmd'], 4370: ['elpro-tunnel'], 4371: ['l2c-control'], 4372: ['l2c-data'], 4373: ['remctl'], 4374: ['psi-ptt'], 4375: ['tolteces'], 4376: ['bip'], 4377: ['cp-spxsvr'], 4378: ['cp-spxdpy'], 4379: ['ctdb'], 4389: ['xandros-cms'], 4390: ['wiegand'], 4391: ['apwi-imserver'], 4392: ['apwi-rxserver'], 4393: ['apwi-rxspooler'], 4395: ['omnivisionesx'], 4396: ['fly'], 4400: ['ds-srv'], 4401: ['ds-srvr'], 4402: ['ds-clnt'], 4403: ['ds-user'], 4404: ['ds-admin'], 4405: ['ds-mail'], 4406: ['ds-slp'], 4407: ['nacagent'], 4408: ['slscc'], 4409: ['netcabinet-com'], 4410: ['itwo-server'], 4411: ['found'], 4425: ['netrockey6'], 4426: ['beacon-port-2'], 4427: ['drizzle'], 4428: ['omviserver'], 4429: ['omviagent'], 4430: ['rsqlserver'], 4431: ['wspipe'], 4432: ['l-acoustics'], 4433: ['vop'], 4442: ['saris'], 4443: ['pharos'], 4444: ['krb524', 'nv-video'], 4445: ['upnotifyp'], 4446: ['n1-fwp'], 4447: ['n1-rmgmt'], 4448: ['asc-slmd'], 4449: ['privatewire'], 4450: ['camp'], 4451: ['ctisystemmsg'], 4452: ['ctiprogramload'], 4453: ['nssalertmgr'], 4454: ['nssagentmgr'], 4455: ['prchat-user'], 4456: ['prchat-server'], 4457: ['prregister'], 4458: ['mcp'], 4484: ['hpssmgmt'], 4485: ['assyst-dr'], 4486: ['icms'], 4487: ['prex-tcp'], 4488: ['awacs-ice'], 4500: ['ipsec-nat-t'], 4535: ['ehs'], 4536: ['ehs-ssl'], 4537: ['wssauthsvc'], 4538: ['swx-gate'], 4545: ['worldscores'], 4546: ['sf-lm'], 4547: ['lanner-lm'], 4548: ['synchromesh'], 4549: ['aegate'], 4550: ['gds-adppiw-db'], 4551: ['ieee-mih'], 4552: ['menandmice-mon'], 4553: ['icshostsvc'], 4554: ['msfrs'], 4555: ['rsip'], 4556: ['dtn-bundle-tcp'], 4559: ['hylafax'], 4566: ['kwtc'], 4567: ['tram'], 4568: ['bmc-reporting'], 4569: ['iax'], 4570: ['deploymentmap'], 4590: ['rid'], 4591: ['l3t-at-an'], 4593: ['ipt-anri-anri'], 4594: ['ias-session'], 4595: ['ias-paging'], 4596: ['ias-neighbor'], 4597: ['a21-an-1xbs'], 4598: ['a16-an-an'], 4599: ['a17-an-an'], 4600: ['piranha1'], 4601: ['piranha2'], 4602: ['mtsserver'], 4603: ['menandmice-upg'], 4658: ['playsta2-app'], 4659: ['playsta2-lob'], 4660: ['smaclmgr'], 4661: ['kar2ouche'], 4662: ['oms'], 4663: ['noteit'], 4664: ['ems'], 4665: ['contclientms'], 4666: ['eportcomm'], 4667: ['mmacomm'], 4668: ['mmaeds'], 4669: ['eportcommdata'], 4670: ['light'], 4671: ['acter'], 4672: ['rfa'], 4673: ['cxws'], 4674: ['appiq-mgmt'], 4675: ['dhct-status'], 4676: ['dhct-alerts'], 4677: ['bcs'], 4678: ['traversal'], 4679: ['mgesupervision'], 4680: ['mgemanagement'], 4681: ['parliant'], 4682: ['finisar'], 4683: ['spike'], 4684: ['rfid-rp1'], 4685: ['autopac'], 4686: ['msp-os'], 4687: ['nst'], 4688: ['mobile-p2p'], 4689: ['altovacentral'], 4690: ['prelude'], 4691: ['mtn'], 4692: ['conspiracy'], 4700: ['netxms-agent'], 4701: ['netxms-mgmt'], 4702: ['netxms-sync'], 4703: ['npqes-test'], 4704: ['assuria-ins'], 37475: ['neckar'], 37483: ['gdrive-sync'], 4725: ['truckstar'], 4727: ['fcis'], 4728: ['capmux'], 4730: ['gearman'], 4731: ['remcap'], 4733: ['resorcs'], 4737: ['ipdr-sp'], 4738: ['solera-lpn'], 4739: ['ipfix'], 4740: ['ipfixs'], 4741: ['lumimgrd'], 4742: ['sicct'], 4743: ['openhpid'], 4744: ['ifsp'], 4745: ['fmp'], 4749: ['profilemac'], 4750: ['ssad'], 4751: ['spocp'], 4752: ['snap'], 4753: ['simon'], 4784: ['bfd-multi-ctl'], 4786: ['smart-install'], 4787: ['sia-ctrl-plane'], 4788: ['xmcp'], 4800: ['iims'], 4801: ['iwec'], 4802: ['ilss'], 4803: ['notateit'], 4827: ['htcp'], 4837: ['varadero-0'], 4838: ['varadero-1'], 4839: ['varadero-2'], 4840: ['opcua-tcp'], 4841: ['quosa'], 4842: ['gw-asv'], 4843: ['opcua-tls'], 4844: ['gw-log'], 4845: ['wcr-remlib'], 4846: ['contamac-icm'], 4847: ['wfc'], 4848: ['appserv-http'], 4849: ['appserv-https'], 4850: ['sun-as-nodeagt'], 4851: ['derby-repli'], 4867: ['unify-debug'], 4868: ['phrelay'], 4869: ['phrelaydbg'], 4870: ['cc-tracking'], 4871: ['wired'], 32896: ['idmgratm'], 4876: ['tritium-can'], 4877: ['lmcs'], 4879: ['wsdl-event'], 4880: ['hislip'], 4883: ['wmlserver'], 4884: ['hivestor'], 4885: ['abbs'], 37654: ['unisys-eportal'], 4894: ['lyskom'], 4899: ['radmin-port'], 4900: ['hfcs'], 4901: ['flr-agent'], 4902: ['magiccontrol'], 4912: ['lutap'], 4913: ['lutcp'], 4914: ['bones'], 4915: ['frcs'], 4940: ['eq-office-4940'], 4941: ['eq-office-4941'], 4942: ['eq-office-4942'], 4949: ['munin'], 4950: ['sybasesrvmon'], 4951: ['pwgwims'], 4952: ['sagxtsds'], 4953: ['dbsyncarbiter'], 4969: ['ccss-qmm'], 4970: ['ccss-qsm'], 4984: ['webyast'], 4985: ['gerhcs'], 4986: ['mrip'], 4987: ['smar-se-port1'], 4988: ['smar-se-port2'], 4989: ['parallel'], 4990: ['busycal'], 4991: ['vrt'], 4999: ['hfcs-manager'], 5000: ['commplex-main'], 5001: ['commplex-link'], 5002: ['rfe'], 5003: ['fmpro-internal'], 5004: ['avt-profile-1'], 5005: ['avt-profile-2'], 5006: ['wsm-server'], 5007: ['wsm-server-ssl'], 5008: ['synapsis-edge'], 5009: ['winfs'], 5010: ['telelpathstart'], 5011: ['telelpathattack'], 5012: ['nsp'], 5013: ['fmpro-v6'], 5015: ['fmwp'], 5020: ['zenginkyo-1'], 5021: ['zenginkyo-2'], 5022: ['mice'], 5023: ['htuilsrv'], 5024: ['scpi-telnet'], 5025: ['scpi-raw'], 5026: ['strexec-d'], 5027: ['strexec-s'], 5028: ['qvr'], 5029: ['infobright'], 5030: ['surfpass'], 5032: ['signacert-agent'], 5042: ['asnaacceler8db'], 5043: ['swxadmin'], 5044: ['lxi-evntsvc'], 5045: ['osp'], 5048: ['texai'], 5049: ['ivocalize'], 5050: ['mmcc'], 5051: ['ita-agent'], 5052: ['ita-manager'], 5053: ['rlm'], 5054: ['rlm-admin'], 5055: ['unot'], 5056: ['intecom-ps1'], 5057: ['intecom-ps2'], 5059: ['sds'], 5060: ['sip'], 5061: ['sip-tls'], 5062: ['na-localise'], 5063: ['csrpc'], 5064: ['ca-1'], 5065: ['ca-2'], 5066: ['stanag-5066'], 5067: ['authentx'], 5068: ['bitforestsrv'], 5069: ['i-net-2000-npr'], 5070: ['vtsas'], 5071: ['powerschool'], 5072: ['ayiya'], 5073: ['tag-pm'], 5074: ['alesquery'], 5075: ['pvaccess'], 5080: ['onscreen'], 5081: ['sdl-ets'], 5082: ['qcp'], 5083: ['qfp'], 5084: ['llrp'], 5085: ['encrypted-llrp'], 5086: ['aprigo-cs'], 5093: ['sentinel-lm'], 5094: ['hart-ip'], 5099: ['sentlm-srv2srv'], 5100: ['socalia'], 5101: ['talarian-tcp'], 5102: ['oms-nonsecure'], 5103: ['actifio-c2c'], 5111: ['taep-as-svc'], 5112: ['pm-cmdsvr'], 5114: ['ev-services'], 5115: ['autobuild'], 5117: ['gradecam'], 5120: ['barracuda-bbs'], 5133: ['nbt-pc'], 5134: ['ppactivation'], 5135: ['erp-scale'], 5137: ['ctsd'], 5145: ['rmonitor-secure'], 5146: ['social-alarm'], 5150: ['atmp'], 5151: ['esri-sde'], 5152: ['sde-discovery'], 5153: ['toruxserver'], 5154: ['bzflag'], 5155: ['asctrl-agent'], 5156: ['rugameonline'], 5157: ['mediat'], 5161: ['snmpssh'], 5162: ['snmpssh-trap'], 5163: ['sbackup'], 5164: ['vpa'], 5165: ['ife-icorp'], 5166: ['winpcs'], 5167: ['scte104'], 5168: ['scte30'], 5190: ['aol'], 5191: ['aol-1'], 5192: ['aol-2'], 5193: ['aol-3'], 5194: ['cpscomm'], 5195: ['ampl-lic'], 5196: ['ampl-tableproxy'], 5200: ['targus-getdata'], 5201: ['targus-getdata1'], 5202: ['targus-getdata2'], 5203: ['targus-getdata3'], 5209: ['nomad'], 5221: ['3exmp'], 5222: ['xmpp-client'], 5223: ['hpvirtgrp'], 5224: ['hpvirtctrl'], 5225: ['hp-server'], 5226: ['hp-status'], 5227: ['perfd'], 5228: ['hpvroom'], 5232: ['csedaemon'], 5233: ['enfs'], 5234: ['eenet'], 5235: ['galaxy-network'], 5236: ['padl2sim'], 5237: ['mnet-discovery'], 5245: ['downtools'], 5248: ['caacws'], 5249: ['caaclang2'], 5250: ['soagateway'], 5251: ['caevms'], 5252: ['movaz-ssc'], 5253: ['kpdp'], 5264: ['3com-njack-1'], 5265: ['3com-njack-2'], 5269: ['xmpp-server'], 5270: ['cartographerxmp'], 5271: ['cuelink'], 5272: ['pk'], 5280: ['xmpp-bosh'], 5281: ['undo-lm'], 5282: ['transmit-port'], 5298: ['presence'], 5299: ['nlg-data'], 5300: ['hacl-hb'], 5301: ['hacl-gs'], 5302: ['hacl-cfg'], 5303: ['hacl-probe'], 5304: ['hacl-local'], 5305: ['hacl-test'], 5306: ['sun-mc-grp'], 5307: ['sco-aip'], 5308: ['cfengine'], 5309: ['jprinter'], 5310: ['outlaws'], 5312: ['permabit-cs'], 5313: ['rrdp'], 5314: ['opalis-rbt-ipc'], 5315: ['hacl-poll'], 5316: ['hpbladems'], 5317: ['hpdevms'], 5318: ['pkix-cmc'], 5320: ['bsfserver-zn'], 5321: ['bsfsvr-zn-ssl'], 33656: ['snip-slave'], 32769: ['filenet-rpc'], 5343: ['kfserver'], 5344: ['xkotodrcp'], 5349: ['stun-behaviors', 'stuns', 'turns'], 5352: ['dns-llq'], 5353: ['mdns'], 5354: ['mdnsresponder'], 5355: ['llmnr'], 5356: ['ms-smlbiz'], 5357: ['wsdapi'], 5358: ['wsdapi-s'], 5359: ['ms-alerter'], 5360: ['ms-sideshow'], 5361: ['ms-s-sideshow'], 5362: ['serverwsd2'], 5363: ['net-projection'], 5397: ['stresstester'], 5398: ['elektron-admin'], 5399: ['securitychase'], 5400: ['excerpt'], 5401: ['excerpts'], 5402: ['mftp'], 5403: ['hpoms-ci-lstn'], 5404: ['hpoms-dps-lstn'], 5405: ['netsupport'], 5406: ['systemics-sox'], 5407: ['foresyte-clear'], 5408: ['foresyte-sec'], 5409: ['salient-dtasrv'], 5410: ['salient-usrmgr'], 5411: ['actnet'], 5412: ['continuus'], 5413: ['wwiotalk'], 5414: ['statusd'], 5415: ['ns-server'], 5416: ['sns-gateway'], 5417: ['sns-agent'], 5418: ['mcntp'], 5419: ['dj-ice'], 5420: ['cylink-c'], 5421: ['netsupport2'], 5422: ['salient-mux'], 5423: ['virtualuser'], 5424: ['beyond-remote'], 5425: ['br-channel'], 5426: ['devbasic'], 5427: ['sco-peer-tta'], 5428: ['telaconsole'], 5429: ['base'], 5430: ['radec-corp'], 5431: ['park-agent'], 5432: ['postgresql'], 5433: ['pyrrho'], 5434: ['sgi-arrayd'], 5435: ['sceanics'], 5443: ['spss'], 5445: ['smbdirect'], 5453: ['surebox'], 5454: ['apc-5454'], 5455: ['apc-5455'], 5456: ['apc-5456'], 5461: ['silkmeter'], 5462: ['ttl-publisher'], 5463: ['ttlpriceproxy'], 5464: ['quailnet'], 5465: ['netops-broker'], 32770: ['filenet-nch'], 5500: ['fcp-addr-srvr1'], 5501: ['fcp-addr-srvr2'], 5502: ['fcp-srvr-inst1'], 5503: ['fcp-srvr-inst2'], 5504: ['fcp-cics-gw1'], 5505: ['checkoutdb'], 5506: ['amc'], 5553: ['sgi-eventmond'], 5554: ['sgi-esphttp'], 5555: ['personal-agent'], 5556: ['freeciv'], 5557: ['farenet'], 5566: ['westec-connect'], 5567: ['enc-eps-mc-sec'], 5568: ['sdt'], 5569: ['rdmnet-ctrl'], 5573: ['sdmmp'], 5574: ['lsi-bobcat'], 5575: ['ora-oap'], 5579: ['fdtracks'], 5580: ['tmosms0'], 5581: ['tmosms1'], 5582: ['fac-restore'], 5583: ['tmo-icon-sync'], 5584: ['bis-web'], 5585: ['bis-sync'], 5597: ['ininmessaging'], 5598: ['mctfeed'], 5599: ['esinstall'], 5600: ['esmmanager'], 5601: ['esmagent'], 5602: ['a1-msc'], 5603: ['a1-bs'], 5604: ['a3-sdunode'], 5605: ['a4-sdunode'], 5618: ['efr'], 5627: ['ninaf'], 5628: ['htrust'], 5629: ['symantec-sfdb'], 5630: ['precise-comm'], 5631: ['pcanywheredata'], 5632: ['pcanywherestat'], 5633: ['beorl'], 5634: ['xprtld'], 5635: ['sfmsso'], 5636: ['sfm-db-server'], 5637: ['cssc'], 5638: ['flcrs'], 5639: ['ics'], 5646: ['vfmobile'], 5670: ['filemq'], 5671: ['amqps'], 5672: ['amqp'], 5673: ['jms'], 5674: ['hyperscsi-port'], 5675: ['v5ua'], 5676: ['raadmin'], 5677: ['questdb2-lnchr'], 5678: ['rrac'], 5679: ['dccm'], 5680: ['auriga-router'], 5681: ['ncxcp'], 5688: ['ggz'], 5689: ['qmvideo'], 5693: ['rbsystem'], 5696: ['kmip'], 5713: ['proshareaudio'], 5714: ['prosharevideo'], 5715: ['prosharedata'], 5716: ['prosharerequest'], 5717: ['prosharenotify'], 5718: ['dpm'], 5719: ['dpm-agent'], 5720: ['ms-licensing'], 5721: ['dtpt'], 5722: ['msdfsr'], 5723: ['omhs'], 5724: ['omsdk'], 5725: ['ms-ilm'], 5726: ['ms-ilm-sts'], 5727: ['asgenf'], 5728: ['io-dist-data'], 5729: ['openmail'], 5730: ['unieng'], 5741: ['ida-discover1'], 5742: ['ida-discover2'], 5743: ['watchdoc-pod'], 5744: ['watchdoc'], 5745: ['fcopy-server'], 5746: ['fcopys-server'], 5747: ['tunatic'], 5748: ['tunalyzer'], 5750: ['rscd'], 5755: ['openmailg'], 5757: ['x500ms'], 5766: ['openmailns'], 5767: ['s-openmail'], 5768: ['openmailpxy'], 5769: ['spramsca'], 5770: ['spramsd'], 5771: ['netagent'], 5777: ['dali-port'], 5780: ['vts-rpc'], 5781: ['3par-evts'], 5782: ['3par-mgmt'], 5783: ['3par-mgmt-ssl'], 5785: ['3par-rcopy'], 5793: ['xtreamx'], 5813: ['icmpd'], 5814: ['spt-automation'], 5842: ['reversion'], 5859: ['wherehoo'], 5863: ['ppsuitemsg'], 5868: ['diameters'], 5883: ['jute'], 5900: ['rfb'], 5910: ['cm'], 5911: ['cpdlc'], 5912: ['fis'], 5913: ['ads-c'], 32773: ['filenet-cm'], 5963: ['indy'], 5968: ['mppolicy-v5'], 5969: ['mppolicy-mgr'], 5984: ['couchdb'], 5985: ['wsman'], 5986: ['wsmans'], 5987: ['wbem-rmi'], 5988: ['wbem-http'], 5989: ['wbem-https'], 5990: ['wbem-exp-https'], 5991: ['nuxsl'], 5992: ['consul-insight'], 5999: ['cvsup'], 38800: ['sruth'], 6064: ['ndl-ahp-svc'], 6065: ['winpharaoh'], 6066: ['ewctsp'], 6068: ['gsmp-ancp'], 6069: ['trip'], 6070: ['messageasap'], 6071: ['ssdtp'], 6072: ['diagnose-proc'], 6073: ['directplay8'], 6074: ['max'], 6075: ['dpm-acm'], 6076: ['msft-dpm-cert'], 6077: ['iconstructsrv'], 6084: ['reload-config'], 6085: ['konspire2b'], 6086: ['pdtp'], 6087: ['ldss'], 6088: ['doglms'], 38865: ['secrmmsafecopya'], 6099: ['raxa-mgmt'], 6100: ['synchronet-db'], 6101: ['synchronet-rtc'], 6102: ['synchronet-upd'], 6103: ['rets'], 6104: ['dbdb'], 6105: ['primaserver'], 6106: ['mpsserver'], 6107: ['etc-control'], 6108: ['sercomm-scadmin'], 6109: ['globecast-id'], 6110: ['softcm'], 6111: ['spc'], 6112: ['dtspcd'], 6113: ['dayliteserver'], 6114: ['wrspice'], 6115: ['xic'], 6116: ['xtlserv'], 6117: ['daylitetouch'], 6121: ['spdy'], 6122: ['bex-webadmin'], 6123: ['backup-express'], 6124: ['pnbs'], 6130: ['damewaremobgtwy'], 6133: ['nbt-wol'], 6140: ['pulsonixnls'], 6141: ['meta-corp'], 6142: ['aspentec-lm'], 6143: ['watershed-lm'], 6144: ['statsci1-lm'], 6145: ['statsci2-lm'], 6146: ['lonewolf-lm'], 6147: ['montage-lm'], 6148: ['ricardo-lm'], 6149: ['tal-pod'], 6159: ['efb-aci'], 6160: ['ecmp'], 6161: ['patrol-ism'], 6162: ['patrol-coll'], 6163: ['pscribe'], 6200: ['lm-x'], 6222: ['radmind'], 32775: ['filenet-pch'], 6241: ['jeol-nsdtp-1'], 6242: ['jeol-nsdtp-2'], 6243: ['jeol-nsdtp-3'], 6244: ['jeol-nsdtp-4'], 6251: ['tl1-raw-ssl'], 6252: ['tl1-ssh'], 6253: ['crip'], 6267: ['gld'], 6268: ['grid'], 6269: ['grid-alt'], 6300: ['bmc-grx'], 6301: ['bmc-ctd-ldap'], 6306: ['ufmp'], 6315: ['scup'], 6316: ['abb-escp'], 6317: ['nav-data-cmd'], 6320: ['repsvc'], 6321: ['emp-server1'], 6322: ['emp-server2'], 6324: ['hrd-ncs'], 6325: ['dt-mgmtsvc'], 6326: ['dt-vra'], 6343: ['sflow'], 6344: ['streletz'], 6346: ['gnutella-svc'], 6347: ['gnutella-rtr'], 6350: ['adap'], 6355: ['pmcs'], 6360: ['metaedit-mu'], 6370: ['metaedit-se'], 6382: ['metatude-mds'], 6389: ['clariion-evr01'], 6390: ['metaedit-ws'], 6417: ['faxcomservice'], 6418: ['syserverremote'], 6419: ['svdrp'], 6420: ['nim-vdrshell'], 6421: ['nim-wan'], 6432: ['pgbouncer'], 6443: ['sun-sr-https'], 6444: ['sge-qmaster'], 6445: ['sge-execd'], 6446: ['mysql-proxy'], 6455: ['skip-cert-recv'], 6456: ['skip-cert-send'], 6471: ['lvision-lm'], 6480: ['sun-sr-http'], 6481: ['servicetags'], 6482: ['ldoms-mgmt'], 6483: ['sunvts-rmi'], 6484: ['sun-sr-jms'], 6485: ['sun-sr-iiop'], 6486: ['sun-sr-iiops'], 6487: ['sun-sr-iiop-aut'], 6488: ['sun-sr-jmx'], 6489: ['sun-sr-admin'], 6500: ['boks'], 6501: ['boks-servc'], 6502: ['boks-servm'], 6503: ['boks-clntd'], 6505: ['badm-priv'], 6506: ['badm-pub'], 6507: ['bdir-priv'], 6508: ['bdir-pub'], 6509: ['mgcs-mfp-port'], 6510: ['mcer-port'], 6513: ['netconf-tls'], 6514: ['syslog-tls'], 6515: ['elipse-rec'], 32777: ['filenet-obrok'], 6543: ['lds-distrib'], 6544: ['lds-dump'], 6547: ['apc-6547'], 6548: ['apc-6548'], 6549: ['apc-6549'], 6550: ['fg-sysupdate'], 6551: ['sum'], 6558: ['xdsxdm'], 6566: ['sane-port'], 6568: ['canit-store'], 6579: ['affiliate'], 6580: ['parsec-master'], 6581: ['parsec-peer'], 6582: ['parsec-game'], 6583: ['joajewelsuite'], 6600: ['mshvlm'], 6601: ['mstmg-sstp'], 6602: ['wsscomfrmwk'], 6619: ['odette-ftps'], 6620: ['kftp-data'], 6621: ['kftp'], 6622: ['mcftp'], 6623: ['ktelnet'], 6624: ['datascaler-db'], 6625: ['datascaler-ctl'], 6626: ['wago-service'], 6627: ['nexgen'], 6628: ['afesc-mc'], 6632: ['mxodbc-connect'], 6640: ['ovsdb'], 6653: ['openflow'], 6655: ['pcs-sf-ui-man'], 6656: ['emgmsg'], 6670: ['vocaltec-gold'], 6671: ['p4p-portal'], 6672: ['vision-server'], 6673: ['vision-elmd'], 6678: ['vfbp'], 6679: ['osaut'], 6687: ['clever-ctrace'], 6688: ['clever-tcpip'], 6689: ['tsa'], 6701: ['kti-icad-srvr'], 6702: ['e-design-net'], 6703: ['e-design-web'], 6714: ['ibprotocol'], 6715: ['fibotrader-com'], 6767: ['bmc-perf-agent'], 6768: ['bmc-perf-mgrd'], 6769: ['adi-gxp-srvprt'], 6770: ['plysrv-http'], 6771: ['plysrv-https'], 6777: ['ntz-tracker'], 6778: ['ntz-p2p-storage'], 6785: ['dgpf-exchg'], 6786: ['smc-jmx'], 6787: ['smc-admin'], 6788: ['smc-http'], 6789: ['smc-https'], 6790: ['hnmp'], 6791: ['hnm'], 6801: ['acnet'], 6817: ['pentbox-sim'], 6831: ['ambit-lm'], 6841: ['netmo-default'], 6842: ['netmo-http'], 6850: ['iccrushmore'], 6868: ['acctopus-cc'], 6888: ['muse'], 6901: ['jetstream'], 39681: ['turbonote-1'], 6935: ['ethoscan'], 6936: ['xsmsvc'], 6946: ['bioserver'], 6951: ['otlp'], 6961: ['jmact3'], 6962: ['jmevt2'], 6963: ['swismgr1'], 6964: ['swismgr2'], 6965: ['swistrap'], 6966: ['swispol'], 6969: ['acmsoda'], 6997: ['mobilitysrv'], 6998: ['iatp-highpri'], 6999: ['iatp-normalpri'], 7000: ['afs3-fileserver'], 7001: ['afs3-callback'], 7002: ['afs3-prserver'], 7003: ['afs3-vlserver'], 7004: ['afs3-kaserver'], 7005: ['afs3-volser'], 7006: ['afs3-errors'], 7007: ['afs3-bos'], 7008: ['afs3-update'], 7009: ['afs3-rmtsys'], 7010: ['ups-onlinet'], 7011: ['talon-disc'], 7012: ['talon-engine'], 7013: ['microtalon-dis'], 7014: ['microtalon-com'], 7015: ['talon-webserver'], 7018: ['fisa-svc'], 7019: ['doceri-ctl'], 7020: ['dpserve'], 7021: ['dpserveadmin'], 7022: ['ctdp'], 7023: ['ct2nmcs'], 7024: ['vmsvc'], 7025: ['vmsvc-2'], 7030: ['op-probe'], 7031: ['iposplanet'], 7070: ['arcp'], 7071: ['iwg1'], 7073: ['martalk'], 7080: ['empowerid'], 7099: ['lazy-ptop'], 7100: ['font-service'], 7101: ['elcn'], 7121: ['virprot-lm'], 7128: ['scenidm'], 7129: ['scenccs'], 7161: ['cabsm-comm'], 7162: ['caistoragemgr'], 7163: ['cacsambroker'], 7164: ['fsr'], 7165: ['doc-server'], 7166: ['aruba-server'], 7167: ['casrmagent'], 7168: ['cnckadserver'], 7169: ['ccag-pib'], 7170: ['nsrp'], 7171: ['drm-production'], 7172: ['metalbend'], 7173: ['zsecure'], 7174: ['clutild'], 7200: ['fodms'], 7201: ['dlip'], 7227: ['ramp'], 7228: ['citrixupp'], 7229: ['citrixuppg'], 40000: ['safetynetp'], 7236: ['display'], 7237: ['pads'], 7262: ['cnap'], 7272: ['watchme-7272'], 7273: ['oma-rlp'], 7274: ['oma-rlp-s'], 7275: ['oma-ulp'], 7276: ['oma-ilp'], 7277: ['oma-ilp-s'], 7278: ['oma-dcdocbs'], 7279: ['ctxlic'], 7280: ['itactionserver1'], 7281: ['itactionserver2'], 7282: ['mzca-action'], 7283: ['genstat'], 7365: ['lcm-server'], 7391: ['mindfilesys'], 7392: ['mrssrendezvous'], 7393: ['nfoldman'], 7394: ['fse'], 7395: ['winqedit'], 7397: ['hexarc'], 7400: ['rtps-discovery'], 7401: ['rtps-dd-ut'], 7402: ['rtps-dd-mt'], 7410: ['ionixnetmon'], 7411: ['daqstream'], 7421: ['mtportmon'], 7426: ['pmdmgr'], 7427: ['oveadmgr'], 7428: ['ovladmgr'], 7429: ['opi-sock'], 7430: ['xmpv7'], 7431: ['pmd'], 7437: ['faximum'], 7443: ['oracleas-https'], 7473: ['rise'], 7474: ['neo4j'], 7491: ['telops-lmd'], 7500: ['silhouette'], 7501: ['ovbus'], 7508: ['adcp'], 7509: ['acplt'], 7510: ['ovhpas'], 7511: ['pafec-lm'], 7542: ['saratoga'], 7543: ['atul'], 7544: ['nta-ds'], 7545: ['nta-us'], 7546: ['cfs'], 7547: ['cwmp'], 7548: ['tidp'], 7549: ['nls-tl'], 7560: ['sncp'], 7563: ['cfw'], 7566: ['vsi-omega'], 7569: ['dell-eql-asm'], 7570: ['aries-kfinder'], 7588: ['sun-lm'], 7624: ['indi'], 7626: ['simco'], 7627: ['soap-http'], 7628: ['zen-pawn'], 7629: ['xdas'], 7630: ['hawk'], 7631: ['tesla-sys-msg'], 7633: ['pmdfmgt'], 40404: ['sptx'], 7648: ['cuseeme'], 7672: ['imqstomp'], 7673: ['imqstomps'], 7674: ['imqtunnels'], 7675: ['imqtunnel'], 7676: ['imqbrokerd'], 7677: ['sun-user-https'], 7680: ['pando-pub'], 7689: ['collaber'], 7697: ['klio'], 7700: ['em7-secom'], 7707: ['sync-em7'], 7708: ['scinet'], 7720: ['medimageportal'], 7724: ['nsdeepfreezectl'], 7725: ['nitrogen'], 7726: ['freezexservice'], 7727: ['trident-data'], 7734: ['smip'], 7738: ['aiagent'], 7741: ['scriptview'], 7742: ['msss'], 7743: ['sstp-1'], 7744: ['raqmon-pdu'], 7747: ['prgp'], 7777: ['cbt'], 7778: ['interwise'], 7779: ['vstat'], 7781: ['accu-lmgr'], 7786: ['minivend'], 7787: ['popup-reminders'], 7789: ['office-tools'], 7794: ['q3ade'], 7797: ['pnet-conn'], 7798: ['pnet-enc'], 7799: ['altbsdp'], 7800: ['asr'], 7801: ['ssp-client'], 7810: ['rbt-wanopt'], 7845: ['apc-7845'], 7846: ['apc-7846'], 7847: ['csoauth'], 7869: ['mobileanalyzer'], 7870: ['rbt-smc'], 7871: ['mdm'], 7878: ['owms'], 7880: ['pss'], 7887: ['ubroker'], 7900: ['mevent'], 7901: ['tnos-sp'], 7902: ['tnos-dp'], 7903: ['tnos-dps'], 7913: ['qo-secure'], 7932: ['t2-drm'], 7933: ['t2-brm'], 7967: ['supercell'], 7979: ['micromuse-ncps'], 7980: ['quest-vista'], 7981: ['sossd-collect'], 7982: ['sossd-agent'], 7997: ['pushns'], 7999: ['irdmi2'], 8000: ['irdmi'], 8001: ['vcom-tunnel'], 8002: ['teradataordbms'], 8003: ['mcreport'], 8005: ['mxi'], 8008: ['http-alt'], 8019: ['qbdb'], 8020: ['intu-ec-svcdisc'], 8021: ['intu-ec-client'], 8022: ['oa-system'], 8025: ['ca-audit-da'], 8026: ['ca-audit-ds'], 8032: ['pro-ed'], 8033: ['mindprint'], 8034: ['vantronix-mgmt'], 8040: ['ampify'], 8042: ['fs-agent'], 8043: ['fs-server'], 8044: ['fs-mgmt'], 8051: ['rocrail'], 8052: ['senomix01'], 8053: ['senomix02'], 8054: ['senomix03'], 8055: ['senomix04'], 8056: ['senomix05'], 8057: ['senomix06'], 8058: ['senomix07'], 8059: ['senomix08'], 8066: ['toad-bi-appsrvr'], 40841: ['cscp'], 8074: ['gadugadu'], 40843: ['csccfirewall'], 8080: ['http-alt'], 8081: ['sunproxyadmin'], 8082: ['us-cli'], 8083: ['us-srv'], 8086: ['d-s-n'], 8087: ['simplifymedia'], 8088: ['radan-http'], 8091: ['jamlink'], 8097: ['sac'], 8100: ['xprint-server'], 8101: ['ldoms-migr'], 8102: ['kz-migr'], 8115: ['mtl8000-matrix'], 8116: ['cp-cluster'], 8117: ['purityrpc'], 8118: ['privoxy'], 8121: ['apollo-data'], 8122: ['apollo-admin'], 8128: ['paycash-online'], 8129: ['paycash-wbp'], 8130: ['indigo-vrmi'], 8131: ['indigo-vbcp'], 8132: ['dbabble'], 8148: ['isdd'], 8153: ['quantastor'], 8160: ['patrol'], 8161: ['patrol-snmp'], 8162: ['lpar2rrd'], 8181: ['intermapper'], 8182: ['vmware-fdm'], 8183: ['proremote'], 8184: ['itach'], 8192: ['spytechphone'], 8194: ['blp1'], 8195: ['blp2'], 8199: ['vvr-data'], 8200: ['trivnet1'], 8201: ['trivnet2'], 8204: ['lm-perfworks'], 8205: ['lm-instmgr'], 8206: ['lm-dta'], 8207: ['lm-sserver'], 8208: ['lm-webwatcher'], 8230: ['rexecj'], 8243: ['synapse-nhttps'], 8276: ['pando-sec'], 8280: ['synapse-nhttp'], 8292: ['blp3'], 8293: ['hiperscan-id'], 8294: ['blp4'], 8300: ['tmi'], 8301: ['amberon'], 8313: ['hub-open-net'], 8320: ['tnp-discover'], 8321: ['tnp'], 41111: ['fs-qos'], 8351: ['server-find'], 41121: ['tentacle'], 8376: ['cruise-enum'], 8377: ['cruise-swroute'], 8378: ['cruise-config'], 8379: ['cruise-diags'], 8380: ['cruise-update'], 8383: ['m2mservices'], 8400: ['cvd'], 8401: ['sabarsd'], 8402: ['abarsd'], 8403: ['admind'], 8404: ['svcloud'], 8405: ['svbackup'], 8415: ['dlpx-sp'], 8416: ['espeech'], 8417: ['espeech-rtp'], 8442: ['cybro-a-bus'], 8443: ['pcsync-https'], 8444: ['pcsync-http'], 8445: ['copy'], 8450: ['npmp'], 8457: ['nexentamv'], 8470: ['cisco-avp'], 8471: ['pim-port'], 8472: ['otv'], 8473: ['vp2p'], 8474: ['noteshare'], 8500: ['fmtp'], 8501: ['cmtp-mgt'], 8554: ['rtsp-alt'], 8555: ['d-fence'], 8567: ['enc-tunnel'], 8600: ['asterix'], 8610: ['canon-mfnp'], 8611: ['canon-bjnp1'], 8612: ['canon-bjnp2'], 8613: ['canon-bjnp3'], 8614: ['canon-bjnp4'], 8615: ['imink'], 8665: ['monetra'], 8666: ['monetra-admin'], 8675: ['msi-cps-rm'], 8686: ['sun-as-jmxrmi'], 8688: ['openremote-ctrl'], 8699: ['vnyx'], 8711: ['nvc'], 8733: ['ibus'], 8750: ['dey-keyneg'], 8763: ['mc-appserver'], 8764: ['openqueue'], 8765: ['ultraseek-http'], 8766: ['amcs'], 8770: ['dpap'], 8778: ['uec'], 8786: ['msgclnt'], 8787: ['msgsrvr'], 8793: ['acd-pm'], 8800: ['sunwebadmin'], 8804: ['truecm'], 8873: ['dxspider'], 8880: ['cddbp-alt'], 8881: ['galaxy4d'], 8883: ['secure-mqtt'], 34249: ['turbonote-2'], 8888: ['ddi-tcp-1'], 8889: ['ddi-tcp-2'], 8890: ['ddi-tcp-3'], 8891: ['ddi-tcp-4'], 8892: ['ddi-tcp-5'], 8893: ['ddi-tcp-6'], 8894: ['ddi-tcp-7'], 8899: ['ospf-lite'], 8900: ['jmb-cds1'], 8901: ['jmb-cds2'], 8910: ['manyone-http'], 8911: ['manyone-xml'], 8912: ['wcbackup'], 8913: ['dragonfly'], 8937: ['twds'], 8953: ['ub-dns-control'], 8954: ['cumulus-admin'], 8989: ['sunwebadmins'], 8990: ['http-wmap'], 8991: ['https-wmap'], 8999: ['bctp'], 9000: ['cslistener'], 9001: ['etlservicemgr'], 9002: ['dynamid'], 9008: ['ogs-server'], 9009: ['pichat'], 9010: ['sdr'], 9020: ['tambora'], 9021: ['panagolin-ident'], 9022: ['paragent'], 9023: ['swa-1'], 9024: ['swa-2'], 9025: ['swa-3'], 9026: ['swa-4'], 41795: ['crestron-ctp'], 41796: ['crestron-cips'], 41797: ['crestron-ctps'], 9050: ['versiera'], 9051: ['fio-cmgmt'], 9080: ['glrpc'], 9083: ['emc-pp-mgmtsvc'], 9084: ['aurora'], 9085: ['ibm-rsyscon'], 9086: ['net2display'], 9087: ['classic'], 9088: ['sqlexec'], 9089: ['sqlexec-ssl'], 9090: ['websm'], 9091: ['xmltec-xmlmail'], 9092: ['xmlipcregsvc'], 9093: ['copycat'], 9100: ['hp-pdl-datastr', 'pdl-datastream'], 9101: ['bacula-dir'], 9102: ['bacula-fd'], 9103: ['bacula-sd'], 9104: ['peerwire'], 9105: ['xadmin'], 9106: ['astergate'], 9107: ['astergatefax'], 9119: ['mxit'], 9122: ['grcmp'], 9123: ['grcp'], 9131: ['dddp'], 9160: ['apani1'], 9161: ['apani2'], 9162: ['apani3'], 9163: ['apani4'], 9164: ['apani5'], 9191: ['sun-as-jpda'], 9200: ['wap-wsp'], 9201: ['wap-wsp-wtp'], 9202: ['wap-wsp-s'], 9203: ['wap-wsp-wtp-s'], 9204: ['wap-vcard'], 9205: ['wap-vcal'], 9206: ['wap-vcard-s'], 9207: ['wap-vcal-s'], 9208: ['rjcdb-vcards'], 9209: ['almobile-system'], 9210: ['oma-mlp'], 9211: ['oma-mlp-s'], 9212: ['serverviewdbms'], 9213: ['serverstart'], 9214: ['ipdcesgbs'], 9215: ['insis'], 9216: ['acme'], 9217: ['fsc-port'], 9222: ['teamcoherence'], 9255: ['mon'], 9278: ['pegasus'], 9279: ['pegasus-ctl'], 9280: ['pgps'], 9281: ['swtp-port1'], 9282: ['swtp-port2'], 9283: ['callwaveiam'], 9284: ['visd'], 9285: ['n2h2server'], 9287: ['cumulus'], 9292: ['armtechdaemon'], 9293: ['storview'], 9294: ['armcenterhttp'], 9295: ['armcenterhttps'], 9300: ['vrace'], 9306: ['sphinxql'], 9312: ['sphinxapi'], 9318: ['secure-ts'], 9321: ['guibase'], 9343: ['mpidcmgr'], 9344: ['mphlpdmc'], 9346: ['ctechlicensing'], 9374: ['fjdmimgr'], 9380: ['boxp'], 9387: ['d2dconfig'], 9388: ['d2ddatatrans'], 9389: ['adws'], 9390: ['otp'], 9396: ['fjinvmgr'], 9397: ['mpidcagt'], 9400: ['sec-t4net-srv'], 9401: ['sec-t4net-clt'], 9402: ['sec-pc2fax-srv'], 9418: ['git'], 9443: ['tungsten-https'], 9444: ['wso2esb-console'], 9445: ['mindarray-ca'], 9450: ['sntlkeyssrvr'], 9500: ['ismserver'], 9535: ['mngsuite'], 9536: ['laes-bf'], 9555: ['trispen-sra'], 9592: ['ldgateway'], 9593: ['cba8'], 9594: ['msgsys'], 9595: ['pds'], 9596: ['mercury-disc'], 9597: ['pd-admin'], 9598: ['vscp'], 9599: ['robix'], 9600: ['micromuse-ncpw'], 9612: ['streamcomm-ds'], 9614: ['iadt-tls'], 9616: ['erunbook-agent'], 9617: ['erunbook-server'], 9618: ['condor'], 9628: ['odbcpathway'], 9629: ['uniport'], 9630: ['peoctlr'], 9631: ['peocoll'], 9640: ['pqsflows'], 34378: ['p-net-local'], 9667: ['xmms2'], 9668: ['tec5-sdctp'], 9694: ['client-wakeup'], 9695: ['ccnx'], 9700: ['board-roar'], 42508: ['candp'], 42509: ['candrp'], 42510: ['caerpc'], 9747: ['l5nas-parchan'], 9750: ['board-voip'], 9753: ['rasadv'], 9762: ['tungsten-http'], 9800: ['davsrc'], 9801: ['sstp-2'], 9802: ['davsrcs'], 9875: ['sapv1'], 9876: ['sd'], 9888: ['cyborg-systems'], 9889: ['gt-proxy'], 9898: ['monkeycom'], 9900: ['iua'], 9909: ['domaintime'], 9911: ['sype-transport'], 9925: ['xybrid-cloud'], 9950: ['apc-9950'], 9951: ['apc-9951'], 9952: ['apc-9952'], 9953: ['acis'], 9954: ['hinp'], 9955: ['alljoyn-stm'], 9966: ['odnsp'], 9978: ['xybrid-rt'], 9987: ['dsm-scm-target'], 9988: ['nsesrvr'], 9990: ['osm-appsrvr'], 9991: ['osm-oev'], 9992: ['palace-1'], 9993: ['palace-2'], 9994: ['palace-3'], 9995: ['palace-4'], 9996: ['palace-5'], 9997: ['palace-6'], 9998: ['distinct32'], 9999: ['distinct'], 10000: ['ndmp'], 10001: ['scp-config'], 10002: ['documentum'], 10003: ['documentum-s'], 10004: ['emcrmirccd'], 10005: ['emcrmird'], 10007: ['mvs-capacity'], 10008: ['octopus'], 10009: ['swdtp-sv'], 10010: ['rxapi'], 10050: ['zabbix-agent'], 10051: ['zabbix-trapper'], 10055: ['qptlmd'], 10080: ['amanda'], 10081: ['famdc'], 10100: ['itap-ddtp'], 10101: ['ezmeeting-2'], 10102: ['ezproxy-2'], 10103: ['ezrelay'], 10104: ['swdtp'], 10107: ['bctp-server'], 10110: ['nmea-0183'], 10113: ['netiq-endpoint'], 10114: ['netiq-qcheck'], 10115: ['netiq-endpt'], 10116: ['netiq-voipa'], 10117: ['iqrm'], 10128: ['bmc-perf-sd'], 10129: ['bmc-gms'], 32801: ['mlsn'], 10160: ['qb-db-server'], 10161: ['snmptls'], 10162: ['snmptls-trap'], 10200: ['trisoap'], 10201: ['rsms'], 43000: ['recvr-rc'], 10252: ['apollo-relay'], 10260: ['axis-wimp-port'], 10288: ['blocks'], 10321: ['cosir'], 43188: ['reachout'], 43189: ['ndm-agent-port'], 43190: ['ip-provision'], 43191: ['noit-transport'], 43210: ['shaperai'], 10540: ['mos-lower'], 10541: ['mos-upper'], 10542: ['mos-aux'], 10543: ['mos-soap'], 10544: ['mos-soap-opt'], 10631: ['printopia'], 43439: ['eq3-update'], 43440: ['ew-mgmt'], 43441: ['ciscocsdb'], 34567: ['dhanalakshmi'], 10800: ['gap'], 10805: ['lpdg'], 10809: ['nbd'], 10860: ['helix'], 10880: ['bveapi'], 10990: ['rmiaux'], 11000: ['irisa'], 11001: ['metasys'], 11103: ['origo-sync'], 11104: ['netapp-icmgmt'], 11105: ['netapp-icdata'], 11106: ['sgi-lk'], 11109: ['sgi-dmfmgr'], 11110: ['sgi-soap'], 11111: ['vce'], 11112: ['dicom'], 11161: ['suncacao-snmp'], 11162: ['suncacao-jmxmp'], 11163: ['suncacao-rmi'], 11164: ['suncacao-csa'], 11165: ['suncacao-websvc'], 11172: ['oemcacao-jmxmp'], 11173: ['t5-straton'], 11174: ['oemcacao-rmi'], 11175: ['oemcacao-websvc'], 11201: ['smsqp'], 11202: ['dcsl-backup'], 11208: ['wifree'], 11211: ['memcache'], 11319: ['imip'], 11320: ['imip-channels'], 11321: ['arena-server'], 44123: ['z-wave-s'], 11367: ['atm-uhas'], 11371: ['hkp'], 11489: ['asgcypresstcps'], 44321: ['pmcd'], 44322: ['pmcdproxy'], 44323: ['pmwebapi'], 11600: ['tempest-port'], 11623: ['emc-xsw-dconfig'], 32811: ['retp'], 44444: ['cognex-dataman'], 33123: ['aurora-balaena'], 11720: ['h323callsigalt'], 11723: ['emc-xsw-dcache'], 11751: ['intrepid-ssl'], 44553: ['rbr-debug'], 11796: ['lanschool'], 11876: ['xoraya'], 11967: ['sysinfo-sp'], 12000: ['entextxid'], 12001: ['entextnetwk'], 12002: ['entexthigh'], 12003: ['entextmed'], 12004: ['entextlow'], 12005: ['dbisamserver1'], 12006: ['dbisamserver2'], 12007: ['accuracer'], 12008: ['accuracer-dbms'], 12010: ['edbsrvr'], 12012: ['vipera'], 12013: ['vipera-ssl'], 44818: ['ethernet-ip-2'], 12109: ['rets-ssl'], 36524: ['febooti-aw'], 12121: ['nupaper-ss'], 44900: ['m3da'], 12168: ['cawas'], 12172: ['hivep'], 45000: ['asmp'], 45001: ['asmps'], 45045: ['synctest'], 45054: ['invision-ag'], 12300: ['linogridengine'], 12302: ['rads'], 12321: ['warehouse-sss'], 12322: ['warehouse'], 12345: ['italk'], 12753: ['tsaf'], 12865: ['netperf'], 45678: ['eba'], 45824: ['dai-shell'], 45825: ['qdb2service'], 13160: ['i-zipqd'], 45966: ['ssr-servermgr'], 13216: ['bcslogc'], 13217: ['rs-pias'], 13218: ['emc-vcas-tcp'], 13223: ['powwow-client'], 13224: ['powwow-server'], 34980: ['ethercat'], 35000: ['heathview'], 35001: ['rt-viewer'], 13400: ['doip-data'], 35002: ['rt-sound'], 35003: ['rt-devicemapper'], 35004: ['rt-classmanager'], 35005: ['rt-labtracker'], 35006: ['rt-helper'], 13720: ['bprd'], 13721: ['bpdbm'], 13722: ['bpjava-msvc'], 13724: ['vnetd'], 13782: ['bpcd'], 13783: ['vopied'], 13785: ['nbdb'], 13786: ['nomdb'], 13818: ['dsmcc-config'], 13819: ['dsmcc-session'], 13820: ['dsmcc-passthru'], 13821: ['dsmcc-download'], 13822: ['dsmcc-ccp'], 13823: ['bmdss'], 13894: ['ucontrol'], 13929: ['dta-systems'], 13930: ['medevolve'], 14000: ['scotty-ft'], 14001: ['sua'], 14033: ['sage-best-com1'], 14034: ['sage-best-com2'], 14141: ['vcs-app'], 14142: ['icpp'], 14145: ['gcm-app'], 14149: ['vrts-tdd'], 14150: ['vcscmd'], 14154: ['vad'], 46998: ['spremotetablet'], 46999: ['mediabox'], 47000: ['mbus'], 47001: ['winrm'], 14250: ['cps'], 14414: ['ca-web-update'], 47557: ['dbbrowse'], 47624: ['directplaysrvr'], 14936: ['hde-lcesrvr-1'], 14937: ['hde-lcesrvr-2'], 15000: ['hydap'], 47806: ['ap'], 47808: ['bacnet'], 48000: ['nimcontroller'], 48001: ['nimspooler'], 48002: ['nimhub'], 48003: ['nimgtw'], 48004: ['nimbusdb'], 48005: ['nimbusdbctrl'], 48049: ['3gpp-cbsp'], 48050: ['weandsf'], 15345: ['xpilot'], 48128: ['isnetserv'], 48129: ['blp5'], 15363: ['3link'], 35354: ['kitim'], 35355: ['altova-lm'], 35356: ['guttersnex'], 35357: ['openstack-id'], 15555: ['cisco-snat'], 15660: ['bex-xr'], 40842: ['csccredir'], 15740: ['ptp'], 48556: ['com-bardac-dw'], 48619: ['iqobject'], 15999: ['programmar'], 16000: ['fmsas'], 16001: ['fmsascon'], 16002: ['gsms'], 16020: ['jwpc'], 16021: ['jwpc-bin'], 16161: ['sun-sea-port'], 16162: ['solaris-audit'], 49000: ['matahari'], 16309: ['etb4j'], 16310: ['pduncs'], 16311: ['pdefmns'], 16360: ['netserialext1'], 16361: ['netserialext2'], 16367: ['netserialext3'], 16368: ['netserialext4'], 16384: ['connected'], 16619: ['xoms'], 34379: ['p-net-remote'], 16900: ['newbay-snc-mc'], 16950: ['sgcip'], 16991: ['intel-rci-mp'], 16992: ['amt-soap-http'], 16993: ['amt-soap-https'], 16994: ['amt-redir-tcp'], 16995: ['amt-redir-tls'], 17007: ['isode-dua'], 17184: ['vestasdlp'], 17185: ['soundsvirtual'], 17219: ['chipper'], 17221: ['avdecc'], 17234: ['integrius-stp'], 17235: ['ssh-mgmt'], 17500: ['db-lsp'], 17729: ['ea'], 17754: ['zep'], 17755: ['zigbee-ip'], 17756: ['zigbee-ips'], 17777: ['sw-orion'], 36602: ['observium-agent'], 33331: ['diamondport'], 33333: ['dgi-serv'], 18000: ['biimenu'], 33334: ['speedtrace'], 18104: ['radpdf'], 18136: ['racf'], 18181: ['opsec-cvp'], 18182: ['opsec-ufp'], 18183: ['opsec-sam'], 18184: ['opsec-lea'], 18185: ['opsec-omi'], 18186: ['ohsc'], 18187: ['opsec-ela'], 18241: ['checkpoint-rtm'], 18242: ['iclid'], 18243: ['clusterxl'], 18262: ['gv-pf'], 18463: ['ac-cluster'], 18634: ['rds-ib'], 18635: ['rds-ip'], 18769: ['ique'], 18881: ['infotos'], 18888: ['apc-necmp'], 19000: ['igrid'], 19020: ['j-link'], 19191: ['opsec-uaa'], 19194: ['ua-secureagent'], 19283: ['keysrvr'], 19315: ['keyshadow'], 19398: ['mtrgtrans'], 36001: ['allpeers'], 19410: ['hp-sco'], 19411: ['hp-sca'], 19412: ['hp-sessmon'], 19539: ['fxuptp'], 19540: ['sxuptp'], 19541: ['jcp'], 19998: ['iec-104-sec'], 19999: ['dnp-sec'], 20000: ['dnp'], 20001: ['microsan'], 20002: ['commtact-http'], 20003: ['commtact-https'], 20005: ['openwebnet'], 20013: ['ss-idi'], 20014: ['opendeploy'], 20034: ['nburn-id'], 20046: ['tmophl7mts'], 20048: ['mountd'], 20049: ['nfsrdma'], 20167: ['tolfab'], 20202: ['ipdtp-port'], 20222: ['ipulse-ics'], 20480: ['emwavemsg'], 20670: ['track'], 20999: ['athand-mmp'], 21000: ['irtrans'], 21010: ['notezilla-lan'], 33434: ['traceroute'], 41794: ['crestron-cip'], 21553: ['rdm-tfs'], 21554: ['dfserver'], 21590: ['vofr-gateway'], 21800: ['tvpm'], 21845: ['webphone'], 21846: ['netspeak-is'], 21847: ['netspeak-cs'], 21848: ['netspeak-acd'], 21849: ['netspeak-cps'], 22000: ['snapenetio'], 22001: ['optocontrol'], 22002: ['optohost002'], 22003: ['optohost003'], 22004: ['optohost004'], 22005: ['optohost004'], 22125: ['dcap'], 22128: ['gsidcap'], 22273: ['wnn6'], 22305: ['cis'], 22343: ['cis-secure'], 22347: ['wibukey'], 22350: ['codemeter'], 22351: ['codemeter-cmwan'], 22537: ['caldsoft-backup'], 22555: ['vocaltec-wconf'], 22763: ['talikaserver'], 22800: ['aws-brf'], 22951: ['brf-gw'], 23000: ['inovaport1'], 23001: ['inovaport2'], 23002: ['inovaport3'], 23003: ['inovaport4'], 23004: ['inovaport5'], 23005: ['inovaport6'], 23053: ['gntp'], 23333: ['elxmgmt'], 23400: ['novar-dbase'], 23401: ['novar-alarm'], 23402: ['novar-global'], 23456: ['aequus'], 23457: ['aequus-alt'], 23546: ['areaguard-neo'], 24000: ['med-ltp'], 24001: ['med-fsp-rx'], 24002: ['med-fsp-tx'], 24003: ['med-supp'], 24004: ['med-ovw'], 24005: ['med-ci'], 24006: ['med-net-svc'], 24242: ['filesphere'], 24249: ['vista-4gl'], 24321: ['ild'], 24386: ['intel-rci'], 24465: ['tonidods'], 24554: ['binkp'], 36865: ['kastenxpipe'], 24676: ['canditv'], 24677: ['flashfiler'], 24678: ['proactivate'], 24680: ['tcc-http'], 24754: ['cslg'], 24922: ['find'], 25000: ['icl-twobase1'], 25001: ['icl-twobase2'], 25002: ['icl-twobase3'], 25003: ['icl-twobase4'], 25004: ['icl-twobase5'], 25005: ['icl-twobase6'], 25006: ['icl-twobase7'], 25007: ['icl-twobase8'], 25008: ['icl-twobase9'], 25009: ['icl-twobase10'], 25576: ['sauterdongle'], 25604: ['idtp'], 25793: ['vocaltec-hos'], 25900: ['tasp-net'], 25901: ['niobserver'], 25902: ['nilinkanalyst'], 25903: ['niprobe'], 26000: ['quake'], 26133: ['scscp'], 26208: ['wnn6-ds'], 26260: ['ezproxy'], 26261: ['ezmeeting'], 26262: ['k3software-svr'], 26263: ['k3software-cli'], 26486: ['exoline-tcp'], 26487: ['exoconfig'], 26489: ['exonet'], 27345: ['imagepump'], 27442: ['jesmsjc'], 27504: ['kopek-httphead'], 27782: ['ars-vista'], 27876: ['astrolink'], 27999: ['tw-auth-key'], 28000: ['nxlmd'], 28001: ['pqsp'], 32771: ['filenet-rmi'], 28200: ['voxelstorm'], 28240: ['siemensgsm'], 29167: ['otmp'], 29999: ['bingbang'], 30000: ['ndmps'], 30001: ['pago-services1'], 30002: ['pago-services2'], 30003: ['amicon-fpsu-ra'], 30260: ['kingdomsonline'], 30999: ['ovobs'], 31020: ['autotrac-acp'], 31416: ['xqosd'], 31457: ['tetrinet'], 31620: ['lm-mon'], 31685: ['dsx-monitor'], 31765: ['gamesmith-port'], 31948: ['iceedcp-tx'], 31949: ['iceedcp-rx'], 32034: ['iracinghelper'], 32249: ['t1distproc60'], 32483: ['apm-link'], 38201: ['galaxy7-data'], 38202: ['fairview'], 38203: ['agpolicy'], 32635: ['sec-ntb-clnt'], 32636: ['dmexpress'], 32767: ['filenet-powsrm']}
-tcp_service_to_ports = {'system-monitor': [2609], 'zannet': [317], 'synapsis-edge': [5008], 'appserv-https': [4849], 'orbix-loc-ssl': [3077], 'clvm-cfg': [1476], 'accessnetwork': [699], 'metrics-pas': [1824], 'sync-em7': [7707], 'rtps-discovery': [7400], 'icg-swp': [2062], 'ibm-dial-out': [3267], 'artifact-msg': [3518], 'omstopology': [4162], 'afs3-update': [7008], 'bmc-gms': [10129], 'pgps': [9280], 'fsportmap': [4349], 'citrixima': [2512], 'taiclock': [4014], 'h323callsigalt': [11720], 'winqedit': [7395], 'banyan-rpc': [567], 'ct2nmcs': [7023], 'iceedcp-rx': [31949], 'panasas': [3095], 'lispworks-orb': [3672], 'anthony-data': [1206], 'ipdtp-port': [20202], 'picknfs': [1598], 'tritium-can': [4876], 'mcftp': [6622], 'ntz-p2p-storage': [6778], 'jboss-iiop-ssl': [3529], 'starbot': [2838], 'contclientms': [4665], 'asgcypresstcps': [11489], 'esp-encap': [2797], 'brcm-comm-port': [3188], 'mlsn': [32801], 'sds-admin': [2705], 'vacdsm-app': [671], 'incognitorv': [3139], 'hart-ip': [5094], 'sugp': [1905], 'directnet': [3447], 'commonspace': [1592], 'lansurveyor': [4347], 'aes-discovery': [3224], 'tungsten-https': [9443], 'cruise-config': [8378], 'fast-rem-serv': [2495], 'netinfo-local': [1033], 'dna': [2287], 'event-listener': [3017], 'syncserver': [2647], 'mcs-fastmail': [3302], 'dnp': [20000], 'ezmeeting-2': [10101], 'dnx': [3998], 'nessus': [1241], 'pcsync-http': [8444], 'excw': [1271], 'acplt': [7509], 'jms': [5673], 'dpcp': [4099], 'caspssl': [1131], 'exce': [2769], 'netgw': [741], 'eristwoguns': [2650], 'radwiz-nms-srv': [2736], 'lisp-data': [4341], 'messageservice': [2311], 'nowcontact': [3167], 'vpps-qua': [672], 'kpasswd': [464], 'smtp': [25], 'niobserver': [25901], 'opswmanager': [3977], 'hp-collector': [381], 'neveroffline': [2614], 'netclip': [2971], 'rsom': [2889], 're101': [1343], 'msiccp': [1731], '3com-tsmux': [106], 'ctlptc': [2153], 'sitaradir': [2631], 'at-8': [208], 'hp-clic': [3384], 'at-5': [205], 'at-7': [207], 'openvms-sysipc': [557], 'at-3': [203], 'sdclient': [2310], 'smakynet': [122], 'wins': [1512], 'alias': [1187], 'ezproxy': [26260], 'simslink': [2676], 'iposplanet': [7031], 'cs-auth-svr': [3113], 'fis': [5912], 'accuracer-dbms': [12008], 'dec_dlm': [625], 'concurrent-lm': [1648], 'vseconnector': [2893], 'xqosd': [31416], 'blizwow': [3724], 't1-e1-over-ip': [3175], 'nupaper-ss': [12121], 'nasmanager': [1960], 'streetperfect': [1330], 'firstcall42': [2673], 'webmethods-b2b': [2907], 'acme': [9216], 'acms': [3980], 'must-backplane': [3515], 'wsdapi': [5357], 'vipera': [12012], 'cns-srv-port': [2976], 'snaresecure': [1684], 'mdm': [7871], 'uadtc': [2767], 'ptp-event': [319], 'odette-ftps': [6619], 'websm': [9090], 'rtsps': [322], 'msl_lmd': [1464], 'ice-slocation': [4062], 'dsp': [33], 'drm-production': [7171], 'snapenetio': [22000], 'ezmessagesrv': [4085], 'dsf': [555], 'aker-cdp': [2473], 'dsc': [3390], 'otpatch': [2936], 'erunbook_server': [9617], 'trident-data': [7727], 'skytelnet': [1618], 'cgi-starapi': [3893], 'hpdevms': [5317], 'oa-system': [8022], 'entrust-aams': [681], 'eoss': [1210], 'banyan-vip': [573], 'ats': [2201], 'surfpass': [5030], 'ds-srv': [4400], 'asci-val': [1560], 'xic': [6115], 'ccm-port': [3575], 'swldy-sias': [1250], 'cl-db-request': [4136], 'wiegand': [4390], 'lanyon-lantern': [1682], 'ibm-rsyscon': [9085], 'fatpipe': [3353], 'ianywhere-dbns': [3968], 'iqserver': [2527], 'rusb-sys-port': [3422], 'iwec': [4801], 'rsmtp': [2390], 'msft-gc-ssl': [3269], 'ups-onlinet': [7010], 'lv-jc': [2143], 'mpsysrmsvr': [3358], 'nas-metering': [2286], 'bspne-pcc': [1252], 'mxit': [9119], 'cl-1': [172], 'ampl-tableproxy': [5196], 'fisa-svc': [7018], 'cybercash': [551], 'owms': [7878], 'beacon-port': [3124], 'vcnet-link-v10': [2554], 'gtp-control': [2123], 'wello': [4177], 'dtv-chan-req': [2253], 'rt-helper': [35006], 'camp': [4450], 'ssmpp': [3550], 'csoauth': [7847], 'hhb-handheld': [4148], 'dj-ice': [5419], 'sgcp': [440], 'igrs': [3880], 'rbr-discovery': [3553], 'zenginkyo-2': [5021], 'zenginkyo-1': [5020], 'cartographerxmp': [5270], 'hillrserv': [4117], 'informatik-lm': [1428], 'nsws': [3049], 'ftp-agent': [574], 'call-sig-trans': [2517], 'smc-http': [6788], 'navisphere': [2162], 'board-roar': [9700], 'microtalon-com': [7014], 'plato': [3285], 'magicom': [2243], 'abb-escp': [6316], 'oirtgsvc': [4141], 'comcam': [2108], 'nntps': [563], 'asipregistry': [687], 'msfw-storage': [2171], 'cdc': [223], 'scc-security': [582], 'npmp': [8450], 'ci3-software-2': [1302], 'wago-io-system': [2455], 'mcreport': [8003], 'ci3-software-1': [1301], 'wspipe': [4431], 'krb524': [4444], 'gprs-data': [3386], 'pads': [7237], 'radius': [1812], 'bess': [3960], 'peerbook-port': [3135], 'xns-auth': [56], 'irc': [194], 'caupc-remote': [2122], 'kme-trap-port': [2081], 'ias-session': [4594], 'cambertx-lm': [1734], 'iceedcp-tx': [31948], 'voxelstorm': [28200], 'tvnetworkvideo': [3791], 'login': [513], 'esip': [2950], 'gopher': [70], 'afpovertcp': [548], 'dicom': [11112], 'hyperscsi-port': [5674], 'privilege': [2588], 'inova-ip-disco': [2716], 'retrospect': [497], 'servistaitsm': [3636], 'mac-srvr-admin': [660], 'exbit-escp': [1316], 'isi-irp': [3226], 'csms2': [3400], 'aftmux': [3917], 'commerce': [542], 'manet': [269], 'drmsmc': [1878], 'tivoconnect': [2190], 'bvcontrol': [1236], 'dbsa-lm': [1407], 'sdo-tls': [3896], 'unot': [5055], 'netconf-ssh': [830], 'oveadmgr': [7427], 'videte-cipc': [1927], 'mirrtex': [4310], 'ctisystemmsg': [4451], 'aol-2': [5192], 'aol-3': [5193], 'dhe': [3252], 'aol-1': [5191], 'meregister': [669], 'vocaltec-admin': [1796], 'swismgr2': [6964], 'ars-vista': [27782], 'neteh': [3828], 'cpudpencap': [2746], 'tunatic': [5747], 'smbdirect': [5445], 'rap-listen': [1531], 'erunbook-agent': [9616], 'simple-tx-rx': [2257], 'na-localise': [5062], 'sigma-port': [3614], 'tcim-control': [2729], 'ovsam-d-agent': [3870], 'nicname': [43], 'hao': [2245], 'j-ac': [4107], 'rsms': [10201], 'hap': [661], 'pushns': [7997], 'xingcsm': [2327], 'pwgippfax': [3951], 'vlsi-lm': [1500], 'fcp-cics-gw1': [5504], 'tcpdataserver': [3805], 'proshare-mc-2': [1674], 'llm-csv': [2814], 'wap-wsp-wtp-s': [9203], 'rt-devicemapper': [35003], 'irapp': [4073], 'bmc-ctd-ldap': [6301], 'genisar-port': [3475], 'sabarsd': [8401], 'fcp': [510], 'bmc-net-svc': [1770], 'vatp': [690], 'exonet': [26489], 'lockstep': [2125], 'bcslogc': [13216], 'nvcnet': [3999], 'hpvmmcontrol': [1124], 'ums': [2248], 'emgmsg': [6656], 'netwall': [533], 'uma': [144, 1797], 'us-cli': [8082], 'synotics-relay': [391], 'qsnet-cond': [4357], 'vpsipport': [2649], 'remoteware-un': [2999], 'pmcp': [3821], 'pmcs': [6355], 'kfserver': [5343], 'oraclenames': [1575], 'radware-rpm-s': [2189], 'pmcd': [44321], 'ticf-2': [493], 'ticf-1': [492], 'gt-proxy': [9889], 'laes-bf': [9536], 'bmc-net-adm': [1769], 'qadmifevent': [2462], 'wbem-http': [5988], 'snmptrap': [162], 'sos': [3838], 'camac': [3545], 'mtl8000-matrix': [8115], 'jetstream': [6901], 'device2': [2030], 'brlp-1': [4102], 'brlp-0': [4101], 'brlp-3': [4104], 'apparenet-tps': [3237], 'tams': [2726], 'gat-lmd': [1708], 'bluectrlproxy': [2277], 'apc-7846': [7846], 'apc-7845': [7845], 'mptn': [397], 'atex-elmd': [1385], 'eppc': [3031], 'pcc-mfp': [2256], 'twamp-control': [862], 'flashmsg': [2884], 'qpasa-agent': [2612], 'dali-port': [5777], 'raven-rdp': [3533], 'afs3-callback': [7001], 'sco-websrvrmgr': [620], 'ampr-info': [1535], 'sai-sentlm': [2640], 'astrolink': [27876], 'omserv': [764], 'sco-websrvrmg3': [598], 'soagateway': [5250], 'abarsd': [8402], 'pslserver': [2352], 'citrixupp': [7228], 'pnrp-port': [3540], 'xmcp': [4788], 'vnsstr': [3321], 'time': [37], 'osp': [5045], 'cisco-avp': [8470], 'ace-proxy': [2335], 'med-supp': [24003], 'speedtrace': [33334], 'dragonfly': [8913], 'xprtld': [5634], 'argis-ds': [2582], 'surfcontrolcpa': [3909], 'lrp': [2090], 'mindfilesys': [7391], 'msgclnt': [8786], 'microtalon-dis': [7013], 'ibprotocol': [6714], 'qnxnetman': [3385], 'phrelaydbg': [4869], 'idp-infotrieve': [2966], 'novell-lu6.2': [1416], 'net8-cman': [1830], 'pc-mta-addrmap': [2246], 'sercomm-wlink': [2235], 'corel-vncadmin': [2654], 'corba-iiop-ssl': [684], 'spt-automation': [5814], 'spamtrap': [2568], 'apogeex-port': [3184], 'mdbs-daemon': [800], 'nuts-bootp': [4133], 'rmonitor-secure': [5145], 'monetra-admin': [8666], 'sysinfo-sp': [11967], 'htrust': [5628], 'abacus-remote': [2894], 'nimbusdb': [48004], 'ftranhc': [1105], 'xingmpeg': [1558], 'sxuptp': [19540], 'gbs-smp': [3762], 'ipr-dglt': [3678], 'ida-discover1': [5741], 'areaguard-neo': [23546], 'ida-discover2': [5742], 'checksum': [1386], 'timbuktu': [407], 'nucleus-sand': [1201], 'stanag-5066': [5066], 'h323hostcallsc': [1300], 'mos-aux': [10542], 'ipp': [631], 'index-pc-wb': [2127], 'ipx': [213], 'repliweb': [2837], 'macon-tcp': [456], 'csregagent': [3022], 'start-network': [3615], 'vsinet': [996], 'compaq-wcp': [2555], 'mobile-p2p': [4688], 'nvmsgd': [3519], 'srcp': [4303], 'iso-ill': [499], 'bintec-admin': [2107], 'igrid': [19000], 'hks-lm': [1722], 'gsmp-ancp': [6068], 'webster': [765], 'sky-transport': [3556], 'afs3-kaserver': [7004], 'rap-service': [1530], 'pd-admin': [9597], 'hcp-wismar': [686], 'smartpackets': [3218], 'netarx': [1040], 'snapp': [2333], 'connlcli': [1358], 'slush': [1966], 'seagulllms': [1291], 'data-port': [3578], 'pslicser': [4168], 'cert-initiator': [1639], 'aairnet-2': [3619], 'dnsix': [90], 'avocent-adsap': [3871], 'kryptolan': [398], 'peoctlr': [9630], 'sd': [9876], 'at-nbp': [202], 'ttc': [2483], 'ldoms-migr': [8101], 'pn-requester2': [2718], 'qmvideo': [5689], 'novell-ipx-cmd': [2645], 'reachout': [43188], 'synapse-nhttp': [8280], 'genstat': [7283], 'global-wlink': [1909], 'netiq-qcheck': [10114], 'netsupport': [5405], 'ovsessionmgr': [2389], 'redstorm_info': [2348], 'idig_mux': [4152], 'radware-rpm': [2188], 'afesc-mc': [6628], 'echonet': [3610], 'cisco-tna': [131], 'kz-migr': [8102], 'wbem-exp-https': [5990], 'direcpc-dll': [1844], 'optiwave-lm': [2524], 't1distproc60': [32249], 'minipay': [2105], 'pscupd': [3453], 'pcc-image-port': [3892], 'nattyserver': [3753], 'payrouter': [1246], 'netlabs-lm': [1406], 'iatp-normalpri': [6999], 'sdproxy': [1297], 'softrack-meter': [3884], 'covia': [64], 'pentbox-sim': [6817], 'h323hostcall': [1720], 'dhcp-failover2': [847], 'xserveraid': [3722], 'mgemanagement': [4680], 'parsec-game': [6582], 'netspeak-is': [21846], 'cnrprotocol': [1096], 'rmt': [411], 'hpoms-dps-lstn': [5404], 'isg-uda-server': [2551], 'ctx-bridge': [3127], 'fmp': [4745], 'pmas': [4066], 'kftp': [6621], 'hippad': [2988], 'donnyworld': [1821], 'starfish': [3981], 'bhoedap4': [352], 'dvt-system': [3246], 'netrisk': [1799], 'bmc-ar': [2494], 'namemunge': [3950], 'profinet-rtm': [34963], 'tcp-id-port': [1999], 'savant': [3391], 'smpp': [2775], 'hpssmgmt': [4484], 'hpbladems': [5316], 'hp-webqosdb': [1877], 'spugna': [3807], 'stun-behavior': [3478], 'wap-vcard': [9204], 'sac': [8097], 'cloanto-net-1': [356], 'vrtl-vmf-sa': [2074], 'ssrip': [3318], 'icslap': [2869], 'nimbusdbctrl': [48005], 'phoenix-rpc': [3347], 'canex-watch': [3583], 'msexch-routing': [691], 'hybrid-pop': [473], 's3db': [2278], 'capioverlan': [1147], 'dellwebadmin-2': [1279], 'dellwebadmin-1': [1278], 'siemensgsm': [28240], 'icmpd': [5813], 'printer': [515], 'synotics-broker': [392], 'rtraceroute': [3765], 'synchromesh': [4548], 'avt-profile-1': [5004], 'avt-profile-2': [5005], 'funk-dialout': [2909], 'aequus': [23456], 'printer-agent': [3396], 'nimsh': [3901], 'elan': [1378], 'ss-idi': [20013], 'elad': [1893], 'edm-adm-notify': [3463], 'legent-1': [373], 'legent-2': [374], 'etebac5': [1216], 'powerclientcsf': [2443], 'transact': [1869], 'qip-qdhcp': [2490], 'mercury-disc': [9596], 'tr-rsrb-port': [1996], 'canit_store': [6568], 'cuseeme': [7648], 'pago-services2': [30002], 'cas-mapi': [3682], 'pxc-epmap': [2434], 'admind': [3279, 8403], 'aicc-cmi': [3316], 'bl-idm': [142], 'ucentric-ds': [2879], 'whoami': [565], 'canditv': [24676], 'aurora-cmgr': [364], 'bdir-priv': [6507], 'ms-streaming': [1755], 'mc-gt-srv': [2180], 'altav-remmgt': [2456], 'ripng': [521], 'fintrx': [3787], 'choiceview-clt': [4316], 'dyna-access': [3310], 'netspeak-cps': [21849], 'sfm-db-server': [5636], 'sshell': [614], 'clutild': [7174], 'csedaemon': [5232], 'decbsrv': [579], 'madcap': [2535], 'brdptc': [2155], 'imip-channels': [11320], 'metaedit-mu': [6360], 'nexstorindltd': [2360], 'irdmi2': [7999], 'netxms-sync': [4702], 'bpcd': [13782], 'sysrqd': [4094], 'upsnotifyprot': [2648], 'sentinel': [3588], 'telesis-licman': [1380], 'bsquare-voip': [1071], 'patrol-snmp': [8161], 'pcsync-https': [8443], 'mni-prot-rout': [3764], 'omsdk': [5724], 'whosells': [2781], 'fmpro-internal': [5003], 'bpjava-msvc': [13722], 'stun-p2': [1991], 'stun-p3': [1992], 'airsync': [2175], 'stun-p1': [1990], 'statsci2-lm': [6145], 'iapp': [2313], 'ibus': [8733], '9pfs': [564], 'syserverremote': [6418], 'lot105-ds-upd': [2053], 'jute': [5883], 'kazaa': [1214], 'kentrox-prot': [2502], 'xss-port': [3510], 'h263-video': [2979], 'oemcacao-websvc': [11175], 'commandport': [3416], 'lv-ffx': [2144], 'fs-server': [8043], 'ottp': [2951], 'hostname': [101], 'd2ddatatrans': [9388], 'sfs-config': [452], 'trivnet1': [8200], 'trivnet2': [8201], 'rfio': [3147], 'casanswmgmt': [3669], 'zsecure': [7173], 'mzca-action': [7282], 'virtual-places': [1533], 'wired': [4871], 'boks_servm': [6502], 'rds2': [1541], 'boks_servc': [6501], 'vestasdlp': [17184], 'supdup': [95], 'raxa-mgmt': [6099], 'qsm-proxy': [1164], 'hivestor': [4884], 'genie': [402], 'estamp': [1982], 'itm-lm': [2828], 'lorica-in': [4080], 'ias-paging': [4595], 'asdis': [2192], 'caids-sensor': [1192], 'wap-vcal-s': [9207], 'ace-svr-prop': [2476], 'qsm-remote': [1166], 'kti-icad-srvr': [6701], 'filenet-peior': [32776], 'spmp': [656], 'kar2ouche': [4661], 'snare': [509], 'audiojuggler': [3643], 'n2h2server': [9285], 'roverlog': [3677], 'broker-service': [3014], 'iso-ip': [147], 'zephyr-clt': [2103], 'msdfsr': [5722], 'prismiq-plugin': [3650], 'autobuild': [5115], 'mynahautostart': [2388], 'sge_execd': [6445], 'acmsoda': [6969], 'purityrpc': [8117], 'rets-ssl': [12109], 'solaris-audit': [16162], 'lonworks2': [2541], 'ddt': [1052], 'wv-csp-sms': [3590], 'neod2': [1048], 'neod1': [1047], 'lanner-lm': [4547], 'xgrid': [4111], 'raid-cc': [2011], 'wap-pushsecure': [2949], 'uarps': [219], 'hpiod': [2208], 'vipremoteagent': [3752], 'aci': [187], 'acp': [599], 'net-steward': [2128], 'qsnet-trans': [4354], 'clariion-evr01': [6389], 'qrh': [752], 'ehtp': [1295], 'netobjects2': [2486], 'netobjects1': [2485], 's-openmail': [5767], 'noadmin': [1921], 'tgcconnect': [4146], 'ezproxy-2': [10102], 'sixxsconfig': [3874], '3link': [15363], 'saris': [4442], 'llm-pass': [2813], 'lkcmserver': [3278], 'rbsystem': [5693], 'mice': [5022], 'j-link': [19020], 'tripe': [4070], 'truckstar': [4725], 'remctl': [4373], 'prchat-server': [4456], 'af': [1411], 'intel_rci': [24386], 'pcanywherestat': [5632], 'ap': [47806], 'uis': [390], 'md-cg-http': [2688], 'trim-ice': [4323], 'jargon': [148], 'snifferdata': [2892], 'uucp': [540], 'targus-getdata': [5200], 'pehelp': [2307], 'sitewatch': [3792], 'mbus': [47000], 'questnotify': [3554], 'tn-tl-r1': [1580], 'aimpp-port-req': [2847], 'nei-management': [3886], 'xmlrpc-beep': [602], 'lbc-sync': [2779], 'onmux': [417], 'actifio-c2c': [5103], 'dn6-smm-red': [196], 'masc': [2587], 'adap': [6350], 'rxe': [761], 'ssdp': [1900], 'cps': [14250], 'kyoceranetdev': [1063], 'tnmpv2': [3686], 'scp': [3820], 'pdnet': [2843], 'jacobus-lm': [1578], 'omhs': [5723], 'sis-emt': [2545], 'smile': [3670], 'zmp': [3925], 'altova-lm': [35355], 'nppmp': [3476], 'blockade': [2911], 'grf-port': [3757], 'mainsoft-lm': [1593], 'xo-wave': [3763], 'egptlm': [3328], 'openqueue': [8764], 'mentaserver': [2118], 'gadugadu': [8074], 'salient-usrmgr': [5410], 'essbase': [1423], 'assuria-ins': [4704], 'bvcdaemon-port': [3626], 'philips-vc': [583], 'elcn': [7101], 'dvl-activemail': [1396], 'iqobject': [48619], 'is99c': [379], 'iw-mmogame': [3596], 'lcm-server': [7365], 'is99s': [380], 'uohost': [3314], 'pra_elmd': [1587], 'njenet-ssl': [2252], 'b2n': [1179], 'udp-sr-port': [1624], 'abatemgr': [3655], 'irc-serv': [529], 'bdp': [581], 'x-bone-api': [2165], 'sonuscallsig': [2569], 'pqsp': [28001], 'vid': [769], 'objectmanager': [2038], 'int-rcv-cntrl': [3603], 'send': [169], 'amx-rms': [3839], 'ohimsrv': [506], 'mtrgtrans': [19398], 'ipsec-nat-t': [4500], 'serverview-icc': [3173], 'neon24x7': [3213], 'nomad': [5209], 'doom': [666], 'csc_proxy': [4187], 'fibotrader-com': [6715], 'ip-provision': [43190], 'iracinghelper': [32034], 'tapestry': [1922], 'netbill-cred': [1614], 'rapidmq-center': [3093], 'supermon': [2709], 'starschool': [2270], 'dab-sti-c': [1076], 'seclayer-tcp': [3495], 'seaodbc': [2471], 'geognosis': [4326], 'viziblebrowser': [1868], 'solid-mux': [1029], 'netxms-mgmt': [4701], 'jwpc': [16020], 'serverstart': [9213], 'playsta2-lob': [4659], 'eyelink': [589], 'wv-csp-sms-cir': [3716], 'l3-hbmon': [2370], 'csrpc': [5063], 'mc2studios': [1899], 'rootd': [1094], 'pnbscada': [3875], 'pscribe': [6163], 'npep-messaging': [2868], 'cybro-a-bus': [8442], 'dialog-port': [2098], 'itap-ddtp': [10100], 'mupdate': [3905], 'asa-appl-proto': [502], 'pegasus': [9278], 'hsl-storm': [2113], 'worldscores': [4545], 'e-builder': [4121], 'sd-request': [2384], 'found': [4411], 'gc-config': [3436], 'stat-cc': [4158], 'l3-hawk': [2842], 'spramsd': [5770], 'netmagic': [1196], 'symantec-sfdb': [5629], 'onehome-remote': [2198], 'nm-game-admin': [3148], 'codima-rtp': [2415], 'opsec-omi': [18185], 'bccp': [4175], 'infiniswitchcl': [3602], 'rexecj': [8230], 'custix': [528], 'rtelnet': [107], 'advant-lm': [2295], 'atmp': [5150], 'pda-sys': [3254], 'newheights': [2114], 'escp-ip': [621], 'redstone-cpss': [2928], 'sstp-2': [9801], 'sstp-1': [7743], 'dcutility': [1044], 'playsta2-app': [4658], 'pvxpluscs': [4093], 'radpdf': [18104], 'spearway': [2440], 'spocp': [4751], 'dfn': [1133], 'tn-tl-fd2': [1584], 'tn-tl-fd1': [476], 'candrp': [42509], 'raid-am': [2013], 'agpolicy': [38203], 'gtrack-ne': [3592], 'tnos-sp': [7901], 'lnvmaps': [2284], 'shockwave2': [1257], 'aap': [2878], 'aas': [1601], 'bcs-broker': [1704], 'equationbuilder': [1351], 'rbt-smc': [7870], 'netiq-endpt': [10115], 'wafs': [4049], 'softcm': [6110], 'telnetcpcd': [3696], 'ctdp': [7022], 'hacl-test': [5305], 'slinkysearch': [1225], 'quasar-server': [3599], 'netmo-default': [6841], 'scservp': [3637], 'swx-gate': [4538], 'freezexservice': [7726], 'e-design-web': [6703], 'asgenf': [5727], 'cylink-c': [5420], 'atmtcp': [2812], 'privatechat': [1735], 'citriximaclient': [2598], 'universe_suite': [4184], 'fg-fps': [3293], 'itach': [8184], 'ctdb': [4379], 'ssr-servermgr': [45966], 'unieng': [5730], 'dmaf-server': [3574], 'finisar': [4682], 'trusted-web': [3011], 'winjaserver': [1290], 'swiftnet': [1751], 'condor': [9618], 'sossd-agent': [7982], 'minilock': [3798], 'imtc-mcs': [1503], 'kastenchasepad': [2918], 'bmc-ea': [3683], 'adcp': [7508], 'crs': [507], 'bytex': [1375], 'sde-discovery': [5152], 'rfb': [5900], 'rfa': [4672], 'rfe': [5002], 'shiva_confsrvr': [1651], 'set': [257], 'sep': [2089], 'res-sap': [3163], 'dbabble': [8132], 'nimgtw': [48003], 'remotefs': [556], 't128-gateway': [1627], 'urld-port': [3534], 'talon-webserver': [7015], 'rtsserv': [2500], 'synchronet-db': [6100], 'dwnmshttp': [3227], 'pds': [9595], 'rmonitor_secure': [5145], 'connection': [2607], 'badm-priv': [6505], 'pdb': [3033], 'community': [2459], 'pda-data': [3253], 'joajewelsuite': [6583], 'hpppssvr': [2448], 'acter': [4671], 'irtrans': [21000], 'agentx': [705], 'apc-necmp': [18888], 'otmp': [29167], 'maxim-asics': [3276], 'laplink': [1547], 'isi-gl': [55], 'osm-appsrvr': [9990], 'kerberos': [88], '3m-image-lm': [1550], 'dvbservdsc': [3937], 'oce-snmp-trap': [2697], 'partimage': [4025], 'jini-discovery': [4160], 'netmon': [2606], 'isoft-p2p': [3501], 'blockade-bpsp': [2574], 'smpppd': [3185], 'sixnetudr': [1658], 'robix': [9599], 'xdsxdm': [6558], 'ipass': [2549], 'gxs-data-port': [2073], 'bflckmgr': [3966], 'kofax-svr': [2424], 'jwalkserver': [1289], 'vop': [4433], 'optika-emedia': [1829], 'tserver': [450], 'scp-config': [10001], 'onscreen': [5080], 'efi-mg': [2224], 'fs-agent': [8042], 'infoman': [1451], 'softaudit': [3419], 'rapidmq-reg': [3094], 'plbserve-port': [3933], 'ncr_ccl': [2528], 'redstorm_find': [2347], 'unify-debug': [4867], 'mppolicy-mgr': [5969], 'mpshrsv': [1261], 'pxc-sapxom': [2680], 'nuts-dem': [4132], 'ciscocsdb': [43441], 'xecp-node': [3940], 'netmount': [2061], 'aries-kfinder': [7570], 'wsdl-event': [4879], 'xnds': [2157], 'mysql': [3306], 'blueberry-lm': [1432], 'sun-sr-iiop': [6485], 'watcomdebug': [3563], 'ibm-cics': [1435], 'opequus-server': [2400], 'hfcs-manager': [4999], 'amiganetfs': [2100], 'rdmnet-ctrl': [5569], 'skip-cert-recv': [6455], 'qsoft': [3059], 'ncdloadbalance': [2683], 'blackjack': [1025], 'proshare-mc-1': [1673], 'oc-lm': [1448], 'redstorm-join': [2346], 'ecomm': [3477], 'personalos-001': [3557], 'sun-as-jpda': [9191], 'ml-svnet': [4171], 'sanity': [643], 'dzdaemon': [3866], 'efidiningport': [2553], 'futrix': [2358], 'hde-lcesrvr-2': [14937], 'hde-lcesrvr-1': [14936], 'santools': [4079], 'ftps-data': [989], 'rfmp': [2249], 'bb': [1984], 'pctrader': [3048], 'hydap': [15000], 'mxodbc-connect': [6632], 'bdir_priv': [6507], 'serverviewdbms': [9212], 'dsx_monitor': [31685], 'tqdata': [2700], 'vstat': [7779], 'scenccs': [7129], 'appserv-http': [4848], 'cycleserv': [763], 'rdc-wh-eos': [3142], 'tambora': [9020], 'gmrupdateserv': [1070], 'jaxer-manager': [4328], 'integral': [3459], 'intv': [1585], 'rsvp_tunnel': [363], 'miva-mqs': [1277], 'ncpm-hip': [1683], 'submit': [773], 'dsfgw': [438], 'bmc-data-coll': [3695], 'ndmps': [30000], 'audit-transfer': [1146], 'statsrv': [133], 'edb-server1': [1635], 'edb-server2': [3711], 'linx': [1361], 'ocs-cmu': [428], 'link': [245], 'macromedia-fcs': [1935], 'newgenpay': [3165], 'qo-secure': [7913], 'icg-bridge': [2063], 'cis': [22305], 'sna-cs': [1553], 'filecast': [3401], 'influence': [3345], 'sun-sr-iiops': [6486], 'trap-port-mom': [3858], 'opendeploy': [20014], 'ovsam-mgmt': [3869], 'k-block': [287], 'timestenbroker': [3754], 'wnn6': [22273], 'fyre-messanger': [2731], 'amqp': [5672], 'wfremotertm': [1046], 'ingres-net': [134], 'owamp-control': [861], 'kiosk': [1061], 'hivep': [12172], 'bzflag': [5154], 'servexec': [2021], 'vrts-tdd': [14149], 'igo-incognito': [4100], 'index-net': [2970], 'hello': [1789], 'iascontrol': [1157], 'stgxfws': [1226], 'dlswpn': [2067], 'ilss': [4802], 'qvr': [5028], 'rsisysaccess': [2752], 'ibm-db2': [523], 'ospf-lite': [8899], 'x9-icue': [1145], 'troff': [2014], 'directvdata': [3287], 'netmpi': [3827], 'documentum': [10002], 'enfs': [5233], 'nlg-data': [5299], 'cgn-config': [2183], 'evm': [1139], 'flcrs': [5638], 'racf': [18136], 'univ-appserver': [1233], 'fpo-fns': [1066], 'gdp-port': [1997], 'tpcsrvr': [2078], 'trp': [2156], 'unihub-server': [2357], 'fmpro-v6': [5013], 'itose': [4348], 'travsoft-ipx-t': [2644], 'l2f': [1701], 'uec': [8778], 'data-insurance': [2764], 'ionixnetmon': [7410], 'rdlap': [2321], 'cbserver': [3388], 'gprs-cube': [3751], 'edm-mgr-sync': [3464], 'cl-db-attach': [4135], 'vmsvc-2': [7025], 'qb-db-server': [10160], 'g2tag': [4110], 'powerburst': [485], 'kv-server': [3360], 'dic-aida': [1941], 'dyniplookup': [3295], 'wsm-server-ssl': [5007], 'jetformpreview': [2097], 'ctp': [3772], 'rds': [1540], 'stvp': [3158], 'ora-oap': [5575], 'ctf': [84], 'xmpv7': [7430], 'rda': [630], 'gv-pf': [18262], 'firefox': [1689], 'msgsrvr': [8787], 'emcrmird': [10005], 'wcr-remlib': [4845], 'winpharaoh': [6065], 'mindprint': [8033], 'boxp': [9380], 'metatude-mds': [6382], 'brvread': [1054], 'nuts_bootp': [4133], 'sti-envision': [1312], 'radius-dynauth': [3799], 'connect-client': [3441], 'ttc-etap-ns': [2977], 'emprise-lls': [3585], 'opsec-uaa': [19191], 'icl-twobase10': [25009], 'conclave-cpp': [2491], 'ndm-requester': [1363], 'elvin_client': [2917], 'ddgn': [4167], 'redwood-chat': [3032], 'agri-gateway': [3026], 'metaconsole': [2850], 's-net': [166], 'mumps': [188], 'caaclang2': [5249], 'tvdumtray-port': [3492], 'blocks': [10288], 'taskmaster2000': [2402, 2403], 'k3software-svr': [26262], 'sentinel-ent': [3712], 'sun-sr-iiop-aut': [6487], 'raqmon-pdu': [7744], 'vinainstall': [4344], 'precise-sft': [2315], 'hawk': [7630], 'npp': [92, 4045], 'anet-h': [3341], 'issd': [1600], 'dyn-site': [3932], 'tarantella': [3144], 'suncacao-csa': [11164], 'm2pa': [3565], 'bts-appserver': [1961], 'urbisnet': [2745], 'bootserver': [2016], 'houston': [4041], 'aplx': [1134], 'ulistproc': [372], 'cmadmin': [2617], 'ns-cfg-server': [3266], 'netopia-vo2': [1840], 'veritas-vis2': [2994], 'veritas-vis1': [2993], 'strexec-d': [5026], 'asc-slmd': [4448], 'astergatefax': [9107], 'decap': [403], 'liebdevmgmt_dm': [3028], 'openvpn': [1194], 'pptconference': [1711], 'iwg1': [7071], 'rgtp': [1431], 'bv-is': [3990], 'manage-exec': [2342], 'ucontrol': [13894], 'tick-port': [3200], 'sun-sr-jms': [6484], 'sun-sr-jmx': [6488], 'faxcomservice': [6417], 'caldsoft-backup': [22537], 'pegasus-ctl': [9279], 'sun-as-nodeagt': [4850], 'avanti-cdp': [4065], 'faximum': [7437], 'dhct-status': [4675], 'sge-qmaster': [6444], 'origo-sync': [11103], 'pdrncs': [3299], 'idfp': [549], 'drmsfsd': [4098], 'bmc-patroldb': [1313], 'fhsp': [1807], 'tempo': [526], 'netwave-ap-mgmt': [2411], 'apollo-gms': [2759], 'callwaveiam': [9283], 'aviva-sna': [2238], 'netangel': [2442], 'uucp-rlogin': [541], 'liebdevmgmt-dm': [3028], 'anet-b': [3338], 'ayiya': [5072], 'llmnr': [5355], 'qubes': [1341], 'patrol-coll': [6162], 'qsnet-assist': [4356], 'plysrv-https': [6771], 'winpoplanmess': [1152], 'anet-m': [3340], 'unimobilectrl': [2927], 'anet-l': [3339], 'gcsp': [3429], 'ansoft-lm-2': [1084], 'ansoft-lm-1': [1083], 'odmr': [366], 'l2tp': [1701], 'groove-dpp': [1211], 'dsmcc-config': [13818], 'mdc-portmapper': [685], 'matahari': [49000], 'kpdp': [5253], 'cuillamartin': [1356], 'lpsrecommender': [2620], 'instl_bootc': [1068], 'instl_boots': [1067], 'aironetddp': [2887], 'zarkov': [2989], 'lmsocialserver': [1111], 'fxp': [286, 2849], 'nsc-ccs': [2604], 'plgproxy': [2790], '3par-mgmt-ssl': [5783], 'pvsw-inet': [2441], 'visd': [9284], 'device': [801], 'gnutella-svc': [6346], 'imgames': [1077], 'rrdp': [5313], 'repsvc': [6320], 'pxc-spvr': [4006], '3par-evts': [5781], 'pammratc': [1632], 'dbm': [2345], 'eicon-server': [1438], 'novell-zen': [2544], 'sonardata': [2863], 'mshvlm': [6600], 'esbroker': [1342], 'cgn-stat': [2182], 'unifyadmin': [2696], 'hmmp-op': [613], 'dsetos': [378], 'accel': [4108], 'abbs': [4885], 'lds-distrib': [6543], 'netcomm1': [1676], 'omnisky': [2056], 'precise-comm': [5630], 'pktcablemmcops': [3918], 'xss-srv-port': [3646], 'dnc-port': [3448], 'rscd': [5750], 'qtp': [2935], 'comotionback': [2262], 'manyone-xml': [8911], 'tl1': [2361], 'snip-slave': [33656], 'tscchat': [2330], 'rich-cp': [2057], 'tnos-dps': [7903], 'elvin_server': [2916], 'mtn': [4691], 'indigo-vrmi': [8130], 'ets': [1569], 'etp': [1798], 'odnsp': [9966], 'nnsp': [433], 'ramp': [7227], 'utmpsd': [430], 'secure-ts': [9318], 'mapper-ws_ethd': [3986], 'volley': [3625], 'net-projection': [5363], 'opencore': [4089], 'cm': [5910], 'pcptcpservice': [4182], 'autodesk-lm': [1422], 'iiw-port': [3186], 'rpki-rtr': [323], 'boks-servc': [6501], 'rdb-dbs-disp': [1571], 'dhcpv6-client': [546], 'boks-servm': [6502], 'ispipes': [2853], 'winddlb': [1565], 'fs-rh-srv': [3488], 'quotad': [762], 'gte-samp': [2643], 'vfbp': [6678], 'ftsrv': [1359], 'ua-secureagent': [19194], 'dist-upgrade': [3624], 'sai_sentlm': [2640], 'graphics': [41], 'c3': [2472], 'descent3': [2092], 'netdb-export': [1329], '1ci-smcs': [3091], '4-tieropmcli': [2934], 'apparenet-ui': [3239], 'cvd': [8400], 'cvc': [1495], 'redstorm-find': [2347], 'dsmcc-download': [13821], 'gdbremote': [2159], 'tl1-raw': [3082], 'sstsys-lm': [1692], 'erp-scale': [5135], 'unizensus': [1151], 'taserver': [3552], 'netchat': [2451], 'rlm-admin': [5054], 'corba-iiop': [683], 'newbay-snc-mc': [16900], 'uuidgen': [697], 'eims-admin': [4199], 'sentinel-lm': [5093], 'cluster-disc': [3374], 'at-echo': [204], 'omviserver': [4428], 'cssp': [4078], 'jwpc-bin': [16021], 'universe-suite': [4184], 'gds_db': [3050], 'cssc': [5637], 'resorcs': [4733], '3exmp': [5221], 'attachmate-g32': [2317], 'gwha': [1383], 'hpoms-ci-lstn': [5403], 'suncacao-jmxmp': [11162], 'wmc-log-svc': [1338], 'linkname': [1903], 'dlsrpn': [2065], 'xkotodrcp': [5344], 'msdts1': [3882], 'aspentec-lm': [6142], 'bmpp': [632], 'telaconsole': [5428], 'go-login': [491], 'nvd': [2184, 2329], 'nvc': [8711], 'unbind-cluster': [2138], 'indigo-vbcp': [8131], 'sgi-lk': [11106], 'launchbird-lm': [3739], 'tl1-telnet': [3083], 'gamegen1': [1738], 'availant-mgr': [1122], 'sfs-smp-net': [451], 'netbill-prod': [1616], 'apollo-cc': [2754], 'murx': [2743], 'sunrpc': [111], 'sun-user-https': [7677], 'jt400': [3470], 'novastorbakcup': [308], 'ttl-publisher': [5462], 'delta-mcp': [1324], 'wysdma': [3741], 'wysdmc': [3916], 'acc-raid': [2800], 'ctechlicensing': [9346], 'apc-2260': [2260], 'tns-server': [3308], 'vision_elmd': [6673], 'radsec': [2083], 'stat-results': [4156], 'pxc-splr-ft': [4003], 'sms-xfer': [2702], 'amt-redir-tcp': [16994], 'codaauth2': [370], 'dbcontrol-agent': [3938], 'odette-ftp': [3305], 'maxumsp': [4179], 'x500ms': [5757], 'emperion': [1282], 'netattachsdmp': [3066], 'tsrmagt': [2077], 'npmp-gui': [611], 'exlm-agent': [3002], 'itinternet': [2691], 'ntz-tracker': [6777], 'netopia-vo1': [1839], 'resource_mgr': [3019], 'irisa': [11000], 'scan-change': [2719], 'autocueds': [3437], 'sane-port': [6566], 'ip-blf': [2088], 'realm-rusd': [688], 'rxmon': [1311], 'csi-sgwp': [348], 'scanstat-1': [1215], 'amt-cnf-prot': [3054], 'srmp': [193], 'cmip-agent': [164], 'splitlock': [3606], 'subntbcst_tftp': [247], 'mortgageware': [367], 'vscp': [9598], 'avanti_cdp': [4065], 'tal-pod': [6149], 'ms-smlbiz': [5356], 'mosaixcc': [2561], 'sentinelsrm': [1947], 'ibm-app': [385], 'manyone-http': [8910], 'pss': [7880], 'fmsascon': [16001], 'ieee-mms': [651], 'puprouter': [999], 'p6ssmc': [4311], 'radan-http': [8088], 'imqtunnel': [7675], 'svnetworks': [2973], 'subntbcst-tftp': [247], 'aurora': [9084], 'mtqp': [1038], 'oma-dcdocbs': [7278], 'ifsf-hb-port': [3486], 'ontime': [1622], 'cma': [1050], 'remote-winsock': [1745], 'dif-port': [2251], 'alaris-disc': [3613], 'responsenet': [3045], 'oms-nonsecure': [5102], 'tag-ups-1': [3573], 'ssm-els': [2479], 'bues-service': [2446], 'gridgen-elmd': [1542], 'kwtc': [4566], 'sysorb': [3241], 'pxc-roid': [4004], 'moldflow-lm': [1576], 'acp-proto': [4046], 'mobile-file-dl': [2926], 'gpsd': [2947], 'iwserver': [2166], 'lv-pici': [2145], 'netscript': [4118], 'palace-4': [9995], 'dpm-agent': [5719], 'gld': [6267], 'palace-2': [9993], 'spectraport': [3851], 'fujitsu-neat': [3382], 'zymed-zpp': [2133], 'diameter': [3868], 'cslg': [24754], 'patrol-mq-nm': [2665], 'brp': [3043], 'isysg-lm': [1609], 'bre': [4096], 'darcorp-lm': [1679], 'rsap': [1647], 'pacmand': [1307], 'servergraph': [1251], 'ironstorm': [3504], 'nkd': [1650], 'ncxcp': [5681], 'dlpx-sp': [8415], 'ciphire-serv': [3888], 'objcall': [94], 'moshebeeri': [2627], 'filenet-powsrm': [32767], 'tnp': [8321], 'rxapi': [10010], 'intecourier': [495], 'opi-sock': [7429], 'flashfiler': [24677], 'avdecc': [17221], 'health-polling': [1161], 'slc-ctrlrloops': [2827], 'asap-tcp-tls': [3864], 'productinfo': [1283], 'sunproxyadmin': [8081], 'lam': [2040], 'arcp': [7070], 'parsec-peer': [6581], 'ravehd': [4037], 'dj-ilm': [3362], 'cisco-tdp': [711], 'mc-appserver': [8763], 'doglms': [6088], 'cfdptkt': [120], 'ardus-cntl': [1116], 'edbsrvr': [12010], 'srp-feedback': [2737], 'sitaramgmt': [2630], 'mpp': [218], 'emsd-port': [1928], 'pwgwims': [4951], 'zep': [17754], 'ssdtp': [6071], 'swismgr1': [6963], 'intel-rci': [24386], 'oidsr': [4143], 'farenet': [5557], 'rs-rmi': [3736], 'www-http': [80], 'csi-lfap': [3145], 'pptp': [1723], 'mpfoncl': [2579], 'codasrv-se': [2433], 'saft': [487], 'comcam-io': [3605], 'omnilink-port': [3904], 'lnvconsole': [2281], 'livestats': [2795], 'iph-policy-adm': [2963], 'vvr-data': [8199], 'dynamic3d': [2150], 'topx': [2436], 'snmptls': [10161], 'amt-soap-http': [16992], 'omasgport': [4090], 'npdbgmngr': [2293], 'ntp': [123], '3par-mgmt': [5782], 'mecomm': [668], 'sun-lm': [7588], 'cyborg-systems': [9888], 'dict-lookup': [2289], 'nburn_id': [20034], 'wkstn-mon': [2991], 'remotedeploy': [3789], 'cesdcdman': [2921], 'codemeter-cmwan': [22351], 'vqp': [1589], 'ndl-aas': [3128], 'ischat': [1336], 'vitalanalysis': [2474], 'hp-managed-node': [382], 'infobright': [5029], 'airs': [1481], 'jmq-daemon-2': [3215], 'jmq-daemon-1': [3214], 'efb-aci': [6159], 'osm-oev': [9991], 'cisco-fna': [130], 'mpnjsomb': [2681], 'syslog-conn': [601], 'mxxrlogin': [1035], 'scte30': [5168], 'answersoft-lm': [1781], 'sia-ctrl-plane': [4787], 'ipfltbcst': [4068], 'sophia-lm': [1408], 'mppolicy-v5': [5968], 'liebdevmgmt_a': [3029], 'filesphere': [24242], 'panagolin-ident': [9021], 'listcrt-port': [3913], 'citrix-rtmp': [2897], 'bruce': [2619], 'pcanywheredata': [5631], 'bsfserver-zn': [5320], 'sun-as-iiops-ca': [3808], 'swtp-port1': [9281], 'swtp-port2': [9282], 'aruba-server': [7166], 'ddm-rdb': [446], 'fjdocdist': [1848], 'ftps': [990], 'netuitive': [1286], 'systat': [11], 'intrepid-ssl': [11751], 'tdaccess': [2910], 'eserver-pap': [3666], 'dc': [2001], 'ent-engine': [3665], 'qencp': [2120], 'cgms': [3003], 'aprigo-cs': [5086], 'cvc-hostd': [442], 'd2dconfig': [9387], 'ems': [4664], 'smartcard-tls': [4116], 'mobilip-mn': [435], 'avinstalldisc': [3502], 'telelpathstart': [5010], 'cruise-update': [8380], 'globmsgsvc': [2519], 'cpq-wbem': [2301], 'cognex-insight': [1069], 'ds-mail': [4405], 'oma-mlp-s': [9211], 'danf-ak2': [1041], 'atul': [7543], 'ice-location': [4061], 'ibm-diradm': [3538], 'ild': [24321], 'esp-lm': [3383], 'ill': [1611], 'xybrid-rt': [9978], 'fio-cmgmt': [9051], 'zephyr-hm': [2104], 'tftp': [69], 'tcpmux': [1], 'xmpcr-interface': [3877], 'new-rwho': [550], 'pyrrho': [5433], 'sysopt': [3281], 'powerexchange': [2480], 'ptp-general': [320], 'ov-nnm-websrv': [3443], 'sm-pas-4': [2941], 'sm-pas-5': [2942], 'msss': [7742], 'sm-pas-1': [2938], 'sm-pas-2': [2939], 'sm-pas-3': [2940], 'pq-lic-mgmt': [2687], 'fcopy-server': [5745], 'resource-mgr': [3019], 'rimsl': [2044], 'vtu-comms': [2216], 'ident': [113], 'stun-behaviors': [5349], 'ita-manager': [5052], 'pangolin-laser': [3348], 'networklenss': [3410], 'scotty-ft': [14000], 'osu-nms': [192], 'conf': [2008], 'ndl-ahp-svc': [6064], 'mdap-port': [3235], 'lv-not': [2146], 'couchdb': [5984], 'routematch': [1287], 'ismaeasdaqtest': [1950], 'bvtsonar': [1149], 'perfd': [5227], 'nim': [1058], 'itelserverport': [3719], 'nip': [376], 'telops-lmd': [7491], 'cslistener': [9000], 'goahead-fldup': [3057], 'drip': [3949], 'epp': [700, 3044], 'ms-s-sideshow': [5361], 'epc': [1267], 'kali': [2213], 'datusorb': [3282], 'swispol': [6966], 'talon-engine': [7012], 'opencm': [3434], 'charsetmgr': [3903], 'prosharevideo': [5714], 'ipdd': [578], 'alchemy': [3234], 'lipsinc1': [1969], 'rnm': [3844], 'kitim': [35354], 'hfcs': [4900], 'rtsclient': [2501], 'truecm': [8804], 'xbox': [3074], 'lsi-bobcat': [5574], 'svbackup': [8405], 'reload-config': [6084], 'hpidsadmin': [2984], 'picodbc': [1603], 'ice-router': [4063], 'jt400-ssl': [3471], 'hassle': [375], 'directv-soft': [3335], 'pcttunnell': [2274], 'cvmmon': [2300], 'gsiftp': [2811], 'florence': [1228], 'lnvmailmon': [2285], 'rt-viewer': [35001], 'ultraseek-http': [8765], 'uniport': [9629], 'menandmice_noh': [4151], 'commplex-link': [5001], 'autodesk-nlm': [2080], 'sabp-signal': [3452], 'confluent': [1484], 'netrcs': [742], 'opsec-cvp': [18181], 'ansys-lm': [1800], 'pxc-ntfy': [3009], 'entextxid': [12000], 'ndm-server': [1364], 'vrts-at-port': [2821], 'lnvalarm': [2282], 'sec-ntb-clnt': [32635], 'octopus': [10008], 'cimplex': [673], 'ambit-lm': [6831], 'dfserver': [21554], 'rkb-oscs': [1817], 'ff-annunc': [1089], 'td-service': [267], 'h2250-annex-g': [2099], 'evtp': [2834], 'idonix-metanet': [2112], 'catalyst': [2836], 'netport-id': [3129], 'gnunet': [2086], 'tcpnethaspsrv': [475], 'dsmeter-iatc': [4060], 'td-replica': [268], 'isis': [2042], 'cumulus-admin': [8954], 'mtp': [1911], 'klogin': [543], 'anet': [212], 'cdfunc': [2045], 'mailq': [174], 'xiip': [1924], 'cbos-ip-port': [3750], 'med-fsp-tx': [24002], 'binderysupport': [2302], 'imoguia-port': [3907], 'esro-emsdp': [642], 'tlisrv': [1527], 'itm-mccs': [3084], 'edm-std-notify': [3462], 'm4-network-as': [4345], 'westec-connect': [5566], 'nbx-dir': [2096], 'radmind': [6222], 'rmpp': [1121], 'blp4': [8294], 'blp5': [48129], 'blp2': [8195], 'blp3': [8292], 'blp1': [8194], 'imqbrokerd': [7676], 'apani5': [9164], 'ubxd': [4034], 'websphere-snmp': [3427], 'mpnjsocl': [2685], 'gradecam': [5117], 'fazzt-ptp': [4038], 'wta-wsp-s': [2805], 'veritas_pbx': [1556], 'codemeter': [22350], 'mns-mail': [2593], 'cadabra-lm': [1563], 'fjicl-tep-a': [1901], 'fjicl-tep-b': [1902], 'fjicl-tep-c': [1904], 'boldsoft-lm': [2961], 'ssslic-mgr': [1203], 'qip-msgd': [2468], 'tasp-net': [25900], 'barracuda-bbs': [5120], 'datasurfsrv': [461], 'mtsserver': [4602], 'upnotifyp': [4445], 'busboy': [998], 'sunlps-http': [3816], 'stun-port': [1994], 'xs-openstorage': [1619], 'webmachine': [1963], 'ipcd3': [1209], 'e-net': [3286], 'turns': [5349], 'hacl-hb': [5300], 'natdataservice': [3927], 'radec-corp': [5430], 'ibm-ssd': [1260], 'biimenu': [18000], 'ideafarm-door': [902], 'checkpoint-rtm': [18241], 'ipcserver': [600], 'cddbp': [888], 'z-wave-s': [44123], 'nmsigport': [2817, 2839], 'health-trap': [1162], 'mondex': [471], 'geniuslm': [3005], 'nmea-0183': [10110], 'ris-cm': [748], 'elm-momentum': [1914], 'sieve': [4190], 'msims': [1582], 'aurora-balaena': [33123], 'ieee-mih': [4551], 'ias-neighbor': [4596], 'rtmp-port': [3500], 'hub-open-net': [8313], 'nlogin': [758], 'eudora-set': [592], 'hs-port': [2570], 'athand-mmp': [20999], 'carrius-rshell': [1197], 'telelpathattack': [5011], 'cailic': [216], 'cinegrfx-lm': [1743], 'siipat': [1733], 'topflow': [2885], 'edm-stager': [3461], 'https': [443], 'canon-bjnp3': [8613], 'canon-bjnp2': [8612], 'canon-bjnp1': [8611], 'httpx': [4180], 'canon-bjnp4': [8614], 'dvcprov-port': [3776], 'nta-ds': [7544], 'westell-stats': [1875], 'powwow-server': [13224], 'mdtp': [3232], 'mcp-port': [3558], 'gdomap': [538], 'cap': [1026], 'med-ltp': [24000], 'fs-qos': [41111], 'cal': [588], 'ibp': [2572], 'aspen-services': [1749], 'brcd': [1323], 'stone-design-1': [1492], 'tr-rsrb-p1': [1987], 'tr-rsrb-p3': [1989], 'tr-rsrb-p2': [1988], 'spc': [6111], 'faxstfx-port': [3684], 'icon-discover': [2799], 'tns-cml': [590], 'mmcc': [5050], 'odbcpathway': [9628], 'ms-theater': [2460], 'oma-ulp': [7275], 'emprise-lsc': [3586], 'aol': [5190], 'winport': [3926], 'ls3bcast': [3068], 'integra-sme': [484], 'netserialext4': [16368], 'netserialext3': [16367], 'netserialext2': [16361], 'prm-sm': [408], 'vnwk-prapi': [2538], 'notify-srvr': [3016], 'b-novative-ls': [1896], 'med-net-svc': [24006], 'netxms-agent': [4700], 'tftps': [3713], 'glogger': [2033], 'brain': [2169], 'qmqp': [628], 'nitrogen': [7725], 'alljoyn-stm': [9955], 'leecoposserver': [2212], 'xadmin': [9105], 'openhpid': [4743], 'sgi-storman': [1178], 'prm-nm-np': [1403], 'isis-ambc': [1643], 'xtlserv': [6116], 'sent-lm': [2316], 'mloadd': [1427], 'adapt-sna': [1365], 'rtsp-alt': [8554], 'drwcs': [2193], 'prospero': [191], 'rsvp-tunnel': [363], 'vpnz': [1224], 'pvxplusio': [4193], 'altalink': [1845], 'pcia-rxp-b': [1332], 'domain': [53], 'wnn6-ds': [26208], 'teedtap': [559], 'crestron-ctp': [41795], 'ea': [17729], 'encrypted-admin': [1138], 'kana': [2656], 'ultrex': [1327], 'krb5gatekeeper': [1318], 'soap-beep': [605], 'atlinks': [4154], 'bbn-mmx': [1348], 'pulsonixnls': [6140], 'bbn-mmc': [1347], 'rlm': [5053], 'lmp': [701], 'lms': [4056], 'rlp': [39], 'liberty-lm': [1496], 'attachmate-s2s': [2419], 'agriserver': [3021], 'qsm-gui': [1165], 'apex-edge': [913], 'hb-engine': [1703], 'opsession-clnt': [3303], 'wimsic': [1326], 'stargatealerts': [1654], 'msfw-s-storage': [2172], 'su-mit-tg': [89], 'caps-lm': [3290], 'brlp-2': [4103], 'servicemeter': [2603], 'courier': [530], 'dns2go': [1227], 'pns': [2487], 'sg-lm': [1659], 'btpp2audctr1': [2536], 'conferencetalk': [1713], 'kwdb-commn': [1127], 'xns-courier': [165], 'dell-eql-asm': [7569], 'jwserver': [1937], 'lvision-lm': [6471], 'aamp': [3939], 'juxml-port': [3642], 'powerguardian': [1777], 'wrs_registry': [2340], 'sunwebadmin': [8800], 'profinet-rt': [34962], 'netiq-ncap': [2219], 'hp-server': [5225], 'ftrapid-2': [1747], 'ftrapid-1': [1746], 'batman': [4305], '3gpp-cbsp': [48049], 'slinterbase': [3065], 'ppsms': [3967], 'xmsg': [1716], 'dhct-alerts': [4676], 'pnaconsult-lm': [2937], 'brutus': [2003], 'ricardo-lm': [1522, 6148], 'teredo': [3544], 'mrm': [679], 'wsm-server': [5006], 'dt-vra': [6326], 'buddy-draw': [1854], 'noaaport': [2210], 'bhfhs': [248], 'jlicelmd': [1567], 'excerpts': [5401], 'embrace-dp-c': [3198], 'upgrade': [2537], 'daap': [3689], 'proxy-gateway': [2303], 'opcon-xps': [3100], 'embrace-dp-s': [3197], 'indigo-server': [1176], 'vrts-registry': [2410], 'backburner': [2635], 'peport': [1449], 'autotrac-acp': [31020], 'fairview': [38202], 'synapse': [2880], 'jvclient': [1940], 'smartcard-port': [3516], 'nav-data-cmd': [6317], 'proremote': [8183], 'aairnet-1': [3618], 'sonar': [572], 'amanda': [10080], 'entomb': [775], 'distinct32': [9998], 'netadmin': [2450], 'menandmice-noh': [4151], 'jeol-nsdtp-1': [6241], 'jeol-nsdtp-3': [6243], 'jeol-nsdtp-2': [6242], 'jeol-nsdtp-4': [6244], 'di-ase': [3046], 'montage-lm': [6147], 'enc-tunnel-sec': [3568], 'opentable': [2368], 'loaprobe': [1634], 'avenue': [2134], 'isode-dua': [17007], 'netmap-lm': [1493], 'ifcp-port': [3420], 'sdhelp': [2308], 'openmailg': [5755], 'connendp': [693], 'dmexpress': [32636], 'invision': [1641], 'tnos-dp': [7902], 'unisys-lm': [1823], 'nfoldman': [7393], 'aurp': [387], 'xns-time': [52], 'aura': [2066], 'monp': [3445], 'nest-protocol': [489], 'csoft-prev': [3271], 'miteksys-lm': [1482], 'btprjctrl': [2803], 'aic-np': [2785], 'iniserve-port': [3560], 'ovrimosdbman': [2956], 'ssm-cssps': [2478], 'corerjd': [284], 'asap-tcp': [3863], 'informer': [3856], 'avian': [486], 'megaco-h248': [2944], 'psprserver': [2354], 'iwb-whiteboard': [2982], 'eis': [3982], 'iceedcp_tx': [31948], 'scup': [6315], 'crestron-ctps': [41797], 'bpmd': [3593], 'shockwave': [1626], 'vrtstrapserver': [1885], 'l2c-control': [4371], 'diamondport': [33331], 'elvin-client': [2917], 'wpages': [776], 'sun-sr-admin': [6489], 'iscsi': [860], 'sunwebadmins': [8989], 'trisoap': [10200], 'bex-xr': [15660], 'cis-secure': [22343], 'nicetec-nmsvc': [2556], 'tunalyzer': [5748], 'nds-sso': [3024], 'gmmp': [4183], 'bluelance': [2877], 'nsesrvr': [9988], 'ca-audit-da': [8025], 'ccp': [3947], 'pwrsevent': [2694], 'chargen': [19], 'ca-audit-ds': [8026], 'nced': [404], 'axis-wimp-port': [10260], 'ff-fms': [1090], 'jaus': [3794], 'tcoregagent': [1976], 'llsurfup-http': [1183], 'cogitate': [3039], 'vcscmd': [14150], 'pawserv': [345], 'netspeak-acd': [21848], 'editbench': [1350], 'amc': [5506], 'alta-ana-lm': [1346], 'amp': [3811], 'ams': [1037], 'amt': [2268], 'stuns': [5349], 'assyst-dr': [4485], 'ocs-amu': [429], 'sossecollector': [3166], 'touchnetplus': [2158], 'ocs_amu': [429], 'dberegister': [1479], 'elcsd': [704], 'perf-port': [1995], 'glbp': [3222], 'ms-cluster-net': [3343], 'bctp-server': [10107], 'cba8': [9593], 'nms': [1429], 'business': [3107], 'hacl-probe': [5303], 'plcy-net-svcs': [4351], 'serialgateway': [1243], 'wherehoo': [5859], 'skronk': [460], 'ms-la': [3535], 'asam': [3451], 'msr-plugin-port': [3931], 'src': [200], 'ws-discovery': [3702], 'mos-soap': [10543], 'doceri-ctl': [7019], 'bacnet': [47808], 'ethernet/ip-1': [2222], 'nsiiops': [261], 'ethernet/ip-2': [44818], 'udrawgraph': [2542], 'oracle-vp1': [1809], 'abatjss': [3656], 'netopia-vo3': [1841], 'oracle-vp2': [1808], 'netopia-vo5': [1843], 'netopia-vo4': [1842], 'wcpp': [4185], 'onehome-help': [2199], 'sco-inetmgr': [615], 'msl-lmd': [1464], 'watchdoc': [5744], 'ldgateway': [9592], 'stars': [4131], 'adaptecmgr': [2521], 'ewcappsrv': [1876], 'oob-ws-https': [664], 'cadkey-licman': [1399], 'sse-app-config': [3852], 'geognosisman': [4325], 'rrisat': [1697], 'plato-lm': [1819], 'sqlserv': [118], 'rje': [5], 'ccmcomm': [3505], 'bnt-manager': [3344], 'pgbouncer': [6432], 'ttlpriceproxy': [5463], 'prodigy-intrnet': [1778], 'nerv': [1222], 'netconf-tls': [6513], 'ttc-etap-ds': [2978], 'fsr': [7164], 'fcp-srvr-inst2': [5503], 'fcp-srvr-inst1': [5502], 'keyshadow': [19315], 'adi-gxp-srvprt': [6769], 'ndsconnect': [3890], 'cedros_fds': [4140], 'stresstester': [5397], 'opcua-tls': [4843], 'hacl-qs': [1238], 'pando-sec': [8276], 'ep-pcp': [3620], 'pkt-krb-ipsec': [1293], 'magaya-network': [3691], 'bears-01': [2852], 'proshare2': [1460], 'proshare1': [1459], 'apdap': [3948], 'semantix': [361], 'griffin': [2458], 'iconp': [3972], 'filex-lport': [1887], 'nssocketport': [3522], 'jpegmpeg': [3155], 'av-emb-config': [2050], 'mpm': [45], 'ipdcesgbs': [9214], 'senomix01': [8052], 'senomix02': [8053], 'senomix03': [8054], 'senomix04': [8055], 'senomix05': [8056], 'l5nas-parchan': [9747], 'senomix07': [8058], 'senomix08': [8059], 'boosterware': [2913], 'cosir': [10321], 'hbci': [3000], 'privateark': [1858], 'ismc': [1638], 'ctxlic': [7279], 'devbasic': [5426], 're-conn-proto': [1306], 'aequus-alt': [23457], 'nani': [2236], 'dsx-monitor': [31685], 'doc1lm': [3161], 'tcoflashagent': [1975], 'nbdb': [13785], 'first-defense': [1232], 'dvt-data': [3247], 'wlanauth': [3810], 'purenoise': [663], 'bis-web': [5584], 'sanavigator': [4033], 'shiva-confsrvr': [1651], 'micromuse-ncpw': [9600], 'micromuse-ncps': [7979], 'l-acoustics': [4432], 'noteit': [4663], 'chshell': [562], 'fc-faultnotify': [2819], 'e-dpnet': [2036], 'a4-sdunode': [5605], 'sage-best-com2': [14034], 'sage-best-com1': [14033], 'synchronet-rtc': [6101], 'kmip': [5696], 'banyan-net': [2708], 'netaspi': [2902], 'tdp-suite': [1814], 'amqps': [5671], 'patrolview': [4097], 'remote-kis': [185], 'dmidi': [1199], 'watilapp': [1269], 'tacacs': [49], 'mcagent': [1820], 'docstor': [1488], 'pwgpsi': [3800], 'ms-sideshow': [5360], 'lhtp': [1983], 'vytalvaultbrtp': [2546], 'ddns-v3': [2164], 'netcheque': [4008], 'invision-ag': [45054], 'reftek': [2543], 'scoi2odialog': [360], 'hpstgmgr2': [2715], 'egs': [1926], 'iceedcp_rx': [31949], 'xtreamx': [5793], 'pim-rp-disc': [496], 'rrirtr': [1693], 'ffserver': [3825], 'badm_pub': [6506], 'syslog-tls': [6514], 'sgi-esphttp': [5554], 'etb4j': [16309], 'hylafax': [4559], 'febooti-aw': [36524], 'ccowcmr': [2116], 'kshell': [544], 'printer_agent': [3396], 'dlip': [7201], 'mcidas': [112], 'sql-net': [66, 150], 'discp-server': [2602], 'esmagent': [5601], 'screencast': [1368], 'csbphonemaster': [1724], 'navisphere-sec': [2163], 'beyond-remote': [5424], 'eportcomm': [4666], 'fjdmimgr': [9374], 'mit-ml-dev': [83, 85], 'netware-ip': [396], 'pxc-spvr-ft': [4002], 'filemq': [5670], 'tungsten-http': [9762], 'monetra': [8665], 'op-probe': [7030], 'giga-pocket': [3862], 'asr': [7800], 'med-ovw': [24004], 'hyperip': [3919], 'vocaltec-gold': [6670], 'sybasedbsynch': [2439], 'asa': [386], 'base': [5429], 'asi': [1827], 'fjswapsnp': [1874], 'elxmgmt': [23333], 'tnp1-port': [4024], 'lxi-evntsvc': [5044], 'heartbeat': [3740], 'pnbs': [6124], 'aiagent': [7738], 'itwo-server': [4410], 'ptcnameservice': [597], 'csdm': [1468, 1472], 'osdcp': [3432], 'pmcdproxy': [44322], 'alphatech-lm': [1653], 'derby-repli': [4851], 'weblogin': [2054], 'caevms': [5251], 'dvapps': [3831], 'ncp': [524], 'strexec-s': [5027], 'cisco-sys': [132], 'hp-sca': [19411], 'ncl': [2397], 'hp-sci': [1299], 'vts-rpc': [5780], 'dtk': [365], 'chmd': [3099], 'nms-topo-serv': [1486], 'stt': [1607], 'ace-server': [2475], 'dts': [2594], 'dtp': [3663], 'stx': [527], 'peocoll': [9631], 'bmc-reporting': [4568], 'spw-dnspreload': [3849], 'dserver': [4309], 'wininstall-ipc': [3674], 'invokator': [2006], 'webdata': [3748], 'immedianet-bcn': [3657], 'hlibmgr': [3634], 'rtcm-sc104': [2101], 'prolink': [1678], 'olhost': [2661], 'iadt-tls': [9614], 'cableport-ax': [282], 'startron': [1057], 'opnet-smp': [3433], 'gppitnp': [103], 'ccu-comm-1': [4053], 'ccu-comm-3': [4055], 'ccu-comm-2': [4054], 'bzr': [4155], 'nati-svrloc': [3580], 'datasurfsrvsec': [462], 'tdmoip': [2142], 'netops-broker': [5465], 'simbaservices': [1599], 'optohost004': [22004, 22005], 'optohost003': [22003], 'optohost002': [22002], 'sf-lm': [4546], 'mpm-flags': [44], 'interpathpanel': [2652], 'beeyond': [2414], 'opc-job-track': [424], '802-11-iapp': [3517], 'nhci': [3842], 'cr-websystems': [2314], 'netrek': [2592], 'syam-agent': [3894], 'hp-sco': [19410], 'nilinkanalyst': [25902], 'gbs-stp': [3484], 'vpjp': [1345], 'tmo-icon-sync': [5583], 'deskview': [3298], 'xfer': [82], 'raadmin': [5676], 'swa-1': [9023], 'portgate-auth': [3710], 'swa-2': [9024], 'swa-4': [9026], 'clever-ctrace': [6687], 'www-dev': [2784], 'db-lsp': [17500], 'mgcp-callagent': [2727], 'hp-webadmin': [1188], 'backroomnet': [3387], 'orbix-config': [3076], 'ccmad': [3114], 'spramsca': [5769], 'kink': [910], 'spock': [2507], 'sesi-lm': [1714], 'sun-dr': [665], 'bmc-perf-agent': [6767], 'hpvmmagent': [1125], 'marcam-lm': [1444], 'ads': [2550], 'pdefmns': [16311], 'mps-raft': [1700], 'videobeans': [3058], 'ecmp': [6160], 'femis': [1776], 'ferrari-foam': [3216], 'lrs-paging': [3700], 'xtgui': [4095], 'smpte': [420], 'nss-routing': [159], 'ms-sql-s': [1433], 'wsman': [5985], 'ms-sql-m': [1434], 'dfoxserver': [2960], 'fjmpss': [2509], 'triomotion': [3240], 'tl1-ssh': [6252], 'sdnskmp': [558], 'imap': [143], 'dtp-dia': [3489], 'amx-webadmin': [2929], 'notezilla-lan': [21010], 'sec-t4net-clt': [9401], 'easy-soft-mux': [2168], 'socorfs': [3379], 'sns-quote': [1967], 'dsm-scm-target': [9987], 'tripwire': [1169], 'sso-service': [2710], 'jps': [2205], 'arcisdms': [262], 'bim-pem': [3783], 'homeportal-web': [3941], 'xmlink-connect': [3953], 'ptk-alink': [3089], 'vnetd': [13724], 'cadkey-tablet': [1400], 'cesdcdtrn': [2922], 'gpfs': [1191], 'nmsserver': [2244], 'qadmifoper': [2461], 'clearvisn': [2052], 'ivsd': [2241], 'eisport': [3525], 'xmlipcregsvc': [9092], 'exapt-lmgr': [3759], 'gsi': [1850], 'remote-as': [1053], 'turbonote-1': [39681], 'turbonote-2': [34249], 'redstorm_join': [2346], 'fln-spx': [221], 'boks-clntd': [6503], 'ewnn': [2674], 'cdbroker': [3376], 'bacula-sd': [9103], 'lmdp': [2623], 'cinegrfx-elmd': [2891], 'bsfsvr-zn-ssl': [5321], 'nettest': [4138], 'submission': [587], 'signal': [2974], 'poweralert-nsa': [4150], 'at-zis': [206], 'sftdst-port': [3230], 'tclprodebugger': [2576], 'prm-sm-np': [1402], 'apc-6548': [6548], 'apc-6549': [6549], 'apc-6547': [6547], 'b2-runtime': [2203], 'balour': [4324], 'directv-tick': [3336], 'micromuse-lm': [1534], 'mosaicsyssvc1': [1235], 'ipcore': [2215], 'ssql': [3352], 'quickbooksrds': [3790], 'i-net-2000-npr': [5069], 'photuris': [468], 'shrinkwrap': [358], 'perimlan': [4075], 'es-elmd': [1822], 'idp': [4067], 'bgp': [179], 'directv-web': [3334], 'l3t-at-an': [4591], 'ng-umds': [1690], 'cadis-1': [1441], 'cadis-2': [1442], 'vnas': [577], 'primaserver': [6105], 'o2server-port': [1894], 'ecovisiong6-1': [2896], 'empire-empuma': [1691], 'iqrm': [10117], 'theta-lm': [2296], 'ecmport': [3524], 'accelenet': [1182], 'atm-zip-office': [1520], 'client-wakeup': [9694], 'cspclmulti': [2890], 'lorica-out-sec': [4083], 'raventdm': [2714], 'hpvirtctrl': [5224], 'datex-asn': [355], 'munin': [4949], 'nati-logos': [2343], 'rprt': [3064], 'iec-104': [2404], 'splitlock-gw': [3647], 'simp-all': [1959], 'xmapi': [1933], 'ivocalize': [5049], 'cplscrambler-lg': [1086], 'elfiq-repl': [1148], 'dlsrap': [1973], 'iclpv-sc': [1390], 'teradataordbms': [8002], 'enpp': [2968], 'nas': [991], 'bmap': [3421], 'enpc': [3289], 'noagent': [1917], '3com-webview': [2339], 'svn': [3690], 'emfis-cntl': [141], 'ewctsp': [6066], 'gw': [3010], 'apc-5456': [5456], 'apc-5455': [5455], 'apc-5454': [5454], 'afs3-rmtsys': [7009], 'ndtp': [2882], 'gf': [3530], 'iafdbase': [480], 'aria': [2624], 'netrjs-3': [73], 'netrjs-2': [72], 'netrjs-1': [71], 'nimcontroller': [48000], 'ldxp': [4042], '4-tieropmgw': [2933], 'pdap': [344], 'quicksuite': [2900], 'watchdoc-pod': [5743], 'gsidcap': [22128], 'bxp': [4027], 'popup-reminders': [7787], 'netagent': [5771], 'topovista-data': [3906], 'broker_service': [3014], 'xandros-cms': [4389], 'tsb2': [2742], 'ulp': [522], 'cpscomm': [5194], 'icl-twobase8': [25007], 'icl-twobase9': [25008], 'nsdeepfreezectl': [7724], 'icl-twobase2': [25001], 'icl-twobase3': [25002], 'icl-twobase1': [25000], 'icl-twobase6': [25005], 'icl-twobase7': [25006], 'icl-twobase4': [25003], 'icl-twobase5': [25004], 'lm-webwatcher': [8208], 'pmdmgr': [7426], 'jmact3': [6961], 'jmact5': [2957], 'g5m': [2732], 'jmact6': [2958], 'oma-rlp-s': [7274], 'nsstp': [1036], 'oem-agent': [3872], 'fdt-rcatp': [4320], 'psbserver': [2350], 'jetform': [1706], 'aeroflight-ads': [1218], 'stryker-com': [3854], 'ah-esp-encap': [2070], 'elipse-rec': [6515], 'tomato-springs': [3040], 'mevent': [7900], 'joost': [4166], 'ip-qsig': [4029], 'can-dch': [1919], 'lnvpoller': [2280], 'qnts-orb': [1262], 'deos': [76], 'bintec-tapi': [2663], 'hydra': [2374], 'jmb-cds1': [8900], 'syscomlan': [1065], 'dtspcd': [6112], 'armcenterhttp': [9294], 'scenidm': [7128], 'dcsl-backup': [11202], 'efcp': [3671], 'msync': [2072], 'ohsc': [18186], 'ncdmirroring': [2706], 'citrixuppg': [7229], 'sec-t4net-srv': [9400], 'sco-sysmgr': [616], 'apertus-ldp': [539], 'wwiotalk': [5413], 'saphostctrls': [1129], 'interhdl_elmd': [1454], 'ds-clnt': [4402], 'encrypted-llrp': [5085], 'inovaport2': [23001], 'inovaport3': [23002], 'inovaport4': [23003], 'inovaport5': [23004], 'inovaport6': [23005], 'intersan': [1331], 'cogsys-lm': [3377], 'cimtrak': [3749], 'pcoip': [4172], '914c/g': [211], 'pclemultimedia': [2558], 'ibm-dt-2': [1792], 'lm-instmgr': [8205], 'giop': [2481], 'altovacentral': [4689], 'citysearch': [3974], 'rt-classmanager': [35004], 'xdmcp': [177], 'ovobs': [30999], 'prospero-np': [1525], 'pichat': [9009], 'iwlistener': [2866], 'msfw-control': [3847], 'smaclmgr': [4660], 'solera-lpn': [4738], 'suncacao-rmi': [11163], 'ofsd': [2322], 'virprot-lm': [7121], 'bhoetty': [351], 'esl-lm': [1455], 'paragent': [9022], 'sip-tls': [5061], 'auth': [113], 'nifty-hmi': [4134], 'udrive': [1867], 'avsecuremgmt': [3211], 'hrd-ncs': [6324], 'nv-video': [4444], 'wibukey': [22347], 'cqg-netlan-1': [2824], 'globe': [2002], 'http-rpc-epmap': [593], 'an-pcp': [3846], 'joltid': [3531], 'lontalk-urgnt': [1629], 'hmmp-ind': [612], 'wap-push': [2948], 'ultimad': [1737], 'tec5-sdctp': [9668], 'openflow': [6653], 'swa-3': [9025], 'apcupsd': [3551], 'max': [6074], 'hl7': [2575], 'ibm-res': [1405], 'pmsm-webrctl': [2972], 'ecp': [3134], 'vipera-ssl': [12013], 'cspmulti': [2807], 'venus-se': [2431], 'nesh-broker': [3507], 'jprinter': [5309], 'jesmsjc': [27442], 'timed': [525], 'client-ctrl': [3730], 'snapd': [2599], 'stss': [3090], 'mc-client': [1180], 'rcp': [469], 'netiq-voipa': [10116], 'whois++': [63], 'qsnet-workst': [4355], 'tragic': [2642], 'gadgetgate1way': [2677], 'streamcomm-ds': [9612], 'ni-ftp': [47], 'yo-main': [4040], 'dgpf-exchg': [6785], 'pcihreq': [3085], 'worldwire': [2371], 'digital-vrc': [466], 'caiccipc': [1202], 'iccrushmore': [6850], 'mapper-mapethd': [3985], 'cyc': [3645], 'mvx-lm': [1510], 'service-ctrl': [2367], 'ipether232port': [3497], 'wmlserver': [4883], 'a1-msc': [5602], 'attachmate-uts': [2304], 'de-server': [1256], 'sybase-sqlany': [1498], 'apple remote desktop (net assistant)': [3283], 'netbios-ssn': [139], 'cuelink': [5271], 'powerschool': [5071], 'ncu-1': [3195], 'ncu-2': [3196], 'lnvstatus': [2283], 'ewall': [1328], 'predatar-comms': [1753], 'interintelli': [2633], 'a13-an': [3125], 'raventbs': [2713], 'f5-globalsite': [2792], 'jamlink': [8091], 'connected': [16384], 'pk-electronics': [2634], 'urd': [465], 'urm': [606], 'indy': [5963], 'talk': [517], 'ratio-adp': [1108], 'indi': [7624], 'newlixconfig': [2076], 'netspeak-cs': [21847], 'dlms-cosem': [4059], 'seraph': [4076], 'questdb2-lnchr': [5677], 'rlzdbase': [635], 'menandmice-lpm': [1231], 'damewaremobgtwy': [6130], 'di-drm': [2226], 'd2k-tapestry1': [3393], 'd2k-tapestry2': [3394], 'bgmp': [264], 'mcs-mailsvr': [3332], 'iscsi-target': [3260], 'twsdss': [3012], 'can-nds-ssl': [3660], 'as-servermap': [449], 'cardax': [1072], 'dhanalakshmi': [34567], 'dpm': [5718], 'mpidcmgr': [9343], 'xmquery': [2279], 'infotos': [18881], 'gsigatekeeper': [2119], 'idotdist': [2590], 'galileolog': [3520], 'sqlexec': [9088], 'backupedge': [3946], 'trnsprntproxy': [3346], 'ansysli': [2325], 'biolink-auth': [3411], 'tabula': [1437], 'ora-lm': [1446], 'warmspotmgmt': [1074], 'apollo-admin': [8122], 'event_listener': [3017], 'ivecon-port': [3258], 'snpp': [444], 'novar-global': [23402], 'choiceview-agt': [4314], 'qft': [189], 'seaview': [3143], 'qfp': [5083], 'dec-mbadmin-h': [1656], 'aspeclmd': [1544], 'infoexch': [3667], 'dx-instrument': [1325], 'dirgis': [2496], 'kastenxpipe': [36865], 'xvttp': [508], 'seclayer-tls': [3496], 'i-zipqd': [13160], 'willy': [2518], 'vxcrnbuport': [3652], 'webyast': [4984], 'dxspider': [8873], 'csvr-proxy': [3190], 'outlaws': [5310], 'ebinsite': [2651], 'tonidods': [24465], 'zicom': [3774], 'park-agent': [5431], 'zabbix-trapper': [10051], 'otp': [9390], 'ott': [2428], 'otv': [8472], 'surveyinst': [3212], 'aocp': [2712], 'uucp-path': [117], 'stat-scanner': [4157], 'ndl-aps': [3096], 'mtportmon': [7421], 'msfw-array': [2174], 'uacs': [2768], 'itm-mcell-u': [1828], 'elpro_tunnel': [4370], 'polestar': [1060], 'as-debug': [4026], 'wsmans': [5986], 'rtip': [771], 'ife_icorp': [5165], 'mqe-agent': [3958], 'ironmail': [3206], 'opentrac': [3855], 'ivmanager': [1276], 'http': [80], 'pharos': [4443], 'swift-rvf': [97], 'us-srv': [8083], 'odn-castraq': [2498], 'vx-auth-port': [3207], 'microsan': [20001], 'boscap': [2990], 'idmgratm': [32896], 'rnrp': [2423], 'nsrp': [7170], 'versiera': [9050], 'mini-sql': [1114], 'sptx': [40404], 'mpfwsas': [2952], 't5-straton': [11173], 'elatelink': [2124], 'vcrp': [3073], 'crestron-cips': [41796], 'interhdl-elmd': [1454], 'sun-mc-grp': [5306], 'isoipsigport-1': [1106], 'pacom': [3435], 'candp': [42508], 'global-dtserv': [1774], 'bingbang': [29999], 'netbill-auth': [1615], 'proofd': [1093], 'decauth': [316], 'drizzle': [4427], 'npsp': [4088], 'lisp-cons': [4342], 'famdc': [10081], 'dec-mbadmin': [1655], 'dashpas-port': [3498], 'qke-llc-v3': [2523], 'nimrod-agent': [1617], 'tenfold': [658], 'publiqare-sync': [4329], 'fcip-port': [3225], 'trap-port': [3857], 'dcs-config': [3988], 'x25-svc-port': [1998], 'dicom-tls': [2762], 'precise-i3': [3607], 'vrts-ipcserver': [1317], 'ifor-protocol': [1515], 'prosharenotify': [5717], 'stm_pproc': [3080], 'ea1': [1791], 'imink': [8615], 'iris-lwz': [715], 'netview-aix-11': [1671], 'netview-aix-10': [1670], 'netview-aix-12': [1672], 'fksp-audit': [3729], 'wimd': [2980], 'cequint-cityid': [4074], 'snmpssh-trap': [5162], 'tivoli-npm': [1965], 'umm-port': [3098], 'spss-lm': [1759], 'dssiapi': [1265], 'gaia': [4340], 'idmaps': [1884], 'evtp-data': [2835], 'instantia': [1240], 'btpp2sectrans': [2444], 'display': [7236], 'dtn1': [2445], 'spytechphone': [8192], 'vrcommerce': [2530], 'wrspice': [6114], 'sunvts-rmi': [6483], 'teleniumdaemon': [2060], 'a17-an-an': [4599], 'ub-dns-control': [8953], 'pvsw': [2520], 'netsc-prod': [154], 'oob-ws-http': [623], 'xsmsvc': [6936], 'mfcobol': [86], 'gss-xlicen': [128], 'cqg-netlan': [2823], 'ssmc': [2187], 'evb-elm': [1504], 'ups-engine': [3664], 'emcsymapiport': [2707], 'hnm': [6791], 'bcs': [4677], 'lumimgrd': [4741], 'em7-secom': [7700], 'dynamid': [9002], 'navegaweb-port': [3159], 'p2pcommunity': [3955], 'netboot-pxe': [3928], 'metaagent': [1897], 'vista-4gl': [24249], 'nsjtp-ctrl': [1687], 'vt-ssl': [3509], 'webobjects': [1085], 'cardbox': [3105], 'rpki-rtr-tls': [324], 'apocd': [3809], 'guibase': [9321], 'fhc': [1499], 'webtie': [3342], 'cvspserver': [2401], 'cxws': [4673], 'ups': [401], 'ttcmremotectrl': [3468], 'docent': [2151], 'entp': [1865], 'nm-game-server': [3149], 'vmware-fdm': [8182], 'topflow-ssl': [3885], 'opsession-prxy': [3307], 'lofr-lm': [1752], 'asia': [626], 'ogs-server': [9008], 'armtechdaemon': [9292], 'sddp': [1163], 'grcp': [9123], 'utmpcd': [431], 'drp': [1974], 'bitforestsrv': [5068], 'ariel1': [419], 'ariel3': [422], 'ariel2': [421], 'rcst': [3467], 'tip2': [3372], 'wsicopy': [3378], 'cctv-port': [3559], 'csoft1': [1837], 'altserviceboot': [4011], 'dtn-bundle-tcp': [4556], 'rmiregistry': [1099], 'sceanics': [5435], 'norton-lambert': [2338], 'bv-ds': [3992], 'rebol': [2997], 'm-wnn': [3732], 'dbstar': [1415], 'netop-school': [1971], 'tell': [754], 'emc-pp-mgmtsvc': [9083], 'vettcp': [78], 'virtual-time': [1852], 'snmpssh': [5161], 'cichild-lm': [1523], 'knet-cmp': [157], 'vmnet': [175], '3d-nfsd': [2323], 'smwan': [3979], 'gbmt-stars': [3912], 'sphinxapi': [9312], 'sasggprs': [3964], 'msft-dpm-cert': [6076], 'tag-pm': [5073], 'ufmp': [6306], 'tw-auth-key': [27999], 'dta-systems': [13929], 'psdbserver': [2355], 'csc-proxy': [4187], 'vfo': [1056], 'ocserver': [184], 'idig-mux': [4152], 'uaac': [145], 'vmpwscs': [214], 'mctet-gateway': [3116], 'wssauthsvc': [4537], 'opsec-ela': [18187], 'entrust-sps': [640], 'murray': [1123], 'suncacao-snmp': [11161], 'scoremgr': [2034], 'antidotemgrsvr': [2247], 'celatalk': [3485], 'simple-push-s': [3688], 'konshus-lm': [2294], 'etlservicemgr': [9001], 'tentacle': [41121], 'mxi': [8005], 'contentserver': [454, 3365], 'netiq-endpoint': [10113], 'vcom-tunnel': [8001], 'magiccontrol': [4902], 'foliocorp': [2242], 'mountd': [20048], 'metagram': [99], 'spcsdlobby': [2888], 'cabsm-comm': [7161], 'pay-per-view': [1564], 'maincontrol': [2516], 'dawn': [1908], 'commplex-main': [5000], 'bfd-control': [3784], 'dsmcc-ccp': [13822], 'rtc-pm-port': [3891], 'xxnetserver': [3832], 'ubroker': [7887], 'unify-adapter': [1889], 'utcd': [1506], 'jerand-lm': [1810], 'propel-msgsys': [1268], 'infowave': [2082], 'wap-vcal': [9205], 'iclpv-wsm': [1395], 'webaccess': [1739], 'ssp-client': [7801], 'terminaldb': [2018], 'piranha1': [4600], 'neo4j': [7474], 'edtools': [1142], 'ansanotify': [116], 'lanschool': [11796], 'svs-omagent': [1625], 'dgi-serv': [33333], 'triquest-lm': [1588], 'embl-ndt': [394], 'cosmocall': [2324], 'nburn-id': [20034], 'circle-x': [2931], 'sms-remctrl': [2704], 'cardbox-http': [3106], 'p-net-local': [34378], 'dxmessagebase1': [2874], 'dxmessagebase2': [2875], 'ft-role': [2429], 'dbref': [2365], 'passgo-tivoli': [627], 'entrusttime': [309], 'monkeycom': [9898], 'eq3-update': [43439], 'solera-epmap': [2132], 'ideafarm-panic': [903], 'lbc-watchdog': [2816], 'hdl-srv': [2641], 'alarm': [2740], 'ndl-tcp-ois-gw': [2738], 'mfserver': [2266], 'bmc-messaging': [2059], 'ndmp': [10000], 'sun-as-jmxrmi': [8686], 'lstp': [2559], 'ttnrepository': [2943], 'ev-services': [5114], 'unisql-java': [1979], 'bmcpatrolrnvu': [3182], 'ldap': [389], 'mpidcagt': [9397], 'smux': [199], 'exasoftport1': [3920], 'filenet-pch': [32775], 'snifferserver': [2533], 'mapper-ws-ethd': [3986], 'zion-lm': [1425], 'bcs-lmserver': [1951], 'ocs_cmu': [428], 'localinfosrvr': [1487], 'megaregsvrport': [3572], 'mysql-im': [2273], 'ltp-deepspace': [1113], 'digivote': [3223], 'g-talk': [2421], 'cpdi-pidas-cm': [3609], 'xsip-network': [1354], 'sais': [1426], 'zigbee-ips': [17756], 'dctp': [675], 'nicetec-mgmt': [2557], 'oms': [4662], 'vision-server': [6672], 'veritas-tcp1': [2802], 'ttc-ssl': [2484], 'esri_sde': [5151], 'boinc-client': [1043], 'fjcp': [3648], 'commtact-http': [20002], 'wusage': [2396], 'ipulse-ics': [20222], 'unicall': [4343], 'dtag-ste-sb': [352], 'periscope': [1230], 'bv-smcsrv': [3991], 'magbind': [3194], 'copycat': [9093], 'timelot': [3243], 'ncacn-ip-tcp': [3062], 'tinc': [655], 'acp-policy': [3824], 'ads-c': [5913], 'wag-service': [2608], 'dsmeter_iatc': [4060], 'pe-mike': [1305], 'sun-sr-https': [6443], 'mcp': [4458], 'imqtunnels': [7674], 'esps-portal': [2867], 'slp': [1605], 'ovbus': [7501], 'fjippol-cnsl': [2749], 'bis-sync': [5585], 'mediavault-gui': [3673], 'palace-6': [9997], 'palace-5': [9996], 'd-fence': [8555], 'palace-3': [9994], 'submitserver': [2028], 'palace-1': [9992], 'nomdb': [13786], 'ampify': [8040], 'livelan': [1555], 'msp-os': [4686], 'l3-ranger': [2841], 'zented': [1229], 'ibm-mqisdp': [1883], 'enc-tunnel': [8567], 'datascaler-db': [6624], 'sps-tunnel': [2876], 'kis': [186], 'kvm-via-ip': [1132], 'mpc-lifenet': [1213], 'taurus-wh': [1610], 'combox-web-acc': [2534], 'dna-cml': [436], 'flr-agent': [4901], 'imqstomp': [7672], 'unidata-ldm': [388], 'identify': [2987], 'amt-redir-tls': [16995], 'remoteware-srv': [3002], 'pdap-np': [1526], 't2-drm': [7932], 'vrpn': [3883], '3com-njack-1': [5264], '3com-njack-2': [5265], 'novell-lu6-2': [1416], 'ipt-anri-anri': [4593], 'commtact-https': [20003], 'sxmp': [3273], 'dai-shell': [45824], 'verismart': [3270], 'bmc_ctd_ldap': [6301], 'isomair': [3589], 'cp-cluster': [8116], 'apc-2160': [2160], 'apc-2161': [2161], 'www': [80], 'mccwebsvr-port': [3570], 'orbiter': [2398], 'apani4': [9163], 'apani3': [9162], 'apani2': [9161], 'apani1': [9160], 'daytime': [13], 'statusd': [5414], 'maitrd': [997], 'glrpc': [9080], 'tmophl7mts': [20046], 'rmlnk': [2818], 'vsixml': [2996], 'vs-server': [3280], 'twds': [8937], 'nicelink': [1095], 'videotex': [516], 'e-woa': [3728], 'postgresql': [5432], 'ipsendmsg': [1992], 'beserver-msg-q': [3527], 'svrloc': [427], 'mxomss': [1141], 'fg-gip': [3294], 'armadp': [1913], 'down': [2022], 'lan900-remote': [2395], 'eye2eye': [1948], 'us-gv': [1370], 'rvs-isdn-dcp': [2578], 'imip': [11319], 'nta-us': [7545], 'fc-cli': [1371], 'traceroute': [33434], 'sonus': [2653], 'd-cinema-csp': [4170], 'qwave': [2177], 'umsp': [2110], 'ique': [18769], 'pt-tls': [271], 'armcenterhttps': [9295], 'lm-dta': [8206], 'boomerang': [1304], 'whisker': [3233], 'n1-fwp': [4446], 'netview-aix-9': [1669], 'classic': [9087], 'amx-icsp': [1319], 'https-wmap': [8991], 'tpmd': [1906], 'search-agent': [1234], 'msolap-ptp2': [2725], 'netmo-http': [6842], 'warehouse': [12322], 'a15': [3598], 'a14': [3597], 'qbdb': [8019], 'journee': [3042], 'deploymentmap': [4570], 'opc-job-start': [423], 'muse': [6888], 'nssagentmgr': [4454], 'jaleosnd': [1623], 'openmailpxy': [5768], 'sunscalar-svc': [1860], 'fse': [7394], 'cajo-discovery': [1198], 'fnet-remote-ui': [1174], 'netapp-icdata': [11105], 'prchat-user': [4455], 'sagxtsds': [4952], 'sdsc-lm': [1537], 'nav-port': [3859], 'radclientport': [3178], 'fujitsu-dtcns': [1514], 'awg-proxy': [3277], 'sah-lm': [3291], 'n1-rmgmt': [4447], 'compressnet': [2, 3], 'inbusiness': [244], 'rsqlserver': [4430], 'calltrax': [3675], 'hpvroom': [5228], 'ls3': [3069], 'sgcip': [16950], 'ljk-login': [472], 'gw-call-port': [3745], 'oraclenet8cman': [1630], 'item': [3848], 'adtempusclient': [3760], 'xdtp': [3088], 'funk-license': [1787], 'crinis-hb': [3818], 'dslremote-mgmt': [2420], 'ntalk': [518], 'ace-client': [2334], 'irdg-post': [2632], 'swistrap': [6965], 'netnews': [532], 'interactionweb': [3508], 'repscmd': [653], 'pmwebapi': [44323], 'integrius-stp': [17234], 'univision': [2820], 'pdtp': [6086], 'tetrinet': [31457], 'enc-eps': [3567], 'stmf': [501], 'sco-dtmgr': [617], 'elanlm': [4346], 'q55-pcc': [1253], 'haipe-otnk': [3769], 'apx500api-2': [2265], 'apx500api-1': [2264], 'cs-live': [2129], 'cisco-snat': [15555], 'signet-ctf': [2733], 'mshnet': [1989], 'tl1-raw-ssl': [6251], 'tn-tl-w1': [474], 'esmmanager': [5600], 'upnotifyps': [3356], 'zephyr-srv': [2102], 'lpar2rrd': [8162], 'writesrv': [1334], 'sagectlpanel': [3698], 'sns-agent': [5417], 'pscl-mgt': [4312], 'icad-el': [425], 'dsmcc-session': [13819], 'canon-capt': [3756], 'thrp': [3963], 'opsec-ufp': [18182], 'parliant': [4681], 'ms-ilm-sts': [5726], 'pconnectmgr': [1562], 'bacula-dir': [9101], 'movaz-ssc': [5252], 'ardus-mtrns': [1117], 'wlbs': [2504], 'rbakcup2': [2774], 'fly': [4396], 'cpqrpm-server': [3257], 'cnap': [7262], 'fodms': [7200], 'mgxswitch': [3070], 'ddm-ssl': [448], 'fiorano-msgsvc': [1856], 'ncube-lm': [1521], 'openport': [260], 'jmb-cds2': [8901], 'asmp': [45000], 'nmsp': [537, 1790], 'entexthigh': [12002], 'nmsd': [1239], 'direcpc-video': [1825], 'lpcp': [1298], 'mao': [2908], 'ariliamulti': [3140], 'matip-type-a': [350], 'matip-type-b': [351], 'necp': [3262], 'gvcp': [3956], 'visitview': [1631], 'appleqtc': [458], 'pago-services1': [30001], 'texai': [5048], 'monitor': [561], 'phonex-port': [3177], 'shofar': [4105], 'policyserver': [3055], 'texar': [333], 'listmgr-port': [3767], 'iatp-highpri': [6998], 'ns-server': [5415], 'xmltec-xmlmail': [9091], 'binkp': [24554], 'isbconference2': [1245], 'tvbus': [2191], 'veritas-pbx': [1556], 'isbconference1': [1244], 'toad-bi-appsrvr': [8066], 'btrieve': [3351], 'isoipsigport-2': [1107], 'msfrs': [4554], 'netrockey6': [4425], 'skip-cert-send': [6456], 'afs3-vlserver': [7003], 'adrep': [3954], 'ii-admin': [3006], 'iasd': [432], 'fiveacross': [1193], 'isis-bcast': [2043], 'iec-104-sec': [19998], 'icpv2': [3130], 'centerline': [3987], 'fagordnc': [3873], 'mercantile': [3398], 'aipn-auth': [3833], 'pciarray': [1552], '3com-net-mgmt': [2391], 'nrcabq-lm': [1458], 'webadmstart': [1110], 'n2nremote': [1685], 'nufw': [4128], 'xpl': [3865], 'registrar': [1712], 'smart-install': [4786], 'gemini-lm': [1590], 'busycal': [4990], 'config-port': [3577], 'aimpp-hello': [2846], 'rtsp': [554], 'proshareaudio': [5713], 'crip': [6253], 'rmopagt': [2959], 'virtualuser': [5423], 'bfd-echo': [3785], 'queueadm': [2230], 'amt-soap-https': [16993], 'permabit-cs': [5312], 'cleanerliverc': [3481], 'telnet': [23], 'hacl-local': [5304], 'lan900_remote': [2395], 'edm-manager': [3460], 'rsc-robot': [1793], 'simplement-tie': [2756], 'privoxy': [8118], 'dasp': [439], 'pktcable-cops': [2126], 'piccolo': [2787], 'server-find': [8351], 'erpc': [121], 'conspiracy': [4692], 'mpnjsosv': [2684], 'xmlblaster': [3412], 'rugameonline': [5156], 'ddi-tcp-5': [8892], 'ddi-tcp-4': [8891], 'ddi-tcp-7': [8894], 'ddi-tcp-6': [8893], 'ddi-tcp-1': [8888], 'ddi-tcp-3': [8890], 'ddi-tcp-2': [8889], 'track': [20670], 'rdrmshc': [1075], 'cisco-sccp': [2000], 'ctsd': [5137], 'gtrack-server': [3591], 'nls-tl': [7549], 'metasage': [1207], 'kopek-httphead': [27504], 'netconfsoapbeep': [833], 'oma-rlp': [7273], 'berknet': [2005], 'mdnsresponder': [5354], 'ddrepl': [4126], 'astergate': [9106], 'sdo-ssh': [3897], 'dyna-lm': [3395], 'cisco-ipsla': [1167], 'spremotetablet': [46998], 'amx-weblinx': [2930], 'dict': [2628], 'helix': [10860], 'rbakcup1': [2773], 'ehp-backup': [3638], 'chromagrafx': [1373], 'ncpm-pm': [1591], 'vistium-share': [1545], 'prm-nm': [409], 'mediat': [5157], 'h323gatestat': [1719], 'sgmp-traps': [160], 'mti-tcs-comm': [2469], 'ardusmul': [1835], 'kermit': [1649], 'ovhpas': [7510], 'pump': [751], 'rads': [12302], 'consul-insight': [5992], 'nntp': [119], 'slingshot': [1705], 'netconf-beep': [831], 'jbroker': [2506], 'msgsys': [9594], 'wsdapi-s': [5358], 'tellumat-nms': [3549], 'dbcontrol_agent': [3938], 'suucp': [4031], 'saratoga': [7542], 'rs-pias': [13217], 'dka': [1263], 'scpi-raw': [5025], 'sns-gateway': [5416], 'mobilitysrv': [6997], 'nimspooler': [48001], 'matrix-vnet': [4360], 'd-s-n': [8086], 'bpcp-trap': [2845], 'netbookmark': [3131], 'ms-shuttle': [568], 'qip-login': [2366], 'ms-alerter': [5359], 'pcmk-remote': [3121], 'mcs-calypsoicf': [3330], 'dt-mgmtsvc': [6325], 'traversal': [4678], 'nati-vi-server': [3363], 'gnutella-rtr': [6347], 'vat-control': [3457], 'pwdgen': [129], 'impera': [1710], 'proaxess': [3961], 'origo-native': [3001], 'interserver': [3060], 'psmond': [1788], 'webphone': [21845], 'iconstructsrv': [6077], 'dpm-acm': [6075], 'twcss': [3428], 'sgi-soap': [11110], 'intel-rci-mp': [16991], 'dzoglserver': [3867], 'nbt-pc': [5133], 'sbook': [1349], 'asprovatalk': [1079], 'epmd': [4369], 'dpkeyserv': [1780], 'nm-asses-admin': [3150], 'interbase': [2041], 'nsjtp-data': [1688], 'cppdp': [4051], 'v-one-spp': [3845], 'tnetos': [377], 'vytalvaultpipe': [2548], 'hp-3000-telnet': [2564], 'vmrdp': [2179], 'ms-rule-engine': [3132], 'cymtec-port': [1898], 'lm-perfworks': [8204], 'ovtopmd': [2532], 'pftp': [662], 'dbcontrol-oms': [1158], 'multiplex': [171], 'm2ua': [2904], 'utsftp': [2529], 'streettalk': [566], 'jwclient': [1938], 'netsc-dev': [155], 'lds-dump': [6544], 'trendchip-dcp': [3608], 'socalia': [5100], 'veritas-ucl': [2148], 'enl-name': [1805], 'zen-pawn': [7628], 'gilatskysurfer': [3013], 'ultrabac': [1910], 'grid': [6268], 'mon': [2583, 9255], 'dbase': [217], 'varadero-1': [4838], 'varadero-0': [4837], 'varadero-2': [4839], 'office-tools': [7789], 'samsung-unidex': [4010], 'qptlmd': [10055], 'empowerid': [7080], 'lm-sserver': [8207], 'mbl-battd': [4153], 'msft-gc': [3268], 'naap': [1340], 'sruth': [38800], 'trispen-sra': [9555], 'facilityview': [1561], 'svdrp': [6419], 'ccss-qmm': [4969], 'mnp-exchange': [2197], 'l3-exprt': [2840], 'sunclustermgr': [1097], 'fatserv': [347], 'twrpc': [3479], 'llrp': [5084], 'beacon-port-2': [4426], 'wcbackup': [8912], 'allpeers': [36001], 'avantageb2b': [2131], 'tht-treasure': [1832], 'gbjd816': [2626], 'teamcoherence': [9222], 'funkproxy': [1505], 'iph-policy-cli': [2962], 'ovladmgr': [7428], 'vrtp': [2255], 'personal-agent': [5555], 'applus': [2037], 'mcs-messaging': [3331], 'talarian-tcp': [5101], 'filenet-obrok': [32777], 'filenet-cm': [32773], 'fujitsu-dtc': [1513], 'apwi-rxspooler': [4393], 'e-mdu': [3727], 'vcs-app': [14141], 'prregister': [4457], 'netiq-mc': [2735], 'suitcase': [2903], 'vhd': [3802], 'vfmobile': [5646], 'ms-olap1': [2393], 'ms-olap3': [2382], 'ms-olap2': [2394], 'ms-olap4': [2383], 'trim-event': [4322], 'compx-lockview': [4308], 'personnel': [3109], 'cernsysmgmtagt': [3830], 'hybrid': [1424], 'sns-channels': [3380], 'ulpnet': [483], 'eicon-x25': [1439], 'corelvideo': [1566], 'iris-beep': [702], 'hp-pxpib': [3101], 'snifferclient': [2452], 'orbplus-iiop': [1597], 'xmpp-client': [5222], 'hpocbus': [2206], 'printopia': [10631], 'atc-lm': [1170], 'husky': [1310], 'documentum-s': [10003], 'wpgs': [780], 'atc-appserver': [1171], 'freeciv': [5556], 'de-noc': [1254], 'amberon': [8301], 'smauth-port': [3929], 'esro-gen': [259], 'masqdialer': [224], 'iden-ralp': [1725], 'clever-tcpip': [6688], 'proxima-lm': [1445], 'iua': [9900], 'xprint-server': [8100], 'pkagent': [3118], 'microsoft-ds': [445], 'worldfusion1': [2595], 'worldfusion2': [2596], 'xoms': [16619], 'grubd': [3136], 'x-bone-ctl': [265], 'markem-dcp': [3836], 'sns-admin': [2658], 'vofr-gateway': [21590], 'lonworks': [2540], '3l-l1': [1511], 'sns-query': [2659], 'ipcs-command': [3743], 'fmsas': [16000], 'ggz': [5688], 'ms-sna-base': [1478], 'ecwcfg': [2263], 'search': [2010], 'cd3o-protocol': [3616], 'citynl': [1729], 'appman-server': [3312], 'mctet-jserv': [3117], 'emp-server1': [6321], 'privatewire': [4449], 'cmmdriver': [1294], 'emp-server2': [6322], 'chipper': [17219], 'tn-timing': [2739], 'ni-visa-remote': [3537], 'netrjs-4': [74], 'hp-hcip': [1782], 'tapeware': [3817], 'nfsrdma': [20049], 'moy-corp': [2488], 'ias-reg': [2140], 'driveappserver': [1930], 'distinct': [9999], 'pcs-sf-ui-man': [6655], 'denali-server': [3444], 'pcle-infex': [3189], 'optocontrol': [22001], 'slp-notify': [1847], 'lm-x': [6200], 'infoseek': [414], 'filenet-tms': [32768], 'ttg-protocol': [2862], 'sge-execd': [6445], 'notify_srvr': [3016], 'alarm-clock-c': [2668], 'ridgeway2': [2777], 'dpserve': [7020], 'tpip': [594], 'scx-proxy': [470], 'cpqrpm-agent': [3256], 'alarm-clock-s': [2667], 'metalbend': [7172], 'quantastor': [8153], 'spiral-admin': [3438], 'weandsf': [48050], 'ibm-mgr': [3801], 'sercomm-scadmin': [6108], 'winshadow': [3261], 'cso': [105], 'pkix-3-ca-ra': [829], 'anoto-rendezv': [3715], 'smsd': [596], 'programmar': [15999], 'pdps': [1314], 'sacred': [1118], 'taskman-port': [2470], 'smsp': [413], 'gv-us': [1369], 'msfw-replica': [2173], 'ati-ip-to-ncpe': [3965], 'net2display': [9086], 'ssh-mgmt': [17235], 'mmpft': [1815], 'wilkenlistener': [1890], 'gotodevice': [2217], 'bftp': [152], 'hislip': [4880], 'patrol-mq-gm': [2664], 'ds-slp': [4406], 'maytagshuffle': [2591], 'gsakmp': [3761], 'dbbrowse': [47557], 'autocuelog': [3104], 'samd': [3275], 'pictrography': [1280], 'netwatcher-mon': [3203], 'apollo-status': [2758], 'hp-san-mgmt': [3037], 'decvms-sysmgt': [441], 'aic-oncrpc': [2786], 'ms-licensing': [5720], 'cisco-net-mgmt': [1741], 'msg-auth': [31], 'med-fsp-rx': [24001], 'officelink2000': [3320], 'ordinox-dbase': [3355], 'bounzza': [2218], 'icpp': [14142], 'saiscm': [1501], 'axon-lm': [1548], 'ca-web-update': [14414], 'indura': [3156], 'di-traceware': [3041], 'uorb': [3313], 'bfd-multi-ctl': [4784], 'rockwell-csp1': [2221], 'abr-api': [1954], 'mos-upper': [10541], 'badm-pub': [6506], 'connect': [2137], 'harp': [1816], 'espeech': [8416], 'ezmeeting': [26261], 'pit-vpn': [2865], 'acd-pm': [8793], 'hpidsagent': [2985], 'enc-eps-mc-sec': [5567], 'spw-dialer': [3796], 'netviewdm3': [731], 'canocentral1': [1872], 'netviewdm1': [729], 'acptsys': [2149], 'bitspeer': [2178], 'csccredir': [40842], 'sbl': [1039], 'wsscomfrmwk': [6602], 'kftp-data': [6620], 'nxedit': [126], 'rocrail': [8051], 'emc-vcas-tcp': [13218], 'wrs-registry': [2340], 'gntp': [23053], 'hacl-monitor': [3542], 'razor': [3555], 'honyaku': [2744], 'ezrelay': [10103], 'sunscalar-dns': [1870], 'serverview-rm': [3172], 'dddp': [9131], 'shadowserver': [2027], 'menandmice-dns': [1337], 'catchpole': [1185], 'goldleaf-licman': [1401], 'm3da': [44900], 'miles-apart': [2621], 'smc-admin': [6787], 'decladebug': [410], 'csvr': [3417], 'dossier': [1175], 'ff-lr-port': [3622], 'iclcnet-locate': [886], 'padl2sim': [5236], 'xns-mail': [58], 'sge_qmaster': [6444], 'emwavemsg': [20480], 'k3software-cli': [26263], 'intuitive-edge': [1355], 'mmcals': [2271], 'tigv2': [4124], 'plysrv-http': [6770], 'solve': [2636], 'accuracer': [12007], 'essp': [2969], 'sphinxql': [9306], 'rushd': [696], 'ctt-broker': [1932], 'iafserver': [479], 'amicon-fpsu-ra': [30003], 'lonewolf-lm': [6146], 'iso-tsap': [102], 'cognex-dataman': [44444], 'dey-keyneg': [8750], 'jtag-server': [1309], 'fxaengine-net': [3402], 'array-manager': [3726], 'ms-wbt-server': [3389], 'find': [24922], 'fpitp': [1045], 'vsnm-agent': [3375], 'mpnjsomg': [2686], 'pafec-lm': [7511], 'iiop': [535], 'passwrd-policy': [1333], 'eapsp': [2291], 'houdini-lm': [1715], 'afs3-fileserver': [7000], 'silc': [706], 'grcmp': [9122], 'wta-wsp-wtp-s': [2923], 'asctrl-agent': [5155], 'mysql-proxy': [6446], 'opsec-sam': [18183], 'hiperscan-id': [8293], 'rmtserver': [2416], 'remoteware-cl': [3000], 'galaxy7-data': [38201], 'odsi': [1308], 'creativeserver': [453, 3364], 'prnrequest': [3910], 'synoptics-trap': [412], 'scte104': [5167], 'warmux': [3826], 'dwmsgserver': [3228], 'slim-devices': [3483], 'imsp': [406], 'eenet': [5234], 'csvr-sslproxy': [3191], 'pluribus': [3469], 'password-chg': [586], 'rsvp-encap-1': [1698], 'rsvp-encap-2': [1699], 'asmps': [45001], 'mailbox': [2004], 'rblcheckd': [3768], 'azeti': [4192], 'ampr-inter': [1536], 'cspmlockmgr': [1272], 'afs3-prserver': [7002], 'nexus-portal': [4021], 'esri-sde': [5151], 'mphlpdmc': [9344], 'pmdfmgt': [7633], 'ccs-software': [2734], 'imdocsvc': [2637], 'pammrpc': [1633], 'toruxserver': [5153], 'qftest-lookup': [3543], 'unix-status': [1957], 'mikey': [2269], 'feitianrockey': [3152], 'retp': [32811], 'collaborator': [622], 'statsci1-lm': [6144], 'dxadmind': [1958], 'liebdevmgmt_c': [3027], 'lm-mon': [31620], 'ltctcp': [3487], 'unify': [181], 'clearcase': [371], 'eportcommdata': [4669], 'epncdp2': [3259], 'spectardb': [3835], 'arepa-cas': [3030], 'sapv1': [9875], 'gris': [2135], 'xtrm': [3423], 'h323gatedisc': [1718], 'wap-wsp': [9200], 'gacp': [190], 'facsys-router': [2515], 'apex-mesh': [912], 'sonus-logging': [2290], 'italk': [12345], 'sfmsso': [5635], 'reversion': [5842], 'aegate': [4549], 'espeech-rtp': [8417], 'pssc': [645], 'netplay-port2': [3641], 'bioserver': [6946], 'netplay-port1': [3640], 'odeumservlink': [3523], 'sms-chat': [2703], 'slc-systemlog': [2826], 'smart-lm': [1608], 'ldp': [646], 'cisco-wafs': [4050], 'insitu-conf': [1490], 'alpes': [463], 'netcelera': [3701], 'optima-vnet': [1051], 'heathview': [35000], 'snac': [3536], 'cawas': [12168], 'snap': [4752], 'ioc-sea-lm': [1579], 'soundsvirtual': [17185], 'sa-msg-port': [1646], 'mt-scaleserver': [2305], 'bip': [4376], 'dpi-proxy': [1795], 'keysrvr': [19283], 'tksocket': [2915], 'mctp': [1100], 'mngsuite': [9535], 'bpcp-poll': [2844], 'rfx-lm': [1497], 'm3ua': [2905], 'mkm-discovery': [3837], 'sysscanner': [3251], 'orbix-cfg-ssl': [3078], 'menandmice-upg': [4603], 'dsx-agent': [3685], 'mylxamport': [2981], 'mmcal': [2272], 'vtsas': [5070], 'solid-e-engine': [1964], 'cyaserv': [2584], 'saiseh': [1644], 'ampr-rcmd': [459], 'hpvmmdata': [1126], 'daishi': [2870], 'openstack-id': [35357], 'badm_priv': [6505], 'fazzt-admin': [4039], 'vergencecm': [2771], 'nsp': [5012], 'nss': [4159], 'nst': [4687], 'emc-xsw-dconfig': [11623], 'sdt': [5568], 'sdr': [9010], 'sds': [5059], 'smart-diagnose': [2721], 'directplay8': [6073], 'asip-webadmin': [311], 'imagepump': [27345], 'sdo': [3635], 'dl-agent': [3876], 'nuts_dem': [4132], 'licensedaemon': [1986], 'groove': [2492], 'orbix-locator': [3075], 'rimf-ps': [2209], 'cpdlc': [5911], 'tns-adv': [3309], 'grid-alt': [6269], 'senomix06': [8057], 'cecsvc': [2571], 'notateit': [4803], 'raven-rmp': [3532], 'ehs-ssl': [4536], 'olsv': [1160], 'olsr': [698], 'mnet-discovery': [5237], 'genie-lm': [1453], 'nacagent': [4407], 'otlp': [6951], 'sftu': [3326], 'sftp': [115], 'mbg-ctrl': [3569], 'netcabinet-com': [4409], 'serverwsd2': [5362], 'ethercat': [34980], 'afrog': [1042], 'isrp-port': [3788], 'dproxy': [1296], 'blaze': [1150], 'lansource': [1485], 'hacl-gs': [5301], 'phrelay': [4868], 'igi-lm': [1404], 'erunbook_agent': [9616], 'epl-slp': [3819], 'noit-transport': [43191], 'can-nds': [1918], 'deskshare': [1702], 'p2pq': [1981], 'efi-lm': [3392], 'd2k-datamover1': [2297], 'd2k-datamover2': [2298], 'xmpp-bosh': [5280], 'bears-02': [3146], 'rrimwm': [1694], 'sitaraserver': [2629], 'zserv': [346], 'iims': [4800], 'pipes': [1465], 'winrm': [47001], 'iclid': [18242], 'rmonitor': [560], 'owserver': [4304], 'systemics-sox': [5406], 'amt-blc-port': [2848], 'pn-requester': [2717], 'bmcpatrolagent': [3181], 'npmp-trap': [609], 'gandalf-lm': [1421], 'ds-user': [4403], 'udt_os': [1382, 3900], 'cp-spxsvr': [4377], 'garcon': [999], 'ovsdb': [6640], 'emfis-data': [140], 'unglue': [2655], 'iris-xpcs': [714], 'fjmpcm': [2975], 'patrol': [8160], 'ssc-agent': [2967], 'serverview-asn': [3170], 'corel_vncadmin': [2654], 'xoraya': [11876], 'xact-backup': [911], '3com-amp3': [629], 'ninaf': [5627], 'mobileip-agent': [434], 'wg-netforce': [3359], 'dkmessenger': [1177], '3par-rcopy': [5785], 'sql*net': [66], 'zfirm-shiprush3': [3841], 'ldap-admin': [3407], 'ies-lm': [1443], 'xpanel': [3737], 'tunnel': [604], 'capfast-lmd': [1756], 'xnm-ssl': [3220], 'ocbinder': [183], 'globecast-id': [6109], 'borland-dsj': [707], 'fronet': [4130], 'bones': [4914], 'slslavemon': [3102], 'web2host': [1559], 'ars-master': [3176], 'apc-3506': [3506], 'afs': [1483], 'profile': [136], 'inovaport1': [23000], 'gds-db': [3050], 'vsaiport': [3317], 'crestron-cip': [41794], 'ppactivation': [5134], 'hnmp': [6790], 'nettgain-nms': [1879], 'wbem-https': [5989], 'neteh-ext': [3829], 'pda-gate': [4012], 'fcp-addr-srvr1': [5500], 'citrixadmin': [2513], 'meter': [570, 571], 'fcp-addr-srvr2': [5501], 'vrace': [9300], 'raw-serial': [2167], 'geolocate': [3108], 'acp-port': [2071], 'apple-sasl': [3659], 'discp-client': [2601], 'tsb': [2741], 'bex-webadmin': [6122], 'tsa': [6689], 'apri-lm': [1447], 'ha-cluster': [694], 'nokia-ann-ch1': [3405], 'nokia-ann-ch2': [3406], 'tsp': [3653], 'qotd': [17], 'mediaspace': [3594], 'fmpro-fdal': [2399], 'vocaltec-hos': [25793], 'commlinx-avl': [1190], 'symplex': [1507], 'apple-vpns-rp': [4112], 'apollo-data': [8121], 'saism': [1436], 'board-voip': [9750], 'swdtp-sv': [10009], 'dixie': [96], 'patrol-ism': [6161], 'onesaf': [3244], 'cichlid': [1377], 'opennl': [1258], 'ismaeasdaqlive': [1949], 'sncp': [7560], 'res': [1942], 'ccmrmi': [3154], 'metaedit-ws': [6390], 'cautcpd': [3061], 'stun': [3478], 'ssad': [4750], 'u-dbap': [3584], 'acl-manager': [4013], 'workflow': [3466], 'ginad': [634], 'insis': [9215], 'di-msg': [2227], 'vaultbase': [1771], 'linktest': [3746], 'domaintime': [9909], 'iclpv-dm': [1389], 'psrserver': [2351], 'xaapi': [1934], 'elpro-tunnel': [4370], 'llsurfup-https': [1184], 'mpnjsc': [1952], 'z-wave': [4123], 'cytel-lm': [3297], 'sweetware-apps': [1221], 'shivadiscovery': [1502], 'almobile-system': [9209], 'suitjd': [3354], 'dnap': [1172], 'navbuddy': [1288], 'ibm_wrless_lan': [1461], 'fjitsuappmgr': [2425], 'labrat': [2560], 'mzap': [2106], 'a16-an-an': [4598], 'paycash-wbp': [8129], 'nqs': [607], 'tidp': [7548], 'bnet': [415], 'hp-dataprotect': [3612], 'idac': [3881], 'isnetserv': [48128], 'glishd': [2833], 'ctiprogramload': [4452], 'connect-server': [3442], 'caller9': [2906], 'lionhead': [2611], 'cft-7': [1768], 'cft-6': [1767], 'cft-5': [1766], 'cft-4': [1765], 'cft-3': [1764], 'cft-2': [1763], 'cft-1': [1762], 'cft-0': [1761], 'oceansoft-lm': [1466], 'hsrp': [1985], 'bmc-perf-sd': [10128], 'codasrv': [2432], 'bootps': [67], 'wv-csp-udp-cir': [3717], 'procos-lm': [3248], 'lazy-ptop': [7099], 'bootpc': [68], 'wsmlb': [3806], 'fjippol-polsvr': [2748], 'quartus-tcl': [2589], 'leoip': [1886], 'c-h-it-port': [3778], 'bintec-capi': [2662], 'salient-dtasrv': [5409], 'foresyte-sec': [5408], 'interwise': [7778], 'ldoms-mgmt': [6482], 'spice': [1923], 'vrtl-vmf-ds': [1956], 'smsqp': [11201], 'xds': [2130], 'securitychase': [5399], 'intu-ec-svcdisc': [8020], 'webemshttp': [2851], 'dn6-nlm-aud': [195], 'cvsup': [5999], 'auditd': [48], 'dpsi': [315], 'mpsserver': [6106], 'ingreslock': [1524], 'tl1-lv': [3081], 'pc-telecommute': [2299], 'alesquery': [5074], 'ibm-diradm-ssl': [3539], 'oi-2000': [2364], 'targus-getdata2': [5202], 'targus-getdata3': [5203], 'jmevt2': [6962], 'targus-getdata1': [5201], 'filenet-rpc': [32769], 'vrt': [4991], 'flamenco-proxy': [3210], 'messageasap': [6070], 'sqlexec-ssl': [9089], 'avocent-proxy': [1078], 'elvin-server': [2916], 'tolfab': [20167], 'd-data': [4301], 'bacula-fd': [9102], 'lv-frontpanel': [3079], 'event-port': [2069], 'rmiaux': [10990], 'news': [2009], 'gss-http': [488], 'npds-tracker': [3680], 'gammafetchsvr': [1859], 'iso-tp0': [146], 'abr-secure': [1955], 'citadel': [504], 'ampl-lic': [5195], 'silverplatter': [416], 'distcc': [3632], 'epicon': [2912], 'mcntp': [5418], 'tsilb': [2489], 'f5-iquery': [4353], 'dellpwrappks': [1266], 'com-bardac-dw': [48556], 'iqnet-port': [3804], 'io-dist-data': [5728], 'pqsflows': [9640], 'powergemplus': [2899], 'cmtp-mgt': [8501], 'ideesrv': [2337], 'ncld': [405], 'secrmmsafecopya': [38865], 'landmarks': [3969], 'armi-server': [3174], 'netbios-dgm': [138], 'dsatp': [2111], 'composit-server': [2417], 'mrssrendezvous': [7392], 'mdqs': [666], 'pacerforum': [1480], 'iop': [2055], 'herodotus-net': [3921], 'mck-ivpip': [2698], 'dl_agent': [3876], 'gcm-app': [14145], 'simba-cs': [1543], 'con': [759], 'xmpp-server': [5269], 'bv-queryengine': [3989], 'documentum_s': [10003], 'bpdbm': [13721], 'itm-mcell-s': [828], 'nirp': [4043], 'lorica-in-sec': [4081], 'nms-dpnss': [2503], 'geneous': [3381], 'zieto-sock': [4072], 'med-ci': [24005], 'ps-ams': [3658], 'repcmd': [641], 'mobrien-chat': [2031], 'frcs': [4915], 'vsiadmin': [2539], 'mstmg-sstp': [6601], 'aipn-reg': [4113], 'trc-netpoll': [2405], 'imtc-map': [2202], 'nim-vdrshell': [6420], 'funk-logger': [1786], 'cart-o-rama': [3292], 'netbill-trans': [1612], 'trap-daemon': [3600], 'ac-cluster': [18463], 'tmi': [8300], 'sdbproxy': [3562], 'sun-sr-http': [6480], 'etftp': [1818], 'dca': [1456], 'xinupageserver': [2020], 'fotogcad': [3878], 'vision_server': [6672], 'dcs': [1367], 'dcp': [93], 'listcrt-port-2': [3914], 'br-channel': [5425], 'powwow-client': [13223], 'findviatv': [3350], 'discard': [9], 'nbx-cc': [2093], 'socks': [1080], 'asoki-sma': [3087], 'autocuesmi': [3103], 'amdsched': [1931], 'pcs-pcw': [2566], 'hp-pdl-datastr': [9100], 'apparenet-ts': [3236], 'unicontrol': [2437, 2499], 'smip': [7734], 'snmp': [161], 'jetcmeserver': [1936], 'oma-ilp': [7276], 'wacp': [3633], 'vopied': [13783], 'newoak': [4001], 'fjsvmpor': [2946], 'vvr-control': [4145], 'optilogic': [2435], 'eq-office-4942': [4942], 'eq-office-4941': [4941], 'eq-office-4940': [4940], 'kingdomsonline': [30260], 'gxtelmd': [2356], 'tacacs-ds': [65], 'sdp-portmapper': [3935], 'oracle-oms': [1159], 'finle-lm': [1784], 'ecolor-imager': [3263], 'iadt': [4169], 'avauthsrvprtcl': [2068], 't1distproc': [1274], 'pip': [321, 1321], 'neto-dcs': [3814], 'multip-msg': [3733], 'tmosms0': [5580], 'tmosms1': [5581], 'mpm-snd': [46], 'collaber': [7689], 'opcua-tcp': [4840], 'dnox': [4022], 'gsms': [16002], 'rt-sound': [35002], 'activesync': [1034], 'xap-ha': [3639], 'ipcd': [576], 'bmc-onekey': [3561], 'l2c-data': [4372], 'scscp': [26133], 'pwdis': [3735], 'idcp': [2326], 'soniqsync': [3803], 'a21-an-1xbs': [4597], 'rhp-iibp': [1912], 'pharmasoft': [1779], 'digital-notary': [1335], 'atm-uhas': [11367], 'medimageportal': [7720], 'senip': [3898], 'pjlink': [4352], 'rise': [7473], 'iee-qfx': [1284], 'fc-ser': [1372], 'p2pgroup': [3587], 'phonebook': [767], 'netwatcher-db': [3204], 'venus': [2430], 'checkoutdb': [5505], 'piranha2': [4601], 'vsat-control': [1880], 'genrad-mux': [176], 'direct': [242], 'ipfixs': [4740], 'd2000webserver': [3120], 'opsmgr': [1270], 'xmms2': [9667], 'lanrevserver': [3971], 'suncacao-websvc': [11165], 'xfr': [682], 'ibm3494': [3494], 'afs3-bos': [7007], 'compaq-https': [2381], 'wap-wsp-s': [9202], 'bmdss': [13823], 'de-cache-query': [1255], 'rcc-host': [2332], 'minivend': [7786], 'mos-soap-opt': [10544], 'cc-tracking': [4870], 'spike': [4683], 'talarian-mqs': [2493], 'ds-srvr': [4401], 'netview-aix-8': [1668], 'vpp': [677], 'netview-aix-1': [1661], 'netview-aix-3': [1663], 'netview-aix-2': [1662], 'netview-aix-5': [1665], 'netview-aix-4': [1664], 'netview-aix-7': [1667], 'netview-aix-6': [1666], 'slscc': [4408], 'vpa': [5164], 'noteshare': [8474], 'osaut': [6679], 'ttyinfo': [2012], 'roketz': [1730], 'slm-api': [1606], 'here-lm': [1409], 'hotu-chat': [3449], 'castorproxy': [3450], 'high-criteria': [2467], 'orion': [2407], 'mcns-tel-ret': [3311], 'close-combat': [1944], 'canit-store': [6568], 'xyplex-mux': [173], 'quest-agent': [3843], 'vslmp': [312], 'enl': [1804], 'netx-agent': [2586], 'fcmsys': [2344], 'z39.50': [210], 'hacl-poll': [5315], 'cadlock2': [1000], 'ovwdb': [2447], 'scientia-ssdb': [2121], 'parallel': [4989], 'sicct': [4742], 'dicom-iscl': [2761], 'entextlow': [12004], 'iso-tp0s': [3782], 'tcoaddressbook': [1977], 'eisp': [3983], 'linogridengine': [12300], 'caacws': [5248], 'cnhrp': [1757], 'clp': [2567], 'mos-lower': [10540], 'intraintra': [3202], 'ctdhercules': [3773], 'intecom-ps2': [5057], 'intecom-ps1': [5056], 'smartsdp': [426], 'intelsync': [3692], 'assuria-slm': [4119], 'nbt-wol': [6133], 'affiliate': [6579], 'scohelp': [457], 'aal-lm': [1469], 'syncserverssl': [2679], 'street-stream': [1736], 'ufastro-instr': [3720], 'desktop-dna': [2763], 'servicetags': [6481], 'omabcastltkm': [4359], 'prnstatus': [3911], 'rds-ib': [18634], 'srssend': [362], 'rds-ip': [18635], 'lontalk-norm': [1628], 'multiling-http': [777], 'rnmap': [3418], 'storman': [4178], 'fjsv-gssagt': [3035], 'mgesupervision': [4679], 'hyperwave-isp': [692], 'spdy': [6121], 'micom-pfs': [490], 'voispeed-port': [3541], 'isis-am': [1642], 'taligent-lm': [1475], 'mvel-lm': [1574], 'authentx': [5067], 'ardusuni': [1834], 'skip-mc-gikreq': [1660], 'hicp': [3250], 'facsys-ntp': [2514], 'exp2': [1022], 'exp1': [1021], 'madge-ltd': [2453], 'allstorcns': [2901], 'npmp-local': [610], 'ordinox-server': [3274], 'paycash-online': [8128], 'sw-orion': [17777], 'apwi-rxserver': [4392], 'ksysguard': [3112], 'smcluster': [4174], 'infomover': [2854], 'radmin-port': [4899], 'paradym-31port': [1864], 'pnet-conn': [7797], 'dls-monitor': [2048], 'msrp': [2855], '914c-g': [211], 'p-net-remote': [34379], 'nbx-au': [2094], 'vrxpservman': [4147], 'hlserver': [3047], 'everydayrc': [2782], 'ept-machine': [3628], 'rap': [38, 256], 'lbf': [2466], 'lbm': [2465], 'medevolve': [13930], 'meta5': [393], 'metaedit-se': [6370], 'bmc-jmx-port': [3604], 'hpstgmgr': [2600], 'hppronetman': [3908], 'dpserveadmin': [7021], 'recvr-rc': [43000], 'csms': [3399], 'v5ua': [5675], 'radix': [2872], 'hexarc': [7397], 'innosys': [1412], 'radio': [1595], 'galaxy4d': [8881], 'lbc-measure': [2815], 'sd-data': [2385], 'giop-ssl': [2482], 'filenet-pa': [32772], 'progistics': [3973], 'pnet-enc': [7798], 'novar-dbase': [23400], 'edm-mgr-cntrl': [3465], '3ds-lm': [1538], 'cs-remote-db': [3630], 'pop3': [110], 'pop2': [109], 'gerhcs': [4985], 'lv-auth': [2147], 'argis-te': [2581], 'simctlp': [2857], 'mcer-port': [6510], 'backup-express': [6123], 'neto-wol-server': [3812], 'ispmmgr': [3775], 'nut': [3493], 'ccag-pib': [7169], 'fsc-port': [9217], 'nxlmd': [28000], 'xinuexpansion3': [2023], 'xinuexpansion4': [2024], 'cruise-diags': [8379], 'shilp': [2049], 'finger': [79], 'prgp': [7747], 'versatalk': [3738], 'appleqtcsrvr': [545], 'blwnkl-port': [2625], 'lupa': [1212], 'altcp': [4165], 'wanscaler': [2312], 'nmasoverip': [1242], 'pkix-timestamp': [318], 'prex-tcp': [4487], 'robcad-lm': [1509], 'whosockami': [2019], 'nameserver': [42], 'cops-tls': [3183], 'b2-license': [2204], 'emcrmirccd': [10004], 'mmaeds': [4668], 'gw-log': [4844], 'conference': [531], 'esinstall': [5599], 'hp-hcip-gwy': [1803], 'rmiactivation': [1098], 'nec-raidplus': [2730], 'stdptc': [2154], 'ccss-qsm': [4970], 'gwen-sonya': [2778], 'wfm': [4057], 'kingfisher': [4058], 'wfc': [4847], 'synapse-nhttps': [8243], 'vocaltec-wconf': [22555], 'flukeserver': [2359], 'aeroflight-ret': [1219], 'veronica': [2770], 'ca-idms': [3709], 'qtms-bootstrap': [3850], 'microcom-sbp': [1680], 'mysql-cm-agent': [1862], 'ias-admind': [2141], 'ccnx': [9695], 'gcmonitor': [2660], 'kfxaclicensing': [3581], 'obrpd': [1092], 'exoline-tcp': [26486], 'ivs-video': [2232], 'wsynch': [3111], 'netapp-icmgmt': [11104], 'va-pacbase': [3676], 'http-alt': [591, 8008, 8080], 'sossd-collect': [7981], 'proactivate': [24678], 'nimhub': [48002], 'ds-admin': [4404], 'vids-avtp': [1853], 'lutap': [4912], 'talon-disc': [7011], 'cpq-tasksmart': [3201], 'bullant-rap': [2965], 'eli': [2087], 'keyserver': [584], 'wago-service': [6626], 'ris': [180], 'els': [1315], 'ncr-ccl': [2528], 'vulture': [3482], 'radius-acct': [1813], 'supercell': [7967], 'cs-services': [3631], 'meta-corp': [6141], 'iclpv-nlc': [1394], 'sgi-eventmond': [5553], 'iclpv-nls': [1393], 'rrac': [5678], 'excerpt': [5400], 'adws': [9389], 'acas': [62], 'acap': [674], 'mctfeed': [5598], 'eicon-slp': [1440], 'ici': [2200], 'netware-csp': [1366], 'opsession-srvr': [3304], 'ica': [1494], 'downtools': [5245], 'shaperai': [43210], 'dectalk': [2007], 'ics': [5639], 'icp': [1112], 'nsw-fe': [27], 'entextmed': [12003], 'myblast': [3795], 'ibridge-data': [2275], 'sqdr': [2728], 'xtrms': [3424], 'directplaysrvr': [47624], 'bdir-pub': [6508], 'h248-binary': [2945], 'prosharedata': [5715], 'lmcs': [4877], 'presence': [5298], 'dcap': [22125], 'cdl-server': [3056], 'interworld': [3548], 'mesavistaco': [1249], 'git': [9418], 'infocrypt': [2233], 'novation': [1322], 'omscontact': [4161], 'jamserverport': [3627], 'sychrond': [3723], 'rtnt-1': [3137], 'rtnt-2': [3138], 'sentlm-srv2srv': [5099], 'pkix-cmc': [5318], 'imprs': [3164], 'bdir_pub': [6508], 'smpnameres': [901], 'tesla-sys-msg': [7631], 'scrabble': [2026], 'talikaserver': [22763], 'simbaexpress': [1583], 'vantronix-mgmt': [8034], 'trim': [1137], 'dandv-tester': [3889], 'sns-protocol': [2409], 'netconfsoaphttp': [832], 'dei-icda': [618], 'redstorm-info': [2348], 'idxp': [603], 'cert-responder': [1640], 'nnp': [3780], 'vpac': [1517], 'vpad': [1516], 'daylitetouch': [6117], 'e-design-net': [6702], 'and-lm': [2646], 'tig': [3943], 'etc-control': [6107], 'vtr-emulator': [3122], 'toad': [2669], 'ibm-mqseries': [1414], 'agslb': [4149], 'nm-assessor': [3151], 'brf-gw': [22951], 'font-service': [7100], 'dhcp-failover': [647], 'mctet-master': [3115], 'amx-axbnet': [1320], 'bmc_patroldb': [1313], 'oma-mlp': [9210], 'dsmcc-passthru': [13820], 'odi-port': [3187], 'dsdn': [1292], 'rjcdb-vcards': [9208], 'can-ferret': [1920], 'ansatrader': [124], 'dtpt': [5721], 'faxportwinport': [1620], 'serverview-as': [3169], 'proxim': [1732], 'contamac-icm': [4846], 'ias-auth': [2139], 'imaps': [993], 'kjtsiteserver': [1339], 'csd-monitor': [3072], 'datalens': [2229], 'hpss-ndapi': [1217], 'siebel-ns': [2320], 'nexentamv': [8457], 'atex_elmd': [1385], 'imap3': [220], 'netop-rc': [1970], 'altbsdp': [7799], 'rsf-1': [1195], 'opalis-robot': [314], 'pmd': [7431], 'oidocsvc': [4142], 'comotionmaster': [2261], 'ethernet-ip-2': [44818], 'ethernet-ip-1': [2222], 'upstriggervsw': [3786], 'filenet-re': [32774], 'niprobe': [25903], 'ridgeway1': [2776], 'prsvp': [3455], 'cindycollab': [3770], 'fujitsu-dev': [747], 'itactionserver2': [7281], 'itactionserver1': [7280], 'orbixd': [1570], 'escvpnet': [3629], '3comfaxrpc': [3446], '4talk': [3284], 'dialpad-voice2': [2861], 'dialpad-voice1': [2860], 'imqstomps': [7673], 'contamac_icm': [4846], 'healthd': [1281], 'stonefalls': [2986], 'newlixreg': [2671], 'rapidbase': [1953], 'quest-data-hub': [3566], 'sntp-heartbeat': [580], 'tsdos390': [1237], 'ibridge-mgmt': [2276], 'htcp': [4827], 'qotps': [2724], 'scientia-sdb': [1811], 'msp': [18, 2438], 'pfu-prcallback': [3208], 'osb-sd': [400], 'gdoi': [848], 'ansyslmd': [1055], 'ice-srouter': [4064], 'afs3-errors': [7006], 'icg-iprelay': [2064], 'ssowatch': [3644], 'cacsambroker': [7163], 'oemcacao-rmi': [11174], 'rfile': [750], 'cl-db-remote': [4137], 'sybaseanywhere': [2638], 'sixtrak': [1594], 'corbaloc': [2809], 'smntubootstrap': [2613], 'pop3s': [995], 'srvc-registry': [3018], 'rib-slm': [3296], 'sunclustergeo': [2084], 'childkey-notif': [1891], 'pxc-splr': [4007], 'aed-512': [149], 'ssslog-mgr': [1204], 'csdmbase': [1467, 1471], 'd-data-control': [4302], 'sflm': [3162], 'mediabox': [46999], 'doc-server': [7165], 'mailprox': [3936], 'dell-rm-port': [3668], 'valisys-lm': [1457], 'altav-tunnel': [3265], 'seagull-ais': [1208], 'bcinameservice': [3415], 'qbikgdp': [368], 'lipsinc': [1968], 'uaiact': [1470], 'nbx-ser': [2095], 'ndl-als': [3431], 'dmdocbroker': [1489], 'cddbp-alt': [8880], 'metasys': [11001], 'dcsoftware': [3793], 'name': [42], 'namp': [167], 'pm-cmdsvr': [5112], 'compaq-evm': [619], 'megardsvr-port': [3571], 'igcp': [2801], 'pt2-discover': [1101], 'myrtle': [1831], 'sd-elmd': [1681], 'pduncs': [16310], 'smar-se-port2': [4988], 'smar-se-port1': [4987], 'd3winosfi': [3458], 'xnmp': [1652], 'mc-brk-srv': [3180], 'nexgen': [6627], 'icabrowser': [1604], 'magicnotes': [3023], 'cab-protocol': [595], 'turn': [3478], 'netiq': [2220], 'vision-elmd': [6673], 'chip-lm': [1572], 'openremote-ctrl': [8688], 'imyx': [1143], 'sso-control': [2711], 'ewinstaller': [4091], 'eba': [45678], 'fs-mgmt': [8044], 'ibm-mqseries2': [1881], 'hecmtl-db': [1551], 'instl-bootc': [1068], 'iax': [4569], 'snmp-tcp-port': [1993], 'instl-boots': [1067], 'aminet': [2639], 'tvpm': [21800], 'rtps-dd-mt': [7402], 'visicron-vs': [4307], 'cops': [3288], 'guttersnex': [35356], 'gamesmith-port': [31765], 'copy': [8445], 'prizma': [2039], 'ovalarmsrv-cmd': [2954], 'musiconline': [1806], 'neckar': [37475], 'lutcp': [4913], 'timeflies': [1362], 'dccm': [5679], 'wap-wsp-wtp': [9201], 'netbill-keyrep': [1613], 'cwmp': [7547], 'prp': [2091], 'accu-lmgr': [7781], 'konspire2b': [6085], 'ewdgs': [4092], 'klio': [7697], 'silhouette': [7500], 'thrtx': [4139], 'ipfix': [4739], 'appworxsrv': [2136], 'http-wmap': [8990], 'acp-conduit': [3823], 'surf': [1010], 'cnrp': [2757], 'cifs': [3020], 'dtserver-port': [4028], 'ife-icorp': [5165], 'opswagent': [3976], 'cesdinv': [2856], 'oracleas-https': [7443], 'simplifymedia': [8087], 'doip-data': [13400], 'recipe': [2240], 'icms': [4486], 'ncadg-ip-udp': [3063], 'wms-messenger': [3219], 'amt-esd-prot': [1082], 'xrpc-registry': [3651], 'ttc-etap': [2675], 'pvuniwien': [1081], 'ssm-cvs': [2477], 'filenet-nch': [32770], 'quaddb': [2497], 'sst': [266], 'ssp': [3249], 'ssh': [22], 'prosharerequest': [5716], 'msnp': [1863], 's8-client-port': [3153], 'ni-mail': [61], 'transmit-port': [5282], 'vp2p': [8473], 'directv-catlg': [3337], 'natuslink': [2895], 'matrix_vnet': [4360], 'ldss': [6087], 'rmc': [657], 'www-ldap-gw': [1760], 'radio-sm': [1596], 'bhmds': [310], 'mylex-mapd': [467], 'rt-labtracker': [35005], 'vytalvaultvsmp': [2547], 'vnyx': [8699], 'hsrpv6': [2029], 'synel-data': [3734], 'sim-control': [3110], 'sbi-agent': [3962], 'omviagent': [4429], 'roboeda': [2920], 'locus-map': [125], 'ssdispatch': [3430], 'sflow': [6343], 'fg-sysupdate': [6550], 'windlm': [1785], 'hello-port': [652], 'cplscrambler-in': [1087], 'redstorm-diag': [2349], 'rescap': [283], 'mrip': [4986], 'ardus-trns': [1115], 'sdl-ets': [5081], 'bbars': [3327], 'aodv': [654], 'ka0wuc': [2822], 'lanserver': [637], 'ndsp': [2881], 'vsi-omega': [7566], 'rwhois': [4321], 'netplan': [2983], 'nextstep': [178], 'casp': [1130], 'z39-50': [210], 'profinet-cm': [34964], 'rbr-debug': [44553], 'macbak': [4181], 'csccfirewall': [40843], 'intersys-cache': [1972], 'dialogic-elmd': [1945], 'trip': [6069], 'sauterdongle': [25576], 'mcns-sec': [638], 'islc': [1637], 'msi-cps-rm': [8675], 'persona': [1916], 'appswitch-emp': [2616], 'resacommunity': [1154], 'locus-con': [127], 'ms-ilm': [5725], 'relief': [1353], 'safetynetp': [40000], 'vaprtm': [3654], 'hp-nnm-data': [2690], 'hinp': [9954], 'netsteward': [2810], 'cadview-3d': [649], 'lsi-raid-mgmt': [2463], 'csd-mgmt-port': [3071], 'msg-icp': [29], 'pcmail-srv': [158], 'aises': [2783], 'scpi-telnet': [5024], 'itv-control': [3899], 'quailnet': [5464], 'lecroy-vicp': [1861], 'ns': [760], 'print-srv': [170], 'mftp': [349, 5402], 'fcis': [4727], 'dbisamserver2': [12006], 'net-device': [4350], 'dbisamserver1': [12005], 'scriptview': [7741], 'veracity': [1062], 'remote-collab': [2250], 'rsync': [873], 'watchdog-nt': [2723], 'gearman': [4730], 'ep-nsp': [3621], 'udt-os': [1382, 3900], 'cognima': [3779], 'ddm-dfm': [447], 'storview': [9293], 'nw-license': [3697], 'awacs-ice': [4488], 'jdl-dbkitchen': [3086], 'inspect': [1602], 'minger': [4069], 'ktelnet': [6623], 'oracle-em1': [1748], 'dls-mon': [198], 'oracle-em2': [1754], 'spss': [5443], 'besapi': [3408], 'tributary': [2580], 'jediserver': [2406], 'spsc': [478], 'hp-device-disc': [3329], 'cvc_hostd': [442], 'flirtmitmir': [3840], 'rockwell-csp2': [2223], 'ehs': [4535], 'bprd': [13720], 'sun-as-iiops': [3708], 'ibm-pps': [1376], 'virtualtape': [2386], 'simco': [7626], 'wap-push-https': [4036], 'rdm-tfs': [21553], 'rcip-itu': [2225], 'amcs': [8766], 'vacdsm-sws': [670], 'cbt': [7777], 'apparenet-as': [3238], 'appliance-cfg': [2898], 'adobeserver-2': [1103], 'adobeserver-3': [3703], 'adobeserver-1': [1102], 'opsview-envoy': [4125], 'csoftragent': [3004], 'adobeserver-4': [3704], 'adobeserver-5': [3705], 'swr-port': [3491], 'starquiz-port': [3526], 'ctcd': [1851], 'ibm-wrless-lan': [1461], 'ftp': [21], 'accessbuilder': [888], 'nucleus': [1463], 'bues_service': [2446], 'arkivio': [3426], 'hdap': [263], 'hacl-cfg': [5302], 'intrastar': [1907], 'davsrc': [9800], 'hpssd': [2207], 'chevinservices': [3349], 'metricadbc': [2622], 'newlixengine': [2075], 'tnp-discover': [8320], 'nsc-posa': [2605], 'tip-app-server': [3160], 'coauthor': [1529], 'ptp': [15740], 'gdrive-sync': [37483], 'iberiagames': [1726], 'fjappmgrbulk': [2510], 'openmath': [1473], 'sntlkeyssrvr': [9450], 'icap': [1344], 'hems': [151], 'utime': [519], 'dbreporter': [1379], 'bnetfile': [1120], 'xdas': [7629], 'delibo': [2562], 'dmod-workspace': [3199], 'idtp': [25604], 'direcpc-si': [2464], 'oemcacao-jmxmp': [11172], 'ratl': [2449], 'nbd': [10809], 'sua': [14001], 'sum': [6551], 'sns-dispatcher': [2657], 'intu-ec-client': [8021], 'arbortext-lm': [1557], 'pim-port': [8471], 'pra-elmd': [1587], 'acp-discovery': [3822], 'ctp-state': [4047], 'silkmeter': [5461], 'tacnews': [98], 'canocentral0': [1871], 'intermapper': [8181], 'streletz': [6344], 'netviewdm2': [730], 'rrifmm': [1696], 'galaxy-server': [3051], 'smap': [3731], 'synchronet-upd': [6102], 'c1222-acse': [1153], 'arepa-raft': [3025], 'intrinsa': [503], 'scipticslsrvr': [2577], 'snagas': [108], 'sdmmp': [5573], 'ivcollector': [1275], 'qcp': [5082], 'hermes': [1248], 'ac-tech': [2796], 'softpc': [215], 'audit': [182], 'autonoc': [1140], 'boks_clntd': [6503], 'datascaler-ctl': [6625], 'e3consultants': [3157], 'clusterxl': [18243], 'mira': [3454], 'parsec-master': [6580], 'nuxsl': [5991], 'qmtp': [209], 'applusservice': [4087], 'sdt-lmd': [3319], 'acr-nema': [104], 'mqe-broker': [3957], 'caistoragemgr': [7162], 'ibm-abtact': [1586], 'swdtp': [10104], 'htuilsrv': [5023], 'tbrpf': [712], 'sharp-server': [3617], 'telnets': [992], 'cfengine': [5308], 'mdbs_daemon': [800], 'sor-update': [3922], 'iascontrol-oms': [1156], 'filenet-rmi': [32771], 'call-logging': [2552], 'six-degrees': [3611], 'agentview': [2331], 'xsync': [3721], 'tsaf': [12753], 'cadlock': [770], 'ininmessaging': [5597], 'jibe-eb': [3777], 'ardt': [1826], 'firemonrcc': [3192], 'creativepartnr': [455, 3366], 'silverpeakcomm': [4164], 'isns': [3205], 'fryeserv': [2788], 'zabbix-agent': [10050], 'prat': [1264], 'agentsease-db': [3997], 'scol': [1200], 'netrix-sftm': [2328], 'lsp-ping': [3503], 'dvr-esm': [2804], 'ismserver': [9500], 'csoft-plusclnt': [2699], 'social-alarm': [5146], 'prism-deploy': [3133], 'jstel': [1064], 'cruise-enum': [8376], 'neoiface': [1285], 'sabams': [2760], 'sops': [3944], 'izm': [4109], 'csnotify': [2955], 'lansurveyorxml': [3815], 'apw-registry': [3758], 'talarian-mcast4': [4018], 'talarian-mcast5': [4019], 'talarian-mcast1': [4015], 'talarian-mcast2': [4016], 'talarian-mcast3': [4017], 'memcache': [11211], 'casrmagent': [7167], 'swxadmin': [5043], 'fac-restore': [5582], 'miroconnect': [1532], 'ew-mgmt': [43440], 'vpps-via': [676], 'ca-2': [5065], 'ca-1': [5064], 'activememory': [2859], 'epnsdp': [2051], 'nmmp': [3649], 'observium-agent': [36602], 'liebdevmgmt-a': [3029], 'liebdevmgmt-c': [3027], 'bh611': [354], 'cp-spxdpy': [4378], 'precise-vip': [2924], 'cloanto-lm': [3397], 'acctopus-cc': [6868], 'interact': [4052], 'openmail': [5729], 'emc-gateway': [1273], 'ttat3lb': [3579], 'hp-alarm-mgr': [383], 'fxuptp': [19539], 'imsldoc': [2035], 'rfid-rp1': [4684], 'tcc-http': [24680], 'tolteces': [4375], 'spandataport': [3193], 'sype-transport': [9911], 'responselogic': [2886], 'ms-sna-server': [1477], 'winfs': [5009], 'vpvd': [1518], 'j-lan-p': [2808], 'vpvc': [1519], 'efr': [5618], 'efs': [520], 'rpasswd': [774], 'osmosis-aeea': [3034], 'openwebnet': [20005], 'exec': [512], 'dbdb': [6104], 'winpcs': [5166], 'tpdu': [1430], 'tftp-mcast': [1758], 'digiman': [2362], 'cspuni': [2806], 'sas-remote-hlp': [3755], 'netml': [2288], 'sbackup': [5163], 'vspread': [2695], 'opus-services': [3718], 'mimer': [1360], 'cdn': [2412], 'fuscript': [1144], 'cds': [4115], 'optech-port1-lm': [2237], 'iclcnet-svinfo': [887], 'gtegsc-lm': [1452], 'tunstall-pnc': [1846], 'psi-ptt': [4374], 'hiq': [1410], 'telefinder': [1474], 'sms-rcinfo': [2701], 'perrla': [4313], 'fjippol-port1': [2750], 'fjippol-port2': [2751], 'media-agent': [2789], 'mediacntrlnfsd': [2363], 'eyetv': [2170], 'xnm-clear-text': [3221], 'netbios-ns': [137], 'continuus': [5412], 'gtp-user': [2152], 'http-mgmt': [280], 'svcloud': [8404], 'orasrv': [1525], 'nuauth': [4129], 'comscm': [437], 'cmc-port': [3576], 'novar-alarm': [23401], 'nimreg': [1059], 'apm-link': [32483], 'ipdr-sp': [4737], 'global-cd-port': [3229], 'ncpm-ft': [1744], 'bctp': [8999], 'objective-dbc': [1388], 'initlsmsad': [2793], 'p4p-portal': [6671], 'escale (newton dock)': [3679], 'symantec-sim': [3547], 'caerpc': [42510], 'prelude': [4690], 'tsspmap': [1568], 'diagmond': [1508], 'ppsuitemsg': [5863], 'actnet': [5411], 'versa-tek': [2610], 'ms-rome': [569], 'shivahose': [1549], 'pspserver': [2353], 'tgp': [1223], 'unisys-eportal': [37654], 'adtech-test': [3357], 'rbt-wanopt': [7810], 'railgun-webaccl': [2408], 'ethoscan': [6935], 'silverpeakpeer': [4163], 'synctest': [45045], 'bnetgame': [1119], 'pk': [5272], 'ph': [481], 'kmscontrol': [1773], 'onbase-dds': [2185], 'nhserver': [2672], 'syam-smc': [3895], 'cmip-man': [163], 'dhcpv6-server': [547], 'can-ferret-ssl': [3661], 'netperf': [12865], 'saphostctrl': [1128], 'wip-port': [3414], 'serverview-gf': [3171], 'quosa': [4841], 'oma-ilp-s': [7277], 'ste-smsc': [1836], 'abbaccuray': [1546], 'secure-mqtt': [8883], 'rid': [4590], 'ecsqdmn': [1882], 'cumulus': [9287], 'galaxy-network': [5235], 'jdatastore': [2508], 'bgs-nsi': [482], 'whoispp': [63], 'cnckadserver': [7168], 'haipe-discover': [3623], 'simple-push': [3687], 'alpha-sms': [1849], 'iclpv-pm': [1392], 'mindarray-ca': [9445], 'homesteadglory': [2597], 'emwin': [2211], 'bridgecontrol': [1073], 'kerberos-adm': [749], 'opsec-lea': [18184], 'iss-mgmt-ssl': [3995], 'nmap': [689], 'profilemac': [4749], 'sgi-dmfmgr': [11109], 'fujitsu-mmpdc': [1657], 'acnet': [6801], 'vdmplay': [1707], 'signacert-agent': [5032], 'ftp-data': [20], 'udpradio': [1833], 'sdserver': [2309], 'newwavesearch': [2058], 'visionpyramid': [1247], 'afs3-volser': [7005], 'snmptls-trap': [10162], 'airshot': [3975], 'infolibria': [2319], 'childkey-ctrl': [1892], 'tl-ipcproxy': [4176], 'sccip-media': [3499], 'abcvoice-port': [3781], 'mib-streaming': [2292], 'redstorm_diag': [2349], 'entrust-kmsh': [709], 'apple-licman': [1381], 'quest-vista': [7980], 'boks': [6500], 'ecnp': [2858], 'blackboard': [2032], 'pegboard': [1357], 'svnet': [3413], 'surebox': [5453], 'opennl-voice': [1259], 'fjippol-swrly': [2747], 'irdmi': [8000], 'vmodem': [3141], 'corelccam': [4300], 'rap-ip': [3813], 'wxbrief': [4368], 'ans-console': [3440], 'plethora': [3480], 'bv-agent': [3993], 'diameters': [5868], 'mdns': [5353], 'epmap': [135], '3comnetman': [1181], 'beorl': [5633], 'npqes-test': [4703], 'biap-mp': [1962], 'dns-llq': [5352], 'ehome-ms': [2228], 'webmail-2': [3511], 'd2000kernel': [3119], 'groupwise': [1677], '3com-nsd': [1742], 'cycleserv2': [772], 'rasadv': [9753], 'magenta-logic': [313], 'auris': [2772], 'ema-sent-lm': [2526], 'davsrcs': [9802], 'daqstream': [7411], 'elektron-admin': [5398], 'pirp': [553], 'linktest-s': [3747], 'fj-hdnet': [1717], 'sift-uft': [608], 'vatata': [4188], 'qsnet-nucl': [4358], 'ff-sm': [1091], 'ppcontrol': [2505], 'passgo': [511], 'mc3ss': [3521], 'ita-agent': [5051], 'm2mservices': [8383], 'bullant-srap': [2964], 'watershed-lm': [6143], 'scinet': [7708], 'sur-meas': [243], 'opalis-rdv': [536], 'mit-dov': [91], 'diagnose-proc': [6072], 'synchronite': [4106], 'icshostsvc': [4553], 'ontobroker': [2267], 'ggf-ncp': [678], 'timbuktu-srv2': [1418], 'timbuktu-srv3': [1419], 'timbuktu-srv1': [1417], 'timbuktu-srv4': [1420], 'gamelobby': [2914], 'd-cinema-rrp': [1173], 'itscomm-ns': [1573], 'windb': [2522], 'crmsbits': [2422], 'bveapi': [10880], 'unet': [1189], 'dbsyncarbiter': [4953], 'simon': [4753], 'colubris': [3490], 'isakmp': [500], 'xpilot': [15345], 'erunbook-server': [9617], 'rt-event': [3706], 'orion-rmi-reg': [2413], 'ifsp': [4744], 'compaq-scp': [2766], 'vmsvc': [7024], 'netcp': [395], 'cas': [2418], 'ndm-agent-port': [43189], 'rrh': [753], 'acis': [9953], 'salient-mux': [5422], 'canon-mfnp': [8610], 'cfw': [7563], 'cfs': [7546], 'rrp': [648], 'foresyte-clear': [5407], 'pando-pub': [7680], 'hypercube-lm': [1577], 'ndsauth': [353], 'agcat': [3915], 'caicci': [1721], 'trustestablish': [2573], 'hkp': [11371], 'arena-server': [11321], 'smc-https': [6789], 'mtport-regist': [2791], 'iclcnet_svinfo': [887], 'openmailns': [5766], 'dsp3270': [246], 'appleugcontrol': [2336], 'gds-adppiw-db': [4550], 'netx-server': [2585], 'delos-dms': [3714], 'jvserver': [1939], 'apollo-relay': [10252], 'dsom-server': [3053], 'jaxer-web': [4327], 'zigbee-ip': [17755], 'jomamqmonitor': [4114], 'sightline': [1645], 'mapper-nodemgr': [3984], 'pdl-datastream': [9100], 'taep-as-svc': [5111], 'auriga-router': [5680], 'pvaccess': [5075], 'lpdg': [10805], 'dec-dlm': [625], 'vchat': [1168], 'rapi': [2176], 'dwr': [644], 'sip': [5060], 'midnight-tech': [3008], 'ada-cip': [2085], 'dwf': [1450], 'pro-ed': [8032], 'rt-event-s': [3707], 'asnaacceler8db': [5042], 'shareapp': [3595], 'msdp': [639], 'nati-dstp': [3015], 'msmq': [1801], 'light': [4670], 'rapido-ip': [2457], 'entrust-aaas': [680], 'sybasesrvmon': [4950], 'talnet': [1838], 'extensis': [2666], 'audio-activmail': [1397], 'nssalertmgr': [4453], 'cypress-stat': [2017], 'unisql': [1978], 'quake': [26000], 'mentaclient': [2117], 'syam-webserver': [3930], 'os-licman': [1384], 'ellpack': [2025], 'rsvd': [168], 'cscp': [40841], 'pserver': [3662], 'nim-wan': [6421], 'bmc-grx': [6300], 'jboss-iiop': [3528], 'mysql-cluster': [1186], 'winshadow-hd': [3861], 'cti-redwood': [2563], 'emc-xsw-dcache': [11723], 'q3ade': [7794], 'bmc-perf-mgrd': [6768], 'appiq-mgmt': [4674], 'remcap': [4731], 'xiostatus': [2341], 'edix': [3123], 'nfa': [1155], 'tram': [4567], 'lanrevagent': [3970], 'idps': [3797], 'rrilwm': [1695], 'bts-x73': [3681], 'nfs': [2049], 'trap': [4020], 'mgcp-gateway': [2427], 'fastlynx': [2689], 'ovalarmsrv': [2953], 'dec-notes': [3333], 'autopac': [4685], 'datacaptor': [1857], 'firepower': [2615], 'cedros-fds': [4140], 'vieo-fe': [3245], 'msi-selectplay': [2871], 'tappi-boxnet': [2306], 'vce': [11111], 'abcsoftware': [3996], 'netwkpathengine': [3209], 'qip-audup': [2765], 'iris-xpc': [713], 'bandwiz-system': [1929], 'entextnetwk': [12001], 'disclose': [667], 'hagel-dump': [3036], 'molly': [1374], 'jcp': [19541], 'lotusnote': [1352], 'esimport': [3564], 'paging-port': [3771], 'ltp': [4044], 'a3-sdunode': [5604], 'jdmn-port': [4030], 'rsip': [4555], 'h2gf-w-2m': [3179], 'essweb-gw': [1772], 'iclpv-sas': [1391], 'cst-port': [3742], 'admins-lms': [2692], 'echo': [7], 'cadsi-lm': [1387], 'ldaps': [636], 'ciphire-data': [3887], 'hp-sessmon': [19412], 'pinghgl': [4306], 'world-lm': [1462], 'siam': [498], 'de-spot': [2753], 'shell': [514], 'sdp-id-port': [3242], 'idware-router': [2079], 't2-brm': [7933], 'telindus': [1728], 'intellistor-lm': [1539], 'cryptoadmin': [624], 'encore': [1740], 'symb-sb-port': [3923], 'sunfm-port': [3934], 'watchme-7272': [7272], 'netserialext1': [16360], 'netsupport2': [5421], 'xrl': [1104], 'secure-cfg-svr': [3978], 'nsrmp': [359], 'sftsrv': [1303], 'peerwire': [9104], 'iso-tsap-c2': [399], 'centra': [1709], 'pxc-pin': [4005], 'hpvirtgrp': [5223], 'cdid': [3315], 'beeyond-media': [1943], 'smc-jmx': [6786], 'ttntspauto': [3474], 'realsecure': [2998], 'avenyo': [2992], 'nimaux': [3902], 'windream': [534], 'fcopys-server': [5746], 'sec-pc2fax-srv': [9402], 'fcp-udp': [810], 'sgi-arrayd': [5434], 'lavenir-lm': [3373], 'imagequery': [2239], 'fiorano-rtrsvc': [1855], 'mobileanalyzer': [7869], 'asterix': [8600], 'tmesis-upshot': [2798], 'wso2esb-console': [9444], 'kv-agent': [3361], 'mpl-gprs-port': [3924], 'tekpls': [1946], 'coord-svr': [2565], 'stm-pproc': [3080], 'sscan': [3853], 'omnivision': [1135], 'aibkup': [4071], 'caci-lm': [1554], 'bhevent': [357], 'eforward': [2181], 'video-activmail': [1398], 'devshr-nts': [552], 'wap-vcard-s': [9206], 'concomp1': [1802], 'expresspay': [2755], 'sgmp': [153], 'gtaua': [2186], 'dls': [197, 2047], 'xybrid-cloud': [9925], 'treehopper': [3959], 'metastorm': [2511], 'mvs-capacity': [10007], 'ieee-mms-ssl': [695], 'must-p2p': [3514], 'vsamredirector': [2387], 'fjmpjps': [1873], 'sun-sea-port': [16161], 'accord-mgc': [1205], 'visinet-gui': [3601], 'lanmessenger': [2372], 'dpap': [8770], 'servstat': [633], 'terabase': [4000], 'sslp': [1750], 'gw-asv': [4842], 're-mail-ck': [50], 'ncconfig': [1888], 'proactivesrvr': [2722], 'rpi': [2214], 'aws-brf': [22800], 'capmux': [4728], 'flr_agent': [4901], 'rtps-dd-ut': [7401], 'wimaxasncp': [2231], 'discovery-port': [1925], 'semaphore': [3255], 'entrust-ash': [710], 'cadencecontrol': [2318], 'fmwp': [5015], 'csnet-ns': [105], 'cypress': [2015], 'at-rtmp': [201], 'swrmi': [1866], 'seispoc': [2254], 'apc-3052': [3052], 'mgcs-mfp-port': [6509], 'dayliteserver': [6113], 'fdtracks': [5579], 'vrts-auth-port': [4032], 'silkp1': [2829], 'silkp3': [2831], 'silkp2': [2830], 'silkp4': [2832], 'fprams': [4122], 'ergolight': [2109], 'flexlm': [744], 'warehouse-sss': [12321], 'wap-push-http': [4035], 'cruise-swroute': [8377], 'wkars': [2720], 'sco-peer-tta': [5427], 'vidigo': [3231], 'pdp': [1675], 'cera-bcm': [1794], 'incp': [2932], 'esnm-zoning': [4023], 'ito-e-gui': [2531], 'santak-ups': [3038], 'unite': [3217], 'unikeypro': [4127], 'remographlm': [2373], 'martalk': [7073], 'pcep': [4189], 'lorica-out': [4082], 'lbc-control': [2780], 'fmtp': [8500], 'astromed-main': [2864], 'sdfunc': [2046], 'hhb-gateway': [1136], 'pov-ray': [494], 'ndnp': [2883], 'tempest-port': [11600], 'ss7ns': [477], 'mailbox-lm': [505], 'priority-e-com': [2618], 'aztec': [3512], 'directplay': [2234], 'wifree': [11208], 'na-er-tip': [3725], 'soap-http': [7627], 'menandmice-mon': [4552], 'softdataphone': [1621], 'rcts': [2258], 'qt-serveradmin': [1220], 'press': [3582], 'rsh-spx': [222], 'roboer': [2919], 'omginitialrefs': [900], 'ms-v-worlds': [2525], 'appss-lm': [3879], 'kdm': [2115], 'fjinvmgr': [9396], 'facelink': [1915], 'dnp-sec': [19999], 'encrypted_admin': [1138], 'spectardata': [3834], 'i3-sessionmgr': [3952], 'emcads': [3945], 'srdp': [3942], 'boxbackupstore': [4186], 'xns-ch': [54], 'qdb2service': [45825], 'rpc2portmap': [369], 'obex': [650], 'arcpd': [3513], 'cplscrambler-al': [1088], 'apwi-imserver': [4391], 'hri-port': [3439], 'omnivisionesx': [4395], 'innosys-acl': [1413], 'winddx': [1727], 'tacticalauth': [2392], 'agps-port': [3425], 'cvmon': [1686], 'sqlsrv': [156], 'exoconfig': [26487], 'kpn-icw': [3699], 'idrs': [2995], 'poweronnud': [3168], 'cl/1': [172], 'mmacomm': [4667], 'rets': [6103], 'networklens': [3409], 'vad': [14154], 'a1-bs': [5603], 'opalis-rbt-ipc': [5314], 'vat': [3456], 'jaugsremotec-2': [3473], 'jaugsremotec-1': [3472], 'personal-link': [281], 'chimera-hwm': [4009], 'nds_sso': [3024], 'vemmi': [575], 'nms_topo_serv': [1486], 'arns': [384], 'srvc_registry': [3018], 'tve-announce': [2670], 'undo-lm': [5281], 'indx-dds': [2454], 'sco-aip': [5307], 'gadgetgate2way': [2678], 'pearldoc-xact': [1980], 'isdc': [1636], 'isdd': [8148], 'lyskom': [4894], 'user-manager': [3272], 'ccmail': [3264], 'hyper-g': [418], 'apc-9952': [9952], 'apc-9950': [9950], 'apc-9951': [9951], 'fjhpjp': [3067], 'dey-sapi': [4330], 'mil-2045-47001': [1581], 'lotusmtap': [3007], 'gap': [10800], 'netmap_lm': [1493], 'sasp': [3860], 'wbem-rmi': [5987], 'sasg': [3744], 'hp-status': [5226], 'td-postman': [1049]}
-udp_port_to_services = {8192: ['spytechphone'], 1: ['tcpmux'], 2: ['compressnet'], 3: ['compressnet'], 32772: ['filenet-pa'], 5: ['rje'], 32774: ['filenet-re'], 7: ['echo'], 8200: ['trivnet1'], 9: ['discard'], 8202: ['aesop'], 11: ['systat'], 8204: ['lm-perfworks'], 13: ['daytime'], 8206: ['lm-dta'], 8207: ['lm-sserver'], 8208: ['lm-webwatcher'], 17: ['qotd'], 18: ['msp'], 19: ['chargen'], 20: ['ftp-data'], 21: ['ftp'], 22: ['ssh'], 23: ['telnet'], 25: ['smtp'], 27: ['nsw-fe'], 29: ['msg-icp'], 31: ['msg-auth'], 33: ['dsp'], 17755: ['zigbee-ip'], 37: ['time'], 38: ['rap'], 39: ['rlp'], 41: ['graphics'], 42: ['name', 'nameserver'], 43: ['nicname'], 44: ['mpm-flags'], 45: ['mpm'], 46: ['mpm-snd'], 47: ['ni-ftp'], 48: ['auditd'], 49: ['tacacs'], 50: ['re-mail-ck'], 8243: ['synapse-nhttps'], 52: ['xns-time'], 53: ['domain'], 54: ['xns-ch'], 55: ['isi-gl'], 56: ['xns-auth'], 58: ['xns-mail'], 61: ['ni-mail'], 62: ['acas'], 63: ['whoispp'], 64: ['covia'], 65: ['tacacs-ds'], 66: ['sql-net'], 67: ['bootps'], 68: ['bootpc'], 69: ['tftp'], 70: ['gopher'], 71: ['netrjs-1'], 72: ['netrjs-2'], 73: ['netrjs-3'], 74: ['netrjs-4'], 76: ['deos'], 9277: ['traingpsdata'], 78: ['vettcp'], 79: ['finger'], 80: ['http'], 8402: ['abarsd'], 82: ['xfer'], 83: ['mit-ml-dev'], 84: ['ctf'], 85: ['mit-ml-dev'], 86: ['mfcobol'], 88: ['kerberos'], 89: ['su-mit-tg'], 90: ['dnsix'], 91: ['mit-dov'], 92: ['npp'], 93: ['dcp'], 94: ['objcall'], 95: ['supdup'], 96: ['dixie'], 97: ['swift-rvf'], 98: ['tacnews'], 99: ['metagram'], 8292: ['blp3'], 101: ['hostname'], 102: ['iso-tsap'], 103: ['gppitnp'], 104: ['acr-nema'], 105: ['csnet-ns', 'cso'], 106: ['3com-tsmux'], 107: ['rtelnet'], 108: ['snagas'], 109: ['pop2'], 110: ['pop3'], 111: ['sunrpc'], 112: ['mcidas'], 113: ['auth'], 115: ['sftp'], 116: ['ansanotify'], 117: ['uucp-path'], 118: ['sqlserv'], 119: ['nntp'], 120: ['cfdptkt'], 121: ['erpc'], 122: ['smakynet'], 123: ['ntp'], 124: ['ansatrader'], 125: ['locus-map'], 126: ['nxedit'], 127: ['locus-con'], 128: ['gss-xlicen'], 129: ['pwdgen'], 130: ['cisco-fna'], 131: ['cisco-tna'], 132: ['cisco-sys'], 133: ['statsrv'], 134: ['ingres-net'], 135: ['epmap'], 136: ['profile'], 137: ['netbios-ns'], 138: ['netbios-dgm'], 139: ['netbios-ssn'], 140: ['emfis-data'], 141: ['emfis-cntl'], 142: ['bl-idm'], 143: ['imap'], 144: ['uma'], 145: ['uaac'], 146: ['iso-tp0'], 147: ['iso-ip'], 148: ['jargon'], 149: ['aed-512'], 150: ['sql-net'], 151: ['hems'], 152: ['bftp'], 153: ['sgmp'], 154: ['netsc-prod'], 155: ['netsc-dev'], 156: ['sqlsrv'], 157: ['knet-cmp'], 158: ['pcmail-srv'], 159: ['nss-routing'], 160: ['sgmp-traps'], 161: ['snmp'], 162: ['snmptrap'], 163: ['cmip-man'], 164: ['cmip-agent'], 165: ['xns-courier'], 166: ['s-net'], 167: ['namp'], 168: ['rsvd'], 169: ['send'], 170: ['print-srv'], 171: ['multiplex'], 172: ['cl-1'], 173: ['xyplex-mux'], 174: ['mailq'], 175: ['vmnet'], 176: ['genrad-mux'], 177: ['xdmcp'], 178: ['nextstep'], 179: ['bgp'], 180: ['ris'], 181: ['unify'], 182: ['audit'], 183: ['ocbinder'], 184: ['ocserver'], 185: ['remote-kis'], 186: ['kis'], 187: ['aci'], 188: ['mumps'], 189: ['qft'], 190: ['gacp'], 191: ['prospero'], 192: ['osu-nms'], 193: ['srmp'], 194: ['irc'], 195: ['dn6-nlm-aud'], 196: ['dn6-smm-red'], 197: ['dls'], 198: ['dls-mon'], 199: ['smux'], 200: ['src'], 201: ['at-rtmp'], 202: ['at-nbp'], 203: ['at-3'], 204: ['at-echo'], 205: ['at-5'], 206: ['at-zis'], 207: ['at-7'], 208: ['at-8'], 209: ['qmtp'], 210: ['z39-50'], 211: ['914c-g'], 212: ['anet'], 213: ['ipx'], 214: ['vmpwscs'], 215: ['softpc'], 216: ['cailic'], 217: ['dbase'], 218: ['mpp'], 219: ['uarps'], 220: ['imap3'], 221: ['fln-spx'], 222: ['rsh-spx'], 223: ['cdc'], 224: ['masqdialer'], 8417: ['espeech-rtp'], 9595: ['pds'], 34378: ['p-net-local'], 8230: ['rexecj'], 27345: ['imagepump'], 9596: ['mercury-disc'], 9597: ['pd-admin'], 242: ['direct'], 243: ['sur-meas'], 244: ['inbusiness'], 245: ['link'], 246: ['dsp3270'], 247: ['subntbcst-tftp'], 248: ['bhfhs'], 8442: ['cybro-a-bus'], 8443: ['pcsync-https'], 8444: ['pcsync-http'], 8445: ['copy-disc'], 256: ['rap'], 257: ['set'], 8450: ['npmp'], 259: ['esro-gen'], 260: ['openport'], 261: ['nsiiops'], 262: ['arcisdms'], 263: ['hdap'], 264: ['bgmp'], 265: ['x-bone-ctl'], 266: ['sst'], 267: ['td-service'], 268: ['td-replica'], 269: ['manet'], 270: ['gist'], 24850: ['assoc-disc'], 10102: ['ezproxy-2'], 280: ['http-mgmt'], 281: ['personal-link'], 282: ['cableport-ax'], 283: ['rescap'], 284: ['corerjd'], 286: ['fxp'], 287: ['k-block'], 10103: ['ezrelay'], 308: ['novastorbakcup'], 309: ['entrusttime'], 310: ['bhmds'], 311: ['asip-webadmin'], 312: ['vslmp'], 313: ['magenta-logic'], 314: ['opalis-robot'], 315: ['dpsi'], 316: ['decauth'], 317: ['zannet'], 318: ['pkix-timestamp'], 319: ['ptp-event'], 320: ['ptp-general'], 321: ['pip'], 322: ['rtsps'], 12013: ['vipera-ssl'], 9612: ['streamcomm-ds'], 333: ['texar'], 10104: ['swdtp'], 8766: ['amcs'], 12345: ['italk'], 344: ['pdap'], 345: ['pawserv'], 346: ['zserv'], 347: ['fatserv'], 348: ['csi-sgwp'], 349: ['mftp'], 350: ['matip-type-a'], 351: ['bhoetty', 'matip-type-b'], 352: ['bhoedap4', 'dtag-ste-sb'], 353: ['ndsauth'], 354: ['bh611'], 355: ['datex-asn'], 356: ['cloanto-net-1'], 357: ['bhevent'], 358: ['shrinkwrap'], 359: ['nsrmp'], 360: ['scoi2odialog'], 361: ['semantix'], 362: ['srssend'], 363: ['rsvp-tunnel'], 364: ['aurora-cmgr'], 365: ['dtk'], 366: ['odmr'], 367: ['mortgageware'], 368: ['qbikgdp'], 369: ['rpc2portmap'], 370: ['codaauth2'], 371: ['clearcase'], 372: ['ulistproc'], 373: ['legent-1'], 374: ['legent-2'], 375: ['hassle'], 376: ['nip'], 377: ['tnetos'], 378: ['dsetos'], 379: ['is99c'], 380: ['is99s'], 381: ['hp-collector'], 382: ['hp-managed-node'], 383: ['hp-alarm-mgr'], 384: ['arns'], 385: ['ibm-app'], 386: ['asa'], 387: ['aurp'], 388: ['unidata-ldm'], 389: ['ldap'], 390: ['uis'], 391: ['synotics-relay'], 392: ['synotics-broker'], 393: ['meta5'], 394: ['embl-ndt'], 395: ['netcp'], 396: ['netware-ip'], 397: ['mptn'], 398: ['kryptolan'], 399: ['iso-tsap-c2'], 400: ['osb-sd'], 401: ['ups'], 402: ['genie'], 403: ['decap'], 404: ['nced'], 405: ['ncld'], 406: ['imsp'], 407: ['timbuktu'], 408: ['prm-sm'], 409: ['prm-nm'], 410: ['decladebug'], 411: ['rmt'], 412: ['synoptics-trap'], 413: ['smsp'], 414: ['infoseek'], 415: ['bnet'], 416: ['silverplatter'], 417: ['onmux'], 418: ['hyper-g'], 419: ['ariel1'], 420: ['smpte'], 421: ['ariel2'], 422: ['ariel3'], 423: ['opc-job-start'], 424: ['opc-job-track'], 425: ['icad-el'], 426: ['smartsdp'], 427: ['svrloc'], 428: ['ocs-cmu'], 429: ['ocs-amu'], 430: ['utmpsd'], 431: ['utmpcd'], 432: ['iasd'], 433: ['nnsp'], 434: ['mobileip-agent'], 435: ['mobilip-mn'], 436: ['dna-cml'], 437: ['comscm'], 438: ['dsfgw'], 439: ['dasp'], 440: ['sgcp'], 441: ['decvms-sysmgt'], 442: ['cvc-hostd'], 443: ['https'], 444: ['snpp'], 445: ['microsoft-ds'], 446: ['ddm-rdb'], 447: ['ddm-dfm'], 448: ['ddm-ssl'], 449: ['as-servermap'], 450: ['tserver'], 451: ['sfs-smp-net'], 452: ['sfs-config'], 453: ['creativeserver'], 454: ['contentserver'], 455: ['creativepartnr'], 456: ['macon-udp'], 457: ['scohelp'], 458: ['appleqtc'], 459: ['ampr-rcmd'], 460: ['skronk'], 461: ['datasurfsrv'], 462: ['datasurfsrvsec'], 463: ['alpes'], 464: ['kpasswd'], 465: ['igmpv3lite'], 466: ['digital-vrc'], 467: ['mylex-mapd'], 468: ['photuris'], 469: ['rcp'], 470: ['scx-proxy'], 471: ['mondex'], 472: ['ljk-login'], 473: ['hybrid-pop'], 474: ['tn-tl-w2'], 475: ['tcpnethaspsrv'], 476: ['tn-tl-fd1'], 477: ['ss7ns'], 478: ['spsc'], 479: ['iafserver'], 480: ['iafdbase'], 481: ['ph'], 482: ['bgs-nsi'], 483: ['ulpnet'], 484: ['integra-sme'], 485: ['powerburst'], 486: ['avian'], 487: ['saft'], 488: ['gss-http'], 489: ['nest-protocol'], 490: ['micom-pfs'], 491: ['go-login'], 492: ['ticf-1'], 493: ['ticf-2'], 494: ['pov-ray'], 495: ['intecourier'], 496: ['pim-rp-disc'], 497: ['retrospect'], 498: ['siam'], 499: ['iso-ill'], 500: ['isakmp'], 501: ['stmf'], 502: ['asa-appl-proto'], 503: ['intrinsa'], 504: ['citadel'], 505: ['mailbox-lm'], 506: ['ohimsrv'], 507: ['crs'], 508: ['xvttp'], 509: ['snare'], 510: ['fcp'], 511: ['passgo'], 512: ['biff', 'comsat'], 513: ['who'], 514: ['syslog'], 515: ['printer'], 516: ['videotex'], 517: ['talk'], 518: ['ntalk'], 519: ['utime'], 520: ['router'], 521: ['ripng'], 522: ['ulp'], 523: ['ibm-db2'], 524: ['ncp'], 525: ['timed'], 526: ['tempo'], 527: ['stx'], 528: ['custix'], 529: ['irc-serv'], 530: ['courier'], 531: ['conference'], 532: ['netnews'], 533: ['netwall'], 534: ['windream'], 535: ['iiop'], 536: ['opalis-rdv'], 537: ['nmsp'], 538: ['gdomap'], 539: ['apertus-ldp'], 540: ['uucp'], 541: ['uucp-rlogin'], 542: ['commerce'], 543: ['klogin'], 544: ['kshell'], 545: ['appleqtcsrvr'], 546: ['dhcpv6-client'], 547: ['dhcpv6-server'], 548: ['afpovertcp'], 549: ['idfp'], 550: ['new-rwho'], 551: ['cybercash'], 552: ['devshr-nts'], 553: ['pirp'], 554: ['rtsp'], 555: ['dsf'], 556: ['remotefs'], 557: ['openvms-sysipc'], 558: ['sdnskmp'], 559: ['teedtap'], 560: ['rmonitor'], 561: ['monitor'], 562: ['chshell'], 563: ['nntps'], 564: ['9pfs'], 565: ['whoami'], 566: ['streettalk'], 567: ['banyan-rpc'], 568: ['ms-shuttle'], 569: ['ms-rome'], 570: ['meter'], 571: ['meter'], 572: ['sonar'], 573: ['banyan-vip'], 574: ['ftp-agent'], 575: ['vemmi'], 576: ['ipcd'], 577: ['vnas'], 578: ['ipdd'], 579: ['decbsrv'], 580: ['sntp-heartbeat'], 581: ['bdp'], 582: ['scc-security'], 583: ['philips-vc'], 584: ['keyserver'], 586: ['password-chg'], 587: ['submission'], 588: ['cal'], 589: ['eyelink'], 590: ['tns-cml'], 591: ['http-alt'], 592: ['eudora-set'], 593: ['http-rpc-epmap'], 594: ['tpip'], 595: ['cab-protocol'], 596: ['smsd'], 597: ['ptcnameservice'], 598: ['sco-websrvrmg3'], 599: ['acp'], 600: ['ipcserver'], 601: ['syslog-conn'], 602: ['xmlrpc-beep'], 603: ['idxp'], 604: ['tunnel'], 605: ['soap-beep'], 606: ['urm'], 607: ['nqs'], 608: ['sift-uft'], 609: ['npmp-trap'], 610: ['npmp-local'], 611: ['npmp-gui'], 612: ['hmmp-ind'], 613: ['hmmp-op'], 614: ['sshell'], 615: ['sco-inetmgr'], 616: ['sco-sysmgr'], 617: ['sco-dtmgr'], 618: ['dei-icda'], 619: ['compaq-evm'], 620: ['sco-websrvrmgr'], 621: ['escp-ip'], 622: ['collaborator'], 623: ['asf-rmcp'], 624: ['cryptoadmin'], 625: ['dec-dlm'], 626: ['asia'], 627: ['passgo-tivoli'], 628: ['qmqp'], 629: ['3com-amp3'], 630: ['rda'], 631: ['ipp'], 632: ['bmpp'], 633: ['servstat'], 634: ['ginad'], 635: ['rlzdbase'], 636: ['ldaps'], 637: ['lanserver'], 638: ['mcns-sec'], 639: ['msdp'], 640: ['entrust-sps'], 641: ['repcmd'], 642: ['esro-emsdp'], 643: ['sanity'], 644: ['dwr'], 645: ['pssc'], 646: ['ldp'], 647: ['dhcp-failover'], 648: ['rrp'], 649: ['cadview-3d'], 650: ['obex'], 651: ['ieee-mms'], 652: ['hello-port'], 653: ['repscmd'], 654: ['aodv'], 655: ['tinc'], 656: ['spmp'], 657: ['rmc'], 658: ['tenfold'], 9667: ['xmms2'], 660: ['mac-srvr-admin'], 661: ['hap'], 662: ['pftp'], 663: ['purenoise'], 664: ['asf-secure-rmcp'], 665: ['sun-dr'], 666: ['doom', 'mdqs'], 667: ['disclose'], 668: ['mecomm'], 669: ['meregister'], 670: ['vacdsm-sws'], 671: ['vacdsm-app'], 672: ['vpps-qua'], 673: ['cimplex'], 674: ['acap'], 675: ['dctp'], 676: ['vpps-via'], 677: ['vpp'], 678: ['ggf-ncp'], 679: ['mrm'], 680: ['entrust-aaas'], 681: ['entrust-aams'], 682: ['xfr'], 683: ['corba-iiop'], 684: ['corba-iiop-ssl'], 685: ['mdc-portmapper'], 686: ['hcp-wismar'], 687: ['asipregistry'], 688: ['realm-rusd'], 689: ['nmap'], 690: ['vatp'], 691: ['msexch-routing'], 692: ['hyperwave-isp'], 693: ['connendp'], 694: ['ha-cluster'], 695: ['ieee-mms-ssl'], 696: ['rushd'], 697: ['uuidgen'], 698: ['olsr'], 699: ['accessnetwork'], 700: ['epp'], 701: ['lmp'], 702: ['iris-beep'], 704: ['elcsd'], 705: ['agentx'], 706: ['silc'], 707: ['borland-dsj'], 8900: ['jmb-cds1'], 709: ['entrust-kmsh'], 710: ['entrust-ash'], 711: ['cisco-tdp'], 712: ['tbrpf'], 713: ['iris-xpc'], 714: ['iris-xpcs'], 715: ['iris-lwz'], 716: ['pana'], 18881: ['infotos'], 8910: ['manyone-http'], 8911: ['manyone-xml'], 8912: ['wcbackup'], 8913: ['dragonfly'], 11208: ['wifree'], 12007: ['accuracer'], 10117: ['iqrm'], 729: ['netviewdm1'], 730: ['netviewdm2'], 731: ['netviewdm3'], 21847: ['netspeak-cs'], 741: ['netgw'], 742: ['netrcs'], 744: ['flexlm'], 747: ['fujitsu-dev'], 748: ['ris-cm'], 749: ['kerberos-adm'], 750: ['kerberos-iv', 'loadav'], 751: ['pump'], 752: ['qrh'], 753: ['rrh'], 754: ['tell'], 758: ['nlogin'], 759: ['con'], 760: ['ns'], 761: ['rxe'], 762: ['quotad'], 763: ['cycleserv'], 764: ['omserv'], 765: ['webster'], 767: ['phonebook'], 21848: ['netspeak-acd'], 769: ['vid'], 770: ['cadlock'], 771: ['rtip'], 772: ['cycleserv2'], 773: ['notify'], 774: ['acmaint-dbd'], 775: ['acmaint-transd'], 776: ['wpages'], 777: ['multiling-http'], 41795: ['crestron-ctp'], 780: ['wpgs'], 26486: ['exoline-udp'], 16666: ['vtp'], 8989: ['sunwebadmins'], 8990: ['http-wmap'], 8991: ['https-wmap'], 800: ['mdbs-daemon'], 801: ['device'], 9951: ['apc-9951'], 8999: ['bctp'], 9000: ['cslistener'], 9001: ['etlservicemgr'], 810: ['fcp-udp'], 27442: ['jesmsjc'], 11211: ['memcache'], 9007: ['ogs-client'], 9009: ['pichat'], 11108: ['myq-termlink'], 9694: ['client-wakeup'], 9695: ['ccnx'], 828: ['itm-mcell-s'], 829: ['pkix-3-ca-ra'], 830: ['netconf-ssh'], 831: ['netconf-beep'], 832: ['netconfsoaphttp'], 833: ['netconfsoapbeep'], 9026: ['swa-4'], 17219: ['chipper'], 17221: ['avdecc'], 17222: ['cpsp'], 847: ['dhcp-failover2'], 848: ['gdoi'], 17234: ['integrius-stp'], 17235: ['ssh-mgmt'], 9700: ['board-roar'], 860: ['iscsi'], 861: ['owamp-control'], 862: ['twamp-control'], 9952: ['apc-9952'], 873: ['rsync'], 26489: ['exonet'], 886: ['iclcnet-locate'], 887: ['iclcnet-svinfo'], 888: ['accessbuilder'], 9084: ['aurora'], 9085: ['ibm-rsyscon'], 9086: ['net2display'], 9087: ['classic'], 9088: ['sqlexec'], 9089: ['sqlexec-ssl'], 9090: ['websm'], 9091: ['xmltec-xmlmail'], 900: ['omginitialrefs'], 901: ['smpnameres'], 902: ['ideafarm-door'], 903: ['ideafarm-panic'], 21849: ['netspeak-cps'], 41111: ['fs-qos'], 9100: ['hp-pdl-datastr', 'pdl-datastream'], 9101: ['bacula-dir'], 910: ['kink'], 911: ['xact-backup'], 912: ['apex-mesh'], 913: ['apex-edge'], 9106: ['astergate-disc'], 19398: ['mtrgtrans'], 9119: ['mxit'], 22000: ['snapenetio'], 9131: ['dddp'], 22003: ['optohost003'], 8351: ['server-find'], 9990: ['osm-appsrvr'], 9160: ['apani1'], 9161: ['apani2'], 9162: ['apani3'], 9163: ['apani4'], 9164: ['apani5'], 32249: ['t1distproc60'], 989: ['ftps-data'], 990: ['ftps'], 991: ['nas'], 992: ['telnets'], 993: ['imaps'], 995: ['pop3s'], 996: ['vsinet'], 997: ['maitrd'], 998: ['puparp'], 999: ['applix', 'puprouter'], 1000: ['cadlock2'], 13820: ['dsmcc-passthru'], 10128: ['bmc-perf-sd'], 9200: ['wap-wsp'], 9201: ['wap-wsp-wtp'], 1010: ['surf'], 9203: ['wap-wsp-wtp-s'], 9204: ['wap-vcard'], 9205: ['wap-vcal'], 9206: ['wap-vcard-s'], 9207: ['wap-vcal-s'], 9208: ['rjcdb-vcards'], 9209: ['almobile-system'], 9210: ['oma-mlp'], 9211: ['oma-mlp-s'], 9212: ['serverviewdbms'], 1021: ['exp1'], 1022: ['exp2'], 9215: ['insis'], 9216: ['acme'], 1025: ['blackjack'], 1026: ['cap'], 1027: ['6a44'], 1029: ['solid-mux'], 9222: ['teamcoherence'], 1033: ['netinfo-local'], 1034: ['activesync'], 1035: ['mxxrlogin'], 1036: ['nsstp'], 1037: ['ams'], 1038: ['mtqp'], 1039: ['sbl'], 1040: ['netarx'], 1041: ['danf-ak2'], 1042: ['afrog'], 1043: ['boinc-client'], 1044: ['dcutility'], 1045: ['fpitp'], 1046: ['wfremotertm'], 1047: ['neod1'], 1048: ['neod2'], 1049: ['td-postman'], 1050: ['cma'], 1051: ['optima-vnet'], 1052: ['ddt'], 1053: ['remote-as'], 1054: ['brvread'], 1055: ['ansyslmd'], 1056: ['vfo'], 1057: ['startron'], 1058: ['nim'], 1059: ['nimreg'], 1060: ['polestar'], 1061: ['kiosk'], 1062: ['veracity'], 1063: ['kyoceranetdev'], 1064: ['jstel'], 1065: ['syscomlan'], 1066: ['fpo-fns'], 1067: ['instl-boots'], 1068: ['instl-bootc'], 1069: ['cognex-insight'], 1070: ['gmrupdateserv'], 1071: ['bsquare-voip'], 1072: ['cardax'], 1073: ['bridgecontrol'], 1074: ['warmspotmgmt'], 1075: ['rdrmshc'], 1076: ['dab-sti-c'], 1077: ['imgames'], 1078: ['avocent-proxy'], 1079: ['asprovatalk'], 1080: ['socks'], 1081: ['pvuniwien'], 1082: ['amt-esd-prot'], 1083: ['ansoft-lm-1'], 1084: ['ansoft-lm-2'], 1085: ['webobjects'], 1086: ['cplscrambler-lg'], 1087: ['cplscrambler-in'], 1088: ['cplscrambler-al'], 1089: ['ff-annunc'], 1090: ['ff-fms'], 1091: ['ff-sm'], 1092: ['obrpd'], 1093: ['proofd'], 1094: ['rootd'], 1095: ['nicelink'], 1096: ['cnrprotocol'], 1097: ['sunclustermgr'], 1098: ['rmiactivation'], 1099: ['rmiregistry'], 1100: ['mctp'], 1101: ['pt2-discover'], 1102: ['adobeserver-1'], 1103: ['adobeserver-2'], 1104: ['xrl'], 1105: ['ftranhc'], 1106: ['isoipsigport-1'], 1107: ['isoipsigport-2'], 1108: ['ratio-adp'], 42510: ['caerpc'], 1110: ['nfsd-keepalive'], 1111: ['lmsocialserver'], 1112: ['icp'], 1113: ['ltp-deepspace'], 1114: ['mini-sql'], 1115: ['ardus-trns'], 1116: ['ardus-cntl'], 1117: ['ardus-mtrns'], 1118: ['sacred'], 1119: ['bnetgame'], 1120: ['bnetfile'], 1121: ['rmpp'], 1122: ['availant-mgr'], 1123: ['murray'], 1124: ['hpvmmcontrol'], 1125: ['hpvmmagent'], 1126: ['hpvmmdata'], 1127: ['kwdb-commn'], 1128: ['saphostctrl'], 1129: ['saphostctrls'], 1130: ['casp'], 1131: ['caspssl'], 1132: ['kvm-via-ip'], 1133: ['dfn'], 1134: ['aplx'], 1135: ['omnivision'], 1136: ['hhb-gateway'], 1137: ['trim'], 1138: ['encrypted-admin'], 1139: ['evm'], 1140: ['autonoc'], 1141: ['mxomss'], 1142: ['edtools'], 1143: ['imyx'], 1144: ['fuscript'], 1145: ['x9-icue'], 1146: ['audit-transfer'], 1147: ['capioverlan'], 1148: ['elfiq-repl'], 1149: ['bvtsonar'], 1150: ['blaze'], 1151: ['unizensus'], 1152: ['winpoplanmess'], 1153: ['c1222-acse'], 1154: ['resacommunity'], 1155: ['nfa'], 1156: ['iascontrol-oms'], 1157: ['iascontrol'], 1158: ['dbcontrol-oms'], 1159: ['oracle-oms'], 1160: ['olsv'], 1161: ['health-polling'], 1162: ['health-trap'], 1163: ['sddp'], 1164: ['qsm-proxy'], 1165: ['qsm-gui'], 1166: ['qsm-remote'], 1167: ['cisco-ipsla'], 1168: ['vchat'], 1169: ['tripwire'], 1170: ['atc-lm'], 1171: ['atc-appserver'], 1172: ['dnap'], 1173: ['d-cinema-rrp'], 1174: ['fnet-remote-ui'], 1175: ['dossier'], 1176: ['indigo-server'], 1177: ['dkmessenger'], 1178: ['sgi-storman'], 1179: ['b2n'], 1180: ['mc-client'], 1181: ['3comnetman'], 1182: ['accelenet-data'], 1183: ['llsurfup-http'], 1184: ['llsurfup-https'], 1185: ['catchpole'], 1186: ['mysql-cluster'], 1187: ['alias'], 1188: ['hp-webadmin'], 1189: ['unet'], 1190: ['commlinx-avl'], 1191: ['gpfs'], 1192: ['caids-sensor'], 1193: ['fiveacross'], 1194: ['openvpn'], 1195: ['rsf-1'], 1196: ['netmagic'], 1197: ['carrius-rshell'], 1198: ['cajo-discovery'], 1199: ['dmidi'], 1200: ['scol'], 1201: ['nucleus-sand'], 1202: ['caiccipc'], 1203: ['ssslic-mgr'], 1204: ['ssslog-mgr'], 1205: ['accord-mgc'], 1206: ['anthony-data'], 1207: ['metasage'], 1208: ['seagull-ais'], 1209: ['ipcd3'], 1210: ['eoss'], 1211: ['groove-dpp'], 1212: ['lupa'], 1213: ['mpc-lifenet'], 1214: ['kazaa'], 1215: ['scanstat-1'], 1216: ['etebac5'], 1217: ['hpss-ndapi'], 1218: ['aeroflight-ads'], 1219: ['aeroflight-ret'], 1220: ['qt-serveradmin'], 1221: ['sweetware-apps'], 1222: ['nerv'], 1223: ['tgp'], 1224: ['vpnz'], 1225: ['slinkysearch'], 1226: ['stgxfws'], 1227: ['dns2go'], 1228: ['florence'], 1229: ['zented'], 1230: ['periscope'], 1231: ['menandmice-lpm'], 1232: ['first-defense'], 1233: ['univ-appserver'], 1234: ['search-agent'], 1235: ['mosaicsyssvc1'], 1236: ['bvcontrol'], 1237: ['tsdos390'], 1238: ['hacl-qs'], 1239: ['nmsd'], 1240: ['instantia'], 1241: ['nessus'], 1242: ['nmasoverip'], 1243: ['serialgateway'], 1244: ['isbconference1'], 1245: ['isbconference2'], 1246: ['payrouter'], 1247: ['visionpyramid'], 1248: ['hermes'], 1249: ['mesavistaco'], 1250: ['swldy-sias'], 1251: ['servergraph'], 1252: ['bspne-pcc'], 1253: ['q55-pcc'], 1254: ['de-noc'], 1255: ['de-cache-query'], 1256: ['de-server'], 1257: ['shockwave2'], 1258: ['opennl'], 1259: ['opennl-voice'], 1260: ['ibm-ssd'], 1261: ['mpshrsv'], 1262: ['qnts-orb'], 1263: ['dka'], 1264: ['prat'], 1265: ['dssiapi'], 1266: ['dellpwrappks'], 1267: ['epc'], 1268: ['propel-msgsys'], 1269: ['watilapp'], 1270: ['opsmgr'], 1271: ['excw'], 1272: ['cspmlockmgr'], 1273: ['emc-gateway'], 1274: ['t1distproc'], 1275: ['ivcollector'], 1276: ['ivmanager'], 1277: ['miva-mqs'], 1278: ['dellwebadmin-1'], 1279: ['dellwebadmin-2'], 1280: ['pictrography'], 1281: ['healthd'], 1282: ['emperion'], 1283: ['productinfo'], 1284: ['iee-qfx'], 1285: ['neoiface'], 1286: ['netuitive'], 1287: ['routematch'], 1288: ['navbuddy'], 1289: ['jwalkserver'], 1290: ['winjaserver'], 1291: ['seagulllms'], 1292: ['dsdn'], 1293: ['pkt-krb-ipsec'], 1294: ['cmmdriver'], 1295: ['ehtp'], 1296: ['dproxy'], 1297: ['sdproxy'], 1298: ['lpcp'], 1299: ['hp-sci'], 1300: ['h323hostcallsc'], 1301: ['ci3-software-1'], 1302: ['ci3-software-2'], 1303: ['sftsrv'], 1304: ['boomerang'], 1305: ['pe-mike'], 1306: ['re-conn-proto'], 1307: ['pacmand'], 1308: ['odsi'], 1309: ['jtag-server'], 1310: ['husky'], 1311: ['rxmon'], 1312: ['sti-envision'], 1313: ['bmc-patroldb'], 1314: ['pdps'], 1315: ['els'], 1316: ['exbit-escp'], 1317: ['vrts-ipcserver'], 1318: ['krb5gatekeeper'], 1319: ['amx-icsp'], 1320: ['amx-axbnet'], 1321: ['pip'], 1322: ['novation'], 1323: ['brcd'], 1324: ['delta-mcp'], 1325: ['dx-instrument'], 1326: ['wimsic'], 1327: ['ultrex'], 1328: ['ewall'], 1329: ['netdb-export'], 1330: ['streetperfect'], 1331: ['intersan'], 1332: ['pcia-rxp-b'], 1333: ['passwrd-policy'], 1334: ['writesrv'], 1335: ['digital-notary'], 1336: ['ischat'], 1337: ['menandmice-dns'], 1338: ['wmc-log-svc'], 1339: ['kjtsiteserver'], 1340: ['naap'], 1341: ['qubes'], 1342: ['esbroker'], 1343: ['re101'], 1344: ['icap'], 1345: ['vpjp'], 1346: ['alta-ana-lm'], 1347: ['bbn-mmc'], 1348: ['bbn-mmx'], 1349: ['sbook'], 1350: ['editbench'], 1351: ['equationbuilder'], 1352: ['lotusnote'], 1353: ['relief'], 1354: ['xsip-network'], 1355: ['intuitive-edge'], 1356: ['cuillamartin'], 1357: ['pegboard'], 1358: ['connlcli'], 1359: ['ftsrv'], 1360: ['mimer'], 1361: ['linx'], 1362: ['timeflies'], 1363: ['ndm-requester'], 1364: ['ndm-server'], 1365: ['adapt-sna'], 1366: ['netware-csp'], 1367: ['dcs'], 1368: ['screencast'], 1369: ['gv-us'], 1370: ['us-gv'], 1371: ['fc-cli'], 1372: ['fc-ser'], 1373: ['chromagrafx'], 1374: ['molly'], 1375: ['bytex'], 1376: ['ibm-pps'], 1377: ['cichlid'], 1378: ['elan'], 1379: ['dbreporter'], 1380: ['telesis-licman'], 1381: ['apple-licman'], 1382: ['udt-os'], 1383: ['gwha'], 1384: ['os-licman'], 1385: ['atex-elmd'], 1386: ['checksum'], 1387: ['cadsi-lm'], 1388: ['objective-dbc'], 1389: ['iclpv-dm'], 1390: ['iclpv-sc'], 1391: ['iclpv-sas'], 1392: ['iclpv-pm'], 1393: ['iclpv-nls'], 1394: ['iclpv-nlc'], 1395: ['iclpv-wsm'], 1396: ['dvl-activemail'], 1397: ['audio-activmail'], 1398: ['video-activmail'], 1399: ['cadkey-licman'], 1400: ['cadkey-tablet'], 1401: ['goldleaf-licman'], 1402: ['prm-sm-np'], 1403: ['prm-nm-np'], 1404: ['igi-lm'], 1405: ['ibm-res'], 1406: ['netlabs-lm'], 1407: ['dbsa-lm'], 1408: ['sophia-lm'], 1409: ['here-lm'], 1410: ['hiq'], 1411: ['af'], 1412: ['innosys'], 1413: ['innosys-acl'], 1414: ['ibm-mqseries'], 1415: ['dbstar'], 1416: ['novell-lu6-2'], 1417: ['timbuktu-srv1'], 1418: ['timbuktu-srv2'], 1419: ['timbuktu-srv3'], 1420: ['timbuktu-srv4'], 1421: ['gandalf-lm'], 1422: ['autodesk-lm'], 1423: ['essbase'], 1424: ['hybrid'], 1425: ['zion-lm'], 1426: ['sais'], 1427: ['mloadd'], 1428: ['informatik-lm'], 1429: ['nms'], 1430: ['tpdu'], 1431: ['rgtp'], 1432: ['blueberry-lm'], 1433: ['ms-sql-s'], 1434: ['ms-sql-m'], 1435: ['ibm-cics'], 1436: ['saism'], 1437: ['tabula'], 1438: ['eicon-server'], 1439: ['eicon-x25'], 1440: ['eicon-slp'], 1441: ['cadis-1'], 1442: ['cadis-2'], 1443: ['ies-lm'], 1444: ['marcam-lm'], 1445: ['proxima-lm'], 1446: ['ora-lm'], 1447: ['apri-lm'], 1448: ['oc-lm'], 1449: ['peport'], 1450: ['dwf'], 1451: ['infoman'], 1452: ['gtegsc-lm'], 1453: ['genie-lm'], 1454: ['interhdl-elmd'], 1455: ['esl-lm'], 1456: ['dca'], 1457: ['valisys-lm'], 1458: ['nrcabq-lm'], 1459: ['proshare1'], 1460: ['proshare2'], 1461: ['ibm-wrless-lan'], 1462: ['world-lm'], 1463: ['nucleus'], 1464: ['msl-lmd'], 1465: ['pipes'], 1466: ['oceansoft-lm'], 1467: ['csdmbase'], 1468: ['csdm'], 1469: ['aal-lm'], 1470: ['uaiact'], 1471: ['csdmbase'], 1472: ['csdm'], 1473: ['openmath'], 1474: ['telefinder'], 1475: ['taligent-lm'], 1476: ['clvm-cfg'], 1477: ['ms-sna-server'], 1478: ['ms-sna-base'], 1479: ['dberegister'], 1480: ['pacerforum'], 1481: ['airs'], 1482: ['miteksys-lm'], 1483: ['afs'], 1484: ['confluent'], 1485: ['lansource'], 1486: ['nms-topo-serv'], 1487: ['localinfosrvr'], 1488: ['docstor'], 1489: ['dmdocbroker'], 1490: ['insitu-conf'], 11171: ['snss'], 1492: ['stone-design-1'], 1493: ['netmap-lm'], 1494: ['ica'], 1495: ['cvc'], 1496: ['liberty-lm'], 1497: ['rfx-lm'], 1498: ['sybase-sqlany'], 1499: ['fhc'], 1500: ['vlsi-lm'], 1501: ['saiscm'], 1502: ['shivadiscovery'], 1503: ['imtc-mcs'], 1504: ['evb-elm'], 1505: ['funkproxy'], 1506: ['utcd'], 1507: ['symplex'], 1508: ['diagmond'], 1509: ['robcad-lm'], 1510: ['mvx-lm'], 1511: ['3l-l1'], 1512: ['wins'], 1513: ['fujitsu-dtc'], 1514: ['fujitsu-dtcns'], 1515: ['ifor-protocol'], 1516: ['vpad'], 1517: ['vpac'], 1518: ['vpvd'], 1519: ['vpvc'], 1520: ['atm-zip-office'], 1521: ['ncube-lm'], 1522: ['ricardo-lm'], 1523: ['cichild-lm'], 1524: ['ingreslock'], 1525: ['orasrv', 'prospero-np'], 1526: ['pdap-np'], 1527: ['tlisrv'], 1529: ['coauthor'], 1530: ['rap-service'], 1531: ['rap-listen'], 1532: ['miroconnect'], 1533: ['virtual-places'], 1534: ['micromuse-lm'], 1535: ['ampr-info'], 1536: ['ampr-inter'], 1537: ['sdsc-lm'], 1538: ['3ds-lm'], 1539: ['intellistor-lm'], 1540: ['rds'], 1541: ['rds2'], 1542: ['gridgen-elmd'], 1543: ['simba-cs'], 1544: ['aspeclmd'], 1545: ['vistium-share'], 1546: ['abbaccuray'], 1547: ['laplink'], 1548: ['axon-lm'], 1549: ['shivasound'], 1550: ['3m-image-lm'], 1551: ['hecmtl-db'], 1552: ['pciarray'], 1553: ['sna-cs'], 1554: ['caci-lm'], 1555: ['livelan'], 1556: ['veritas-pbx'], 1557: ['arbortext-lm'], 1558: ['xingmpeg'], 1559: ['web2host'], 1560: ['asci-val'], 1561: ['facilityview'], 1562: ['pconnectmgr'], 1563: ['cadabra-lm'], 1564: ['pay-per-view'], 1565: ['winddlb'], 1566: ['corelvideo'], 1567: ['jlicelmd'], 1568: ['tsspmap'], 1569: ['ets'], 1570: ['orbixd'], 1571: ['rdb-dbs-disp'], 1572: ['chip-lm'], 1573: ['itscomm-ns'], 1574: ['mvel-lm'], 1575: ['oraclenames'], 1576: ['moldflow-lm'], 1577: ['hypercube-lm'], 1578: ['jacobus-lm'], 1579: ['ioc-sea-lm'], 1580: ['tn-tl-r2'], 1581: ['mil-2045-47001'], 1582: ['msims'], 1583: ['simbaexpress'], 1584: ['tn-tl-fd2'], 1585: ['intv'], 1586: ['ibm-abtact'], 1587: ['pra-elmd'], 1588: ['triquest-lm'], 1589: ['vqp'], 1590: ['gemini-lm'], 1591: ['ncpm-pm'], 1592: ['commonspace'], 1593: ['mainsoft-lm'], 1594: ['sixtrak'], 1595: ['radio'], 1596: ['radio-bc'], 1597: ['orbplus-iiop'], 1598: ['picknfs'], 1599: ['simbaservices'], 1600: ['issd'], 1601: ['aas'], 1602: ['inspect'], 1603: ['picodbc'], 1604: ['icabrowser'], 1605: ['slp'], 1606: ['slm-api'], 1607: ['stt'], 1608: ['smart-lm'], 1609: ['isysg-lm'], 1610: ['taurus-wh'], 1611: ['ill'], 1612: ['netbill-trans'], 1613: ['netbill-keyrep'], 1614: ['netbill-cred'], 1615: ['netbill-auth'], 1616: ['netbill-prod'], 1617: ['nimrod-agent'], 1618: ['skytelnet'], 1619: ['xs-openstorage'], 1620: ['faxportwinport'], 1621: ['softdataphone'], 1622: ['ontime'], 1623: ['jaleosnd'], 1624: ['udp-sr-port'], 1625: ['svs-omagent'], 1626: ['shockwave'], 1627: ['t128-gateway'], 1628: ['lontalk-norm'], 1629: ['lontalk-urgnt'], 1630: ['oraclenet8cman'], 1631: ['visitview'], 1632: ['pammratc'], 1633: ['pammrpc'], 1634: ['loaprobe'], 1635: ['edb-server1'], 1636: ['isdc'], 1637: ['islc'], 1638: ['ismc'], 1639: ['cert-initiator'], 1640: ['cert-responder'], 1641: ['invision'], 1642: ['isis-am'], 1643: ['isis-ambc'], 1644: ['saiseh'], 1645: ['sightline'], 1646: ['sa-msg-port'], 1647: ['rsap'], 1648: ['concurrent-lm'], 1649: ['kermit'], 1650: ['nkd'], 1651: ['shiva-confsrvr'], 1652: ['xnmp'], 1653: ['alphatech-lm'], 1654: ['stargatealerts'], 1655: ['dec-mbadmin'], 1656: ['dec-mbadmin-h'], 1657: ['fujitsu-mmpdc'], 1658: ['sixnetudr'], 1659: ['sg-lm'], 1660: ['skip-mc-gikreq'], 1661: ['netview-aix-1'], 1662: ['netview-aix-2'], 1663: ['netview-aix-3'], 1664: ['netview-aix-4'], 1665: ['netview-aix-5'], 1666: ['netview-aix-6'], 1667: ['netview-aix-7'], 1668: ['netview-aix-8'], 1669: ['netview-aix-9'], 1670: ['netview-aix-10'], 1671: ['netview-aix-11'], 1672: ['netview-aix-12'], 1673: ['proshare-mc-1'], 1674: ['proshare-mc-2'], 1675: ['pdp'], 1676: ['netcomm2'], 1677: ['groupwise'], 1678: ['prolink'], 1679: ['darcorp-lm'], 1680: ['microcom-sbp'], 1681: ['sd-elmd'], 1682: ['lanyon-lantern'], 1683: ['ncpm-hip'], 1684: ['snaresecure'], 1685: ['n2nremote'], 1686: ['cvmon'], 1687: ['nsjtp-ctrl'], 1688: ['nsjtp-data'], 1689: ['firefox'], 1690: ['ng-umds'], 1691: ['empire-empuma'], 1692: ['sstsys-lm'], 1693: ['rrirtr'], 1694: ['rrimwm'], 1695: ['rrilwm'], 1696: ['rrifmm'], 1697: ['rrisat'], 1698: ['rsvp-encap-1'], 1699: ['rsvp-encap-2'], 1700: ['mps-raft'], 1701: ['l2f', 'l2tp'], 1702: ['deskshare'], 1703: ['hb-engine'], 1704: ['bcs-broker'], 1705: ['slingshot'], 1706: ['jetform'], 1707: ['vdmplay'], 1708: ['gat-lmd'], 1709: ['centra'], 1710: ['impera'], 1711: ['pptconference'], 1712: ['registrar'], 1713: ['conferencetalk'], 1714: ['sesi-lm'], 1715: ['houdini-lm'], 1716: ['xmsg'], 1717: ['fj-hdnet'], 1718: ['h323gatedisc'], 1719: ['h323gatestat'], 1720: ['h323hostcall'], 1721: ['caicci'], 1722: ['hks-lm'], 1723: ['pptp'], 1724: ['csbphonemaster'], 1725: ['iden-ralp'], 1726: ['iberiagames'], 1727: ['winddx'], 1728: ['telindus'], 1729: ['citynl'], 1730: ['roketz'], 1731: ['msiccp'], 1732: ['proxim'], 1733: ['siipat'], 1734: ['cambertx-lm'], 1735: ['privatechat'], 1736: ['street-stream'], 1737: ['ultimad'], 1738: ['gamegen1'], 1739: ['webaccess'], 1740: ['encore'], 1741: ['cisco-net-mgmt'], 1742: ['3com-nsd'], 1743: ['cinegrfx-lm'], 1744: ['ncpm-ft'], 1745: ['remote-winsock'], 1746: ['ftrapid-1'], 1747: ['ftrapid-2'], 1748: ['oracle-em1'], 1749: ['aspen-services'], 1750: ['sslp'], 1751: ['swiftnet'], 1752: ['lofr-lm'], 1754: ['oracle-em2'], 1755: ['ms-streaming'], 1756: ['capfast-lmd'], 1757: ['cnhrp'], 1758: ['tftp-mcast'], 1759: ['spss-lm'], 1760: ['www-ldap-gw'], 1761: ['cft-0'], 1762: ['cft-1'], 1763: ['cft-2'], 1764: ['cft-3'], 1765: ['cft-4'], 1766: ['cft-5'], 1767: ['cft-6'], 1768: ['cft-7'], 1769: ['bmc-net-adm'], 1770: ['bmc-net-svc'], 1771: ['vaultbase'], 1772: ['essweb-gw'], 1773: ['kmscontrol'], 1774: ['global-dtserv'], 1776: ['femis'], 1777: ['powerguardian'], 1778: ['prodigy-intrnet'], 1779: ['pharmasoft'], 1780: ['dpkeyserv'], 1781: ['answersoft-lm'], 1782: ['hp-hcip'], 1784: ['finle-lm'], 1785: ['windlm'], 1786: ['funk-logger'], 1787: ['funk-license'], 1788: ['psmond'], 1789: ['hello'], 1790: ['nmsp'], 1791: ['ea1'], 1792: ['ibm-dt-2'], 1793: ['rsc-robot'], 1794: ['cera-bcm'], 1795: ['dpi-proxy'], 1796: ['vocaltec-admin'], 1797: ['uma'], 1798: ['etp'], 1799: ['netrisk'], 1800: ['ansys-lm'], 1801: ['msmq'], 1802: ['concomp1'], 1803: ['hp-hcip-gwy'], 1804: ['enl'], 1805: ['enl-name'], 1806: ['musiconline'], 1807: ['fhsp'], 1808: ['oracle-vp2'], 1809: ['oracle-vp1'], 1810: ['jerand-lm'], 1811: ['scientia-sdb'], 1812: ['radius'], 1813: ['radius-acct'], 1814: ['tdp-suite'], 1815: ['mmpft'], 1816: ['harp'], 1817: ['rkb-oscs'], 1818: ['etftp'], 1819: ['plato-lm'], 1820: ['mcagent'], 1821: ['donnyworld'], 1822: ['es-elmd'], 1823: ['unisys-lm'], 1824: ['metrics-pas'], 1825: ['direcpc-video'], 1826: ['ardt'], 1827: ['asi'], 1828: ['itm-mcell-u'], 1829: ['optika-emedia'], 1830: ['net8-cman'], 1831: ['myrtle'], 1832: ['tht-treasure'], 1833: ['udpradio'], 1834: ['ardusuni'], 1835: ['ardusmul'], 1836: ['ste-smsc'], 1837: ['csoft1'], 1838: ['talnet'], 1839: ['netopia-vo1'], 1840: ['netopia-vo2'], 1841: ['netopia-vo3'], 1842: ['netopia-vo4'], 1843: ['netopia-vo5'], 1844: ['direcpc-dll'], 1845: ['altalink'], 1846: ['tunstall-pnc'], 1847: ['slp-notify'], 1848: ['fjdocdist'], 1849: ['alpha-sms'], 1850: ['gsi'], 1851: ['ctcd'], 1852: ['virtual-time'], 1853: ['vids-avtp'], 1854: ['buddy-draw'], 1855: ['fiorano-rtrsvc'], 1856: ['fiorano-msgsvc'], 1857: ['datacaptor'], 1858: ['privateark'], 1859: ['gammafetchsvr'], 1860: ['sunscalar-svc'], 1861: ['lecroy-vicp'], 1862: ['mysql-cm-agent'], 1863: ['msnp'], 1864: ['paradym-31port'], 1865: ['entp'], 1866: ['swrmi'], 1867: ['udrive'], 1868: ['viziblebrowser'], 1869: ['transact'], 1870: ['sunscalar-dns'], 1871: ['canocentral0'], 1872: ['canocentral1'], 1873: ['fjmpjps'], 1874: ['fjswapsnp'], 1875: ['westell-stats'], 1876: ['ewcappsrv'], 1877: ['hp-webqosdb'], 1878: ['drmsmc'], 1879: ['nettgain-nms'], 1880: ['vsat-control'], 1881: ['ibm-mqseries2'], 1882: ['ecsqdmn'], 1883: ['ibm-mqisdp'], 1884: ['idmaps'], 1885: ['vrtstrapserver'], 1886: ['leoip'], 1887: ['filex-lport'], 1888: ['ncconfig'], 1889: ['unify-adapter'], 1890: ['wilkenlistener'], 1891: ['childkey-notif'], 1892: ['childkey-ctrl'], 1893: ['elad'], 1894: ['o2server-port'], 1896: ['b-novative-ls'], 1897: ['metaagent'], 1898: ['cymtec-port'], 1899: ['mc2studios'], 1900: ['ssdp'], 1901: ['fjicl-tep-a'], 1902: ['fjicl-tep-b'], 1903: ['linkname'], 1904: ['fjicl-tep-c'], 1905: ['sugp'], 1906: ['tpmd'], 1907: ['intrastar'], 1908: ['dawn'], 1909: ['global-wlink'], 1910: ['ultrabac'], 1911: ['mtp'], 1912: ['rhp-iibp'], 1913: ['armadp'], 1914: ['elm-momentum'], 1915: ['facelink'], 1916: ['persona'], 1917: ['noagent'], 1918: ['can-nds'], 1919: ['can-dch'], 1920: ['can-ferret'], 1921: ['noadmin'], 1922: ['tapestry'], 1923: ['spice'], 1924: ['xiip'], 1925: ['discovery-port'], 1926: ['egs'], 1927: ['videte-cipc'], 1928: ['emsd-port'], 1929: ['bandwiz-system'], 1930: ['driveappserver'], 1931: ['amdsched'], 1932: ['ctt-broker'], 1933: ['xmapi'], 1934: ['xaapi'], 1935: ['macromedia-fcs'], 1936: ['jetcmeserver'], 1937: ['jwserver'], 1938: ['jwclient'], 1939: ['jvserver'], 1940: ['jvclient'], 1941: ['dic-aida'], 1942: ['res'], 1943: ['beeyond-media'], 1944: ['close-combat'], 1945: ['dialogic-elmd'], 1946: ['tekpls'], 1947: ['sentinelsrm'], 1948: ['eye2eye'], 1949: ['ismaeasdaqlive'], 1950: ['ismaeasdaqtest'], 1951: ['bcs-lmserver'], 1952: ['mpnjsc'], 1953: ['rapidbase'], 1954: ['abr-api'], 1955: ['abr-secure'], 1956: ['vrtl-vmf-ds'], 1957: ['unix-status'], 1958: ['dxadmind'], 1959: ['simp-all'], 1960: ['nasmanager'], 1961: ['bts-appserver'], 1962: ['biap-mp'], 1963: ['webmachine'], 1964: ['solid-e-engine'], 1965: ['tivoli-npm'], 1966: ['slush'], 1967: ['sns-quote'], 1968: ['lipsinc'], 1969: ['lipsinc1'], 1970: ['netop-rc'], 1971: ['netop-school'], 1972: ['intersys-cache'], 1973: ['dlsrap'], 1974: ['drp'], 1975: ['tcoflashagent'], 1976: ['tcoregagent'], 1977: ['tcoaddressbook'], 1978: ['unisql'], 1979: ['unisql-java'], 1980: ['pearldoc-xact'], 1981: ['p2pq'], 1982: ['estamp'], 1983: ['lhtp'], 1984: ['bb'], 1985: ['hsrp'], 1986: ['licensedaemon'], 1987: ['tr-rsrb-p1'], 1988: ['tr-rsrb-p2'], 1989: ['mshnet', 'tr-rsrb-p3'], 1990: ['stun-p1'], 1991: ['stun-p2'], 1992: ['ipsendmsg', 'stun-p3'], 1993: ['snmp-tcp-port'], 1994: ['stun-port'], 1995: ['perf-port'], 1996: ['tr-rsrb-port'], 1997: ['gdp-port'], 1998: ['x25-svc-port'], 1999: ['tcp-id-port'], 2000: ['cisco-sccp'], 2001: ['wizard'], 2002: ['globe'], 2003: ['brutus'], 2004: ['emce'], 2005: ['oracle'], 2006: ['raid-cd'], 2007: ['raid-am'], 2008: ['terminaldb'], 2009: ['whosockami'], 2010: ['pipe-server'], 2011: ['servserv'], 2012: ['raid-ac'], 2013: ['raid-cd'], 2014: ['raid-sf'], 2015: ['raid-cs'], 2016: ['bootserver'], 2017: ['bootclient'], 2018: ['rellpack'], 2019: ['about'], 2020: ['xinupageserver'], 2021: ['xinuexpansion1'], 2022: ['xinuexpansion2'], 2023: ['xinuexpansion3'], 2024: ['xinuexpansion4'], 2025: ['xribs'], 2026: ['scrabble'], 2027: ['shadowserver'], 2028: ['submitserver'], 2029: ['hsrpv6'], 2030: ['device2'], 2031: ['mobrien-chat'], 2032: ['blackboard'], 2033: ['glogger'], 2034: ['scoremgr'], 2035: ['imsldoc'], 2036: ['e-dpnet'], 2037: ['applus'], 2038: ['objectmanager'], 2039: ['prizma'], 2040: ['lam'], 2041: ['interbase'], 2042: ['isis'], 2043: ['isis-bcast'], 2044: ['rimsl'], 2045: ['cdfunc'], 2046: ['sdfunc'], 2047: ['dls'], 2048: ['dls-monitor'], 2049: ['nfs', 'shilp'], 2050: ['av-emb-config'], 2051: ['epnsdp'], 2052: ['clearvisn'], 2053: ['lot105-ds-upd'], 2054: ['weblogin'], 2055: ['iop'], 2056: ['omnisky'], 2057: ['rich-cp'], 2058: ['newwavesearch'], 2059: ['bmc-messaging'], 2060: ['teleniumdaemon'], 2061: ['netmount'], 2062: ['icg-swp'], 2063: ['icg-bridge'], 2064: ['icg-iprelay'], 2065: ['dlsrpn'], 2066: ['aura'], 2067: ['dlswpn'], 2068: ['avauthsrvprtcl'], 2069: ['event-port'], 2070: ['ah-esp-encap'], 2071: ['acp-port'], 2072: ['msync'], 2073: ['gxs-data-port'], 2074: ['vrtl-vmf-sa'], 2075: ['newlixengine'], 2076: ['newlixconfig'], 2077: ['tsrmagt'], 2078: ['tpcsrvr'], 2079: ['idware-router'], 2080: ['autodesk-nlm'], 2081: ['kme-trap-port'], 2082: ['infowave'], 2083: ['radsec'], 2084: ['sunclustergeo'], 2085: ['ada-cip'], 2086: ['gnunet'], 2087: ['eli'], 2088: ['ip-blf'], 2089: ['sep'], 2090: ['lrp'], 2091: ['prp'], 2092: ['descent3'], 2093: ['nbx-cc'], 2094: ['nbx-au'], 2095: ['nbx-ser'], 2096: ['nbx-dir'], 2097: ['jetformpreview'], 2098: ['dialog-port'], 2099: ['h2250-annex-g'], 2100: ['amiganetfs'], 2101: ['rtcm-sc104'], 2102: ['zephyr-srv'], 2103: ['zephyr-clt'], 2104: ['zephyr-hm'], 2105: ['minipay'], 2106: ['mzap'], 2107: ['bintec-admin'], 2108: ['comcam'], 2109: ['ergolight'], 2110: ['umsp'], 2111: ['dsatp'], 2112: ['idonix-metanet'], 2113: ['hsl-storm'], 2114: ['newheights'], 2115: ['kdm'], 2116: ['ccowcmr'], 2117: ['mentaclient'], 2118: ['mentaserver'], 2119: ['gsigatekeeper'], 2120: ['qencp'], 2121: ['scientia-ssdb'], 2122: ['caupc-remote'], 2123: ['gtp-control'], 2124: ['elatelink'], 2125: ['lockstep'], 2126: ['pktcable-cops'], 2127: ['index-pc-wb'], 2128: ['net-steward'], 2129: ['cs-live'], 2130: ['xds'], 2131: ['avantageb2b'], 2132: ['solera-epmap'], 2133: ['zymed-zpp'], 2134: ['avenue'], 2135: ['gris'], 2136: ['appworxsrv'], 2137: ['connect'], 2138: ['unbind-cluster'], 2139: ['ias-auth'], 2140: ['ias-reg'], 2141: ['ias-admind'], 2142: ['tdmoip'], 2143: ['lv-jc'], 2144: ['lv-ffx'], 2145: ['lv-pici'], 2146: ['lv-not'], 2147: ['lv-auth'], 2148: ['veritas-ucl'], 2149: ['acptsys'], 2150: ['dynamic3d'], 2151: ['docent'], 2152: ['gtp-user'], 2153: ['ctlptc'], 2154: ['stdptc'], 2155: ['brdptc'], 2156: ['trp'], 2157: ['xnds'], 2158: ['touchnetplus'], 2159: ['gdbremote'], 2160: ['apc-2160'], 2161: ['apc-2161'], 2162: ['navisphere'], 2163: ['navisphere-sec'], 2164: ['ddns-v3'], 2165: ['x-bone-api'], 2166: ['iwserver'], 2167: ['raw-serial'], 2168: ['easy-soft-mux'], 2169: ['brain'], 2170: ['eyetv'], 2171: ['msfw-storage'], 2172: ['msfw-s-storage'], 2173: ['msfw-replica'], 2174: ['msfw-array'], 2175: ['airsync'], 2176: ['rapi'], 2177: ['qwave'], 2178: ['bitspeer'], 2179: ['vmrdp'], 2180: ['mc-gt-srv'], 2181: ['eforward'], 2182: ['cgn-stat'], 2183: ['cgn-config'], 2184: ['nvd'], 2185: ['onbase-dds'], 2186: ['gtaua'], 2187: ['ssmd'], 2190: ['tivoconnect'], 2191: ['tvbus'], 2192: ['asdis'], 2193: ['drwcs'], 26260: ['ezproxy'], 34963: ['profinet-rtm'], 34964: ['profinet-cm'], 2197: ['mnp-exchange'], 2198: ['onehome-remote'], 2199: ['onehome-help'], 2200: ['ici'], 2201: ['ats'], 2202: ['imtc-map'], 2203: ['b2-runtime'], 2204: ['b2-license'], 2205: ['jps'], 2206: ['hpocbus'], 2207: ['hpssd'], 2208: ['hpiod'], 2209: ['rimf-ps'], 2210: ['noaaport'], 2211: ['emwin'], 2212: ['leecoposserver'], 2213: ['kali'], 2214: ['rpi'], 2215: ['ipcore'], 2216: ['vtu-comms'], 2217: ['gotodevice'], 2218: ['bounzza'], 2219: ['netiq-ncap'], 2220: ['netiq'], 2221: ['rockwell-csp1'], 2222: ['ethernet-ip-1'], 2223: ['rockwell-csp2'], 2224: ['efi-mg'], 2226: ['di-drm'], 2227: ['di-msg'], 2228: ['ehome-ms'], 2229: ['datalens'], 2230: ['queueadm'], 2231: ['wimaxasncp'], 2232: ['ivs-video'], 2233: ['infocrypt'], 2234: ['directplay'], 2235: ['sercomm-wlink'], 2236: ['nani'], 2237: ['optech-port1-lm'], 2238: ['aviva-sna'], 2239: ['imagequery'], 2240: ['recipe'], 2241: ['ivsd'], 2242: ['foliocorp'], 2243: ['magicom'], 2244: ['nmsserver'], 2245: ['hao'], 2246: ['pc-mta-addrmap'], 2247: ['antidotemgrsvr'], 2248: ['ums'], 2249: ['rfmp'], 2250: ['remote-collab'], 2251: ['dif-port'], 2252: ['njenet-ssl'], 2253: ['dtv-chan-req'], 2254: ['seispoc'], 2255: ['vrtp'], 2256: ['pcc-mfp'], 2257: ['simple-tx-rx'], 2258: ['rcts'], 2260: ['apc-2260'], 2261: ['comotionmaster'], 2262: ['comotionback'], 2263: ['ecwcfg'], 2264: ['apx500api-1'], 2265: ['apx500api-2'], 2266: ['mfserver'], 2267: ['ontobroker'], 2268: ['amt'], 2269: ['mikey'], 2270: ['starschool'], 2271: ['mmcals'], 2272: ['mmcal'], 2273: ['mysql-im'], 2274: ['pcttunnell'], 2275: ['ibridge-data'], 2276: ['ibridge-mgmt'], 2277: ['bluectrlproxy'], 2278: ['s3db'], 2279: ['xmquery'], 2280: ['lnvpoller'], 2281: ['lnvconsole'], 2282: ['lnvalarm'], 2283: ['lnvstatus'], 2284: ['lnvmaps'], 2285: ['lnvmailmon'], 2286: ['nas-metering'], 2287: ['dna'], 2288: ['netml'], 2289: ['dict-lookup'], 2290: ['sonus-logging'], 2291: ['eapsp'], 2292: ['mib-streaming'], 2293: ['npdbgmngr'], 2294: ['konshus-lm'], 2295: ['advant-lm'], 2296: ['theta-lm'], 2297: ['d2k-datamover1'], 2298: ['d2k-datamover2'], 2299: ['pc-telecommute'], 2300: ['cvmmon'], 2301: ['cpq-wbem'], 2302: ['binderysupport'], 2303: ['proxy-gateway'], 2304: ['attachmate-uts'], 2305: ['mt-scaleserver'], 2306: ['tappi-boxnet'], 2307: ['pehelp'], 2308: ['sdhelp'], 2309: ['sdserver'], 2310: ['sdclient'], 2311: ['messageservice'], 2312: ['wanscaler'], 2313: ['iapp'], 2314: ['cr-websystems'], 2315: ['precise-sft'], 2316: ['sent-lm'], 2317: ['attachmate-g32'], 2318: ['cadencecontrol'], 2319: ['infolibria'], 2320: ['siebel-ns'], 2321: ['rdlap'], 2322: ['ofsd'], 2323: ['3d-nfsd'], 2324: ['cosmocall'], 2325: ['ansysli'], 2326: ['idcp'], 2327: ['xingcsm'], 2328: ['netrix-sftm'], 2329: ['nvd'], 2330: ['tscchat'], 2331: ['agentview'], 2332: ['rcc-host'], 2333: ['snapp'], 2334: ['ace-client'], 2335: ['ace-proxy'], 2336: ['appleugcontrol'], 2337: ['ideesrv'], 2338: ['norton-lambert'], 2339: ['3com-webview'], 2340: ['wrs-registry'], 2341: ['xiostatus'], 2342: ['manage-exec'], 2343: ['nati-logos'], 2344: ['fcmsys'], 2345: ['dbm'], 2346: ['redstorm-join'], 2347: ['redstorm-find'], 2348: ['redstorm-info'], 2349: ['redstorm-diag'], 2350: ['psbserver'], 2351: ['psrserver'], 2352: ['pslserver'], 2353: ['pspserver'], 2354: ['psprserver'], 2355: ['psdbserver'], 2356: ['gxtelmd'], 2357: ['unihub-server'], 2358: ['futrix'], 2359: ['flukeserver'], 2360: ['nexstorindltd'], 2361: ['tl1'], 2362: ['digiman'], 2363: ['mediacntrlnfsd'], 2364: ['oi-2000'], 2365: ['dbref'], 2366: ['qip-login'], 2367: ['service-ctrl'], 2368: ['opentable'], 8199: ['vvr-data'], 2370: ['l3-hbmon'], 2371: ['worldwire'], 2372: ['lanmessenger'], 9899: ['sctp-tunneling'], 9953: ['acis'], 11319: ['imip'], 2381: ['compaq-https'], 2382: ['ms-olap3'], 2383: ['ms-olap4'], 2384: ['sd-capacity'], 2385: ['sd-data'], 2386: ['virtualtape'], 2387: ['vsamredirector'], 2388: ['mynahautostart'], 2389: ['ovsessionmgr'], 2390: ['rsmtp'], 2391: ['3com-net-mgmt'], 2392: ['tacticalauth'], 2393: ['ms-olap1'], 2394: ['ms-olap2'], 2395: ['lan900-remote'], 2396: ['wusage'], 2397: ['ncl'], 2398: ['orbiter'], 2399: ['fmpro-fdal'], 2400: ['opequus-server'], 2401: ['cvspserver'], 2402: ['taskmaster2000'], 2403: ['taskmaster2000'], 2404: ['iec-104'], 2405: ['trc-netpoll'], 2406: ['jediserver'], 2407: ['orion'], 2409: ['sns-protocol'], 2410: ['vrts-registry'], 2411: ['netwave-ap-mgmt'], 2412: ['cdn'], 2413: ['orion-rmi-reg'], 2414: ['beeyond'], 2415: ['codima-rtp'], 2416: ['rmtserver'], 2417: ['composit-server'], 2418: ['cas'], 2419: ['attachmate-s2s'], 2420: ['dslremote-mgmt'], 2421: ['g-talk'], 2422: ['crmsbits'], 2423: ['rnrp'], 2424: ['kofax-svr'], 2425: ['fjitsuappmgr'], 9628: ['odbcpathway'], 2427: ['mgcp-gateway'], 2428: ['ott'], 2429: ['ft-role'], 2430: ['venus'], 2431: ['venus-se'], 2432: ['codasrv'], 2433: ['codasrv-se'], 2434: ['pxc-epmap'], 2435: ['optilogic'], 2436: ['topx'], 2437: ['unicontrol'], 2438: ['msp'], 2439: ['sybasedbsynch'], 2440: ['spearway'], 2441: ['pvsw-inet'], 2442: ['netangel'], 2443: ['powerclientcsf'], 2444: ['btpp2sectrans'], 2445: ['dtn1'], 2446: ['bues-service'], 2447: ['ovwdb'], 2448: ['hpppssvr'], 2449: ['ratl'], 2450: ['netadmin'], 2451: ['netchat'], 2452: ['snifferclient'], 2453: ['madge-ltd'], 2454: ['indx-dds'], 2455: ['wago-io-system'], 2456: ['altav-remmgt'], 2457: ['rapido-ip'], 2458: ['griffin'], 2459: ['community'], 2460: ['ms-theater'], 2461: ['qadmifoper'], 2462: ['qadmifevent'], 2463: ['lsi-raid-mgmt'], 2464: ['direcpc-si'], 2465: ['lbm'], 2466: ['lbf'], 2467: ['high-criteria'], 2468: ['qip-msgd'], 2469: ['mti-tcs-comm'], 2470: ['taskman-port'], 2471: ['seaodbc'], 2472: ['c3'], 2473: ['aker-cdp'], 2474: ['vitalanalysis'], 2475: ['ace-server'], 2476: ['ace-svr-prop'], 2477: ['ssm-cvs'], 2478: ['ssm-cssps'], 2479: ['ssm-els'], 2480: ['powerexchange'], 2481: ['giop'], 2482: ['giop-ssl'], 2483: ['ttc'], 2484: ['ttc-ssl'], 2485: ['netobjects1'], 2486: ['netobjects2'], 2487: ['pns'], 2488: ['moy-corp'], 2489: ['tsilb'], 2490: ['qip-qdhcp'], 2491: ['conclave-cpp'], 2492: ['groove'], 2493: ['talarian-mqs'], 2494: ['bmc-ar'], 2495: ['fast-rem-serv'], 2496: ['dirgis'], 2497: ['quaddb'], 2498: ['odn-castraq'], 2499: ['unicontrol'], 2500: ['rtsserv'], 2501: ['rtsclient'], 2502: ['kentrox-prot'], 2503: ['nms-dpnss'], 2504: ['wlbs'], 2505: ['ppcontrol'], 2506: ['jbroker'], 2507: ['spock'], 2508: ['jdatastore'], 2509: ['fjmpss'], 2510: ['fjappmgrbulk'], 2511: ['metastorm'], 2512: ['citrixima'], 2513: ['citrixadmin'], 2514: ['facsys-ntp'], 2515: ['facsys-router'], 2516: ['maincontrol'], 2517: ['call-sig-trans'], 2518: ['willy'], 2519: ['globmsgsvc'], 2520: ['pvsw'], 2521: ['adaptecmgr'], 2522: ['windb'], 2523: ['qke-llc-v3'], 2524: ['optiwave-lm'], 2525: ['ms-v-worlds'], 2526: ['ema-sent-lm'], 2527: ['iqserver'], 2528: ['ncr-ccl'], 2529: ['utsftp'], 2530: ['vrcommerce'], 2531: ['ito-e-gui'], 2532: ['ovtopmd'], 2533: ['snifferserver'], 2534: ['combox-web-acc'], 2535: ['madcap'], 2536: ['btpp2audctr1'], 2537: ['upgrade'], 2538: ['vnwk-prapi'], 2539: ['vsiadmin'], 2540: ['lonworks'], 2541: ['lonworks2'], 2542: ['udrawgraph'], 2543: ['reftek'], 2544: ['novell-zen'], 2545: ['sis-emt'], 2546: ['vytalvaultbrtp'], 2547: ['vytalvaultvsmp'], 2548: ['vytalvaultpipe'], 2549: ['ipass'], 2550: ['ads'], 2551: ['isg-uda-server'], 2552: ['call-logging'], 2553: ['efidiningport'], 2554: ['vcnet-link-v10'], 2555: ['compaq-wcp'], 2556: ['nicetec-nmsvc'], 2557: ['nicetec-mgmt'], 2558: ['pclemultimedia'], 2559: ['lstp'], 2560: ['labrat'], 2561: ['mosaixcc'], 2562: ['delibo'], 2563: ['cti-redwood'], 2564: ['hp-3000-telnet'], 2565: ['coord-svr'], 2566: ['pcs-pcw'], 2567: ['clp'], 2568: ['spamtrap'], 2569: ['sonuscallsig'], 2570: ['hs-port'], 2571: ['cecsvc'], 2572: ['ibp'], 2573: ['trustestablish'], 2574: ['blockade-bpsp'], 2575: ['hl7'], 2576: ['tclprodebugger'], 2577: ['scipticslsrvr'], 2578: ['rvs-isdn-dcp'], 2579: ['mpfoncl'], 2580: ['tributary'], 2581: ['argis-te'], 2582: ['argis-ds'], 2583: ['mon'], 2584: ['cyaserv'], 2585: ['netx-server'], 2586: ['netx-agent'], 2587: ['masc'], 2588: ['privilege'], 2589: ['quartus-tcl'], 2590: ['idotdist'], 2591: ['maytagshuffle'], 2592: ['netrek'], 2593: ['mns-mail'], 2594: ['dts'], 2595: ['worldfusion1'], 2596: ['worldfusion2'], 2597: ['homesteadglory'], 2598: ['citriximaclient'], 2599: ['snapd'], 2600: ['hpstgmgr'], 2601: ['discp-client'], 2602: ['discp-server'], 2603: ['servicemeter'], 2604: ['nsc-ccs'], 2605: ['nsc-posa'], 2606: ['netmon'], 2607: ['connection'], 2608: ['wag-service'], 2609: ['system-monitor'], 2610: ['versa-tek'], 2611: ['lionhead'], 2612: ['qpasa-agent'], 2613: ['smntubootstrap'], 2614: ['neveroffline'], 2615: ['firepower'], 2616: ['appswitch-emp'], 2617: ['cmadmin'], 2618: ['priority-e-com'], 2619: ['bruce'], 2620: ['lpsrecommender'], 2621: ['miles-apart'], 2622: ['metricadbc'], 2623: ['lmdp'], 2624: ['aria'], 2625: ['blwnkl-port'], 2626: ['gbjd816'], 2627: ['moshebeeri'], 2628: ['dict'], 2629: ['sitaraserver'], 2630: ['sitaramgmt'], 2631: ['sitaradir'], 2632: ['irdg-post'], 2633: ['interintelli'], 2634: ['pk-electronics'], 2635: ['backburner'], 2636: ['solve'], 2637: ['imdocsvc'], 2638: ['sybaseanywhere'], 2639: ['aminet'], 2640: ['sai-sentlm'], 2641: ['hdl-srv'], 2642: ['tragic'], 2643: ['gte-samp'], 2644: ['travsoft-ipx-t'], 2645: ['novell-ipx-cmd'], 2646: ['and-lm'], 2647: ['syncserver'], 2648: ['upsnotifyprot'], 2649: ['vpsipport'], 2650: ['eristwoguns'], 2651: ['ebinsite'], 2652: ['interpathpanel'], 2653: ['sonus'], 2654: ['corel-vncadmin'], 2655: ['unglue'], 2656: ['kana'], 2657: ['sns-dispatcher'], 2658: ['sns-admin'], 2659: ['sns-query'], 2660: ['gcmonitor'], 2661: ['olhost'], 2662: ['bintec-capi'], 2663: ['bintec-tapi'], 2664: ['patrol-mq-gm'], 2665: ['patrol-mq-nm'], 2666: ['extensis'], 2667: ['alarm-clock-s'], 2668: ['alarm-clock-c'], 2669: ['toad'], 2670: ['tve-announce'], 2671: ['newlixreg'], 2672: ['nhserver'], 2673: ['firstcall42'], 2674: ['ewnn'], 2675: ['ttc-etap'], 2676: ['simslink'], 2677: ['gadgetgate1way'], 2678: ['gadgetgate2way'], 2679: ['syncserverssl'], 2680: ['pxc-sapxom'], 2681: ['mpnjsomb'], 2683: ['ncdloadbalance'], 2684: ['mpnjsosv'], 2685: ['mpnjsocl'], 2686: ['mpnjsomg'], 2687: ['pq-lic-mgmt'], 2688: ['md-cg-http'], 2689: ['fastlynx'], 2690: ['hp-nnm-data'], 2691: ['itinternet'], 2692: ['admins-lms'], 2694: ['pwrsevent'], 2695: ['vspread'], 2696: ['unifyadmin'], 2697: ['oce-snmp-trap'], 2698: ['mck-ivpip'], 2699: ['csoft-plusclnt'], 2700: ['tqdata'], 2701: ['sms-rcinfo'], 2702: ['sms-xfer'], 2703: ['sms-chat'], 2704: ['sms-remctrl'], 2705: ['sds-admin'], 2706: ['ncdmirroring'], 2707: ['emcsymapiport'], 2708: ['banyan-net'], 2709: ['supermon'], 2710: ['sso-service'], 2711: ['sso-control'], 2712: ['aocp'], 2713: ['raventbs'], 2714: ['raventdm'], 2715: ['hpstgmgr2'], 2716: ['inova-ip-disco'], 2717: ['pn-requester'], 2718: ['pn-requester2'], 2719: ['scan-change'], 2720: ['wkars'], 2721: ['smart-diagnose'], 2722: ['proactivesrvr'], 2723: ['watchdog-nt'], 2724: ['qotps'], 2725: ['msolap-ptp2'], 2726: ['tams'], 2727: ['mgcp-callagent'], 2728: ['sqdr'], 2729: ['tcim-control'], 2730: ['nec-raidplus'], 2731: ['fyre-messanger'], 2732: ['g5m'], 2733: ['signet-ctf'], 2734: ['ccs-software'], 2735: ['netiq-mc'], 2736: ['radwiz-nms-srv'], 2737: ['srp-feedback'], 2738: ['ndl-tcp-ois-gw'], 2739: ['tn-timing'], 2740: ['alarm'], 2741: ['tsb'], 2742: ['tsb2'], 2743: ['murx'], 2744: ['honyaku'], 2745: ['urbisnet'], 2746: ['cpudpencap'], 2747: ['fjippol-swrly'], 2748: ['fjippol-polsvr'], 2749: ['fjippol-cnsl'], 2750: ['fjippol-port1'], 2751: ['fjippol-port2'], 2752: ['rsisysaccess'], 2753: ['de-spot'], 2754: ['apollo-cc'], 2755: ['expresspay'], 2756: ['simplement-tie'], 2757: ['cnrp'], 2758: ['apollo-status'], 2759: ['apollo-gms'], 2760: ['sabams'], 2761: ['dicom-iscl'], 2762: ['dicom-tls'], 2763: ['desktop-dna'], 2764: ['data-insurance'], 2765: ['qip-audup'], 2766: ['compaq-scp'], 2767: ['uadtc'], 2768: ['uacs'], 2769: ['exce'], 2770: ['veronica'], 2771: ['vergencecm'], 2772: ['auris'], 2773: ['rbakcup1'], 2774: ['rbakcup2'], 2775: ['smpp'], 2776: ['ridgeway1'], 2777: ['ridgeway2'], 2778: ['gwen-sonya'], 2779: ['lbc-sync'], 2780: ['lbc-control'], 2781: ['whosells'], 2782: ['everydayrc'], 2783: ['aises'], 2784: ['www-dev'], 2785: ['aic-np'], 2786: ['aic-oncrpc'], 2787: ['piccolo'], 2788: ['fryeserv'], 2789: ['media-agent'], 2790: ['plgproxy'], 2791: ['mtport-regist'], 2792: ['f5-globalsite'], 2793: ['initlsmsad'], 2795: ['livestats'], 2796: ['ac-tech'], 2797: ['esp-encap'], 2798: ['tmesis-upshot'], 2799: ['icon-discover'], 2800: ['acc-raid'], 2801: ['igcp'], 2802: ['veritas-udp1'], 2803: ['btprjctrl'], 2804: ['dvr-esm'], 2805: ['wta-wsp-s'], 2806: ['cspuni'], 2807: ['cspmulti'], 2808: ['j-lan-p'], 2809: ['corbaloc'], 2810: ['netsteward'], 2811: ['gsiftp'], 2812: ['atmtcp'], 2813: ['llm-pass'], 2814: ['llm-csv'], 2815: ['lbc-measure'], 2816: ['lbc-watchdog'], 2817: ['nmsigport'], 2818: ['rmlnk'], 2819: ['fc-faultnotify'], 2820: ['univision'], 2821: ['vrts-at-port'], 2822: ['ka0wuc'], 2823: ['cqg-netlan'], 2824: ['cqg-netlan-1'], 2826: ['slc-systemlog'], 2827: ['slc-ctrlrloops'], 2828: ['itm-lm'], 2829: ['silkp1'], 2830: ['silkp2'], 2831: ['silkp3'], 2832: ['silkp4'], 2833: ['glishd'], 2834: ['evtp'], 2835: ['evtp-data'], 2836: ['catalyst'], 2837: ['repliweb'], 2838: ['starbot'], 2839: ['nmsigport'], 2840: ['l3-exprt'], 2841: ['l3-ranger'], 2842: ['l3-hawk'], 2843: ['pdnet'], 2844: ['bpcp-poll'], 2845: ['bpcp-trap'], 2846: ['aimpp-hello'], 2847: ['aimpp-port-req'], 2848: ['amt-blc-port'], 2849: ['fxp'], 2850: ['metaconsole'], 2851: ['webemshttp'], 2852: ['bears-01'], 2853: ['ispipes'], 2854: ['infomover'], 2855: ['msrp'], 2856: ['cesdinv'], 2857: ['simctlp'], 2858: ['ecnp'], 2859: ['activememory'], 2860: ['dialpad-voice1'], 2861: ['dialpad-voice2'], 2862: ['ttg-protocol'], 2863: ['sonardata'], 2864: ['astromed-main'], 2865: ['pit-vpn'], 2866: ['iwlistener'], 2867: ['esps-portal'], 2868: ['npep-messaging'], 2869: ['icslap'], 2870: ['daishi'], 2871: ['msi-selectplay'], 2872: ['radix'], 2874: ['dxmessagebase1'], 2875: ['dxmessagebase2'], 2876: ['sps-tunnel'], 2877: ['bluelance'], 2878: ['aap'], 2879: ['ucentric-ds'], 2880: ['synapse'], 2881: ['ndsp'], 2882: ['ndtp'], 2883: ['ndnp'], 2884: ['flashmsg'], 2885: ['topflow'], 2886: ['responselogic'], 2887: ['aironetddp'], 2888: ['spcsdlobby'], 2889: ['rsom'], 2890: ['cspclmulti'], 2891: ['cinegrfx-elmd'], 2892: ['snifferdata'], 2893: ['vseconnector'], 2894: ['abacus-remote'], 2895: ['natuslink'], 2896: ['ecovisiong6-1'], 2897: ['citrix-rtmp'], 2898: ['appliance-cfg'], 2899: ['powergemplus'], 2900: ['quicksuite'], 2901: ['allstorcns'], 2902: ['netaspi'], 2903: ['suitcase'], 2904: ['m2ua'], 2906: ['caller9'], 2907: ['webmethods-b2b'], 2908: ['mao'], 2909: ['funk-dialout'], 2910: ['tdaccess'], 2911: ['blockade'], 2912: ['epicon'], 2913: ['boosterware'], 2914: ['gamelobby'], 2915: ['tksocket'], 2916: ['elvin-server'], 2917: ['elvin-client'], 2918: ['kastenchasepad'], 2919: ['roboer'], 2920: ['roboeda'], 2921: ['cesdcdman'], 2922: ['cesdcdtrn'], 2923: ['wta-wsp-wtp-s'], 2924: ['precise-vip'], 2926: ['mobile-file-dl'], 2927: ['unimobilectrl'], 2928: ['redstone-cpss'], 2929: ['amx-webadmin'], 2930: ['amx-weblinx'], 2931: ['circle-x'], 2932: ['incp'], 2933: ['4-tieropmgw'], 2934: ['4-tieropmcli'], 2935: ['qtp'], 2936: ['otpatch'], 2937: ['pnaconsult-lm'], 2938: ['sm-pas-1'], 2939: ['sm-pas-2'], 2940: ['sm-pas-3'], 2941: ['sm-pas-4'], 2942: ['sm-pas-5'], 2943: ['ttnrepository'], 2944: ['megaco-h248'], 2945: ['h248-binary'], 2946: ['fjsvmpor'], 2947: ['gpsd'], 2948: ['wap-push'], 2949: ['wap-pushsecure'], 2950: ['esip'], 2951: ['ottp'], 2952: ['mpfwsas'], 2953: ['ovalarmsrv'], 2954: ['ovalarmsrv-cmd'], 2955: ['csnotify'], 2956: ['ovrimosdbman'], 2957: ['jmact5'], 2958: ['jmact6'], 2959: ['rmopagt'], 2960: ['dfoxserver'], 2961: ['boldsoft-lm'], 2962: ['iph-policy-cli'], 2963: ['iph-policy-adm'], 2964: ['bullant-srap'], 2965: ['bullant-rap'], 2966: ['idp-infotrieve'], 2967: ['ssc-agent'], 2968: ['enpp'], 2969: ['essp'], 2970: ['index-net'], 2971: ['netclip'], 2972: ['pmsm-webrctl'], 2973: ['svnetworks'], 2974: ['signal'], 2975: ['fjmpcm'], 2976: ['cns-srv-port'], 2977: ['ttc-etap-ns'], 2978: ['ttc-etap-ds'], 2979: ['h263-video'], 2980: ['wimd'], 2981: ['mylxamport'], 2982: ['iwb-whiteboard'], 2983: ['netplan'], 2984: ['hpidsadmin'], 2985: ['hpidsagent'], 2986: ['stonefalls'], 2987: ['identify'], 2988: ['hippad'], 2989: ['zarkov'], 2990: ['boscap'], 2991: ['wkstn-mon'], 2992: ['avenyo'], 2993: ['veritas-vis1'], 2994: ['veritas-vis2'], 2995: ['idrs'], 2996: ['vsixml'], 2997: ['rebol'], 2998: ['realsecure'], 2999: ['remoteware-un'], 3000: ['hbci', 'remoteware-cl'], 3002: ['exlm-agent', 'remoteware-srv'], 3003: ['cgms'], 3004: ['csoftragent'], 3005: ['geniuslm'], 3006: ['ii-admin'], 3007: ['lotusmtap'], 3008: ['midnight-tech'], 3009: ['pxc-ntfy'], 3010: ['ping-pong'], 3011: ['trusted-web'], 3012: ['twsdss'], 3013: ['gilatskysurfer'], 3014: ['broker-service'], 3015: ['nati-dstp'], 3016: ['notify-srvr'], 3017: ['event-listener'], 3018: ['srvc-registry'], 3019: ['resource-mgr'], 3020: ['cifs'], 3021: ['agriserver'], 3022: ['csregagent'], 3023: ['magicnotes'], 3024: ['nds-sso'], 3025: ['arepa-raft'], 3026: ['agri-gateway'], 3027: ['liebdevmgmt-c'], 3028: ['liebdevmgmt-dm'], 3029: ['liebdevmgmt-a'], 3030: ['arepa-cas'], 3031: ['eppc'], 3032: ['redwood-chat'], 3033: ['pdb'], 3034: ['osmosis-aeea'], 3035: ['fjsv-gssagt'], 3036: ['hagel-dump'], 3037: ['hp-san-mgmt'], 3038: ['santak-ups'], 3039: ['cogitate'], 3040: ['tomato-springs'], 3041: ['di-traceware'], 3042: ['journee'], 3043: ['brp'], 3044: ['epp'], 3045: ['responsenet'], 3046: ['di-ase'], 3047: ['hlserver'], 3048: ['pctrader'], 3049: ['nsws'], 3050: ['gds-db'], 3051: ['galaxy-server'], 3052: ['apc-3052'], 3053: ['dsom-server'], 3054: ['amt-cnf-prot'], 3055: ['policyserver'], 3056: ['cdl-server'], 3057: ['goahead-fldup'], 3058: ['videobeans'], 3059: ['qsoft'], 3060: ['interserver'], 3061: ['cautcpd'], 3062: ['ncacn-ip-tcp'], 3063: ['ncadg-ip-udp'], 3064: ['rprt'], 3065: ['slinterbase'], 3066: ['netattachsdmp'], 3067: ['fjhpjp'], 3068: ['ls3bcast'], 3069: ['ls3'], 3070: ['mgxswitch'], 3071: ['csd-mgmt-port'], 3072: ['csd-monitor'], 3073: ['vcrp'], 3074: ['xbox'], 3075: ['orbix-locator'], 3076: ['orbix-config'], 3077: ['orbix-loc-ssl'], 3078: ['orbix-cfg-ssl'], 3079: ['lv-frontpanel'], 3080: ['stm-pproc'], 3081: ['tl1-lv'], 3082: ['tl1-raw'], 3083: ['tl1-telnet'], 3084: ['itm-mccs'], 3085: ['pcihreq'], 3086: ['jdl-dbkitchen'], 3087: ['asoki-sma'], 3088: ['xdtp'], 3089: ['ptk-alink'], 3090: ['stss'], 3091: ['1ci-smcs'], 3093: ['rapidmq-center'], 3094: ['rapidmq-reg'], 3095: ['panasas'], 3096: ['ndl-aps'], 16900: ['newbay-snc-mc'], 3098: ['umm-port'], 3099: ['chmd'], 3100: ['opcon-xps'], 3101: ['hp-pxpib'], 3102: ['slslavemon'], 3103: ['autocuesmi'], 3104: ['autocuetime'], 3105: ['cardbox'], 3106: ['cardbox-http'], 3107: ['business'], 3108: ['geolocate'], 3109: ['personnel'], 3110: ['sim-control'], 3111: ['wsynch'], 3112: ['ksysguard'], 3113: ['cs-auth-svr'], 3114: ['ccmad'], 3115: ['mctet-master'], 3116: ['mctet-gateway'], 3117: ['mctet-jserv'], 3118: ['pkagent'], 3119: ['d2000kernel'], 3120: ['d2000webserver'], 33656: ['snip-slave'], 3122: ['vtr-emulator'], 3123: ['edix'], 3124: ['beacon-port'], 3125: ['a13-an'], 24680: ['tcc-http'], 3127: ['ctx-bridge'], 3128: ['ndl-aas'], 3129: ['netport-id'], 3130: ['icpv2'], 3131: ['netbookmark'], 3132: ['ms-rule-engine'], 3133: ['prism-deploy'], 3134: ['ecp'], 3135: ['peerbook-port'], 3136: ['grubd'], 3137: ['rtnt-1'], 3138: ['rtnt-2'], 3139: ['incognitorv'], 3140: ['ariliamulti'], 3141: ['vmodem'], 3142: ['rdc-wh-eos'], 3143: ['seaview'], 3144: ['tarantella'], 3145: ['csi-lfap'], 3146: ['bears-02'], 3147: ['rfio'], 3148: ['nm-game-admin'], 3149: ['nm-game-server'], 3150: ['nm-asses-admin'], 3151: ['nm-assessor'], 3152: ['feitianrockey'], 3153: ['s8-client-port'], 3154: ['ccmrmi'], 3155: ['jpegmpeg'], 3156: ['indura'], 3157: ['e3consultants'], 3158: ['stvp'], 3159: ['navegaweb-port'], 3160: ['tip-app-server'], 3161: ['doc1lm'], 3162: ['sflm'], 3163: ['res-sap'], 3164: ['imprs'], 3165: ['newgenpay'], 3166: ['sossecollector'], 3167: ['nowcontact'], 3168: ['poweronnud'], 3169: ['serverview-as'], 3170: ['serverview-asn'], 3171: ['serverview-gf'], 3172: ['serverview-rm'], 3173: ['serverview-icc'], 3174: ['armi-server'], 3175: ['t1-e1-over-ip'], 3176: ['ars-master'], 3177: ['phonex-port'], 3178: ['radclientport'], 3179: ['h2gf-w-2m'], 3180: ['mc-brk-srv'], 3181: ['bmcpatrolagent'], 3182: ['bmcpatrolrnvu'], 3183: ['cops-tls'], 3184: ['apogeex-port'], 3185: ['smpppd'], 3186: ['iiw-port'], 3187: ['odi-port'], 3188: ['brcm-comm-port'], 3189: ['pcle-infex'], 3190: ['csvr-proxy'], 3191: ['csvr-sslproxy'], 3192: ['firemonrcc'], 3193: ['spandataport'], 3194: ['magbind'], 3195: ['ncu-1'], 3196: ['ncu-2'], 3197: ['embrace-dp-s'], 3198: ['embrace-dp-c'], 3199: ['dmod-workspace'], 3200: ['tick-port'], 3201: ['cpq-tasksmart'], 3202: ['intraintra'], 3203: ['netwatcher-mon'], 3204: ['netwatcher-db'], 3205: ['isns'], 3206: ['ironmail'], 3207: ['vx-auth-port'], 3208: ['pfu-prcallback'], 3209: ['netwkpathengine'], 3210: ['flamenco-proxy'], 3211: ['avsecuremgmt'], 3212: ['surveyinst'], 3213: ['neon24x7'], 3214: ['jmq-daemon-1'], 3215: ['jmq-daemon-2'], 3216: ['ferrari-foam'], 3217: ['unite'], 3218: ['smartpackets'], 3219: ['wms-messenger'], 3220: ['xnm-ssl'], 3221: ['xnm-clear-text'], 3222: ['glbp'], 3223: ['digivote'], 3224: ['aes-discovery'], 3225: ['fcip-port'], 3226: ['isi-irp'], 3227: ['dwnmshttp'], 3228: ['dwmsgserver'], 3229: ['global-cd-port'], 3230: ['sftdst-port'], 3231: ['vidigo'], 3232: ['mdtp'], 3233: ['whisker'], 3234: ['alchemy'], 3235: ['mdap-port'], 3236: ['apparenet-ts'], 3237: ['apparenet-tps'], 3238: ['apparenet-as'], 3239: ['apparenet-ui'], 3240: ['triomotion'], 3241: ['sysorb'], 3242: ['sdp-id-port'], 3243: ['timelot'], 3244: ['onesaf'], 3245: ['vieo-fe'], 3246: ['dvt-system'], 3247: ['dvt-data'], 3248: ['procos-lm'], 3249: ['ssp'], 3250: ['hicp'], 3251: ['sysscanner'], 3252: ['dhe'], 3253: ['pda-data'], 3254: ['pda-sys'], 3255: ['semaphore'], 3256: ['cpqrpm-agent'], 3257: ['cpqrpm-server'], 3258: ['ivecon-port'], 3259: ['epncdp2'], 3260: ['iscsi-target'], 3261: ['winshadow'], 3262: ['necp'], 3263: ['ecolor-imager'], 3264: ['ccmail'], 3265: ['altav-tunnel'], 3266: ['ns-cfg-server'], 3267: ['ibm-dial-out'], 3268: ['msft-gc'], 3269: ['msft-gc-ssl'], 3270: ['verismart'], 3271: ['csoft-prev'], 3272: ['user-manager'], 3273: ['sxmp'], 3274: ['ordinox-server'], 3275: ['samd'], 3276: ['maxim-asics'], 3277: ['awg-proxy'], 3278: ['lkcmserver'], 3279: ['admind'], 3280: ['vs-server'], 3281: ['sysopt'], 3282: ['datusorb'], 3283: ['apple remote desktop (net assistant)'], 3284: ['4talk'], 3285: ['plato'], 3286: ['e-net'], 3287: ['directvdata'], 3288: ['cops'], 3289: ['enpc'], 3290: ['caps-lm'], 3291: ['sah-lm'], 3292: ['cart-o-rama'], 3293: ['fg-fps'], 3294: ['fg-gip'], 3295: ['dyniplookup'], 3296: ['rib-slm'], 3297: ['cytel-lm'], 3298: ['deskview'], 3299: ['pdrncs'], 3302: ['mcs-fastmail'], 3303: ['opsession-clnt'], 3304: ['opsession-srvr'], 3305: ['odette-ftp'], 3306: ['mysql'], 3307: ['opsession-prxy'], 3308: ['tns-server'], 3309: ['tns-adv'], 3310: ['dyna-access'], 3311: ['mcns-tel-ret'], 3312: ['appman-server'], 3313: ['uorb'], 3314: ['uohost'], 3315: ['cdid'], 3316: ['aicc-cmi'], 3317: ['vsaiport'], 3318: ['ssrip'], 3319: ['sdt-lmd'], 3320: ['officelink2000'], 3321: ['vnsstr'], 10111: ['nmea-onenet'], 8294: ['blp4'], 3326: ['sftu'], 3327: ['bbars'], 3328: ['egptlm'], 3329: ['hp-device-disc'], 3330: ['mcs-calypsoicf'], 3331: ['mcs-messaging'], 3332: ['mcs-mailsvr'], 3333: ['dec-notes'], 3334: ['directv-web'], 3335: ['directv-soft'], 3336: ['directv-tick'], 3337: ['directv-catlg'], 3338: ['anet-b'], 3339: ['anet-l'], 3340: ['anet-m'], 3341: ['anet-h'], 3342: ['webtie'], 3343: ['ms-cluster-net'], 3344: ['bnt-manager'], 3345: ['influence'], 3346: ['trnsprntproxy'], 3347: ['phoenix-rpc'], 3348: ['pangolin-laser'], 3349: ['chevinservices'], 3350: ['findviatv'], 3351: ['btrieve'], 3352: ['ssql'], 3353: ['fatpipe'], 3354: ['suitjd'], 3355: ['ordinox-dbase'], 3356: ['upnotifyps'], 3357: ['adtech-test'], 3358: ['mpsysrmsvr'], 3359: ['wg-netforce'], 3360: ['kv-server'], 3361: ['kv-agent'], 3362: ['dj-ilm'], 3363: ['nati-vi-server'], 3364: ['creativeserver'], 3365: ['contentserver'], 3366: ['creativepartnr'], 3372: ['tip2'], 3373: ['lavenir-lm'], 3374: ['cluster-disc'], 3375: ['vsnm-agent'], 3376: ['cdbroker'], 3377: ['cogsys-lm'], 3378: ['wsicopy'], 3379: ['socorfs'], 3380: ['sns-channels'], 3381: ['geneous'], 3382: ['fujitsu-neat'], 3383: ['esp-lm'], 3384: ['hp-clic'], 3385: ['qnxnetman'], 3386: ['gprs-sig'], 3387: ['backroomnet'], 3388: ['cbserver'], 3389: ['ms-wbt-server'], 3390: ['dsc'], 3391: ['savant'], 3392: ['efi-lm'], 3393: ['d2k-tapestry1'], 3394: ['d2k-tapestry2'], 3395: ['dyna-lm'], 3396: ['printer-agent'], 3397: ['cloanto-lm'], 3398: ['mercantile'], 3399: ['csms'], 3400: ['csms2'], 3401: ['filecast'], 3402: ['fxaengine-net'], 19788: ['mle'], 3405: ['nokia-ann-ch1'], 3406: ['nokia-ann-ch2'], 3407: ['ldap-admin'], 3408: ['besapi'], 3409: ['networklens'], 3410: ['networklenss'], 3411: ['biolink-auth'], 3412: ['xmlblaster'], 3413: ['svnet'], 3414: ['wip-port'], 3415: ['bcinameservice'], 3416: ['commandport'], 3417: ['csvr'], 3418: ['rnmap'], 3419: ['softaudit'], 3420: ['ifcp-port'], 3421: ['bmap'], 3422: ['rusb-sys-port'], 3423: ['xtrm'], 3424: ['xtrms'], 3425: ['agps-port'], 3426: ['arkivio'], 3427: ['websphere-snmp'], 3428: ['twcss'], 3429: ['gcsp'], 3430: ['ssdispatch'], 3431: ['ndl-als'], 3432: ['osdcp'], 3433: ['opnet-smp'], 3434: ['opencm'], 3435: ['pacom'], 3436: ['gc-config'], 3437: ['autocueds'], 3438: ['spiral-admin'], 3439: ['hri-port'], 3440: ['ans-console'], 3441: ['connect-client'], 3442: ['connect-server'], 3443: ['ov-nnm-websrv'], 3444: ['denali-server'], 3445: ['monp'], 3446: ['3comfaxrpc'], 3447: ['directnet'], 3448: ['dnc-port'], 3449: ['hotu-chat'], 3450: ['castorproxy'], 3451: ['asam'], 3452: ['sabp-signal'], 3453: ['pscupd'], 3454: ['mira'], 3455: ['prsvp'], 3456: ['vat'], 3457: ['vat-control'], 3458: ['d3winosfi'], 3459: ['integral'], 3460: ['edm-manager'], 3461: ['edm-stager'], 3462: ['edm-std-notify'], 3463: ['edm-adm-notify'], 3464: ['edm-mgr-sync'], 3465: ['edm-mgr-cntrl'], 3466: ['workflow'], 3467: ['rcst'], 3468: ['ttcmremotectrl'], 3469: ['pluribus'], 3470: ['jt400'], 3471: ['jt400-ssl'], 3472: ['jaugsremotec-1'], 3473: ['jaugsremotec-2'], 3474: ['ttntspauto'], 3475: ['genisar-port'], 3476: ['nppmp'], 3477: ['ecomm'], 3478: ['stun', 'stun-behavior', 'turn'], 3479: ['twrpc'], 3480: ['plethora'], 3481: ['cleanerliverc'], 3482: ['vulture'], 3483: ['slim-devices'], 3484: ['gbs-stp'], 3485: ['celatalk'], 3486: ['ifsf-hb-port'], 3487: ['ltcudp'], 3488: ['fs-rh-srv'], 3489: ['dtp-dia'], 3490: ['colubris'], 3491: ['swr-port'], 3492: ['tvdumtray-port'], 3493: ['nut'], 3494: ['ibm3494'], 3495: ['seclayer-tcp'], 3496: ['seclayer-tls'], 3497: ['ipether232port'], 3498: ['dashpas-port'], 3499: ['sccip-media'], 3500: ['rtmp-port'], 3501: ['isoft-p2p'], 3502: ['avinstalldisc'], 3503: ['lsp-ping'], 3504: ['ironstorm'], 3505: ['ccmcomm'], 3506: ['apc-3506'], 3507: ['nesh-broker'], 3508: ['interactionweb'], 3509: ['vt-ssl'], 3510: ['xss-port'], 3511: ['webmail-2'], 3512: ['aztec'], 3513: ['arcpd'], 3514: ['must-p2p'], 3515: ['must-backplane'], 3516: ['smartcard-port'], 3517: ['802-11-iapp'], 3518: ['artifact-msg'], 3519: ['galileo'], 3520: ['galileolog'], 3521: ['mc3ss'], 3522: ['nssocketport'], 3523: ['odeumservlink'], 3524: ['ecmport'], 3525: ['eisport'], 3526: ['starquiz-port'], 3527: ['beserver-msg-q'], 3528: ['jboss-iiop'], 3529: ['jboss-iiop-ssl'], 3530: ['gf'], 3531: ['joltid'], 3532: ['raven-rmp'], 3533: ['raven-rdp'], 3534: ['urld-port'], 3535: ['ms-la'], 3536: ['snac'], 3537: ['ni-visa-remote'], 3538: ['ibm-diradm'], 3539: ['ibm-diradm-ssl'], 3540: ['pnrp-port'], 3541: ['voispeed-port'], 3542: ['hacl-monitor'], 3543: ['qftest-lookup'], 3544: ['teredo'], 3545: ['camac'], 3547: ['symantec-sim'], 3548: ['interworld'], 3549: ['tellumat-nms'], 3550: ['ssmpp'], 3551: ['apcupsd'], 3552: ['taserver'], 3553: ['rbr-discovery'], 3554: ['questnotify'], 3555: ['razor'], 3556: ['sky-transport'], 3557: ['personalos-001'], 3558: ['mcp-port'], 3559: ['cctv-port'], 3560: ['iniserve-port'], 3561: ['bmc-onekey'], 3562: ['sdbproxy'], 3563: ['watcomdebug'], 3564: ['esimport'], 8786: ['msgclnt'], 3567: ['enc-eps'], 3568: ['enc-tunnel-sec'], 3569: ['mbg-ctrl'], 3570: ['mccwebsvr-port'], 3571: ['megardsvr-port'], 3572: ['megaregsvrport'], 3573: ['tag-ups-1'], 3574: ['dmaf-caster'], 3575: ['ccm-port'], 3576: ['cmc-port'], 3577: ['config-port'], 3578: ['data-port'], 3579: ['ttat3lb'], 3580: ['nati-svrloc'], 3581: ['kfxaclicensing'], 3582: ['press'], 3583: ['canex-watch'], 3584: ['u-dbap'], 3585: ['emprise-lls'], 3586: ['emprise-lsc'], 3587: ['p2pgroup'], 3588: ['sentinel'], 3589: ['isomair'], 3590: ['wv-csp-sms'], 3591: ['gtrack-server'], 3592: ['gtrack-ne'], 3593: ['bpmd'], 3594: ['mediaspace'], 3595: ['shareapp'], 3596: ['iw-mmogame'], 3597: ['a14'], 3598: ['a15'], 3599: ['quasar-server'], 3600: ['trap-daemon'], 3601: ['visinet-gui'], 3602: ['infiniswitchcl'], 3603: ['int-rcv-cntrl'], 3604: ['bmc-jmx-port'], 3605: ['comcam-io'], 3606: ['splitlock'], 3607: ['precise-i3'], 3608: ['trendchip-dcp'], 3609: ['cpdi-pidas-cm'], 3610: ['echonet'], 3611: ['six-degrees'], 3612: ['hp-dataprotect'], 3613: ['alaris-disc'], 3614: ['sigma-port'], 3615: ['start-network'], 3616: ['cd3o-protocol'], 3617: ['sharp-server'], 3618: ['aairnet-1'], 3619: ['aairnet-2'], 3620: ['ep-pcp'], 3621: ['ep-nsp'], 3622: ['ff-lr-port'], 3623: ['haipe-discover'], 3624: ['dist-upgrade'], 3625: ['volley'], 3626: ['bvcdaemon-port'], 3627: ['jamserverport'], 3628: ['ept-machine'], 3629: ['escvpnet'], 3630: ['cs-remote-db'], 3631: ['cs-services'], 3632: ['distcc'], 3633: ['wacp'], 3634: ['hlibmgr'], 3635: ['sdo'], 3636: ['servistaitsm'], 3637: ['scservp'], 3638: ['ehp-backup'], 3639: ['xap-ha'], 3640: ['netplay-port1'], 3641: ['netplay-port2'], 3642: ['juxml-port'], 3643: ['audiojuggler'], 3644: ['ssowatch'], 3645: ['cyc'], 3646: ['xss-srv-port'], 3647: ['splitlock-gw'], 3648: ['fjcp'], 3649: ['nmmp'], 3650: ['prismiq-plugin'], 3651: ['xrpc-registry'], 3652: ['vxcrnbuport'], 3653: ['tsp'], 3654: ['vaprtm'], 3655: ['abatemgr'], 3656: ['abatjss'], 3657: ['immedianet-bcn'], 3658: ['ps-ams'], 3659: ['apple-sasl'], 3660: ['can-nds-ssl'], 3661: ['can-ferret-ssl'], 3662: ['pserver'], 3663: ['dtp'], 3664: ['ups-engine'], 3665: ['ent-engine'], 3666: ['eserver-pap'], 3667: ['infoexch'], 3668: ['dell-rm-port'], 3669: ['casanswmgmt'], 3670: ['smile'], 3671: ['efcp'], 3672: ['lispworks-orb'], 3673: ['mediavault-gui'], 3674: ['wininstall-ipc'], 3675: ['calltrax'], 3676: ['va-pacbase'], 3677: ['roverlog'], 3678: ['ipr-dglt'], 3679: ['escale (newton dock)'], 3680: ['npds-tracker'], 3681: ['bts-x73'], 3682: ['cas-mapi'], 3683: ['bmc-ea'], 3684: ['faxstfx-port'], 3685: ['dsx-agent'], 3686: ['tnmpv2'], 3687: ['simple-push'], 3688: ['simple-push-s'], 3689: ['daap'], 3690: ['svn'], 3691: ['magaya-network'], 3692: ['intelsync'], 3695: ['bmc-data-coll'], 3696: ['telnetcpcd'], 3697: ['nw-license'], 3698: ['sagectlpanel'], 3699: ['kpn-icw'], 3700: ['lrs-paging'], 3701: ['netcelera'], 3702: ['ws-discovery'], 3703: ['adobeserver-3'], 3704: ['adobeserver-4'], 3705: ['adobeserver-5'], 3706: ['rt-event'], 3707: ['rt-event-s'], 3708: ['sun-as-iiops'], 3709: ['ca-idms'], 3710: ['portgate-auth'], 3711: ['edb-server2'], 3712: ['sentinel-ent'], 3713: ['tftps'], 3714: ['delos-dms'], 3715: ['anoto-rendezv'], 3716: ['wv-csp-sms-cir'], 3717: ['wv-csp-udp-cir'], 3718: ['opus-services'], 3719: ['itelserverport'], 3720: ['ufastro-instr'], 3721: ['xsync'], 3722: ['xserveraid'], 3723: ['sychrond'], 3724: ['blizwow'], 3725: ['na-er-tip'], 3726: ['array-manager'], 3727: ['e-mdu'], 3728: ['e-woa'], 3729: ['fksp-audit'], 3730: ['client-ctrl'], 3731: ['smap'], 3732: ['m-wnn'], 3733: ['multip-msg'], 3734: ['synel-data'], 3735: ['pwdis'], 3736: ['rs-rmi'], 3738: ['versatalk'], 3739: ['launchbird-lm'], 3740: ['heartbeat'], 3741: ['wysdma'], 3742: ['cst-port'], 3743: ['ipcs-command'], 3744: ['sasg'], 3745: ['gw-call-port'], 3746: ['linktest'], 3747: ['linktest-s'], 3748: ['webdata'], 3749: ['cimtrak'], 3750: ['cbos-ip-port'], 3751: ['gprs-cube'], 3752: ['vipremoteagent'], 3753: ['nattyserver'], 3754: ['timestenbroker'], 3755: ['sas-remote-hlp'], 3756: ['canon-capt'], 3757: ['grf-port'], 3758: ['apw-registry'], 3759: ['exapt-lmgr'], 3760: ['adtempusclient'], 3761: ['gsakmp'], 3762: ['gbs-smp'], 3763: ['xo-wave'], 3764: ['mni-prot-rout'], 3765: ['rtraceroute'], 3767: ['listmgr-port'], 3768: ['rblcheckd'], 3769: ['haipe-otnk'], 3770: ['cindycollab'], 3771: ['paging-port'], 3772: ['ctp'], 3773: ['ctdhercules'], 3774: ['zicom'], 3775: ['ispmmgr'], 3776: ['dvcprov-port'], 3777: ['jibe-eb'], 3778: ['c-h-it-port'], 3779: ['cognima'], 3780: ['nnp'], 3781: ['abcvoice-port'], 3782: ['iso-tp0s'], 3783: ['bim-pem'], 3784: ['bfd-control'], 3785: ['bfd-echo'], 3786: ['upstriggervsw'], 3787: ['fintrx'], 3788: ['isrp-port'], 3789: ['remotedeploy'], 3790: ['quickbooksrds'], 3791: ['tvnetworkvideo'], 3792: ['sitewatch'], 3793: ['dcsoftware'], 3794: ['jaus'], 3795: ['myblast'], 3796: ['spw-dialer'], 3797: ['idps'], 3798: ['minilock'], 3799: ['radius-dynauth'], 3800: ['pwgpsi'], 3801: ['ibm-mgr'], 3802: ['vhd'], 3803: ['soniqsync'], 3804: ['iqnet-port'], 3805: ['tcpdataserver'], 3806: ['wsmlb'], 3807: ['spugna'], 3808: ['sun-as-iiops-ca'], 3809: ['apocd'], 3810: ['wlanauth'], 3811: ['amp'], 3812: ['neto-wol-server'], 3813: ['rap-ip'], 3814: ['neto-dcs'], 3815: ['lansurveyorxml'], 3816: ['sunlps-http'], 3817: ['tapeware'], 3818: ['crinis-hb'], 3819: ['epl-slp'], 3820: ['scp'], 3821: ['pmcp'], 3822: ['acp-discovery'], 3823: ['acp-conduit'], 3824: ['acp-policy'], 3825: ['ffserver'], 3826: ['warmux'], 3827: ['netmpi'], 3828: ['neteh'], 3829: ['neteh-ext'], 3830: ['cernsysmgmtagt'], 3831: ['dvapps'], 3832: ['xxnetserver'], 3833: ['aipn-auth'], 3834: ['spectardata'], 3835: ['spectardb'], 3836: ['markem-dcp'], 3837: ['mkm-discovery'], 3838: ['sos'], 3839: ['amx-rms'], 3840: ['flirtmitmir'], 3841: ['zfirm-shiprush3'], 3842: ['nhci'], 3843: ['quest-agent'], 3844: ['rnm'], 3845: ['v-one-spp'], 3846: ['an-pcp'], 3847: ['msfw-control'], 3848: ['item'], 3849: ['spw-dnspreload'], 3850: ['qtms-bootstrap'], 3851: ['spectraport'], 3852: ['sse-app-config'], 3853: ['sscan'], 3854: ['stryker-com'], 3855: ['opentrac'], 3856: ['informer'], 3857: ['trap-port'], 3858: ['trap-port-mom'], 3859: ['nav-port'], 3860: ['sasp'], 3861: ['winshadow-hd'], 3862: ['giga-pocket'], 3863: ['asap-udp'], 3865: ['xpl'], 3866: ['dzdaemon'], 3867: ['dzoglserver'], 3869: ['ovsam-mgmt'], 3870: ['ovsam-d-agent'], 3871: ['avocent-adsap'], 3872: ['oem-agent'], 3873: ['fagordnc'], 3874: ['sixxsconfig'], 3875: ['pnbscada'], 3876: ['dl-agent'], 3877: ['xmpcr-interface'], 3878: ['fotogcad'], 3879: ['appss-lm'], 3880: ['igrs'], 3881: ['idac'], 3882: ['msdts1'], 3883: ['vrpn'], 3884: ['softrack-meter'], 3885: ['topflow-ssl'], 3886: ['nei-management'], 3887: ['ciphire-data'], 3888: ['ciphire-serv'], 3889: ['dandv-tester'], 3890: ['ndsconnect'], 3891: ['rtc-pm-port'], 3892: ['pcc-image-port'], 3893: ['cgi-starapi'], 3894: ['syam-agent'], 3895: ['syam-smc'], 3896: ['sdo-tls'], 3897: ['sdo-ssh'], 3898: ['senip'], 3899: ['itv-control'], 3900: ['udt-os'], 3901: ['nimsh'], 3902: ['nimaux'], 3903: ['charsetmgr'], 3904: ['omnilink-port'], 3905: ['mupdate'], 3906: ['topovista-data'], 3907: ['imoguia-port'], 3908: ['hppronetman'], 3909: ['surfcontrolcpa'], 3910: ['prnrequest'], 3911: ['prnstatus'], 3912: ['gbmt-stars'], 3913: ['listcrt-port'], 3914: ['listcrt-port-2'], 3915: ['agcat'], 3916: ['wysdmc'], 3917: ['aftmux'], 3918: ['pktcablemmcops'], 3919: ['hyperip'], 3920: ['exasoftport1'], 3921: ['herodotus-net'], 3922: ['sor-update'], 3923: ['symb-sb-port'], 3924: ['mpl-gprs-port'], 3925: ['zmp'], 3926: ['winport'], 3927: ['natdataservice'], 3928: ['netboot-pxe'], 3929: ['smauth-port'], 3930: ['syam-webserver'], 3931: ['msr-plugin-port'], 3932: ['dyn-site'], 3933: ['plbserve-port'], 3934: ['sunfm-port'], 3935: ['sdp-portmapper'], 3936: ['mailprox'], 3937: ['dvbservdsc'], 3938: ['dbcontrol-agent'], 3939: ['aamp'], 3940: ['xecp-node'], 3941: ['homeportal-web'], 3942: ['srdp'], 3943: ['tig'], 3944: ['sops'], 3945: ['emcads'], 3946: ['backupedge'], 3947: ['ccp'], 3948: ['apdap'], 3949: ['drip'], 3950: ['namemunge'], 3951: ['pwgippfax'], 3952: ['i3-sessionmgr'], 3953: ['xmlink-connect'], 3954: ['adrep'], 3955: ['p2pcommunity'], 3956: ['gvcp'], 3957: ['mqe-broker'], 3958: ['mqe-agent'], 3959: ['treehopper'], 3960: ['bess'], 3961: ['proaxess'], 3962: ['sbi-agent'], 3963: ['thrp'], 3964: ['sasggprs'], 3965: ['ati-ip-to-ncpe'], 3966: ['bflckmgr'], 3967: ['ppsms'], 3968: ['ianywhere-dbns'], 3969: ['landmarks'], 3970: ['lanrevagent'], 3971: ['lanrevserver'], 3972: ['iconp'], 3973: ['progistics'], 3974: ['citysearch'], 3975: ['airshot'], 3976: ['opswagent'], 3977: ['opswmanager'], 3978: ['secure-cfg-svr'], 3979: ['smwan'], 3980: ['acms'], 3981: ['starfish'], 3982: ['eis'], 3983: ['eisp'], 3984: ['mapper-nodemgr'], 3985: ['mapper-mapethd'], 3986: ['mapper-ws-ethd'], 3987: ['centerline'], 3988: ['dcs-config'], 3989: ['bv-queryengine'], 3990: ['bv-is'], 3991: ['bv-smcsrv'], 3992: ['bv-ds'], 3993: ['bv-agent'], 3995: ['iss-mgmt-ssl'], 3996: ['abcsoftware'], 3997: ['agentsease-db'], 3998: ['dnx'], 3999: ['nvcnet'], 4000: ['terabase'], 4001: ['newoak'], 4002: ['pxc-spvr-ft'], 4003: ['pxc-splr-ft'], 4004: ['pxc-roid'], 4005: ['pxc-pin'], 4006: ['pxc-spvr'], 4007: ['pxc-splr'], 4008: ['netcheque'], 4009: ['chimera-hwm'], 4010: ['samsung-unidex'], 4011: ['altserviceboot'], 4012: ['pda-gate'], 4013: ['acl-manager'], 4014: ['taiclock'], 4015: ['talarian-mcast1'], 4016: ['talarian-mcast2'], 4017: ['talarian-mcast3'], 4018: ['talarian-mcast4'], 4019: ['talarian-mcast5'], 4020: ['trap'], 4021: ['nexus-portal'], 4022: ['dnox'], 4023: ['esnm-zoning'], 4024: ['tnp1-port'], 4025: ['partimage'], 4026: ['as-debug'], 4027: ['bxp'], 4028: ['dtserver-port'], 4029: ['ip-qsig'], 4030: ['jdmn-port'], 4031: ['suucp'], 4032: ['vrts-auth-port'], 4033: ['sanavigator'], 4034: ['ubxd'], 4035: ['wap-push-http'], 4036: ['wap-push-https'], 4037: ['ravehd'], 4038: ['fazzt-ptp'], 4039: ['fazzt-admin'], 4040: ['yo-main'], 4041: ['houston'], 4042: ['ldxp'], 4043: ['nirp'], 4044: ['ltp'], 4045: ['npp'], 4046: ['acp-proto'], 4047: ['ctp-state'], 4049: ['wafs'], 4050: ['cisco-wafs'], 4051: ['cppdp'], 4052: ['interact'], 4053: ['ccu-comm-1'], 4054: ['ccu-comm-2'], 4055: ['ccu-comm-3'], 4056: ['lms'], 4057: ['wfm'], 4058: ['kingfisher'], 4059: ['dlms-cosem'], 4060: ['dsmeter-iatc'], 4061: ['ice-location'], 4062: ['ice-slocation'], 4063: ['ice-router'], 4064: ['ice-srouter'], 4065: ['avanti-cdp'], 4066: ['pmas'], 4067: ['idp'], 4068: ['ipfltbcst'], 4069: ['minger'], 4070: ['tripe'], 4071: ['aibkup'], 4072: ['zieto-sock'], 4073: ['irapp'], 4074: ['cequint-cityid'], 4075: ['perimlan'], 4076: ['seraph'], 4077: ['ascomalarm'], 4079: ['santools'], 4080: ['lorica-in'], 4081: ['lorica-in-sec'], 4082: ['lorica-out'], 4083: ['lorica-out-sec'], 4084: ['fortisphere-vm'], 9956: ['alljoyn'], 4086: ['ftsync'], 8873: ['dxspider'], 4089: ['opencore'], 4090: ['omasgport'], 4091: ['ewinstaller'], 4092: ['ewdgs'], 4093: ['pvxpluscs'], 4094: ['sysrqd'], 4095: ['xtgui'], 4096: ['bre'], 4097: ['patrolview'], 4098: ['drmsfsd'], 4099: ['dpcp'], 4100: ['igo-incognito'], 4101: ['brlp-0'], 4102: ['brlp-1'], 4103: ['brlp-2'], 4104: ['brlp-3'], 4105: ['shofar'], 4106: ['synchronite'], 4107: ['j-ac'], 4108: ['accel'], 4109: ['izm'], 4110: ['g2tag'], 4111: ['xgrid'], 4112: ['apple-vpns-rp'], 4113: ['aipn-reg'], 4114: ['jomamqmonitor'], 4115: ['cds'], 4116: ['smartcard-tls'], 4117: ['hillrserv'], 4118: ['netscript'], 4119: ['assuria-slm'], 4121: ['e-builder'], 4122: ['fprams'], 4123: ['z-wave'], 4124: ['tigv2'], 4125: ['opsview-envoy'], 4126: ['ddrepl'], 4127: ['unikeypro'], 4128: ['nufw'], 4129: ['nuauth'], 4130: ['fronet'], 4131: ['stars'], 4132: ['nuts-dem'], 4133: ['nuts-bootp'], 4134: ['nifty-hmi'], 4135: ['cl-db-attach'], 4136: ['cl-db-request'], 4137: ['cl-db-remote'], 4138: ['nettest'], 4139: ['thrtx'], 4140: ['cedros-fds'], 4141: ['oirtgsvc'], 4142: ['oidocsvc'], 4143: ['oidsr'], 4145: ['vvr-control'], 4146: ['tgcconnect'], 4147: ['vrxpservman'], 4148: ['hhb-handheld'], 4149: ['agslb'], 4150: ['poweralert-nsa'], 4151: ['menandmice-noh'], 4152: ['idig-mux'], 4153: ['mbl-battd'], 4154: ['atlinks'], 4155: ['bzr'], 4156: ['stat-results'], 4157: ['stat-scanner'], 4158: ['stat-cc'], 4159: ['nss'], 4160: ['jini-discovery'], 4161: ['omscontact'], 4162: ['omstopology'], 4163: ['silverpeakpeer'], 4164: ['silverpeakcomm'], 4165: ['altcp'], 4166: ['joost'], 4167: ['ddgn'], 4168: ['pslicser'], 4169: ['iadt-disc'], 4172: ['pcoip'], 4173: ['mma-discovery'], 4174: ['sm-disc'], 44600: ['asihpi'], 4177: ['wello'], 4178: ['storman'], 4179: ['maxumsp'], 4180: ['httpx'], 4181: ['macbak'], 4182: ['pcptcpservice'], 4183: ['gmmp'], 4184: ['universe-suite'], 4185: ['wcpp'], 4188: ['vatata'], 8890: ['ddi-udp-3'], 4191: ['dsmipv6'], 4192: ['azeti-bd'], 8891: ['ddi-udp-4'], 4199: ['eims-admin'], 8892: ['ddi-udp-5'], 8893: ['ddi-udp-6'], 8894: ['ddi-udp-7'], 10260: ['axis-wimp-port'], 26487: ['exoconfig'], 16995: ['amt-redir-tls'], 8899: ['ospf-lite'], 8901: ['jmb-cds2'], 10000: ['ndmp'], 9903: ['multicast-ping'], 20670: ['track'], 4300: ['corelccam'], 4301: ['d-data'], 4302: ['d-data-control'], 4303: ['srcp'], 4304: ['owserver'], 4305: ['batman'], 4306: ['pinghgl'], 4307: ['visicron-vs'], 4308: ['compx-lockview'], 4309: ['dserver'], 4310: ['mirrtex'], 28240: ['siemensgsm'], 8800: ['sunwebadmin'], 4320: ['fdt-rcatp'], 4321: ['rwhois'], 4322: ['trim-event'], 4323: ['trim-ice'], 4324: ['balour'], 4325: ['geognosisman'], 4326: ['geognosis'], 4327: ['jaxer-web'], 4328: ['jaxer-manager'], 15740: ['ptp'], 4340: ['gaia'], 4341: ['lisp-data'], 4342: ['lisp-control'], 4343: ['unicall'], 4344: ['vinainstall'], 4345: ['m4-network-as'], 4346: ['elanlm'], 4347: ['lansurveyor'], 4348: ['itose'], 4349: ['fsportmap'], 4350: ['net-device'], 4351: ['plcy-net-svcs'], 4352: ['pjlink'], 4353: ['f5-iquery'], 4354: ['qsnet-trans'], 4355: ['qsnet-workst'], 4356: ['qsnet-assist'], 4357: ['qsnet-cond'], 4358: ['qsnet-nucl'], 4359: ['omabcastltkm'], 4361: ['nacnl'], 4362: ['afore-vdp-disc'], 16994: ['amt-redir-tcp'], 4368: ['wxbrief'], 4369: ['epmd'], 4370: ['elpro-tunnel'], 4371: ['l2c-disc'], 4372: ['l2c-data'], 4373: ['remctl'], 4375: ['tolteces'], 4376: ['bip'], 4377: ['cp-spxsvr'], 4378: ['cp-spxdpy'], 4379: ['ctdb'], 9966: ['odnsp'], 4389: ['xandros-cms'], 4390: ['wiegand'], 8320: ['tnp-discover'], 4394: ['apwi-disc'], 4395: ['omnivisionesx'], 4400: ['ds-srv'], 4401: ['ds-srvr'], 4402: ['ds-clnt'], 4403: ['ds-user'], 4404: ['ds-admin'], 4405: ['ds-mail'], 4406: ['ds-slp'], 4425: ['netrockey6'], 4426: ['beacon-port-2'], 4430: ['rsqlserver'], 4432: ['l-acoustics'], 24676: ['canditv'], 4441: ['netblox'], 4442: ['saris'], 4443: ['pharos'], 4444: ['krb524', 'nv-video'], 4445: ['upnotifyp'], 4446: ['n1-fwp'], 4447: ['n1-rmgmt'], 4448: ['asc-slmd'], 4449: ['privatewire'], 4450: ['camp'], 4451: ['ctisystemmsg'], 4452: ['ctiprogramload'], 4453: ['nssalertmgr'], 4454: ['nssagentmgr'], 4455: ['prchat-user'], 4456: ['prchat-server'], 4457: ['prregister'], 4458: ['mcp'], 10107: ['bctp-server'], 4484: ['hpssmgmt'], 4486: ['icms'], 13819: ['dsmcc-session'], 4488: ['awacs-ice'], 45966: ['ssr-servermgr'], 4500: ['ipsec-nat-t'], 25003: ['icl-twobase4'], 16950: ['sgcip'], 4534: ['armagetronad'], 4535: ['ehs'], 4536: ['ehs-ssl'], 4537: ['wssauthsvc'], 4538: ['swx-gate'], 8880: ['cddbp-alt'], 4545: ['worldscores'], 4546: ['sf-lm'], 4547: ['lanner-lm'], 4548: ['synchromesh'], 4549: ['aegate'], 4550: ['gds-adppiw-db'], 4551: ['ieee-mih'], 4552: ['menandmice-mon'], 9632: ['mc-comm'], 4554: ['msfrs'], 4555: ['rsip'], 4556: ['dtn-bundle-udp'], 4557: ['mtcevrunqss'], 4558: ['mtcevrunqman'], 4559: ['hylafax'], 12753: ['tsaf'], 9878: ['kca-service'], 14414: ['ca-web-update'], 4566: ['kwtc'], 4567: ['tram'], 4568: ['bmc-reporting'], 4569: ['iax'], 8954: ['cumulus-admin'], 18634: ['rds-ib'], 4591: ['l3t-at-an'], 4592: ['hrpd-ith-at-an'], 4593: ['ipt-anri-anri'], 4594: ['ias-session'], 4595: ['ias-paging'], 4596: ['ias-neighbor'], 4597: ['a21-an-1xbs'], 4598: ['a16-an-an'], 4599: ['a17-an-an'], 4600: ['piranha1'], 4601: ['piranha2'], 20999: ['athand-mmp'], 21000: ['irtrans'], 8732: ['dtp-net'], 8610: ['canon-mfnp'], 8883: ['secure-mqtt'], 12300: ['linogridengine'], 16992: ['amt-soap-http'], 33434: ['traceroute'], 8611: ['canon-bjnp1'], 4658: ['playsta2-app'], 4659: ['playsta2-lob'], 4660: ['smaclmgr'], 4661: ['kar2ouche'], 4662: ['oms'], 4663: ['noteit'], 4664: ['ems'], 4665: ['contclientms'], 4666: ['eportcomm'], 4667: ['mmacomm'], 4668: ['mmaeds'], 4669: ['eportcommdata'], 4670: ['light'], 4671: ['acter'], 4672: ['rfa'], 4673: ['cxws'], 4674: ['appiq-mgmt'], 4675: ['dhct-status'], 4676: ['dhct-alerts'], 4677: ['bcs'], 4678: ['traversal'], 4679: ['mgesupervision'], 4680: ['mgemanagement'], 4681: ['parliant'], 4682: ['finisar'], 4683: ['spike'], 4684: ['rfid-rp1'], 4685: ['autopac'], 4686: ['msp-os'], 4687: ['nst'], 4688: ['mobile-p2p'], 4689: ['altovacentral'], 4690: ['prelude'], 4691: ['mtn'], 4692: ['conspiracy'], 33123: ['aurora-balaena'], 23272: ['s102'], 4700: ['netxms-agent'], 4701: ['netxms-mgmt'], 4702: ['netxms-sync'], 37475: ['neckar'], 8613: ['canon-bjnp3'], 11201: ['smsqp'], 45678: ['eba'], 26000: ['quake'], 4725: ['truckstar'], 4726: ['a26-fap-fgw'], 4727: ['fcis-disc'], 4728: ['capmux'], 4729: ['gsmtap'], 4730: ['gearman'], 4732: ['ohmtrigger'], 4737: ['ipdr-sp'], 4738: ['solera-lpn'], 4739: ['ipfix'], 4740: ['ipfixs'], 4741: ['lumimgrd'], 4742: ['sicct-sdp'], 4743: ['openhpid'], 4744: ['ifsp'], 4745: ['fmp'], 4747: ['buschtrommel'], 19999: ['dnp-sec'], 4749: ['profilemac'], 4750: ['ssad'], 4751: ['spocp'], 4752: ['snap'], 4753: ['simon-disc'], 13821: ['dsmcc-download'], 24006: ['med-net-svc'], 8888: ['ddi-udp-1'], 10252: ['apollo-relay'], 4784: ['bfd-multi-ctl'], 4785: ['cncp'], 4789: ['vxlan'], 4800: ['iims'], 4801: ['iwec'], 4802: ['ilss'], 4803: ['notateit-disc'], 4804: ['aja-ntv4-disc'], 17185: ['soundsvirtual'], 8889: ['ddi-udp-2'], 4827: ['htcp'], 4837: ['varadero-0'], 4838: ['varadero-1'], 4839: ['varadero-2'], 4840: ['opcua-udp'], 4841: ['quosa'], 4842: ['gw-asv'], 4843: ['opcua-tls'], 4844: ['gw-log'], 4845: ['wcr-remlib'], 4846: ['contamac-icm'], 4847: ['wfc'], 4848: ['appserv-http'], 4849: ['appserv-https'], 4850: ['sun-as-nodeagt'], 4851: ['derby-repli'], 13929: ['dta-systems'], 9002: ['dynamid'], 45825: ['qdb2service'], 4867: ['unify-debug'], 4868: ['phrelay'], 4869: ['phrelaydbg'], 4870: ['cc-tracking'], 4871: ['wired'], 32896: ['idmgratm'], 28119: ['a27-ran-ran'], 4876: ['tritium-can'], 4877: ['lmcs'], 4878: ['inst-discovery'], 10001: ['scp-config'], 4881: ['socp-t'], 4882: ['socp-c'], 4884: ['hivestor'], 4885: ['abbs'], 37654: ['unisys-eportal'], 4894: ['lyskom'], 4899: ['radmin-port'], 4900: ['hfcs'], 20000: ['dnp'], 4914: ['bones'], 10110: ['nmea-0183'], 9950: ['apc-9950'], 25004: ['icl-twobase5'], 4937: ['atsc-mh-ssc'], 4940: ['eq-office-4940'], 4941: ['eq-office-4941'], 4942: ['eq-office-4942'], 15363: ['3link'], 10115: ['netiq-endpt'], 4949: ['munin'], 4950: ['sybasesrvmon'], 4951: ['pwgwims'], 4952: ['sagxtsds'], 41794: ['crestron-cip'], 43440: ['ew-disc-cmd'], 13160: ['i-zipqd'], 4969: ['ccss-qmm'], 4970: ['ccss-qsm'], 11751: ['intrepid-ssl'], 34962: ['profinet-rt'], 9021: ['panagolin-ident'], 12168: ['cawas'], 9022: ['paragent'], 4986: ['mrip'], 4987: ['smar-se-port1'], 4988: ['smar-se-port2'], 4989: ['parallel'], 4990: ['busycal'], 4991: ['vrt'], 9024: ['swa-2'], 8472: ['otv'], 4999: ['hfcs-manager'], 5000: ['commplex-main'], 5001: ['commplex-link'], 5002: ['rfe'], 5003: ['fmpro-internal'], 5004: ['avt-profile-1'], 5005: ['avt-profile-2'], 5006: ['wsm-server'], 5007: ['wsm-server-ssl'], 5008: ['synapsis-edge'], 5009: ['winfs'], 5010: ['telelpathstart'], 5011: ['telelpathattack'], 5012: ['nsp'], 5013: ['fmpro-v6'], 5014: ['onpsocket'], 9987: ['dsm-scm-target'], 5020: ['zenginkyo-1'], 5021: ['zenginkyo-2'], 5022: ['mice'], 5023: ['htuilsrv'], 5024: ['scpi-telnet'], 5025: ['scpi-raw'], 5026: ['strexec-d'], 5027: ['strexec-s'], 5029: ['infobright'], 5030: ['surfpass'], 5031: ['dmp'], 13224: ['powwow-server'], 5042: ['asnaacceler8db'], 5043: ['swxadmin'], 5044: ['lxi-evntsvc'], 5046: ['vpm-udp'], 5047: ['iscape'], 5049: ['ivocalize'], 5050: ['mmcc'], 5051: ['ita-agent'], 5052: ['ita-manager'], 5053: ['rlm-disc'], 5055: ['unot'], 5056: ['intecom-ps1'], 5057: ['intecom-ps2'], 5058: ['locus-disc'], 5059: ['sds'], 5060: ['sip'], 5061: ['sip-tls'], 5062: ['na-localise'], 5064: ['ca-1'], 5065: ['ca-2'], 5066: ['stanag-5066'], 5067: ['authentx'], 5069: ['i-net-2000-npr'], 5070: ['vtsas'], 5071: ['powerschool'], 5072: ['ayiya'], 5073: ['tag-pm'], 5074: ['alesquery'], 5079: ['cp-spxrpts'], 5080: ['onscreen'], 5081: ['sdl-ets'], 5082: ['qcp'], 5083: ['qfp'], 5084: ['llrp'], 5085: ['encrypted-llrp'], 5092: ['magpie'], 5093: ['sentinel-lm'], 5094: ['hart-ip'], 5099: ['sentlm-srv2srv'], 5100: ['socalia'], 5101: ['talarian-udp'], 5102: ['oms-nonsecure'], 5104: ['tinymessage'], 5105: ['hughes-ap'], 9888: ['cyborg-systems'], 5111: ['taep-as-svc'], 5112: ['pm-cmdsvr'], 5116: ['emb-proj-cmd'], 5120: ['barracuda-bbs'], 44544: ['domiq'], 5133: ['nbt-pc'], 8763: ['mc-appserver'], 5136: ['minotaur-sa'], 5137: ['ctsd'], 8321: ['tnp'], 5145: ['rmonitor-secure'], 11600: ['tempest-port'], 5150: ['atmp'], 5151: ['esri-sde'], 5152: ['sde-discovery'], 5154: ['bzflag'], 5155: ['asctrl-agent'], 5164: ['vpa-disc'], 5165: ['ife-icorp'], 5166: ['winpcs'], 5167: ['scte104'], 5168: ['scte30'], 21554: ['dfserver'], 44553: ['rbr-debug'], 43188: ['reachout'], 9909: ['domaintime'], 19540: ['sxuptp'], 24677: ['flashfiler'], 5190: ['aol'], 5191: ['aol-1'], 5192: ['aol-2'], 5193: ['aol-3'], 9993: ['palace-2'], 5200: ['targus-getdata'], 5201: ['targus-getdata1'], 5202: ['targus-getdata2'], 5203: ['targus-getdata3'], 43000: ['recvr-rc-disc'], 21590: ['vofr-gateway'], 35001: ['rt-viewer'], 13400: ['doip-disc'], 19541: ['jcp'], 11001: ['metasys'], 5223: ['hpvirtgrp'], 5224: ['hpvirtctrl'], 5225: ['hp-server'], 5226: ['hp-status'], 5227: ['perfd'], 39681: ['turbonote-1'], 5234: ['eenet'], 5235: ['galaxy-network'], 5236: ['padl2sim'], 5237: ['mnet-discovery'], 11796: ['lanschool-mpt'], 10009: ['swdtp-sv'], 5245: ['downtools-disc'], 5246: ['capwap-control'], 5247: ['capwap-data'], 5248: ['caacws'], 5249: ['caaclang2'], 5250: ['soagateway'], 5251: ['caevms'], 5252: ['movaz-ssc'], 9995: ['palace-4'], 32636: ['dmexpress'], 8612: ['canon-bjnp2'], 5264: ['3com-njack-1'], 5265: ['3com-njack-2'], 27999: ['tw-auth-key'], 5270: ['cartographerxmp'], 5271: ['cuelink-disc'], 5272: ['pk'], 9450: ['sntlkeyssrvr'], 5282: ['transmit-port'], 8764: ['openqueue'], 9996: ['palace-5'], 43189: ['ndm-agent-port'], 28000: ['nxlmd'], 5298: ['presence'], 5299: ['nlg-data'], 5300: ['hacl-hb'], 5301: ['hacl-gs'], 5302: ['hacl-cfg'], 5303: ['hacl-probe'], 5304: ['hacl-local'], 5305: ['hacl-test'], 5306: ['sun-mc-grp'], 5307: ['sco-aip'], 5308: ['cfengine'], 5309: ['jprinter'], 5310: ['outlaws'], 5312: ['permabit-cs'], 5313: ['rrdp'], 5314: ['opalis-rbt-ipc'], 5315: ['hacl-poll'], 9997: ['palace-6'], 20001: ['microsan'], 20002: ['commtact-http'], 9080: ['glrpc'], 20003: ['commtact-https'], 18181: ['opsec-cvp'], 32769: ['filenet-rpc'], 5343: ['kfserver'], 5344: ['xkotodrcp'], 25001: ['icl-twobase2'], 9998: ['distinct32'], 5349: ['stun-behaviors', 'stuns', 'turns'], 5350: ['pcp-multicast'], 5351: ['pcp'], 5352: ['dns-llq'], 5353: ['mdns'], 5354: ['mdnsresponder'], 5355: ['llmnr'], 5356: ['ms-smlbiz'], 5357: ['wsdapi'], 5358: ['wsdapi-s'], 5359: ['ms-alerter'], 5360: ['ms-sideshow'], 5361: ['ms-s-sideshow'], 5362: ['serverwsd2'], 5363: ['net-projection'], 5364: ['kdnet'], 25002: ['icl-twobase3'], 9999: ['distinct'], 20012: ['ss-idi-disc'], 9092: ['xmlipcregsvc'], 18183: ['opsec-sam'], 25005: ['icl-twobase6'], 5397: ['stresstester'], 5398: ['elektron-admin'], 5399: ['securitychase'], 5400: ['excerpt'], 5401: ['excerpts'], 5402: ['mftp'], 5403: ['hpoms-ci-lstn'], 5404: ['hpoms-dps-lstn'], 5405: ['netsupport'], 5406: ['systemics-sox'], 5407: ['foresyte-clear'], 5408: ['foresyte-sec'], 5409: ['salient-dtasrv'], 5410: ['salient-usrmgr'], 5411: ['actnet'], 5412: ['continuus'], 5413: ['wwiotalk'], 5414: ['statusd'], 5415: ['ns-server'], 5416: ['sns-gateway'], 5417: ['sns-agent'], 5418: ['mcntp'], 5419: ['dj-ice'], 5420: ['cylink-c'], 5421: ['netsupport2'], 5422: ['salient-mux'], 5423: ['virtualuser'], 5424: ['beyond-remote'], 5425: ['br-channel'], 5426: ['devbasic'], 5427: ['sco-peer-tta'], 5428: ['telaconsole'], 5429: ['base'], 5430: ['radec-corp'], 5431: ['park-agent'], 5432: ['postgresql'], 5433: ['pyrrho'], 5434: ['sgi-arrayd'], 5435: ['sceanics'], 5436: ['pmip6-cntl'], 5437: ['pmip6-data'], 5443: ['spss'], 43190: ['ip-provision'], 18185: ['opsec-omi'], 5453: ['surebox'], 5454: ['apc-5454'], 5455: ['apc-5455'], 5456: ['apc-5456'], 8376: ['cruise-enum'], 5461: ['silkmeter'], 5462: ['ttl-publisher'], 5463: ['ttlpriceproxy'], 5464: ['quailnet'], 5465: ['netops-broker'], 10002: ['documentum'], 9103: ['bacula-sd'], 9104: ['peerwire'], 10100: ['itap-ddtp'], 9105: ['xadmin'], 18186: ['ohsc'], 9911: ['sype-transport'], 47100: ['jvl-mactalk'], 8787: ['msgsrvr'], 25006: ['icl-twobase7'], 10003: ['documentum-s'], 13822: ['dsmcc-ccp'], 11367: ['atm-uhas'], 5500: ['fcp-addr-srvr1'], 5501: ['fcp-addr-srvr2'], 5502: ['fcp-srvr-inst1'], 5503: ['fcp-srvr-inst2'], 5504: ['fcp-cics-gw1'], 5505: ['checkoutdb'], 5506: ['amc'], 8567: ['enc-tunnel'], 18187: ['opsec-ela'], 20034: ['nburn-id'], 25007: ['icl-twobase8'], 13720: ['bprd'], 13721: ['bpdbm'], 13722: ['bpjava-msvc'], 13724: ['vnetd'], 5553: ['sgi-eventmond'], 5554: ['sgi-esphttp'], 5555: ['personal-agent'], 5556: ['freeciv'], 5567: ['enc-eps-mc-sec'], 5568: ['sdt'], 5569: ['rdmnet-device'], 9991: ['osm-oev'], 5573: ['sdmmp'], 13217: ['rs-pias'], 5580: ['tmosms0'], 5581: ['tmosms1'], 5582: ['fac-restore'], 5583: ['tmo-icon-sync'], 5584: ['bis-web'], 5585: ['bis-sync'], 10116: ['netiq-voipa'], 20046: ['tmophl7mts'], 13782: ['bpcd'], 13783: ['vopied'], 13785: ['nbdb'], 13786: ['nomdb'], 5597: ['ininmessaging'], 5598: ['mctfeed'], 5599: ['esinstall'], 5600: ['esmmanager'], 5601: ['esmagent'], 5602: ['a1-msc'], 5603: ['a1-bs'], 5604: ['a3-sdunode'], 5605: ['a4-sdunode'], 20049: ['nfsrdma'], 18463: ['ac-cluster'], 13223: ['powwow-client'], 10161: ['snmpdtls'], 10007: ['mvs-capacity'], 22001: ['optocontrol'], 22002: ['optohost002'], 11371: ['hkp'], 22004: ['optohost004'], 22005: ['optohost004'], 13818: ['dsmcc-config'], 5627: ['ninaf'], 5628: ['htrust'], 5629: ['symantec-sfdb'], 5630: ['precise-comm'], 5631: ['pcanywheredata'], 5632: ['pcanywherestat'], 5633: ['beorl'], 5634: ['xprtld'], 10008: ['octopus'], 20005: ['openwebnet'], 10500: ['hip-nat-t'], 19283: ['keysrvr'], 22305: ['cis'], 5670: ['zre-disc'], 5671: ['amqps'], 5672: ['amqp'], 5673: ['jms'], 5674: ['hyperscsi-port'], 5675: ['v5ua'], 5676: ['raadmin'], 5677: ['questdb2-lnchr'], 5678: ['rrac'], 5679: ['dccm'], 5680: ['auriga-router'], 5681: ['ncxcp'], 5682: ['brightcore'], 5683: ['coap'], 5684: ['coaps'], 5688: ['ggz'], 5689: ['qmvideo'], 13894: ['ucontrol'], 5713: ['proshareaudio'], 5714: ['prosharevideo'], 5715: ['prosharedata'], 5716: ['prosharerequest'], 5717: ['prosharenotify'], 5718: ['dpm'], 5719: ['dpm-agent'], 5720: ['ms-licensing'], 5721: ['dtpt'], 5722: ['msdfsr'], 5723: ['omhs'], 5724: ['omsdk'], 11877: ['x2e-disc'], 5728: ['io-dist-group'], 5729: ['openmail'], 5730: ['unieng'], 8276: ['pando-sec'], 5741: ['ida-discover1'], 5742: ['ida-discover2'], 5743: ['watchdoc-pod'], 5744: ['watchdoc'], 5745: ['fcopy-server'], 5746: ['fcopys-server'], 5747: ['tunatic'], 5748: ['tunalyzer'], 5750: ['rscd'], 8300: ['tmi'], 5755: ['openmailg'], 5757: ['x500ms'], 5766: ['openmailns'], 5767: ['s-openmail'], 5768: ['openmailpxy'], 5769: ['spramsca'], 5770: ['spramsd'], 5771: ['netagent'], 5777: ['dali-port'], 19539: ['fxuptp'], 5781: ['3par-evts'], 5782: ['3par-mgmt'], 5783: ['3par-mgmt-ssl'], 5784: ['ibar'], 5785: ['3par-rcopy'], 5786: ['cisco-redu'], 5787: ['waascluster'], 5793: ['xtreamx'], 5794: ['spdp'], 14000: ['scotty-ft'], 14001: ['sua'], 14002: ['scotty-disc'], 5813: ['icmpd'], 5814: ['spt-automation'], 8377: ['cruise-swroute'], 14033: ['sage-best-com1'], 14034: ['sage-best-com2'], 8378: ['cruise-config'], 11106: ['sgi-lk'], 5859: ['wherehoo'], 5863: ['ppsuitemsg'], 8379: ['cruise-diags'], 22273: ['wnn6'], 10540: ['mos-lower'], 5900: ['rfb'], 10541: ['mos-upper'], 9900: ['iua'], 8380: ['cruise-update'], 10542: ['mos-aux'], 5910: ['cm'], 5911: ['cpdlc'], 5912: ['fis'], 5913: ['ads-c'], 10543: ['mos-soap'], 10544: ['mos-soap-opt'], 47000: ['mbus'], 32773: ['filenet-cm'], 24678: ['proactivate'], 14141: ['vcs-app'], 14142: ['icpp'], 14145: ['gcm-app'], 14149: ['vrts-tdd'], 22343: ['cis-secure'], 14154: ['vad'], 5963: ['indy'], 40843: ['csccfirewall'], 22350: ['codemeter'], 5968: ['mppolicy-v5'], 5969: ['mppolicy-mgr'], 8201: ['trivnet2'], 36865: ['kastenxpipe'], 22763: ['talikaserver'], 5984: ['couchdb'], 5985: ['wsman'], 5986: ['wsmans'], 5987: ['wbem-rmi'], 5988: ['wbem-http'], 5989: ['wbem-https'], 5990: ['wbem-exp-https'], 5991: ['nuxsl'], 5992: ['consul-insight'], 9191: ['sun-as-jpda'], 8383: ['m2mservices'], 5999: ['cvsup'], 9747: ['l5nas-parchan'], 11111: ['vce'], 25954: ['bf-game'], 17756: ['zigbee-ips'], 32770: ['filenet-nch'], 9202: ['wap-wsp-s'], 11112: ['dicom'], 17754: ['zep'], 46999: ['mediabox'], 17007: ['isode-dua'], 16991: ['intel-rci-mp'], 26208: ['wnn6-ds'], 14250: ['cps'], 9025: ['swa-3'], 6064: ['ndl-ahp-svc'], 6065: ['winpharaoh'], 6066: ['ewctsp'], 6069: ['trip'], 6070: ['messageasap'], 6071: ['ssdtp'], 6072: ['diagnose-proc'], 6073: ['directplay8'], 6074: ['max'], 6082: ['p25cai'], 6083: ['miami-bcast'], 6085: ['konspire2b'], 6086: ['pdtp'], 6087: ['ldss'], 6088: ['doglms-notify'], 9750: ['board-voip'], 6100: ['synchronet-db'], 6101: ['synchronet-rtc'], 6102: ['synchronet-upd'], 6103: ['rets'], 6104: ['dbdb'], 6105: ['primaserver'], 6106: ['mpsserver'], 6107: ['etc-control'], 6108: ['sercomm-scadmin'], 6109: ['globecast-id'], 6110: ['softcm'], 6111: ['spc'], 6112: ['dtspcd'], 6118: ['tipc'], 18769: ['ique'], 6122: ['bex-webadmin'], 6123: ['backup-express'], 6124: ['pnbs'], 9213: ['serverstart'], 6133: ['nbt-wol'], 6140: ['pulsonixnls'], 6141: ['meta-corp'], 6142: ['aspentec-lm'], 6143: ['watershed-lm'], 6144: ['statsci1-lm'], 6145: ['statsci2-lm'], 6146: ['lonewolf-lm'], 6147: ['montage-lm'], 6148: ['ricardo-lm'], 6149: ['tal-pod'], 9217: ['fsc-port'], 6160: ['ecmp-data'], 6161: ['patrol-ism'], 6162: ['patrol-coll'], 6163: ['pscribe'], 22555: ['vocaltec-phone'], 9668: ['tec5-sdctp'], 10162: ['snmpdtls-trap'], 9753: ['rasadv'], 8770: ['dpap'], 6200: ['lm-x'], 6201: ['thermo-calc'], 20048: ['mountd'], 6222: ['radmind'], 33331: ['diamondport'], 10101: ['ezmeeting-2'], 25955: ['bf-master'], 32775: ['filenet-pch'], 16993: ['amt-soap-https'], 12006: ['dbisamserver2'], 6241: ['jeol-nsddp-1'], 6242: ['jeol-nsddp-2'], 6243: ['jeol-nsddp-3'], 6244: ['jeol-nsddp-4'], 6251: ['tl1-raw-ssl'], 6252: ['tl1-ssh'], 6253: ['crip'], 30832: ['samsung-disc'], 11967: ['sysinfo-sp'], 6268: ['grid'], 6269: ['grid-alt'], 10114: ['netiq-qcheck'], 27504: ['kopek-httphead'], 6300: ['bmc-grx'], 6301: ['bmc-ctd-ldap'], 19191: ['opsec-uaa'], 6306: ['ufmp'], 13218: ['emc-vcas-udp'], 6315: ['scup-disc'], 6316: ['abb-escp'], 6317: ['nav-data'], 6320: ['repsvc'], 6321: ['emp-server1'], 6322: ['emp-server2'], 6324: ['hrd-ns-disc'], 8280: ['synapse-nhttp'], 6343: ['sflow'], 6346: ['gnutella-svc'], 6347: ['gnutella-rtr'], 6350: ['adap'], 6355: ['pmcs'], 6360: ['metaedit-mu'], 6363: ['ndn'], 6370: ['metaedit-se'], 25009: ['icl-twobase10'], 9214: ['ipdcesgbs'], 9255: ['mon'], 34249: ['turbonote-2'], 6382: ['metatude-mds'], 32776: ['filenet-peior'], 9901: ['enrp'], 8473: ['vp2p'], 6389: ['clariion-evr01'], 6390: ['metaedit-ws'], 28200: ['voxelstorm'], 9898: ['monkeycom'], 22800: ['aws-brf'], 6417: ['faxcomservice'], 19410: ['hp-sco'], 6420: ['nim-vdrshell'], 6421: ['nim-wan'], 30999: ['ovobs'], 26261: ['ezmeeting'], 6443: ['sun-sr-https'], 6444: ['sge-qmaster'], 6445: ['sge-execd'], 6446: ['mysql-proxy'], 9762: ['tungsten-http'], 31029: ['yawn'], 6455: ['skip-cert-recv'], 6456: ['skip-cert-send'], 9629: ['uniport'], 18184: ['opsec-lea'], 12000: ['entextxid'], 6471: ['lvision-lm'], 12002: ['entexthigh'], 6480: ['sun-sr-http'], 6481: ['servicetags'], 6482: ['ldoms-mgmt'], 6483: ['sunvts-rmi'], 6484: ['sun-sr-jms'], 6485: ['sun-sr-iiop'], 6486: ['sun-sr-iiops'], 6487: ['sun-sr-iiop-aut'], 6488: ['sun-sr-jmx'], 6489: ['sun-sr-admin'], 12005: ['dbisamserver1'], 6500: ['boks'], 6501: ['boks-servc'], 6502: ['boks-servm'], 6503: ['boks-clntd'], 6505: ['badm-priv'], 6506: ['badm-pub'], 6507: ['bdir-priv'], 6508: ['bdir-pub'], 6509: ['mgcs-mfp-port'], 6510: ['mcer-port'], 6511: ['dccp-udp'], 12008: ['accuracer-dbms'], 6514: ['syslog-tls'], 6515: ['elipse-rec'], 9278: ['pegasus'], 12009: ['ghvpn'], 8554: ['rtsp-alt'], 9279: ['pegasus-ctl'], 20202: ['ipdtp-port'], 9280: ['pgps'], 32777: ['filenet-obrok'], 9281: ['swtp-port1'], 12012: ['vipera'], 8401: ['sabarsd'], 9282: ['swtp-port2'], 6543: ['lds-distrib'], 6544: ['lds-dump'], 6547: ['apc-6547'], 6548: ['apc-6548'], 6549: ['apc-6549'], 6550: ['fg-sysupdate'], 6551: ['sum'], 9284: ['visd'], 11000: ['irisa'], 6558: ['xdsxdm'], 9285: ['n2h2server'], 9286: ['n2receive'], 6566: ['sane-port'], 22951: ['brf-gw'], 6568: ['rp-reputation'], 19411: ['hp-sca'], 9287: ['cumulus'], 26133: ['scscp'], 8675: ['msi-cps-rm-disc'], 6579: ['affiliate'], 6580: ['parsec-master'], 6581: ['parsec-peer'], 6582: ['parsec-game'], 6583: ['joajewelsuite'], 8609: ['canon-cpp-disc'], 47557: ['dbbrowse'], 8403: ['admind'], 9292: ['armtechdaemon'], 8500: ['fmtp'], 9293: ['storview'], 9294: ['armcenterhttp'], 23000: ['inovaport1'], 23001: ['inovaport2'], 23002: ['inovaport3'], 6619: ['odette-ftps'], 6620: ['kftp-data'], 6621: ['kftp'], 6622: ['mcftp'], 6623: ['ktelnet'], 6626: ['wago-service'], 6627: ['nexgen'], 6628: ['afesc-mc'], 6633: ['cisco-vpath-tun'], 8555: ['d-fence'], 20222: ['ipulse-ics'], 9300: ['vrace'], 6653: ['openflow'], 6657: ['palcom-disc'], 24321: ['ild'], 47624: ['directplaysrvr'], 6670: ['vocaltec-gold'], 6671: ['p4p-portal'], 6672: ['vision-server'], 6673: ['vision-elmd'], 6678: ['vfbp-disc'], 6679: ['osaut'], 43439: ['eq3-config'], 6689: ['tsa'], 24922: ['find'], 43441: ['ciscocsdb'], 6696: ['babel'], 17500: ['db-lsp-disc'], 6701: ['kti-icad-srvr'], 6702: ['e-design-net'], 6703: ['e-design-web'], 32768: ['filenet-tms'], 6714: ['ibprotocol'], 6715: ['fibotrader-com'], 19412: ['hp-sessmon'], 44322: ['pmcdproxy'], 9592: ['ldgateway'], 14936: ['hde-lcesrvr-1'], 14937: ['hde-lcesrvr-2'], 19194: ['ua-secureagent'], 8501: ['cmtp-av'], 9318: ['secure-ts'], 19315: ['keyshadow'], 44818: ['ethernet-ip-2'], 6767: ['bmc-perf-agent'], 6768: ['bmc-perf-mgrd'], 6769: ['adi-gxp-srvprt'], 6770: ['plysrv-http'], 6771: ['plysrv-https'], 9321: ['guibase'], 9992: ['palace-1'], 6784: ['bfd-lag'], 6785: ['dgpf-exchg'], 6786: ['smc-jmx'], 6787: ['smc-admin'], 6788: ['smc-http'], 6789: ['smc-https'], 6790: ['hnmp'], 6791: ['hnm'], 6801: ['acnet'], 15000: ['hydap'], 42508: ['candp'], 6831: ['ambit-lm'], 18888: ['apc-necmp'], 31416: ['xqosd'], 6841: ['netmo-default'], 6842: ['netmo-http'], 42509: ['candrp'], 47806: ['ap'], 47808: ['bacnet'], 47809: ['presonus-ucnet'], 6850: ['iccrushmore'], 11165: ['suncacao-websvc'], 6868: ['acctopus-st'], 10160: ['qb-db-server'], 31457: ['tetrinet'], 9283: ['callwaveiam'], 9593: ['cba8'], 9102: ['bacula-fd'], 6888: ['muse'], 8686: ['sun-as-jmxrmi'], 9343: ['mpidcmgr'], 10050: ['zabbix-agent'], 9889: ['gt-proxy'], 9344: ['mphlpdmc'], 12321: ['warehouse-sss'], 9346: ['ctechlicensing'], 15118: ['v2g-secc'], 12004: ['entextlow'], 6935: ['ethoscan'], 6936: ['xsmsvc'], 10051: ['zabbix-trapper'], 27782: ['ars-vista'], 6946: ['bioserver'], 23003: ['inovaport4'], 23333: ['elxmgmt'], 6951: ['otlp'], 23004: ['inovaport5'], 23005: ['inovaport6'], 6961: ['jmact3'], 6962: ['jmevt2'], 6963: ['swismgr1'], 6964: ['swismgr2'], 6965: ['swistrap'], 6966: ['swispol'], 6969: ['acmsoda'], 8416: ['espeech'], 6997: ['mobilitysrv'], 6998: ['iatp-highpri'], 6999: ['iatp-normalpri'], 7000: ['afs3-fileserver'], 7001: ['afs3-callback'], 7002: ['afs3-prserver'], 7003: ['afs3-vlserver'], 7004: ['afs3-kaserver'], 7005: ['afs3-volser'], 7006: ['afs3-errors'], 7007: ['afs3-bos'], 7008: ['afs3-update'], 7009: ['afs3-rmtsys'], 7010: ['ups-onlinet'], 7011: ['talon-disc'], 7012: ['talon-engine'], 7013: ['microtalon-dis'], 7014: ['microtalon-com'], 7015: ['talon-webserver'], 23400: ['novar-dbase'], 23401: ['novar-alarm'], 23402: ['novar-global'], 7019: ['doceri-view'], 7020: ['dpserve'], 7021: ['dpserveadmin'], 7022: ['ctdp'], 7023: ['ct2nmcs'], 7024: ['vmsvc'], 7025: ['vmsvc-2'], 11321: ['arena-server'], 7030: ['op-probe'], 11320: ['imip-channels'], 9594: ['msgsys'], 7040: ['quest-disc'], 48001: ['nimspooler'], 48002: ['nimhub'], 48003: ['nimgtw'], 31620: ['lm-mon'], 24386: ['intel-rci'], 20014: ['opendeploy'], 33334: ['speedtrace-disc'], 10113: ['netiq-endpoint'], 12322: ['warehouse'], 7070: ['arcp'], 7071: ['iwg1'], 7080: ['empowerid'], 9374: ['fjdmimgr'], 7095: ['jdp-disc'], 7099: ['lazy-ptop'], 7100: ['font-service'], 7101: ['elcn'], 7107: ['aes-x170'], 12109: ['rets-ssl'], 7121: ['virprot-lm'], 7128: ['scenidm'], 7129: ['scenccs'], 18241: ['checkpoint-rtm'], 21846: ['netspeak-is'], 15345: ['xpilot'], 18182: ['opsec-ufp'], 7161: ['cabsm-comm'], 7162: ['caistoragemgr'], 7163: ['cacsambroker'], 7164: ['fsr'], 7165: ['doc-server'], 7166: ['aruba-server'], 48128: ['isnetserv'], 7169: ['ccag-pib'], 7170: ['nsrp'], 7171: ['drm-production'], 7174: ['clutild'], 31765: ['gamesmith-port'], 12121: ['nupaper-ss'], 7200: ['fodms'], 7201: ['dlip'], 9396: ['fjinvmgr'], 7227: ['ramp'], 9397: ['mpidcagt'], 40000: ['safetynetp'], 11723: ['emc-xsw-dcache'], 7235: ['aspcoordination'], 8793: ['acd-pm'], 8600: ['asterix'], 9400: ['sec-t4net-srv'], 9401: ['sec-t4net-clt'], 44900: ['m3da-disc'], 9402: ['sec-pc2fax-srv'], 7262: ['cnap'], 25000: ['icl-twobase1'], 7272: ['watchme-7272'], 7273: ['oma-rlp'], 7274: ['oma-rlp-s'], 7275: ['oma-ulp'], 7276: ['oma-ilp'], 7277: ['oma-ilp-s'], 7278: ['oma-dcdocbs'], 7279: ['ctxlic'], 7280: ['itactionserver1'], 7281: ['itactionserver2'], 7282: ['mzca-alert'], 34980: ['ethercat'], 18635: ['rds-ip'], 25793: ['vocaltec-hos'], 9295: ['armcenterhttps'], 8804: ['truecm'], 26262: ['k3software-svr'], 35355: ['altova-lm-disc'], 9020: ['tambora'], 8614: ['canon-bjnp4'], 48129: ['blp5'], 9418: ['git'], 15555: ['cisco-snat'], 7365: ['lcm-server'], 10288: ['blocks'], 31948: ['iceedcp-tx'], 31949: ['iceedcp-rx'], 7391: ['mindfilesys'], 7392: ['mrssrendezvous'], 7393: ['nfoldman'], 7394: ['fse'], 7395: ['winqedit'], 7397: ['hexarc'], 7400: ['rtps-discovery'], 7401: ['rtps-dd-ut'], 7402: ['rtps-dd-mt'], 44321: ['pmcd'], 7410: ['ionixnetmon'], 7411: ['daqstream'], 9955: ['alljoyn-mcm'], 7421: ['mtportmon'], 7426: ['pmdmgr'], 7427: ['oveadmgr'], 7428: ['ovladmgr'], 7429: ['opi-sock'], 7430: ['xmpv7'], 7431: ['pmd'], 7437: ['faximum'], 7443: ['oracleas-https'], 10800: ['gap'], 32034: ['iracinghelper'], 15660: ['bex-xr'], 10990: ['rmiaux'], 7473: ['rise'], 40842: ['csccredir'], 10805: ['lpdg'], 7491: ['telops-lmd'], 12172: ['hivep'], 7500: ['silhouette'], 7501: ['ovbus'], 11161: ['suncacao-snmp'], 19000: ['igrid'], 9443: ['tungsten-https'], 7510: ['ovhpas'], 7511: ['pafec-lm'], 9444: ['wso2esb-console'], 10810: ['nmc-disc'], 24465: ['tonidods'], 11162: ['suncacao-jmxmp'], 8765: ['ultraseek-http'], 8733: ['ibus'], 7542: ['saratoga'], 7543: ['atul'], 7544: ['nta-ds'], 7545: ['nta-us'], 7546: ['cfs'], 7547: ['cwmp'], 7548: ['tidp'], 7549: ['nls-tl'], 7550: ['cloudsignaling'], 7560: ['sncp'], 22347: ['wibukey'], 11163: ['suncacao-rmi'], 7566: ['vsi-omega'], 7570: ['aries-kfinder'], 29167: ['otmp'], 7588: ['sun-lm'], 9800: ['davsrc'], 11164: ['suncacao-csa'], 48556: ['com-bardac-dw'], 35004: ['rt-classmanager'], 24000: ['med-ltp'], 24001: ['med-fsp-rx'], 24002: ['med-fsp-tx'], 24003: ['med-supp'], 24004: ['med-ovw'], 24005: ['med-ci'], 9801: ['sstp-2'], 7624: ['indi'], 7627: ['soap-http'], 7628: ['zen-pawn'], 7629: ['xdas'], 20167: ['tolfab'], 30260: ['kingdomsonline'], 7633: ['pmdfmgt'], 9598: ['vscp'], 9618: ['condor'], 7648: ['cuseeme'], 9802: ['davsrcs'], 48619: ['iqobject'], 8474: ['noteshare'], 9380: ['boxp'], 7674: ['imqtunnels'], 7675: ['imqtunnel'], 7676: ['imqbrokerd'], 7677: ['sun-user-https'], 7680: ['pando-pub'], 7689: ['collaber'], 18000: ['biimenu'], 34379: ['p-net-remote'], 7697: ['klio'], 32801: ['mlsn'], 7707: ['sync-em7'], 7708: ['scinet'], 12003: ['entextmed'], 7720: ['medimageportal'], 7724: ['nsdeepfreezectl'], 7725: ['nitrogen'], 7726: ['freezexservice'], 7727: ['trident-data'], 7734: ['smip'], 7738: ['aiagent'], 7741: ['scriptview'], 7743: ['sstp-1'], 7744: ['raqmon-pdu'], 7747: ['prgp'], 16310: ['pduncs'], 18262: ['gv-pf'], 7777: ['cbt'], 7778: ['interwise'], 7779: ['vstat'], 7781: ['accu-lmgr'], 9599: ['robix'], 7786: ['minivend'], 7787: ['popup-reminders'], 7789: ['office-tools'], 7794: ['q3ade'], 7797: ['pnet-conn'], 7798: ['pnet-enc'], 7799: ['altbsdp'], 7800: ['asr'], 7801: ['ssp-client'], 7802: ['vns-tp'], 15998: ['2ping'], 10080: ['amanda'], 7810: ['rbt-wanopt'], 16003: ['alfin'], 10860: ['helix'], 9994: ['palace-3'], 9535: ['mngsuite'], 11876: ['xoraya'], 16384: ['connected'], 10081: ['famdc'], 7845: ['apc-7845'], 7846: ['apc-7846'], 9500: ['ismserver'], 43210: ['shaperai-disc'], 45000: ['asmp-mon'], 24242: ['filesphere'], 32771: ['filenet-rmi'], 24249: ['vista-4gl'], 7872: ['mipv6tls'], 9023: ['swa-1'], 7880: ['pss'], 7887: ['ubroker'], 13216: ['bcslogc'], 7900: ['mevent'], 7901: ['tnos-sp'], 7902: ['tnos-dp'], 7903: ['tnos-dps'], 48000: ['nimcontroller'], 32483: ['apm-link'], 11720: ['h323callsigalt'], 7913: ['qo-secure'], 10200: ['trisoap'], 21800: ['tvpm'], 25008: ['icl-twobase9'], 8301: ['amberon'], 7932: ['t2-drm'], 7933: ['t2-brm'], 10880: ['bveapi'], 24322: ['hid'], 9600: ['micromuse-ncpw'], 25900: ['tasp-net'], 9875: ['sapv1'], 25901: ['niobserver'], 32635: ['sec-ntb-clnt'], 25902: ['nilinkanalyst'], 25903: ['niprobe'], 7967: ['supercell'], 16161: ['sun-sea-port'], 8400: ['cvd'], 30001: ['pago-services1'], 7979: ['micromuse-ncps'], 7980: ['quest-vista'], 9522: ['sma-spw'], 7982: ['sossd-disc'], 30003: ['amicon-fpsu-ra'], 30004: ['amicon-fpsu-s'], 7998: ['usicontentpush'], 7999: ['irdmi2'], 8000: ['irdmi'], 8001: ['vcom-tunnel'], 8002: ['teradataordbms'], 8003: ['mcreport'], 8005: ['mxi'], 8008: ['http-alt'], 36001: ['allpeers'], 8019: ['qbdb'], 8020: ['intu-ec-svcdisc'], 8021: ['intu-ec-client'], 8022: ['oa-system'], 38201: ['galaxy7-data'], 8025: ['ca-audit-da'], 8026: ['ca-audit-ds'], 38202: ['fairview'], 8032: ['pro-ed'], 8033: ['mindprint'], 8034: ['vantronix-mgmt'], 38203: ['agpolicy'], 8040: ['ampify'], 8052: ['senomix01'], 8053: ['senomix02'], 8054: ['senomix03'], 8055: ['senomix04'], 8056: ['senomix05'], 8057: ['senomix06'], 8058: ['senomix07'], 8059: ['senomix08'], 8060: ['aero'], 20480: ['emwavemsg'], 9536: ['laes-bf'], 10201: ['rscs'], 17729: ['ea'], 40841: ['cscp'], 8074: ['gadugadu'], 30002: ['pago-services2'], 26263: ['k3software-cli'], 8080: ['http-alt'], 8081: ['sunproxyadmin'], 8082: ['us-cli'], 8083: ['us-srv'], 40853: ['ortec-disc'], 8086: ['d-s-n'], 8087: ['simplifymedia'], 8088: ['radan-http'], 8194: ['blp1'], 8097: ['sac'], 8100: ['xprint-server'], 8115: ['mtl8000-matrix'], 8116: ['cp-cluster'], 16309: ['etb4j'], 8118: ['privoxy'], 16311: ['pdefmns'], 8121: ['apollo-data'], 8122: ['apollo-admin'], 8128: ['paycash-online'], 8129: ['paycash-wbp'], 8130: ['indigo-vrmi'], 8131: ['indigo-vbcp'], 8132: ['dbabble'], 8148: ['isdd'], 8149: ['eor-game'], 8205: ['lm-instmgr'], 12001: ['entextnetwk'], 8160: ['patrol'], 8161: ['patrol-snmp'], 8195: ['blp2'], 16360: ['netserialext1'], 16361: ['netserialext2'], 24554: ['binkp'], 16367: ['netserialext3'], 16368: ['netserialext4'], 9555: ['trispen-sra'], 45054: ['invision-ag'], 8182: ['vmware-fdm'], 8184: ['itach'], 32767: ['filenet-powsrm'], 21845: ['webphone']}
-udp_service_to_ports = {'system-monitor': [2609], 'zannet': [317], 'synapsis-edge': [5008], 'appserv-https': [4849], 'orbix-loc-ssl': [3077], 'accessnetwork': [699], 'metrics-pas': [1824], 'sync-em7': [7707], 'rtps-discovery': [7400], 'icg-swp': [2062], 'ibm-dial-out': [3267], 'artifact-msg': [3518], 'omstopology': [4162], 'afs3-update': [7008], 'fsportmap': [4349], 'citrixima': [2512], 'taiclock': [4014], 'h323callsigalt': [11720], 'winqedit': [7395], 'banyan-rpc': [567], 'ct2nmcs': [7023], 'iceedcp-rx': [31949], 'panasas': [3095], 'lispworks-orb': [3672], 'anthony-data': [1206], 'ipdtp-port': [20202], 'picknfs': [1598], 'tritium-can': [4876], 'mcftp': [6622], 'jboss-iiop-ssl': [3529], 'starbot': [2838], 'contclientms': [4665], 'rp-reputation': [6568], 'ibar': [5784], 'esp-encap': [2797], 'brcm-comm-port': [3188], 'mlsn': [32801], 'sds-admin': [2705], 'vacdsm-app': [671], 'macon-udp': [456], 'incognitorv': [3139], 'hart-ip': [5094], 'sugp': [1905], 'directnet': [3447], 'commonspace': [1592], 'lansurveyor': [4347], 'aes-discovery': [3224], 'tungsten-https': [9443], 'cruise-config': [8378], 'fast-rem-serv': [2495], 'netinfo-local': [1033], 'dna': [2287], 'event-listener': [3017], 'syncserver': [2647], 'mcs-fastmail': [3302], 'dnp': [20000], 'ezmeeting-2': [10101], 'dnx': [3998], 'nessus': [1241], 'pcsync-http': [8444], 'excw': [1271], 'jms': [5673], 'dpcp': [4099], 'caspssl': [1131], 'exce': [2769], 'netgw': [741], 'eristwoguns': [2650], 'radwiz-nms-srv': [2736], 'lisp-data': [4341], 'messageservice': [2311], 'nowcontact': [3167], 'vpps-qua': [672], 'kpasswd': [464], 'smtp': [25], 'coaps': [5684], 'niobserver': [25901], 'opswmanager': [3977], 'hp-collector': [381], 'neveroffline': [2614], 'netclip': [2971], 'rsom': [2889], 're101': [1343], 'msiccp': [1731], '3com-tsmux': [106], 'ctlptc': [2153], 'sitaradir': [2631], 'at-8': [208], 'hp-clic': [3384], 'at-5': [205], 'at-7': [207], 'openvms-sysipc': [557], 'at-3': [203], 'sdclient': [2310], 'smakynet': [122], 'wins': [1512], 'alias': [1187], 'ezproxy': [26260], 'simslink': [2676], 'cs-auth-svr': [3113], 'fis': [5912], 'accuracer-dbms': [12008], 'dec_dlm': [625], 'concurrent-lm': [1648], 'vseconnector': [2893], 'xqosd': [31416], 'blizwow': [3724], 't1-e1-over-ip': [3175], 'nupaper-ss': [12121], 'nasmanager': [1960], 'streetperfect': [1330], 'firstcall42': [2673], 'webmethods-b2b': [2907], 'acme': [9216], 'acms': [3980], 'must-backplane': [3515], 'shivasound': [1549], 'vipera': [12012], 'cns-srv-port': [2976], 'snaresecure': [1684], 'uadtc': [2767], 'ptp-event': [319], 'fhc': [1499], 'websm': [9090], 'rtsps': [322], 'msl_lmd': [1464], 'ice-slocation': [4062], 'dsp': [33], 'drm-production': [7171], 'dsf': [555], 'aker-cdp': [2473], 'dsc': [3390], 'otpatch': [2936], 'trident-data': [7727], 'skytelnet': [1618], 'cgi-starapi': [3893], 'oa-system': [8022], 'entrust-aams': [681], 'eoss': [1210], 'banyan-vip': [573], 'ats': [2201], 'surfpass': [5030], 'ds-srv': [4400], 'asci-val': [1560], 'ccm-port': [3575], 'swldy-sias': [1250], 'cl-db-request': [4136], 'wiegand': [4390], 'lanyon-lantern': [1682], 'ibm-rsyscon': [9085], 'fatpipe': [3353], 'ianywhere-dbns': [3968], 'pmip6-cntl': [5436], 'iqserver': [2527], 'rusb-sys-port': [3422], 'iwec': [4801], 'rsmtp': [2390], 'msft-gc-ssl': [3269], 'ups-onlinet': [7010], 'lv-jc': [2143], 'mpsysrmsvr': [3358], 'nas-metering': [2286], 'bspne-pcc': [1252], 'mxit': [9119], 'vns-tp': [7802], 'cl-1': [172], 'cybercash': [551], 'beacon-port': [3124], 'vcnet-link-v10': [2554], 'gtp-control': [2123], 'wello': [4177], 'dtv-chan-req': [2253], 'camp': [4450], 'ssmpp': [3550], 'hhb-handheld': [4148], 'dj-ice': [5419], 'sgcp': [440], 'igrs': [3880], 'rbr-discovery': [3553], 'zenginkyo-2': [5021], 'zenginkyo-1': [5020], 'cartographerxmp': [5270], 'hillrserv': [4117], 'informatik-lm': [1428], 'nsws': [3049], 'ftp-agent': [574], 'call-sig-trans': [2517], 'smc-http': [6788], 'navisphere': [2162], 'board-roar': [9700], 'microtalon-com': [7014], 'plato': [3285], 'magicom': [2243], 'abb-escp': [6316], 'oirtgsvc': [4141], 'comcam': [2108], 'nntps': [563], 'asipregistry': [687], 'msfw-storage': [2171], 'cdc': [223], 'scc-security': [582], 'npmp': [8450], 'ci3-software-2': [1302], 'wago-io-system': [2455], 'patrol-coll': [6162], 'ci3-software-1': [1301], 'krb524': [4444], 'radius': [1812], 'smpte': [420], 'bess': [3960], 'peerbook-port': [3135], 'xns-auth': [56], 'irc': [194], 'caupc-remote': [2122], 'kme-trap-port': [2081], 'ias-session': [4594], 'cambertx-lm': [1734], 'iceedcp-tx': [31948], 'voxelstorm': [28200], 'tvnetworkvideo': [3791], 'esip': [2950], 'gopher': [70], 'afpovertcp': [548], 'dicom': [11112], 'hyperscsi-port': [5674], 'recvr-rc-disc': [43000], 'privilege': [2588], 'inova-ip-disco': [2716], 'retrospect': [497], 'servistaitsm': [3636], '6a44': [1027], 'mac-srvr-admin': [660], 'exbit-escp': [1316], 'isi-irp': [3226], 'csms2': [3400], 'aftmux': [3917], 'commerce': [542], 'manet': [269], 'drmsmc': [1878], 'tivoconnect': [2190], 'bvcontrol': [1236], 'dbsa-lm': [1407], 'sdo-tls': [3896], 'unot': [5055], 'netconf-ssh': [830], 'oveadmgr': [7427], 'videte-cipc': [1927], 'mirrtex': [4310], 'ctisystemmsg': [4451], 'aol-2': [5192], 'aol-3': [5193], 'dhe': [3252], 'aol-1': [5191], 'meregister': [669], 'vocaltec-admin': [1796], 'swismgr2': [6964], 'ars-vista': [27782], 'neteh': [3828], 'cpudpencap': [2746], 'tunatic': [5747], 'rap-listen': [1531], 'simple-tx-rx': [2257], 'na-localise': [5062], 'sigma-port': [3614], 'tcim-control': [2729], 'ovsam-d-agent': [3870], 'nicname': [43], 'hao': [2245], 'j-ac': [4107], 'powerexchange': [2480], 'myq-termlink': [11108], 'hap': [661], 'xingcsm': [2327], 'pwgippfax': [3951], 'vlsi-lm': [1500], 'fcp-cics-gw1': [5504], 'tcpdataserver': [3805], 'proshare-mc-2': [1674], 'llm-csv': [2814], 'wap-wsp-wtp-s': [9203], 'irapp': [4073], 'bmc-ctd-ldap': [6301], 'genisar-port': [3475], 'sabarsd': [8401], 'fcp': [510], 'bmc-net-svc': [1770], 'vatp': [690], 'exonet': [26489], 'lockstep': [2125], 'bcslogc': [13216], 'nvcnet': [3999], 'hpvmmcontrol': [1124], 'ums': [2248], 'netwall': [533], 'uma': [144, 1797], 'synotics-relay': [391], 'dtserver-port': [4028], 'qsnet-cond': [4357], 'vpsipport': [2649], 'remoteware-un': [2999], 'pmcp': [3821], 'pmcs': [6355], 'kfserver': [5343], 'oraclenames': [1575], 'pmcd': [44321], 'ticf-2': [493], 'ticf-1': [492], 'gt-proxy': [9889], 'laes-bf': [9536], 'bmc-net-adm': [1769], 'veritas-udp1': [2802], 'qadmifevent': [2462], 'wbem-http': [5988], 'snmptrap': [162], 'sos': [3838], 'camac': [3545], 'mtl8000-matrix': [8115], 'device2': [2030], 'brlp-1': [4102], 'brlp-0': [4101], 'brlp-3': [4104], 'apparenet-tps': [3237], 'tams': [2726], 'gat-lmd': [1708], 'bluectrlproxy': [2277], 'apc-7846': [7846], 'apc-7845': [7845], 'mptn': [397], 'atex-elmd': [1385], 'eppc': [3031], 'pcc-mfp': [2256], 'twamp-control': [862], 'flashmsg': [2884], 'qpasa-agent': [2612], 'dali-port': [5777], 'raven-rdp': [3533], 'afs3-callback': [7001], 'sco-websrvrmgr': [620], 'aes-x170': [7107], 'sai-sentlm': [2640], 'omserv': [764], 'sco-websrvrmg3': [598], 'soagateway': [5250], 'abarsd': [8402], 'pslserver': [2352], 'pnrp-port': [3540], 'vnsstr': [3321], 'time': [37], 'ace-proxy': [2335], 'med-supp': [24003], 'dragonfly': [8913], 'xprtld': [5634], 'argis-ds': [2582], 'surfcontrolcpa': [3909], 'lrp': [2090], 'mindfilesys': [7391], 'msgclnt': [8786], 'microtalon-dis': [7013], 'ibprotocol': [6714], 'qnxnetman': [3385], 'phrelaydbg': [4869], 'idp-infotrieve': [2966], 'novell-lu6.2': [1416], 'net8-cman': [1830], 'pc-mta-addrmap': [2246], 'sercomm-wlink': [2235], 'corel-vncadmin': [2654], 'corba-iiop-ssl': [684], 'spt-automation': [5814], 'spamtrap': [2568], 'apogeex-port': [3184], 'mdbs-daemon': [800], 'nuts-bootp': [4133], 'rmonitor-secure': [5145], 'interpathpanel': [2652], 'sysinfo-sp': [11967], 'htrust': [5628], 'abacus-remote': [2894], 'ftranhc': [1105], 'xingmpeg': [1558], 'sxuptp': [19540], 'gbs-smp': [3762], 'galileo': [3519], 'ipr-dglt': [3678], 'ida-discover1': [5741], 'ida-discover2': [5742], 'checksum': [1386], 'timbuktu': [407], 'nucleus-sand': [1201], 'stanag-5066': [5066], 'h323hostcallsc': [1300], 'mos-aux': [10542], 'ipp': [631], 'index-pc-wb': [2127], 'ipx': [213], 'repliweb': [2837], 'csregagent': [3022], 'start-network': [3615], 'vsinet': [996], 'compaq-wcp': [2555], 'mobile-p2p': [4688], 'srcp': [4303], 'iso-ill': [499], 'bintec-admin': [2107], 'igrid': [19000], 'hks-lm': [1722], 'tragic': [2642], 'webster': [765], 'sky-transport': [3556], 'afs3-kaserver': [7004], 'rap-service': [1530], 'pd-admin': [9597], 'hcp-wismar': [686], 'smartpackets': [3218], 'netarx': [1040], 'snapp': [2333], 'connlcli': [1358], 'slush': [1966], 'seagulllms': [1291], 'data-port': [3578], 'pslicser': [4168], 'cert-initiator': [1639], 'aairnet-2': [3619], 'dnsix': [90], 'avocent-adsap': [3871], 'kryptolan': [398], 'at-nbp': [202], 'ttc': [2483], 'alljoyn': [9956], 'pn-requester2': [2718], 'qmvideo': [5689], 'novell-ipx-cmd': [2645], 'reachout': [43188], 'synapse-nhttp': [8280], 'global-wlink': [1909], 'netiq-qcheck': [10114], 'netsupport': [5405], 'ovsessionmgr': [2389], 'redstorm_info': [2348], 'idig_mux': [4152], 'afesc-mc': [6628], 'cisco-tna': [131], 'wbem-exp-https': [5990], 'direcpc-dll': [1844], 'optiwave-lm': [2524], 't1distproc60': [32249], 'minipay': [2105], 'pscupd': [3453], 'pcc-image-port': [3892], 'nattyserver': [3753], 'payrouter': [1246], 'netlabs-lm': [1406], 'iatp-normalpri': [6999], 'sdproxy': [1297], 'softrack-meter': [3884], 'covia': [64], 'h323hostcall': [1720], 'dhcp-failover2': [847], 'router': [520], 'xserveraid': [3722], 'mgemanagement': [4680], 'parsec-game': [6582], 'netspeak-is': [21846], 'cnrprotocol': [1096], 'hpoms-dps-lstn': [5404], 'isg-uda-server': [2551], 'ctx-bridge': [3127], 'fmp': [4745], 'pmas': [4066], 'kftp': [6621], 'hippad': [2988], 'donnyworld': [1821], 'starfish': [3981], 'bhoedap4': [352], 'dvt-system': [3246], 'netrisk': [1799], 'bmc-ar': [2494], 'namemunge': [3950], 'profinet-rtm': [34963], 'tcp-id-port': [1999], 'savant': [3391], 'smpp': [2775], 'hpssmgmt': [4484], 'hp-webqosdb': [1877], 'spugna': [3807], 'stun-behavior': [3478], 'wap-vcard': [9204], 'sac': [8097], 'cloanto-net-1': [356], 'vrtl-vmf-sa': [2074], 'ssrip': [3318], 'icslap': [2869], 'phoenix-rpc': [3347], 'canex-watch': [3583], 'msexch-routing': [691], 'hybrid-pop': [473], 's3db': [2278], 'capioverlan': [1147], 'dellwebadmin-2': [1279], 'dellwebadmin-1': [1278], 'siemensgsm': [28240], 'icmpd': [5813], 'printer': [515], 'rlm-disc': [5053], 'synotics-broker': [392], 'rtraceroute': [3765], 'synchromesh': [4548], 'avt-profile-1': [5004], 'avt-profile-2': [5005], 'funk-dialout': [2909], 'printer-agent': [3396], 'nimsh': [3901], 'elan': [1378], 'elad': [1893], 'edm-adm-notify': [3463], 'legent-1': [373], 'legent-2': [374], 'etebac5': [1216], 'powerclientcsf': [2443], 'transact': [1869], 'qip-qdhcp': [2490], 'mercury-disc': [9596], 'tr-rsrb-port': [1996], 'cuseeme': [7648], 'pago-services2': [30002], 'cas-mapi': [3682], 'pxc-epmap': [2434], 'admind': [3279, 8403], 'suncacao-snmp': [11161], 'aicc-cmi': [3316], 'bl-idm': [142], 'ucentric-ds': [2879], 'whoami': [565], 'canditv': [24676], 'aurora-cmgr': [364], 'bdir-priv': [6507], 'ms-streaming': [1755], 'mc-gt-srv': [2180], 'altav-remmgt': [2456], 'ripng': [521], 'fintrx': [3787], 'dyna-access': [3310], 'diamondport': [33331], 'sshell': [614], 'clutild': [7174], 'decbsrv': [579], 'madcap': [2535], 'brdptc': [2155], 'imip-channels': [11320], 'metaedit-mu': [6360], 'nexstorindltd': [2360], 'irdmi2': [7999], 'netxms-sync': [4702], 'bpcd': [13782], 'sysrqd': [4094], 'upsnotifyprot': [2648], 'sentinel': [3588], 'telesis-licman': [1380], 'bsquare-voip': [1071], 'patrol-snmp': [8161], 'pcsync-https': [8443], 'mni-prot-rout': [3764], 'omsdk': [5724], 'whosells': [2781], 'fmpro-internal': [5003], 'gist': [270], 'stun-p2': [1991], 'stun-p3': [1992], 'airsync': [2175], 'stun-p1': [1990], 'statsci2-lm': [6145], 'ecmp-data': [6160], 'iapp': [2313], 'ibus': [8733], '9pfs': [564], 'svnet': [3413], 'lot105-ds-upd': [2053], 'kazaa': [1214], 'kentrox-prot': [2502], 'xss-port': [3510], 'h263-video': [2979], 'commandport': [3416], 'lv-ffx': [2144], 'ottp': [2951], 'hostname': [101], 'sfs-config': [452], 'trivnet1': [8200], 'trivnet2': [8201], 'rfio': [3147], 'casanswmgmt': [3669], 'ftsync': [4086], 'virtual-places': [1533], 'wired': [4871], 'boks_servm': [6502], 'rds2': [1541], 'boks_servc': [6501], 'supdup': [95], 'qsm-proxy': [1164], 'hivestor': [4884], 'genie': [402], 'estamp': [1982], 'lorica-in': [4080], 'ias-paging': [4595], 'asdis': [2192], 'caids-sensor': [1192], 'wap-vcal-s': [9207], 'ace-svr-prop': [2476], 'qsm-remote': [1166], 'kti-icad-srvr': [6701], 'filenet-peior': [32776], 'spmp': [656], 'kar2ouche': [4661], 'snare': [509], 'audiojuggler': [3643], 'n2h2server': [9285], 'roverlog': [3677], 'broker-service': [3014], 'iso-ip': [147], 'zephyr-clt': [2103], 'msdfsr': [5722], 'prismiq-plugin': [3650], 'emc-vcas-udp': [13218], 'mynahautostart': [2388], 'sge_execd': [6445], 'acmsoda': [6969], 'rets-ssl': [12109], 'lonworks2': [2541], 'ddt': [1052], 'wv-csp-sms': [3590], 'neod2': [1048], 'neod1': [1047], 'lanner-lm': [4547], 'xgrid': [4111], 'wap-pushsecure': [2949], 'uarps': [219], 'raid-cd': [2006, 2013], 'hpiod': [2208], 'raid-cs': [2015], 'vipremoteagent': [3752], 'aci': [187], 'acp': [599], 'net-steward': [2128], 'qsnet-trans': [4354], 'clariion-evr01': [6389], 'qrh': [752], 'ehtp': [1295], 'netobjects2': [2486], 'netobjects1': [2485], 's-openmail': [5767], 'noadmin': [1921], 'tgcconnect': [4146], 'ezproxy-2': [10102], 'aodv': [654], '3link': [15363], 'saris': [4442], 'llm-pass': [2813], 'lkcmserver': [3278], 'mice': [5022], 'speedtrace-disc': [33334], 'tripe': [4070], 'truckstar': [4725], 'remctl': [4373], 'cisco-redu': [5786], 'sftu': [3326], 'prchat-server': [4456], 'af': [1411], 'intel_rci': [24386], 'pcanywherestat': [5632], 'ap': [47806], 'uis': [390], 'md-cg-http': [2688], 'trim-ice': [4323], 'jargon': [148], 'mpp': [218], 'snifferdata': [2892], 'uucp': [540], 'targus-getdata': [5200], 'pehelp': [2307], 'sitewatch': [3792], 'mbus': [47000], 'questnotify': [3554], 'tn-tl-r2': [1580], 'aimpp-port-req': [2847], 'nei-management': [3886], 'xmlrpc-beep': [602], 'lbc-sync': [2779], 'onmux': [417], 'dn6-smm-red': [196], 'masc': [2587], 'adap': [6350], 'rxe': [761], 'ssdp': [1900], 'cps': [14250], 'kyoceranetdev': [1063], 'tnmpv2': [3686], 'emce': [2004], 'scp': [3820], 'pdnet': [2843], 'jacobus-lm': [1578], 'omhs': [5723], 'sis-emt': [2545], 'smile': [3670], 'zmp': [3925], 'nppmp': [3476], 'blockade': [2911], 'mainsoft-lm': [1593], 'xo-wave': [3763], 'egptlm': [3328], 'openqueue': [8764], 'mentaserver': [2118], 'gadugadu': [8074], 'salient-usrmgr': [5410], 'essbase': [1423], 'hicp': [3250], 'bvcdaemon-port': [3626], 'philips-vc': [583], 'elcn': [7101], 'dvl-activemail': [1396], 'iqobject': [48619], 'is99c': [379], 'iw-mmogame': [3596], 'lcm-server': [7365], 'is99s': [380], 'uohost': [3314], 'pra_elmd': [1587], 'njenet-ssl': [2252], 'b2n': [1179], 'acmaint_dbd': [774], 'udp-sr-port': [1624], 'abatemgr': [3655], 'irc-serv': [529], 'bdp': [581], 'x-bone-api': [2165], 'sonuscallsig': [2569], 'vid': [769], 'objectmanager': [2038], 'fcis-disc': [4727], 'int-rcv-cntrl': [3603], 'send': [169], 'amx-rms': [3839], 'ohimsrv': [506], 'mtrgtrans': [19398], 'ipsec-nat-t': [4500], 'serverview-icc': [3173], 'neon24x7': [3213], 'doom': [666], 'fibotrader-com': [6715], 'ip-provision': [43190], 'iracinghelper': [32034], 'tapestry': [1922], 'netbill-cred': [1614], 'rapidmq-center': [3093], 'mediabox': [46999], 'starschool': [2270], 'dab-sti-c': [1076], 'seclayer-tcp': [3495], 'seaodbc': [2471], 'geognosis': [4326], 'viziblebrowser': [1868], 'solid-mux': [1029], 'netxms-mgmt': [4701], 'serverstart': [9213], 'playsta2-lob': [4659], 'eyelink': [589], 'wv-csp-sms-cir': [3716], 'l3-hbmon': [2370], 'mc2studios': [1899], 'rootd': [1094], 'pnbscada': [3875], 'pscribe': [6163], 'pana': [716], 'cybro-a-bus': [8442], 'dialog-port': [2098], 'itap-ddtp': [10100], 'profinet-cm': [34964], 'asa-appl-proto': [502], 'pegasus': [9278], 'hsl-storm': [2113], 'worldscores': [4545], 'e-builder': [4121], 'gc-config': [3436], 'stat-cc': [4158], 'l3-hawk': [2842], 'spramsd': [5770], 'netmagic': [1196], 'symantec-sfdb': [5629], 'onehome-remote': [2198], 'nm-game-admin': [3148], 'codima-rtp': [2415], 'opsec-omi': [18185], 'infiniswitchcl': [3602], 'rexecj': [8230], 'custix': [528], 'rtelnet': [107], 'advant-lm': [2295], 'atmp': [5150], 'pda-sys': [3254], 'newheights': [2114], 'escp-ip': [621], 'redstone-cpss': [2928], 'sstp-2': [9801], 'sstp-1': [7743], 'dcutility': [1044], 'playsta2-app': [4658], 'pvxpluscs': [4093], 'doceri-view': [7019], 'spearway': [2440], 'spocp': [4751], 'dfn': [1133], 'tn-tl-fd2': [1584], 'tn-tl-fd1': [476], 'raid-ac': [2012], 'raid-am': [2007], 'agpolicy': [38203], 'gtrack-ne': [3592], 'tnos-sp': [7901], 'lnvmaps': [2284], 'shockwave2': [1257], 'aap': [2878], 'aas': [1601], 'bcs-broker': [1704], 'equationbuilder': [1351], 'netiq-endpt': [10115], 'wafs': [4049], 'softcm': [6110], 'telnetcpcd': [3696], 'ctdp': [7022], 'hacl-test': [5305], 'slinkysearch': [1225], 'quasar-server': [3599], 'netmo-default': [6841], 'scservp': [3637], 'swx-gate': [4538], 'freezexservice': [7726], 'e-design-web': [6703], 'cylink-c': [5420], 'yawn': [31029], 'atmtcp': [2812], 'privatechat': [1735], 'citriximaclient': [2598], 'universe_suite': [4184], 'fg-fps': [3293], 'itach': [8184], 'ctdb': [4379], 'ssr-servermgr': [45966], 'unieng': [5730], 'finisar': [4682], 'trusted-web': [3011], 'winjaserver': [1290], 'swiftnet': [1751], 'condor': [9618], 'minilock': [3798], 'imtc-mcs': [1503], 'kastenchasepad': [2918], 'bmc-ea': [3683], 'crs': [507], 'bytex': [1375], 'sde-discovery': [5152], 'rfb': [5900], 'rfa': [4672], 'rfe': [5002], 'shiva_confsrvr': [1651], 'set': [257], 'sep': [2089], 'res-sap': [3163], 'dbabble': [8132], 'nimgtw': [48003], 'remotefs': [556], 't128-gateway': [1627], 'urld-port': [3534], 'talon-webserver': [7015], 'rtsserv': [2500], 'synchronet-db': [6100], 'dwnmshttp': [3227], 'pds': [9595], 'rmonitor_secure': [5145], 'connection': [2607], 'badm-priv': [6505], 'pdb': [3033], 'community': [2459], 'pda-data': [3253], 'joajewelsuite': [6583], 'hpppssvr': [2448], 'acter': [4671], 'dic-aida': [1941], 'agentx': [705], 'apc-necmp': [18888], 'otmp': [29167], 'maxim-asics': [3276], 'laplink': [1547], 'isi-gl': [55], 'osm-appsrvr': [9990], 'kerberos': [88], '3m-image-lm': [1550], 'dvbservdsc': [3937], 'oce-snmp-trap': [2697], 'partimage': [4025], 'jini-discovery': [4160], 'netmon': [2606], 'isoft-p2p': [3501], 'blockade-bpsp': [2574], 'smpppd': [3185], 'mle': [19788], 'sixnetudr': [1658], 'robix': [9599], 'xdsxdm': [6558], 'ipass': [2549], 'gxs-data-port': [2073], 'bflckmgr': [3966], 'kofax-svr': [2424], 'jwalkserver': [1289], 'optika-emedia': [1829], 'tserver': [450], 'scp-config': [10001], 'onscreen': [5080], 'efi-mg': [2224], 'infoman': [1451], 'softaudit': [3419], 'rapidmq-reg': [3094], 'plbserve-port': [3933], 'ncr_ccl': [2528], 'redstorm_find': [2347], 'unify-debug': [4867], 'mppolicy-mgr': [5969], 'mpshrsv': [1261], 'pxc-sapxom': [2680], 'nuts-dem': [4132], 'ciscocsdb': [43441], 'xecp-node': [3940], 'netmount': [2061], 'aries-kfinder': [7570], 'xnds': [2157], 'mysql': [3306], 'blueberry-lm': [1432], 'sun-sr-iiop': [6485], 'watcomdebug': [3563], 'ibm-cics': [1435], 'opequus-server': [2400], 'hfcs-manager': [4999], 'amiganetfs': [2100], 'skip-cert-recv': [6455], 'qsoft': [3059], 'ncdloadbalance': [2683], 'blackjack': [1025], 'proshare-mc-1': [1673], 'oc-lm': [1448], 'redstorm-join': [2346], 'ecomm': [3477], 'personalos-001': [3557], 'sun-as-jpda': [9191], 'ampr-info': [1535], 'sanity': [643], 'dzdaemon': [3866], 'efidiningport': [2553], 'futrix': [2358], 'hde-lcesrvr-2': [14937], 'hde-lcesrvr-1': [14936], 'santools': [4079], 'ftps-data': [989], 'rfmp': [2249], 'bb': [1984], 'pctrader': [3048], 'hydap': [15000], 'bdir_priv': [6507], 'serverviewdbms': [9212], 'tqdata': [2700], 'vstat': [7779], 'scenccs': [7129], 'appserv-http': [4848], 'cycleserv': [763], 'rdc-wh-eos': [3142], 'tambora': [9020], 'gmrupdateserv': [1070], 'jaxer-manager': [4328], 'integral': [3459], 'acctopus-st': [6868], 'intv': [1585], 'rsvp_tunnel': [363], 'miva-mqs': [1277], 'ncpm-hip': [1683], 'dsfgw': [438], 'bmc-data-coll': [3695], 'acmaint-dbd': [774], 'audit-transfer': [1146], 'statsrv': [133], 'edb-server1': [1635], 'edb-server2': [3711], 'linx': [1361], 'ocs-cmu': [428], 'link': [245], 'macromedia-fcs': [1935], 'newgenpay': [3165], 'qo-secure': [7913], 'icg-bridge': [2063], 'cis': [22305], 'sna-cs': [1553], 'filecast': [3401], 'influence': [3345], 'sun-sr-iiops': [6486], 'trap-port-mom': [3858], 'mobileip-agent': [434], 'ovsam-mgmt': [3869], 'k-block': [287], 'timestenbroker': [3754], 'wnn6': [22273], 'jcp': [19541], 'amqp': [5672], 'wfremotertm': [1046], 'ingres-net': [134], 'owamp-control': [861], 'kiosk': [1061], 'hivep': [12172], 'bzflag': [5154], 'vrts-tdd': [14149], 'igo-incognito': [4100], 'index-net': [2970], 'oracle': [2005], 'hello': [1789], 'iascontrol': [1157], 'stgxfws': [1226], 'dlswpn': [2067], 'ilss': [4802], 'rsisysaccess': [2752], 'ibm-db2': [523], 'ospf-lite': [8899], 'x9-icue': [1145], 'directvdata': [3287], 'netmpi': [3827], 'documentum': [10002], 'npep-messaging': [2868], 'nlg-data': [5299], 'cgn-config': [2183], 'evm': [1139], 'mtcevrunqss': [4557], 'univ-appserver': [1233], 'fpo-fns': [1066], 'gdp-port': [1997], 'tpcsrvr': [2078], 'trp': [2156], 'unihub-server': [2357], 'fmpro-v6': [5013], 'itose': [4348], 'travsoft-ipx-t': [2644], 'l2f': [1701], 'data-insurance': [2764], 'ionixnetmon': [7410], 'rdlap': [2321], 'cbserver': [3388], 'gprs-cube': [3751], 'edm-mgr-sync': [3464], 'cl-db-attach': [4135], 'vmsvc-2': [7025], 'qb-db-server': [10160], 'g2tag': [4110], 'powerburst': [485], 'kv-server': [3360], 'irtrans': [21000], 'dyniplookup': [3295], 'wsm-server-ssl': [5007], 'jetformpreview': [2097], 'ctp': [3772], 'rds': [1540], 'stvp': [3158], 'ctf': [84], 'xmpv7': [7430], 'rda': [630], 'gv-pf': [18262], 'firefox': [1689], 'msgsrvr': [8787], 'wcr-remlib': [4845], 'winpharaoh': [6065], 'mindprint': [8033], 'boxp': [9380], 'metatude-mds': [6382], 'brvread': [1054], 'nuts_bootp': [4133], 'sti-envision': [1312], 'radius-dynauth': [3799], 'connect-client': [3441], 'ttc-etap-ns': [2977], 'emprise-lls': [3585], 'opsec-uaa': [19191], 'icl-twobase10': [25009], 'conclave-cpp': [2491], 'ndm-requester': [1363], 'elvin_client': [2917], 'ddgn': [4167], 'redwood-chat': [3032], 'agri-gateway': [3026], 'metaconsole': [2850], 's-net': [166], 'mumps': [188], 'caaclang2': [5249], 'tvdumtray-port': [3492], 'blocks': [10288], 'taskmaster2000': [2402, 2403], 'k3software-svr': [26262], 'sentinel-ent': [3712], 'sun-sr-iiop-aut': [6487], 'uucp-rlogin': [541], 'vinainstall': [4344], 'precise-sft': [2315], 'anet-l': [3339], 'npp': [92, 4045], 'anet-h': [3341], 'issd': [1600], 'dyn-site': [3932], 'tarantella': [3144], 'suncacao-csa': [11164], 'bts-appserver': [1961], 'urbisnet': [2745], 'bootserver': [2016], 'houston': [4041], 'aplx': [1134], 'ulistproc': [372], 'cmadmin': [2617], 'ns-cfg-server': [3266], 'netopia-vo2': [1840], 'veritas-vis2': [2994], 'veritas-vis1': [2993], 'strexec-d': [5026], 'asc-slmd': [4448], 'decap': [403], 'liebdevmgmt_dm': [3028], 'openvpn': [1194], 'pptconference': [1711], 'iwg1': [7071], 'rgtp': [1431], 'bv-is': [3990], 'manage-exec': [2342], 'ucontrol': [13894], 'tick-port': [3200], 'sun-sr-jms': [6484], 'sun-sr-jmx': [6488], 'faxcomservice': [6417], 'pegasus-ctl': [9279], 'sun-as-nodeagt': [4850], 'avanti-cdp': [4065], 'faximum': [7437], 'dhct-status': [4675], 'sge-qmaster': [6444], 'pdrncs': [3299], 'idfp': [549], 'drmsfsd': [4098], 'bmc-patroldb': [1313], 'fhsp': [1807], 'tempo': [526], 'netwave-ap-mgmt': [2411], 'apollo-gms': [2759], 'callwaveiam': [9283], 'aviva-sna': [2238], 'netangel': [2442], 'raqmon-pdu': [7744], 'kca-service': [9878], 'liebdevmgmt-dm': [3028], 'anet-b': [3338], 'ayiya': [5072], 'llmnr': [5355], 'qubes': [1341], 'mcreport': [8003], 'qsnet-assist': [4356], 'plysrv-https': [6771], 'winpoplanmess': [1152], 'anet-m': [3340], 'unimobilectrl': [2927], 'gcsp': [3429], 'ansoft-lm-2': [1084], 'ansoft-lm-1': [1083], 'odmr': [366], 'l2tp': [1701], 'groove-dpp': [1211], 'dsmcc-config': [13818], 'mdc-portmapper': [685], 'capwap-data': [5247], 'cuillamartin': [1356], 'lpsrecommender': [2620], 'instl_bootc': [1068], 'instl_boots': [1067], 'aironetddp': [2887], 'zarkov': [2989], 'lmsocialserver': [1111], 'babel': [6696], 'fxp': [286, 2849], 'nsc-ccs': [2604], 'plgproxy': [2790], 'lisp-control': [4342], '3par-mgmt-ssl': [5783], 'pvsw-inet': [2441], 'visd': [9284], 'device': [801], 'gnutella-svc': [6346], 'imgames': [1077], 'devshr-nts': [552], 'rrdp': [5313], 'repsvc': [6320], 'pxc-spvr': [4006], '3par-evts': [5781], 'pammratc': [1632], 'dbm': [2345], 'eicon-server': [1438], 'novell-zen': [2544], 'sonardata': [2863], 'esbroker': [1342], 'cgn-stat': [2182], 'unifyadmin': [2696], 'hmmp-op': [613], 'dsetos': [378], 'accel': [4108], 'abbs': [4885], 'lds-distrib': [6543], 'netcomm2': [1676], 'omnisky': [2056], 'precise-comm': [5630], 'pktcablemmcops': [3918], 'xss-srv-port': [3646], 'dnc-port': [3448], 'rscd': [5750], 'qtp': [2935], 'comotionback': [2262], 'manyone-xml': [8911], 'rscs': [10201], 'tl1': [2361], 'snip-slave': [33656], 'tscchat': [2330], 'rich-cp': [2057], 'tnos-dps': [7903], 'elvin_server': [2916], 'mtn': [4691], 'indigo-vrmi': [8130], 'ets': [1569], 'etp': [1798], 'vision-server': [6672], 'nnsp': [433], 'ramp': [7227], 'utmpsd': [430], 'secure-ts': [9318], 'volley': [3625], 'net-projection': [5363], 'opencore': [4089], 'cm': [5910], 'pcptcpservice': [4182], 'autodesk-lm': [1422], 'iiw-port': [3186], 'boks-servc': [6501], 'rdb-dbs-disp': [1571], 'dhcpv6-client': [546], 'boks-servm': [6502], 'ispipes': [2853], 'winddlb': [1565], 'fs-rh-srv': [3488], 'quotad': [762], 'gte-samp': [2643], 'ftsrv': [1359], 'ua-secureagent': [19194], 'dist-upgrade': [3624], 'sai_sentlm': [2640], 'graphics': [41], 'c3': [2472], 'descent3': [2092], 'netdb-export': [1329], '1ci-smcs': [3091], '4-tieropmcli': [2934], 'purenoise': [663], 'cvd': [8400], 'cvc': [1495], 'redstorm-find': [2347], 'dsmcc-download': [13821], 'gdbremote': [2159], 'tl1-raw': [3082], 'sstsys-lm': [1692], 'unizensus': [1151], 'taserver': [3552], 'netchat': [2451], 'corba-iiop': [683], 'newbay-snc-mc': [16900], 'uuidgen': [697], 'eims-admin': [4199], 'sentinel-lm': [5093], 'cluster-disc': [3374], 'at-echo': [204], 'universe-suite': [4184], 'gds_db': [3050], 'doip-disc': [13400], 'csnet-ns': [105], 'gsmtap': [4729], 'attachmate-g32': [2317], 'gwha': [1383], 'hpoms-ci-lstn': [5403], 'suncacao-jmxmp': [11162], 'wmc-log-svc': [1338], 'linkname': [1903], 'dlsrpn': [2065], 'xkotodrcp': [5344], 'msdts1': [3882], 'aspentec-lm': [6142], 'bmpp': [632], 'telaconsole': [5428], 'go-login': [491], 'nvd': [2184, 2329], 'unbind-cluster': [2138], 'indigo-vbcp': [8131], 'sgi-lk': [11106], 'launchbird-lm': [3739], 'tl1-telnet': [3083], 'gamegen1': [1738], 'availant-mgr': [1122], 'sfs-smp-net': [451], 'netbill-prod': [1616], 'apollo-cc': [2754], 'murx': [2743], 'sunrpc': [111], 'sun-user-https': [7677], 'jt400': [3470], 'novastorbakcup': [308], 'ttl-publisher': [5462], 'delta-mcp': [1324], 'wysdma': [3741], 'wysdmc': [3916], 'acc-raid': [2800], 'netrjs-4': [74], 'ctechlicensing': [9346], 'apc-2260': [2260], 'tns-server': [3308], 'vision_elmd': [6673], 'radsec': [2083], 'stat-results': [4156], 'pxc-splr-ft': [4003], 'sms-xfer': [2702], 'accelenet-data': [1182], 'amt-redir-tcp': [16994], 'codaauth2': [370], 'dbcontrol-agent': [3938], 'odette-ftp': [3305], 'maxumsp': [4179], 'x500ms': [5757], 'emperion': [1282], 'netattachsdmp': [3066], 'tsrmagt': [2077], 'cloudsignaling': [7550], 'exlm-agent': [3002], 'itinternet': [2691], 'netopia-vo1': [1839], 'resource_mgr': [3019], 'irisa': [11000], 'scan-change': [2719], 'autocueds': [3437], 'sane-port': [6566], 'ip-blf': [2088], 'realm-rusd': [688], 'rxmon': [1311], 'csi-sgwp': [348], 'scanstat-1': [1215], 'amt-cnf-prot': [3054], 'srmp': [193], 'cmip-agent': [164], 'splitlock': [3606], 'subntbcst_tftp': [247], 'mortgageware': [367], 'vscp': [9598], 'avanti_cdp': [4065], 'tal-pod': [6149], 'ms-smlbiz': [5356], 'mosaixcc': [2561], 'sentinelsrm': [1947], 'ibm-app': [385], 'manyone-http': [8910], 'sncp': [7560], 'pss': [7880], 'ieee-mms': [651], 'puprouter': [999], 'radan-http': [8088], 'imqtunnel': [7675], 'svnetworks': [2973], 'subntbcst-tftp': [247], 'aurora': [9084], 'mtqp': [1038], 'oma-dcdocbs': [7278], 'ifsf-hb-port': [3486], 'ontime': [1622], 'cma': [1050], 'remote-winsock': [1745], 'dif-port': [2251], 'alaris-disc': [3613], 'responsenet': [3045], 'oms-nonsecure': [5102], 'tag-ups-1': [3573], 'ssm-els': [2479], 'bues-service': [2446], 'gridgen-elmd': [1542], 'kwtc': [4566], 'sysorb': [3241], 'pxc-roid': [4004], 'moldflow-lm': [1576], 'acp-proto': [4046], 'mobile-file-dl': [2926], 'gpsd': [2947], 'iwserver': [2166], 'lv-pici': [2145], 'netscript': [4118], 'palace-4': [9995], 'dpm-agent': [5719], 'palace-2': [9993], 'spectraport': [3851], 'fujitsu-neat': [3382], 'zymed-zpp': [2133], 'patrol-mq-nm': [2665], 'brp': [3043], 'isysg-lm': [1609], 'bre': [4096], 'darcorp-lm': [1679], 'rsap': [1647], 'pacmand': [1307], 'servergraph': [1251], 'ironstorm': [3504], 'nkd': [1650], 'ncxcp': [5681], 'ciphire-serv': [3888], 'objcall': [94], 'moshebeeri': [2627], 'filenet-powsrm': [32767], 'tnp': [8321], 'netspeak-cps': [21849], 'intecourier': [495], 'opi-sock': [7429], 'flashfiler': [24677], 'avdecc': [17221], 'health-polling': [1161], 'slc-ctrlrloops': [2827], 'm3da-disc': [44900], 'productinfo': [1283], 'sunproxyadmin': [8081], 'lam': [2040], 'mpm': [45], 'arcp': [7070], 'parsec-peer': [6581], 'ravehd': [4037], 'dj-ilm': [3362], 'cisco-tdp': [711], 'mc-appserver': [8763], 'cfdptkt': [120], 'ardus-cntl': [1116], 'srp-feedback': [2737], 'domiq': [44544], 'sitaramgmt': [2630], 'l5nas-parchan': [9747], 'emsd-port': [1928], 'pwgwims': [4951], 'zep': [17754], 'ssdtp': [6071], 'swismgr1': [6963], 'intel-rci': [24386], 'oidsr': [4143], 'rs-rmi': [3736], 'www-http': [80], 'csi-lfap': [3145], 'pptp': [1723], 'mpfoncl': [2579], 'codasrv-se': [2433], 'saft': [487], 'comcam-io': [3605], 'omnilink-port': [3904], 'lnvconsole': [2281], 'livestats': [2795], 'iph-policy-adm': [2963], 'vvr-data': [8199], 'dynamic3d': [2150], 'topx': [2436], 'amt-soap-http': [16992], 'omasgport': [4090], 'npdbgmngr': [2293], 'ntp': [123], '3par-mgmt': [5782], 'mecomm': [668], 'sun-lm': [7588], 'cyborg-systems': [9888], 'dict-lookup': [2289], 'sma-spw': [9522], 'nburn_id': [20034], 'servserv': [2011], 'wkstn-mon': [2991], 'remotedeploy': [3789], 'cesdcdman': [2921], 'vqp': [1589], 'ndl-aas': [3128], 'ischat': [1336], 'vitalanalysis': [2474], 'hp-managed-node': [382], 'infobright': [5029], 'airs': [1481], 'jmq-daemon-2': [3215], 'jmq-daemon-1': [3214], 'osm-oev': [9991], 'cisco-fna': [130], 'mpnjsomb': [2681], 'syslog-conn': [601], 'mxxrlogin': [1035], 'scte30': [5168], 'syslog': [514], 'answersoft-lm': [1781], 'ipfltbcst': [4068], 'sophia-lm': [1408], 'mppolicy-v5': [5968], 'liebdevmgmt_a': [3029], 'ratl': [2449], 'panagolin-ident': [9021], 'listcrt-port': [3913], 'citrix-rtmp': [2897], 'bruce': [2619], 'pcanywheredata': [5631], 'sun-as-iiops-ca': [3808], 'swtp-port1': [9281], 'swtp-port2': [9282], 'aruba-server': [7166], 'ddm-rdb': [446], 'fjdocdist': [1848], 'ftps': [990], 'netuitive': [1286], 'systat': [11], 'intrepid-ssl': [11751], 'tdaccess': [2910], 'eserver-pap': [3666], 'ent-engine': [3665], 'qencp': [2120], 'cgms': [3003], 'cvc-hostd': [442], 'ems': [4664], 'smartcard-tls': [4116], 'mobilip-mn': [435], 'avinstalldisc': [3502], 'telelpathstart': [5010], 'cruise-update': [8380], 'globmsgsvc': [2519], 'cpq-wbem': [2301], 'cognex-insight': [1069], 'ds-mail': [4405], 'oma-mlp-s': [9211], 'danf-ak2': [1041], 'atul': [7543], 'vfbp-disc': [6678], 'ice-location': [4061], 'ibm-diradm': [3538], 'ild': [24321], 'esp-lm': [3383], 'ill': [1611], 'altova-lm-disc': [35355], 'zephyr-hm': [2104], 'tftp': [69], 'tcpmux': [1], 'xmpcr-interface': [3877], 'new-rwho': [550], 'pyrrho': [5433], 'sysopt': [3281], 'ptp-general': [320], 'ov-nnm-websrv': [3443], 'sm-pas-4': [2941], 'sm-pas-5': [2942], 'sm-pas-1': [2938], 'sm-pas-2': [2939], 'sm-pas-3': [2940], 'pq-lic-mgmt': [2687], 'fcopy-server': [5745], 'igmpv3lite': [465], 'resource-mgr': [3019], 'rimsl': [2044], 'vtu-comms': [2216], 'stun-behaviors': [5349], 'ita-manager': [5052], 'pmip6-data': [5437], 'pangolin-laser': [3348], 'networklenss': [3410], 'scotty-ft': [14000], 'osu-nms': [192], 'ndl-ahp-svc': [6064], 'mdap-port': [3235], 'lv-not': [2146], 'couchdb': [5984], 'routematch': [1287], 'wsdapi': [5357], 'ismaeasdaqtest': [1950], 'bvtsonar': [1149], 'perfd': [5227], 'nim': [1058], 'itelserverport': [3719], 'nip': [376], 'telops-lmd': [7491], 'cslistener': [9000], 'goahead-fldup': [3057], 'drip': [3949], 'epp': [700, 3044], 'ms-s-sideshow': [5361], 'epc': [1267], 'kali': [2213], 'datusorb': [3282], 'swispol': [6966], 'talon-engine': [7012], 'bf-game': [25954], 'opencm': [3434], 'charsetmgr': [3903], 'prosharevideo': [5714], 'ipdd': [578], 'alchemy': [3234], 'lipsinc1': [1969], 'rnm': [3844], 'hfcs': [4900], 'rtsclient': [2501], 'truecm': [8804], 'xbox': [3074], 'hpidsadmin': [2984], 'picodbc': [1603], 'ice-router': [4063], 'jt400-ssl': [3471], 'hassle': [375], 'directv-soft': [3335], 'pcttunnell': [2274], 'cvmmon': [2300], 'gsiftp': [2811], 'florence': [1228], 'lnvmailmon': [2285], 'rt-viewer': [35001], 'ultraseek-http': [8765], 'uniport': [9629], 'menandmice_noh': [4151], 'commplex-link': [5001], 'autodesk-nlm': [2080], 'sabp-signal': [3452], 'confluent': [1484], 'netrcs': [742], 'opsec-cvp': [18181], 'ansys-lm': [1800], 'ddi-udp-7': [8894], 'ddi-udp-6': [8893], 'pxc-ntfy': [3009], 'entextxid': [12000], 'ndm-server': [1364], 'vrts-at-port': [2821], 'lnvalarm': [2282], 'sec-ntb-clnt': [32635], 'octopus': [10008], 'cimplex': [673], 'ambit-lm': [6831], 'dfserver': [21554], 'rkb-oscs': [1817], 'ff-annunc': [1089], 'td-service': [267], 'h2250-annex-g': [2099], 'evtp': [2834], 'idonix-metanet': [2112], 'catalyst': [2836], 'netport-id': [3129], 'gnunet': [2086], 'tcpnethaspsrv': [475], 'dsmeter-iatc': [4060], 'td-replica': [268], 'iscape': [5047], 'isis': [2042], 'cumulus-admin': [8954], 'mtp': [1911], 'klogin': [543], 'anet': [212], 'cdfunc': [2045], 'mailq': [174], 'xiip': [1924], 'cbos-ip-port': [3750], 'med-fsp-tx': [24002], 'binderysupport': [2302], 'imoguia-port': [3907], 'esro-emsdp': [642], 'tlisrv': [1527], 'itm-mccs': [3084], 'edm-std-notify': [3462], 'm4-network-as': [4345], 'nbx-dir': [2096], 'radmind': [6222], 'rmpp': [1121], 'blp4': [8294], 'blp5': [48129], 'blp2': [8195], 'blp3': [8292], 'blp1': [8194], 'imqbrokerd': [7676], 'apani5': [9164], 'ubxd': [4034], 'websphere-snmp': [3427], 'mpnjsocl': [2685], 'fazzt-ptp': [4038], 'wta-wsp-s': [2805], 'veritas_pbx': [1556], 'codemeter': [22350], 'mns-mail': [2593], 'cadabra-lm': [1563], 'fjicl-tep-a': [1901], 'fjicl-tep-b': [1902], 'fjicl-tep-c': [1904], 'boldsoft-lm': [2961], 'ssslic-mgr': [1203], 'qip-msgd': [2468], 'tasp-net': [25900], 'barracuda-bbs': [5120], 'datasurfsrv': [461], 'upnotifyp': [4445], 'sunlps-http': [3816], 'stun-port': [1994], 'hip-nat-t': [10500], 'xs-openstorage': [1619], 'aesop': [8202], 'webmachine': [1963], 'ipcd3': [1209], 'e-net': [3286], 'turns': [5349], 'hacl-hb': [5300], 'natdataservice': [3927], 'radec-corp': [5430], 'ibm-ssd': [1260], 'biimenu': [18000], 'ideafarm-door': [902], 'checkpoint-rtm': [18241], 'ipcserver': [600], 'nmsigport': [2817, 2839], 'health-trap': [1162], 'mondex': [471], 'geniuslm': [3005], 'nmea-0183': [10110], 'ris-cm': [748], 'elm-momentum': [1914], 'msims': [1582], 'sm-disc': [4174], 'aurora-balaena': [33123], 'ieee-mih': [4551], 'ias-neighbor': [4596], 'rtmp-port': [3500], 'nlogin': [758], 'eudora-set': [592], 'hs-port': [2570], 'athand-mmp': [20999], 'carrius-rshell': [1197], 'telelpathattack': [5011], 'cailic': [216], 'cinegrfx-lm': [1743], 'siipat': [1733], 'topflow': [2885], 'edm-stager': [3461], 'https': [443], 'canon-bjnp3': [8613], 'canon-bjnp2': [8612], 'canon-bjnp1': [8611], 'httpx': [4180], 'canon-bjnp4': [8614], 'dvcprov-port': [3776], 'nta-ds': [7544], 'sicct-sdp': [4742], 'westell-stats': [1875], 'powwow-server': [13224], 'mdtp': [3232], 'acmaint_transd': [775], 'gdomap': [538], 'cap': [1026], 'med-ltp': [24000], 'fs-qos': [41111], 'cal': [588], 'ibp': [2572], 'aspen-services': [1749], 'brcd': [1323], 'stone-design-1': [1492], 'tr-rsrb-p1': [1987], 'tr-rsrb-p3': [1989], 'tr-rsrb-p2': [1988], 'spc': [6111], 'faxstfx-port': [3684], 'icon-discover': [2799], 'tns-cml': [590], 'mmcc': [5050], 'odbcpathway': [9628], 'ms-theater': [2460], 'oma-ulp': [7275], 'emprise-lsc': [3586], 'aol': [5190], 'winport': [3926], 'ls3bcast': [3068], 'integra-sme': [484], 'netserialext4': [16368], 'netserialext3': [16367], 'netserialext2': [16361], 'prm-sm': [408], 'vnwk-prapi': [2538], 'notify-srvr': [3016], 'b-novative-ls': [1896], 'med-net-svc': [24006], 'netxms-agent': [4700], 'tftps': [3713], 'glogger': [2033], 'brain': [2169], 'qmqp': [628], 'nitrogen': [7725], 'leecoposserver': [2212], 'xadmin': [9105], 'openhpid': [4743], 'sgi-storman': [1178], 'prm-nm-np': [1403], 'isis-ambc': [1643], 'sent-lm': [2316], 'mloadd': [1427], 'adapt-sna': [1365], 'rtsp-alt': [8554], 'drwcs': [2193], 'prospero': [191], 'rsvp-tunnel': [363], 'vpnz': [1224], 'altalink': [1845], 'pcia-rxp-b': [1332], 'domain': [53], 'wnn6-ds': [26208], 'teedtap': [559], 'crestron-ctp': [41795], 'ea': [17729], 'encrypted-admin': [1138], 'kana': [2656], 'ultrex': [1327], 'krb5gatekeeper': [1318], 'soap-beep': [605], 'atlinks': [4154], 'bbn-mmx': [1348], 'pulsonixnls': [6140], 'bbn-mmc': [1347], 'lmp': [701], 'lms': [4056], 'rlp': [39], 'liberty-lm': [1496], 'attachmate-s2s': [2419], 'agriserver': [3021], 'qsm-gui': [1165], 'apex-edge': [913], 'hb-engine': [1703], 'opsession-clnt': [3303], 'wimsic': [1326], 'stargatealerts': [1654], 'msfw-s-storage': [2172], 'su-mit-tg': [89], 'caps-lm': [3290], 'brlp-2': [4103], 'servicemeter': [2603], 'courier': [530], 'dns2go': [1227], 'pns': [2487], 'sg-lm': [1659], 'btpp2audctr1': [2536], 'conferencetalk': [1713], 'kwdb-commn': [1127], 'rellpack': [2018], 'xns-courier': [165], 'nfsd-keepalive': [1110], 'jwserver': [1937], 'lvision-lm': [6471], 'aamp': [3939], 'juxml-port': [3642], 'powerguardian': [1777], 'wrs_registry': [2340], 'sunwebadmin': [8800], 'profinet-rt': [34962], 'netiq-ncap': [2219], 'hp-server': [5225], 'ftrapid-2': [1747], 'ftrapid-1': [1746], 'slinterbase': [3065], 'ppsms': [3967], 'xmsg': [1716], 'dhct-alerts': [4676], 'pnaconsult-lm': [2937], 'brutus': [2003], 'ricardo-lm': [1522, 6148], 'teredo': [3544], 'mrm': [679], 'alfin': [16003], 'wsm-server': [5006], 'buddy-draw': [1854], 'noaaport': [2210], 'bhfhs': [248], 'jlicelmd': [1567], 'excerpts': [5401], 'embrace-dp-c': [3198], 'upgrade': [2537], 'daap': [3689], 'proxy-gateway': [2303], 'opcon-xps': [3100], 'embrace-dp-s': [3197], 'indigo-server': [1176], 'vrts-registry': [2410], 'backburner': [2635], 'peport': [1449], 'fairview': [38202], 'synapse': [2880], 'jvclient': [1940], 'smartcard-port': [3516], 'echonet': [3610], 'aairnet-1': [3618], 'sonar': [572], 'amanda': [10080], 'distinct32': [9998], 'netadmin': [2450], 'menandmice-noh': [4151], 'wlanauth': [3810], 'di-ase': [3046], 'montage-lm': [6147], 'enc-tunnel-sec': [3568], 'opentable': [2368], 'loaprobe': [1634], 'avenue': [2134], 'isode-dua': [17007], 'netmap-lm': [1493], 'ifcp-port': [3420], 'sdhelp': [2308], 'openmailg': [5755], 'connendp': [693], 'dmexpress': [32636], 'invision': [1641], 'tnos-dp': [7902], 'unisys-lm': [1823], 'nfoldman': [7393], 'aurp': [387], 'xns-time': [52], 'aura': [2066], 'monp': [3445], 'nest-protocol': [489], 'csoft-prev': [3271], 'miteksys-lm': [1482], 'btprjctrl': [2803], 'aic-np': [2785], 'iniserve-port': [3560], 'ovrimosdbman': [2956], 'ssm-cssps': [2478], 'corerjd': [284], 'informer': [3856], 'avian': [486], 'megaco-h248': [2944], 'aero': [8060], 'psprserver': [2354], 'iwb-whiteboard': [2982], 'eis': [3982], 'iceedcp_tx': [31948], 'grf-port': [3757], 'bpmd': [3593], 'shockwave': [1626], 'vrtstrapserver': [1885], 'elvin-client': [2917], 'wpages': [776], 'sun-sr-admin': [6489], 'iscsi': [860], 'copy-disc': [8445], 'sunwebadmins': [8989], 'trisoap': [10200], 'bex-xr': [15660], 'cis-secure': [22343], 'asf-rmcp': [623], 'nicetec-nmsvc': [2556], 'tunalyzer': [5748], 'nds-sso': [3024], 'gmmp': [4183], 'bluelance': [2877], 'ca-audit-da': [8025], 'ccp': [3947], 'pwrsevent': [2694], 'chargen': [19], 'ca-audit-ds': [8026], 'nced': [404], 'axis-wimp-port': [10260], 'ff-fms': [1090], 'jaus': [3794], 'tcoregagent': [1976], 'llsurfup-http': [1183], 'socp-t': [4881], 'socp-c': [4882], 'cogitate': [3039], 'pawserv': [345], 'netspeak-acd': [21848], 'editbench': [1350], 'amc': [5506], 'alta-ana-lm': [1346], 'amp': [3811], 'ams': [1037], 'amt': [2268], 'stuns': [5349], 'ocs-amu': [429], 'sossecollector': [3166], 'capwap-control': [5246], 'touchnetplus': [2158], 'ocs_amu': [429], 'dberegister': [1479], 'elcsd': [704], 'perf-port': [1995], 'glbp': [3222], 'ms-cluster-net': [3343], 'bctp-server': [10107], 'cba8': [9593], 'nms': [1429], 'business': [3107], 'hacl-probe': [5303], 'plcy-net-svcs': [4351], 'serialgateway': [1243], 'wherehoo': [5859], 'skronk': [460], 'ms-la': [3535], 'asam': [3451], 'msr-plugin-port': [3931], 'src': [200], 'ws-discovery': [3702], 'mos-soap': [10543], 'bacnet': [47808], 'ethernet/ip-1': [2222], 'asap-udp': [3863], 'nsiiops': [261], 'ethernet/ip-2': [44818], 'udrawgraph': [2542], 'oracle-vp1': [1809], 'abatjss': [3656], 'netopia-vo3': [1841], 'oracle-vp2': [1808], 'netopia-vo5': [1843], 'netopia-vo4': [1842], 'wcpp': [4185], 'onehome-help': [2199], 'sco-inetmgr': [615], 'msl-lmd': [1464], 'waascluster': [5787], 'watchdoc': [5744], 'ldgateway': [9592], 'stars': [4131], 'adaptecmgr': [2521], 'ewcappsrv': [1876], 'cadkey-licman': [1399], 'sse-app-config': [3852], 'geognosisman': [4325], 'rrisat': [1697], 'plato-lm': [1819], 'sqlserv': [118], 'rje': [5], 'ccmcomm': [3505], 'bnt-manager': [3344], 'ttlpriceproxy': [5463], 'prodigy-intrnet': [1778], 'nerv': [1222], 'ttc-etap-ds': [2978], 'fsr': [7164], 'fcp-srvr-inst2': [5503], 'fcp-srvr-inst1': [5502], 'keyshadow': [19315], 'adi-gxp-srvprt': [6769], 'ndsconnect': [3890], 'cedros_fds': [4140], 'stresstester': [5397], 'opcua-tls': [4843], 'hacl-qs': [1238], 'simon-disc': [4753], 'pando-sec': [8276], 'ep-pcp': [3620], 'pkt-krb-ipsec': [1293], 'magaya-network': [3691], 'bears-01': [2852], 'proshare2': [1460], 'proshare1': [1459], 'apdap': [3948], 'semantix': [361], 'griffin': [2458], 'iconp': [3972], 'filex-lport': [1887], 'nssocketport': [3522], 'jpegmpeg': [3155], 'av-emb-config': [2050], 'jvl-mactalk': [47100], 'ipdcesgbs': [9214], 'senomix01': [8052], 'senomix02': [8053], 'senomix03': [8054], 'senomix04': [8055], 'senomix05': [8056], 'senomix06': [8057], 'senomix07': [8058], 'senomix08': [8059], 'boosterware': [2913], 'eor-game': [8149], 'hbci': [3000], 'privateark': [1858], 'ismc': [1638], 'ctxlic': [7279], 'devbasic': [5426], 're-conn-proto': [1306], 'nani': [2236], 'doc1lm': [3161], 'tcoflashagent': [1975], 'nbdb': [13785], 'first-defense': [1232], 'dvt-data': [3247], 'apparenet-ui': [3239], 'bis-web': [5584], 'dtn-bundle-udp': [4556], 'sanavigator': [4033], 'shiva-confsrvr': [1651], 'micromuse-ncpw': [9600], 'micromuse-ncps': [7979], 'l-acoustics': [4432], 'noteit': [4663], 'chshell': [562], 'fc-faultnotify': [2819], 'e-dpnet': [2036], 'ghvpn': [12009], 'a4-sdunode': [5605], 'sage-best-com2': [14034], 'sage-best-com1': [14033], 'synchronet-rtc': [6101], 'banyan-net': [2708], 'netaspi': [2902], 'tdp-suite': [1814], 'amqps': [5671], 'patrolview': [4097], 'remote-kis': [185], 'dmidi': [1199], 'watilapp': [1269], 'tacacs': [49], 'mcagent': [1820], 'docstor': [1488], 'nmea-onenet': [10111], 'pwgpsi': [3800], 'ms-sideshow': [5360], 'lhtp': [1983], 'vytalvaultbrtp': [2546], 'ddns-v3': [2164], 'dmaf-caster': [3574], 'netcheque': [4008], 'invision-ag': [45054], 'reftek': [2543], 'scoi2odialog': [360], 'msi-cps-rm-disc': [8675], 'hpstgmgr2': [2715], 'egs': [1926], 'iceedcp_rx': [31949], 'xtreamx': [5793], 'pim-rp-disc': [496], 'rrirtr': [1693], 'ffserver': [3825], 'badm_pub': [6506], 'syslog-tls': [6514], 'sgi-esphttp': [5554], 'etb4j': [16309], 'hylafax': [4559], 'ccowcmr': [2116], 'kshell': [544], 'printer_agent': [3396], 'dlip': [7201], 'mcidas': [112], 'gprs-sig': [3386], 'sql-net': [66, 150], 'discp-server': [2602], 'esmagent': [5601], 'lanschool-mpt': [11796], 'screencast': [1368], 'doglms-notify': [6088], 'csbphonemaster': [1724], 'navisphere-sec': [2163], 'beyond-remote': [5424], 'eportcomm': [4666], 'fjdmimgr': [9374], 'mit-ml-dev': [83, 85], 'netware-ip': [396], 'pxc-spvr-ft': [4002], 'nmc-disc': [10810], 'tungsten-http': [9762], 'op-probe': [7030], 'giga-pocket': [3862], 'raid-sf': [2014], 'asr': [7800], 'med-ovw': [24004], 'hyperip': [3919], 'vocaltec-gold': [6670], 'sybasedbsynch': [2439], 'asa': [386], 'base': [5429], 'asi': [1827], 'fjswapsnp': [1874], 'elxmgmt': [23333], 'tnp1-port': [4024], 'lxi-evntsvc': [5044], 'heartbeat': [3740], 'pnbs': [6124], 'aiagent': [7738], 'ptcnameservice': [597], 'csdm': [1468, 1472], 'osdcp': [3432], 'pmcdproxy': [44322], 'alphatech-lm': [1653], 'enrp': [9901], 'derby-repli': [4851], 'weblogin': [2054], 'caevms': [5251], 'dvapps': [3831], 'ncp': [524], 'strexec-s': [5027], 'cisco-sys': [132], 'hp-sca': [19411], 'ncl': [2397], 'hp-sci': [1299], 'hp-sco': [19410], 'dtk': [365], 'chmd': [3099], 'nms-topo-serv': [1486], 'stt': [1607], 'ace-server': [2475], 'dts': [2594], 'dtp': [3663], 'stx': [527], 'bmc-reporting': [4568], 'spw-dnspreload': [3849], 'dserver': [4309], 'wininstall-ipc': [3674], 'webdata': [3748], 'immedianet-bcn': [3657], 'hlibmgr': [3634], 'rtcm-sc104': [2101], 'prolink': [1678], 'olhost': [2661], 'cableport-ax': [282], 'startron': [1057], 'opnet-smp': [3433], 'gppitnp': [103], 'ccu-comm-1': [4053], 'ccu-comm-3': [4055], 'ccu-comm-2': [4054], 'bzr': [4155], 'nati-svrloc': [3580], 'datasurfsrvsec': [462], 'tdmoip': [2142], 'netops-broker': [5465], 'simbaservices': [1599], 'optohost004': [22004, 22005], 'optohost003': [22003], 'optohost002': [22002], 'tinymessage': [5104], 'sf-lm': [4546], 'mpm-flags': [44], 'beeyond': [2414], 'opc-job-track': [424], '802-11-iapp': [3517], 'nhci': [3842], 'cr-websystems': [2314], 'netrek': [2592], 'syam-agent': [3894], 'nilinkanalyst': [25902], 'gbs-stp': [3484], 'vpjp': [1345], 'tmo-icon-sync': [5583], 'deskview': [3298], 'xfer': [82], 'raadmin': [5676], 'swa-1': [9023], 'portgate-auth': [3710], 'swa-2': [9024], 'swa-4': [9026], 'www-dev': [2784], 'mgcp-callagent': [2727], 'hp-webadmin': [1188], 'backroomnet': [3387], 'orbix-config': [3076], 'ccmad': [3114], 'spramsca': [5769], 'kink': [910], 'spock': [2507], 'sesi-lm': [1714], 'sun-dr': [665], 'bmc-perf-agent': [6767], 'astergate-disc': [9106], 'hpvmmagent': [1125], 'marcam-lm': [1444], 'ads': [2550], 'pdefmns': [16311], 'mps-raft': [1700], 'videobeans': [3058], 'femis': [1776], 'ferrari-foam': [3216], 'lrs-paging': [3700], 'xtgui': [4095], 'pipe_server': [2010], 'nss-routing': [159], 'ms-sql-s': [1433], 'wsman': [5985], 'ms-sql-m': [1434], 'dfoxserver': [2960], 'cpsp': [17222], 'fjmpss': [2509], 'triomotion': [3240], 'tl1-ssh': [6252], 'sdnskmp': [558], 'imap': [143], 'dtp-dia': [3489], 'amx-webadmin': [2929], 'sec-t4net-clt': [9401], 'easy-soft-mux': [2168], 'socorfs': [3379], 'sns-quote': [1967], 'dsm-scm-target': [9987], 'tripwire': [1169], 'sso-service': [2710], 'jps': [2205], 'arcisdms': [262], 'bim-pem': [3783], 'homeportal-web': [3941], 'xmlink-connect': [3953], 'ptk-alink': [3089], 'vnetd': [13724], 'cadkey-tablet': [1400], 'cesdcdtrn': [2922], 'gpfs': [1191], 'amicon-fpsu-s': [30004], 'nmsserver': [2244], 'qadmifoper': [2461], 'snmpdtls-trap': [10162], 'clearvisn': [2052], 'ivsd': [2241], 'eisport': [3525], 'xmlipcregsvc': [9092], 'exapt-lmgr': [3759], 'gsi': [1850], 'remote-as': [1053], 'fyre-messanger': [2731], 'turbonote-1': [39681], 'turbonote-2': [34249], 'redstorm_join': [2346], 'fln-spx': [221], 'boks-clntd': [6503], 'ewnn': [2674], 'cdbroker': [3376], 'bacula-sd': [9103], 'lmdp': [2623], 'cinegrfx-elmd': [2891], 'autocuetime': [3104], 'commtact-https': [20003], 'submission': [587], 'signal': [2974], 'poweralert-nsa': [4150], 'at-zis': [206], 'sftdst-port': [3230], 'tclprodebugger': [2576], 'prm-sm-np': [1402], 'apc-6548': [6548], 'apc-6549': [6549], 'apc-6547': [6547], 'b2-runtime': [2203], 'balour': [4324], 'directv-tick': [3336], 'micromuse-lm': [1534], 'mosaicsyssvc1': [1235], 'ipcore': [2215], 'ssql': [3352], 'quickbooksrds': [3790], 'i-net-2000-npr': [5069], 'photuris': [468], 'perimlan': [4075], 'es-elmd': [1822], 'ew-disc-cmd': [43440], 'bgp': [179], 'directv-web': [3334], 'l3t-at-an': [4591], 'ng-umds': [1690], 'cadis-1': [1441], 'cadis-2': [1442], 'vnas': [577], 'primaserver': [6105], 'o2server-port': [1894], 'ecovisiong6-1': [2896], 'empire-empuma': [1691], 'a26-fap-fgw': [4726], 'iqrm': [10117], 'theta-lm': [2296], 'ecmport': [3524], 'atm-zip-office': [1520], 'client-wakeup': [9694], 'cspclmulti': [2890], 'aipn-reg': [4113], 'raventdm': [2714], 'snmpdtls': [10161], 'hpvirtctrl': [5224], 'datex-asn': [355], 'munin': [4949], 'nati-logos': [2343], 'rprt': [3064], 'iec-104': [2404], 'splitlock-gw': [3647], 'simp-all': [1959], 'xmapi': [1933], 'ivocalize': [5049], 'cplscrambler-lg': [1086], 'elfiq-repl': [1148], 'dlsrap': [1973], 'iclpv-sc': [1390], 'teradataordbms': [8002], 'enpp': [2968], 'nas': [991], 'bmap': [3421], 'enpc': [3289], 'noagent': [1917], '3com-webview': [2339], 'svn': [3690], 'emfis-cntl': [141], 'ewctsp': [6066], 'apc-5456': [5456], 'apc-5455': [5455], 'apc-5454': [5454], 'afs3-rmtsys': [7009], 'ndtp': [2882], 'gf': [3530], 'iafdbase': [480], 'notify': [773], 'acmaint-transd': [775], 'aria': [2624], 'netrjs-3': [73], 'netrjs-2': [72], 'netrjs-1': [71], 'nimcontroller': [48000], 'ldxp': [4042], '4-tieropmgw': [2933], 'pdap': [344], 'quicksuite': [2900], 'watchdoc-pod': [5743], 'bxp': [4027], 'popup-reminders': [7787], 'netagent': [5771], 'topovista-data': [3906], 'broker_service': [3014], 'xandros-cms': [4389], 'tsb2': [2742], 'ulp': [522], 'icl-twobase8': [25007], 'icl-twobase9': [25008], 'nsdeepfreezectl': [7724], 'icl-twobase2': [25001], 'icl-twobase3': [25002], 'icl-twobase1': [25000], 'icl-twobase6': [25005], 'icl-twobase7': [25006], 'icl-twobase4': [25003], 'icl-twobase5': [25004], 'lm-webwatcher': [8208], 'pmdmgr': [7426], 'jmact3': [6961], 'jmact5': [2957], 'g5m': [2732], 'jmact6': [2958], 'oma-rlp-s': [7274], 'nsstp': [1036], 'io-dist-group': [5728], 'oem-agent': [3872], 'fdt-rcatp': [4320], 'psbserver': [2350], 'jetform': [1706], 'aeroflight-ads': [1218], 'stryker-com': [3854], 'ah-esp-encap': [2070], 'elipse-rec': [6515], 'tomato-springs': [3040], 'mevent': [7900], 'joost': [4166], 'ip-qsig': [4029], 'can-dch': [1919], 'lnvpoller': [2280], 'qnts-orb': [1262], 'deos': [76], 'bintec-tapi': [2663], 'jmb-cds1': [8900], 'syscomlan': [1065], 'dtspcd': [6112], 'armcenterhttp': [9294], 'scenidm': [7128], 'efcp': [3671], 'msync': [2072], 'ohsc': [18186], 'ncdmirroring': [2706], 'sec-t4net-srv': [9400], 'sco-sysmgr': [616], 'apertus-ldp': [539], 'wwiotalk': [5413], 'saphostctrls': [1129], 'interhdl_elmd': [1454], 'ds-clnt': [4402], 'inovaport1': [23000], 'inovaport2': [23001], 'inovaport3': [23002], 'inovaport4': [23003], 'inovaport5': [23004], 'inovaport6': [23005], 'intersan': [1331], 'cogsys-lm': [3377], 'cimtrak': [3749], 'pcoip': [4172], '914c/g': [211], 'pclemultimedia': [2558], 'ibm-dt-2': [1792], 'lm-instmgr': [8205], 'giop': [2481], 'altovacentral': [4689], 'citysearch': [3974], 'rt-classmanager': [35004], 'xdmcp': [177], 'ovobs': [30999], 'prospero-np': [1525], 'pichat': [9009], 'iwlistener': [2866], 'msfw-control': [3847], 'smaclmgr': [4660], 'solera-lpn': [4738], 'suncacao-rmi': [11163], 'ofsd': [2322], 'virprot-lm': [7121], 'bhoetty': [351], 'esl-lm': [1455], 'paragent': [9022], 'sip-tls': [5061], 'auth': [113], 'nifty-hmi': [4134], 'udrive': [1867], 'avsecuremgmt': [3211], 'nv-video': [4444], 'wibukey': [22347], 'cqg-netlan-1': [2824], 'globe': [2002], 'http-rpc-epmap': [593], 'an-pcp': [3846], 'joltid': [3531], 'lontalk-urgnt': [1629], 'hmmp-ind': [612], 'wap-push': [2948], 'ultimad': [1737], 'tec5-sdctp': [9668], 'openflow': [6653], 'swa-3': [9025], 'apcupsd': [3551], 'max': [6074], 'hl7': [2575], 'ibm-res': [1405], 'pmsm-webrctl': [2972], 'ecp': [3134], 'vipera-ssl': [12013], 'cspmulti': [2807], 'venus-se': [2431], 'nesh-broker': [3507], 'jprinter': [5309], 'jesmsjc': [27442], 'timed': [525], 'client-ctrl': [3730], 'snapd': [2599], 'stss': [3090], 'mc-client': [1180], 'rcp': [469], 'netiq-voipa': [10116], 'whois++': [63], 'qsnet-workst': [4355], 'gadgetgate1way': [2677], 'streamcomm-ds': [9612], 'ni-ftp': [47], 'yo-main': [4040], 'dgpf-exchg': [6785], 'pcihreq': [3085], 'worldwire': [2371], 'digital-vrc': [466], 'caiccipc': [1202], 'iccrushmore': [6850], 'mapper-mapethd': [3985], 'cyc': [3645], 'mvx-lm': [1510], 'service-ctrl': [2367], 'ipether232port': [3497], 'a1-msc': [5602], 'attachmate-uts': [2304], 'de-server': [1256], 'sybase-sqlany': [1498], 'apple remote desktop (net assistant)': [3283], 'netbios-ssn': [139], 'powerschool': [5071], 'ncu-1': [3195], 'ncu-2': [3196], 'lnvstatus': [2283], 'ewall': [1328], 'interintelli': [2633], 'a13-an': [3125], 'raventbs': [2713], 'f5-globalsite': [2792], 'connected': [16384], 'pk-electronics': [2634], 'urm': [606], 'indy': [5963], 'talk': [517], 'ratio-adp': [1108], 'indi': [7624], 'newlixconfig': [2076], 'nuauth': [4129], 'dlms-cosem': [4059], 'seraph': [4076], 'questdb2-lnchr': [5677], 'rlzdbase': [635], 'menandmice-lpm': [1231], 'vspread': [2695], 'di-drm': [2226], 'd2k-tapestry1': [3393], 'd2k-tapestry2': [3394], 'bgmp': [264], 'mcs-mailsvr': [3332], 'iscsi-target': [3260], 'twsdss': [3012], 'can-nds-ssl': [3660], 'as-servermap': [449], 'cardax': [1072], 'dpm': [5718], 'mpidcmgr': [9343], 'xmquery': [2279], 'infotos': [18881], 'gsigatekeeper': [2119], 'idotdist': [2590], 'galileolog': [3520], 'sqlexec': [9088], 'backupedge': [3946], 'trnsprntproxy': [3346], 'ansysli': [2325], 'biolink-auth': [3411], 'tabula': [1437], 'ora-lm': [1446], 'warmspotmgmt': [1074], 'apollo-admin': [8122], 'event_listener': [3017], 'ivecon-port': [3258], 'snpp': [444], 'novar-global': [23402], 'sdp-portmapper': [3935], 'qft': [189], 'seaview': [3143], 'qfp': [5083], 'dec-mbadmin-h': [1656], 'aspeclmd': [1544], 'infoexch': [3667], 'dx-instrument': [1325], 'dirgis': [2496], 'kastenxpipe': [36865], 'xvttp': [508], 'seclayer-tls': [3496], 'i-zipqd': [13160], 'willy': [2518], 'vxcrnbuport': [3652], 'dxspider': [8873], 'csvr-proxy': [3190], 'outlaws': [5310], 'ebinsite': [2651], 'tonidods': [24465], 'mma-discovery': [4173], 'zicom': [3774], 'park-agent': [5431], 'zabbix-trapper': [10051], 'ott': [2428], 'otv': [8472], 'surveyinst': [3212], 'aocp': [2712], 'uucp-path': [117], 'stat-scanner': [4157], 'ndl-aps': [3096], 'mtportmon': [7421], 'msfw-array': [2174], 'uacs': [2768], 'itm-mcell-u': [1828], 'elpro_tunnel': [4370], 'polestar': [1060], 'as-debug': [4026], 'wsmans': [5986], 'rtip': [771], 'ife_icorp': [5165], 'mqe-agent': [3958], 'ironmail': [3206], 'opentrac': [3855], 'ivmanager': [1276], 'http': [80], 'pharos': [4443], 'swift-rvf': [97], 'us-srv': [8083], 'odn-castraq': [2498], 'vx-auth-port': [3207], 'microsan': [20001], 'boscap': [2990], 'idmgratm': [32896], 'rnrp': [2423], 'nsrp': [7170], 'mini-sql': [1114], 'ping-pong': [3010], 'mpfwsas': [2952], 'elatelink': [2124], 'vcrp': [3073], 'interhdl-elmd': [1454], 'sun-mc-grp': [5306], 'isoipsigport-1': [1106], 'pacom': [3435], 'ss-idi-disc': [20012], 'candp': [42508], 'global-dtserv': [1774], 'netbill-auth': [1615], 'proofd': [1093], 'decauth': [316], 'opalis-rdv': [536], 'famdc': [10081], 'dashpas-port': [3498], 'qke-llc-v3': [2523], 'nimrod-agent': [1617], 'tenfold': [658], 'fcip-port': [3225], 'trap-port': [3857], 'dcs-config': [3988], 'x25-svc-port': [1998], 'dicom-tls': [2762], 'precise-i3': [3607], 'vrts-ipcserver': [1317], 'ifor-protocol': [1515], 'prosharenotify': [5717], 'stm_pproc': [3080], 'ea1': [1791], 'iris-lwz': [715], 'netview-aix-11': [1671], 'netview-aix-10': [1670], 'netview-aix-12': [1672], 'fksp-audit': [3729], 'wimd': [2980], 'cequint-cityid': [4074], 'tivoli-npm': [1965], 'umm-port': [3098], 'spss-lm': [1759], 'dssiapi': [1265], 'gaia': [4340], 'idmaps': [1884], 'evtp-data': [2835], 'instantia': [1240], 'dmp': [5031], 'btpp2sectrans': [2444], 'dtn1': [2445], 'spytechphone': [8192], 'vrcommerce': [2530], 'sco-peer-tta': [5427], 'sunvts-rmi': [6483], 'teleniumdaemon': [2060], 'a17-an-an': [4599], 'pvsw': [2520], 'netsc-prod': [154], 'xsmsvc': [6936], 'mfcobol': [86], 'gss-xlicen': [128], 'cqg-netlan': [2823], 'ssmd': [2187], 'evb-elm': [1504], 'ups-engine': [3664], 'emcsymapiport': [2707], 'hnm': [6791], 'bcs': [4677], 'lumimgrd': [4741], 'pgps': [9280], 'dynamid': [9002], 'navegaweb-port': [3159], 'p2pcommunity': [3955], 'netboot-pxe': [3928], 'metaagent': [1897], 'vista-4gl': [24249], 'nsjtp-ctrl': [1687], 'vt-ssl': [3509], 'webobjects': [1085], 'cardbox': [3105], 'apocd': [3809], 'guibase': [9321], 'odette-ftps': [6619], 'webtie': [3342], 'cvspserver': [2401], 'cxws': [4673], 'ups': [401], 'ttcmremotectrl': [3468], 'docent': [2151], 'entp': [1865], 'nm-game-server': [3149], 'vmware-fdm': [8182], 'topflow-ssl': [3885], 'opsession-prxy': [3307], 'lofr-lm': [1752], 'tipc': [6118], 'asia': [626], 'armtechdaemon': [9292], 'sddp': [1163], 'utmpcd': [431], 'drp': [1974], 'ariel1': [419], 'ariel3': [422], 'ariel2': [421], 'rcst': [3467], 'tip2': [3372], 'wsicopy': [3378], 'cctv-port': [3559], 'csoft1': [1837], 'altserviceboot': [4011], 'rmiregistry': [1099], 'sceanics': [5435], 'norton-lambert': [2338], 'bv-ds': [3992], 'rebol': [2997], 'm-wnn': [3732], 'dbstar': [1415], 'netop-school': [1971], 'tell': [754], 'virtual-time': [1852], 'cichild-lm': [1523], 'knet-cmp': [157], 'vmnet': [175], '3d-nfsd': [2323], 'smwan': [3979], 'gbmt-stars': [3912], 'sasggprs': [3964], 'tag-pm': [5073], 'ufmp': [6306], 'tw-auth-key': [27999], 'dta-systems': [13929], 'psdbserver': [2355], 'vfo': [1056], 'ocserver': [184], 'idig-mux': [4152], 'uaac': [145], 'vmpwscs': [214], 'mctet-gateway': [3116], 'wssauthsvc': [4537], 'opsec-ela': [18187], 'entrust-sps': [640], 'murray': [1123], 'us-cli': [8082], 'scoremgr': [2034], 'antidotemgrsvr': [2247], 'celatalk': [3485], 'simple-push-s': [3688], 'konshus-lm': [2294], 'etlservicemgr': [9001], 'mxi': [8005], 'contentserver': [454, 3365], 'netiq-endpoint': [10113], 'vcom-tunnel': [8001], 'foliocorp': [2242], 'mountd': [20048], 'metagram': [99], 'spcsdlobby': [2888], 'cabsm-comm': [7161], 'pay-per-view': [1564], 'maincontrol': [2516], 'dawn': [1908], 'commplex-main': [5000], 'bfd-control': [3784], 'dsmcc-ccp': [13822], 'rtc-pm-port': [3891], 'xxnetserver': [3832], 'ubroker': [7887], 'unify-adapter': [1889], 'utcd': [1506], 'jerand-lm': [1810], 'propel-msgsys': [1268], 'infowave': [2082], 'wap-vcal': [9205], 'iclpv-wsm': [1395], 'webaccess': [1739], 'ssp-client': [7801], 'terminaldb': [2008], 'piranha1': [4600], 'edtools': [1142], 'ansanotify': [116], 'svs-omagent': [1625], 'triquest-lm': [1588], 'embl-ndt': [394], 'cosmocall': [2324], 'nburn-id': [20034], 'circle-x': [2931], 'sms-remctrl': [2704], 'zre-disc': [5670], 'cardbox-http': [3106], 'p-net-local': [34378], 'dxmessagebase1': [2874], 'dxmessagebase2': [2875], 'ft-role': [2429], 'hughes-ap': [5105], 'dbref': [2365], 'passgo-tivoli': [627], 'entrusttime': [309], 'monkeycom': [9898], 'solera-epmap': [2132], 'ideafarm-panic': [903], 'lbc-watchdog': [2816], 'hdl-srv': [2641], 'alarm': [2740], 'ndl-tcp-ois-gw': [2738], 'mfserver': [2266], 'bmc-messaging': [2059], 'ndmp': [10000], 'sun-as-jmxrmi': [8686], 'lstp': [2559], 'ttnrepository': [2943], 'unisql-java': [1979], 'bmcpatrolrnvu': [3182], 'ldap': [389], 'hrpd-ith-at-an': [4592], 'mpidcagt': [9397], 'smux': [199], 'exasoftport1': [3920], 'filenet-pch': [32775], 'snifferserver': [2533], 'mapper-ws-ethd': [3986], 'zion-lm': [1425], 'bcs-lmserver': [1951], 'ocs_cmu': [428], 'localinfosrvr': [1487], 'megaregsvrport': [3572], 'mysql-im': [2273], 'ltp-deepspace': [1113], 'digivote': [3223], 'g-talk': [2421], 'cpdi-pidas-cm': [3609], 'xsip-network': [1354], 'sais': [1426], 'zigbee-ips': [17756], 'dctp': [675], 'nicetec-mgmt': [2557], 'oms': [4662], 'odnsp': [9966], 'ttc-ssl': [2484], 'esri_sde': [5151], 'boinc-client': [1043], 'fjcp': [3648], 'commtact-http': [20002], 'wusage': [2396], 'ipulse-ics': [20222], 'unicall': [4343], 'dtag-ste-sb': [352], 'periscope': [1230], 'bv-smcsrv': [3991], 'magbind': [3194], 'timelot': [3243], 'ncacn-ip-tcp': [3062], 'tinc': [655], 'acp-policy': [3824], 'ads-c': [5913], 'wag-service': [2608], 'dsmeter_iatc': [4060], 'pe-mike': [1305], 'sun-sr-https': [6443], 'mcp': [4458], 'imqtunnels': [7674], 'esps-portal': [2867], 'slp': [1605], 'ovbus': [7501], 'fjippol-cnsl': [2749], 'bis-sync': [5585], 'mediavault-gui': [3673], 'palace-6': [9997], 'palace-5': [9996], 'd-fence': [8555], 'palace-3': [9994], 'submitserver': [2028], 'palace-1': [9992], 'nomdb': [13786], 'ampify': [8040], 'livelan': [1555], 'msp-os': [4686], 'l3-ranger': [2841], 'zented': [1229], 'ibm-mqisdp': [1883], 'enc-tunnel': [8567], 'sps-tunnel': [2876], 'kis': [186], 'kvm-via-ip': [1132], 'mpc-lifenet': [1213], 'taurus-wh': [1610], 'combox-web-acc': [2534], 'dna-cml': [436], 'unidata-ldm': [388], 'identify': [2987], 'amt-redir-tls': [16995], 'remoteware-srv': [3002], 'pdap-np': [1526], 't2-drm': [7932], 'vrpn': [3883], '3com-njack-1': [5264], '3com-njack-2': [5265], 'novell-lu6-2': [1416], 'opcua-udp': [4840], 'ipt-anri-anri': [4593], 'nettest': [4138], 'applix': [999], 'sxmp': [3273], 'verismart': [3270], 'notateit-disc': [4803], 's102': [23272], 'bmc_ctd_ldap': [6301], 'isomair': [3589], 'shaperai-disc': [43210], 'cp-cluster': [8116], 'downtools-disc': [5245], 'ddi-udp-5': [8892], 'ddi-udp-4': [8891], 'apc-2160': [2160], 'apc-2161': [2161], 'ddi-udp-1': [8888], 'ddi-udp-3': [8890], 'ddi-udp-2': [8889], 'www': [80], 'mccwebsvr-port': [3570], 'orbiter': [2398], 'apani4': [9163], 'apani3': [9162], 'apani2': [9161], 'apani1': [9160], 'daytime': [13], 'statusd': [5414], 'maitrd': [997], 'glrpc': [9080], 'tmophl7mts': [20046], 'rmlnk': [2818], 'vsixml': [2996], 'vs-server': [3280], 'nicelink': [1095], 'videotex': [516], 'e-woa': [3728], 'postgresql': [5432], 'ipsendmsg': [1992], 'beserver-msg-q': [3527], 'svrloc': [427], 'mxomss': [1141], 'fg-gip': [3294], 'armadp': [1913], 'lan900-remote': [2395], 'eye2eye': [1948], 'us-gv': [1370], 'rvs-isdn-dcp': [2578], 'imip': [11319], 'nta-us': [7545], 'fc-cli': [1371], 'traceroute': [33434], 'sonus': [2653], 'batman': [4305], 'qwave': [2177], 'umsp': [2110], 'ique': [18769], 'armcenterhttps': [9295], 'lm-dta': [8206], 'boomerang': [1304], 'whisker': [3233], 'n1-fwp': [4446], 'netview-aix-9': [1669], 'classic': [9087], 'amx-icsp': [1319], 'https-wmap': [8991], 'tpmd': [1906], 'search-agent': [1234], 'msolap-ptp2': [2725], 'netmo-http': [6842], 'warehouse': [12322], 'a15': [3598], 'a14': [3597], 'qbdb': [8019], 'journee': [3042], 'opc-job-start': [423], 'muse': [6888], 'nssagentmgr': [4454], 'jaleosnd': [1623], 'openmailpxy': [5768], 'sunscalar-svc': [1860], 'fse': [7394], 'cajo-discovery': [1198], 'fnet-remote-ui': [1174], 'prchat-user': [4455], 'sagxtsds': [4952], 'sdsc-lm': [1537], 'nav-port': [3859], 'radclientport': [3178], 'fujitsu-dtcns': [1514], 'awg-proxy': [3277], 'sah-lm': [3291], 'n1-rmgmt': [4447], 'compressnet': [2, 3], 'inbusiness': [244], 'rsqlserver': [4430], 'calltrax': [3675], 'ls3': [3069], 'sgcip': [16950], 'ljk-login': [472], 'gw-call-port': [3745], 'oraclenet8cman': [1630], 'item': [3848], 'adtempusclient': [3760], 'xdtp': [3088], 'funk-license': [1787], 'crinis-hb': [3818], 'dslremote-mgmt': [2420], 'ntalk': [518], 'ace-client': [2334], 'irdg-post': [2632], 'swistrap': [6965], 'netnews': [532], 'kerberos-iv': [750], 'interactionweb': [3508], 'repscmd': [653], 'integrius-stp': [17234], 'univision': [2820], 'pdtp': [6086], 'tetrinet': [31457], 'enc-eps': [3567], 'stmf': [501], 'sco-dtmgr': [617], 'elanlm': [4346], 'q55-pcc': [1253], 'haipe-otnk': [3769], 'apx500api-2': [2265], 'apx500api-1': [2264], 'cs-live': [2129], 'cisco-snat': [15555], 'signet-ctf': [2733], 'mshnet': [1989], 'tl1-raw-ssl': [6251], 'tn-tl-w2': [474], 'esmmanager': [5600], 'upnotifyps': [3356], 'zephyr-srv': [2102], 'writesrv': [1334], 'sagectlpanel': [3698], 'sns-agent': [5417], 'icad-el': [425], 'dsmcc-session': [13819], 'canon-capt': [3756], 'thrp': [3963], 'opsec-ufp': [18182], 'parliant': [4681], 'pconnectmgr': [1562], 'bacula-dir': [9101], 'movaz-ssc': [5252], 'ardus-mtrns': [1117], 'wlbs': [2504], 'rbakcup2': [2774], 'cpqrpm-server': [3257], 'cnap': [7262], 'fodms': [7200], 'ddm-ssl': [448], 'fiorano-msgsvc': [1856], 'ncube-lm': [1521], 'openport': [260], 'jmb-cds2': [8901], 'idp': [4067], 'nmsp': [537, 1790], 'entexthigh': [12002], 'nmsd': [1239], 'direcpc-video': [1825], 'cisco-vpath-tun': [6633], 'lpcp': [1298], 'mao': [2908], 'ariliamulti': [3140], 'matip-type-a': [350], 'matip-type-b': [351], 'necp': [3262], 'gvcp': [3956], 'visitview': [1631], 'appleqtc': [458], 'pago-services1': [30001], 'monitor': [561], 'phonex-port': [3177], 'shofar': [4105], 'policyserver': [3055], 'texar': [333], 'listmgr-port': [3767], 'iatp-highpri': [6998], 'ns-server': [5415], 'xmltec-xmlmail': [9091], 'binkp': [24554], 'isbconference2': [1245], 'tvbus': [2191], 'veritas-pbx': [1556], 'isbconference1': [1244], 'btrieve': [3351], 'isoipsigport-2': [1107], 'msfrs': [4554], 'netrockey6': [4425], 'skip-cert-send': [6456], 'afs3-vlserver': [7003], 'adrep': [3954], 'ii-admin': [3006], 'iasd': [432], 'fiveacross': [1193], 'isis-bcast': [2043], 'icpv2': [3130], 'centerline': [3987], 'fagordnc': [3873], 'brightcore': [5682], 'mercantile': [3398], 'aipn-auth': [3833], 'pciarray': [1552], '3com-net-mgmt': [2391], 'nrcabq-lm': [1458], 'n2nremote': [1685], 'nufw': [4128], 'xpl': [3865], 'registrar': [1712], 'busycal': [4990], 'config-port': [3577], 'aimpp-hello': [2846], 'rtsp': [554], 'proshareaudio': [5713], 'crip': [6253], 'rmopagt': [2959], 'virtualuser': [5423], 'bfd-echo': [3785], 'queueadm': [2230], 'miami-bcast': [6083], 'bootclient': [2017], 'amt-soap-https': [16993], 'permabit-cs': [5312], 'cleanerliverc': [3481], 'telnet': [23], 'hacl-local': [5304], 'lan900_remote': [2395], 'edm-manager': [3460], 'rsc-robot': [1793], 'nacnl': [4361], 'simplement-tie': [2756], 'privoxy': [8118], 'dasp': [439], 'pktcable-cops': [2126], 'piccolo': [2787], 'server-find': [8351], 'erpc': [121], 'conspiracy': [4692], 'mpnjsosv': [2684], 'xmlblaster': [3412], 'track': [20670], 'rdrmshc': [1075], 'cisco-sccp': [2000], 'ctsd': [5137], 'gtrack-server': [3591], 'nls-tl': [7549], 'metasage': [1207], 'kopek-httphead': [27504], 'netconfsoapbeep': [833], 'oma-rlp': [7273], 'mdnsresponder': [5354], 'ddrepl': [4126], 'sdo-ssh': [3897], 'dyna-lm': [3395], 'cisco-ipsla': [1167], 'amx-weblinx': [2930], 'dict': [2628], 'helix': [10860], 'rbakcup1': [2773], 'ehp-backup': [3638], 'chromagrafx': [1373], 'ncpm-pm': [1591], 'vistium-share': [1545], 'prm-nm': [409], 'h323gatestat': [1719], 'sgmp-traps': [160], 'mti-tcs-comm': [2469], 'ardusmul': [1835], 'kermit': [1649], 'ovhpas': [7510], 'pump': [751], 'consul-insight': [5992], 'nntp': [119], 'slingshot': [1705], 'netconf-beep': [831], 'jbroker': [2506], 'msgsys': [9594], 'wsdapi-s': [5358], 'tellumat-nms': [3549], 'dbcontrol_agent': [3938], 'suucp': [4031], 'saratoga': [7542], 'rs-pias': [13217], 'dka': [1263], 'scpi-raw': [5025], 'sns-gateway': [5416], 'alljoyn-mcm': [9955], 'mobilitysrv': [6997], 'nimspooler': [48001], 'd-s-n': [8086], 'bpcp-trap': [2845], 'netbookmark': [3131], 'ms-shuttle': [568], 'qip-login': [2366], 'ms-alerter': [5359], 'mcs-calypsoicf': [3330], 'traversal': [4678], 'nati-vi-server': [3363], 'gnutella-rtr': [6347], 'vat-control': [3457], 'pwdgen': [129], 'impera': [1710], 'proaxess': [3961], 'interserver': [3060], 'psmond': [1788], 'webphone': [21845], 'twcss': [3428], 'intel-rci-mp': [16991], 'dzoglserver': [3867], 'talarian-udp': [5101], 'nbt-pc': [5133], 'sbook': [1349], 'asprovatalk': [1079], 'epmd': [4369], 'dpkeyserv': [1780], 'nm-asses-admin': [3150], 'interbase': [2041], 'nsjtp-data': [1688], 'atsc-mh-ssc': [4937], 'cppdp': [4051], 'v-one-spp': [3845], 'tnetos': [377], 'vytalvaultpipe': [2548], 'cncp': [4785], 'hp-3000-telnet': [2564], 'vmrdp': [2179], 'ms-rule-engine': [3132], 'cymtec-port': [1898], 'lm-perfworks': [8204], 'ovtopmd': [2532], 'pftp': [662], 'kdnet': [5364], 'dbcontrol-oms': [1158], 'multiplex': [171], 'm2ua': [2904], 'utsftp': [2529], 'streettalk': [566], 'jwclient': [1938], 'netsc-dev': [155], 'lds-dump': [6544], 'trendchip-dcp': [3608], 'socalia': [5100], 'veritas-ucl': [2148], 'enl-name': [1805], 'zen-pawn': [7628], 'gilatskysurfer': [3013], 'ultrabac': [1910], 'grid': [6268], 'mon': [2583, 9255], 'dbase': [217], 'varadero-1': [4838], 'varadero-0': [4837], 'varadero-2': [4839], 'office-tools': [7789], 'samsung-unidex': [4010], 'radio-bc': [1596], 'empowerid': [7080], 'lm-sserver': [8207], 'mbl-battd': [4153], 'msft-gc': [3268], 'naap': [1340], 'trispen-sra': [9555], 'facilityview': [1561], 'ccss-qmm': [4969], 'mnp-exchange': [2197], 'l3-exprt': [2840], 'sunclustermgr': [1097], 'fatserv': [347], 'twrpc': [3479], 'llrp': [5084], 'beacon-port-2': [4426], 'wcbackup': [8912], 'loadav': [750], 'allpeers': [36001], 'avantageb2b': [2131], 'tht-treasure': [1832], 'gbjd816': [2626], 'bfd-lag': [6784], 'teamcoherence': [9222], 'funkproxy': [1505], 'iph-policy-cli': [2962], 'ovladmgr': [7428], 'vrtp': [2255], 'personal-agent': [5555], 'applus': [2037], 'mcs-messaging': [3331], 'filenet-obrok': [32777], 'filenet-cm': [32773], 'fujitsu-dtc': [1513], 'e-mdu': [3727], 'vcs-app': [14141], 'prregister': [4457], 'netiq-mc': [2735], 'suitcase': [2903], 'vhd': [3802], 'ms-olap1': [2393], 'ms-olap3': [2382], 'ms-olap2': [2394], 'ms-olap4': [2383], 'bpjava-msvc': [13722], 'trim-event': [4322], 'compx-lockview': [4308], 'personnel': [3109], 'cernsysmgmtagt': [3830], 'hybrid': [1424], 'sns-channels': [3380], 'ulpnet': [483], 'eicon-x25': [1439], 'corelvideo': [1566], 'iris-beep': [702], 'hp-pxpib': [3101], 'snifferclient': [2452], 'orbplus-iiop': [1597], 'hpocbus': [2206], 'atc-lm': [1170], 'husky': [1310], 'documentum-s': [10003], 'wpgs': [780], 'atc-appserver': [1171], 'freeciv': [5556], 'de-noc': [1254], 'amberon': [8301], 'smauth-port': [3929], 'esro-gen': [259], 'masqdialer': [224], 'iden-ralp': [1725], 'proxima-lm': [1445], 'crmsbits': [2422], 'iua': [9900], 'xprint-server': [8100], 'pkagent': [3118], 'microsoft-ds': [445], 'worldfusion1': [2595], 'worldfusion2': [2596], 'grubd': [3136], 'x-bone-ctl': [265], 'markem-dcp': [3836], 'sns-admin': [2658], 'vofr-gateway': [21590], 'lonworks': [2540], '3l-l1': [1511], 'sns-query': [2659], 'ipcs-command': [3743], 'ggz': [5688], 'ms-sna-base': [1478], 'usicontentpush': [7998], 'ecwcfg': [2263], 'hp-hcip-gwy': [1803], 'cd3o-protocol': [3616], 'citynl': [1729], 'appman-server': [3312], 'mctet-jserv': [3117], 'emp-server1': [6321], 'privatewire': [4449], 'cmmdriver': [1294], 'emp-server2': [6322], 'chipper': [17219], 'tn-timing': [2739], 'ni-visa-remote': [3537], 'wizard': [2001], 'hp-hcip': [1782], 'tapeware': [3817], 'nfsrdma': [20049], 'moy-corp': [2488], 'ias-reg': [2140], 'driveappserver': [1930], 'quest-disc': [7040], 'distinct': [9999], 'denali-server': [3444], 'pcle-infex': [3189], 'optocontrol': [22001], 'slp-notify': [1847], 'lm-x': [6200], 'infoseek': [414], 'filenet-tms': [32768], 'ttg-protocol': [2862], 'sge-execd': [6445], 'notify_srvr': [3016], 'alarm-clock-c': [2668], 'ridgeway2': [2777], 'dpserve': [7020], 'tpip': [594], 'scx-proxy': [470], 'cpqrpm-agent': [3256], 'alarm-clock-s': [2667], 'sntp-heartbeat': [580], 'spiral-admin': [3438], 'ibm-mgr': [3801], 'sercomm-scadmin': [6108], 'winshadow': [3261], 'cso': [105], 'pkix-3-ca-ra': [829], 'anoto-rendezv': [3715], 'smsd': [596], 'inst-discovery': [4878], 'sacred': [1118], 'taskman-port': [2470], 'smsp': [413], 'gv-us': [1369], 'msfw-replica': [2173], 'ati-ip-to-ncpe': [3965], 'net2display': [9086], 'ssh-mgmt': [17235], 'mmpft': [1815], 'wilkenlistener': [1890], 'gotodevice': [2217], 'bftp': [152], 'coap': [5683], 'patrol-mq-gm': [2664], 'ds-slp': [4406], 'maytagshuffle': [2591], 'gsakmp': [3761], 'dbbrowse': [47557], 'fortisphere-vm': [4084], 'samd': [3275], 'pictrography': [1280], 'netwatcher-mon': [3203], 'pcp': [5351], 'apollo-status': [2758], 'hp-san-mgmt': [3037], 'decvms-sysmgt': [441], 'aic-oncrpc': [2786], 'ms-licensing': [5720], 'cisco-net-mgmt': [1741], 'msg-auth': [31], 'med-fsp-rx': [24001], 'officelink2000': [3320], 'ordinox-dbase': [3355], 'bounzza': [2218], 'icpp': [14142], 'saiscm': [1501], 'axon-lm': [1548], 'ca-web-update': [14414], 'indura': [3156], 'di-traceware': [3041], 'uorb': [3313], 'bfd-multi-ctl': [4784], 'rockwell-csp1': [2221], 'abr-api': [1954], 'mos-upper': [10541], 'badm-pub': [6506], 'connect': [2137], 'harp': [1816], 'espeech': [8416], 'pit-vpn': [2865], 'acd-pm': [8793], 'hpidsagent': [2985], 'enc-eps-mc-sec': [5567], 'spw-dialer': [3796], 'netviewdm3': [731], 'canocentral1': [1872], 'netviewdm1': [729], 'acptsys': [2149], 'bitspeer': [2178], 'csccredir': [40842], 'sbl': [1039], 'dtp-net': [8732], 'kftp-data': [6620], 'nxedit': [126], 'wrs-registry': [2340], 'hacl-monitor': [3542], 'razor': [3555], 'honyaku': [2744], 'ezrelay': [10103], 'sunscalar-dns': [1870], 'serverview-rm': [3172], 'dddp': [9131], 'shadowserver': [2027], 'menandmice-dns': [1337], 'catchpole': [1185], 'goldleaf-licman': [1401], 'miles-apart': [2621], 'smc-admin': [6787], 'decladebug': [410], 'csvr': [3417], 'dossier': [1175], 'novar-alarm': [23401], 'apm-link': [32483], 'padl2sim': [5236], 'xns-mail': [58], 'lorica-out-sec': [4083], 'sge_qmaster': [6444], 'emwavemsg': [20480], 'ltcudp': [3487], 'intuitive-edge': [1355], 'mmcals': [2271], 'tigv2': [4124], 'plysrv-http': [6770], 'solve': [2636], 'accuracer': [12007], 'essp': [2969], 'rushd': [696], 'ctt-broker': [1932], 'iafserver': [479], 'amicon-fpsu-ra': [30003], 'lonewolf-lm': [6146], 'iso-tsap': [102], 'jtag-server': [1309], 'fxaengine-net': [3402], 'array-manager': [3726], 'ms-wbt-server': [3389], 'find': [24922], 'fpitp': [1045], 'vsnm-agent': [3375], 'mpnjsomg': [2686], 'pafec-lm': [7511], 'iiop': [535], 'passwrd-policy': [1333], 'eapsp': [2291], 'houdini-lm': [1715], 'afs3-fileserver': [7000], 'silc': [706], 'unisql': [1978], 'wta-wsp-wtp-s': [2923], 'dccp-udp': [6511], 'asctrl-agent': [5155], 'mysql-proxy': [6446], 'opsec-sam': [18183], 'rmtserver': [2416], 'remoteware-cl': [3000], 'galaxy7-data': [38201], 'odsi': [1308], 'creativeserver': [453, 3364], 'prnrequest': [3910], 'synoptics-trap': [412], 'scte104': [5167], 'warmux': [3826], 'dwmsgserver': [3228], 'slim-devices': [3483], 'imsp': [406], 'eenet': [5234], 'csvr-sslproxy': [3191], 'pluribus': [3469], 'password-chg': [586], 'rsvp-encap-1': [1698], 'rsvp-encap-2': [1699], 'rblcheckd': [3768], 'ampr-inter': [1536], 'netblox': [4441], 'cspmlockmgr': [1272], 'afs3-prserver': [7002], 'nexus-portal': [4021], 'esri-sde': [5151], 'mphlpdmc': [9344], 'pmdfmgt': [7633], 'ccs-software': [2734], 'imdocsvc': [2637], 'pammrpc': [1633], 'qftest-lookup': [3543], 'unix-status': [1957], 'mikey': [2269], 'feitianrockey': [3152], 'collaborator': [622], 'statsci1-lm': [6144], 'dxadmind': [1958], 'liebdevmgmt_c': [3027], 'lm-mon': [31620], 'unify': [181], 'clearcase': [371], 'eportcommdata': [4669], 'epncdp2': [3259], 'spectardb': [3835], 'arepa-cas': [3030], 'sapv1': [9875], 'gris': [2135], 'xtrm': [3423], 'h323gatedisc': [1718], 'wap-wsp': [9200], 'gacp': [190], 'facsys-router': [2515], 'apex-mesh': [912], 'sonus-logging': [2290], 'italk': [12345], 'canon-cpp-disc': [8609], 'snapenetio': [22000], 'aegate': [4549], 'espeech-rtp': [8417], 'pssc': [645], 'netplay-port2': [3641], 'bioserver': [6946], 'netplay-port1': [3640], 'odeumservlink': [3523], 'sms-chat': [2703], 'slc-systemlog': [2826], 'smart-lm': [1608], 'ldp': [646], 'cisco-wafs': [4050], 'insitu-conf': [1490], 'alpes': [463], 'netcelera': [3701], 'optima-vnet': [1051], 'snac': [3536], 'cawas': [12168], 'snap': [4752], 'ioc-sea-lm': [1579], 'soundsvirtual': [17185], 'pipe-server': [2010], 'sa-msg-port': [1646], 'mt-scaleserver': [2305], 'bip': [4376], 'dpi-proxy': [1795], 'keysrvr': [19283], 'tksocket': [2915], 'comsat': [512], 'mctp': [1100], 'mngsuite': [9535], 'bpcp-poll': [2844], 'rfx-lm': [1497], 'mkm-discovery': [3837], 'mupdate': [3905], 'sd-capacity': [2384], 'orbix-cfg-ssl': [3078], 'dsx-agent': [3685], 'mylxamport': [2981], 'mmcal': [2272], 'vtsas': [5070], 'solid-e-engine': [1964], 'cyaserv': [2584], 'saiseh': [1644], 'ampr-rcmd': [459], 'hpvmmdata': [1126], 'daishi': [2870], 'badm_priv': [6505], 'fazzt-admin': [4039], 'vergencecm': [2771], 'nsp': [5012], 'nss': [4159], 'nst': [4687], '2ping': [15998], 'sdt': [5568], 'sds': [5059], 'smart-diagnose': [2721], 'directplay8': [6073], 'asip-webadmin': [311], 'imagepump': [27345], 'sdo': [3635], 'dl-agent': [3876], 'nuts_dem': [4132], 'eq3-config': [43439], 'licensedaemon': [1986], 'groove': [2492], 'orbix-locator': [3075], 'rimf-ps': [2209], 'cpdlc': [5911], 'tns-adv': [3309], 'grid-alt': [6269], 'cecsvc': [2571], 'itm-lm': [2828], 'raven-rmp': [3532], 'n2receive': [9286], 'ehs-ssl': [4536], 'olsv': [1160], 'olsr': [698], 'mnet-discovery': [5237], 'genie-lm': [1453], 'otlp': [6951], 'mc-comm': [9632], 'sftp': [115], 'mbg-ctrl': [3569], 'hrd-ns-disc': [6324], 'serverwsd2': [5362], 'ethercat': [34980], 'afrog': [1042], 'isrp-port': [3788], 'dproxy': [1296], 'blaze': [1150], 'lansource': [1485], 'hacl-gs': [5301], 'phrelay': [4868], 'igi-lm': [1404], 'epl-slp': [3819], 'can-nds': [1918], 'deskshare': [1702], 'p2pq': [1981], 'efi-lm': [3392], 'd2k-datamover1': [2297], 'd2k-datamover2': [2298], 'bears-02': [3146], 'rrimwm': [1694], 'sitaraserver': [2629], 'zserv': [346], 'iims': [4800], 'pipes': [1465], 'rmonitor': [560], 'owserver': [4304], 'systemics-sox': [5406], 'amt-blc-port': [2848], 'pn-requester': [2717], 'bmcpatrolagent': [3181], 'npmp-trap': [609], 'gandalf-lm': [1421], 'ds-user': [4403], 'udt_os': [1382, 3900], 'cp-spxsvr': [4377], 'emfis-data': [140], 'unglue': [2655], 'iris-xpcs': [714], 'fjmpcm': [2975], 'vettcp': [78], 'ssc-agent': [2967], 'serverview-asn': [3170], 'corel_vncadmin': [2654], 'xoraya': [11876], 'xact-backup': [911], '3com-amp3': [629], 'ninaf': [5627], 'opendeploy': [20014], 'wg-netforce': [3359], 'dkmessenger': [1177], '3par-rcopy': [5785], 'sql*net': [66], 'zfirm-shiprush3': [3841], 'ldap-admin': [3407], 'ies-lm': [1443], 'tunnel': [604], 'capfast-lmd': [1756], 'xnm-ssl': [3220], 'ocbinder': [183], 'globecast-id': [6109], 'borland-dsj': [707], 'fronet': [4130], 'bones': [4914], 'slslavemon': [3102], 'web2host': [1559], 'ars-master': [3176], 'hlserver': [3047], 'apc-3506': [3506], 'afs': [1483], 'profile': [136], 'encrypted-llrp': [5085], 'gds-db': [3050], 'vsaiport': [3317], 'crestron-cip': [41794], 'hnmp': [6790], 'nettgain-nms': [1879], 'wbem-https': [5989], 'neteh-ext': [3829], 'pda-gate': [4012], 'dsmipv6': [4191], 'fcp-addr-srvr1': [5500], 'citrixadmin': [2513], 'meter': [570, 571], 'fcp-addr-srvr2': [5501], 'vrace': [9300], 'raw-serial': [2167], 'geolocate': [3108], 'acp-port': [2071], 'apple-sasl': [3659], 'discp-client': [2601], 'tsb': [2741], 'bex-webadmin': [6122], 'tsa': [6689], 'apri-lm': [1447], 'ha-cluster': [694], 'nokia-ann-ch1': [3405], 'nokia-ann-ch2': [3406], 'tsp': [3653], 'qotd': [17], 'mediaspace': [3594], 'fmpro-fdal': [2399], 'vocaltec-hos': [25793], 'commlinx-avl': [1190], 'symplex': [1507], 'bf-master': [25955], 'apple-vpns-rp': [4112], 'apollo-data': [8121], 'saism': [1436], 'board-voip': [9750], 'swdtp-sv': [10009], 'dixie': [96], 'patrol-ism': [6161], 'onesaf': [3244], 'cichlid': [1377], 'opennl': [1258], 'ismaeasdaqlive': [1949], 'asmp-mon': [45000], 'res': [1942], 'ccmrmi': [3154], 'metaedit-ws': [6390], 'cautcpd': [3061], 'stun': [3478], 'ssad': [4750], 'u-dbap': [3584], 'acl-manager': [4013], 'workflow': [3466], 'ginad': [634], 'insis': [9215], 'di-msg': [2227], 'vaultbase': [1771], 'linktest': [3746], 'domaintime': [9909], 'iclpv-dm': [1389], 'psrserver': [2351], 'xaapi': [1934], 'elpro-tunnel': [4370], 'llsurfup-https': [1184], 'mpnjsc': [1952], 'z-wave': [4123], 'cytel-lm': [3297], 'sweetware-apps': [1221], 'shivadiscovery': [1502], 'almobile-system': [9209], 'suitjd': [3354], 'dnap': [1172], 'navbuddy': [1288], 'ibm_wrless_lan': [1461], 'fjitsuappmgr': [2425], 'labrat': [2560], 'mzap': [2106], 'a16-an-an': [4598], 'paycash-wbp': [8129], 'nqs': [607], 'tidp': [7548], 'bnet': [415], 'hp-dataprotect': [3612], 'idac': [3881], 'samsung-disc': [30832], 'isnetserv': [48128], 'glishd': [2833], 'ctiprogramload': [4452], 'connect-server': [3442], 'caller9': [2906], 'lionhead': [2611], 'cft-7': [1768], 'cft-6': [1767], 'cft-5': [1766], 'cft-4': [1765], 'cft-3': [1764], 'cft-2': [1763], 'cft-1': [1762], 'cft-0': [1761], 'oceansoft-lm': [1466], 'hsrp': [1985], 'bmc-perf-sd': [10128], 'codasrv': [2432], 'v2g-secc': [15118], 'bootps': [67], 'nxlmd': [28000], 'wv-csp-udp-cir': [3717], 'procos-lm': [3248], 'lazy-ptop': [7099], 'bootpc': [68], 'wsmlb': [3806], 'fjippol-polsvr': [2748], 'quartus-tcl': [2589], 'leoip': [1886], 'c-h-it-port': [3778], 'bintec-capi': [2662], 'salient-dtasrv': [5409], 'foresyte-sec': [5408], 'interwise': [7778], 'ldoms-mgmt': [6482], 'spice': [1923], 'vrtl-vmf-ds': [1956], 'smsqp': [11201], 'xds': [2130], 'securitychase': [5399], 'intu-ec-svcdisc': [8020], 'webemshttp': [2851], 'dn6-nlm-aud': [195], 'cvsup': [5999], 'auditd': [48], 'dpsi': [315], 'exoline-udp': [26486], 'mpsserver': [6106], 'ingreslock': [1524], 'tl1-lv': [3081], 'pc-telecommute': [2299], 'alesquery': [5074], 'ibm-diradm-ssl': [3539], 'oi-2000': [2364], 'targus-getdata2': [5202], 'targus-getdata3': [5203], 'jmevt2': [6962], 'targus-getdata1': [5201], 'filenet-rpc': [32769], 'vrt': [4991], 'flamenco-proxy': [3210], 'messageasap': [6070], 'sqlexec-ssl': [9089], 'avocent-proxy': [1078], 'elvin-server': [2916], 'tolfab': [20167], 'd-data': [4301], 'bacula-fd': [9102], 'lv-frontpanel': [3079], 'event-port': [2069], 'rmiaux': [10990], 'gss-http': [488], 'npds-tracker': [3680], 'gammafetchsvr': [1859], 'iso-tp0': [146], 'abr-secure': [1955], 'citadel': [504], 'silverplatter': [416], 'distcc': [3632], 'epicon': [2912], 'mcntp': [5418], 'tsilb': [2489], 'f5-iquery': [4353], 'dellpwrappks': [1266], 'com-bardac-dw': [48556], 'iqnet-port': [3804], 'powergemplus': [2899], 'ideesrv': [2337], 'ncld': [405], 'landmarks': [3969], 'armi-server': [3174], 'netbios-dgm': [138], 'dsatp': [2111], 'composit-server': [2417], 'mrssrendezvous': [7392], 'mdqs': [666], 'pacerforum': [1480], 'iop': [2055], 'herodotus-net': [3921], 'mck-ivpip': [2698], 'dl_agent': [3876], 'gcm-app': [14145], 'simba-cs': [1543], 'con': [759], 'bv-queryengine': [3989], 'documentum_s': [10003], 'bpdbm': [13721], 'itm-mcell-s': [828], 'nirp': [4043], 'lorica-in-sec': [4081], 'nms-dpnss': [2503], 'rdmnet-device': [5569], 'geneous': [3381], 'zieto-sock': [4072], 'med-ci': [24005], 'ps-ams': [3658], 'mobrien-chat': [2031], 'vsiadmin': [2539], 'shrinkwrap': [358], 'p-net-remote': [34379], 'trc-netpoll': [2405], 'imtc-map': [2202], 'nim-vdrshell': [6420], 'funk-logger': [1786], 'cart-o-rama': [3292], 'netbill-trans': [1612], 'trap-daemon': [3600], 'ac-cluster': [18463], 'tmi': [8300], 'sdbproxy': [3562], 'sun-sr-http': [6480], 'etftp': [1818], 'dca': [1456], 'xinupageserver': [2020], 'fotogcad': [3878], 'vision_server': [6672], 'dcs': [1367], 'dcp': [93], 'listcrt-port-2': [3914], 'about': [2019], 'br-channel': [5425], 'powwow-client': [13223], 'findviatv': [3350], 'discard': [9], 'nbx-cc': [2093], 'socks': [1080], 'asoki-sma': [3087], 'autocuesmi': [3103], 'amdsched': [1931], 'pcs-pcw': [2566], 'hp-pdl-datastr': [9100], 'apparenet-ts': [3236], 'unicontrol': [2437, 2499], 'smip': [7734], 'snmp': [161], 'jetcmeserver': [1936], 'oma-ilp': [7276], 'wacp': [3633], 'vopied': [13783], 'newoak': [4001], 'fjsvmpor': [2946], 'vvr-control': [4145], 'optilogic': [2435], 'eq-office-4942': [4942], 'eq-office-4941': [4941], 'eq-office-4940': [4940], 'kingdomsonline': [30260], 'gxtelmd': [2356], 'tacacs-ds': [65], 'jeol-nsddp-1': [6241], 'jeol-nsddp-3': [6243], 'jeol-nsddp-2': [6242], 'jeol-nsddp-4': [6244], 'oracle-oms': [1159], 'finle-lm': [1784], 'ecolor-imager': [3263], 'avauthsrvprtcl': [2068], 't1distproc': [1274], 'pip': [321, 1321], 'neto-dcs': [3814], 'multip-msg': [3733], 'tmosms0': [5580], 'tmosms1': [5581], 'mpm-snd': [46], 'collaber': [7689], 'dnox': [4022], 'dec-mbadmin': [1655], 'activesync': [1034], 'xap-ha': [3639], 'ipcd': [576], 'bmc-onekey': [3561], 'traingpsdata': [9277], 'l2c-data': [4372], 'scscp': [26133], 'pwdis': [3735], 'idcp': [2326], 'soniqsync': [3803], 'a21-an-1xbs': [4597], 'rhp-iibp': [1912], 'pharmasoft': [1779], 'digital-notary': [1335], 'atm-uhas': [11367], 'medimageportal': [7720], 'vxlan': [4789], 'senip': [3898], 'pjlink': [4352], 'rise': [7473], 'iee-qfx': [1284], 'supermon': [2709], 'fc-ser': [1372], 'p2pgroup': [3587], 'phonebook': [767], 'netwatcher-db': [3204], 'venus': [2430], 'checkoutdb': [5505], 'piranha2': [4601], 'vsat-control': [1880], 'genrad-mux': [176], 'direct': [242], 'ipfixs': [4740], 'd2000webserver': [3120], 'opsmgr': [1270], 'xmms2': [9667], 'lanrevserver': [3971], 'suncacao-websvc': [11165], 'xfr': [682], 'ibm3494': [3494], 'afs3-bos': [7007], 'compaq-https': [2381], 'wap-wsp-s': [9202], 'de-cache-query': [1255], 'rcc-host': [2332], 'minivend': [7786], 'mos-soap-opt': [10544], 'cc-tracking': [4870], 'spike': [4683], 'talarian-mqs': [2493], 'ds-srvr': [4401], 'netview-aix-8': [1668], 'vpp': [677], 'netview-aix-1': [1661], 'netview-aix-3': [1663], 'netview-aix-2': [1662], 'netview-aix-5': [1665], 'netview-aix-4': [1664], 'netview-aix-7': [1667], 'netview-aix-6': [1666], 'memcache': [11211], 'noteshare': [8474], 'osaut': [6679], 'roketz': [1730], 'slm-api': [1606], 'here-lm': [1409], 'hotu-chat': [3449], 'castorproxy': [3450], 'high-criteria': [2467], 'orion': [2407], 'mcns-tel-ret': [3311], 'close-combat': [1944], 'xyplex-mux': [173], 'quest-agent': [3843], 'vslmp': [312], 'vpa-disc': [5164], 'enl': [1804], 'netx-agent': [2586], 'fcmsys': [2344], 'z39.50': [210], 'hacl-poll': [5315], 'cadlock2': [1000], 'ovwdb': [2447], 'scientia-ssdb': [2121], 'parallel': [4989], 'dicom-iscl': [2761], 'entextlow': [12004], 'iso-tp0s': [3782], 'a27-ran-ran': [28119], 'tcoaddressbook': [1977], 'eisp': [3983], 'linogridengine': [12300], 'caacws': [5248], 'cnhrp': [1757], 'clp': [2567], 'mos-lower': [10540], 'intraintra': [3202], 'ctdhercules': [3773], 'intecom-ps2': [5057], 'intecom-ps1': [5056], 'smartsdp': [426], 'intelsync': [3692], 'assuria-slm': [4119], 'nbt-wol': [6133], 'affiliate': [6579], 'scohelp': [457], 'aal-lm': [1469], 'syncserverssl': [2679], 'street-stream': [1736], 'ufastro-instr': [3720], 'desktop-dna': [2763], 'servicetags': [6481], 'omabcastltkm': [4359], 'prnstatus': [3911], 'rds-ib': [18634], 'srssend': [362], 'rds-ip': [18635], 'lontalk-norm': [1628], 'multiling-http': [777], 'rnmap': [3418], 'storman': [4178], 'fjsv-gssagt': [3035], 'mgesupervision': [4679], 'iadt-disc': [4169], 'hyperwave-isp': [692], 'spdp': [5794], 'micom-pfs': [490], 'voispeed-port': [3541], 'isis-am': [1642], 'taligent-lm': [1475], 'mvel-lm': [1574], 'authentx': [5067], 'ardusuni': [1834], 'skip-mc-gikreq': [1660], 'facsys-ntp': [2514], 'exp2': [1022], 'exp1': [1021], 'madge-ltd': [2453], 'allstorcns': [2901], 'npmp-local': [610], 'ordinox-server': [3274], 'paycash-online': [8128], 'ksysguard': [3112], 'infomover': [2854], 'radmin-port': [4899], 'paradym-31port': [1864], 'pnet-conn': [7797], 'dls-monitor': [2048], 'msrp': [2855], '914c-g': [211], 'nbx-au': [2094], 'vrxpservman': [4147], 'mtcevrunqman': [4558], 'everydayrc': [2782], 'ept-machine': [3628], 'rap': [38, 256], 'lbf': [2466], 'lbm': [2465], 'meta5': [393], 'metaedit-se': [6370], 'bmc-jmx-port': [3604], 'hpstgmgr': [2600], 'hppronetman': [3908], 'dpserveadmin': [7021], 'csms': [3399], 'v5ua': [5675], 'radix': [2872], 'hexarc': [7397], 'innosys': [1412], 'radio': [1595], 'lbc-measure': [2815], 'sd-data': [2385], 'giop-ssl': [2482], 'filenet-pa': [32772], 'xribs': [2025], 'progistics': [3973], 'pnet-enc': [7798], 'novar-dbase': [23400], 'edm-mgr-cntrl': [3465], '3ds-lm': [1538], 'cs-remote-db': [3630], 'pop3': [110], 'pop2': [109], 'lv-auth': [2147], 'argis-te': [2581], 'simctlp': [2857], 'mcer-port': [6510], 'backup-express': [6123], 'neto-wol-server': [3812], 'ispmmgr': [3775], 'nut': [3493], 'ccag-pib': [7169], 'fsc-port': [9217], 'xinuexpansion1': [2021], 'pcp-multicast': [5350], 'xinuexpansion3': [2023], 'xinuexpansion2': [2022], 'xinuexpansion4': [2024], 'cruise-diags': [8379], 'shilp': [2049], 'finger': [79], 'prgp': [7747], 'versatalk': [3738], 'appleqtcsrvr': [545], 'blwnkl-port': [2625], 'lupa': [1212], 'altcp': [4165], 'wanscaler': [2312], 'nmasoverip': [1242], 'pkix-timestamp': [318], 'robcad-lm': [1509], 'whosockami': [2009], 'nameserver': [42], 'cops-tls': [3183], 'b2-license': [2204], 'repcmd': [641], 'mmaeds': [4668], 'gw-log': [4844], 'conference': [531], 'esinstall': [5599], 'rmiactivation': [1098], 'nec-raidplus': [2730], 'stdptc': [2154], 'ccss-qsm': [4970], 'gwen-sonya': [2778], 'wfm': [4057], 'kingfisher': [4058], 'wfc': [4847], 'synapse-nhttps': [8243], 'flukeserver': [2359], 'aeroflight-ret': [1219], 'veronica': [2770], 'ca-idms': [3709], 'minotaur-sa': [5136], 'aja-ntv4-disc': [4804], 'qtms-bootstrap': [3850], 'microcom-sbp': [1680], 'mysql-cm-agent': [1862], 'ias-admind': [2141], 'ccnx': [9695], 'gcmonitor': [2660], 'kfxaclicensing': [3581], 'obrpd': [1092], 'ivs-video': [2232], 'wsynch': [3111], 'va-pacbase': [3676], 'http-alt': [591, 8008, 8080], 'proactivate': [24678], 'nimhub': [48002], 'ds-admin': [4404], 'vids-avtp': [1853], 'talon-disc': [7011], 'cpq-tasksmart': [3201], 'bullant-rap': [2965], 'eli': [2087], 'keyserver': [584], 'wago-service': [6626], 'ris': [180], 'els': [1315], 'ncr-ccl': [2528], 'vulture': [3482], 'radius-acct': [1813], 'supercell': [7967], 'cs-services': [3631], 'meta-corp': [6141], 'iclpv-nlc': [1394], 'sgi-eventmond': [5553], 'iclpv-nls': [1393], 'rrac': [5678], 'sysscanner': [3251], 'excerpt': [5400], 'acas': [62], 'acap': [674], 'mctfeed': [5598], 'eicon-slp': [1440], 'ici': [2200], 'netware-csp': [1366], 'opsession-srvr': [3304], 'ica': [1494], 'icp': [1112], 'nsw-fe': [27], 'entextmed': [12003], 'ascomalarm': [4077], 'myblast': [3795], 'ibridge-data': [2275], 'cmtp-av': [8501], 'sqdr': [2728], 'xtrms': [3424], 'directplaysrvr': [47624], 'bdir-pub': [6508], 'h248-binary': [2945], 'prosharedata': [5715], 'lmcs': [4877], 'presence': [5298], 'cdl-server': [3056], 'interworld': [3548], 'mesavistaco': [1249], 'git': [9418], 'infocrypt': [2233], 'novation': [1322], 'omscontact': [4161], 'jamserverport': [3627], 'sychrond': [3723], 'rtnt-1': [3137], 'rtnt-2': [3138], 'sentlm-srv2srv': [5099], 'icms': [4486], 'imprs': [3164], 'bdir_pub': [6508], 'smpnameres': [901], 'scrabble': [2026], 'talikaserver': [22763], 'simbaexpress': [1583], 'vantronix-mgmt': [8034], 'trim': [1137], 'dandv-tester': [3889], 'sns-protocol': [2409], 'scup-disc': [6315], 'netconfsoaphttp': [832], 'dei-icda': [618], 'redstorm-info': [2348], 'idxp': [603], 'cert-responder': [1640], 'nnp': [3780], 'vpac': [1517], 'vpad': [1516], 'e-design-net': [6702], 'and-lm': [2646], 'tig': [3943], 'etc-control': [6107], 'vtr-emulator': [3122], 'toad': [2669], 'ibm-mqseries': [1414], 'agslb': [4149], 'nm-assessor': [3151], 'brf-gw': [22951], 'font-service': [7100], 'dhcp-failover': [647], 'mctet-master': [3115], 'amx-axbnet': [1320], 'bmc_patroldb': [1313], 'oma-mlp': [9210], 'dsmcc-passthru': [13820], 'odi-port': [3187], 'dsdn': [1292], 'rjcdb-vcards': [9208], 'can-ferret': [1920], 'ansatrader': [124], 'dtpt': [5721], 'faxportwinport': [1620], 'serverview-as': [3169], 'proxim': [1732], 'contamac-icm': [4846], 'ias-auth': [2139], 'imaps': [993], 'mzca-alert': [7282], 'kjtsiteserver': [1339], 'csd-monitor': [3072], 'datalens': [2229], 'hpss-ndapi': [1217], 'siebel-ns': [2320], 'atex_elmd': [1385], 'imap3': [220], 'netop-rc': [1970], 'altbsdp': [7799], 'opalis-robot': [314], 'pmd': [7431], 'oidocsvc': [4142], 'comotionmaster': [2261], 'ethernet-ip-2': [44818], 'ethernet-ip-1': [2222], 'upstriggervsw': [3786], 'filenet-re': [32774], 'niprobe': [25903], 'ridgeway1': [2776], 'prsvp': [3455], 'cindycollab': [3770], 'fujitsu-dev': [747], 'itactionserver2': [7281], 'itactionserver1': [7280], 'orbixd': [1570], 'escvpnet': [3629], '3comfaxrpc': [3446], 'vocaltec-phone': [22555], '4talk': [3284], 'dialpad-voice2': [2861], 'dialpad-voice1': [2860], 'cmip-man': [163], 'contamac_icm': [4846], 'healthd': [1281], 'stonefalls': [2986], 'nmap': [689], 'rapidbase': [1953], 'tsdos390': [1237], 'ibridge-mgmt': [2276], 'htcp': [4827], 'qotps': [2724], 'scientia-sdb': [1811], 'msp': [18, 2438], 'pfu-prcallback': [3208], 'osb-sd': [400], 'gdoi': [848], 'ansyslmd': [1055], 'ice-srouter': [4064], 'afs3-errors': [7006], 'icg-iprelay': [2064], 'ssowatch': [3644], 'cacsambroker': [7163], 'x2e-disc': [11877], 'trustestablish': [2573], 'cl-db-remote': [4137], 'sybaseanywhere': [2638], 'sixtrak': [1594], 'corbaloc': [2809], 'smntubootstrap': [2613], 'pop3s': [995], 'pdps': [1314], 'srvc-registry': [3018], 'rib-slm': [3296], 'sunclustergeo': [2084], 'childkey-notif': [1891], 'pxc-splr': [4007], 'aed-512': [149], 'ssslog-mgr': [1204], 'csdmbase': [1467, 1471], 'd-data-control': [4302], 'sflm': [3162], 'sctp-tunneling': [9899], 'doc-server': [7165], 'mailprox': [3936], 'dell-rm-port': [3668], 'valisys-lm': [1457], 'altav-tunnel': [3265], 'seagull-ais': [1208], 'bcinameservice': [3415], 'qbikgdp': [368], 'lipsinc': [1968], 'vtp': [16666], 'uaiact': [1470], 'nbx-ser': [2095], 'ndl-als': [3431], 'dmdocbroker': [1489], 'cddbp-alt': [8880], 'metasys': [11001], 'dcsoftware': [3793], 'name': [42], 'namp': [167], 'pm-cmdsvr': [5112], 'compaq-evm': [619], 'megardsvr-port': [3571], 'igcp': [2801], 'pt2-discover': [1101], 'myrtle': [1831], 'sd-elmd': [1681], 'pduncs': [16310], 'smar-se-port2': [4988], 'smar-se-port1': [4987], 'asf-secure-rmcp': [664], 'd3winosfi': [3458], 'xnmp': [1652], 'mc-brk-srv': [3180], 'nexgen': [6627], 'icabrowser': [1604], 'magicnotes': [3023], 'cab-protocol': [595], 'turn': [3478], 'netiq': [2220], 'vision-elmd': [6673], 'chip-lm': [1572], 'imyx': [1143], 'sso-control': [2711], 'ewinstaller': [4091], 'ibm-mqseries2': [1881], 'hecmtl-db': [1551], 'instl-bootc': [1068], 'iax': [4569], 'snmp-tcp-port': [1993], 'instl-boots': [1067], 'aminet': [2639], 'tvpm': [21800], 'rtps-dd-mt': [7402], 'visicron-vs': [4307], 'cops': [3288], 'gamesmith-port': [31765], 'clvm-cfg': [1476], 'prizma': [2039], 'ovalarmsrv-cmd': [2954], 'musiconline': [1806], 'neckar': [37475], 'timeflies': [1362], 'dccm': [5679], 'onpsocket': [5014], 'wap-wsp-wtp': [9201], 'netbill-keyrep': [1613], 'cwmp': [7547], 'prp': [2091], 'accu-lmgr': [7781], 'konspire2b': [6085], 'sossd-disc': [7982], 'ewdgs': [4092], 'klio': [7697], 'silhouette': [7500], 'thrtx': [4139], 'ipfix': [4739], 'appworxsrv': [2136], 'http-wmap': [8990], 'acp-conduit': [3823], 'surf': [1010], 'cnrp': [2757], 'biff': [512], 'cifs': [3020], 'apwi-disc': [4394], 'ife-icorp': [5165], 'opswagent': [3976], 'cesdinv': [2856], 'oracleas-https': [7443], 'simplifymedia': [8087], 'recipe': [2240], 'ncadg-ip-udp': [3063], 'wms-messenger': [3219], 'amt-esd-prot': [1082], 'xrpc-registry': [3651], 'ttc-etap': [2675], 'pvuniwien': [1081], 'ssm-cvs': [2477], 'filenet-nch': [32770], 'quaddb': [2497], 'sst': [266], 'ssp': [3249], 'ssh': [22], 'prosharerequest': [5716], 'msnp': [1863], 's8-client-port': [3153], 'ni-mail': [61], 'transmit-port': [5282], 'vp2p': [8473], 'directv-catlg': [3337], 'natuslink': [2895], 'rmt': [411], 'ldss': [6087], 'rmc': [657], 'www-ldap-gw': [1760], 'bhmds': [310], 'mylex-mapd': [467], 'vytalvaultvsmp': [2547], 'hsrpv6': [2029], 'synel-data': [3734], 'sim-control': [3110], 'sbi-agent': [3962], 'roboeda': [2920], 'locus-map': [125], 'ssdispatch': [3430], 'sflow': [6343], 'fg-sysupdate': [6550], 'windlm': [1785], 'hello-port': [652], 'cplscrambler-in': [1087], 'redstorm-diag': [2349], 'rescap': [283], 'mrip': [4986], 'ardus-trns': [1115], 'sdl-ets': [5081], 'bbars': [3327], 'sixxsconfig': [3874], 'ka0wuc': [2822], 'lanserver': [637], 'ndsp': [2881], 'vsi-omega': [7566], 'rwhois': [4321], 'netplan': [2983], 'nextstep': [178], 'casp': [1130], 'z39-50': [210], 'rbr-debug': [44553], 'macbak': [4181], 'csccfirewall': [40843], 'intersys-cache': [1972], 'dialogic-elmd': [1945], 'trip': [6069], 'mcns-sec': [638], 'assoc-disc': [24850], 'islc': [1637], 'persona': [1916], 'appswitch-emp': [2616], 'resacommunity': [1154], 'locus-con': [127], 'relief': [1353], 'safetynetp': [40000], 'vaprtm': [3654], 'multicast-ping': [9903], 'hp-nnm-data': [2690], 'netsteward': [2810], 'cadview-3d': [649], 'lsi-raid-mgmt': [2463], 'csd-mgmt-port': [3071], 'msg-icp': [29], 'pcmail-srv': [158], 'aises': [2783], 'thermo-calc': [6201], 'scpi-telnet': [5024], 'itv-control': [3899], 'quailnet': [5464], 'lecroy-vicp': [1861], 'ns': [760], 'print-srv': [170], 'mftp': [349, 5402], 'dbisamserver2': [12006], 'net-device': [4350], 'dbisamserver1': [12005], 'scriptview': [7741], 'veracity': [1062], 'remote-collab': [2250], 'rsync': [873], 'watchdog-nt': [2723], 'gearman': [4730], 'ep-nsp': [3621], 'udt-os': [1382, 3900], 'cognima': [3779], 'ddm-dfm': [447], 'storview': [9293], 'nw-license': [3697], 'awacs-ice': [4488], 'jdl-dbkitchen': [3086], 'inspect': [1602], 'minger': [4069], 'ktelnet': [6623], 'oracle-em1': [1748], 'dls-mon': [198], 'oracle-em2': [1754], 'spss': [5443], 'besapi': [3408], 'tributary': [2580], 'jediserver': [2406], 'spsc': [478], 'hp-device-disc': [3329], 'cvc_hostd': [442], 'flirtmitmir': [3840], 'rockwell-csp2': [2223], 'ehs': [4535], 'bprd': [13720], 'sun-as-iiops': [3708], 'ibm-pps': [1376], 'virtualtape': [2386], 'wap-push-https': [4036], 'amcs': [8766], 'afore-vdp-disc': [4362], 'vacdsm-sws': [670], 'cbt': [7777], 'apparenet-as': [3238], 'appliance-cfg': [2898], 'adobeserver-2': [1103], 'adobeserver-3': [3703], 'adobeserver-1': [1102], 'opsview-envoy': [4125], 'csoftragent': [3004], 'adobeserver-4': [3704], 'adobeserver-5': [3705], 'swr-port': [3491], 'starquiz-port': [3526], 'palcom-disc': [6657], 'ctcd': [1851], 'ibm-wrless-lan': [1461], 'ftp': [21], 'accessbuilder': [888], 'nucleus': [1463], 'puparp': [998], 'bues_service': [2446], 'arkivio': [3426], 'hdap': [263], 'hacl-cfg': [5302], 'intrastar': [1907], 'davsrc': [9800], 'hpssd': [2207], 'chevinservices': [3349], 'metricadbc': [2622], 'newlixengine': [2075], 'tnp-discover': [8320], 'nsc-posa': [2605], 'tip-app-server': [3160], 'coauthor': [1529], 'ptp': [15740], 'iberiagames': [1726], 'fjappmgrbulk': [2510], 'openmath': [1473], 'sntlkeyssrvr': [9450], 'icap': [1344], 'scotty-disc': [14002], 'hems': [151], 'utime': [519], 'dbreporter': [1379], 'bnetfile': [1120], 'xdas': [7629], 'delibo': [2562], 'dmod-workspace': [3199], 'direcpc-si': [2464], 'filesphere': [24242], 'sua': [14001], 'sum': [6551], 'sns-dispatcher': [2657], 'intu-ec-client': [8021], 'arbortext-lm': [1557], 'pra-elmd': [1587], 'acp-discovery': [3822], 'ctp-state': [4047], 'silkmeter': [5461], 'tacnews': [98], 'canocentral0': [1871], 'netviewdm2': [730], 'rrifmm': [1696], 'galaxy-server': [3051], 'smap': [3731], 'whoispp': [63], 'synchronet-upd': [6102], 'c1222-acse': [1153], 'arepa-raft': [3025], 'intrinsa': [503], 'scipticslsrvr': [2577], 'snagas': [108], 'sdmmp': [5573], 'ivcollector': [1275], 'qcp': [5082], 'hermes': [1248], 'ac-tech': [2796], 'softpc': [215], 'audit': [182], 'autonoc': [1140], 'boks_clntd': [6503], 'e3consultants': [3157], 'mira': [3454], 'parsec-master': [6580], 'locus-disc': [5058], 'nuxsl': [5991], 'qmtp': [209], 'mgxswitch': [3070], 'sdt-lmd': [3319], 'acr-nema': [104], 'mqe-broker': [3957], 'caistoragemgr': [7162], 'ibm-abtact': [1586], 'swdtp': [10104], 'htuilsrv': [5023], 'tbrpf': [712], 'sharp-server': [3617], 'telnets': [992], 'magpie': [5092], 'cfengine': [5308], 'mdbs_daemon': [800], 'sor-update': [3922], 'iascontrol-oms': [1156], 'filenet-rmi': [32771], 'call-logging': [2552], 'six-degrees': [3611], 'agentview': [2331], 'xsync': [3721], 'tsaf': [12753], 'cadlock': [770], 'ininmessaging': [5597], 'jibe-eb': [3777], 'ardt': [1826], 'firemonrcc': [3192], 'creativepartnr': [455, 3366], 'silverpeakcomm': [4164], 'isns': [3205], 'fryeserv': [2788], 'zabbix-agent': [10050], 'prat': [1264], 'agentsease-db': [3997], 'scol': [1200], 'netrix-sftm': [2328], 'lsp-ping': [3503], 'dvr-esm': [2804], 'ismserver': [9500], 'csoft-plusclnt': [2699], 'prism-deploy': [3133], 'jstel': [1064], 'cruise-enum': [8376], 'neoiface': [1285], 'sabams': [2760], 'sops': [3944], 'izm': [4109], 'csnotify': [2955], 'lansurveyorxml': [3815], 'apw-registry': [3758], 'talarian-mcast4': [4018], 'talarian-mcast5': [4019], 'talarian-mcast1': [4015], 'talarian-mcast2': [4016], 'talarian-mcast3': [4017], 'swxadmin': [5043], 'fac-restore': [5582], 'miroconnect': [1532], 'vpps-via': [676], 'astromed-main': [2864], 'ca-2': [5065], 'ca-1': [5064], 'activememory': [2859], 'epnsdp': [2051], 'nmmp': [3649], 'liebdevmgmt-a': [3029], 'liebdevmgmt-c': [3027], 'bh611': [354], 'cp-spxdpy': [4378], 'precise-vip': [2924], 'cloanto-lm': [3397], 'interact': [4052], 'openmail': [5729], 'emc-gateway': [1273], 'ttat3lb': [3579], 'hp-alarm-mgr': [383], 'fxuptp': [19539], 'imsldoc': [2035], 'rfid-rp1': [4684], 'tcc-http': [24680], 'tolteces': [4375], 'ogs-client': [9007], 'spandataport': [3193], 'sype-transport': [9911], 'responselogic': [2886], 'ms-sna-server': [1477], 'winfs': [5009], 'vpvd': [1518], 'j-lan-p': [2808], 'vpvc': [1519], 'osmosis-aeea': [3034], 'openwebnet': [20005], 'vpm-udp': [5046], 'dbdb': [6104], 'winpcs': [5166], 'tpdu': [1430], 'tftp-mcast': [1758], 'digiman': [2362], 'cspuni': [2806], 'sas-remote-hlp': [3755], 'netml': [2288], 'opus-services': [3718], 'candrp': [42509], 'mimer': [1360], 'cdn': [2412], 'fuscript': [1144], 'cds': [4115], 'optech-port1-lm': [2237], 'iclcnet-svinfo': [887], 'gtegsc-lm': [1452], 'tunstall-pnc': [1846], 'hiq': [1410], 'telefinder': [1474], 'sms-rcinfo': [2701], 'hid': [24322], 'fjippol-port1': [2750], 'fjippol-port2': [2751], 'media-agent': [2789], 'mipv6tls': [7872], 'mediacntrlnfsd': [2363], 'eyetv': [2170], 'xnm-clear-text': [3221], 'netbios-ns': [137], 'continuus': [5412], 'gtp-user': [2152], 'http-mgmt': [280], 'orasrv': [1525], 'netspeak-cs': [21847], 'comscm': [437], 'cmc-port': [3576], 'ff-lr-port': [3622], 'nimreg': [1059], 'iclcnet-locate': [886], 'ipdr-sp': [4737], 'global-cd-port': [3229], 'ncpm-ft': [1744], 'bctp': [8999], 'objective-dbc': [1388], 'initlsmsad': [2793], 'p4p-portal': [6671], 'escale (newton dock)': [3679], 'symantec-sim': [3547], 'caerpc': [42510], 'prelude': [4690], 'tsspmap': [1568], 'diagmond': [1508], 'ppsuitemsg': [5863], 'actnet': [5411], 'versa-tek': [2610], 'ms-rome': [569], 'ortec-disc': [40853], 'pspserver': [2353], 'tgp': [1223], 'adtech-test': [3357], 'rbt-wanopt': [7810], 'ethoscan': [6935], 'silverpeakpeer': [4163], 'bnetgame': [1119], 'pk': [5272], 'ph': [481], 'kmscontrol': [1773], 'onbase-dds': [2185], 'nhserver': [2672], 'syam-smc': [3895], 'dhcpv6-server': [547], 'can-ferret-ssl': [3661], 'saphostctrl': [1128], 'wip-port': [3414], 'serverview-gf': [3171], 'k3software-cli': [26263], 'quosa': [4841], 'oma-ilp-s': [7277], 'ste-smsc': [1836], 'abbaccuray': [1546], 'secure-mqtt': [8883], 'ecsqdmn': [1882], 'cumulus': [9287], 'galaxy-network': [5235], 'jdatastore': [2508], 'bgs-nsi': [482], 'unisys-eportal': [37654], 'haipe-discover': [3623], 'simple-push': [3687], 'alpha-sms': [1849], 'iclpv-pm': [1392], 'homesteadglory': [2597], 'emwin': [2211], 'bridgecontrol': [1073], 'kerberos-adm': [749], 'opsec-lea': [18184], 'iss-mgmt-ssl': [3995], 'newlixreg': [2671], 'profilemac': [4749], 'fujitsu-mmpdc': [1657], 'acnet': [6801], 'vdmplay': [1707], 'ftp-data': [20], 'udpradio': [1833], 'sdserver': [2309], 'newwavesearch': [2058], 'visionpyramid': [1247], 'afs3-volser': [7005], 'airshot': [3975], 'infolibria': [2319], 'childkey-ctrl': [1892], 'sccip-media': [3499], 'abcvoice-port': [3781], 'mib-streaming': [2292], 'redstorm_diag': [2349], 'entrust-kmsh': [709], 'apple-licman': [1381], 'quest-vista': [7980], 'boks': [6500], 'ecnp': [2858], 'blackboard': [2032], 'pegboard': [1357], 'surebox': [5453], 'opennl-voice': [1259], 'fjippol-swrly': [2747], 'irdmi': [8000], 'vmodem': [3141], 'corelccam': [4300], 'rap-ip': [3813], 'wxbrief': [4368], 'ans-console': [3440], 'plethora': [3480], 'bv-agent': [3993], 'mdns': [5353], 'epmap': [135], '3comnetman': [1181], 'beorl': [5633], 'gemini-lm': [1590], 'biap-mp': [1962], 'dns-llq': [5352], 'ehome-ms': [2228], 'webmail-2': [3511], 'd2000kernel': [3119], 'groupwise': [1677], '3com-nsd': [1742], 'cycleserv2': [772], 'rasadv': [9753], 'magenta-logic': [313], 'auris': [2772], 'aspcoordination': [7235], 'ema-sent-lm': [2526], 'davsrcs': [9802], 'daqstream': [7411], 'elektron-admin': [5398], 'pirp': [553], 'linktest-s': [3747], 'fj-hdnet': [1717], 'sift-uft': [608], 'vatata': [4188], 'qsnet-nucl': [4358], 'ff-sm': [1091], 'ppcontrol': [2505], 'passgo': [511], 'mc3ss': [3521], 'ita-agent': [5051], 'm2mservices': [8383], 'bullant-srap': [2964], 'watershed-lm': [6143], 'scinet': [7708], 'sur-meas': [243], 'mit-dov': [91], 'diagnose-proc': [6072], 'synchronite': [4106], 'ontobroker': [2267], 'ggf-ncp': [678], 'timbuktu-srv2': [1418], 'timbuktu-srv3': [1419], 'npmp-gui': [611], 'timbuktu-srv1': [1417], 'timbuktu-srv4': [1420], 'gamelobby': [2914], 'd-cinema-rrp': [1173], 'itscomm-ns': [1573], 'windb': [2522], 'emb-proj-cmd': [5116], 'bveapi': [10880], 'unet': [1189], 'colubris': [3490], 'isakmp': [500], 'xpilot': [15345], 'rt-event': [3706], 'orion-rmi-reg': [2413], 'ifsp': [4744], 'mcp-port': [3558], 'compaq-scp': [2766], 'vmsvc': [7024], 'netcp': [395], 'ezmeeting': [26261], 'ndm-agent-port': [43189], 'rrh': [753], 'acis': [9953], 'salient-mux': [5422], 'presonus-ucnet': [47809], 'canon-mfnp': [8610], 'cfs': [7546], 'rrp': [648], 'foresyte-clear': [5407], 'pando-pub': [7680], 'hypercube-lm': [1577], 'ndsauth': [353], 'agcat': [3915], 'caicci': [1721], 'hkp': [11371], 'arena-server': [11321], 'cp-spxrpts': [5079], 'smc-https': [6789], 'mtport-regist': [2791], 'buschtrommel': [4747], 'iclcnet_svinfo': [887], 'openmailns': [5766], 'dsp3270': [246], 'appleugcontrol': [2336], 'gds-adppiw-db': [4550], 'netx-server': [2585], 'delos-dms': [3714], 'jvserver': [1939], 'apollo-relay': [10252], 'dsom-server': [3053], 'jaxer-web': [4327], 'zigbee-ip': [17755], 'jomamqmonitor': [4114], 'sightline': [1645], 'mapper-nodemgr': [3984], 'pdl-datastream': [9100], 'taep-as-svc': [5111], 'auriga-router': [5680], 'patrol': [8160], 'lpdg': [10805], 'dec-dlm': [625], 'vchat': [1168], 'rapi': [2176], 'dwr': [644], 'p25cai': [6082], 'sip': [5060], 'midnight-tech': [3008], 'ada-cip': [2085], 'dwf': [1450], 'pro-ed': [8032], 'rt-event-s': [3707], 'asnaacceler8db': [5042], 'shareapp': [3595], 'msdp': [639], 'nati-dstp': [3015], 'msmq': [1801], 'light': [4670], 'rapido-ip': [2457], 'entrust-aaas': [680], 'sybasesrvmon': [4950], 'talnet': [1838], 'extensis': [2666], 'audio-activmail': [1397], 'nssalertmgr': [4453], 'cuelink-disc': [5271], 'mapper-ws_ethd': [3986], 'quake': [26000], 'mentaclient': [2117], 'syam-webserver': [3930], 'os-licman': [1384], 'l2c-disc': [4371], 'rsvd': [168], 'jdp-disc': [7095], 'cscp': [40841], 'pserver': [3662], 'nim-wan': [6421], 'bmc-grx': [6300], 'jboss-iiop': [3528], 'mysql-cluster': [1186], 'winshadow-hd': [3861], 'cti-redwood': [2563], 'emc-xsw-dcache': [11723], 'q3ade': [7794], 'bmc-perf-mgrd': [6768], 'appiq-mgmt': [4674], 'xiostatus': [2341], 'edix': [3123], 'nfa': [1155], 'tram': [4567], 'lanrevagent': [3970], 'idps': [3797], 'rrilwm': [1695], 'bts-x73': [3681], 'nfs': [2049], 'trap': [4020], 'mgcp-gateway': [2427], 'fastlynx': [2689], 'ovalarmsrv': [2953], 'dec-notes': [3333], 'autopac': [4685], 'datacaptor': [1857], 'firepower': [2615], 'cedros-fds': [4140], 'vieo-fe': [3245], 'msi-selectplay': [2871], 'tappi-boxnet': [2306], 'asihpi': [44600], 'vce': [11111], 'abcsoftware': [3996], 'netwkpathengine': [3209], 'qip-audup': [2765], 'iris-xpc': [713], 'bandwiz-system': [1929], 'entextnetwk': [12001], 'disclose': [667], 'hagel-dump': [3036], 'molly': [1374], 'lotusnote': [1352], 'esimport': [3564], 'paging-port': [3771], 'ltp': [4044], 'a3-sdunode': [5604], 'jdmn-port': [4030], 'rsip': [4555], 'h2gf-w-2m': [3179], 'essweb-gw': [1772], 'iclpv-sas': [1391], 'cst-port': [3742], 'admins-lms': [2692], 'echo': [7], 'cadsi-lm': [1387], 'ldaps': [636], 'ciphire-data': [3887], 'hp-sessmon': [19412], 'pinghgl': [4306], 'world-lm': [1462], 'siam': [498], 'de-spot': [2753], 'nav-data': [6317], 'sdp-id-port': [3242], 'idware-router': [2079], 't2-brm': [7933], 'telindus': [1728], 'intellistor-lm': [1539], 'cryptoadmin': [624], 'encore': [1740], 'symb-sb-port': [3923], 'sunfm-port': [3934], 'watchme-7272': [7272], 'netserialext1': [16360], 'netsupport2': [5421], 'xrl': [1104], 'secure-cfg-svr': [3978], 'nsrmp': [359], 'sftsrv': [1303], 'peerwire': [9104], 'iso-tsap-c2': [399], 'centra': [1709], 'pxc-pin': [4005], 'hpvirtgrp': [5223], 'db-lsp-disc': [17500], 'cdid': [3315], 'who': [513], 'beeyond-media': [1943], 'smc-jmx': [6786], 'ttntspauto': [3474], 'realsecure': [2998], 'avenyo': [2992], 'nimaux': [3902], 'windream': [534], 'fcopys-server': [5746], 'sec-pc2fax-srv': [9402], 'fcp-udp': [810], 'sgi-arrayd': [5434], 'lavenir-lm': [3373], 'imagequery': [2239], 'fiorano-rtrsvc': [1855], 'rsf-1': [1195], 'asterix': [8600], 'tmesis-upshot': [2798], 'wso2esb-console': [9444], 'kv-agent': [3361], 'mpl-gprs-port': [3924], 'tekpls': [1946], 'coord-svr': [2565], 'stm-pproc': [3080], 'sscan': [3853], 'omnivision': [1135], 'aibkup': [4071], 'caci-lm': [1554], 'bhevent': [357], 'eforward': [2181], 'video-activmail': [1398], 'eba': [45678], 'ohmtrigger': [4732], 'wap-vcard-s': [9206], 'concomp1': [1802], 'expresspay': [2755], 'armagetronad': [4534], 'sgmp': [153], 'gtaua': [2186], 'dls': [197, 2047], 'treehopper': [3959], 'metastorm': [2511], 'mvs-capacity': [10007], 'ieee-mms-ssl': [695], 'must-p2p': [3514], 'vsamredirector': [2387], 'fjmpjps': [1873], 'sun-sea-port': [16161], 'accord-mgc': [1205], 'visinet-gui': [3601], 'lanmessenger': [2372], 'dpap': [8770], 'servstat': [633], 'azeti-bd': [4192], 'terabase': [4000], 'sslp': [1750], 'gw-asv': [4842], 're-mail-ck': [50], 'ncconfig': [1888], 'proactivesrvr': [2722], 'rpi': [2214], 'aws-brf': [22800], 'capmux': [4728], 'rtps-dd-ut': [7401], 'wimaxasncp': [2231], 'discovery-port': [1925], 'semaphore': [3255], 'entrust-ash': [710], 'cadencecontrol': [2318], 'at-rtmp': [201], 'swrmi': [1866], 'seispoc': [2254], 'apc-3052': [3052], 'mgcs-mfp-port': [6509], 'vrts-auth-port': [4032], 'silkp1': [2829], 'silkp3': [2831], 'silkp2': [2830], 'silkp4': [2832], 'fprams': [4122], 'ergolight': [2109], 'flexlm': [744], 'warehouse-sss': [12321], 'wap-push-http': [4035], 'cruise-swroute': [8377], 'wkars': [2720], 'vidigo': [3231], 'pdp': [1675], 'cera-bcm': [1794], 'incp': [2932], 'esnm-zoning': [4023], 'ito-e-gui': [2531], 'santak-ups': [3038], 'unite': [3217], 'unikeypro': [4127], 'lorica-out': [4082], 'lbc-control': [2780], 'fmtp': [8500], 'cas': [2418], 'sdfunc': [2046], 'hhb-gateway': [1136], 'pov-ray': [494], 'ndnp': [2883], 'tempest-port': [11600], 'ss7ns': [477], 'mailbox-lm': [505], 'priority-e-com': [2618], 'aztec': [3512], 'directplay': [2234], 'wifree': [11208], 'na-er-tip': [3725], 'soap-http': [7627], 'menandmice-mon': [4552], 'softdataphone': [1621], 'rcts': [2258], 'qt-serveradmin': [1220], 'press': [3582], 'rsh-spx': [222], 'roboer': [2919], 'omginitialrefs': [900], 'ms-v-worlds': [2525], 'appss-lm': [3879], 'kdm': [2115], 'fjinvmgr': [9396], 'facelink': [1915], 'dnp-sec': [19999], 'encrypted_admin': [1138], 'spectardata': [3834], 'i3-sessionmgr': [3952], 'emcads': [3945], 'srdp': [3942], 'xns-ch': [54], 'qdb2service': [45825], 'rpc2portmap': [369], 'obex': [650], 'arcpd': [3513], 'cplscrambler-al': [1088], 'hri-port': [3439], 'omnivisionesx': [4395], 'innosys-acl': [1413], 'winddx': [1727], 'tacticalauth': [2392], 'ndn': [6363], 'agps-port': [3425], 'cvmon': [1686], 'sqlsrv': [156], 'exoconfig': [26487], 'kpn-icw': [3699], 'idrs': [2995], 'poweronnud': [3168], 'cl/1': [172], 'mmacomm': [4667], 'rets': [6103], 'networklens': [3409], 'vad': [14154], 'a1-bs': [5603], 'opalis-rbt-ipc': [5314], 'vat': [3456], 'jaugsremotec-2': [3473], 'jaugsremotec-1': [3472], 'personal-link': [281], 'chimera-hwm': [4009], 'nds_sso': [3024], 'vemmi': [575], 'nms_topo_serv': [1486], 'arns': [384], 'srvc_registry': [3018], 'tve-announce': [2670], 'snss': [11171], 'indx-dds': [2454], 'sco-aip': [5307], 'gadgetgate2way': [2678], 'pearldoc-xact': [1980], 'isdc': [1636], 'isdd': [8148], 'lyskom': [4894], 'user-manager': [3272], 'ccmail': [3264], 'hyper-g': [418], 'apc-9952': [9952], 'apc-9950': [9950], 'apc-9951': [9951], 'fjhpjp': [3067], 'mil-2045-47001': [1581], 'lotusmtap': [3007], 'gap': [10800], 'netmap_lm': [1493], 'sasp': [3860], 'wbem-rmi': [5987], 'sasg': [3744], 'hp-status': [5226], 'td-postman': [1049]}
-### DO NOT EDIT THIS LINE ###
+import csv
+import json
+import mmap
+import struct
+import sys
 
-if __name__ == "__main__":
-    import csv
-    import os
-    import os.path
-    import urllib2
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Mapping
+from difflib import get_close_matches
+from os import fstat, stat, unlink
+from os.path import abspath, dirname, exists, join
+from threading import Lock
+from time import time
+
+from fileutil import replace_file
+
+
+# Data file with the registry.
+DATA_FILE = join(dirname(abspath(__file__)), "iana.dat")
+
+# Magic string of the data file.
+DATA_MAGIC = "IANAPRT1"
+
+# Location of the registry in the IANA website.
+IANA_URL  = "http://www.iana.org/assignments/service-names-port-numbers/"
+IANA_FILE = "service-names-port-numbers.csv"
+
+# Seconds between checks for a new data file in running processes.
+RELOAD_INTERVAL = 5.0
+
+# Prefixes of the tables for each protocol. The tables without a prefix
+# have the ports and services registered for both TCP and UDP.
+PROTOCOLS = ("", "tcp_", "udp_")
+
+# Names of the tables.
+TABLES = tuple(
+    protocol + table
+    for protocol in PROTOCOLS
+    for table in ("port_to_services", "service_to_ports")
+)
+
+# Array typecodes for port numbers (16 bits), and for service name indexes
+# and offsets (32 bits). The arrays are stored in little endian byte order.
+PORT_TYPE  = "H"
+INDEX_TYPE = "I"
+
+
+def _section(name, values):
+    """
+    Data file section with the contents of an array, in little endian.
+    Indexes and offsets are stored in 16 bits when they fit.
+    """
+    if values.typecode != "H" and max(values or [0]) <= 0xFFFF:
+        values = array("H", values)
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return name, values.typecode, values.tostring()
+
+
+def write_data(data_file, tables, last_modified = None, version = 1):
+    """
+    Write the registry to a data file. The file is replaced atomically.
+
+    :param data_file: Data filename.
+    :type data_file: str
+
+    :param tables: Map of table names, as in TABLES, to dictionaries
+        like the ones this module exports.
+    :type tables: dict(str -> dict)
+
+    :param last_modified: Last modification date of the registry, as
+        returned by the IANA web server.
+    :type last_modified: str | None
+
+    :param version: Version number of the data file.
+    :type version: int
+    """
+
+    # Collect the service names and sort them.
+    names = set()
+    for protocol in PROTOCOLS:
+        names.update(tables[protocol + "service_to_ports"].iterkeys())
+        for services in tables[protocol + "port_to_services"].itervalues():
+            names.update(services)
+    names = sorted(names)
+    indexes = {name: index for index, name in enumerate(names)}
+
+    # Build the table of service names.
+    offsets = array(INDEX_TYPE, [0])
+    for name in names:
+        offsets.append(offsets[-1] + len(name))
+    sections = [
+        ("names", None, "".join(names)),
+        _section("name_offsets", offsets),
+    ]
+
+    # Build the arrays for each table.
+    for protocol in PROTOCOLS:
+        port_to_services = tables[protocol + "port_to_services"]
+        service_to_ports = tables[protocol + "service_to_ports"]
+        keys    = array(PORT_TYPE, sorted(port_to_services))
+        offsets = array(INDEX_TYPE, [0])
+        values  = array(INDEX_TYPE)
+        for port in keys:
+            values.extend(indexes[name] for name in port_to_services[port])
+            offsets.append(len(values))
+        sections.append(_section(protocol + "ports_keys", keys))
+        sections.append(_section(protocol + "ports_offsets", offsets))
+        sections.append(_section(protocol + "ports_values", values))
+        keys    = array(INDEX_TYPE,
+                        sorted(indexes[name] for name in service_to_ports))
+        offsets = array(INDEX_TYPE, [0])
+        values  = array(PORT_TYPE)
+        for index in keys:
+            values.extend(service_to_ports[names[index]])
+            offsets.append(len(values))
+        sections.append(_section(protocol + "services_keys", keys))
+        sections.append(_section(protocol + "services_offsets", offsets))
+        sections.append(_section(protocol + "services_values", values))
+
+    # Build the header with the location and typecode of each section.
+    header = {
+        "last_modified": last_modified,
+        "sections":      {},
+        "version":       version,
+    }
+    position = 0
+    for name, typecode, contents in sections:
+        header["sections"][name] = [position, len(contents), typecode]
+        position += len(contents)
+    header = json.dumps(header, sort_keys = True)
+
+    # Write the data file.
+    tmp_file = data_file + ".tmp"
+    try:
+        with open(tmp_file, "wb") as fd:
+            fd.write(DATA_MAGIC)
+            fd.write(struct.pack("<I", len(header)))
+            fd.write(header)
+            for _, _, contents in sections:
+                fd.write(contents)
+        replace_file(tmp_file, data_file)
+    except:
+        if exists(tmp_file):
+            unlink(tmp_file)
+        raise
+
+
+class _IANAData(object):
+    """
+    Memory mapped registry data file.
+
+    On Windows mapped files can't be replaced, so the file is read into
+    memory instead. It's small enough.
+    """
+
+    def __init__(self, data_file):
+        with open(data_file, "rb") as fd:
+            if sys.platform == "win32":
+                self.__map = fd.read()
+            else:
+                self.__map = mmap.mmap(
+                    fd.fileno(), 0, access = mmap.ACCESS_READ)
+            self.__identity = _file_identity(fstat(fd.fileno()))
+        self.filename = data_file
+        if self.__map[:len(DATA_MAGIC)] != DATA_MAGIC:
+            raise ValueError("Not an IANA registry data file: %s"
+                             % data_file)
+        size, = struct.unpack_from("<I", self.__map, len(DATA_MAGIC))
+        start = len(DATA_MAGIC) + 4
+        header = json.loads(self.__map[start:start + size])
+        self.__base = start + size
+        self.__sections = header["sections"]
+        self.__arrays = {}
+        self.last_modified = header["last_modified"]
+        self.version = header.get("version", 0)
+        self.__names = self.__base + self.__sections["names"][0]
+        self.__name_offsets = self.get_array("name_offsets")
+        self.names = _NameList(self)
+
+    def is_replaced(self):
+        """
+        Check if the data file was replaced since it was opened.
+        A missing file doesn't count, the old one is still usable.
+
+        :rtype: bool
+        """
+        try:
+            return _file_identity(stat(self.filename)) != self.__identity
+        except OSError:
+            return False
+
+    def get_array(self, section):
+        """
+        Get the contents of a section of the data file as an array.
+        The array is only loaded the first time.
+
+        :param section: Section name.
+        :type section: str
+
+        :rtype: array
+        """
+        try:
+            return self.__arrays[section]
+        except KeyError:
+            pass
+        offset, size, typecode = self.__sections[section]
+        start = self.__base + offset
+        values = array(str(typecode))
+        values.fromstring(self.__map[start:start + size])
+        if sys.byteorder != "little":
+            values.byteswap()
+        self.__arrays[section] = values
+        return values
+
+    def get_name(self, index):
+        """
+        Get a service name from the table of names.
+
+        :param index: Service name index.
+        :type index: int
+
+        :rtype: str
+        """
+        offsets = self.__name_offsets
+        return self.__map[self.__names + offsets[index]:
+                          self.__names + offsets[index + 1]]
+
+    def find_name(self, name):
+        """
+        Find a service name in the table of names.
+
+        :param name: Service name.
+        :type name: str
+
+        :returns: Service name index, or -1 if not found.
+        :rtype: int
+        """
+        count = len(self.__name_offsets) - 1
+        index = bisect_left(self.names, name, 0, count)
+        if index < count and self.get_name(index) == name:
+            return index
+        return -1
+
+
+def _file_identity(st):
+    "Identify a file from its stat() result. A replaced file is a new one."
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime)
+
+
+class _NameList(object):
+    "Sequence of the service names in a data file, for bisect."
+
+    def __init__(self, data):
+        self.__data = data
+
+    def __len__(self):
+        return len(self.__data.get_array("name_offsets")) - 1
+
+    def __getitem__(self, index):
+        return self.__data.get_name(index)
+
+
+_data = None
+_data_lock = Lock()
+_next_check = 0.0
+
+def _get_data():
+    """
+    Get the registry data file, opening it the first time. Every
+    RELOAD_INTERVAL seconds, check if it was replaced and reopen it.
+    """
+    global _data, _next_check
+    data = _data
+    if data is None or time() >= _next_check:
+        with _data_lock:
+            data = _data
+            if data is None or time() >= _next_check:
+                if data is None or data.is_replaced():
+                    data = _IANAData(DATA_FILE)
+                    _data = data
+                _next_check = time() + RELOAD_INTERVAL
+    return data
+
+
+def reload_data():
+    """
+    Check right away if the registry data file was replaced, and reopen
+    it if so. The tables and registries begin using the new data on their
+    next query.
+
+    :returns: True if the data file was reopened, False otherwise.
+    :rtype: bool
+    """
+    global _next_check
+    old_data = _data
+    _next_check = 0.0
+    return _get_data() is not old_data
+
+
+class _TableView(Mapping):
+    """
+    Read-only view of one of the registry tables, which behaves like a
+    dictionary with sorted keys. The values are new lists every time.
+    """
+
+    def __init__(self, table, data = None):
+        self._table = table
+        self.__data = data
+        self.__arrays = None
+
+    def _get_arrays(self):
+        "Get the data file and the keys, offsets and values of the table."
+        data = self.__data
+        if data is None:
+            data = _get_data()
+        arrays = self.__arrays
+        if arrays is None or arrays[0] is not data:
+            table = self._table
+            arrays = (
+                data,
+                data.get_array(table + "_keys"),
+                data.get_array(table + "_offsets"),
+                data.get_array(table + "_values"),
+            )
+            self.__arrays = arrays
+        return arrays
+
+    def _find(self, keys, key):
+        "Find a key in the sorted keys, or return -1."
+        index = bisect_left(keys, key)
+        if index == len(keys) or keys[index] != key:
+            return -1
+        return index
+
+    def _get_key(self, data, key):
+        "Convert a key to the type stored in the keys array."
+        return key
+
+    def _get_value(self, data, values):
+        "Convert the stored values of a key to the returned type."
+        raise NotImplementedError()
+
+    def __getitem__(self, key):
+        data, keys, offsets, values = self._get_arrays()
+        index = self._find(keys, self._get_key(data, key))
+        if index < 0:
+            raise KeyError(key)
+        return self._get_value(
+            data, values[offsets[index]:offsets[index + 1]])
+
+    def get(self, key, default = None):
+        data, keys, offsets, values = self._get_arrays()
+        index = self._find(keys, self._get_key(data, key))
+        if index < 0:
+            return default
+        return self._get_value(
+            data, values[offsets[index]:offsets[index + 1]])
+
+    def __contains__(self, key):
+        data, keys, _, _ = self._get_arrays()
+        return self._find(keys, self._get_key(data, key)) >= 0
+
+    def __len__(self):
+        return len(self._get_arrays()[1])
+
+    def __repr__(self):
+        return "<%s %s (%d entries)>" % (
+            self.__class__.__name__, self._table, len(self))
+
+
+class _PortToServices(_TableView):
+    "Read-only view of a table of port numbers to service names."
+
+    def _get_value(self, data, values):
+        return [data.get_name(index) for index in values]
+
+    def __iter__(self):
+        return iter(self._get_arrays()[1])
+
+
+class _ServiceToPorts(_TableView):
+    "Read-only view of a table of service names to port numbers."
+
+    def _get_key(self, data, service):
+        return data.find_name(service)
+
+    def _get_value(self, data, values):
+        return values.tolist()
+
+    def __iter__(self):
+        data, keys, _, _ = self._get_arrays()
+        return (data.get_name(index) for index in keys)
 
-    IANA_FILE = "service-names-port-numbers.csv"
-    IANA_URL  = "http://www.iana.org/assignments/service-names-port-numbers/"
 
+port_to_services     = _PortToServices("ports")
+service_to_ports     = _ServiceToPorts("services")
+tcp_port_to_services = _PortToServices("tcp_ports")
+tcp_service_to_ports = _ServiceToPorts("tcp_services")
+udp_port_to_services = _PortToServices("udp_ports")
+udp_service_to_ports = _ServiceToPorts("udp_services")
+
+
+def _import_numpy(use_numpy):
+    """
+    Import NumPy only when it's going to be used, since it's slow to load.
+    Returns None if it shouldn't be used.
+    """
+    if use_numpy is False:
+        return None
+    try:
+        import numpy
+    except ImportError:
+        if use_numpy:
+            raise ImportError("NumPy is not installed")
+        return None
+    return numpy
+
+
+class IANARegistry(object):
+    """
+    Indexed queries over the IANA registry of one protocol: bulk port
+    lookups, port ranges and service name searches.
+
+    Services are identified by their index in the sorted table of names,
+    see get_service_name() and get_service_id(). The IDs may change when
+    the data file is updated.
+    """
+
+    def __init__(self, protocol = None):
+        """
+        :param protocol: "tcp", "udp", or None for the ports and services
+            registered for both.
+        :type protocol: str | None
+        """
+        if protocol is None:
+            prefix = ""
+        elif protocol.lower() in ("tcp", "udp"):
+            prefix = protocol.lower() + "_"
+        else:
+            raise ValueError("Invalid protocol: %r" % (protocol,))
+        self.__protocol = protocol
+        self.__port_to_services = _PortToServices(prefix + "ports")
+        self.__service_to_ports = _ServiceToPorts(prefix + "services")
+        self.__first_services = None
+        self.__names = None
+
+    @property
+    def protocol(self):
+        return self.__protocol
+
+    @property
+    def port_to_services(self):
+        return self.__port_to_services
+
+    @property
+    def service_to_ports(self):
+        return self.__service_to_ports
+
+    def get_service_name(self, service_id):
+        """
+        Get the name of a service.
+
+        :param service_id: Service ID.
+        :type service_id: int
+
+        :rtype: str
+
+        :raises IndexError: Invalid service ID.
+        """
+        if service_id < 0:
+            raise IndexError(service_id)
+        return _get_data().get_name(service_id)
+
+    def get_service_id(self, name):
+        """
+        Get the ID of a service.
+
+        :param name: Service name.
+        :type name: str
+
+        :returns: Service ID, or -1 if the service is not registered.
+        :rtype: int
+        """
+        data, keys, _, _ = self.__service_to_ports._get_arrays()
+        service_id = data.find_name(name)
+        if self.__service_to_ports._find(keys, service_id) < 0:
+            return -1
+        return service_id
+
+    def __get_first_services(self):
+        """
+        Get the first service ID of every port, -1 for unregistered ports.
+        The table is built the first time it's needed.
+        """
+        data, keys, offsets, values = self.__port_to_services._get_arrays()
+        cached = self.__first_services
+        if cached is None or cached[0] is not data:
+            table = array("i", [-1]) * 65536
+            for index, port in enumerate(keys):
+                table[port] = values[offsets[index]]
+            cached = (data, table)
+            self.__first_services = cached
+        return cached[1]
+
+    def lookup_ports(self, ports, use_numpy = None):
+        """
+        Look up the first registered service of many ports at once.
+
+        :param ports: Port numbers, from 0 to 65535.
+        :type ports: iterable(int)
+
+        :param use_numpy: True to use NumPy, False to use the array module,
+            None to use NumPy only if it's installed.
+        :type use_numpy: bool | None
+
+        :returns: Array of service IDs, -1 for unregistered ports.
+        :rtype: array | numpy.ndarray
+
+        :raises ValueError: Invalid port number.
+        """
+        table = self.__get_first_services()
+        if not hasattr(ports, "__len__"):
+            ports = list(ports)
+        numpy = _import_numpy(use_numpy)
+        if numpy is not None:
+            ports = numpy.asarray(ports, numpy.intp)
+            if ports.size and (ports.min() < 0 or ports.max() > 65535):
+                raise ValueError("Invalid port number")
+            return numpy.frombuffer(table, numpy.intc)[ports]
+        if len(ports) and (min(ports) < 0 or max(ports) > 65535):
+            raise ValueError("Invalid port number")
+        return array("i", map(table.__getitem__, ports))
+
+    def get_port_range(self, low, high):
+        """
+        Get the registered ports in a range, and their services.
+
+        :param low: Lowest port number.
+        :type low: int
+
+        :param high: Highest port number, included in the range.
+        :type high: int
+
+        :returns: Port numbers and service names, sorted by port.
+        :rtype: list(tuple(int, list(str)))
+        """
+        data, keys, offsets, values = self.__port_to_services._get_arrays()
+        first = bisect_left(keys, low)
+        last = bisect_right(keys, high)
+        return [
+            (keys[index], [
+                data.get_name(service_id)
+                for service_id in values[offsets[index]:offsets[index + 1]]
+            ])
+            for index in xrange(first, last)
+        ]
+
+    def search_prefix(self, prefix):
+        """
+        Find the registered services whose names begin with a prefix.
+
+        :param prefix: Service name prefix.
+        :type prefix: str
+
+        :returns: Service names, sorted.
+        :rtype: list(str)
+        """
+        data, keys, _, _ = self.__service_to_ports._get_arrays()
+
+        # The names are sorted, so the ones with the prefix are together,
+        # and so are the service IDs, since they index the names. Service
+        # names are ASCII, so they sort before the prefix plus "\xff".
+        count = len(data.names)
+        first = bisect_left(data.names, prefix, 0, count)
+        last = bisect_left(data.names, prefix + "\xff", first, count)
+        return [
+            data.get_name(service_id)
+            for service_id in keys[bisect_left(keys, first):
+                                   bisect_left(keys, last)]
+        ]
+
+    def search_fuzzy(self, name, count = 10, cutoff = 0.6):
+        """
+        Find the registered services with names similar to the given one.
+
+        :param name: Service name, or part of it.
+        :type name: str
+
+        :param count: Maximum number of results.
+        :type count: int
+
+        :param cutoff: Minimum similarity, from 0 to 1.
+        :type cutoff: float
+
+        :returns: Service names, the most similar first.
+        :rtype: list(str)
+        """
+        data, keys, _, _ = self.__service_to_ports._get_arrays()
+        cached = self.__names
+        if cached is None or cached[0] is not data:
+            cached = (data, [data.get_name(service_id) for service_id in keys])
+            self.__names = cached
+        return get_close_matches(name, cached[1], count, cutoff)
+
+def parse_registry(lines):
+    """
+    Parse the IANA registry in CSV format. It's read one row at a time,
+    so it can be parsed while it's being downloaded.
+
+    :param lines: Lines of the CSV file, such as a file object or the
+        response of the IANA web server.
+    :type lines: iterable(str)
+
+    :returns: Map of table names, as in TABLES, to dictionaries.
+    :rtype: dict(str -> dict)
+    """
     tcp_port_to_services = {}
     tcp_service_to_ports = {}
     udp_port_to_services = {}
     udp_service_to_ports = {}
 
-    should_delete = False
-    if not os.path.exists(IANA_FILE):
-        should_delete = True
-    else:
-        print "Found local file! Skipping download..."
-    try:
-        if should_delete:
-            print "Looking for updates..."
-            if LAST_MODIFIED:
-                headers = {"If-Modified-Since": LAST_MODIFIED}
-            else:
-                headers = {}
-            req  = urllib2.Request(IANA_URL + IANA_FILE, headers=headers)
-            try:
-                resp = urllib2.urlopen(req)
-            except urllib2.HTTPError, e:
-                if e.code == 304:
-                    print "No updates found."
-                    exit(0)
-                raise
-            print "Update found, downloading..."
-            LAST_MODIFIED = resp.headers.get("Last-Modified", LAST_MODIFIED)
-            data = resp.read()
-            with open(IANA_FILE, "wb") as f:
-                f.write(data)
-            data = ""
-
-        print "Parsing file..."
-        with open(IANA_FILE, "rU") as f:
-
-            # Service Name, Port Number, Transport Protocol,
-            # Description, Assignee, Contact, Registration Date,
-            # Modification Date, Reference, Service Code,
-            # Known Unauthorized Uses, Assignment Notes
-
-            reader = csv.reader(f)
-            reader.next()
-            for row in reader:
-                if not row:
-                    continue
-
-                service = row[0].lower()
-                if not service:
-                    continue
-
-                try:
-                    port = int(row[1])
-                except ValueError:
-                    continue
-                if not port:
-                    continue
-
-                proto = row[2].lower()
-                if proto == "tcp":
-                    port_to_services = tcp_port_to_services
-                    service_to_ports = tcp_service_to_ports
-                elif proto == "udp":
-                    port_to_services = udp_port_to_services
-                    service_to_ports = udp_service_to_ports
-                else:
-                    continue
-
-                if service not in service_to_ports:
-                    service_to_ports[service] = [port]
-                else:
-                    service_to_ports[service].append(port)
-                    service_to_ports[service].sort()
-
-                if "This entry is an alias" in row[-1]:
-                    continue
-                if "This is a duplicate" in row[-1]:
-                    continue
-
-                if port not in port_to_services:
-                    port_to_services[port] = [service]
-                else:
-                    port_to_services[port].append(service)
-                    port_to_services[port].sort()
-
-            reader = None
-
-        port_to_services = {}
-        service_to_ports = {}
-
-        services = set(tcp_service_to_ports.iterkeys())
-        services.intersection_update(udp_service_to_ports.iterkeys())
-        for service in sorted(services):
-            ports = set(tcp_service_to_ports[service])
-            ports.intersection_update(udp_service_to_ports[service])
-            if ports:
-                service_to_ports[service] = sorted(ports)
-                ports.clear()
-        services.clear()
-
-        ports = set(tcp_port_to_services.iterkeys())
-        ports.intersection_update(udp_port_to_services.iterkeys())
-        for port in sorted(ports):
-            services = set(tcp_port_to_services[port])
-            services.intersection_update(udp_port_to_services[port])
-            if services:
-                port_to_services[port] = sorted(services)
-                services.clear()
-        ports.clear()
-
-        source = "LAST_MODIFIED = %r\n" \
-                 "port_to_services = %r\n" \
-                 "service_to_ports = %r\n" \
-                 "tcp_port_to_services = %r\n" \
-                 "tcp_service_to_ports = %r\n" \
-                 "udp_port_to_services = %r\n" \
-                 "udp_service_to_ports = %r\n"
-        source %= (LAST_MODIFIED,
-                   port_to_services,
-                   service_to_ports,
-                   tcp_port_to_services,
-                   tcp_service_to_ports,
-                   udp_port_to_services,
-                   udp_service_to_ports)
-
-        separator = "#" * 3
-        separator = separator + " DO NOT EDIT THIS LINE " + separator + "\n"
-        with open(__file__, "rU") as f:
-            data = f.read()
-        p = data.find(separator)
-        if p >= 0:
-            p += len(separator)
-            q = data.find(separator, p)
-            if q >= p:
-                data = data[:p] + source + data[q:]
-                with open(__file__, "w") as f:
-                    f.write(data)
-            else:
-                raise RuntimeError(
-                    "Separator not found! Did you manually edit the file?")
+    # Service Name, Port Number, Transport Protocol,
+    # Description, Assignee, Contact, Registration Date,
+    # Modification Date, Reference, Service Code,
+    # Known Unauthorized Uses, Assignment Notes
+    reader = csv.reader(lines)
+    reader.next()
+    for row in reader:
+        if not row:
+            continue
+
+        service = row[0].lower()
+        if not service:
+            continue
+
+        try:
+            port = int(row[1])
+        except ValueError:
+            continue
+        if not port:
+            continue
+
+        proto = row[2].lower()
+        if proto == "tcp":
+            port_to_services = tcp_port_to_services
+            service_to_ports = tcp_service_to_ports
+        elif proto == "udp":
+            port_to_services = udp_port_to_services
+            service_to_ports = udp_service_to_ports
+        else:
+            continue
+
+        if service not in service_to_ports:
+            service_to_ports[service] = [port]
         else:
-            raise RuntimeError(
-                "Separator not found! Did you manually edit the file?")
+            service_to_ports[service].append(port)
+            service_to_ports[service].sort()
+
+        if "This entry is an alias" in row[-1]:
+            continue
+        if "This is a duplicate" in row[-1]:
+            continue
+
+        if port not in port_to_services:
+            port_to_services[port] = [service]
+        else:
+            port_to_services[port].append(service)
+            port_to_services[port].sort()
+
+    # The tables without a prefix have what TCP and UDP have in common.
+    port_to_services = {}
+    service_to_ports = {}
+    services = set(tcp_service_to_ports.iterkeys())
+    services.intersection_update(udp_service_to_ports.iterkeys())
+    for service in services:
+        ports = set(tcp_service_to_ports[service])
+        ports.intersection_update(udp_service_to_ports[service])
+        if ports:
+            service_to_ports[service] = sorted(ports)
+    ports = set(tcp_port_to_services.iterkeys())
+    ports.intersection_update(udp_port_to_services.iterkeys())
+    for port in ports:
+        services = set(tcp_port_to_services[port])
+        services.intersection_update(udp_port_to_services[port])
+        if services:
+            port_to_services[port] = sorted(services)
+
+    return {
+        "port_to_services":     port_to_services,
+        "service_to_ports":     service_to_ports,
+        "tcp_port_to_services": tcp_port_to_services,
+        "tcp_service_to_ports": tcp_service_to_ports,
+        "udp_port_to_services": udp_port_to_services,
+        "udp_service_to_ports": udp_service_to_ports,
+    }
+
+
+def _read_tables(data):
+    "Read all the tables of a data file into dictionaries."
+    tables = {}
+    for protocol in PROTOCOLS:
+        tables[protocol + "port_to_services"] = dict(
+            _PortToServices(protocol + "ports", data))
+        tables[protocol + "service_to_ports"] = dict(
+            _ServiceToPorts(protocol + "services", data))
+    return tables
+
+
+def diff_tables(old_tables, new_tables):
+    """
+    Compare two versions of the registry tables.
+
+    :param old_tables: Map of table names, as in TABLES, to dictionaries.
+    :type old_tables: dict(str -> dict)
 
-    finally:
-        if should_delete and os.path.exists(IANA_FILE):
-            print "Deleting temporary file..."
-            os.unlink(IANA_FILE)
+    :param new_tables: Map of table names, as in TABLES, to dictionaries.
+    :type new_tables: dict(str -> dict)
+
+    :returns: Map of table names to a map of "added", "removed" and
+        "changed" to the sorted keys of each table that were added,
+        removed or changed. Tables without changes are left out.
+    :rtype: dict(str -> dict(str -> list))
+    """
+    changes = {}
+    for table in TABLES:
+        old = old_tables.get(table, {})
+        new = new_tables.get(table, {})
+        added   = sorted(key for key in new if key not in old)
+        removed = sorted(key for key in old if key not in new)
+        changed = sorted(key for key in new
+                         if key in old and old[key] != new[key])
+        if added or removed or changed:
+            changes[table] = {
+                "added":   added,
+                "removed": removed,
+                "changed": changed,
+            }
+    return changes
+
+
+def update(csv_file = None, data_file = None, force = False):
+    """
+    Update the registry data file from the IANA website, or from a local
+    copy of the registry in CSV format.
+
+    The registry is parsed while it's being downloaded, and compared with
+    the current data file. The data file is only replaced if the registry
+    changed, with the next version number. Running processes reopen it
+    within RELOAD_INTERVAL seconds, and this one right away.
+
+    :param csv_file: Local copy of the registry in CSV format,
+        or None to download it.
+    :type csv_file: str | None
+
+    :param data_file: Data filename, or None for DATA_FILE.
+    :type data_file: str | None
+
+    :param force: True to download the registry even if it wasn't
+        modified since the last update.
+    :type force: bool
+
+    :returns: Changes to the tables, as returned by diff_tables(),
+        or None if the registry wasn't modified since the last update.
+    :rtype: dict(str -> dict(str -> list)) | None
+    """
+    if data_file is None:
+        data_file = DATA_FILE
+
+    # Get the current data, its version and modification date.
+    old_tables = {}
+    version = 0
+    last_modified = None
+    if exists(data_file):
+        current = _IANAData(data_file)
+        version = current.version
+        last_modified = current.last_modified
+        old_tables = _read_tables(current)
+        current = None
+    old_modified = last_modified
+
+    # Parse the local file, or download and parse the registry,
+    # unless it wasn't modified since the last update.
+    if csv_file:
+        with open(csv_file, "rU") as fd:
+            tables = parse_registry(fd)
+    else:
+        import urllib2
+        headers = {}
+        if last_modified and not force:
+            headers["If-Modified-Since"] = last_modified
+        req = urllib2.Request(IANA_URL + IANA_FILE, headers = headers)
+        try:
+            resp = urllib2.urlopen(req)
+        except urllib2.HTTPError, e:
+            if e.code == 304:
+                return None
+            raise
+        try:
+            last_modified = resp.headers.get("Last-Modified", last_modified)
+            tables = parse_registry(resp)
+        finally:
+            resp.close()
+
+    # Compare it with the current data, and write the new data file
+    # if anything changed.
+    changes = diff_tables(old_tables, tables)
+    if changes or not old_tables or last_modified != old_modified:
+        write_data(data_file, tables, last_modified, version + 1)
+        if abspath(data_file) == DATA_FILE:
+            reload_data()
+    return changes
+
+
+if __name__ == "__main__":
+    import os.path
+
+    # Use the local copy of the registry if there is one.
+    if os.path.exists(IANA_FILE):
+        print "Found local file! Skipping download..."
+        changes = update(IANA_FILE)
+    else:
+        print "Looking for updates..."
+        changes = update()
+    if changes is None:
+        print "No updates found."
+        exit(0)
 
-    print "Update complete."
+    # Show what changed.
+    for table in TABLES:
+        if table in changes:
+            print "%s: %d added, %d removed, %d changed" % (
+                table,
+                len(changes[table]["added"]),
+                len(changes[table]["removed"]),
+                len(changes[table]["changed"]),
+            )
+    if not changes:
+        print "No changes in the registry."
+    print "Update complete, data file version %d." % _get_data().version
@@ -0,0 +1,525 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2013, Mario Vilas
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     * Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice,this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of the copyright holder nor the names of its
+#       contributors may be used to endorse or promote products derived from
+#       this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Read-only database snapshots, for distribution to many hosts.
+
+A snapshot is a compacted SQLite database that is never modified after it's
+built, so the clients can open it as immutable and memory mapped, without
+any locking or journaling. Each snapshot comes with a manifest in JSON with
+its size and SHA-256 hash, and optionally with a compressed copy.
+
+Binary deltas between two snapshots let the clients upgrade without
+downloading the whole thing. Snapshots are compacted, so the pages move
+around whenever rows are added, and rows move between pages. Deltas are
+made by content instead of by position: pages found anywhere in the old
+snapshot are copied from there, and the rest are pieced together from
+blocks of the old snapshot, rsync style, plus whatever is really new.
+When a delta wouldn't be smaller than the compressed snapshot it's not
+made at all, and the clients should download the snapshot instead.
+"""
+
+import bz2
+import gzip
+import hashlib
+import json
+import mmap
+import sqlite3
+import struct
+
+from os import unlink
+from os.path import abspath, exists, getsize, realpath
+from shutil import copyfile, copyfileobj
+from urllib import quote
+
+from fileutil import replace_file
+
+
+# Compression formats for the snapshots: file extension and opener.
+COMPRESSORS = {
+    "gzip": (".gz",  gzip.open),
+    "bz2":  (".bz2", bz2.BZ2File),
+}
+
+# The manifest is named after the snapshot, with this extension.
+MANIFEST_SUFFIX = ".manifest"
+
+# Magic string of the delta files.
+DELTA_MAGIC = "SQLDELT2"
+
+# Size of the blocks of the old snapshot that are looked for in the
+# changed pages of the new one.
+BLOCK_SIZE = 64
+
+# Instructions of the delta files to rebuild a page: copy bytes from the
+# old snapshot, or take them from the delta.
+_COPY = 0
+_DATA = 1
+
+# Number of bytes to read at a time when hashing or copying files.
+CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(filename):
+    """
+    Calculate the SHA-256 hash of a file.
+
+    :param filename: Filename.
+    :type filename: str
+
+    :returns: Size of the file and its SHA-256 hash in hexadecimal.
+    :rtype: tuple(int, str)
+    """
+    digest = hashlib.sha256()
+    size   = 0
+    with open(filename, "rb") as fd:
+        while True:
+            data = fd.read(CHUNK_SIZE)
+            if not data:
+                break
+            digest.update(data)
+            size += len(data)
+    return size, digest.hexdigest()
+
+
+def write_manifest(snapshot_file, compress = None, **info):
+    """
+    Write the manifest of a snapshot, and optionally a compressed copy.
+
+    :param snapshot_file: Snapshot filename.
+    :type snapshot_file: str
+
+    :param compress: Compression format, one of COMPRESSORS, or None.
+    :type compress: str | None
+
+    :param info: Additional information to put in the manifest.
+
+    :returns: Manifest.
+    :rtype: dict
+    """
+    size, sha256 = hash_file(snapshot_file)
+    manifest = dict(info)
+    manifest["size"]   = size
+    manifest["sha256"] = sha256
+    if compress:
+        extension, opener = COMPRESSORS[compress]
+        compressed_file = snapshot_file + extension
+        tmp_file = compressed_file + ".tmp"
+        try:
+            with open(snapshot_file, "rb") as src:
+                dst = opener(tmp_file, "wb")
+                try:
+                    copyfileobj(src, dst, CHUNK_SIZE)
+                finally:
+                    dst.close()
+            replace_file(tmp_file, compressed_file)
+        except:
+            if exists(tmp_file):
+                unlink(tmp_file)
+            raise
+        size, sha256 = hash_file(compressed_file)
+        manifest["compressed"] = {
+            "format": compress,
+            "size":   size,
+            "sha256": sha256,
+        }
+    tmp_file = snapshot_file + MANIFEST_SUFFIX + ".tmp"
+    with open(tmp_file, "wb") as fd:
+        json.dump(manifest, fd, indent = 4, sort_keys = True)
+    replace_file(tmp_file, snapshot_file + MANIFEST_SUFFIX)
+    return manifest
+
+
+def read_manifest(snapshot_file):
+    """
+    Read the manifest of a snapshot.
+
+    :param snapshot_file: Snapshot filename.
+    :type snapshot_file: str
+
+    :returns: Manifest.
+    :rtype: dict
+    """
+    with open(snapshot_file + MANIFEST_SUFFIX, "rb") as fd:
+        return json.load(fd)
+
+
+def verify_snapshot(snapshot_file):
+    """
+    Verify a snapshot against its manifest.
+
+    :param snapshot_file: Snapshot filename.
+    :type snapshot_file: str
+
+    :returns: Manifest.
+    :rtype: dict
+
+    :raises ValueError: The snapshot doesn't match the manifest.
+    """
+    manifest = read_manifest(snapshot_file)
+    if hash_file(snapshot_file) != (manifest["size"], manifest["sha256"]):
+        raise ValueError("Snapshot doesn't match its manifest: %s"
+                         % snapshot_file)
+    return manifest
+
+
+def unpack_snapshot(compressed_file):
+    """
+    Decompress a snapshot and verify it against its manifest.
+
+    The snapshot is named like the compressed file without the extension,
+    and it's only replaced if the verification succeeds.
+
+    :param compressed_file: Compressed snapshot filename.
+    :type compressed_file: str
+
+    :returns: Snapshot filename.
+    :rtype: str
+
+    :raises ValueError: The snapshot doesn't match the manifest.
+    """
+    for extension, opener in COMPRESSORS.itervalues():
+        if compressed_file.endswith(extension):
+            break
+    else:
+        raise ValueError("Unknown compression format: %s" % compressed_file)
+    snapshot_file = compressed_file[:-len(extension)]
+    manifest = read_manifest(snapshot_file)
+    tmp_file = snapshot_file + ".tmp"
+    try:
+        src = opener(compressed_file, "rb")
+        try:
+            with open(tmp_file, "wb") as dst:
+                copyfileobj(src, dst, CHUNK_SIZE)
+        finally:
+            src.close()
+        if hash_file(tmp_file) != (manifest["size"], manifest["sha256"]):
+            raise ValueError("Snapshot doesn't match its manifest: %s"
+                             % compressed_file)
+        replace_file(tmp_file, snapshot_file)
+    except:
+        if exists(tmp_file):
+            unlink(tmp_file)
+        raise
+    return snapshot_file
+
+
+def open_snapshot(snapshot_file):
+    """
+    Open a snapshot as an immutable, memory mapped SQLite database.
+
+    SQLite doesn't lock immutable databases nor check if they changed, so
+    the file must not be modified while it's open. Replace it with a new
+    file instead (see replace_file). On Windows, open snapshots can't be
+    replaced, so close them first.
+
+    :param snapshot_file: Snapshot filename.
+    :type snapshot_file: str
+
+    :returns: Database connection.
+    :rtype: sqlite3.Connection
+
+    :raises RuntimeError: SQLite was built without URI filename support.
+    """
+    path = realpath(abspath(snapshot_file))
+    if not exists(path):
+        raise IOError("Snapshot not found: %s" % snapshot_file)
+    db = sqlite3.connect(
+        "file:%s?immutable=1" % quote(path),
+        isolation_level = None,
+        check_same_thread = False,
+    )
+    try:
+
+        # Without URI support the "file:" name is taken literally, and we'd
+        # end up with an empty database instead.
+        filename = db.execute("PRAGMA database_list;").fetchone()[2]
+        if filename != path:
+            raise RuntimeError(
+                "This SQLite version can't open snapshots (no URI support)")
+
+        db.execute("PRAGMA mmap_size = %d;" % getsize(path))
+    except:
+        db.close()
+        raise
+    return db
+
+
+def _page_size(db_file):
+    "Get the page size of an SQLite database from its header."
+    with open(db_file, "rb") as fd:
+        header = fd.read(18)
+    if len(header) < 18 or not header.startswith("SQLite format 3\0"):
+        raise ValueError("Not an SQLite database: %s" % db_file)
+    page_size, = struct.unpack(">H", header[16:18])
+    if page_size == 1:
+        page_size = 65536
+    return page_size
+
+
+def _diff_page(page, old, blocks, block_size):
+    """
+    Encode a page as a list of instructions: copies of the old snapshot,
+    wherever blocks of it are found in the page, and literal data.
+    """
+    size = len(page)
+    old_size = len(old)
+    instructions = []
+    literal = 0
+    position = 0
+    while position + block_size <= size:
+        offset = blocks.get(page[position:position + block_size])
+        if offset is None:
+            position += 1
+            continue
+
+        # Extend the match forward as far as it goes, a block at a time.
+        length = block_size
+        while position + length < size and offset + length < old_size:
+            step = min(block_size, size - position - length,
+                       old_size - offset - length)
+            if page[position + length:position + length + step] == \
+                    old[offset + length:offset + length + step]:
+                length += step
+                continue
+            while page[position + length] == old[offset + length]:
+                length += 1
+            break
+
+        # Extend it backward into the pending literal data.
+        while position > literal and offset > 0 and \
+                page[position - 1] == old[offset - 1]:
+            position -= 1
+            offset   -= 1
+            length   += 1
+
+        if position > literal:
+            instructions.append((_DATA, page[literal:position]))
+        instructions.append((_COPY, length, offset))
+        position += length
+        literal   = position
+    if literal < size:
+        instructions.append((_DATA, page[literal:]))
+    return instructions
+
+
+def _write_instructions(delta, instructions):
+    "Write the instructions to rebuild a page to a delta file."
+    for instruction in instructions:
+        if instruction[0] == _COPY:
+            delta.write(struct.pack("<BIQ", *instruction))
+        else:
+            delta.write(struct.pack("<BI", _DATA, len(instruction[1])))
+            delta.write(instruction[1])
+
+
+def make_delta(old_file, new_file, delta_file):
+    """
+    Make a binary delta between two snapshots, to rebuild the new one
+    from the old one. The delta is gzipped.
+
+    Pages of the new snapshot found anywhere in the old one are copied
+    from there. The other changed pages are matched against blocks of the
+    old pages that are gone from the new snapshot, since that's usually
+    where their rows were before.
+
+    If the new snapshot has a compressed copy (see write_manifest) and the
+    delta isn't smaller than it, no delta is made, since the clients are
+    better off downloading the compressed snapshot.
+
+    :param old_file: Old snapshot filename.
+    :type old_file: str
+
+    :param new_file: New snapshot filename.
+    :type new_file: str
+
+    :param delta_file: Output delta filename.
+    :type delta_file: str
+
+    :returns: Number of pages that changed, and in the new snapshot,
+        or None if the delta wasn't made.
+    :rtype: tuple(int, int) | None
+    """
+    page_size = _page_size(new_file)
+    old_size, old_sha256 = hash_file(old_file)
+    new_size, new_sha256 = hash_file(new_file)
+    header = json.dumps({
+        "page_size":  page_size,
+        "old_size":   old_size,
+        "old_sha256": old_sha256,
+        "new_size":   new_size,
+        "new_sha256": new_sha256,
+    })
+    changed = 0
+    total   = 0
+    tmp_file = delta_file + ".tmp"
+    try:
+        with open(old_file, "rb") as old_fd:
+            with open(new_file, "rb") as new_fd:
+                old = mmap.mmap(old_fd.fileno(), 0, access = mmap.ACCESS_READ)
+                new = mmap.mmap(new_fd.fileno(), 0, access = mmap.ACCESS_READ)
+                try:
+
+                    # Index the pages of the old snapshot by content.
+                    old_pages = {}
+                    for offset in xrange(0, old_size, page_size):
+                        digest = hashlib.sha1(
+                            old[offset:offset + page_size]).digest()
+                        old_pages.setdefault(digest, offset)
+
+                    # Find the pages of the new snapshot that changed,
+                    # and where they are in the old one, if they are.
+                    pages = []
+                    new_digests = set()
+                    for offset in xrange(0, new_size, page_size):
+                        page = new[offset:offset + page_size]
+                        digest = hashlib.sha1(page).digest()
+                        new_digests.add(digest)
+                        if page != old[offset:offset + page_size]:
+                            pages.append((offset, old_pages.get(digest)))
+                        total += 1
+
+                    # Index the blocks of the old pages that are gone.
+                    blocks = {}
+                    for digest, old_offset in old_pages.iteritems():
+                        if digest not in new_digests:
+                            end = min(old_offset + page_size, old_size)
+                            for offset in xrange(old_offset, end, BLOCK_SIZE):
+                                blocks.setdefault(
+                                    old[offset:offset + BLOCK_SIZE], offset)
+
+                    # Write the instructions to rebuild each changed page.
+                    delta = gzip.open(tmp_file, "wb")
+                    try:
+                        delta.write(DELTA_MAGIC)
+                        delta.write(struct.pack("<I", len(header)))
+                        delta.write(header)
+                        for offset, old_offset in pages:
+                            page = new[offset:offset + page_size]
+                            if old_offset is not None:
+                                instructions = [
+                                    (_COPY, len(page), old_offset)]
+                            else:
+                                instructions = _diff_page(
+                                    page, old, blocks, BLOCK_SIZE)
+                            delta.write(struct.pack("<I", offset // page_size))
+                            _write_instructions(delta, instructions)
+                            changed += 1
+                    finally:
+                        delta.close()
+                finally:
+                    new.close()
+                    old.close()
+
+        # Don't make a delta that's no better than the compressed snapshot.
+        compressed = None
+        if exists(new_file + MANIFEST_SUFFIX):
+            compressed = read_manifest(new_file).get("compressed")
+        if compressed and getsize(tmp_file) >= compressed["size"]:
+            unlink(tmp_file)
+            return None
+
+        replace_file(tmp_file, delta_file)
+    except:
+        if exists(tmp_file):
+            unlink(tmp_file)
+        raise
+    return changed, total
+
+
+def apply_delta(old_file, delta_file, new_file):
+    """
+    Apply a binary delta made by make_delta() to an old snapshot.
+    Both the old and the new snapshots are verified against the hashes
+    stored in the delta.
+
+    :param old_file: Old snapshot filename.
+    :type old_file: str
+
+    :param delta_file: Delta filename.
+    :type delta_file: str
+
+    :param new_file: Output new snapshot filename. It's only replaced if
+        the delta was applied successfully. It may be the old snapshot.
+    :type new_file: str
+
+    :raises ValueError: The delta doesn't apply to the old snapshot, or the
+        result is not the new snapshot.
+    """
+    delta = gzip.open(delta_file, "rb")
+    try:
+        if delta.read(len(DELTA_MAGIC)) != DELTA_MAGIC:
+            raise ValueError("Not a snapshot delta file: %s" % delta_file)
+        size,  = struct.unpack("<I", delta.read(4))
+        header = json.loads(delta.read(size))
+        if hash_file(old_file) != (header["old_size"], header["old_sha256"]):
+            raise ValueError("Delta doesn't apply to this snapshot: %s"
+                             % old_file)
+        page_size = header["page_size"]
+        new_size  = header["new_size"]
+        tmp_file  = new_file + ".tmp"
+        try:
+            copyfile(old_file, tmp_file)
+            with open(old_file, "rb") as old:
+                with open(tmp_file, "r+b") as fd:
+                    fd.truncate(new_size)
+                    while True:
+                        data = delta.read(4)
+                        if not data:
+                            break
+                        page, = struct.unpack("<I", data)
+                        fd.seek(page * page_size)
+                        remaining = min(page_size, new_size - page * page_size)
+                        while remaining > 0:
+                            operation, length = struct.unpack(
+                                "<BI", delta.read(5))
+                            if operation == _COPY:
+                                offset, = struct.unpack("<Q", delta.read(8))
+                                old.seek(offset)
+                                data = old.read(length)
+                            else:
+                                data = delta.read(length)
+                            if len(data) != length or length > remaining:
+                                raise ValueError(
+                                    "Corrupt snapshot delta file: %s"
+                                    % delta_file)
+                            fd.write(data)
+                            remaining -= length
+            if hash_file(tmp_file) != (header["new_size"],
+                                       header["new_sha256"]):
+                raise ValueError("Delta produced a corrupt snapshot: %s"
+                                 % delta_file)
+            replace_file(tmp_file, new_file)
+        except:
+            if exists(tmp_file):
+                unlink(tmp_file)
+            raise
+    finally:
+        delta.close()